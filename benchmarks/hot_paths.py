@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the wegene_utils and CLI hot paths.
+
+Every stage runs offline against the bundled sample genome and is timed
+on its own (median of --runs) and once more under tracemalloc for its peak
+memory. Caches are kept in a temporary folder, packaging is timed from
+scratch (package) and again over its previous archive (package_warm).
+Results can be saved with --output and compared against a saved file with
+--baseline, in which case the script exits with status 1 when a stage got
+slower than --threshold times its baseline:
+
+    python benchmarks/hot_paths.py --output baseline.json
+    python benchmarks/hot_paths.py --baseline baseline.json --threshold 1.2
+"""
+import os
+import sys
+import gzip
+import json
+import time
+import base64
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from weapp_cli import cli  # noqa: E402
+from weapp_cli import wegene_utils  # noqa: E402
+from weapp_cli.sample import load_sample_data  # noqa: E402
+from weapp_cli.extended_data import build_extended_store  # noqa: E402
+
+LOOKUPS = 10000
+RSID_LIST_SIZE = 2000
+EXTENDED_SNPS = 200000
+PACKAGE_FILES = 500
+PACKAGE_FILE_SIZE = 64 * 1024
+
+
+@contextlib.contextmanager
+def quiet():
+    # generate_test_data and package report through click.echo
+    with open(os.devnull, 'w') as devnull:
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            yield
+        finally:
+            sys.stdout = stdout
+
+
+@contextlib.contextmanager
+def working_dir(path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+def write_rsid_list(path, rsids):
+    with open(path, 'w') as rsid_f:
+        rsid_f.write('\n'.join(rsids) + '\n')
+
+
+def write_extended_data(path, count):
+    with open(path, 'w') as dat_f:
+        for i in range(count):
+            dat_f.write('rs{}\t{}\t{}\tAG\n'.format(900000000 + i,
+                                                  i % 22 + 1, i * 100))
+
+
+def write_project(path):
+    os.makedirs(os.path.join(path, 'data'))
+    os.makedirs(os.path.join(path, 'lib', 'models'))
+    with open(os.path.join(path, '.weapp'), 'w') as meta_f:
+        json.dump({'project': 'bench', 'language': 'python3',
+                   'markdown': 0}, meta_f)
+    with open(os.path.join(path, 'main.py'), 'w') as main_f:
+        main_f.write('print("bench")\n' * 1000)
+    block = os.urandom(PACKAGE_FILE_SIZE // 2).hex().encode('ascii')
+    for i in range(PACKAGE_FILES):
+        with open(os.path.join(path, 'lib', 'models',
+                               'model_{}.txt'.format(i)), 'wb') as model_f:
+            model_f.write(block)
+    with open(os.path.join(path, 'data', 'data.json'), 'w') as data_f:
+        data_f.write('{}')
+
+
+def stages(tmp_dir):
+    inputs = load_sample_data()['inputs']
+    genome_format = inputs['format']
+    raw = base64.b64decode(inputs['data'])
+    genome_str = gzip.decompress(raw).decode('ascii')
+    genome = wegene_utils.parse_genome_string(genome_str, genome_format)
+    rsids = sorted(genome)
+    step = max(1, len(rsids) // LOOKUPS)
+    lookup_rsids = rsids[::step][:LOOKUPS]
+
+    rsid_file = os.path.join(tmp_dir, 'rsids.txt')
+    write_rsid_list(rsid_file, rsids[::max(1, len(rsids) //
+                                         RSID_LIST_SIZE)][:RSID_LIST_SIZE])
+    extended_file = os.path.join(tmp_dir, 'extended_data.dat')
+    write_extended_data(extended_file, EXTENDED_SNPS)
+    build_extended_store(extended_file)
+    with open(rsid_file, 'a') as rsid_f:
+        rsid_f.write('\n'.join('rs{}'.format(900000000 + i)
+                               for i in range(0, EXTENDED_SNPS, 1000)))
+    project = os.path.join(tmp_dir, 'project')
+    write_project(project)
+
+    def lookup_dict():
+        for rsid in lookup_rsids:
+            genome[rsid]['genotype']
+
+    def lookup_lazy():
+        # A fresh genome each time, LazyGenome keeps what it resolved
+        lazy_genome = wegene_utils.LazyGenome(genome_str, genome_format)
+        for rsid in lookup_rsids:
+            lazy_genome[rsid]['genotype']
+
+    def generate(extended):
+        with quiet():
+            cli.generate_test_data('y', 'y', 'y', 'y', 'y', 'n', rsid_file,
+                                   genome_format,
+                                   extended_file if extended else '')
+
+    def package():
+        with working_dir(project), quiet():
+            cli.cli.main(['package'], standalone_mode=False)
+
+    def clean_package():
+        # The archive and manifest of the previous run would be reused
+        for path in (os.path.join(project, 'bench.zip'),
+                     os.path.join(project, '.weapp-cache', 'package.json')):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def warm_package():
+        if not os.path.exists(os.path.join(project, 'bench.zip')):
+            package()
+
+    return [
+        ('b64_decode', lambda: base64.b64decode(inputs['data']), None),
+        ('gunzip', lambda: gzip.decompress(raw), None),
+        ('parse_genome_string',
+         lambda: wegene_utils.parse_genome_string(genome_str,
+                                                  genome_format), None),
+        ('lookup_dict_{}'.format(len(lookup_rsids)), lookup_dict, None),
+        ('lookup_lazy_{}'.format(len(lookup_rsids)), lookup_lazy, None),
+        ('generate_test_data', lambda: generate(False), None),
+        ('generate_test_data_extended', lambda: generate(True), None),
+        ('package', package, clean_package),
+        ('package_warm', package, warm_package),
+    ]
+
+
+def measure(func, runs, setup=None):
+    # setup runs untimed before every call
+    timings = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'time_ms': round(timings[len(timings) // 2], 3),
+            'peak_kb': round(peak / 1024.0, 1)}
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in sorted(results['stages'].items()):
+        base = baseline['stages'].get(name)
+        if base is None or not base['time_ms']:
+            print('{:<30} {:>10.3f} ms  (no baseline)'.format(
+                name, result['time_ms']))
+            continue
+        ratio = result['time_ms'] / base['time_ms']
+        flag = ''
+        if ratio > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print('{:<30} {:>10.3f} ms  {:>10.3f} ms  x{:.2f}{}'.format(
+            name, result['time_ms'], base['time_ms'], ratio, flag))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--only', action='append', default=None,
+                        help='Run only the stages starting with this name')
+    parser.add_argument('--output', default=None,
+                        help='Write the results as json to this file')
+    parser.add_argument('--baseline', default=None,
+                        help='Compare the results with a saved json file')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown against the baseline that fails')
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='weapp-bench-')
+    # The sample genome and extended data caches stay out of the user cache
+    os.environ['WEAPP_CLI_CACHE_DIR'] = os.path.join(tmp_dir, 'cache')
+    try:
+        results = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'runs': args.runs,
+            'stages': {}
+        }
+        for name, func, setup in stages(tmp_dir):
+            if args.only and not any(name.startswith(prefix)
+                                     for prefix in args.only):
+                continue
+            results['stages'][name] = measure(func, args.runs, setup)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    if args.output:
+        with open(args.output, 'w') as output_f:
+            json.dump(results, output_f, indent=2, sort_keys=True)
+
+    failed = False
+    if args.baseline:
+        with open(args.baseline) as baseline_f:
+            baseline = json.load(baseline_f)
+        print('{:<30} {:>13}  {:>13}'.format('stage', 'current',
+                                             'baseline'))
+        failed = bool(compare(results, baseline, args.threshold))
+    else:
+        for name, result in sorted(results['stages'].items()):
+            print('{:<30} {:>10.3f} ms  {:>12.1f} KB peak'.format(
+                name, result['time_ms'], result['peak_kb']))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Startup time benchmark for weapp-cli.
+
+Runs `weapp-cli --help` and a bare import of the CLI module in fresh
+interpreters and reports the median wall time. With --max-ms the script
+exits with status 1 when the median exceeds the budget, so it can guard
+against startup regressions in CI:
+
+    python benchmarks/startup.py --runs 20 --max-ms 300
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    'help': [sys.executable, '-m', 'weapp_cli.cli', '--help'],
+    'import': [sys.executable, '-c', 'import weapp_cli.cli'],
+}
+
+# Modules that must not be imported just to start the CLI
+LAZY_MODULES = ['weapp_cli.sample', 'weapp_cli.wegene_utils', 'numpy',
+                'markdown', 'urllib.request']
+
+
+def time_command(command, runs):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def eager_modules():
+    code = ('import sys, weapp_cli.cli; '
+            'print(" ".join(m for m in {!r} if m in sys.modules))'
+            .format(LAZY_MODULES))
+    output = subprocess.check_output([sys.executable, '-c', code],
+                                     env=dict(os.environ, PYTHONPATH=ROOT))
+    return output.decode().split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Fail when the median `--help` time is above')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the results as json')
+    args = parser.parse_args()
+
+    results = dict((name, round(time_command(command, args.runs), 1))
+                   for name, command in sorted(CASES.items()))
+    results['eager_modules'] = eager_modules()
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name in sorted(CASES):
+            print('{:<8} {:>8.1f} ms (median of {})'.format(
+                name, results[name], args.runs))
+        print('eagerly imported heavy modules: {}'.format(
+            ', '.join(results['eager_modules']) or 'none'))
+
+    failed = bool(results['eager_modules'])
+    if args.max_ms is not None and results['help'] > args.max_ms:
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,7 @@ A CLI tool for generating, testing and packaging WeGene weapps
 """
 from setuptools import find_packages, setup
 
-dependencies = ['click', 'wget', 'markdown']
+dependencies = ['click', 'markdown']
 
 setup(
     name='wegene-weapp-cli',
@@ -19,7 +19,9 @@ setup(
     zip_safe=False,
     platforms='any',
     install_requires=dependencies,
-    package_data={'': ['file_templates/*',
+    extras_require={'numpy': ['numpy']},
+    package_data={'': ['sample.json.gz',
+                       'file_templates/*',
                        'file_templates/python27/*', 
                        'file_templates/python3/*', 
                        'file_templates/r/*', 
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # Keeps the sample, asset store and digest caches out of the user cache
+    path = tmp_path / 'cache'
+    monkeypatch.setenv('WEAPP_CLI_CACHE_DIR', str(path))
+    return path
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from weapp_cli import asset_store
+
+
+def write_assets(root, content):
+    (root / 'indexes').mkdir(parents=True)
+    (root / 'indexes' / 'index_a.idx').write_bytes(content)
+    (root / 'indexes' / 'index_b.idx').write_bytes(content + b'b')
+    (root / 'readme.txt').write_bytes(b'assets\n')
+
+
+def store_objects():
+    objects = os.path.join(asset_store.store_path(), 'objects')
+    return sorted(filename for _, _, filenames in os.walk(objects)
+                  for filename in filenames)
+
+
+def test_import_tree_stores_equal_files_once(tmp_path):
+    write_assets(tmp_path / 'one', b'0\trs1\t1\t10\n')
+    write_assets(tmp_path / 'two', b'0\trs1\t1\t10\n')
+    first = asset_store.import_tree(str(tmp_path / 'one'))
+    second = asset_store.import_tree(str(tmp_path / 'two'))
+    assert first == second
+    assert sorted(first) == ['indexes/index_a.idx', 'indexes/index_b.idx',
+                             'readme.txt']
+    assert store_objects() == sorted(set(first.values()))
+
+
+def test_link_tree_recreates_the_files(tmp_path):
+    write_assets(tmp_path / 'src', b'0\trs1\t1\t10\n')
+    manifest = asset_store.import_tree(str(tmp_path / 'src'))
+    method = asset_store.link_tree(sorted(manifest.items()),
+                                   str(tmp_path / 'dest'))
+    assert method in asset_store.LINK_METHODS
+    for rel_path in manifest:
+        with open(str(tmp_path / 'src' / rel_path), 'rb') as src_f, \
+                open(str(tmp_path / 'dest' / rel_path), 'rb') as dest_f:
+            assert src_f.read() == dest_f.read()
+
+
+def test_derived_object_is_built_once(tmp_path):
+    write_assets(tmp_path / 'src', b'0\trs1\t1\t10\n')
+    manifest = asset_store.import_tree(str(tmp_path / 'src'))
+    calls = []
+
+    def build(source_path, tmp_path):
+        calls.append(source_path)
+        with open(source_path, 'rb') as src_f, open(tmp_path, 'wb') as dest_f:
+            dest_f.write(src_f.read().upper())
+
+    source = manifest['readme.txt']
+    digest = asset_store.derived_object(source, 'upper', 1, build)
+    assert asset_store.derived_object(source, 'upper', 1, build) == digest
+    assert asset_store.derived_object(source, 'upper', 2, build) != digest
+    assert len(calls) == 2
+    with open(asset_store.object_path(digest), 'rb') as object_f:
+        assert object_f.read() == b'ASSETS\n'
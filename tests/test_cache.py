@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from weapp_cli import cache
+
+
+def test_cached_digest_reads_a_file_once_until_it_changes(tmp_path,
+                                                          monkeypatch):
+    path = tmp_path / 'sample.json.gz'
+    path.write_bytes(b'first')
+    digest = cache.cached_digest(str(path))
+    assert digest == cache.file_digest(str(path))
+
+    def fail(path, algorithm='sha1'):
+        raise AssertionError('digest computed again')
+
+    file_digest = cache.file_digest
+    monkeypatch.setattr(cache, 'file_digest', fail)
+    assert cache.cached_digest(str(path)) == digest
+
+    monkeypatch.setattr(cache, 'file_digest', file_digest)
+    mtime = os.path.getmtime(str(path))
+    path.write_bytes(b'other')
+    os.utime(str(path), (mtime + 10, mtime + 10))
+    assert cache.cached_digest(str(path)) == file_digest(str(path)) != digest
+
+
+def test_build_entry(tmp_path):
+    calls = []
+
+    def build(tmp_entry):
+        calls.append(tmp_entry)
+        with open(os.path.join(tmp_entry, 'data'), 'w') as data_f:
+            data_f.write('built')
+
+    entry = str(tmp_path / 'entry')
+    assert cache.build_entry(entry, build) == entry
+    assert cache.build_entry(entry, build) == entry
+    assert len(calls) == 1
+    assert os.listdir(str(tmp_path)) == ['entry']
+
+
+def test_build_entry_leaves_nothing_on_errors(tmp_path):
+    def build(tmp_entry):
+        raise ValueError('broken')
+
+    with pytest.raises(ValueError):
+        cache.build_entry(str(tmp_path / 'entry'), build)
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import random
+import hashlib
+import zipfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from weapp_cli import download
+
+
+class Handler(BaseHTTPRequestHandler):
+    # Serves server.files, {path: (body, ranged)}, and logs the requests
+
+    def do_GET(self):
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+        body, ranged = self.server.files[self.path]
+        range_header = self.headers.get('Range')
+        with self.server.lock:
+            self.server.requests.append((self.path, range_header))
+        if ranged and range_header:
+            start, end = range_header[len('bytes='):].split('-')
+            start, end = int(start), min(int(end), len(body) - 1)
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(
+                start, end, len(body)))
+            body = body[start:end + 1]
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.files = {}
+    httpd.requests = []
+    httpd.lock = threading.Lock()
+    httpd.url = 'http://127.0.0.1:{}'.format(httpd.server_address[1])
+    thread = threading.Thread(target=httpd.serve_forever,
+                              kwargs={'poll_interval': 0.05})
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def payload(server, monkeypatch):
+    monkeypatch.setattr(download, 'CHUNK_SIZE', 1000)
+    monkeypatch.setattr(download, 'READ_SIZE', 300)
+    rng = random.Random(0)
+    body = bytes(rng.getrandbits(8) for _ in range(10500))
+    server.files['/extended_data.zip'] = (body, True)
+    return body
+
+
+def ranges(server):
+    # The ranged requests after the one that probes the size
+    return sorted(range_header for _, range_header in server.requests[1:])
+
+
+def test_download_in_ranges(server, payload, tmp_path):
+    dest = str(tmp_path / 'extended_data.zip')
+    sizes = []
+    assert download.download(server.url + '/extended_data.zip', dest,
+                             jobs=3, progress=sizes.append) == dest
+    with open(dest, 'rb') as dest_f:
+        assert dest_f.read() == payload
+    assert sum(sizes) == len(payload)
+    assert len(ranges(server)) == 11
+    assert os.listdir(str(tmp_path)) == ['extended_data.zip']
+
+
+def test_download_resumes_after_the_finished_chunks(server, payload,
+                                                    tmp_path):
+    url = server.url + '/extended_data.zip'
+    dest = str(tmp_path / 'extended_data.zip')
+    with open(dest + '.part', 'wb') as part_f:
+        part_f.write(payload[:3000] + b'\0' * (len(payload) - 3000))
+    with open(dest + '.part.json', 'w') as state_f:
+        json.dump({'url': url, 'size': len(payload),
+                   'done': [0, 1000, 2000]}, state_f)
+    sizes = []
+    download.download(url, dest, jobs=2, progress=sizes.append)
+    with open(dest, 'rb') as dest_f:
+        assert dest_f.read() == payload
+    assert sum(sizes) == len(payload)
+    assert len(ranges(server)) == 8
+    assert 'bytes=0-999' not in ranges(server)
+
+
+def test_download_ignores_the_state_of_another_url(server, payload,
+                                                   tmp_path):
+    dest = str(tmp_path / 'extended_data.zip')
+    with open(dest + '.part', 'wb') as part_f:
+        part_f.write(b'\0' * len(payload))
+    with open(dest + '.part.json', 'w') as state_f:
+        json.dump({'url': server.url + '/other.zip', 'size': len(payload),
+                   'done': [0, 1000, 2000]}, state_f)
+    download.download(server.url + '/extended_data.zip', dest)
+    with open(dest, 'rb') as dest_f:
+        assert dest_f.read() == payload
+    assert len(ranges(server)) == 11
+
+
+def test_download_without_range_support(server, payload, tmp_path):
+    server.files['/extended_data.zip'] = (payload, False)
+    dest = str(tmp_path / 'extended_data.zip')
+    download.download(server.url + '/extended_data.zip', dest, jobs=3)
+    with open(dest, 'rb') as dest_f:
+        assert dest_f.read() == payload
+    assert ranges(server) == [None]
+
+
+@pytest.mark.parametrize('matches', [True, False])
+def test_download_keeps_a_complete_dest(server, payload, tmp_path, matches):
+    dest = str(tmp_path / 'extended_data.zip')
+    content = payload if matches else payload[::-1]
+    with open(dest, 'wb') as dest_f:
+        dest_f.write(content)
+    sha256 = hashlib.sha256(payload).hexdigest().upper()
+    download.download(server.url + '/extended_data.zip', dest,
+                      sha256=sha256)
+    with open(dest, 'rb') as dest_f:
+        assert dest_f.read() == payload
+    assert len(ranges(server)) == (0 if matches else 11)
+    assert download.sha256sum(dest) == sha256.lower()
+
+
+def test_fetch_checksum(server, payload):
+    digest = hashlib.sha256(payload).hexdigest()
+    server.files['/extended_data.zip.sha256'] = (
+        (digest.upper() + '  extended_data.zip\n').encode('ascii'), True)
+    assert download.fetch_checksum(server.url + '/extended_data.zip') == \
+        digest
+    assert download.fetch_checksum(server.url + '/missing.zip') is None
+    server.files['/empty.zip.sha256'] = (b'', True)
+    assert download.fetch_checksum(server.url + '/empty.zip') is None
+
+
+def test_fetch_checksum_of_unreachable_server(server):
+    url = server.url
+    server.shutdown()
+    server.server_close()
+    assert download.fetch_checksum(url + '/extended_data.zip') is None
+
+
+def write_zip(path, entries):
+    with zipfile.ZipFile(path, 'w') as zip_file:
+        for name, data in entries:
+            zip_file.writestr(name, data)
+
+
+@pytest.mark.parametrize('remove', [True, False])
+def test_extract_archive(tmp_path, remove):
+    archive = str(tmp_path / 'extended_data.zip')
+    write_zip(archive, [('extended_data/', b''),
+                        ('extended_data/extended_data.dat', b'rs1\t1\t5\tAA\n'),
+                        ('README', b'new')])
+    dest_dir = tmp_path / 'lib'
+    (dest_dir / 'extended_data').mkdir(parents=True)
+    (dest_dir / 'extended_data' / 'old.dat').write_bytes(b'old')
+    (dest_dir / 'README').write_bytes(b'old')
+    download.extract_archive(archive, str(dest_dir), remove=remove)
+    assert os.path.isfile(archive) != remove
+    assert sorted(os.listdir(str(dest_dir))) == ['README', 'extended_data']
+    assert (dest_dir / 'README').read_bytes() == b'new'
+    assert os.listdir(str(dest_dir / 'extended_data')) == \
+        ['extended_data.dat']
+
+
+def test_extract_archive_rejects_unsafe_paths(tmp_path):
+    archive = str(tmp_path / 'extended_data.zip')
+    write_zip(archive, [('README', b'new'), ('../evil', b'evil')])
+    dest_dir = tmp_path / 'lib'
+    dest_dir.mkdir()
+    with pytest.raises(IOError):
+        download.extract_archive(archive, str(dest_dir))
+    assert os.path.isfile(archive)
+    assert os.listdir(str(dest_dir)) == []
+    assert not (tmp_path / 'evil').exists()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+
+import pytest
+
+from weapp_cli import extended_data
+
+
+def write_dat(path, count, seed=0):
+    rng = random.Random(seed)
+    entries = dict(('rs{}'.format(i), (rng.choice(['1', '2', 'X']),
+                                       str(rng.randint(1, 10 ** 8)),
+                                       rng.choice(['AA', 'AG', 'CT', '--'])))
+                   for i in range(1, count + 1))
+    lines = ['{}\t{}\t{}\t{}'.format(rsid, *entry)
+             for rsid, entry in entries.items()]
+    rng.shuffle(lines)
+    with open(path, 'w', newline='') as dat_f:
+        for i, line in enumerate(lines):
+            dat_f.write(line + ('\r\n' if i % 5 == 0 else '\n'))
+            if i % 97 == 0:
+                dat_f.write('\n')
+    return entries
+
+
+@pytest.mark.parametrize('chunk_lines', [2, 50, 1000000])
+def test_extended_store_lookups(tmp_path, monkeypatch, chunk_lines):
+    # Small chunks sort the file in many runs that are merged on disk
+    monkeypatch.setattr(extended_data, 'SORT_CHUNK_LINES', chunk_lines)
+    dat_path = str(tmp_path / 'extended_data.dat')
+    entries = write_dat(dat_path, 500)
+    store_path = extended_data.build_extended_store(dat_path)
+    assert store_path == str(tmp_path / 'extended_data.store')
+    assert sorted(os.listdir(str(tmp_path))) == ['extended_data.dat',
+                                                 'extended_data.store']
+    store = extended_data.open_extended_store(dat_path)
+    try:
+        assert len(store) == len(entries)
+        for rsid, (chromosome, position, genotype) in entries.items():
+            assert store.get(rsid) == {'genotype': genotype,
+                                       'chromosome': chromosome,
+                                       'position': position}
+        for rsid in ['rs0', 'rs5000', 'rs', 'i1', 'rs99999']:
+            assert store.get(rsid) is None
+    finally:
+        store.close()
+
+
+def test_extended_store_is_rebuilt_after_the_dat_changes(tmp_path):
+    dat_path = str(tmp_path / 'extended_data.dat')
+    write_dat(dat_path, 10)
+    assert not extended_data.is_store_current(dat_path)
+    assert extended_data.open_extended_store(dat_path) is None
+    store_path = extended_data.build_extended_store(dat_path)
+    assert extended_data.is_store_current(dat_path)
+    mtime = os.path.getmtime(store_path)
+    os.utime(dat_path, (mtime + 10, mtime + 10))
+    assert not extended_data.is_store_current(dat_path)
+    assert extended_data.open_extended_store(dat_path) is None
+
+
+def test_extended_store_rejects_other_files(tmp_path):
+    dat_path = str(tmp_path / 'extended_data.dat')
+    write_dat(dat_path, 10)
+    with open(extended_data.store_path_for(dat_path), 'wb') as store_f:
+        store_f.write(b'\0' * 64)
+    assert extended_data.is_store_current(dat_path)
+    assert extended_data.open_extended_store(dat_path) is None
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import shutil
+
+import pytest
+
+from weapp_cli import multi_test
+
+LIMITS = {'timeout': 30, 'memory_limit': 0, 'cpu_limit': 0}
+UTILS = os.path.join(os.path.dirname(multi_test.__file__), 'file_templates',
+                     'python3', 'wegene_utils.py')
+APP = '''
+import os
+import sys
+data = sys.stdin.read()
+print(os.path.basename(os.getcwd()), data)
+if data == 'fail':
+    sys.exit(1)
+'''
+
+
+def make_project(path, data='ok', meta=None, utils=None):
+    (path / 'data').mkdir(parents=True)
+    (path / '.weapp').write_text(json.dumps(
+        meta or {'project': path.name, 'language': 'python3'}))
+    (path / 'main.py').write_text(APP)
+    if utils is None:
+        shutil.copy(UTILS, str(path))
+    else:
+        (path / 'wegene_utils.py').write_text(utils)
+    if data is not None:
+        (path / 'data' / 'data.json').write_text(data)
+    return str(path)
+
+
+def test_find_projects(tmp_path):
+    for rel_path in ['a', 'a/sub', 'a/data/copy', 'a/lib/copy', 'b/.git/c',
+                     'b/node_modules/d', 'e/f']:
+        (tmp_path / rel_path).mkdir(parents=True)
+        (tmp_path / rel_path / '.weapp').write_text('{}')
+    (tmp_path / 'g').mkdir()
+    assert multi_test.find_projects(str(tmp_path)) == [
+        str(tmp_path / 'a'), str(tmp_path / 'a' / 'sub'),
+        str(tmp_path / 'e' / 'f')]
+
+
+def test_group_projects(tmp_path):
+    one = make_project(tmp_path / 'one')
+    two = make_project(tmp_path / 'two')
+    other = make_project(tmp_path / 'other', utils='# changed\n')
+    r_app = make_project(tmp_path / 'r_app', meta={'project': 'r_app',
+                                                   'language': 'r'})
+    broken = tmp_path / 'broken'
+    broken.mkdir()
+    (broken / '.weapp').write_text('{')
+    groups = multi_test.group_projects(
+        sorted([one, two, other, r_app, str(broken)]), 'Linux', jobs=2)
+    assert [[project['path'] for project in group['projects']]
+            for group in groups] == [[one, two], [other], [r_app],
+                                     [str(broken)]]
+    assert groups[0]['command'] == ['python3', 'main.py']
+    assert groups[2]['command'] == ['Rscript', 'main.R']
+    assert groups[3]['command'] is None
+    assert groups[3]['projects'][0]['error'].startswith('Invalid project')
+
+
+@pytest.mark.parametrize('warm', [False, True])
+def test_run_projects(tmp_path, warm):
+    with open(UTILS) as utils_f:
+        utils = utils_f.read()
+    paths = [make_project(tmp_path / 'pass'),
+             make_project(tmp_path / 'fail', data='fail'),
+             make_project(tmp_path / 'no_data', data=None),
+             make_project(tmp_path / 'other', utils=utils + '# changed\n')]
+    groups = multi_test.group_projects(paths, 'Linux')
+    progress = []
+    outcomes = multi_test.run_projects(groups, jobs=2, warm=warm,
+                                       use_cache=False,
+                                       progress=progress.append, **LIMITS)
+    assert len(progress) == 4
+    statuses = dict((os.path.basename(outcome['project']['path']),
+                     multi_test.status(outcome)) for outcome in outcomes)
+    assert statuses == {'pass': 'pass', 'fail': 'fail', 'no_data': 'error',
+                        'other': 'pass'}
+    for outcome in outcomes:
+        if outcome['result'] is not None:
+            # Every app ran in its own folder, also on a shared warm worker
+            name = os.path.basename(outcome['project']['path'])
+            assert outcome['result'].stdout.split()[0] == \
+                name.encode('ascii')
+
+
+def test_run_projects_reuses_cached_results(tmp_path):
+    paths = [make_project(tmp_path / 'pass'),
+             make_project(tmp_path / 'fail', data='fail')]
+    groups = multi_test.group_projects(paths, 'Linux')
+    outcomes = multi_test.run_projects(groups, **LIMITS)
+    assert not any(outcome['cached'] for outcome in outcomes)
+    outcomes = multi_test.run_projects(groups, **LIMITS)
+    assert all(outcome['cached'] for outcome in outcomes)
+    assert [multi_test.status(outcome) for outcome in outcomes] == \
+        ['pass', 'fail']
+
+    log_path = str(tmp_path / multi_test.log_name(str(tmp_path), paths[1]))
+    multi_test.write_log(log_path, outcomes[1], 'utf-8', LIMITS)
+    with open(log_path, encoding='utf-8') as log_f:
+        log = log_f.read()
+    assert 'Status: fail (cached)\n' in log
+    assert 'The app exited with status 1' in log
+
+
+def test_log_name(tmp_path):
+    root = str(tmp_path / 'apps')
+    assert multi_test.log_name(root, os.path.join(root, 'a', 'b')) == \
+        'a__b.log'
+    assert multi_test.log_name(root, root) == 'apps.log'
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import shutil
+import zipfile
+
+import pytest
+
+from weapp_cli import packager
+from weapp_cli.packager import IgnoreRules, build_package, walk_project
+
+
+@pytest.mark.parametrize('lines, rel_path, is_dir, ignored', [
+    (['*.log'], 'app.log', False, True),
+    (['*.log'], 'lib/deep/app.log', False, True),
+    (['*.log'], 'app.log.txt', False, False),
+    (['*.log', '!keep.log'], 'keep.log', False, False),
+    (['*.log', '!keep.log', 'keep.log'], 'keep.log', False, True),
+    (['build/'], 'build', True, True),
+    (['build/'], 'build', False, False),
+    (['build/'], 'lib/build', True, True),
+    (['/top.txt'], 'top.txt', False, True),
+    (['/top.txt'], 'lib/top.txt', False, False),
+    (['docs/**/*.md'], 'docs/a/b/c.md', False, True),
+    (['docs/**/*.md'], 'docs/c.md', False, True),
+    (['docs/**/*.md'], 'lib/docs/c.md', False, False),
+    (['data?.csv'], 'data1.csv', False, True),
+    (['data?.csv'], 'data/.csv', False, False),
+    (['model_[0-9].bin'], 'model_3.bin', False, True),
+    (['model_[!0-9].bin'], 'model_3.bin', False, False),
+    (['# comment', ''], 'comment', False, False),
+    (['\\#notes'], '#notes', False, True),
+    (['\\!important'], '!important', False, True),
+])
+def test_ignore_rules(lines, rel_path, is_dir, ignored):
+    assert IgnoreRules(lines).ignored(rel_path, is_dir) == ignored
+
+
+def test_default_ignore_rules(tmp_path):
+    rules = IgnoreRules.from_file(str(tmp_path / '.weappignore'))
+    assert rules.ignored('__pycache__', is_dir=True)
+    assert rules.ignored('lib/module.pyc')
+    assert not rules.ignored('main.py')
+
+
+def write_tree(root):
+    (root / 'lib' / 'models').mkdir(parents=True)
+    (root / 'data').mkdir()
+    (root / 'empty').mkdir()
+    (root / 'main.py').write_text('print("weapp")\n')
+    (root / 'run.sh').write_text('#!/bin/sh\n')
+    (root / 'run.sh').chmod(0o755)
+    (root / 'app.log').write_text('log\n')
+    (root / 'data' / 'data.json').write_text('{}')
+    for i in range(20):
+        (root / 'lib' / 'models' / 'model_{}.txt'.format(i)).write_bytes(
+            os.urandom(100).hex().encode('ascii') * (i + 1))
+    (root / '.weappignore').write_text('*.log\n')
+
+
+def package(root, jobs=2):
+    cwd = os.getcwd()
+    os.chdir(str(root))
+    try:
+        rules = IgnoreRules.from_file('.weappignore')
+        files, dirs, skipped = walk_project(
+            '.', rules, local_dirs=['data', '.weapp-cache'],
+            skip_files=['app.zip', '.weappignore'])
+        counts = build_package('app.zip', files, dirs, jobs=jobs)
+        with open('app.zip', 'rb') as zip_f:
+            return counts, zip_f.read(), skipped
+    finally:
+        os.chdir(cwd)
+
+
+def test_package_contents(tmp_path):
+    write_tree(tmp_path)
+    _, _, skipped = package(tmp_path)
+    assert skipped == ['data']
+    with zipfile.ZipFile(str(tmp_path / 'app.zip')) as zip_file:
+        assert zip_file.testzip() is None
+        names = zip_file.namelist()
+        assert names == sorted(names)
+        assert 'app.log' not in names
+        assert 'empty/' in names
+        assert not any(name.startswith('data') for name in names)
+        info = zip_file.getinfo('run.sh')
+        assert info.date_time == packager.FIXED_DATE_TIME
+        assert info.external_attr >> 16 & 0o777 == 0o755
+        assert zip_file.read('main.py') == b'print("weapp")\n'
+
+
+def test_package_is_deterministic(tmp_path, monkeypatch):
+    first = tmp_path / 'first'
+    first.mkdir()
+    write_tree(first)
+    counts, archive, _ = package(first)
+    assert counts == (0, 22)
+
+    # The archive is copied back as is once nothing changed
+    counts, again, _ = package(first, jobs=1)
+    assert counts == (22, 0)
+    assert again == archive
+
+    # Other modification times and the public ZipFile path give the same
+    # bytes
+    second = tmp_path / 'second'
+    shutil.copytree(str(first), str(second),
+                    ignore=shutil.ignore_patterns('.weapp-cache', 'app.zip'))
+    later = time.time() + 3600
+    for dirname, _, filenames in os.walk(str(second)):
+        for filename in filenames:
+            os.utime(os.path.join(dirname, filename), (later, later))
+    monkeypatch.setattr(packager, 'RAW_WRITES', False)
+    counts, other, _ = package(second)
+    assert counts == (0, 22)
+    assert other == archive
+
+
+def test_package_recompresses_changed_files(tmp_path):
+    write_tree(tmp_path)
+    package(tmp_path)
+    (tmp_path / 'main.py').write_text('print("changed")\n')
+    counts, _, _ = package(tmp_path)
+    assert counts == (21, 1)
+    with zipfile.ZipFile(str(tmp_path / 'app.zip')) as zip_file:
+        assert zip_file.testzip() is None
+        assert zip_file.read('main.py') == b'print("changed")\n'
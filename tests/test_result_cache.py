@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+import pytest
+
+from weapp_cli import result_cache
+from weapp_cli.result_cache import ResultCache
+from weapp_cli.runner import RunResult
+
+COMMAND = [sys.executable, 'main.py']
+LIMITS = {'timeout': 60, 'memory_limit': 2048, 'cpu_limit': 60}
+
+
+def touch(path, text):
+    # A new modification time even on file systems with coarse timestamps
+    mtime = os.path.getmtime(str(path)) if path.exists() else 0
+    path.write_text(text)
+    os.utime(str(path), (mtime + 10, mtime + 10))
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / 'project'
+    (path / 'lib').mkdir(parents=True)
+    (path / 'data').mkdir()
+    (path / 'main.py').write_text('print(1)\n')
+    (path / 'lib' / 'helper.py').write_text('x = 1\n')
+    (path / 'data' / 'data.json').write_text('{"inputs": {}}')
+    return path
+
+
+def key(project, stdin_name='data.json', limits=LIMITS):
+    return ResultCache(str(project)).key(
+        COMMAND, 'python3', str(project / 'data' / stdin_name), limits)
+
+
+def test_key_follows_the_sources_input_and_limits(project):
+    first = key(project)
+    assert key(project) == first
+
+    # Outputs of a test run, other data and the cache itself do not count
+    touch(project / 'test_result.html', '<html>')
+    touch(project / 'data' / 'other.json', '{}')
+    touch(project / '.weapp-cache' / 'other.json', '{}')
+    assert key(project) == first
+
+    assert key(project, limits=dict(LIMITS, cpu_limit=10)) != first
+    assert key(project, stdin_name='other.json') != first
+
+    touch(project / 'lib' / 'helper.py', 'x = 2\n')
+    second = key(project)
+    assert second != first
+    touch(project / 'data' / 'data.json', '{"inputs": {"sex": 1}}')
+    assert key(project) != second
+
+
+def test_unchanged_sources_are_not_read_again(project, monkeypatch):
+    digest = ResultCache(str(project)).sources_digest()
+
+    def fail(path, algorithm='sha1'):
+        raise AssertionError('{} read again'.format(path))
+
+    monkeypatch.setattr(result_cache, 'file_digest', fail)
+    assert ResultCache(str(project)).sources_digest() == digest
+
+
+def test_results_are_stored_and_reused(project):
+    cache = ResultCache(str(project))
+    result = RunResult(1, b'out\xff', b'err', False, 1.5, 0.25, 14, None)
+    cache.put('key', result)
+    assert ResultCache(str(project)).get('key') == result
+    assert cache.get('other') is None
+
+
+@pytest.mark.parametrize('returncode, timed_out', [(-9, True), (-24, False)])
+def test_results_cut_short_are_not_stored(project, returncode, timed_out):
+    cache = ResultCache(str(project))
+    cache.put('key', RunResult(returncode, b'', b'', timed_out, 60.0, None,
+                               14, None))
+    assert cache.get('key') is None
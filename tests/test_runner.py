@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import signal
+
+import pytest
+
+from weapp_cli import runner
+
+posix_only = pytest.mark.skipif(runner.resource is None,
+                                reason='limits need the resource module')
+
+
+def python(code):
+    return [sys.executable, '-c', code]
+
+
+@pytest.fixture
+def stdin_path(tmp_path):
+    path = tmp_path / 'data.json'
+    # Larger than a pipe buffer in both directions
+    path.write_bytes(b'{"inputs": "' + b'ACGT' * 100000 + b'"}')
+    return str(path)
+
+
+def test_run_app_passes_stdin_through(stdin_path, tmp_path):
+    result = runner.run_app(
+        python('import sys\n'
+               'data = sys.stdin.buffer.read()\n'
+               'sys.stdout.buffer.write(data)\n'
+               'sys.stderr.write(str(len(data)))'),
+        stdin_path, cwd=str(tmp_path))
+    with open(stdin_path, 'rb') as stdin_f:
+        assert result.stdout == stdin_f.read()
+    assert result.stderr == str(len(result.stdout)).encode('ascii')
+    assert result.returncode == 0
+    assert not result.timed_out
+    assert runner.describe_failure(result, 60, 60) is None
+
+
+def test_run_app_reports_the_exit_status(stdin_path):
+    result = runner.run_app(python('import sys; sys.exit(3)'), stdin_path)
+    assert result.returncode == 3
+    assert runner.describe_failure(result, 60, 60) == \
+        'The app exited with status 3'
+
+
+@posix_only
+def test_timeout_stops_the_children_of_the_app(stdin_path):
+    # The child holds the output pipes open after the app is killed
+    result = runner.run_app(
+        python('import subprocess, time\n'
+               'subprocess.Popen(["sleep", "30"])\n'
+               'time.sleep(30)'),
+        stdin_path, timeout=0.5)
+    assert result.timed_out
+    assert result.duration < 10
+    assert runner.describe_failure(result, 0.5, 60) == \
+        'The app was stopped after exceeding the time limit of 0.5s'
+
+
+@posix_only
+def test_cpu_limit(stdin_path):
+    result = runner.run_app(python('while True: pass'), stdin_path,
+                            timeout=30, cpu_limit=1)
+    assert not result.timed_out
+    assert result.returncode == -signal.SIGXCPU
+    assert runner.describe_failure(result, 30, 1) == \
+        'The app was stopped after exceeding the CPU time limit of 1s'
+
+
+@posix_only
+def test_memory_limit(stdin_path):
+    result = runner.run_app(python('data = bytearray(512 * 1024 * 1024)'),
+                            stdin_path, memory_limit=200)
+    assert result.returncode == 1
+    assert b'MemoryError' in result.stderr
+    # Allowed without the limit
+    result = runner.run_app(python('data = bytearray(512 * 1024 * 1024)'),
+                            stdin_path, memory_limit=0)
+    assert result.returncode == 0
+
+
+@posix_only
+def test_other_signals_are_not_blamed_on_the_cpu_limit(stdin_path):
+    result = runner.run_app(
+        python('import os, signal; os.kill(os.getpid(), signal.SIGKILL)'),
+        stdin_path, cpu_limit=60)
+    assert result.returncode == -signal.SIGKILL
+    assert runner.describe_failure(result, 60, 60) == \
+        'The app was killed by signal {}'.format(int(signal.SIGKILL))
+
+
+def test_profile(stdin_path):
+    result = runner.run_app(
+        python('import sys, time\n'
+               'data = sys.stdin.buffer.read()\n'
+               'time.sleep(0.2)\n'
+               'print("ready", flush=True)\n'
+               'end = time.process_time() + 0.3\n'
+               'while time.process_time() < end: pass\n'
+               'sys.stderr.write("done")'),
+        stdin_path)
+    report = runner.profile(result)
+    assert report['stdin_bytes'] == os.path.getsize(stdin_path)
+    assert report['stdout_bytes'] == len(b'ready\n')
+    assert report['stderr_bytes'] == len(b'done')
+    assert report['returncode'] == 0 and not report['timed_out']
+    assert 0.2 <= report['time_to_first_output'] <= report['wall_time']
+    line = runner.format_profile(report)
+    assert line.startswith('wall ')
+    assert 'first output ' in line
+    if runner.resource is not None:
+        assert report['user_time'] + report['system_time'] >= 0.25
+        assert report['peak_rss_bytes'] > 1024 * 1024
+        assert 'peak RSS ' in line
+
+
+def test_profile_without_usage():
+    result = runner.RunResult(0, b'', b'', False, 1.5, None, 10, None)
+    report = runner.profile(result)
+    assert report['time_to_first_output'] is None
+    assert 'user_time' not in report
+    assert runner.format_profile(report) == \
+        'wall 1.500s, stdin 10 B, stdout 0 B, stderr 0 B'
+
+
+@posix_only
+def test_sigkill_at_the_hard_cpu_limit_is_blamed_on_it(stdin_path):
+    # An app ignoring SIGXCPU is killed one second later
+    result = runner.run_app(
+        python('import signal\n'
+               'signal.signal(signal.SIGXCPU, signal.SIG_IGN)\n'
+               'while True: pass'),
+        stdin_path, timeout=30, cpu_limit=1)
+    assert result.returncode == -signal.SIGKILL
+    assert runner.describe_failure(result, 30, 1) == \
+        'The app was stopped after exceeding the CPU time limit of 1s'
+
+
+def test_run_corpus(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / 'input{}.json'.format(i)
+        path.write_text('fail' if i == 4 else 'input {}'.format(i))
+        paths.append(str(path))
+    progress = []
+    results, elapsed = runner.run_corpus(
+        python('import sys\n'
+               'data = sys.stdin.read()\n'
+               'if data == "fail": sys.exit(2)\n'
+               'print("output of " + data)'),
+        paths, jobs=3, progress=progress.append, timeout=30)
+    assert [path for path, _ in results] == paths
+    assert [result.stdout.strip() for _, result in results] == \
+        [b'output of input 0', b'output of input 1', b'output of input 2',
+         b'output of input 3', b'', b'output of input 5']
+    assert sum(progress) == len(paths)
+    assert elapsed >= max(result.duration for _, result in results)
+
+    summary = runner.summarize_corpus(results, elapsed, slowest=2)
+    assert summary['inputs'] == 6
+    assert summary['failures'] == 1
+    assert summary['failed'] == [{'input': paths[4], 'returncode': 2,
+                                  'timed_out': False}]
+    assert summary['timeouts'] == 0
+    assert len(summary['slowest']) == 2
+
+
+def make_result(duration, returncode=0, timed_out=False):
+    return runner.RunResult(returncode, b'', b'', timed_out, duration, None,
+                            0, None)
+
+
+def test_summarize_corpus():
+    results = [('input{}.json'.format(i), make_result(float(i)))
+               for i in range(1, 11)]
+    results[2] = ('input3.json', make_result(3.0, returncode=1))
+    results[6] = ('input7.json', make_result(7.0, returncode=-9,
+                                             timed_out=True))
+    summary = runner.summarize_corpus(results, 5.0, slowest=3)
+    assert summary['inputs'] == 10
+    assert summary['failures'] == 2
+    assert summary['timeouts'] == 1
+    assert summary['throughput'] == 2.0
+    assert (summary['p50'], summary['p95'], summary['p99'], summary['max']) \
+        == (5.0, 10.0, 10.0, 10.0)
+    assert [item['input'] for item in summary['slowest']] == \
+        ['input10.json', 'input9.json', 'input8.json']
+    assert summary['failed'] == [
+        {'input': 'input3.json', 'returncode': 1, 'timed_out': False},
+        {'input': 'input7.json', 'returncode': -9, 'timed_out': True}]
+    assert runner.percentile([], 0.5) is None
+
+
+def test_summarize_corpus_leaves_out_cached_results():
+    results = [('input{}.json'.format(i), make_result(float(i)))
+               for i in range(1, 5)]
+    results[0] = ('input1.json', make_result(0.0, returncode=1))
+    summary = runner.summarize_corpus(
+        results, 2.0, cached=['input1.json', 'input4.json'])
+    assert summary['inputs'] == 4
+    assert summary['cached'] == 2
+    # Cached failures still count
+    assert summary['failures'] == 1
+    assert summary['throughput'] == 1.0
+    assert (summary['p50'], summary['max']) == (2.0, 3.0)
+    assert [item['input'] for item in summary['slowest']] == \
+        ['input3.json', 'input2.json']
+    summary = runner.summarize_corpus(results, 2.0, cached=dict(results))
+    assert summary['throughput'] is None and summary['p50'] is None
+
+
+APP = '''
+import os
+import sys
+import shutil
+import time
+import state
+import wegene_utils
+
+state.runs.append(wegene_utils.__name__)
+data = sys.stdin.read()
+print(os.getpid(), len(state.runs))
+if data == 'exit':
+    sys.exit(3)
+if data == 'crash':
+    os._exit(5)
+if data == 'hang':
+    time.sleep(30)
+'''
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / 'project'
+    path.mkdir()
+    shutil.copy(os.path.join(os.path.dirname(runner.__file__),
+                             'file_templates', 'python3', 'wegene_utils.py'),
+                str(path))
+    (path / 'state.py').write_text('runs = []\n')
+    (path / 'main.py').write_text(APP)
+    for name in ['ok', 'exit', 'crash', 'hang']:
+        (tmp_path / name).write_text(name)
+    return path
+
+
+def test_warm_worker(project, tmp_path):
+    worker = runner.WarmWorker([sys.executable, 'main.py'], cwd=str(project),
+                               timeout=2)
+    try:
+        first = worker.run(str(tmp_path / 'ok'))
+        assert first.returncode == 0 and not first.timed_out
+        pid, runs = first.stdout.split()
+        # Same process, modules of the project are imported again
+        assert worker.run(str(tmp_path / 'ok')).stdout.split() == [pid, b'1']
+        assert runs == b'1'
+
+        result = worker.run(str(tmp_path / 'exit'))
+        assert result.returncode == 3
+        assert result.stdout.split()[0] == pid
+
+        result = worker.run(str(tmp_path / 'crash'))
+        assert result.returncode == 5
+        result = worker.run(str(tmp_path / 'ok'))
+        assert result.returncode == 0
+        assert result.stdout.split()[0] != pid
+
+        result = worker.run(str(tmp_path / 'hang'))
+        assert result.timed_out
+        assert worker.run(str(tmp_path / 'ok')).returncode == 0
+    finally:
+        worker.close()
+
+
+def test_summarize_trace(tmp_path):
+    trace_path = tmp_path / 'trace.jsonl'
+    trace_path.write_text(
+        '{"function": "parse_genome_string", "pid": 1, "phases": '
+        '{"index_load": 0.5, "dict_build": 0.25}, "counters": '
+        '{"snps": 10, "missing": 2}}\n'
+        '{"function": "parse_genome_string", "pid": 1, "phases": '
+        '{"index_load": 0.25, "dict_build": 0.25}, "counters": '
+        '{"snps": 10, "missing": 1}}\n'
+        '{"function": "process_raw_genome_data", "pid": 2, "phases": '
+        '{"decode": 0.125}, "counters": {}}\n'
+        '{"function": "parse_genome_str')
+    # The last record was cut short
+    records = runner.read_trace(str(trace_path))
+    assert len(records) == 3
+    summary = runner.summarize_trace(records)
+    assert summary == {
+        'parse_genome_string': {
+            'calls': 2, 'phases': {'index_load': 0.75, 'dict_build': 0.5},
+            'counters': {'snps': 20, 'missing': 3}},
+        'process_raw_genome_data': {
+            'calls': 1, 'phases': {'decode': 0.125}, 'counters': {}}}
+    assert runner.format_trace(summary) == [
+        'parse_genome_string x2: index_load 0.750s, dict_build 0.500s; '
+        'missing 3, snps 20',
+        'process_raw_genome_data x1: decode 0.125s']
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import os
+import gzip
+import base64
+
+from weapp_cli import sample, wegene_utils
+
+INDEX = [('rs10', '1', '100'), ('rs11', '1', 'NA'), ('rs12', 'X', '300')]
+
+
+def test_load_sample_genome(tmp_path, cache_dir, monkeypatch):
+    idx_path = tmp_path / 'index_test.idx'
+    idx_path.write_text('NA\tNA\tNA\tNA\n' + ''.join(
+        '{}\t{}\t{}\t{}\n'.format(i + 1, *entry)
+        for i, entry in enumerate(INDEX)))
+    monkeypatch.setattr(wegene_utils, '_index_path',
+                        lambda genome_format, ext='idx':
+                        str(tmp_path / 'index_{}.{}'.format(genome_format,
+                                                            ext)))
+    genome = b'--GATT__'
+    monkeypatch.setattr(sample, '_data', {'inputs': {
+        'format': 'test',
+        'data': base64.b64encode(gzip.compress(genome)).decode('ascii')}})
+
+    sample_genome = sample.load_sample_genome()
+    try:
+        assert sample_genome.get('rs10') == {'genotype': 'AG',
+                                             'chromosome': '1',
+                                             'position': '100'}
+        assert sample_genome.get('rs11')['genotype'] == 'TT'
+        assert sample_genome.get('rs12')['genotype'] == '__'
+        assert sample_genome.get('rs1', 'default') == 'default'
+    finally:
+        sample_genome.close()
+    # Decoded once, later calls open the same entry
+    sample.load_sample_genome().close()
+    assert len(os.listdir(str(cache_dir / 'sample'))) == 1
+
+    # A changed index is a new entry
+    mtime = os.path.getmtime(str(idx_path))
+    with idx_path.open('a') as idx_f:
+        idx_f.write('4\trs13\t2\t400\n')
+    os.utime(str(idx_path), (mtime + 10, mtime + 10))
+    sample_genome = sample.load_sample_genome()
+    try:
+        assert sample_genome.get('rs13')['chromosome'] == '2'
+    finally:
+        sample_genome.close()
+    assert len(os.listdir(str(cache_dir / 'sample'))) == 2
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import os
+import gzip
+import json
+import base64
+
+import pytest
+
+pytest.importorskip('numpy')
+from weapp_cli import synth  # noqa: E402
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    # 200 sites of a format the bundled sample does not have, every fifth
+    # without an rsid
+    path = tmp_path / 'index_synth_test.idx'
+    path.write_text(''.join(
+        'NA\tNA\tNA\tNA\n' if i % 5 == 4 else
+        '{}\trs{}\t1\t{}\n'.format(i, i + 1, i * 100)
+        for i in range(200)))
+    monkeypatch.setattr(synth, '_index_path', lambda genome_format: str(path))
+    return str(path)
+
+
+def read_outputs(out_dir):
+    outputs = {}
+    for name in sorted(os.listdir(out_dir)):
+        with open(os.path.join(out_dir, name), 'rb') as out_f:
+            outputs[name] = out_f.read()
+    return outputs
+
+
+def test_generate_does_not_depend_on_jobs(index_path, tmp_path):
+    progress = []
+    assert synth.generate('synth_test', 10, str(tmp_path / 'one'), seed=7,
+                          jobs=1, progress=progress.append) == 7
+    synth.generate('synth_test', 10, str(tmp_path / 'two'), seed=7, jobs=2)
+    outputs = read_outputs(str(tmp_path / 'one'))
+    assert sorted(outputs) == ['synth_{:02d}.json'.format(i)
+                               for i in range(10)]
+    assert outputs == read_outputs(str(tmp_path / 'two'))
+    assert sum(progress) == 10
+    synth.generate('synth_test', 10, str(tmp_path / 'other'), seed=8)
+    assert outputs != read_outputs(str(tmp_path / 'other'))
+
+
+def test_generated_genomes(index_path, tmp_path):
+    out_dir = tmp_path / 'out'
+    synth.generate('synth_test', 3, str(out_dir), missing_rate=0, seed=1)
+    for name in os.listdir(str(out_dir)):
+        with open(str(out_dir / name)) as out_f:
+            inputs = json.load(out_f)['inputs']
+        assert inputs['format'] == 'synth_test'
+        genome = gzip.decompress(base64.b64decode(inputs['data'])) \
+            .decode('ascii')
+        assert len(genome) == 400
+        for i in range(200):
+            genotype = genome[i * 2:i * 2 + 2]
+            if i % 5 == 4:
+                assert genotype == '--'
+            else:
+                assert set(genotype) <= set('ACGT')
+                assert genotype == ''.join(sorted(genotype))
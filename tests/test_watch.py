@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+from weapp_cli import watch
+
+WATCHERS = [watch.PollingWatcher, pytest.param(
+    watch.InotifyWatcher, marks=pytest.mark.skipif(
+        not sys.platform.startswith('linux'), reason='inotify is Linux only'))]
+
+
+@pytest.mark.parametrize('rel_path, ignored', [
+    ('main.py', False),
+    ('lib/helper.py', False),
+    ('data/data.json', False),
+    ('test_result.html', True),
+    ('test_profile.json', True),
+    ('project.zip', True),
+    ('__pycache__/main.cpython-311.pyc', True),
+    ('.git/index', True),
+    ('.weapp-cache/sources.json', True),
+    ('extended_data/extended_data.dat', True),
+    ('main.py~', True),
+    ('.#main.py', True),
+    ('lib/.main.py.swp', True),
+])
+def test_is_ignored(rel_path, ignored):
+    assert watch.is_ignored(rel_path.replace('/', os.sep)) == ignored
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch, 'POLL_INTERVAL', 0.05)
+    monkeypatch.setattr(watch, 'DEBOUNCE', 0.1)
+    path = tmp_path / 'project'
+    (path / '__pycache__').mkdir(parents=True)
+    (path / 'main.py').write_text('print(1)\n')
+    return path
+
+
+def later(delay, *writes):
+    # Writes (path, text) pairs, delay seconds apart, from another thread
+    def write():
+        for path, text in writes:
+            time.sleep(delay)
+            if text is None:
+                path.mkdir()
+            else:
+                path.write_text(text)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize('watcher_class', WATCHERS)
+def test_watcher_reports_changes(project, watcher_class):
+    watcher = watcher_class(str(project))
+    try:
+        thread = later(0.2, (project / 'main.py', 'print(2)\n'))
+        assert watcher.wait(timeout=5) == {'main.py'}
+        thread.join()
+        thread = later(0.2, (project / 'lib', None),
+                       (project / 'lib' / 'helper.py', 'x = 1\n'))
+        assert watcher.wait(timeout=5) == {os.path.join('lib', 'helper.py')}
+        thread.join()
+    finally:
+        watcher.close()
+
+
+@pytest.mark.parametrize('watcher_class', WATCHERS)
+def test_watcher_keeps_waiting_on_ignored_changes(project, watcher_class):
+    watcher = watcher_class(str(project))
+    try:
+        # What a test run writes, followed by an edit
+        thread = later(0.2, (project / 'test_result.html', '<html>'),
+                       (project / '__pycache__' / 'main.cpython-311.pyc',
+                        'code'),
+                       (project / 'main.py', 'print(2)\n'))
+        assert watcher.wait(timeout=5) == {'main.py'}
+        thread.join()
+
+        thread = later(0.1, (project / 'test_result.html', '<html></html>'))
+        start = time.time()
+        assert watcher.wait(timeout=0.6) == set()
+        assert time.time() - start >= 0.6
+        thread.join()
+    finally:
+        watcher.close()
+
+
+def test_open_watcher(project):
+    watcher = watch.open_watcher(str(project))
+    try:
+        if sys.platform.startswith('linux'):
+            assert watcher.name == 'inotify'
+        thread = later(0.2, (project / 'main.py', 'print(2)\n'))
+        assert watcher.wait(timeout=5) == {'main.py'}
+        thread.join()
+    finally:
+        watcher.close()
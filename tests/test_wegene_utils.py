@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import gzip
+import json
+import base64
+import random
+
+import pytest
+
+from weapp_cli import wegene_utils
+
+
+def make_genome(count, seed=0):
+    rng = random.Random(seed)
+    return ''.join(rng.choice(['AA', 'AG', 'GA', 'CT', 'GG', 'DI', '--',
+                               '__'])
+                   for _ in range(count)).encode('ascii')
+
+
+def encode_genome(genome):
+    return base64.b64encode(gzip.compress(genome))
+
+
+def write_text_index(path, count):
+    with open(path, 'w') as idx_f:
+        for i in range(count):
+            if i % 7 == 3:
+                idx_f.write('NA\tNA\tNA\tNA\n')
+                continue
+            chromosome = ['1', '2', 'X', 'MT'][i * 4 // count]
+            idx_f.write('{}\trs{}\t{}\t{}\n'.format(i, 1000 + i, chromosome,
+                                                  i * 10 + 5))
+
+
+def read_text_index(path):
+    text_index = {}
+    with open(path) as idx_f:
+        for line in idx_f:
+            if not line.startswith('NA'):
+                fields = line.strip().split('\t')
+                text_index[fields[1]] = (int(fields[0]), fields[2], fields[3])
+    return text_index
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    # A text index of 500 positions for the genome format "test"
+    def path(genome_format, ext='idx'):
+        return str(tmp_path / 'index_{}.{}'.format(genome_format, ext))
+
+    write_text_index(path('test'), 500)
+    monkeypatch.setattr(wegene_utils, '_index_path', path)
+    return path
+
+
+def assert_same_index(index, text_index):
+    assert len(index) == len(text_index)
+    assert dict((rsid, (index_pos, chromosome, position))
+                for rsid, index_pos, chromosome, position
+                in index) == text_index
+    for rsid, entry in text_index.items():
+        assert rsid in index
+        assert index.get(rsid) == entry
+    assert 'rs1' not in index
+    assert index.get('rs1') is None
+
+
+def test_compiled_index_matches_text_index(index_path):
+    wegene_utils.compile_genome_index(index_path('test'))
+    index = wegene_utils.GenomeIndex(index_path('test', 'bin'))
+    try:
+        assert_same_index(index, read_text_index(index_path('test')))
+    finally:
+        index.close()
+
+
+def test_compiled_index_rejects_other_files(tmp_path):
+    bin_path = tmp_path / 'index_test.bin'
+    bin_path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        wegene_utils.GenomeIndex(str(bin_path))
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_parse_genome_string(index_path, compiled):
+    if compiled:
+        wegene_utils.compile_genome_index(index_path('test'))
+    genome = make_genome(500, seed=3).decode('ascii')
+    parsed = wegene_utils.parse_genome_string(genome, 'test')
+    text_index = read_text_index(index_path('test'))
+    assert len(parsed) == len(text_index)
+    for rsid, (index_pos, chromosome, position) in text_index.items():
+        assert parsed[rsid] == {
+            'genotype': wegene_utils.sort_genotype(
+                genome[index_pos * 2:index_pos * 2 + 2]),
+            'chromosome': chromosome, 'position': position}
+    assert 'rs1003' not in parsed
+
+
+def test_text_index_edited_after_compiling_wins(index_path):
+    wegene_utils.compile_genome_index(index_path('test'))
+    assert wegene_utils.open_genome_index('test') is not None
+    write_text_index(index_path('test'), 400)
+    bin_path = index_path('test', 'bin')
+    mtime = os.path.getmtime(bin_path)
+    os.utime(index_path('test'), (mtime + 10, mtime + 10))
+    assert wegene_utils.open_genome_index('test') is None
+    genome = make_genome(500, seed=4).decode('ascii')
+    assert len(wegene_utils.parse_genome_string(genome, 'test')) == \
+        len(read_text_index(index_path('test')))
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_lazy_genome_matches_parsed_genome(index_path, compiled):
+    if compiled:
+        wegene_utils.compile_genome_index(index_path('test'))
+    genome = make_genome(500, seed=5).decode('ascii')
+    parsed = wegene_utils.parse_genome_string(genome, 'test')
+    lazy = wegene_utils.LazyGenome(genome, 'test')
+    assert len(lazy) == len(parsed)
+    assert set(lazy) == set(parsed)
+    for rsid, entry in parsed.items():
+        assert rsid in lazy
+        assert lazy[rsid] == entry
+    assert 'rs1003' not in lazy
+    assert lazy.get('rs1003') is None
+    with pytest.raises(KeyError):
+        lazy['rs1003']
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_packed_genome_matches_parsed_genome(index_path, compiled):
+    pytest.importorskip('numpy')
+    if compiled:
+        wegene_utils.compile_genome_index(index_path('test'))
+    genome = make_genome(500, seed=6).decode('ascii')
+    parsed = wegene_utils.parse_genome_string(genome, 'test')
+    packed = wegene_utils.PackedGenome(genome, 'test')
+    assert len(packed) == len(parsed)
+    assert packed.to_dict() == parsed
+    for rsid, entry in parsed.items():
+        assert rsid in packed
+        assert packed[rsid] == entry
+        row = packed.find(rsid)
+        assert packed.genotype(row) == entry['genotype']
+        assert packed.missing[row] == (entry['genotype'] in ('--', '__'))
+        # Only genotypes of other alleles than ACGT are kept verbatim
+        assert (row in packed.others) == (entry['genotype'] in
+                                          ('--', '__', 'DI'))
+    assert 'rs1003' not in packed
+    with pytest.raises(KeyError):
+        packed['rs1003']
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64 * 1024])
+def test_decode_genome_data_matches_b64decode(monkeypatch, chunk_size):
+    monkeypatch.setattr(wegene_utils, 'DECODE_CHUNK_SIZE', chunk_size)
+    genome = make_genome(2000)
+    data = encode_genome(genome)
+    assert bytes(wegene_utils._decode_genome_data(data)) == \
+        gzip.decompress(base64.b64decode(data))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 64 * 1024])
+def test_decode_genome_data_unescapes_json(monkeypatch, chunk_size):
+    monkeypatch.setattr(wegene_utils, 'DECODE_CHUNK_SIZE', chunk_size)
+    genome = make_genome(2000, seed=1)
+    data = encode_genome(genome)
+    # What a JSON encoder may emit for the same string: escaped slashes,
+    # line breaks and \u escapes
+    lines = [data[i:i + 76] for i in range(0, len(data), 76)]
+    escaped = b'\\n'.join(lines).replace(b'/', b'\\/')
+    escaped = escaped.replace(b'A', b'\\u0041', 3)
+    assert bytes(wegene_utils._decode_genome_data(escaped)) == genome
+
+
+def test_find_inputs_data_skips_other_data_fields():
+    genome = make_genome(1000, seed=2)
+    body = json.dumps({
+        'meta': {'data': 'not the genome'},
+        'inputs': {'note': '"data": "decoy"', 'extra': {'data': 'nested'},
+                   'format': 'test_format',
+                   'data': encode_genome(genome).decode('ascii')}
+    }).encode('utf-8')
+    span = wegene_utils._find_inputs_data(body)
+    assert span is not None
+    start, end = span
+    assert bytes(wegene_utils._decode_genome_data(body[start:end])) == genome
+
+
+@pytest.mark.parametrize('mode', [{}, {'lazy': True}, {'packed': True}])
+def test_read_genome_inputs_matches_process_raw_genome_data(index_path,
+                                                            mode):
+    if mode.get('packed'):
+        pytest.importorskip('numpy')
+    genome = make_genome(500, seed=7)
+    raw_inputs = {'format': 'test',
+                  'data': encode_genome(genome).decode('ascii')}
+    body = json.dumps({'inputs': dict(raw_inputs, extra='kept')})
+    inputs, user_genome = wegene_utils.read_genome_inputs(
+        io.BytesIO(body.encode('utf-8')), **mode)
+    assert inputs == {'format': 'test', 'extra': 'kept'}
+    parsed = wegene_utils.parse_genome_string(genome.decode('ascii'), 'test')
+    processed = wegene_utils.process_raw_genome_data(raw_inputs, **mode)
+    for rsid, entry in parsed.items():
+        assert user_genome[rsid] == entry
+        assert processed[rsid] == entry
+
+
+def load_genome(genome_str, kind):
+    if kind == 'lazy':
+        return wegene_utils.LazyGenome(genome_str, 'test')
+    if kind == 'packed':
+        return wegene_utils.PackedGenome(genome_str, 'test')
+    return wegene_utils.parse_genome_string(genome_str, 'test')
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+@pytest.mark.parametrize('kind', ['dict', 'lazy', 'packed'])
+def test_get_genotypes(index_path, compiled, kind):
+    pytest.importorskip('numpy')
+    if compiled:
+        wegene_utils.compile_genome_index(index_path('test'))
+    genome_str = make_genome(500, seed=8).decode('ascii')
+    parsed = wegene_utils.parse_genome_string(genome_str, 'test')
+    rsids = ['rs1', 'rs1003'] + sorted(parsed)[::3] + ['rs1000', 'rs1000']
+    genotypes, missing = wegene_utils.get_genotypes(
+        load_genome(genome_str, kind), rsids)
+    expected = [parsed[rsid]['genotype'] if rsid in parsed else '--'
+                for rsid in rsids]
+    assert genotypes.tolist() == expected
+    assert missing.tolist() == [genotype in ('--', '__')
+                                for genotype in expected]
+
+
+def test_get_genotypes_of_partial_genome():
+    pytest.importorskip('numpy')
+    genome = {'rs1': 'GA', 'rs2': 'I', 'rs3': '__', 'rs4': 'DI-'}
+    genotypes, missing = wegene_utils.get_genotypes(
+        genome, ['rs1', 'rs2', 'rs3', 'rs4', 'rs5'])
+    assert genotypes.tolist() == ['AG', '--', '__', '--', '--']
+    assert missing.tolist() == [False, True, True, True, True]
+
+
+def write_region_index(path, count, seed=0):
+    # Positions out of order, some unknown, on two chromosomes
+    rng = random.Random(seed)
+    positions = rng.sample(range(1, 100000), count)
+    with open(path, 'w') as idx_f:
+        for i, position in enumerate(positions):
+            idx_f.write('{}\trs{}\t{}\t{}\n'.format(
+                i, 1000 + i, '1' if i % 3 else '2',
+                'NA' if i % 11 == 5 else position))
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+@pytest.mark.parametrize('kind', ['dict', 'lazy', 'packed', 'partial'])
+def test_query_region(index_path, compiled, kind):
+    if kind == 'packed':
+        pytest.importorskip('numpy')
+    write_region_index(index_path('region'), 300)
+    if compiled:
+        wegene_utils.compile_genome_index(index_path('region'))
+    genome_str = make_genome(300, seed=9).decode('ascii')
+    parsed = wegene_utils.parse_genome_string(genome_str, 'region')
+    if kind == 'partial':
+        genome = dict((rsid, entry['genotype'])
+                      for rsid, entry in sorted(parsed.items())[::2])
+    elif kind == 'lazy':
+        genome = wegene_utils.LazyGenome(genome_str, 'region')
+    elif kind == 'packed':
+        genome = wegene_utils.PackedGenome(genome_str, 'region')
+    else:
+        genome = parsed
+    for chromosome, start, end in [('1', 20000, 60000), (2, 0, 100000),
+                                   ('1', 50000, 50000), ('X', 0, 100000)]:
+        expected = sorted(
+            (int(entry['position']), rsid) for rsid, entry in parsed.items()
+            if rsid in genome and entry['chromosome'] == str(chromosome) and
+            entry['position'] != 'NA' and
+            start <= int(entry['position']) <= end)
+        assert wegene_utils.query_region(genome, 'region', chromosome, start,
+                                         end) == \
+            [rsid for _, rsid in expected]
+
+
+def expected_score(parsed, weights):
+    score = 0.0
+    used = 0
+    for rsid, effect_allele, weight in weights:
+        genotype = parsed[rsid]['genotype'] if rsid in parsed else '--'
+        if genotype in ('--', '__'):
+            continue
+        used += 1
+        score += genotype.count(effect_allele) * weight
+    return score, used
+
+
+@pytest.mark.parametrize('kind', ['dict', 'lazy', 'packed'])
+def test_polygenic_score(index_path, tmp_path, kind):
+    pytest.importorskip('numpy')
+    wegene_utils.compile_genome_index(index_path('test'))
+    genome_str = make_genome(500, seed=10).decode('ascii')
+    parsed = wegene_utils.parse_genome_string(genome_str, 'test')
+    rng = random.Random(10)
+    weights = [(rsid, rng.choice('ACGTD'), round(rng.uniform(-1, 1), 3))
+               for rsid in sorted(parsed)[::4] + ['rs1', 'rs1003']]
+    weights_path = tmp_path / 'weights.tsv'
+    weights_path.write_text(
+        '# A test score\nrsid\teffect_allele\tweight\n' +
+        ''.join('{}\t{}\t{}\n'.format(*variant) for variant in weights))
+    score, used = expected_score(parsed, weights)
+    genome = load_genome(genome_str, kind)
+    for prs in [wegene_utils.PolygenicScore(weights),
+                wegene_utils.PolygenicScore(str(weights_path))]:
+        # Twice, the rows of the panel are looked up once per genome format
+        for _ in range(2):
+            result = prs.score(genome)
+            assert result['score'] == pytest.approx(score)
+            assert result['variants'] == len(weights)
+            assert result['used'] == used
+            assert result['missing'] == len(weights) - used
+            assert result['coverage'] == pytest.approx(
+                float(used) / len(weights))
+
+
+def test_polygenic_score_rejects_longer_effect_alleles():
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError):
+        wegene_utils.PolygenicScore([('rs1000', 'A', 0.1),
+                                     ('rs1001', 'AT', 0.2)])
+
+
+def test_trace_records(index_path, tmp_path, monkeypatch):
+    trace_path = tmp_path / 'trace.jsonl'
+    monkeypatch.setattr(wegene_utils, '_trace_target', str(trace_path))
+    genome = make_genome(500, seed=11)
+    parsed = wegene_utils.process_raw_genome_data(
+        {'format': 'test', 'data': encode_genome(genome).decode('ascii')})
+    wegene_utils.process_raw_genome_data(
+        {'format': 'test', 'data': encode_genome(genome).decode('ascii')},
+        lazy=True)
+    wegene_utils.parse_genome_string(genome.decode('ascii'), 'test')
+    records = [json.loads(line) for line in trace_path.read_text()
+               .splitlines()]
+    assert [record['function'] for record in records] == [
+        'process_raw_genome_data', 'process_raw_genome_data',
+        'parse_genome_string']
+    missing = sum(1 for snp in parsed.values()
+                  if snp['genotype'] in ('--', '__'))
+    assert records[0]['counters'] == {'genome_bytes': 1000,
+                                      'snps': len(parsed),
+                                      'missing': missing}
+    assert set(records[0]['phases']) == {'decode', 'decompress',
+                                         'index_load', 'dict_build'}
+    assert records[1]['counters'] == {'genome_bytes': 1000}
+    assert set(records[1]['phases']) == {'decode', 'decompress',
+                                         'index_load'}
+    assert records[2]['counters'] == {'snps': len(parsed),
+                                      'missing': missing}
+    assert records[0]['pid'] == os.getpid()
+
+
+def test_trace_to_stderr(index_path, capsys, monkeypatch):
+    genome = make_genome(500, seed=12).decode('ascii')
+    wegene_utils.parse_genome_string(genome, 'test')
+    assert capsys.readouterr().err == ''
+    monkeypatch.setattr(wegene_utils, '_trace_target', '1')
+    wegene_utils.parse_genome_string(genome, 'test')
+    err = capsys.readouterr().err
+    assert err.startswith(wegene_utils.TRACE_PREFIX)
+    assert json.loads(err[len(wegene_utils.TRACE_PREFIX):])['function'] == \
+        'parse_genome_string'
+
+
+def test_shared_index_is_published_once(index_path, tmp_path, monkeypatch):
+    monkeypatch.setenv(wegene_utils.SHARED_INDEX_ENV,
+                       str(tmp_path / 'shared'))
+    shared_path = wegene_utils.publish_genome_index('test')
+    assert shared_path is not None
+    assert wegene_utils.publish_genome_index('test') == shared_path
+    assert len(list((tmp_path / 'shared').iterdir())) == 1
+    index = wegene_utils.open_genome_index('test')
+    try:
+        assert_same_index(index, read_text_index(index_path('test')))
+    finally:
+        index.close()
+
+
+def test_shared_index_ignores_lock_of_dead_publisher(index_path, tmp_path,
+                                                     monkeypatch):
+    monkeypatch.setenv(wegene_utils.SHARED_INDEX_ENV,
+                       str(tmp_path / 'shared'))
+    shared_path = wegene_utils._shared_index_path('test')
+    (tmp_path / 'shared').mkdir()
+    with open(shared_path + '.lock', 'w') as lock_f:
+        # Far above the default pid_max
+        lock_f.write('99999999')
+    assert wegene_utils.publish_genome_index('test') == shared_path
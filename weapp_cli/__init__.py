@@ -1,2 +1,16 @@
-from weapp_cli.sample import *
-from weapp_cli.wegene_utils import * 
\ No newline at end of file
+import importlib
+
+__all__ = ['data', 'process_raw_genome_data', 'read_genome_inputs',
+           'get_genotypes', 'query_region', 'PolygenicScore',
+           'is_genotype_exist', 'is_wegene_format']
+
+
+# Re-exports are resolved on first access so that importing the CLI does not
+# pay for the sample genome or numpy
+def __getattr__(name):
+    if name in ('data', 'load_sample_data'):
+        return getattr(importlib.import_module('weapp_cli.sample'), name)
+    if name in __all__:
+        return getattr(importlib.import_module('weapp_cli.wegene_utils'), name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import stat
+import shutil
+import hashlib
+import tempfile
+
+from weapp_cli.cache import cache_dir, file_digest
+
+# Digests of the source files keyed by absolute path, reused while mtime
+# and size stay the same
+DIGESTS_FILE = 'digests.json'
+# FICLONE from linux/fs.h, a copy-on-write clone of the whole file
+FICLONE = 0x40049409
+LINK_METHODS = ('reflink', 'hardlink', 'symlink', 'copy')
+
+
+def store_path():
+    return cache_dir('store')
+
+
+def object_path(digest):
+    return os.path.join(store_path(), 'objects', digest[:2], digest)
+
+
+def _load_digests():
+    try:
+        with open(os.path.join(store_path(), DIGESTS_FILE)) as digests_f:
+            return json.load(digests_f)
+    except (IOError, ValueError):
+        return {}
+
+
+def _save_digests(digests):
+    path = os.path.join(store_path(), DIGESTS_FILE)
+    fd, tmp_path = tempfile.mkstemp(dir=store_path(), prefix='.tmp-')
+    with os.fdopen(fd, 'w') as digests_f:
+        json.dump(digests, digests_f)
+    os.replace(tmp_path, path)
+
+
+def _add_object(digest, write):
+    # write(tmp_path) creates the content, objects are never modified
+    path = object_path(digest)
+    if os.path.isfile(path):
+        return path
+    parent = os.path.dirname(path)
+    if not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=parent, prefix='.tmp-')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+'''
+Adds every file under src_dir to the store and returns a manifest that maps
+their paths relative to src_dir, with "/" separators, to their digests
+'''
+
+
+def import_tree(src_dir):
+    digests = _load_digests()
+    changed = False
+    manifest = {}
+    for dirname, _, filenames in os.walk(src_dir):
+        for filename in filenames:
+            path = os.path.abspath(os.path.join(dirname, filename))
+            file_stat = os.stat(path)
+            entry = digests.get(path)
+            if entry is None or \
+                    entry[:2] != [file_stat.st_mtime_ns, file_stat.st_size] \
+                    or not os.path.isfile(object_path(entry[2])):
+                entry = [file_stat.st_mtime_ns, file_stat.st_size,
+                         file_digest(path)]
+                digests[path] = entry
+                changed = True
+                # copy2 keeps the modification times that tell whether a
+                # compiled index or extended data store is current
+                _add_object(entry[2], lambda tmp_path: shutil.copy2(
+                    path, tmp_path))
+            rel_path = os.path.relpath(path, src_dir).replace(os.sep, '/')
+            manifest[rel_path] = entry[2]
+    if changed:
+        _save_digests(digests)
+    return manifest
+
+
+'''
+Returns the digest of an object derived from the object source_digest,
+e.g. a compiled index, building it with build(source_path, tmp_path) the
+first time. kind and version tell derived objects of the same source apart
+'''
+
+
+def derived_object(source_digest, kind, version, build):
+    digest = hashlib.sha1('{}:{}:{}'.format(
+        source_digest, kind, version).encode('ascii')).hexdigest()
+    _add_object(digest, lambda tmp_path: build(object_path(source_digest),
+                                               tmp_path))
+    return digest
+
+
+def _reflink(src, dest):
+    if not sys.platform.startswith('linux'):
+        raise OSError('reflinks are only tried on Linux')
+    import fcntl
+
+    with open(src, 'rb') as src_f, open(dest, 'wb') as dest_f:
+        try:
+            fcntl.ioctl(dest_f.fileno(), FICLONE, src_f.fileno())
+        except OSError:
+            dest_f.close()
+            os.remove(dest)
+            raise
+    # Keeps the modification times of the store, a compiled index must
+    # stay newer than its text index
+    shutil.copystat(src, dest)
+
+
+def _link(src, dest, method):
+    if method == 'reflink':
+        _reflink(src, dest)
+    elif method == 'hardlink':
+        os.link(src, dest)
+    elif method == 'symlink':
+        os.symlink(src, dest)
+    else:
+        shutil.copy2(src, dest)
+        os.chmod(dest, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP |
+                 stat.S_IROTH)
+
+
+'''
+Creates the files of manifest, (path, digest) pairs, under dest_dir from
+the store with the first of LINK_METHODS that works on this file system.
+Objects are read-only and indexes and extended data are only ever
+replaced, never written in place, so one store serves every project.
+Returns the method used
+'''
+
+
+def link_tree(manifest, dest_dir):
+    methods = list(LINK_METHODS)
+    for rel_path, digest in manifest:
+        dest = os.path.join(dest_dir, *rel_path.split('/'))
+        parent = os.path.dirname(dest)
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+        while True:
+            try:
+                _link(object_path(digest), dest, methods[0])
+                break
+            except (OSError, NotImplementedError):
+                if len(methods) == 1:
+                    raise
+                methods.pop(0)
+    return methods[0]
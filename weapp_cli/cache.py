@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import hashlib
+import tempfile
+
+
+def cache_dir(*parts):
+    root = os.environ.get('WEAPP_CLI_CACHE_DIR')
+    if not root:
+        if os.name == 'nt':
+            root = os.path.join(os.environ.get(
+                'LOCALAPPDATA', os.path.expanduser('~')), 'weapp-cli', 'Cache')
+        else:
+            root = os.path.join(os.environ.get(
+                'XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'weapp-cli')
+    path = os.path.join(root, *parts)
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    return path
+
+
+def file_digest(path, algorithm='sha1'):
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+'''
+Returns file_digest(path) remembered in the user cache folder by the path,
+size and modification time of the file, so that an unchanged file is only
+read again once it changes
+'''
+
+
+def cached_digest(path, algorithm='sha1'):
+    path = os.path.abspath(path)
+    file_stat = os.stat(path)
+    stamp = '{} {} {}'.format(algorithm, file_stat.st_size,
+                              file_stat.st_mtime_ns)
+    name = hashlib.sha1(path.encode('utf-8', 'surrogateescape')).hexdigest()
+    memo_path = os.path.join(cache_dir('digests'), name)
+    try:
+        with open(memo_path, 'r') as memo_f:
+            memo_stamp, digest = memo_f.read().rsplit(' ', 1)
+        if memo_stamp == stamp:
+            return digest
+    except (IOError, OSError, ValueError):
+        pass
+    digest = file_digest(path, algorithm)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(memo_path),
+                                    prefix='.tmp-')
+    with os.fdopen(fd, 'w') as memo_f:
+        memo_f.write('{} {}'.format(stamp, digest))
+    os.replace(tmp_path, memo_path)
+    return digest
+
+
+'''
+Creates the cache entry at path by calling build(tmp_path) on a temporary
+folder next to it and renaming it into place, so that concurrent builders
+never see a partially written entry
+'''
+
+
+def build_entry(path, build):
+    if os.path.isdir(path):
+        return path
+    parent = os.path.dirname(path)
+    tmp_path = tempfile.mkdtemp(dir=parent, prefix='.tmp-')
+    try:
+        build(tmp_path)
+        os.rename(tmp_path, path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+    finally:
+        if os.path.isdir(tmp_path):
+            shutil.rmtree(tmp_path)
+    return path
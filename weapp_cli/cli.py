@@ -2,20 +2,25 @@
 
 import click
 import os
+import sys
+import time
 import json
-import zipfile
-import wget
-import subprocess
-from shutil import copy2, copytree
-import markdown
+from shutil import copy2, copytree, rmtree
 import platform
 
-from weapp_cli.sample import data as sample_data
-from weapp_cli.wegene_utils import process_raw_genome_data
+from weapp_cli import runner
+
+# Heavier modules (the sample genome, numpy through wegene_utils, markdown
+# and urllib) are imported by the commands that use them to keep startup fast
 
 
 def generate_test_data(sex, age, ancestry, haplogroup, haplotype,
                        genome, rsid_file, array_format, extended_file=''):
+    from weapp_cli.sample import load_sample_data, load_sample_genome
+    from weapp_cli.wegene_utils import process_raw_genome_data
+    from weapp_cli.extended_data import open_extended_store
+
+    sample_data = load_sample_data()
     data = {'inputs': {'format': array_format}}
     if sex == 'y':
         data['inputs']['sex'] = sample_data['inputs']['sex']
@@ -34,29 +39,97 @@ def generate_test_data(sex, age, ancestry, haplogroup, haplotype,
         rsids = rsids_fh.readlines()
         rsids = list(map(lambda rsid: rsid.strip().lower(), rsids))
         rsids_fh.close()
-        user_genome = process_raw_genome_data(sample_data['inputs'])
+        try:
+            sample_genome = load_sample_genome()
+        except OSError:
+            # The user cache folder is not writable
+            sample_genome = process_raw_genome_data(sample_data['inputs'])
+            if sample_genome is None:
+                raise click.ClickException(
+                    'Failed to decode the sample genome')
+        user_genome = {}
         if extended_file:
-            extended_fh = open(extended_file, 'r')
-            extended_data_lines = extended_fh.readlines()
-            for line in extended_data_lines:
-                rs, chromosome, pos, genotype = line.strip().split('\t')
-                if rs in rsids:
-                    user_genome[rs] = {
-                        'genotype': genotype,
-                        'chromosome': chromosome,
-                        'position': pos
-                    }
-            extended_fh.close()
+            extended_store = open_extended_store(extended_file)
+            if extended_store is not None:
+                for rs in rsids:
+                    extended_snp = extended_store.get(rs)
+                    if extended_snp is not None:
+                        user_genome[rs] = extended_snp
+                extended_store.close()
+            else:
+                rsid_set = set(rsids)
+                with open(extended_file, 'r') as extended_fh:
+                    for line in extended_fh:
+                        rs, chromosome, pos, genotype = \
+                            line.strip().split('\t')
+                        if rs in rsid_set:
+                            user_genome[rs] = {
+                                'genotype': genotype,
+                                'chromosome': chromosome,
+                                'position': pos
+                            }
         for rsid in rsids:
-            try:
-                data['inputs'][rsid.upper()] = user_genome[rsid]['genotype']
-            except:
+            snp = user_genome.get(rsid) or sample_genome.get(rsid)
+            if snp is not None:
+                data['inputs'][rsid.upper()] = snp['genotype']
+            else:
                 click.echo(click.style(rsid + ' does not exist, ignored',
                                        fg='yellow'))
 
     return json.dumps(data)
 
 
+def compile_indexes(index_path):
+    from weapp_cli.wegene_utils import compile_genome_index
+
+    for filename in sorted(os.listdir(index_path)):
+        if filename.endswith('.idx'):
+            compile_genome_index(os.path.join(index_path, filename))
+
+
+def copy_assets(lib_path, project_path, language):
+    # Anything linked before the store failed is copied again
+    for folder in ('indexes', 'extended_data'):
+        if os.path.isdir(project_path + '/' + folder):
+            rmtree(project_path + '/' + folder)
+    copytree(lib_path + '/indexes', project_path + '/indexes')
+    if language != 'r':
+        compile_indexes(project_path + '/indexes')
+    if os.path.isdir(lib_path + '/extended_data'):
+        copytree(lib_path + '/extended_data', project_path + '/extended_data')
+
+
+'''
+Links the indexes, with compiled indexes for Python projects, and the
+extended data into the project from the content addressed store in the
+user cache instead of copying them. Returns the reference kept in .weapp
+'''
+
+
+def link_assets(lib_path, project_path, language):
+    from weapp_cli import asset_store
+
+    assets = {'store': asset_store.store_path()}
+    indexes = asset_store.import_tree(lib_path + '/indexes')
+    if language != 'r':
+        from weapp_cli.wegene_utils import INDEX_VERSION, compile_genome_index
+
+        for rel_path, digest in list(indexes.items()):
+            if rel_path.endswith('.idx'):
+                indexes[rel_path[:-len('.idx')] + '.bin'] = \
+                    asset_store.derived_object(digest, 'bin', INDEX_VERSION,
+                                               compile_genome_index)
+    assets['method'] = asset_store.link_tree(sorted(indexes.items()),
+                                             project_path + '/indexes')
+    assets['indexes'] = indexes
+    if os.path.isdir(lib_path + '/extended_data'):
+        extended_data = asset_store.import_tree(lib_path + '/extended_data')
+        asset_store.link_tree(sorted(extended_data.items()),
+                              project_path + '/extended_data')
+        assets['extended_data'] = extended_data
+    return assets
+
+
 @click.group()
 def cli():
     pass
@@ -89,6 +162,8 @@ def cli():
               type=click.Choice(['y', 'n']), default='y',
               help='Whether to use markdown for output')
 def init(project, language, sex, age, ancestry, haplogroup, haplotype, genome, rsid_file, markdown):
+    from weapp_cli.extended_data import build_extended_store, is_store_current
+
     work_path = os.getcwd()
     lib_path = os.path.split(os.path.abspath(__file__))[0]
     project_path = work_path + '/' + project
@@ -124,31 +199,42 @@ def init(project, language, sex, age, ancestry, haplogroup, haplotype, genome, r
         markdown = 0
 
     meta = {'project': project, 'language': language, 'markdown': markdown}
-    meta_file = open(project_path + '/.weapp', 'w')
-    meta_file.write(json.dumps(meta, indent=4))
-    meta_file.close()
 
     if language == 'python27':
         copy2(lib_path + '/file_templates/python27/requirements.txt', project_path)
         copy2(lib_path + '/file_templates/python27/wegene_utils.py', project_path)
         copy2(lib_path + '/file_templates/python27/main.py', project_path)
-        copytree(lib_path + '/indexes', project_path + '/indexes')
     elif language == 'python3':
         copy2(lib_path + '/file_templates/python3/requirements.txt', project_path)
         copy2(lib_path + '/file_templates/python3/wegene_utils.py', project_path)
         copy2(lib_path + '/file_templates/python3/main.py', project_path)
-        copytree(lib_path + '/indexes', project_path + '/indexes')
     elif language == 'r':
         copy2(lib_path + '/file_templates/r/pacman.R', project_path)
         copy2(lib_path + '/file_templates/r/wegene_utils.R', project_path)
         copy2(lib_path + '/file_templates/r/main.R', project_path)
-        copytree(lib_path + '/indexes', project_path + '/indexes')
 
     extended_data_file = ''
     if(os.path.isdir(lib_path + '/extended_data')):
-        copytree(lib_path + '/extended_data', project_path + '/extended_data')
+        lib_extended_file = lib_path + '/extended_data/extended_data.dat'
+        if os.path.isfile(lib_extended_file) and \
+                not is_store_current(lib_extended_file):
+            click.echo(click.style('Indexing extended data...', fg='green'))
+            build_extended_store(lib_extended_file)
         extended_data_file = project_path + '/extended_data/extended_data.dat'
 
+    try:
+        meta['assets'] = link_assets(lib_path, project_path, language)
+    except OSError as e:
+        # The user cache folder is not writable
+        click.echo(click.style('Could not use the shared asset store (' +
+                               str(e) + '), copying the data instead',
+                               fg='yellow'))
+        copy_assets(lib_path, project_path, language)
+
+    meta_file = open(project_path + '/.weapp', 'w')
+    meta_file.write(json.dumps(meta, indent=4))
+    meta_file.close()
+
     click.echo(click.style('Generating test data...', fg='green'))
 
     data_file = open(project_data_path + '/data.json', 'w')
@@ -160,33 +246,415 @@ def init(project, language, sex, age, ancestry, haplogroup, haplotype, genome, r
 
 
 @cli.command()
-def download_extra():
-    extended_data_url = 'http://wegene-upload-prod.oss-cn-hangzhou.aliyuncs.com/sample_data/extended_data.zip'
+@click.option('--jobs', default=4, type=click.IntRange(1, 32),
+              help='Number of ranges to download in parallel')
+@click.option('--base-url', default=None,
+              help='Where to download the extended data from, defaults to '
+                   '$WEAPP_CLI_DATA_URL or the WeGene server')
+@click.option('--sha256', default=None,
+              help='Expected SHA-256 of the archive, by default the '
+                   'published .sha256 file is used if there is one')
+def download_extra(jobs, base_url, sha256):
+    from weapp_cli import download
+    from weapp_cli.extended_data import (build_extended_store,
+                                         is_store_current)
+
+    if base_url is None:
+        base_url = download.base_url()
+    extended_data_url = base_url.rstrip('/') + '/extended_data.zip'
     click.echo(click.style('Downloading extended data, ' +
                            'please wait...',
                fg='green'))
     lib_path = os.path.split(os.path.abspath(__file__))[0]
+    extended_data_archive = lib_path + '/extended_data.zip'
+    extended_data_file = lib_path + '/extended_data/extended_data.dat'
     try:
-        extended_data_archive = wget.download(extended_data_url, out=lib_path)
-        click.echo(click.style('\nDownload completed, unpacking now...',
+        if os.path.isfile(extended_data_file) and \
+                not os.path.isfile(extended_data_archive) and \
+                not is_store_current(extended_data_file):
+            # Unpacked by an earlier run that failed while indexing
+            click.echo(click.style('Indexing extended data...', fg='green'))
+            build_extended_store(extended_data_file)
+            click.echo(click.style('Successfully updated extended data!',
+                       fg='green'))
+            return
+        if sha256 is None:
+            sha256 = download.fetch_checksum(extended_data_url)
+        size, _ = download.remote_size(extended_data_url)
+        with click.progressbar(length=size, label='Downloading') as bar:
+            # An archive completed by an earlier run is not fetched again
+            download.download(extended_data_url, extended_data_archive,
+                              jobs=jobs, progress=bar.update, sha256=sha256)
+        if sha256 is not None:
+            click.echo(click.style('Verifying checksum...', fg='green'))
+            if download.sha256sum(extended_data_archive) != sha256.lower():
+                os.remove(extended_data_archive)
+                click.echo(click.style('Checksum mismatch, the downloaded '
+                                       'archive has been removed. '
+                                       'Please try again!',
+                                       fg='red'))
+                return
+        click.echo(click.style('Download completed, unpacking now...',
                    fg='green'))
-        zip_file = zipfile.ZipFile(extended_data_archive)
-        for names in zip_file.namelist():
-            zip_file.extract(names, lib_path)
-        zip_file.close()
-        click.echo(click.style('Removing temp data...',
-                   fg='green'))
-        if os.path.exists(extended_data_archive):
-            os.remove(extended_data_archive)
+        download.extract_archive(extended_data_archive, lib_path)
+        click.echo(click.style('Indexing extended data...', fg='green'))
+        build_extended_store(extended_data_file)
         click.echo(click.style('Successfully updated extended data!',
                    fg='green'))
-    except Exception:
-        click.echo(click.style('Failed to download extended data, ' +
-                               'please try again!',
+    except Exception as e:
+        click.echo(click.style('Failed to download extended data: ' +
+                               str(e) + '. Run the command again to resume '
+                               'the download.',
+                               fg='red'))
+
+
+@cli.command()
+def build_index():
+    if not os.path.isfile('.weapp'):
+        click.echo(click.style('Aborted. Not a weapp project folder!',
+                               fg='red'))
+        exit()
+    if not os.path.isdir('./indexes'):
+        click.echo(click.style('Aborted. No indexes folder in the project!',
+                               fg='red'))
+        exit()
+    click.echo(click.style('Compiling genome indexes...', fg='green'))
+    compile_indexes('./indexes')
+    click.echo(click.style('Index compilation completed!', fg='green'))
+
+
+@cli.command()
+@click.option('--count', default=100, type=click.IntRange(1),
+              help='Number of inputs to generate')
+@click.option('--format', 'genome_format', default='wegene_affy_2',
+              help='Genome format, an index_<format>.idx must exist')
+@click.option('--out', default='corpus', type=click.Path(file_okay=False),
+              help='Folder to write the inputs to')
+@click.option('--missing-rate', default=0.01, type=click.FloatRange(0, 1),
+              help='Fraction of sites called as "--"')
+@click.option('--min-freq', default=0.05, type=click.FloatRange(0, 1),
+              help='Lowest alternate allele frequency of a site')
+@click.option('--max-freq', default=0.5, type=click.FloatRange(0, 1),
+              help='Highest alternate allele frequency of a site')
+@click.option('--seed', default=None, type=int,
+              help='Seed to reproduce a corpus, random by default')
+@click.option('--jobs', default=os.cpu_count() or 1, type=click.IntRange(1),
+              help='Number of inputs to generate at a time')
+def synth(count, genome_format, out, missing_rate, min_freq, max_freq, seed,
+          jobs):
+    try:
+        from weapp_cli import synth as synthesizer
+    except ImportError:
+        click.echo(click.style('Aborted. Generating inputs requires numpy, '
+                               'install it with "pip install '
+                               'wegene-weapp-cli[numpy]"', fg='red'))
+        exit()
+
+    lib_path = os.path.split(os.path.abspath(__file__))[0]
+    if not os.path.isfile(lib_path + '/indexes/index_' + genome_format +
+                          '.idx'):
+        click.echo(click.style('Aborted. Unknown genome format ' +
+                               genome_format, fg='red'))
+        exit()
+    if min_freq > max_freq:
+        click.echo(click.style('Aborted. --min-freq is larger than '
+                               '--max-freq', fg='red'))
+        exit()
+
+    click.echo(click.style('Generating synthetic inputs...', fg='green'))
+    with click.progressbar(length=count, label='Generating') as bar:
+        seed = synthesizer.generate(genome_format, count, out,
+                                    missing_rate=missing_rate,
+                                    min_freq=min_freq, max_freq=max_freq,
+                                    seed=seed, jobs=jobs,
+                                    progress=bar.update)
+    click.echo(click.style('{} inputs written to {} (seed {})'.format(
+        count, out, seed), fg='green'))
+
+
+def write_test_html(result):
+    import markdown
+
+    exts = ['markdown.extensions.tables']
+    html = markdown.markdown(result, extensions=exts)
+
+    template_file = open('./html_template.html', 'r', encoding='utf-8')
+    html_template = template_file.read()
+    template_file.close()
+
+    html_file = open('./test_result.html', 'w')
+    html_file.write(html_template.replace('{{RESULTS}}', html))
+    html_file.close()
+
+
+def share_indexes():
+    from weapp_cli.cache import cache_dir
+
+    # Inherited by the apps, the first app without a current compiled index
+    # compiles it there once and the others map that file read-only
+    if not os.environ.get(runner.SHARED_INDEX_ENV):
+        os.environ[runner.SHARED_INDEX_ENV] = cache_dir('shared_indexes')
+
+
+def start_trace():
+    import tempfile
+
+    trace_fd, trace_path = tempfile.mkstemp(prefix='weapp-trace-',
+                                            suffix='.jsonl')
+    os.close(trace_fd)
+    # Inherited by the app, wegene_utils appends its records to the file
+    os.environ[runner.TRACE_ENV] = trace_path
+    return trace_path
+
+
+def collect_trace(trace_path):
+    del os.environ[runner.TRACE_ENV]
+    try:
+        return runner.summarize_trace(runner.read_trace(trace_path))
+    finally:
+        os.remove(trace_path)
+
+
+def show_trace(trace):
+    click.echo(click.style('wegene_utils Trace: ', fg='green'))
+    if not trace:
+        click.echo(click.style('None, the app did not call '
+                               'process_raw_genome_data or '
+                               'parse_genome_string\n', fg='yellow'))
+        return
+    click.echo(click.style('\n'.join(runner.format_trace(trace)) + '\n',
+                           fg='yellow'))
+
+
+'''
+Prints the outputs, errors and optionally the profile of a test run and
+returns the output. The HTML preview is only written again when the output
+differs from last_output
+'''
+
+
+def show_test_result(result, is_markdown, console_codec, profile, limits,
+                     last_output=None, trace=None):
+    click.echo(click.style('WeApp Outputs: ', fg='green'))
+    output = result.stdout.decode(console_codec, 'replace')
+    if output:
+        if is_markdown and output != last_output:
+            write_test_html(output)
+        click.echo(click.style('{}\n'.format(output), fg='yellow'))
+
+        if is_markdown:
+            click.echo(click.style('Note: An HTML file named "test_result.html" is generated for you to test styles\n', fg='green'))
+    else:
+        click.echo(click.style('None\n', fg='yellow'))
+
+    click.echo(click.style('WeApp Errors: ', fg='green'))
+    errors = result.stderr.decode(console_codec, 'replace')
+    failure = runner.describe_failure(result, limits['timeout'],
+                                      limits['cpu_limit'])
+    if errors:
+        click.echo(click.style('{}\n'.format(errors), fg='red'))
+    if failure:
+        click.echo(click.style('{}\n'.format(failure), fg='red'))
+    if not errors and not failure:
+        click.echo(click.style('None\n', fg='yellow'))
+
+    if trace is not None:
+        show_trace(trace)
+
+    if profile:
+        report = runner.profile(result)
+        if trace is not None:
+            report['wegene_utils'] = trace
+        with open('./test_profile.json', 'w') as profile_file:
+            profile_file.write(json.dumps(report, indent=4))
+        click.echo(click.style('WeApp Profile: ', fg='green'))
+        click.echo(click.style(runner.format_profile(report) + '\n',
+                               fg='yellow'))
+    return output
+
+
+'''
+Tests the app with data/data.json again whenever a file of the project
+changes. A run that is still going when another change comes in is
+cancelled and started over. A warm worker is restarted when wegene_utils
+or the indexes it keeps loaded change
+'''
+
+
+def watch_test(command, is_markdown, console_codec, profile, warm, limits):
+    import threading
+    from weapp_cli.watch import open_watcher
+
+    watcher = open_watcher('.')
+    worker = runner.WarmWorker(command, **limits) if warm else None
+    stdin_path = os.path.join('data', 'data.json')
+    last_output = None
+    click.echo(click.style('Watching for changes with {}, press Ctrl+C to '
+                           'stop\n'.format(watcher.name), fg='green'))
+
+    def run_once(cancel, outcome):
+        try:
+            if worker is not None:
+                outcome['result'] = worker.run(stdin_path, cancel=cancel)
+            else:
+                outcome['result'] = runner.run_app(command, stdin_path,
+                                                   cancel=cancel, **limits)
+        except Exception as e:
+            outcome['error'] = e
+
+    try:
+        while True:
+            cancel = threading.Event()
+            outcome = {}
+            thread = threading.Thread(target=run_once,
+                                      args=(cancel, outcome))
+            thread.daemon = True
+            thread.start()
+            changes = set()
+            while thread.is_alive() and not changes:
+                changes = watcher.wait(runner.CANCEL_POLL)
+            if changes:
+                cancel.set()
+                thread.join()
+                click.echo(click.style('Changed while testing: ' +
+                                       ', '.join(sorted(changes)) +
+                                       ', testing again...\n',
+                                       fg='yellow'))
+            else:
+                thread.join()
+                if 'error' in outcome:
+                    click.echo(click.style('An error has occured during the '
+                                           'test: ', fg='red'))
+                    click.echo(click.style(str(outcome['error']) + '\n',
+                                           fg='red'))
+                else:
+                    last_output = show_test_result(outcome['result'],
+                                                   is_markdown,
+                                                   console_codec, profile,
+                                                   limits, last_output)
+                changes = watcher.wait()
+                click.echo(click.style('Changed: ' +
+                                       ', '.join(sorted(changes)) +
+                                       ', testing again...\n', fg='green'))
+            if worker is not None and any(
+                    path == 'wegene_utils.py' or
+                    path.startswith('indexes' + os.sep) for path in changes):
+                worker.close()
+    except KeyboardInterrupt:
+        click.echo(click.style('Stopped watching', fg='green'))
+    finally:
+        if worker is not None:
+            worker.close()
+        watcher.close()
+
+
+def test_corpus(command, corpus, jobs, profile, warm=False,
+                result_cache=None, language=None, trace_path=None, **limits):
+    inputs = sorted(os.path.join(corpus, filename)
+                    for filename in os.listdir(corpus)
+                    if filename.endswith('.json'))
+    if not inputs:
+        click.echo(click.style('Aborted. No .json inputs in ' + corpus,
                                fg='red'))
+        exit()
+
+    cached = {}
+    keys = {}
+    if result_cache is not None:
+        for path in inputs:
+            keys[path] = result_cache.key(command, language, path, limits)
+            result = result_cache.get(keys[path])
+            if result is not None:
+                cached[path] = result
+        if cached:
+            click.echo(click.style('{} of {} inputs are unchanged, using '
+                                   'their cached results'.format(
+                                       len(cached), len(inputs)),
+                                   fg='green'))
+    pending = [path for path in inputs if path not in cached]
+
+    with click.progressbar(length=len(pending), label='Running') as bar:
+        fresh, elapsed = runner.run_corpus(command, pending, jobs=jobs,
+                                           progress=bar.update, warm=warm,
+                                           **limits)
+    results = dict(cached)
+    for path, result in fresh:
+        if result_cache is not None:
+            result_cache.put(keys[path], result)
+        results[path] = result
+    results = [(path, results[path]) for path in inputs]
+    # Cached results did not run now, they are left out of the timings
+    summary = runner.summarize_corpus(results, elapsed, cached=cached)
+    trace = None
+    if trace_path is not None:
+        trace = collect_trace(trace_path)
+
+    click.echo(click.style('\nWeApp Load Test: ', fg='green'))
+    click.echo(click.style(
+        '{} runs in {:.2f}s with {} jobs, {:.2f} runs/s'.format(
+            summary['inputs'] - summary['cached'], summary['elapsed'], jobs,
+            summary['throughput'] or 0), fg='yellow'))
+    if summary['cached']:
+        click.echo(click.style(
+            '{} cached results are not timed, use --no-cache to run every '
+            'input'.format(summary['cached']), fg='yellow'))
+    if summary['p50'] is not None:
+        click.echo(click.style(
+            'latency p50 {:.3f}s, p95 {:.3f}s, p99 {:.3f}s, max {:.3f}s'
+            .format(summary['p50'], summary['p95'], summary['p99'],
+                    summary['max']), fg='yellow'))
+    click.echo(click.style(
+        'failures {} (timeouts {})'.format(summary['failures'],
+                                           summary['timeouts']),
+        fg='red' if summary['failures'] else 'yellow'))
+    click.echo(click.style('Slowest inputs: ', fg='green'))
+    for slow in summary['slowest']:
+        click.echo(click.style('  {:.3f}s  {}'.format(slow['duration'],
+                                                     slow['input']),
+                               fg='yellow'))
+    if trace is not None:
+        click.echo()
+        show_trace(trace)
+
+    if profile:
+        if trace is not None:
+            summary['wegene_utils'] = trace
+        summary['runs'] = [dict(runner.profile(result), input=path,
+                                cached=path in cached)
+                           for path, result in results]
+        with open('./test_corpus.json', 'w') as report_file:
+            report_file.write(json.dumps(summary, indent=4))
+        click.echo(click.style('Note: The full report is written to '
+                               '"test_corpus.json"\n', fg='green'))
+
 
 @cli.command()
-def test():
+@click.option('--timeout', default=runner.DEFAULT_TIMEOUT, type=int,
+              help='Wall time limit of the app in seconds, 0 to disable')
+@click.option('--memory-limit', default=runner.DEFAULT_MEMORY_LIMIT,
+              type=int, help='Data segment limit of the app in MB, '
+                             '0 to disable')
+@click.option('--cpu-limit', default=runner.DEFAULT_CPU_LIMIT, type=int,
+              help='CPU time limit of the app in seconds, 0 to disable')
+@click.option('--profile', is_flag=True,
+              help='Measure the app and write test_profile.json')
+@click.option('--corpus', default=None,
+              type=click.Path(exists=True, file_okay=False),
+              help='Run the app against every .json input in this folder')
+@click.option('--jobs', default=os.cpu_count() or 1, type=click.IntRange(1),
+              help='Number of apps to run at a time with --corpus')
+@click.option('--warm', is_flag=True,
+              help='Run Python apps in a worker that keeps wegene_utils and '
+                   'the indexes loaded between runs')
+@click.option('--watch', is_flag=True,
+              help='Test again whenever a file of the project changes')
+@click.option('--no-cache', is_flag=True,
+              help='Run the app even if the result of an identical run is '
+                   'cached in .weapp-cache')
+@click.option('--trace', is_flag=True,
+              help='Report where wegene_utils spends its time in the app')
+def test(timeout, memory_limit, cpu_limit, profile, corpus, jobs, warm,
+         watch, no_cache, trace):
     sys_name = platform.system()
 
     if not sys_name in ['Windows', 'Linux', 'Darwin']:
@@ -206,63 +674,64 @@ def test():
             meta = json.load(meta_file)
         language = meta['language']
         is_markdown = meta['markdown']
+        console_codec = 'gbk' if sys_name == 'Windows' else 'UTF-8'
+        command = runner.app_command(language, sys_name)
+        limits = {'timeout': timeout, 'memory_limit': memory_limit,
+                  'cpu_limit': cpu_limit}
+
+        if warm and language == 'r':
+            click.echo(click.style('Warm workers only support Python apps, '
+                                   'running the app as usual\n',
+                                   fg='yellow'))
+            warm = False
+
+        result_cache = None
+        if not no_cache and not profile and not trace:
+            # Profiles and traces always come from a real run
+            from weapp_cli.result_cache import ResultCache
+            result_cache = ResultCache()
+
+        if watch:
+            watch_test(command, is_markdown, console_codec, profile, warm,
+                       limits)
+            return
+
+        trace_path = start_trace() if trace else None
+
+        if corpus is not None:
+            share_indexes()
+            test_corpus(command, corpus, jobs, profile, warm=warm,
+                        result_cache=result_cache, language=language,
+                        trace_path=trace_path, **limits)
+            return
 
         try:
-            if sys_name == 'Windows':
-                p1 = subprocess.Popen(
-                    ['type', 'data\data.json'], stdout=subprocess.PIPE, shell=True)
-                if language == 'python27' or language == 'python3':
-                    p2 = subprocess.Popen(['python', 'main.py'],
-                                        stdin=p1.stdout, stdout=subprocess.PIPE)
-                elif language == 'r':
-                    p2 = subprocess.Popen(['Rscript', 'main.R'],
-                                        stdin=p1.stdout, stdout=subprocess.PIPE)
-                console_codec = 'gbk'
-            else:
-                p1 = subprocess.Popen(
-                    ['cat', './data/data.json'], stdout=subprocess.PIPE)
-                if language == 'python27':
-                    p2 = subprocess.Popen(['python2', 'main.py'],
-                                        stdin=p1.stdout, stdout=subprocess.PIPE)
-                elif language == 'python3':
-                    p2 = subprocess.Popen(['python3', 'main.py'],
-                                        stdin=p1.stdout, stdout=subprocess.PIPE)
-                elif language == 'r':
-                    p2 = subprocess.Popen(['Rscript', 'main.R'],
-                                        stdin=p1.stdout, stdout=subprocess.PIPE)
-                console_codec = 'UTF-8'
-            p1.stdout.close()
-
-            click.echo(click.style('WeApp Outputs: ', fg='green'))
-            if p2.stdout is not None and p2.stdout != '':
-                if is_markdown:
-                    exts = ['markdown.extensions.tables']
-                    result = p2.stdout.read().decode(console_codec)
-                    result = markdown.markdown(result, extensions=exts)
-
-                    template_file = open(
-                        './html_template.html', 'r', encoding='utf-8')
-                    html_template = template_file.read()
-                    template_file.close()
-
-                    html_file = open('./test_result.html', 'w')
-                    html_file.write(html_template.replace('{{RESULTS}}', result))
-                    html_file.close()
+            stdin_path = os.path.join('data', 'data.json')
+            result = None
+            if result_cache is not None:
+                key = result_cache.key(command, language, stdin_path, limits)
+                result = result_cache.get(key)
+                if result is not None:
+                    click.echo(click.style('Nothing changed since the last '
+                                           'test, showing its result. Use '
+                                           '--no-cache to run the app '
+                                           'again\n', fg='green'))
+            if result is None:
+                if warm:
+                    worker = runner.WarmWorker(command, **limits)
+                    try:
+                        result = worker.run(stdin_path)
+                    finally:
+                        worker.close()
                 else:
-                    result = p2.stdout.read().decode(console_codec)
-                click.echo(click.style('{}\n'.format(result), fg='yellow'))
-
-                if is_markdown:
-                    click.echo(click.style('Note: An HTML file named "test_result.html" is generated for you to test styles\n', fg='green'))
-            else:
-                click.echo(click.style('None\n', fg='yellow'))
-
-            click.echo(click.style('WeApp Errors: ', fg='green'))
-            if p2.stderr is not None:
-                click.echo(click.style('{}\n'.format(
-                    p2.stderr.read().decode(console_codec)), fg='red'))
-            else:
-                click.echo(click.style('None\n', fg='yellow'))
+                    result = runner.run_app(command, stdin_path, **limits)
+                if result_cache is not None:
+                    result_cache.put(key, result)
+            trace_summary = None
+            if trace_path is not None:
+                trace_summary = collect_trace(trace_path)
+            show_test_result(result, is_markdown, console_codec, profile,
+                             limits, trace=trace_summary)
         except Exception as e:
             click.echo(click.style('An error has occured during the test: ',
                                    fg='red'))
@@ -270,7 +739,116 @@ def test():
 
 
 @cli.command()
-def package():
+@click.argument('root', default='.',
+                type=click.Path(exists=True, file_okay=False))
+@click.option('--timeout', default=runner.DEFAULT_TIMEOUT, type=int,
+              help='Wall time limit of each app in seconds, 0 to disable')
+@click.option('--memory-limit', default=runner.DEFAULT_MEMORY_LIMIT,
+              type=int, help='Data segment limit of each app in MB, '
+                             '0 to disable')
+@click.option('--cpu-limit', default=runner.DEFAULT_CPU_LIMIT, type=int,
+              help='CPU time limit of each app in seconds, 0 to disable')
+@click.option('--jobs', default=os.cpu_count() or 1, type=click.IntRange(1),
+              help='Number of apps to run at a time')
+@click.option('--warm', is_flag=True,
+              help='Run Python apps in warm workers shared by the projects '
+                   'with the same interpreter, wegene_utils and indexes')
+@click.option('--no-cache', is_flag=True,
+              help='Run every app even if the result of an identical run is '
+                   'cached in the .weapp-cache of its project')
+@click.option('--log-dir', default='weapp-test-logs',
+              type=click.Path(file_okay=False),
+              help='Folder for the log of every project and the summary')
+def test_all(root, timeout, memory_limit, cpu_limit, jobs, warm, no_cache,
+             log_dir):
+    from weapp_cli import multi_test
+
+    sys_name = platform.system()
+    if not sys_name in ['Windows', 'Linux', 'Darwin']:
+        click.echo(click.style('Aborted. Unsupported operation system!',
+                               fg='red'))
+        exit()
+
+    projects = multi_test.find_projects(root)
+    if not projects:
+        click.echo(click.style('Aborted. No weapp project folder under ' +
+                               root, fg='red'))
+        exit()
+
+    console_codec = 'gbk' if sys_name == 'Windows' else 'UTF-8'
+    limits = {'timeout': timeout, 'memory_limit': memory_limit,
+              'cpu_limit': cpu_limit}
+    share_indexes()
+    groups = multi_test.group_projects(projects, sys_name, jobs=jobs)
+    click.echo(click.style('Testing {} weapps in {} groups with {} '
+                           'jobs...\n'.format(len(projects), len(groups),
+                                               jobs), fg='green'))
+    for number, group in enumerate(groups, 1):
+        if group['command'] is None:
+            label = 'invalid projects'
+        else:
+            label = ' '.join(group['command'])
+        click.echo(click.style('  group {}: {} ({} projects)'.format(
+            number, label, len(group['projects'])), fg='yellow'))
+    click.echo()
+
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir)
+    start = time.time()
+    with click.progressbar(length=len(projects), label='Running') as bar:
+        outcomes = multi_test.run_projects(
+            groups, jobs=jobs, warm=warm, use_cache=not no_cache,
+            progress=lambda outcome: bar.update(1), **limits)
+    elapsed = time.time() - start
+
+    summary = []
+    width = max(len(os.path.relpath(outcome['project']['path'], root))
+                for outcome in outcomes)
+    width = max(width, len('project'))
+    click.echo(click.style('\n{:<{width}}  {:>5}  {:<7}  {:>9}'.format(
+        'project', 'group', 'status', 'time', width=width), fg='green'))
+    for outcome in outcomes:
+        project_path = outcome['project']['path']
+        rel_path = os.path.relpath(project_path, root)
+        log_path = os.path.join(log_dir,
+                                multi_test.log_name(root, project_path))
+        multi_test.write_log(log_path, outcome, console_codec, limits)
+        status = multi_test.status(outcome)
+        duration = None
+        if outcome['result'] is not None:
+            duration = outcome['result'].duration
+        click.echo(click.style('{:<{width}}  {:>5}  {:<7}  {:>9}'.format(
+            rel_path, outcome['group'], status,
+            'cached' if outcome['cached'] else
+            '-' if duration is None else '{:.3f}s'.format(duration),
+            width=width), fg='yellow' if status == 'pass' else 'red'))
+        summary.append({'project': rel_path, 'group': outcome['group'],
+                        'status': status, 'cached': outcome['cached'],
+                        'duration': None if duration is None
+                        else round(duration, 4),
+                        'log': log_path})
+
+    failed = [item for item in summary if item['status'] != 'pass']
+    with open(os.path.join(log_dir, 'summary.json'), 'w') as summary_file:
+        summary_file.write(json.dumps({'root': os.path.abspath(root),
+                                       'elapsed': round(elapsed, 4),
+                                       'jobs': jobs, 'projects': summary},
+                                      indent=4))
+    click.echo(click.style(
+        '\n{} passed, {} failed in {:.2f}s. Logs are written to "{}"'.format(
+            len(summary) - len(failed), len(failed), elapsed, log_dir),
+        fg='red' if failed else 'green'))
+    if failed:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--jobs', default=os.cpu_count() or 1, type=click.IntRange(1),
+              help='Number of files to compress at a time')
+def package(jobs):
+    from weapp_cli.packager import (IGNORE_FILE, IgnoreRules, build_package,
+                                    walk_project)
+
     if not os.path.isfile('.weapp'):
         click.echo(click.style('Aborted. Not a weapp project folder!',
                                fg='red'))
@@ -280,19 +858,24 @@ def package():
         with open('.weapp') as meta_file:
             meta = json.load(meta_file)
         archive_name = meta['project'] + '.zip'
-        zipf = zipfile.ZipFile(archive_name, 'w', zipfile.ZIP_DEFLATED)
-        for dirname, subdirs, files in os.walk('.'):
-            if dirname not in ['./data', './indexes', './extended_data']:
-                zipf.write(dirname)
-                for filename in files:
-                    if filename not in [archive_name, '.weapp', 'html_template.html', 'test_result.html']:
-                        zipf.write(os.path.join(dirname, filename))
-            else:
+        rules = IgnoreRules.from_file(IGNORE_FILE)
+        files, dirs, skipped = walk_project(
+            '.', rules,
+            local_dirs=['data', 'indexes', 'extended_data', '.weapp-cache'],
+            skip_files=[archive_name, '.weapp', IGNORE_FILE,
+                        'html_template.html', 'test_result.html',
+                        'test_profile.json', 'test_corpus.json'])
+        for dirname in skipped:
+            if dirname != '.weapp-cache':
                 click.echo(click.style('Ignoring folder for local testing: '
-                                       + dirname + '. Do not put your custom '
-                                       + 'files under this folder',
-                           fg='yellow'))
-        zipf.close()
+                                       './' + dirname + '. Do not put your '
+                                       'custom files under this folder',
+                                       fg='yellow'))
+        reused, compressed = build_package(archive_name, files, dirs,
+                                           jobs=jobs)
+        click.echo(click.style('{} files compressed, {} unchanged files '
+                               'reused from the previous archive'.format(
+                                   compressed, reused), fg='green'))
         click.echo(click.style('Archiving completed!', fg='green'))
 
 
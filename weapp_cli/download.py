@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import socket
+import shutil
+import hashlib
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+from urllib.error import URLError
+
+DEFAULT_BASE_URL = \
+    'http://wegene-upload-prod.oss-cn-hangzhou.aliyuncs.com/sample_data'
+CHUNK_SIZE = 8 * 1024 * 1024
+READ_SIZE = 64 * 1024
+TIMEOUT = 60
+
+
+def base_url():
+    return os.environ.get('WEAPP_CLI_DATA_URL', DEFAULT_BASE_URL).rstrip('/')
+
+
+def remote_size(url):
+    # A one byte ranged request tells both the size and range support
+    request = Request(url, headers={'Range': 'bytes=0-0'})
+    with urlopen(request, timeout=TIMEOUT) as response:
+        if response.status == 206:
+            content_range = response.headers.get('Content-Range', '')
+            total = content_range.rpartition('/')[2]
+            if total.isdigit():
+                return int(total), True
+        length = response.headers.get('Content-Length')
+        return (int(length) if length else None), False
+
+
+def _fetch_range(url, part_path, start, end, progress):
+    request = Request(url, headers={'Range': 'bytes=%d-%d' % (start, end)})
+    with urlopen(request, timeout=TIMEOUT) as response, \
+            open(part_path, 'r+b') as part_f:
+        if response.status != 206:
+            raise IOError('Server ignored the range request')
+        part_f.seek(start)
+        while True:
+            block = response.read(READ_SIZE)
+            if not block:
+                break
+            part_f.write(block)
+            progress(len(block))
+        if part_f.tell() != end + 1:
+            raise IOError('Incomplete chunk %d-%d' % (start, end))
+
+
+def _fetch_whole(url, part_path, progress):
+    with urlopen(url, timeout=TIMEOUT) as response, \
+            open(part_path, 'wb') as part_f:
+        while True:
+            block = response.read(READ_SIZE)
+            if not block:
+                break
+            part_f.write(block)
+            progress(len(block))
+
+
+'''
+Downloads url to dest in CHUNK_SIZE ranges, up to jobs ranges at a time.
+Finished chunks are recorded next to the partial file so that a failed or
+interrupted download resumes where it stopped. Servers without range
+support fall back to a single plain request. A complete dest left by an
+earlier run, of the remote size and matching sha256 when given, is kept
+'''
+
+
+def download(url, dest, jobs=1, progress=None, sha256=None):
+    part_path = dest + '.part'
+    state_path = dest + '.part.json'
+    if progress is None:
+        progress = lambda size: None  # noqa: E731
+    size, ranged = remote_size(url)
+    if size is not None and os.path.isfile(dest) and \
+            os.path.getsize(dest) == size and \
+            (sha256 is None or sha256sum(dest) == sha256.lower()):
+        progress(size)
+        return dest
+    if not ranged or size is None:
+        _fetch_whole(url, part_path, progress)
+        os.replace(part_path, dest)
+        return dest
+
+    done = set()
+    if os.path.isfile(part_path) and os.path.isfile(state_path):
+        with open(state_path) as state_f:
+            state = json.load(state_f)
+        if state.get('url') == url and state.get('size') == size:
+            done = set(state['done'])
+    if not done:
+        with open(part_path, 'wb') as part_f:
+            part_f.truncate(size)
+    chunks = [start for start in range(0, size, CHUNK_SIZE)
+              if start not in done]
+    progress(sum(min(CHUNK_SIZE, size - start) for start in done))
+
+    lock = threading.Lock()
+
+    def fetch(start):
+        end = min(start + CHUNK_SIZE, size) - 1
+        _fetch_range(url, part_path, start, end, progress)
+        with lock:
+            done.add(start)
+            with open(state_path, 'w') as state_f:
+                json.dump({'url': url, 'size': size, 'done': sorted(done)},
+                          state_f)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for future in [executor.submit(fetch, start) for start in chunks]:
+            future.result()
+    os.replace(part_path, dest)
+    os.remove(state_path)
+    return dest
+
+
+def fetch_checksum(url):
+    try:
+        with urlopen(url + '.sha256', timeout=TIMEOUT) as response:
+            return response.read().decode('ascii').split()[0].lower()
+    except (URLError, socket.timeout, IndexError, UnicodeDecodeError):
+        return None
+
+
+def sha256sum(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+'''
+Extracts archive into dest_dir entry by entry through a staging folder
+next to it, then swaps the staged entries into place. With remove the
+archive is removed as soon as it has been read
+'''
+
+
+def extract_archive(archive, dest_dir, remove=True):
+    staging = os.path.join(dest_dir, '.extract-tmp')
+    if os.path.isdir(staging):
+        shutil.rmtree(staging)
+    os.makedirs(staging)
+    try:
+        with zipfile.ZipFile(archive) as zip_file:
+            for info in zip_file.infolist():
+                target = os.path.realpath(os.path.join(staging, info.filename))
+                if not target.startswith(os.path.realpath(staging) + os.sep):
+                    raise IOError('Unsafe path in archive: ' + info.filename)
+                if info.is_dir():
+                    os.makedirs(target, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with zip_file.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, READ_SIZE)
+        if remove:
+            os.remove(archive)
+        for name in os.listdir(staging):
+            target = os.path.join(dest_dir, name)
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            elif os.path.exists(target):
+                os.remove(target)
+            os.replace(os.path.join(staging, name), target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
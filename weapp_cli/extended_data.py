@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+import os
+import mmap
+import heapq
+import struct
+import tempfile
+from array import array
+
+# Layout of extended_data.store, see build_extended_store
+STORE_MAGIC = b'WGXD'
+STORE_VERSION = 1
+STORE_HEADER = struct.Struct('<4sHQQ')
+# Lines sorted in memory at once while building the store
+SORT_CHUNK_LINES = 1000000
+
+
+def store_path_for(dat_path):
+    return os.path.splitext(dat_path)[0] + '.store'
+
+
+def _sorted_runs(dat_path, tmp_dir):
+    runs = []
+    with open(dat_path, 'rb') as dat_f:
+        while True:
+            lines = dat_f.readlines(SORT_CHUNK_LINES * 32)
+            if not lines:
+                break
+            lines = [line.rstrip(b'\r\n') + b'\n'
+                     for line in lines if line.strip()]
+            lines.sort()
+            run_path = os.path.join(tmp_dir, 'run%d' % len(runs))
+            with open(run_path, 'wb') as run_f:
+                run_f.writelines(lines)
+            runs.append(run_path)
+    return runs
+
+
+'''
+Builds an rsid sorted store from extended_data.dat (rsid, chromosome,
+position, genotype per line). The store is laid out as
+    header | lines sorted by rsid | offset of each line
+so that single rsids can be looked up by binary search without reading the
+whole file. Large files are sorted in chunks and merged on disk
+'''
+
+
+def build_extended_store(dat_path, store_path=None):
+    if store_path is None:
+        store_path = store_path_for(dat_path)
+    tmp_path = store_path + '.tmp'
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(
+        store_path)))
+    offsets = array('Q')
+    try:
+        runs = _sorted_runs(dat_path, tmp_dir)
+        run_files = [open(run_path, 'rb') for run_path in runs]
+        try:
+            with open(tmp_path, 'wb') as store_f:
+                store_f.write(b'\0' * STORE_HEADER.size)
+                offset = STORE_HEADER.size
+                for line in heapq.merge(*run_files):
+                    offsets.append(offset)
+                    store_f.write(line)
+                    offset += len(line)
+                offsets_offset = offset
+                offsets.append(offset)
+                offsets.tofile(store_f)
+                store_f.seek(0)
+                store_f.write(STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION,
+                                                len(offsets) - 1,
+                                                offsets_offset))
+        finally:
+            for run_f in run_files:
+                run_f.close()
+    finally:
+        for name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, name))
+        os.rmdir(tmp_dir)
+    os.replace(tmp_path, store_path)
+    return store_path
+
+
+class ExtendedDataStore(object):
+
+    def __init__(self, store_path):
+        with open(store_path, 'rb') as store_f:
+            self._buf = mmap.mmap(store_f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, offsets_offset = \
+            STORE_HEADER.unpack_from(self._buf, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self._buf.close()
+            raise ValueError('Unsupported extended data store ' + store_path)
+        self._offsets = memoryview(self._buf)[
+            offsets_offset:offsets_offset + (self._count + 1) * 8].cast('Q')
+
+    def __len__(self):
+        return self._count
+
+    def _line(self, i):
+        return self._buf[self._offsets[i]:self._offsets[i + 1] - 1]
+
+    def _rsid(self, i):
+        start = self._offsets[i]
+        return self._buf[start:self._buf.find(b'\t', start)]
+
+    def get(self, rsid):
+        key = rsid.encode('ascii')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._rsid(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._rsid(lo) == key:
+            _, chromosome, position, genotype = \
+                self._line(lo).decode('ascii').split('\t')
+            return {
+                'genotype': genotype,
+                'chromosome': chromosome,
+                'position': position
+            }
+        return None
+
+    def close(self):
+        self._offsets.release()
+        self._buf.close()
+
+
+def is_store_current(dat_path):
+    store_path = store_path_for(dat_path)
+    if not os.path.isfile(store_path):
+        return False
+    return not os.path.isfile(dat_path) or \
+        os.path.getmtime(dat_path) <= os.path.getmtime(store_path)
+
+
+def open_extended_store(dat_path):
+    if not is_store_current(dat_path):
+        return None
+    try:
+        return ExtendedDataStore(store_path_for(dat_path))
+    except ValueError:
+        return None
@@ -33,6 +33,8 @@ try:
     inputs = json.loads(body)['inputs']
     # 使用 wegene_utils 解析以后，数据会被解析成下面这样的 json 格式:
     #   {'rs123': {'genotype': 'AA', 'chromosome': '1', position: '1236'}, ...}
+    # 如果只需要读取少量位点，可以使用 process_raw_genome_data(inputs, lazy=True)，
+    # 返回的对象用法与上面的 dict 相同，但只会在访问某个位点时才解析该位点
     if 'data' in inputs:
         user_genome = process_raw_genome_data(inputs)
         rs671 = user_genome['rs671']['genotype']
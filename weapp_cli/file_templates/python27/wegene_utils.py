@@ -1,14 +1,581 @@
 # -*- coding: utf-8 -*-
+import os
 import sys
 import gzip
+import json
+import mmap
+import time
 import base64
+import struct
+import hashlib
+import errno
+import tempfile
 from StringIO import StringIO
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# Layout of the compiled index_<format>.bin files, see compile_genome_index
+INDEX_MAGIC = b'WGIX'
+INDEX_VERSION = 2
+INDEX_HEADER = struct.Struct('<4sHHIII')
+INDEX_RECORD = struct.Struct('<IIIBB')
+INDEX_REGION = struct.Struct('<II')
+# Records unpacked by a single struct call while iterating an index
+ITER_RECORDS = 4096
+INDEX_NO_POSITION = 0xFFFFFFFF
 
 
 def sort_genotype(genotyope):
     return ''.join(sorted(genotyope))
 
 
+def _index_path(genome_format, ext='idx'):
+    # Index files for all posible formats will be provided automatically
+    # Do not change the default path below if you wish to use those
+    return './indexes/index_' + genome_format + '.' + ext
+
+
+'''
+Compiles a text index (index_pos, rsid, chromosome, position per line) into
+a binary index that can be opened with mmap. The file is laid out as
+    header | chromosome names | fixed-width records sorted by rsid | rsids |
+    (start, count) per chromosome | (position, record) sorted by position
+where the rsids are newline separated in the same order as the records and
+the (position, record) pairs are grouped by chromosome
+'''
+
+
+def compile_genome_index(idx_path, bin_path=None):
+    if bin_path is None:
+        bin_path = os.path.splitext(idx_path)[0] + '.bin'
+    chromosomes = []
+    chromosome_codes = {}
+    entries = []
+    with open(idx_path, 'r') as idx_f:
+        for line in idx_f:
+            if not line.startswith('NA'):
+                fields = line.strip().split('\t')
+                chromosome = fields[2]
+                if chromosome not in chromosome_codes:
+                    chromosome_codes[chromosome] = len(chromosomes)
+                    chromosomes.append(chromosome)
+                position = fields[3]
+                if position.isdigit():
+                    position = int(position)
+                else:
+                    position = INDEX_NO_POSITION
+                entries.append((fields[1].encode('ascii'), int(fields[0]),
+                                position, chromosome_codes[chromosome]))
+    entries.sort()
+
+    chromosome_table = '\t'.join(chromosomes).encode('ascii')
+    strings_offset = (INDEX_HEADER.size + len(chromosome_table) +
+                      INDEX_RECORD.size * len(entries))
+    records = []
+    rsids = []
+    rsid_offset = 0
+    regions = [[] for _ in chromosomes]
+    for record, entry in enumerate(entries):
+        rsid, index_pos, position, chromosome_code = entry
+        records.append(INDEX_RECORD.pack(rsid_offset, index_pos, position,
+                                         len(rsid), chromosome_code))
+        rsids.append(rsid)
+        rsid_offset += len(rsid) + 1
+        if position != INDEX_NO_POSITION:
+            regions[chromosome_code].append((position, record))
+    rsids = b'\n'.join(rsids)
+    regions_offset = strings_offset + len(rsids)
+
+    spans = []
+    region_entries = []
+    for region in regions:
+        region.sort()
+        spans.append(INDEX_REGION.pack(len(region_entries), len(region)))
+        region_entries.extend(INDEX_REGION.pack(position, record)
+                              for position, record in region)
+
+    tmp_path = bin_path + '.tmp'
+    with open(tmp_path, 'wb') as bin_f:
+        bin_f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION,
+                                      len(chromosome_table), len(entries),
+                                      strings_offset, regions_offset))
+        bin_f.write(chromosome_table)
+        bin_f.write(b''.join(records))
+        bin_f.write(rsids)
+        bin_f.write(b''.join(spans))
+        bin_f.write(b''.join(region_entries))
+    if os.path.exists(bin_path):
+        os.remove(bin_path)
+    os.rename(tmp_path, bin_path)
+    return bin_path
+
+
+'''
+Read-only view of a compiled index. Opening is constant time, single rsids
+are looked up by binary search and iterating yields
+    (rsid, index_pos, chromosome, position) in rsid order
+'''
+
+
+class GenomeIndex(object):
+
+    def __init__(self, bin_path):
+        with open(bin_path, 'rb') as bin_f:
+            self._buf = mmap.mmap(bin_f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, chromosome_table_len, self._count,
+         self._strings_offset,
+         self._regions_offset) = INDEX_HEADER.unpack_from(self._buf, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._buf.close()
+            raise ValueError('Unsupported index file ' + bin_path)
+        self._records_offset = INDEX_HEADER.size + chromosome_table_len
+        self.chromosomes = self._buf[
+            INDEX_HEADER.size:self._records_offset].split('\t')
+        self._positions_offset = (self._regions_offset +
+                                  INDEX_REGION.size * len(self.chromosomes))
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        # Records are unpacked ITER_RECORDS at a time, one struct call per
+        # record is slower on Python 2 than parsing the text index
+        buf = self._buf
+        chromosomes = self.chromosomes
+        rsids = self.keys()
+        records_struct = struct.Struct(
+            '<' + INDEX_RECORD.format.lstrip('<') * ITER_RECORDS)
+        for first in range(0, self._count, ITER_RECORDS):
+            count = min(ITER_RECORDS, self._count - first)
+            if count != ITER_RECORDS:
+                records_struct = struct.Struct(
+                    '<' + INDEX_RECORD.format.lstrip('<') * count)
+            values = records_struct.unpack_from(
+                buf, self._records_offset + first * INDEX_RECORD.size)
+            positions = [str(position) if position != INDEX_NO_POSITION
+                         else 'NA' for position in values[2::5]]
+            for entry in zip(rsids[first:first + count], values[1::5],
+                             [chromosomes[code] for code in values[4::5]],
+                             positions):
+                yield entry
+
+    def __contains__(self, rsid):
+        return self.find(rsid) >= 0
+
+    def keys(self):
+        # str like the rsids read from the text index
+        return self._buf[self._strings_offset:self._regions_offset] \
+            .split('\n')
+
+    @staticmethod
+    def _position_str(position):
+        return 'NA' if position == INDEX_NO_POSITION else str(position)
+
+    def _record(self, i):
+        return INDEX_RECORD.unpack_from(
+            self._buf, self._records_offset + i * INDEX_RECORD.size)
+
+    def _rsid_bytes(self, record):
+        rsid_start = self._strings_offset + record[0]
+        return self._buf[rsid_start:rsid_start + record[3]]
+
+    def find(self, rsid):
+        key = rsid.encode('ascii')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._rsid_bytes(self._record(mid)) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._rsid_bytes(self._record(lo)) == key:
+            return lo
+        return -1
+
+    def _region_position(self, i):
+        return INDEX_REGION.unpack_from(
+            self._buf, self._positions_offset + i * INDEX_REGION.size)[0]
+
+    def _bisect_region(self, lo, hi, position):
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._region_position(mid) < position:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    '''
+    Returns the rsids located on chromosome between start and end
+    (both inclusive) ordered by position
+    '''
+
+    def query_region(self, chromosome, start, end):
+        chromosome = str(chromosome)
+        if chromosome not in self.chromosomes:
+            return []
+        first, count = INDEX_REGION.unpack_from(
+            self._buf, self._regions_offset +
+            self.chromosomes.index(chromosome) * INDEX_REGION.size)
+        lo = self._bisect_region(first, first + count, start)
+        hi = self._bisect_region(lo, first + count, end + 1)
+        rsids = []
+        for i in range(lo, hi):
+            record = INDEX_REGION.unpack_from(
+                self._buf, self._positions_offset + i * INDEX_REGION.size)[1]
+            rsids.append(
+                self._rsid_bytes(self._record(record)).decode('ascii'))
+        return rsids
+
+    def get(self, rsid):
+        i = self.find(rsid)
+        if i < 0:
+            return None
+        _, index_pos, position, _, chromosome_code = self._record(i)
+        return (index_pos, self.chromosomes[chromosome_code],
+                self._position_str(position))
+
+    def close(self):
+        self._buf.close()
+
+
+def open_genome_index(genome_format):
+    idx_path = _index_path(genome_format)
+    bin_path = _index_path(genome_format, 'bin')
+    # A text index edited after compiling takes precedence
+    if os.path.isfile(bin_path) and not (
+            os.path.isfile(idx_path) and
+            os.path.getmtime(idx_path) > os.path.getmtime(bin_path)):
+        try:
+            return GenomeIndex(bin_path)
+        except ValueError:
+            # Compiled by an older version of weapp-cli
+            pass
+    return _open_shared_index(genome_format)
+
+
+# Folder where worker processes publish and share compiled indexes, see
+# publish_genome_index
+SHARED_INDEX_ENV = 'WEGENE_UTILS_SHARED_INDEXES'
+# Other processes wait that long for a publisher, after which a publisher
+# that did not finish is assumed to have died
+PUBLISH_TIMEOUT = 600
+PUBLISH_POLL = 0.05
+
+
+def _shared_index_path(genome_format):
+    shared_dir = os.environ.get(SHARED_INDEX_ENV)
+    idx_path = _index_path(genome_format)
+    if not shared_dir or not os.path.isfile(idx_path):
+        return None
+    idx_stat = os.stat(idx_path)
+    # Any change of the text index gives a new name, projects that hardlink
+    # the same text index share one compiled index
+    mtime_ns = getattr(idx_stat, 'st_mtime_ns',
+                       int(idx_stat.st_mtime * 1e9))
+    key = hashlib.sha1('{}:{}:{}:{}:{}'.format(
+        idx_stat.st_dev, idx_stat.st_ino, idx_stat.st_size, mtime_ns,
+        INDEX_VERSION).encode('utf-8')).hexdigest()
+    return os.path.join(shared_dir,
+                        'index_{}_{}.bin'.format(genome_format, key[:16]))
+
+
+def _publisher_alive(lock_path):
+    # A publisher killed by a limit leaves its lock behind, the lock holds
+    # its pid. A lock that is still being written counts as alive
+    with open(lock_path) as lock_f:
+        pid = lock_f.read()
+    if not pid or os.name == 'nt':
+        # os.kill would terminate the process on Windows
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    except ValueError:
+        return True
+    return True
+
+
+'''
+Compiles the text index of genome_format once into the folder named by
+WEGENE_UTILS_SHARED_INDEXES and returns the path of the compiled index.
+Every process that then opens the index without a current compiled index
+of its own maps that file read-only instead of parsing the text index, so
+its pages are shared by all of them. While another process compiles the
+index the others wait for it, unless it died. Returns None when the
+variable is not set or the index was not published within PUBLISH_TIMEOUT
+seconds
+'''
+
+
+def publish_genome_index(genome_format):
+    shared_path = _shared_index_path(genome_format)
+    if shared_path is None or os.path.isfile(shared_path):
+        return shared_path
+    shared_dir = os.path.dirname(shared_path)
+    if not os.path.isdir(shared_dir):
+        try:
+            os.makedirs(shared_dir)
+        except OSError:
+            # Created by another process meanwhile
+            pass
+    lock_path = shared_path + '.lock'
+    deadline = time.time() + PUBLISH_TIMEOUT
+    while True:
+        if os.path.isfile(shared_path):
+            return shared_path
+        try:
+            lock_fd = os.open(lock_path,
+                              os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except OSError:
+            pass
+        try:
+            if not _publisher_alive(lock_path) or \
+                    time.time() - os.path.getmtime(lock_path) > \
+                    PUBLISH_TIMEOUT:
+                os.remove(lock_path)
+                continue
+        except (IOError, OSError):
+            # Released meanwhile or not ours to remove
+            pass
+        if time.time() > deadline:
+            return None
+        time.sleep(PUBLISH_POLL)
+    os.write(lock_fd, str(os.getpid()).encode('ascii'))
+    os.close(lock_fd)
+    try:
+        if not os.path.isfile(shared_path):
+            tmp_fd, tmp_path = tempfile.mkstemp(dir=shared_dir,
+                                                prefix='.tmp-')
+            os.close(tmp_fd)
+            try:
+                compile_genome_index(_index_path(genome_format), tmp_path)
+                os.rename(tmp_path, shared_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    finally:
+        os.remove(lock_path)
+    return shared_path
+
+
+def _open_shared_index(genome_format):
+    try:
+        shared_path = publish_genome_index(genome_format)
+        if shared_path is None:
+            return None
+        return GenomeIndex(shared_path)
+    except (OSError, IOError, ValueError):
+        # Not writable or corrupted, the text index still works
+        return None
+
+
+def _iter_index_entries(genome_format):
+    index = open_genome_index(genome_format)
+    if index is not None:
+        try:
+            for rsid, index_pos, chromosome, position in index:
+                yield index_pos, rsid, chromosome, position
+        finally:
+            index.close()
+        return
+    with open(_index_path(genome_format), 'r') as idx_f:
+        for line in idx_f:
+            if not line.startswith('NA'):
+                fields = line.strip().split('\t')
+                yield int(fields[0]), fields[1], fields[2], fields[3]
+
+
+def _load_text_index(genome_format):
+    index = {}
+    with open(_index_path(genome_format), 'r') as idx_f:
+        for line in idx_f:
+            if not line.startswith('NA'):
+                fields = line.strip().split('\t')
+                index[fields[1]] = (int(fields[0]), fields[2], fields[3])
+    return index
+
+
+'''
+Read-only mapping with the same interface as the dict returned by
+parse_genome_string, e.g. user_genome['rs671']['genotype']. The genotype,
+chromosome and position of a rsid are only resolved when it is accessed
+'''
+
+
+class LazyGenome(Mapping):
+
+    def __init__(self, genome_str, genome_format):
+        self._genome_str = genome_str
+        self._index = open_genome_index(genome_format)
+        if self._index is None:
+            self._index = _load_text_index(genome_format)
+        self._cache = {}
+
+    def __getitem__(self, rsid):
+        try:
+            return self._cache[rsid]
+        except KeyError:
+            pass
+        entry = self._index.get(rsid)
+        if entry is None:
+            raise KeyError(rsid)
+        index_pos, chromosome, position = entry
+        start_pos = index_pos * 2
+        snp = {
+            'genotype': sort_genotype(self._genome_str[start_pos:start_pos+2]),
+            'chromosome': chromosome,
+            'position': position
+        }
+        self._cache[rsid] = snp
+        return snp
+
+    def __contains__(self, rsid):
+        return rsid in self._cache or rsid in self._index
+
+    def __iter__(self):
+        return iter(self._index.keys())
+
+    def __len__(self):
+        return len(self._index)
+
+    def query_region(self, chromosome, start, end):
+        if isinstance(self._index, GenomeIndex):
+            return self._index.query_region(chromosome, start, end)
+        return _scan_region(self._index.items(), chromosome, start, end)
+
+
+def _scan_region(entries, chromosome, start, end):
+    chromosome = str(chromosome)
+    region = []
+    for rsid, entry in entries:
+        if entry[1] == chromosome and entry[2].isdigit() and \
+                start <= int(entry[2]) <= end:
+            region.append((int(entry[2]), rsid))
+    region.sort()
+    return [rsid for _, rsid in region]
+
+
+'''
+Returns the rsids of genome located on chromosome between start and end
+(both inclusive) ordered by position. genome can be anything
+process_raw_genome_data or read_genome_inputs return, including the plain
+dict, or the inputs of a partial genome
+'''
+
+
+def query_region(genome, genome_format, chromosome, start, end):
+    if hasattr(genome, 'query_region'):
+        return genome.query_region(chromosome, start, end)
+    index = open_genome_index(genome_format)
+    if index is not None:
+        try:
+            rsids = index.query_region(chromosome, start, end)
+        finally:
+            index.close()
+    else:
+        rsids = _scan_region(_load_text_index(genome_format).items(),
+                             chromosome, start, end)
+    return [rsid for rsid in rsids if rsid in genome]
+
+
+# Opt-in timings of the genome parsing, see _Trace
+TRACE_ENV = 'WEGENE_UTILS_TRACE'
+TRACE_PREFIX = 'WEGENE_UTILS_TRACE '
+_trace_target = os.environ.get(TRACE_ENV)
+
+
+'''
+Phase timings and counters of one call, recorded when WEGENE_UTILS_TRACE
+is set. The record is written as a JSON line to stderr, prefixed with
+TRACE_PREFIX, when the variable is "1" or "stderr" and appended to the file
+it names otherwise
+'''
+
+
+class _Trace(object):
+
+    enabled = True
+
+    def __init__(self, function):
+        self.function = function
+        self.phases = {}
+        self.counters = {}
+        self._last = time.time()
+
+    def mark(self, phase):
+        now = time.time()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self._last
+        self._last = now
+
+    def count(self, counter, value):
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def emit(self):
+        record = json.dumps({
+            'function': self.function,
+            'pid': os.getpid(),
+            'phases': dict((phase, round(seconds, 6))
+                           for phase, seconds in self.phases.items()),
+            'counters': self.counters
+        })
+        if _trace_target in ('1', 'stderr'):
+            sys.stderr.write(TRACE_PREFIX + record + '\n')
+        else:
+            with open(_trace_target, 'a') as trace_f:
+                trace_f.write(record + '\n')
+
+
+class _NoTrace(object):
+
+    enabled = False
+
+    def mark(self, phase):
+        pass
+
+    def count(self, counter, value):
+        pass
+
+    def emit(self):
+        pass
+
+
+_NO_TRACE = _NoTrace()
+
+
+def _start_trace(function):
+    if _trace_target:
+        return _Trace(function)
+    return _NO_TRACE
+
+
+def _parse_genome_string(genome_str, genome_format, trace):
+    entries = _iter_index_entries(genome_format)
+    if trace.enabled:
+        # Read the whole index first so that both phases can be told apart
+        entries = list(entries)
+        trace.mark('index_load')
+    genome_dict = {}
+    for index_pos, rsid, chromosome, position in entries:
+        start_pos = index_pos * 2
+        genome_dict[rsid] = {
+            'genotype': sort_genotype(
+                            genome_str[start_pos:start_pos+2]),
+            'chromosome': chromosome,
+            'position': position
+        }
+    trace.mark('dict_build')
+    if trace.enabled:
+        trace.count('snps', len(genome_dict))
+        trace.count('missing', sum(1 for snp in genome_dict.values()
+                                   if snp['genotype'] in ('--', '__')))
+    return genome_dict
+
+
 '''
 Reads the genome string anmd format and parse into a dict of
     {'rs1234': {'genotype': 'AA', 'chromosome': '1', position: '123456'}, ...}
@@ -17,24 +584,9 @@ Reads the genome string anmd format and parse into a dict of
 
 def parse_genome_string(genome_str, genome_format):
     try:
-        genome_dict = {}
-        # Index files for all posible formats will be provided automatically
-        # Do not change the default path below if you wish to use those
-        with open('./indexes/index_' + genome_format + '.idx', 'r') as idx_f:
-            for line in idx_f:
-                if not line.startswith('NA'):
-                    fields = line.strip().split('\t')
-                    index_pos = fields[0]
-                    rsid = fields[1]
-                    chromosome = fields[2]
-                    position = fields[3]
-                    start_pos = int(index_pos) * 2
-                    genome_dict[rsid] = {
-                        'genotype': sort_genotype(
-                                        genome_str[start_pos:start_pos+2]),
-                        'chromosome': chromosome,
-                        'position': position
-                    }
+        trace = _start_trace('parse_genome_string')
+        genome_dict = _parse_genome_string(genome_str, genome_format, trace)
+        trace.emit()
         return genome_dict
     except Exception as e:
         sys.stderr.write('Error on file {} line {} '.format(
@@ -43,12 +595,24 @@ def parse_genome_string(genome_str, genome_format):
                          + str(e))
 
 
-def process_raw_genome_data(raw_inputs):
+def process_raw_genome_data(raw_inputs, lazy=False):
     try:
-        genome = gzip.GzipFile(fileobj=StringIO(
-                    base64.b64decode(raw_inputs['data']))).read()
+        trace = _start_trace('process_raw_genome_data')
+        raw = base64.b64decode(raw_inputs['data'])
+        trace.mark('decode')
+        genome = gzip.GzipFile(fileobj=StringIO(raw)).read()
+        # The compressed genome is not needed once it is decompressed
+        del raw
+        trace.mark('decompress')
+        trace.count('genome_bytes', len(genome))
         genome_format = raw_inputs['format']
-        return parse_genome_string(genome, genome_format)
+        if lazy:
+            genome = LazyGenome(genome, genome_format)
+            trace.mark('index_load')
+        else:
+            genome = _parse_genome_string(genome, genome_format, trace)
+        trace.emit()
+        return genome
     except Exception as e:
         sys.stderr.write('Error on file {} line {} '.format(
                             sys.exc_info()[-1].tb_frame.f_code.co_filename,
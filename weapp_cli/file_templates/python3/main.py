@@ -26,6 +26,8 @@ from wegene_utils import is_wegene_format
 '''
 
 # 从 stdin 读取输入数据
+# 对于全部位点数据，也可以使用 inputs, user_genome = read_genome_inputs() 直接从 stdin
+# 解析出输入数据和位点数据，解码过程中只保留一份完整的基因组数据，内存占用更低
 body = sys.stdin.read()
 
 try:
@@ -33,6 +35,8 @@ try:
     inputs = json.loads(body)['inputs']
     # 使用 wegene_utils 解析以后，数据会被解析成下面这样的 json 格式:
     #   {'rs123': {'genotype': 'AA', 'chromosome': '1', position: '1236'}, ...}
+    # 如果只需要读取少量位点，可以使用 process_raw_genome_data(inputs, lazy=True)，
+    # 返回的对象用法与上面的 dict 相同，但只会在访问某个位点时才解析该位点
     if 'data' in inputs.keys():
         user_genome = process_raw_genome_data(inputs)
         rs671 = user_genome['rs671']['genotype']
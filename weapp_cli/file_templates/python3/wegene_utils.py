@@ -1,17 +1,786 @@
 # -*- coding: utf-8 -*-
 
-__all__ = ['process_raw_genome_data', 'is_genotype_exist', 'is_wegene_format']
+__all__ = ['process_raw_genome_data', 'read_genome_inputs', 'get_genotypes',
+           'query_region', 'PolygenicScore', 'is_genotype_exist',
+           'is_wegene_format']
 
+import os
+import re
 import sys
 import gzip
+import json
+import mmap
+import zlib
 import base64
+import struct
+import hashlib
+import errno
+import tempfile
+import time
 from io import BytesIO
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Layout of the compiled index_<format>.bin files, see compile_genome_index
+INDEX_MAGIC = b'WGIX'
+INDEX_VERSION = 2
+INDEX_HEADER = struct.Struct('<4sHHIII')
+INDEX_RECORD = struct.Struct('<IIIBB')
+INDEX_REGION = struct.Struct('<II')
+INDEX_NO_POSITION = 0xFFFFFFFF
+
+# Strings and punctuation of a JSON body, enough to follow its structure
+JSON_TOKEN = re.compile(br'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\],]')
+# JSON escapes in a base64 string, e.g. '\/' or a line break '\n'
+JSON_ESCAPE = re.compile(br'\\(u[0-9A-Fa-f]{4}|.)', re.DOTALL)
+BASE64_CHARS = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                         b'abcdefghijklmnopqrstuvwxyz0123456789+/=')
+DECODE_CHUNK_SIZE = 64 * 1024
+# Escaped base64 characters at the end of the data that hold ISIZE
+GZIP_TAIL_SIZE = 256
+
+ALLELES = 'ACGT'
+ALLELE_OTHER = 0xFF
+if np is not None:
+    INDEX_DTYPE = np.dtype([('rsid_offset', '<u4'), ('index_pos', '<u4'),
+                            ('position', '<u4'), ('rsid_len', 'u1'),
+                            ('chromosome', 'u1')])
+    ALLELE_CODES = np.full(256, ALLELE_OTHER, dtype=np.uint8)
+    for code, allele in enumerate(ALLELES):
+        ALLELE_CODES[ord(allele)] = code
+    ALLELE_PAIRS = np.array([a + b for a in ALLELES for b in ALLELES],
+                            dtype=object)
+    ALLELE_BYTES = np.frombuffer(ALLELES.encode('ascii'), dtype=np.uint8)
 
 
 def sort_genotype(genotyope):
     return ''.join(sorted(genotyope))
 
 
+def _index_path(genome_format, ext='idx'):
+    # Index files for all posible formats will be provided automatically
+    # Do not change the default path below if you wish to use those
+    return './indexes/index_' + genome_format + '.' + ext
+
+
+'''
+Compiles a text index (index_pos, rsid, chromosome, position per line) into
+a binary index that can be opened with mmap. The file is laid out as
+    header | chromosome names | fixed-width records sorted by rsid | rsids |
+    (start, count) per chromosome | (position, record) sorted by position
+where the rsids are newline separated in the same order as the records and
+the (position, record) pairs are grouped by chromosome
+'''
+
+
+def compile_genome_index(idx_path, bin_path=None):
+    if bin_path is None:
+        bin_path = os.path.splitext(idx_path)[0] + '.bin'
+    chromosomes = []
+    chromosome_codes = {}
+    entries = []
+    with open(idx_path, 'r') as idx_f:
+        for line in idx_f:
+            if not line.startswith('NA'):
+                fields = line.strip().split('\t')
+                chromosome = fields[2]
+                if chromosome not in chromosome_codes:
+                    chromosome_codes[chromosome] = len(chromosomes)
+                    chromosomes.append(chromosome)
+                position = fields[3]
+                if position.isdigit():
+                    position = int(position)
+                else:
+                    position = INDEX_NO_POSITION
+                entries.append((fields[1].encode('ascii'), int(fields[0]),
+                                position, chromosome_codes[chromosome]))
+    entries.sort()
+
+    chromosome_table = '\t'.join(chromosomes).encode('ascii')
+    strings_offset = (INDEX_HEADER.size + len(chromosome_table) +
+                      INDEX_RECORD.size * len(entries))
+    records = []
+    rsids = []
+    rsid_offset = 0
+    regions = [[] for _ in chromosomes]
+    for record, entry in enumerate(entries):
+        rsid, index_pos, position, chromosome_code = entry
+        records.append(INDEX_RECORD.pack(rsid_offset, index_pos, position,
+                                         len(rsid), chromosome_code))
+        rsids.append(rsid)
+        rsid_offset += len(rsid) + 1
+        if position != INDEX_NO_POSITION:
+            regions[chromosome_code].append((position, record))
+    rsids = b'\n'.join(rsids)
+    regions_offset = strings_offset + len(rsids)
+
+    spans = []
+    region_entries = []
+    for region in regions:
+        region.sort()
+        spans.append(INDEX_REGION.pack(len(region_entries), len(region)))
+        region_entries.extend(INDEX_REGION.pack(position, record)
+                              for position, record in region)
+
+    tmp_path = bin_path + '.tmp'
+    with open(tmp_path, 'wb') as bin_f:
+        bin_f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION,
+                                      len(chromosome_table), len(entries),
+                                      strings_offset, regions_offset))
+        bin_f.write(chromosome_table)
+        bin_f.write(b''.join(records))
+        bin_f.write(rsids)
+        bin_f.write(b''.join(spans))
+        bin_f.write(b''.join(region_entries))
+    if os.path.exists(bin_path):
+        os.remove(bin_path)
+    os.rename(tmp_path, bin_path)
+    return bin_path
+
+
+'''
+Read-only view of a compiled index. Opening is constant time, single rsids
+are looked up by binary search and iterating yields
+    (rsid, index_pos, chromosome, position) in rsid order
+'''
+
+
+class GenomeIndex(object):
+
+    def __init__(self, bin_path):
+        with open(bin_path, 'rb') as bin_f:
+            self._buf = mmap.mmap(bin_f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, chromosome_table_len, self._count,
+         self._strings_offset,
+         self._regions_offset) = INDEX_HEADER.unpack_from(self._buf, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._buf.close()
+            raise ValueError('Unsupported index file ' + bin_path)
+        self._records_offset = INDEX_HEADER.size + chromosome_table_len
+        self.chromosomes = self._buf[
+            INDEX_HEADER.size:self._records_offset].decode('ascii').split('\t')
+        self._positions_offset = (self._regions_offset +
+                                  INDEX_REGION.size * len(self.chromosomes))
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        buf = self._buf
+        chromosomes = self.chromosomes
+        position_str = self._position_str
+        records = buf[self._records_offset:self._strings_offset]
+        # rsids are stored newline separated in record order
+        rsids = self.keys()
+        if hasattr(INDEX_RECORD, 'iter_unpack'):
+            unpacked = INDEX_RECORD.iter_unpack(records)
+        else:
+            unpacked = (INDEX_RECORD.unpack_from(records, offset)
+                        for offset in range(0, len(records),
+                                            INDEX_RECORD.size))
+        for rsid, record in zip(rsids, unpacked):
+            yield (rsid, record[1], chromosomes[record[4]],
+                   position_str(record[2]))
+
+    def __contains__(self, rsid):
+        return self.find(rsid) >= 0
+
+    def keys(self):
+        return self._buf[self._strings_offset:self._regions_offset] \
+            .decode('ascii').split('\n')
+
+    @staticmethod
+    def _position_str(position):
+        return 'NA' if position == INDEX_NO_POSITION else str(position)
+
+    def _record(self, i):
+        return INDEX_RECORD.unpack_from(
+            self._buf, self._records_offset + i * INDEX_RECORD.size)
+
+    def _rsid_bytes(self, record):
+        rsid_start = self._strings_offset + record[0]
+        return self._buf[rsid_start:rsid_start + record[3]]
+
+    def find(self, rsid):
+        key = rsid.encode('ascii')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._rsid_bytes(self._record(mid)) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._rsid_bytes(self._record(lo)) == key:
+            return lo
+        return -1
+
+    def _region_position(self, i):
+        return INDEX_REGION.unpack_from(
+            self._buf, self._positions_offset + i * INDEX_REGION.size)[0]
+
+    def _bisect_region(self, lo, hi, position):
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._region_position(mid) < position:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    '''
+    Returns the rsids located on chromosome between start and end
+    (both inclusive) ordered by position
+    '''
+
+    def query_region(self, chromosome, start, end):
+        chromosome = str(chromosome)
+        if chromosome not in self.chromosomes:
+            return []
+        first, count = INDEX_REGION.unpack_from(
+            self._buf, self._regions_offset +
+            self.chromosomes.index(chromosome) * INDEX_REGION.size)
+        lo = self._bisect_region(first, first + count, start)
+        hi = self._bisect_region(lo, first + count, end + 1)
+        rsids = []
+        for i in range(lo, hi):
+            record = INDEX_REGION.unpack_from(
+                self._buf, self._positions_offset + i * INDEX_REGION.size)[1]
+            rsids.append(
+                self._rsid_bytes(self._record(record)).decode('ascii'))
+        return rsids
+
+    def get(self, rsid):
+        i = self.find(rsid)
+        if i < 0:
+            return None
+        _, index_pos, position, _, chromosome_code = self._record(i)
+        return (index_pos, self.chromosomes[chromosome_code],
+                self._position_str(position))
+
+    def close(self):
+        self._buf.close()
+
+
+def open_genome_index(genome_format):
+    idx_path = _index_path(genome_format)
+    bin_path = _index_path(genome_format, 'bin')
+    # A text index edited after compiling takes precedence
+    if os.path.isfile(bin_path) and not (
+            os.path.isfile(idx_path) and
+            os.path.getmtime(idx_path) > os.path.getmtime(bin_path)):
+        try:
+            return GenomeIndex(bin_path)
+        except ValueError:
+            # Compiled by an older version of weapp-cli
+            pass
+    return _open_shared_index(genome_format)
+
+
+# Folder where worker processes publish and share compiled indexes, see
+# publish_genome_index
+SHARED_INDEX_ENV = 'WEGENE_UTILS_SHARED_INDEXES'
+# Other processes wait that long for a publisher, after which a publisher
+# that did not finish is assumed to have died
+PUBLISH_TIMEOUT = 600
+PUBLISH_POLL = 0.05
+
+
+def _shared_index_path(genome_format):
+    shared_dir = os.environ.get(SHARED_INDEX_ENV)
+    idx_path = _index_path(genome_format)
+    if not shared_dir or not os.path.isfile(idx_path):
+        return None
+    idx_stat = os.stat(idx_path)
+    # Any change of the text index gives a new name, projects that hardlink
+    # the same text index share one compiled index
+    key = hashlib.sha1('{}:{}:{}:{}:{}'.format(
+        idx_stat.st_dev, idx_stat.st_ino, idx_stat.st_size,
+        idx_stat.st_mtime_ns, INDEX_VERSION).encode('utf-8')).hexdigest()
+    return os.path.join(shared_dir,
+                        'index_{}_{}.bin'.format(genome_format, key[:16]))
+
+
+def _publisher_alive(lock_path):
+    # A publisher killed by a limit leaves its lock behind, the lock holds
+    # its pid. A lock that is still being written counts as alive
+    with open(lock_path) as lock_f:
+        pid = lock_f.read()
+    if not pid or os.name == 'nt':
+        # os.kill would terminate the process on Windows
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    except ValueError:
+        return True
+    return True
+
+
+'''
+Compiles the text index of genome_format once into the folder named by
+WEGENE_UTILS_SHARED_INDEXES and returns the path of the compiled index.
+Every process that then opens the index without a current compiled index
+of its own maps that file read-only instead of parsing the text index, so
+its pages are shared by all of them. While another process compiles the
+index the others wait for it, unless it died. Returns None when the
+variable is not set or the index was not published within PUBLISH_TIMEOUT
+seconds
+'''
+
+
+def publish_genome_index(genome_format):
+    shared_path = _shared_index_path(genome_format)
+    if shared_path is None or os.path.isfile(shared_path):
+        return shared_path
+    shared_dir = os.path.dirname(shared_path)
+    if not os.path.isdir(shared_dir):
+        try:
+            os.makedirs(shared_dir)
+        except OSError:
+            # Created by another process meanwhile
+            pass
+    lock_path = shared_path + '.lock'
+    deadline = time.time() + PUBLISH_TIMEOUT
+    while True:
+        if os.path.isfile(shared_path):
+            return shared_path
+        try:
+            lock_fd = os.open(lock_path,
+                              os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except OSError:
+            pass
+        try:
+            if not _publisher_alive(lock_path) or \
+                    time.time() - os.path.getmtime(lock_path) > \
+                    PUBLISH_TIMEOUT:
+                os.remove(lock_path)
+                continue
+        except (IOError, OSError):
+            # Released meanwhile or not ours to remove
+            pass
+        if time.time() > deadline:
+            return None
+        time.sleep(PUBLISH_POLL)
+    os.write(lock_fd, str(os.getpid()).encode('ascii'))
+    os.close(lock_fd)
+    try:
+        if not os.path.isfile(shared_path):
+            tmp_fd, tmp_path = tempfile.mkstemp(dir=shared_dir,
+                                                prefix='.tmp-')
+            os.close(tmp_fd)
+            try:
+                compile_genome_index(_index_path(genome_format), tmp_path)
+                os.rename(tmp_path, shared_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    finally:
+        os.remove(lock_path)
+    return shared_path
+
+
+def _open_shared_index(genome_format):
+    try:
+        shared_path = publish_genome_index(genome_format)
+        if shared_path is None:
+            return None
+        return GenomeIndex(shared_path)
+    except (OSError, IOError, ValueError):
+        # Not writable or corrupted, the text index still works
+        return None
+
+
+def _iter_index_entries(genome_format):
+    index = open_genome_index(genome_format)
+    if index is not None:
+        try:
+            for rsid, index_pos, chromosome, position in index:
+                yield index_pos, rsid, chromosome, position
+        finally:
+            index.close()
+        return
+    with open(_index_path(genome_format), 'r') as idx_f:
+        for line in idx_f:
+            if not line.startswith('NA'):
+                fields = line.strip().split('\t')
+                yield int(fields[0]), fields[1], fields[2], fields[3]
+
+
+def _load_text_index(genome_format):
+    index = {}
+    with open(_index_path(genome_format), 'r') as idx_f:
+        for line in idx_f:
+            if not line.startswith('NA'):
+                fields = line.strip().split('\t')
+                index[fields[1]] = (int(fields[0]), fields[2], fields[3])
+    return index
+
+
+'''
+Read-only mapping with the same interface as the dict returned by
+parse_genome_string, e.g. user_genome['rs671']['genotype']. The genotype,
+chromosome and position of a rsid are only resolved when it is accessed
+'''
+
+
+class LazyGenome(Mapping):
+
+    def __init__(self, genome_str, genome_format):
+        self._genome_str = genome_str
+        self._index = open_genome_index(genome_format)
+        if self._index is None:
+            self._index = _load_text_index(genome_format)
+        self._cache = {}
+
+    def __getitem__(self, rsid):
+        try:
+            return self._cache[rsid]
+        except KeyError:
+            pass
+        entry = self._index.get(rsid)
+        if entry is None:
+            raise KeyError(rsid)
+        index_pos, chromosome, position = entry
+        start_pos = index_pos * 2
+        genotype = self._genome_str[start_pos:start_pos+2]
+        if not isinstance(genotype, str):
+            genotype = genotype.decode('ascii')
+        snp = {
+            'genotype': sort_genotype(genotype),
+            'chromosome': chromosome,
+            'position': position
+        }
+        self._cache[rsid] = snp
+        return snp
+
+    def __contains__(self, rsid):
+        return rsid in self._cache or rsid in self._index
+
+    def __iter__(self):
+        return iter(self._index.keys())
+
+    def __len__(self):
+        return len(self._index)
+
+    def query_region(self, chromosome, start, end):
+        if isinstance(self._index, GenomeIndex):
+            return self._index.query_region(chromosome, start, end)
+        return _scan_region(self._index.items(), chromosome, start, end)
+
+
+def _scan_region(entries, chromosome, start, end):
+    chromosome = str(chromosome)
+    region = []
+    for rsid, entry in entries:
+        if entry[1] == chromosome and entry[2].isdigit() and \
+                start <= int(entry[2]) <= end:
+            region.append((int(entry[2]), rsid))
+    region.sort()
+    return [rsid for _, rsid in region]
+
+
+'''
+Returns the rsids of genome located on chromosome between start and end
+(both inclusive) ordered by position. genome can be anything
+process_raw_genome_data or read_genome_inputs return, including the plain
+dict, or the inputs of a partial genome
+'''
+
+
+def query_region(genome, genome_format, chromosome, start, end):
+    if hasattr(genome, 'query_region'):
+        return genome.query_region(chromosome, start, end)
+    index = open_genome_index(genome_format)
+    if index is not None:
+        try:
+            rsids = index.query_region(chromosome, start, end)
+        finally:
+            index.close()
+    else:
+        rsids = _scan_region(_load_text_index(genome_format).items(),
+                             chromosome, start, end)
+    return [rsid for rsid in rsids if rsid in genome]
+
+
+'''
+Columnar genome backed by NumPy arrays that line up with the index records.
+Genotypes are packed with 2 bits per allele (A=0, C=1, G=2, T=3, four alleles
+per byte); genotypes containing any other allele such as '--' or 'DI' are
+kept verbatim in a small exception table
+'''
+
+
+class PackedGenome(object):
+
+    def __init__(self, genome_str, genome_format):
+        if np is None:
+            raise ImportError('PackedGenome requires numpy')
+        if not isinstance(genome_str, (bytes, bytearray)):
+            genome_str = genome_str.encode('ascii')
+        self.genome_format = genome_format
+        self._index = open_genome_index(genome_format)
+        self._sorted_rsids = None
+        if self._index is not None:
+            records = np.frombuffer(self._index._buf, dtype=INDEX_DTYPE,
+                                    count=len(self._index),
+                                    offset=self._index._records_offset)
+            self._rsids = None
+            self._rows = None
+            self.chromosome_names = self._index.chromosomes
+            index_pos = records['index_pos']
+            self.chromosomes = records['chromosome']
+            self.positions = records['position']
+        else:
+            self._rsids = []
+            self._rows = {}
+            self.chromosome_names = []
+            chromosome_codes = {}
+            index_pos = []
+            chromosomes = []
+            positions = []
+            with open(_index_path(genome_format), 'r') as idx_f:
+                for line in idx_f:
+                    if not line.startswith('NA'):
+                        fields = line.strip().split('\t')
+                        if fields[2] not in chromosome_codes:
+                            chromosome_codes[fields[2]] = \
+                                len(self.chromosome_names)
+                            self.chromosome_names.append(fields[2])
+                        self._rows[fields[1]] = len(self._rsids)
+                        self._rsids.append(fields[1])
+                        index_pos.append(int(fields[0]))
+                        chromosomes.append(chromosome_codes[fields[2]])
+                        positions.append(int(fields[3])
+                                         if fields[3].isdigit()
+                                         else INDEX_NO_POSITION)
+            index_pos = np.array(index_pos, dtype=np.uint32)
+            self.chromosomes = np.array(chromosomes, dtype=np.uint8)
+            self.positions = np.array(positions, dtype=np.uint32)
+
+        genome = np.frombuffer(genome_str, dtype=np.uint8)
+        starts = index_pos.astype(np.intp) * 2
+        first = genome[starts]
+        second = genome[starts + 1]
+        # Same allele order as sort_genotype
+        alleles = np.empty((len(starts), 2), dtype=np.uint8)
+        np.minimum(first, second, out=alleles[:, 0])
+        np.maximum(first, second, out=alleles[:, 1])
+
+        codes = ALLELE_CODES[alleles]
+        other = (codes == ALLELE_OTHER).any(axis=1)
+        self.missing = ((alleles[:, 0] == alleles[:, 1]) &
+                        ((alleles[:, 0] == ord('-')) |
+                         (alleles[:, 0] == ord('_'))))
+        self.others = dict(
+            (int(row), alleles[row].tobytes().decode('ascii'))
+            for row in np.flatnonzero(other))
+        codes[other] = 0
+        self.packed = _pack_alleles(codes.ravel())
+
+    def __len__(self):
+        return len(self.positions)
+
+    def find(self, rsid):
+        if self._rows is not None:
+            return self._rows.get(rsid, -1)
+        return self._index.find(rsid)
+
+    def find_all(self, rsids):
+        if self._rows is not None:
+            return np.array([self._rows.get(rsid, -1) for rsid in rsids],
+                            dtype=np.intp)
+        if self._sorted_rsids is None:
+            self._sorted_rsids = np.array(self._index.keys(), dtype=bytes)
+        keys = np.array([rsid.encode('ascii') for rsid in rsids],
+                        dtype=self._sorted_rsids.dtype)
+        rows = np.searchsorted(self._sorted_rsids, keys)
+        rows[rows == len(self._sorted_rsids)] = 0
+        rows[self._sorted_rsids[rows] != keys] = -1
+        return rows
+
+    def rsids(self):
+        if self._rsids is not None:
+            return self._rsids
+        return self._index.keys()
+
+    def allele_codes(self, rows=None):
+        if rows is None:
+            return _unpack_alleles(self.packed, len(self) * 2).reshape(-1, 2)
+        # Only the bytes holding these rows, two genotypes per byte
+        rows = np.asarray(rows, dtype=np.intp)
+        shifts = ((rows % 2) * 4).astype(np.uint8)
+        packed = self.packed[rows // 2]
+        codes = np.empty((len(rows), 2), dtype=np.uint8)
+        codes[:, 0] = (packed >> shifts) & 3
+        codes[:, 1] = (packed >> (shifts + 2)) & 3
+        return codes
+
+    def genotype(self, row):
+        if row in self.others:
+            return self.others[row]
+        byte_pos, shift = divmod(row * 2, 4)
+        byte = int(self.packed[byte_pos]) >> (shift * 2)
+        return ALLELES[byte & 3] + ALLELES[(byte >> 2) & 3]
+
+    def genotypes(self):
+        genotypes = ALLELE_PAIRS[self.allele_codes().dot([4, 1])]
+        for row, genotype in self.others.items():
+            genotypes[row] = genotype
+        return genotypes
+
+    def __getitem__(self, rsid):
+        row = self.find(rsid)
+        if row < 0:
+            raise KeyError(rsid)
+        return {
+            'genotype': self.genotype(row),
+            'chromosome': self.chromosome_names[self.chromosomes[row]],
+            'position': GenomeIndex._position_str(int(self.positions[row]))
+        }
+
+    def __contains__(self, rsid):
+        return self.find(rsid) >= 0
+
+    def query_region(self, chromosome, start, end):
+        if self._index is not None:
+            return self._index.query_region(chromosome, start, end)
+        chromosome = str(chromosome)
+        if chromosome not in self.chromosome_names:
+            return []
+        rows = np.flatnonzero(
+            (self.chromosomes == self.chromosome_names.index(chromosome)) &
+            (self.positions >= start) & (self.positions <= end))
+        rows = rows[np.argsort(self.positions[rows], kind='stable')]
+        return [self._rsids[row] for row in rows]
+
+    def to_dict(self):
+        genome_dict = {}
+        chromosome_names = self.chromosome_names
+        for rsid, genotype, chromosome, position in zip(
+                self.rsids(), self.genotypes().tolist(),
+                self.chromosomes.tolist(), self.positions.tolist()):
+            genome_dict[rsid] = {
+                'genotype': genotype,
+                'chromosome': chromosome_names[chromosome],
+                'position': GenomeIndex._position_str(position)
+            }
+        return genome_dict
+
+
+def _pack_alleles(codes):
+    padded = np.zeros((len(codes) + 3) // 4 * 4, dtype=np.uint8)
+    padded[:len(codes)] = codes
+    padded = padded.reshape(-1, 4)
+    return (padded[:, 0] | (padded[:, 1] << 2) |
+            (padded[:, 2] << 4) | (padded[:, 3] << 6)).astype(np.uint8)
+
+
+def _unpack_alleles(packed, count):
+    shifts = np.array([0, 2, 4, 6], dtype=np.uint8)
+    return ((packed[:, None] >> shifts) & 3).ravel()[:count]
+
+
+# Opt-in timings of the genome parsing, see _Trace
+TRACE_ENV = 'WEGENE_UTILS_TRACE'
+TRACE_PREFIX = 'WEGENE_UTILS_TRACE '
+_trace_target = os.environ.get(TRACE_ENV)
+
+
+'''
+Phase timings and counters of one call, recorded when WEGENE_UTILS_TRACE
+is set. The record is written as a JSON line to stderr, prefixed with
+TRACE_PREFIX, when the variable is "1" or "stderr" and appended to the file
+it names otherwise
+'''
+
+
+class _Trace(object):
+
+    enabled = True
+
+    def __init__(self, function):
+        self.function = function
+        self.phases = {}
+        self.counters = {}
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self._last
+        self._last = now
+
+    def count(self, counter, value):
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def emit(self):
+        record = json.dumps({
+            'function': self.function,
+            'pid': os.getpid(),
+            'phases': dict((phase, round(seconds, 6))
+                           for phase, seconds in self.phases.items()),
+            'counters': self.counters
+        })
+        if _trace_target in ('1', 'stderr'):
+            sys.stderr.write(TRACE_PREFIX + record + '\n')
+        else:
+            with open(_trace_target, 'a') as trace_f:
+                trace_f.write(record + '\n')
+
+
+class _NoTrace(object):
+
+    enabled = False
+
+    def mark(self, phase):
+        pass
+
+    def count(self, counter, value):
+        pass
+
+    def emit(self):
+        pass
+
+
+_NO_TRACE = _NoTrace()
+
+
+def _start_trace(function):
+    if _trace_target:
+        return _Trace(function)
+    return _NO_TRACE
+
+
+def _parse_genome_string(genome_str, genome_format, trace):
+    entries = _iter_index_entries(genome_format)
+    if trace.enabled:
+        # Read the whole index first so that both phases can be told apart
+        entries = list(entries)
+        trace.mark('index_load')
+    genome_dict = {}
+    for index_pos, rsid, chromosome, position in entries:
+        start_pos = index_pos * 2
+        genome_dict[rsid] = {
+            'genotype': sort_genotype(
+                            genome_str[start_pos:start_pos+2]),
+            'chromosome': chromosome,
+            'position': position
+        }
+    trace.mark('dict_build')
+    if trace.enabled:
+        trace.count('snps', len(genome_dict))
+        trace.count('missing', sum(1 for snp in genome_dict.values()
+                                   if snp['genotype'] in ('--', '__')))
+    return genome_dict
+
+
 '''
 Reads the genome string anmd format and parse into a dict of
     {'rs1234': {'genotype': 'AA', 'chromosome': '1', position: '123456'}, ...}
@@ -20,24 +789,9 @@ Reads the genome string anmd format and parse into a dict of
 
 def parse_genome_string(genome_str, genome_format):
     try:
-        genome_dict = {}
-        # Index files for all posible formats will be provided automatically
-        # Do not change the default path below if you wish to use those
-        with open('./indexes/index_' + genome_format + '.idx', 'r') as idx_f:
-            for line in idx_f:
-                if not line.startswith('NA'):
-                    fields = line.strip().split('\t')
-                    index_pos = fields[0]
-                    rsid = fields[1]
-                    chromosome = fields[2]
-                    position = fields[3]
-                    start_pos = int(index_pos) * 2
-                    genome_dict[rsid] = {
-                        'genotype': sort_genotype(
-                                        genome_str[start_pos:start_pos+2]),
-                        'chromosome': chromosome,
-                        'position': position
-                    }
+        trace = _start_trace('parse_genome_string')
+        genome_dict = _parse_genome_string(genome_str, genome_format, trace)
+        trace.emit()
         return genome_dict
     except Exception as e:
         sys.stderr.write('Error on file {} line {} '.format(
@@ -46,12 +800,28 @@ def parse_genome_string(genome_str, genome_format):
                          + str(e))
 
 
-def process_raw_genome_data(raw_inputs):
+def process_raw_genome_data(raw_inputs, lazy=False, packed=False):
     try:
-        genome = str(gzip.GzipFile(fileobj=BytesIO(
-                    base64.b64decode(raw_inputs['data']))).read())
+        trace = _start_trace('process_raw_genome_data')
+        raw = base64.b64decode(raw_inputs['data'])
+        trace.mark('decode')
+        genome = gzip.GzipFile(fileobj=BytesIO(raw)).read()
+        # The compressed genome is not needed once it is decompressed
+        del raw
+        genome = genome.decode('ascii')
+        trace.mark('decompress')
+        trace.count('genome_bytes', len(genome))
         genome_format = raw_inputs['format']
-        return parse_genome_string(genome, genome_format)
+        if packed:
+            genome = PackedGenome(genome, genome_format)
+            trace.mark('index_load')
+        elif lazy:
+            genome = LazyGenome(genome, genome_format)
+            trace.mark('index_load')
+        else:
+            genome = _parse_genome_string(genome, genome_format, trace)
+        trace.emit()
+        return genome
     except Exception as e:
         sys.stderr.write('Error on file {} line {} '.format(
                             sys.exc_info()[-1].tb_frame.f_code.co_filename,
@@ -59,6 +829,252 @@ def process_raw_genome_data(raw_inputs):
                          + str(e))
 
 
+def _unescape_base64(chunk):
+    # Escapes of characters outside of the base64 alphabet, such as line
+    # breaks, are dropped as base64.b64decode ignores them after json.loads
+    def unescape(match):
+        escaped = match.group(1)
+        if escaped == b'/':
+            return escaped
+        if len(escaped) == 5 and int(escaped[1:], 16) in BASE64_CHARS:
+            return bytes(bytearray([int(escaped[1:], 16)]))
+        return b''
+    return JSON_ESCAPE.sub(unescape, chunk)
+
+
+def _split_escape(raw):
+    # Offset of an escape left incomplete at the end of raw, or len(raw)
+    cut = raw.rfind(b'\\', max(0, len(raw) - 6))
+    if cut < 0:
+        return len(raw)
+    backslashes = cut + 1 - len(raw[:cut + 1].rstrip(b'\\'))
+    if not backslashes % 2:
+        # The last backslash is itself escaped
+        return len(raw)
+    if cut + 1 == len(raw) or \
+            (raw[cut + 1:cut + 2] == b'u' and len(raw) - cut < 6):
+        return cut
+    return len(raw)
+
+
+def _gzip_size(b64_data):
+    # ISIZE, the last 4 bytes of a gzip member, is the uncompressed size
+    tail = bytearray(_unescape_base64(bytes(b64_data[-GZIP_TAIL_SIZE:])))
+    tail = bytes(bytearray(c for c in tail if c in BASE64_CHARS))[-12:]
+    return struct.unpack('<I', base64.b64decode(tail)[-4:])[0]
+
+
+def _decode_genome_data(b64_data):
+    genome = bytearray(_gzip_size(b64_data))
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    filled = 0
+    pending = b''
+    escape = b''
+    for start in range(0, len(b64_data), DECODE_CHUNK_SIZE):
+        raw = escape + bytes(b64_data[start:start + DECODE_CHUNK_SIZE])
+        escape = b''
+        cut = _split_escape(raw)
+        # An escape split between two chunks is decoded with the next one
+        raw, escape = raw[:cut], raw[cut:]
+        chunk = pending + _unescape_base64(raw)
+        usable = len(chunk) - len(chunk) % 4
+        pending = chunk[usable:]
+        block = decompressor.decompress(base64.b64decode(chunk[:usable]))
+        genome[filled:filled + len(block)] = block
+        filled += len(block)
+    block = decompressor.flush()
+    genome[filled:filled + len(block)] = block
+    filled += len(block)
+    del genome[filled:]
+    return genome
+
+
+def _find_inputs_data(body):
+    # Span of the inputs.data string of a request body. Only the tokens are
+    # followed, nested objects and strings that mention "data" are skipped
+    containers = []
+    for token in JSON_TOKEN.finditer(body):
+        start, end = token.span()
+        char = body[start:start + 1]
+        if char == b'"':
+            if containers and containers[-1][0] and \
+                    containers[-1][1] is None:
+                containers[-1][1] = body[start:end]
+            elif len(containers) == 2 and containers[0][0] and \
+                    containers[1][0] and \
+                    containers[0][1] == b'"inputs"' and \
+                    containers[1][1] == b'"data"':
+                return start + 1, end - 1
+        elif char in (b'{', b'['):
+            containers.append([char == b'{', None])
+        elif char in (b'}', b']'):
+            if not containers:
+                return None
+            containers.pop()
+        elif containers and containers[-1][0]:
+            # A comma, the next string of the object is a key
+            containers[-1][1] = None
+    return None
+
+
+'''
+Reads the request body from stdin and returns (inputs, user_genome). The
+whole genome data is located in the raw bytes and decoded chunk by chunk
+into a single buffer instead of going through json.loads, base64 decoding
+and gzip separately. user_genome is None if the inputs have no data field,
+otherwise it is parsed as process_raw_genome_data would
+'''
+
+
+def read_genome_inputs(stream=None, lazy=False, packed=False):
+    if stream is None:
+        stream = getattr(sys.stdin, 'buffer', sys.stdin)
+    body = stream.read()
+    if not isinstance(body, bytes):
+        body = body.encode('utf-8')
+    span = _find_inputs_data(body)
+    if span is None:
+        return json.loads(body.decode('utf-8'))['inputs'], None
+    data_start, data_end = span
+    inputs = json.loads((body[:data_start] + body[data_end:])
+                        .decode('utf-8'))['inputs']
+    del inputs['data']
+    genome = _decode_genome_data(memoryview(body)[data_start:data_end])
+    del body
+    genome_format = inputs['format']
+    if packed:
+        return inputs, PackedGenome(genome, genome_format)
+    if lazy:
+        return inputs, LazyGenome(genome, genome_format)
+    genome_str = genome.decode('ascii')
+    del genome
+    return inputs, parse_genome_string(genome_str, genome_format)
+
+
+'''
+Batch lookup of a panel of rsids. Returns (genotypes, missing) where
+genotypes is an array of allele sorted genotypes aligned with rsids and
+missing marks rsids that are absent or '--' / '__', like is_genotype_exist,
+and values that are not two alleles long.
+genome can be a PackedGenome, the dict from parse_genome_string, a
+LazyGenome or the inputs of a partial genome
+'''
+
+
+def get_genotypes(genome, rsids):
+    if np is None:
+        raise ImportError('get_genotypes requires numpy')
+    alleles, missing = _genotype_alleles(genome, rsids)
+    return alleles.view('S2').ravel().astype('U2'), missing
+
+
+def _genotype_alleles(genome, rsids, rows=None):
+    if isinstance(genome, PackedGenome):
+        if rows is None:
+            rows = genome.find_all(rsids)
+        found = rows >= 0
+        codes = genome.allele_codes(rows[found])
+        alleles = np.full((len(rows), 2), ord('-'), dtype=np.uint8)
+        alleles[found] = ALLELE_BYTES[codes]
+        other_rows = np.fromiter(genome.others, dtype=np.intp,
+                                 count=len(genome.others))
+        for i in np.flatnonzero(np.isin(rows, other_rows)):
+            genotype = genome.others[int(rows[i])]
+            alleles[i] = bytearray(genotype.encode('ascii'))
+    else:
+        values = []
+        for rsid in rsids:
+            value = genome.get(rsid, '--')
+            if isinstance(value, dict):
+                value = value['genotype']
+            if len(value) != 2:
+                # Not a genotype of two alleles, e.g. 'I' or 'DI-'
+                value = '--'
+            values.append(value)
+        alleles = np.array(values, dtype='S2').view(np.uint8).reshape(-1, 2)
+        alleles.sort(axis=1)
+    missing = ((alleles[:, 0] == alleles[:, 1]) &
+               ((alleles[:, 0] == ord('-')) | (alleles[:, 0] == ord('_'))))
+    return alleles, missing
+
+
+'''
+Polygenic score over a weights table of (rsid, effect allele, weight). The
+table is either a list of tuples or a tab separated file with one variant
+per line. Weights are loaded once into arrays and can be applied to any
+number of genomes:
+    prs = PolygenicScore('weights.tsv')
+    result = prs.score(user_genome)
+    {'score': 0.42, 'variants': 1000, 'used': 987, 'missing': 13,
+     'coverage': 0.987}
+SNPs missing from a genome contribute nothing to the score
+'''
+
+
+class PolygenicScore(object):
+
+    def __init__(self, weights):
+        if np is None:
+            raise ImportError('PolygenicScore requires numpy')
+        if isinstance(weights, str):
+            weights = self._read_weights(weights)
+        self.rsids = []
+        effect_alleles = []
+        values = []
+        for rsid, effect_allele, weight in weights:
+            # Genotypes hold one character per allele, such as 'D' or 'I'
+            # for indels, a longer effect allele could never be counted
+            if len(effect_allele) != 1:
+                raise ValueError('Effect allele {!r} of {} is not a single '
+                                 'allele'.format(effect_allele, rsid))
+            self.rsids.append(rsid)
+            effect_alleles.append(effect_allele.upper())
+            values.append(float(weight))
+        self.effect_alleles = np.array(effect_alleles, dtype='S1') \
+            .view(np.uint8)
+        self.weights = np.array(values, dtype=np.float64)
+        self._rows = {}
+
+    @staticmethod
+    def _read_weights(weights_path):
+        weights = []
+        with open(weights_path, 'r') as weights_f:
+            for line in weights_f:
+                fields = line.split()
+                if len(fields) < 3 or line.startswith('#'):
+                    continue
+                try:
+                    weights.append((fields[0], fields[1], float(fields[2])))
+                except ValueError:
+                    # Header line
+                    continue
+        return weights
+
+    def dosages(self, genome):
+        rows = None
+        if isinstance(genome, PackedGenome):
+            key = (genome.genome_format, genome._index is not None)
+            rows = self._rows.get(key)
+            if rows is None:
+                rows = self._rows[key] = genome.find_all(self.rsids)
+        alleles, missing = _genotype_alleles(genome, self.rsids, rows)
+        dosages = (alleles == self.effect_alleles[:, None]).sum(axis=1)
+        dosages[missing] = 0
+        return dosages, missing
+
+    def score(self, genome):
+        dosages, missing = self.dosages(genome)
+        variants = len(self.rsids)
+        used = variants - int(missing.sum())
+        return {
+            'score': float(dosages.dot(self.weights)),
+            'variants': variants,
+            'used': used,
+            'missing': variants - used,
+            'coverage': float(used) / variants if variants else 0.0
+        }
+
+
 def is_genotype_exist(input, rsid):
     return rsid in input and input[rsid] != '--' and input[rsid] != '__'
 
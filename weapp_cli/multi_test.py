@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from weapp_cli import runner
+from weapp_cli.cache import file_digest
+from weapp_cli.watch import IGNORED_DIRS
+
+META_FILE = '.weapp'
+# Folders of a project that never hold another project
+PROJECT_DIRS = {'data', 'indexes', 'extended_data', 'lib'}
+
+
+'''
+Lists the folders under root holding a .weapp file, sorted. The folders a
+watcher ignores are pruned and the data folders of a project are not
+searched
+'''
+
+
+def find_projects(root):
+    projects = []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+        is_project = any(entry.name == META_FILE and entry.is_file()
+                         for entry in entries)
+        if is_project:
+            projects.append(path)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and \
+                    entry.name not in IGNORED_DIRS and \
+                    not (is_project and entry.name in PROJECT_DIRS):
+                stack.append(entry.path)
+    return sorted(projects)
+
+
+class _Digests(object):
+    # Hardlinked and unchanged files are only read once
+
+    def __init__(self):
+        self._known = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        file_stat = os.stat(path)
+        key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size,
+               file_stat.st_mtime_ns)
+        with self._lock:
+            if key in self._known:
+                return self._known[key]
+        digest = file_digest(path)
+        with self._lock:
+            self._known[key] = digest
+        return digest
+
+
+def _index_digests(project_path, meta, digests):
+    # Compiled indexes follow from the text index and wegene_utils.py
+    assets = meta.get('assets') or {}
+    if assets.get('indexes') is not None:
+        # Recorded by init when the indexes come from the asset store
+        return sorted((rel_path, digest) for rel_path, digest
+                      in assets['indexes'].items()
+                      if rel_path.endswith('.idx'))
+    index_path = os.path.join(project_path, 'indexes')
+    if not os.path.isdir(index_path):
+        return []
+    return [(filename, digests.get(os.path.join(index_path, filename)))
+            for filename in sorted(os.listdir(index_path))
+            if filename.endswith('.idx')]
+
+
+'''
+Reads the .weapp of every project and groups the projects that run under
+the same interpreter with the same indexes and, for Python apps, the same
+wegene_utils.py. Returns a list of groups, each a dict with its command
+and its projects, a dict per project with its path, language, markdown
+flag and any error found while reading it
+'''
+
+
+def group_projects(projects, sys_name, jobs=1):
+    digests = _Digests()
+
+    def describe(project_path):
+        project = {'path': project_path, 'error': None, 'language': None}
+        try:
+            with open(os.path.join(project_path, META_FILE)) as meta_f:
+                meta = json.load(meta_f)
+            project['language'] = meta['language']
+            project['markdown'] = meta.get('markdown')
+            command = runner.app_command(meta['language'], sys_name)
+            key = [command, _index_digests(project_path, meta, digests)]
+            utils_path = os.path.join(project_path, 'wegene_utils.py')
+            if meta['language'] != 'r' and os.path.isfile(utils_path):
+                key.append(digests.get(utils_path))
+        except (IOError, OSError, ValueError, KeyError) as e:
+            project['error'] = 'Invalid project: {}'.format(e)
+            return project, None, None
+        return project, command, json.dumps(key)
+
+    groups = {}
+    invalid = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for project, command, key in executor.map(describe, projects):
+            if key is None:
+                invalid.append(project)
+                continue
+            if key not in groups:
+                groups[key] = {'command': command, 'projects': []}
+            groups[key]['projects'].append(project)
+    ordered = sorted(groups.values(),
+                     key=lambda group: group['projects'][0]['path'])
+    if invalid:
+        ordered.append({'command': None, 'projects': invalid})
+    return ordered
+
+
+class _GroupWorkers(object):
+    # Warm workers of a group, started from its first project and closed
+    # once every project of the group has run
+
+    def __init__(self, group, limits):
+        self._command = group['command']
+        self._cwd = group['projects'][0]['path']
+        self._limits = limits
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._remaining = len(group['projects'])
+        self._workers = []
+
+    def run(self, stdin_path, cwd):
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            worker = runner.WarmWorker(self._command, cwd=self._cwd,
+                                       **self._limits)
+            with self._lock:
+                self._workers.append(worker)
+        try:
+            return worker.run(stdin_path, cwd=cwd)
+        finally:
+            self._idle.put(worker)
+
+    def finish(self):
+        # Called once per project of the group, run or not
+        with self._lock:
+            self._remaining -= 1
+            done = not self._remaining
+        if done:
+            self.close()
+
+    def close(self):
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+
+'''
+Tests every project of groups, see group_projects, with data/data.json and
+up to jobs apps at a time. Projects are queued group by group, with warm
+the Python projects of a group share warm workers that keep its
+wegene_utils and indexes loaded. With use_cache results are reused from
+the .weapp-cache of a project as weapp-cli test does. progress(outcome)
+is called as projects finish and the outcomes, dicts with the
+project, its group number, the RunResult or an error and whether the
+result was cached, are returned in the order of groups
+'''
+
+
+def run_projects(groups, jobs=1, warm=False, use_cache=True, progress=None,
+                 **limits):
+    if use_cache:
+        from weapp_cli.result_cache import ResultCache
+
+    tasks = []
+    group_workers = []
+    for number, group in enumerate(groups, 1):
+        workers = None
+        if warm and group['command'] is not None and \
+                group['projects'][0]['language'] != 'r':
+            workers = _GroupWorkers(group, limits)
+            group_workers.append(workers)
+        for project in group['projects']:
+            tasks.append((number, group['command'], project, workers))
+
+    def run_one(number, command, project, workers):
+        outcome = {'project': project, 'group': number, 'result': None,
+                   'cached': False, 'error': project['error'],
+                   'elapsed': 0.0}
+        if outcome['error'] is not None:
+            return outcome
+        start = time.time()
+        try:
+            stdin_path = os.path.join(project['path'], 'data', 'data.json')
+            if not os.path.isfile(stdin_path):
+                raise IOError('No test data, run weapp-cli init or copy '
+                              'data/data.json into the project')
+            key = None
+            result_cache = None
+            if use_cache:
+                result_cache = ResultCache(project['path'])
+                key = result_cache.key(command, project['language'],
+                                       stdin_path, limits)
+                outcome['result'] = result_cache.get(key)
+                outcome['cached'] = outcome['result'] is not None
+            if outcome['result'] is None:
+                if workers is not None:
+                    outcome['result'] = workers.run(stdin_path,
+                                                    project['path'])
+                else:
+                    outcome['result'] = runner.run_app(
+                        command, stdin_path, cwd=project['path'], **limits)
+                if result_cache is not None:
+                    result_cache.put(key, outcome['result'])
+        except Exception as e:
+            outcome['error'] = str(e)
+        finally:
+            if workers is not None:
+                workers.finish()
+        outcome['elapsed'] = time.time() - start
+        return outcome
+
+    outcomes = [None] * len(tasks)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            futures = dict((executor.submit(run_one, *task), i)
+                           for i, task in enumerate(tasks))
+            for future in as_completed(futures):
+                outcome = future.result()
+                outcomes[futures[future]] = outcome
+                if progress is not None:
+                    progress(outcome)
+    finally:
+        for workers in group_workers:
+            workers.close()
+    return outcomes
+
+
+def status(outcome):
+    result = outcome['result']
+    if outcome['error'] is not None:
+        return 'error'
+    if result.timed_out:
+        return 'timeout'
+    if result.returncode != 0:
+        return 'fail'
+    return 'pass'
+
+
+def log_name(root, project_path):
+    rel_path = os.path.relpath(project_path, root)
+    if rel_path == '.':
+        rel_path = os.path.basename(os.path.abspath(root))
+    return rel_path.replace(os.sep, '__') + '.log'
+
+
+'''
+Writes the outputs, errors and the reason of a failure of a project to
+its log file, decoded with console_codec
+'''
+
+
+def write_log(path, outcome, console_codec, limits):
+    result = outcome['result']
+    with open(path, 'w', encoding='utf-8') as log_f:
+        log_f.write('Project: {}\n'.format(outcome['project']['path']))
+        log_f.write('Status: {}{}\n'.format(
+            status(outcome), ' (cached)' if outcome['cached'] else ''))
+        if outcome['error'] is not None:
+            log_f.write('\n{}\n'.format(outcome['error']))
+            return
+        log_f.write('Duration: {:.3f}s\n'.format(result.duration))
+        failure = runner.describe_failure(result, limits['timeout'],
+                                          limits['cpu_limit'])
+        if failure:
+            log_f.write('\n{}\n'.format(failure))
+        log_f.write('\nWeApp Outputs:\n{}\n'.format(
+            result.stdout.decode(console_codec, 'replace')))
+        log_f.write('\nWeApp Errors:\n{}\n'.format(
+            result.stderr.decode(console_codec, 'replace')))
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import sys
+import json
+import stat
+import zlib
+import shutil
+import struct
+import zipfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from weapp_cli.cache import file_digest
+
+# Every entry gets the same timestamp so that equal trees give equal zips
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+MANIFEST_DIR = '.weapp-cache'
+MANIFEST_FILE = 'package.json'
+MANIFEST_VERSION = 1
+READ_SIZE = 1024 * 1024
+# Compressed files larger than this are kept on disk until written
+SPOOL_SIZE = 16 * 1024 * 1024
+LOCAL_HEADER = struct.Struct('<4s5H3I2H')
+FLAG_DATA_DESCRIPTOR = 0x08
+# Compressed data is written as is through ZipFile internals known to work
+# on these versions, elsewhere every file is compressed through open()
+RAW_WRITES = (3, 6) <= sys.version_info[:2] <= (3, 13) and \
+    hasattr(zipfile.ZipFile, '_writecheck') and \
+    hasattr(zipfile.ZipInfo, 'FileHeader')
+IGNORE_FILE = '.weappignore'
+# Ignored in every project, before the rules of .weappignore
+DEFAULT_IGNORE = ['.git/', '.hg/', '.svn/', '__pycache__/', '*.py[cod]',
+                  '.DS_Store']
+
+
+def _translate(pattern):
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+            continue
+        char = pattern[i]
+        if char == '*':
+            regex += '[^/]*'
+        elif char == '?':
+            regex += '[^/]'
+        elif char == '[' and pattern.find(']', i + 2) != -1:
+            end = pattern.find(']', i + 2)
+            chars = pattern[i + 1:end]
+            if chars.startswith('!'):
+                chars = '^' + chars[1:]
+            regex += '[' + chars.replace('\\', '\\\\') + ']'
+            i = end
+        elif char == '\\' and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(char)
+        i += 1
+    return regex
+
+
+'''
+gitignore style rules: "#" comments, "!" to include again, a trailing "/"
+for folders only, patterns with a "/" anchored at the project root and
+"*", "?", "[...]" and "**" wildcards. Every pattern is compiled once and
+the last matching rule decides, like git does
+'''
+
+
+class IgnoreRules(object):
+
+    def __init__(self, lines=()):
+        self._rules = []
+        for line in lines:
+            self.add(line)
+
+    @classmethod
+    def from_file(cls, path, defaults=DEFAULT_IGNORE):
+        rules = cls(defaults)
+        if os.path.isfile(path):
+            with open(path, encoding='utf-8') as ignore_f:
+                for line in ignore_f:
+                    rules.add(line)
+        return rules
+
+    def add(self, line):
+        line = line.rstrip('\r\n')
+        if not line.endswith('\\ '):
+            line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            return
+        negate = line.startswith('!')
+        if negate or line.startswith('\\!') or line.startswith('\\#'):
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return
+        if '/' in line:
+            regex = '^' + _translate(line.lstrip('/')) + '$'
+        else:
+            regex = '^(?:.*/)?' + _translate(line) + '$'
+        self._rules.append((re.compile(regex, re.DOTALL), negate, dir_only))
+
+    def ignored(self, rel_path, is_dir=False):
+        result = False
+        for regex, negate, dir_only in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if result == negate and regex.match(rel_path):
+                result = not negate
+        return result
+
+
+'''
+Lists the files and folders to package under root, as paths relative to
+it, with os.scandir. Ignored folders are pruned before they are read, as
+are the top level local_dirs, which are returned separately. Files named
+in skip_files are left out at any depth
+'''
+
+
+def walk_project(root='.', rules=None, local_dirs=(), skip_files=()):
+    files = []
+    dirs = []
+    skipped = []
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+        for entry in entries:
+            rel_path = rel_dir + '/' + entry.name if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not rel_dir and entry.name in local_dirs:
+                    skipped.append(rel_path)
+                elif rules is None or not rules.ignored(rel_path, True):
+                    dirs.append(rel_path)
+                    stack.append(rel_path)
+            elif entry.is_file() and entry.name not in skip_files and \
+                    (rules is None or not rules.ignored(rel_path)):
+                files.append(rel_path)
+    return sorted(files), sorted(dirs), sorted(skipped)
+
+
+def _file_info(arcname, mode):
+    info = zipfile.ZipInfo(arcname, date_time=FIXED_DATE_TIME)
+    info.create_system = 3
+    perm = 0o755 if mode & stat.S_IXUSR else 0o644
+    info.external_attr = (stat.S_IFREG | perm) << 16
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def _dir_info(arcname):
+    info = zipfile.ZipInfo(arcname.rstrip('/') + '/',
+                           date_time=FIXED_DATE_TIME)
+    info.create_system = 3
+    info.external_attr = ((stat.S_IFDIR | 0o755) << 16) | 0x10
+    return info
+
+
+def _compress(path):
+    # zlib releases the GIL while compressing, threads run in parallel
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED,
+                                  -15)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    crc = 0
+    size = 0
+    with open(path, 'rb') as src:
+        for block in iter(lambda: src.read(READ_SIZE), b''):
+            crc = zlib.crc32(block, crc)
+            size += len(block)
+            spool.write(compressor.compress(block))
+    spool.write(compressor.flush())
+    compress_size = spool.tell()
+    spool.seek(0)
+    return spool, crc, size, compress_size
+
+
+def _open_raw(zip_file, info):
+    # Positions a file object at the compressed data of an entry
+    raw = open(zip_file.filename, 'rb')
+    raw.seek(info.header_offset)
+    fields = LOCAL_HEADER.unpack(raw.read(LOCAL_HEADER.size))
+    raw.seek(info.header_offset + LOCAL_HEADER.size + fields[-2] + fields[-1])
+    return raw
+
+
+def _write_raw(zip_file, info, raw):
+    # What ZipFile.writestr does, with data that is already compressed
+    zip64 = info.file_size > zipfile.ZIP64_LIMIT or \
+        info.compress_size > zipfile.ZIP64_LIMIT
+    zip_file._writecheck(info)
+    zip_file._didModify = True
+    info.header_offset = zip_file.fp.tell()
+    zip_file.fp.write(info.FileHeader(zip64))
+    remaining = info.compress_size
+    while remaining:
+        block = raw.read(min(READ_SIZE, remaining))
+        if not block:
+            raise IOError('Truncated entry ' + info.filename)
+        zip_file.fp.write(block)
+        remaining -= len(block)
+    zip_file.filelist.append(info)
+    zip_file.NameToInfo[info.filename] = info
+    zip_file.start_dir = zip_file.fp.tell()
+
+
+def _write_file(zip_file, info, path):
+    # Public API fallback of _write_raw, used when RAW_WRITES is false
+    info.file_size = os.path.getsize(path)
+    with open(path, 'rb') as src, zip_file.open(info, 'w') as dest:
+        shutil.copyfileobj(src, dest, READ_SIZE)
+
+
+def _load_manifest(manifest_path, archive_name):
+    try:
+        with open(manifest_path) as manifest_f:
+            manifest = json.load(manifest_f)
+    except (IOError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION or \
+            manifest.get('archive') != archive_name:
+        return {}
+    return manifest
+
+
+def _archive_stamp(archive_name):
+    archive_stat = os.stat(archive_name)
+    return [archive_stat.st_size, archive_stat.st_mtime_ns]
+
+
+'''
+Writes the files and folders (paths relative to the project) to the zip
+archive_name. Entries are sorted and carry a fixed timestamp and
+normalised permissions, so the same tree always gives the same archive.
+The digest of every file is kept in .weapp-cache/package.json: files
+unchanged since the previous archive are copied from it still compressed,
+the others are compressed by up to jobs threads. Without RAW_WRITES every
+file is compressed again, one at a time. Returns the number of reused and
+compressed files
+'''
+
+
+def build_package(archive_name, files, dirs=(), jobs=None, progress=None):
+    manifest_path = os.path.join(MANIFEST_DIR, MANIFEST_FILE)
+    manifest = _load_manifest(manifest_path, archive_name)
+    known = manifest.get('files', {})
+    previous = None
+    if known and os.path.isfile(archive_name) and \
+            manifest.get('stamp') == _archive_stamp(archive_name):
+        try:
+            previous = zipfile.ZipFile(archive_name)
+        except zipfile.BadZipFile:
+            previous = None
+
+    digests = {}
+    reuse = {}
+    changed = []
+    for path in sorted(files):
+        arcname = path.replace(os.sep, '/')
+        file_stat = os.stat(path)
+        entry = known.get(arcname)
+        if entry is None or \
+                entry[:2] != [file_stat.st_mtime_ns, file_stat.st_size]:
+            entry = [file_stat.st_mtime_ns, file_stat.st_size,
+                     file_digest(path)]
+        digests[arcname] = entry
+        old_info = None
+        if previous is not None and arcname in known and \
+                known[arcname][2] == entry[2]:
+            try:
+                old_info = previous.getinfo(arcname)
+            except KeyError:
+                pass
+        if RAW_WRITES and old_info is not None and \
+                old_info.compress_type == zipfile.ZIP_DEFLATED and \
+                not old_info.flag_bits & FLAG_DATA_DESCRIPTOR:
+            reuse[arcname] = old_info
+        else:
+            changed.append(path)
+
+    entries = sorted([(path.replace(os.sep, '/'), path) for path in files] +
+                     [(path.replace(os.sep, '/').rstrip('/') + '/', None)
+                      for path in dirs])
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    # Files are compressed ahead of the writer by at most a few per thread
+    # to bound the memory held by compressed data waiting to be written
+    changed = iter(sorted(changed, key=lambda path: path.replace(os.sep,
+                                                                 '/')))
+    compressed = {}
+
+    def compress_next():
+        path = next(changed, None) if RAW_WRITES else None
+        if path is not None:
+            compressed[path] = executor.submit(_compress, path)
+
+    tmp_path = archive_name + '.tmp'
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        for _ in range(jobs * 2):
+            compress_next()
+        with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for arcname, path in entries:
+                if path is None:
+                    zipf.writestr(_dir_info(arcname), b'')
+                    continue
+                info = _file_info(arcname, os.stat(path).st_mode)
+                if not RAW_WRITES:
+                    _write_file(zipf, info, path)
+                elif arcname in reuse:
+                    old_info = reuse[arcname]
+                    info.CRC = old_info.CRC
+                    info.file_size = old_info.file_size
+                    info.compress_size = old_info.compress_size
+                    with _open_raw(previous, old_info) as raw:
+                        _write_raw(zipf, info, raw)
+                else:
+                    spool, info.CRC, info.file_size, info.compress_size = \
+                        compressed.pop(path).result()
+                    compress_next()
+                    with spool:
+                        _write_raw(zipf, info, spool)
+                if progress is not None:
+                    progress(1)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        if previous is not None:
+            previous.close()
+    os.replace(tmp_path, archive_name)
+
+    if not os.path.isdir(MANIFEST_DIR):
+        os.makedirs(MANIFEST_DIR)
+    with open(manifest_path + '.tmp', 'w') as manifest_f:
+        json.dump({'version': MANIFEST_VERSION, 'archive': archive_name,
+                   'stamp': _archive_stamp(archive_name),
+                   'files': digests}, manifest_f)
+    os.replace(manifest_path + '.tmp', manifest_path)
+    return len(reuse), len(files) - len(reuse)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import base64
+import hashlib
+import subprocess
+
+from weapp_cli.cache import file_digest
+from weapp_cli.runner import RunResult
+from weapp_cli.watch import is_ignored, _walk_dirs
+
+CACHE_DIR = '.weapp-cache'
+# Digests of the source files keyed by path, reused while mtime and size
+# stay the same
+SOURCES_FILE = 'sources.json'
+CACHE_VERSION = 1
+
+_versions = {}
+
+
+def interpreter_version(command):
+    if command[0] not in _versions:
+        try:
+            # Rscript prints its version to stderr
+            output = subprocess.run([command[0], '--version'],
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT,
+                                    timeout=30).stdout
+            _versions[command[0]] = output.decode('utf-8', 'replace').strip()
+        except (OSError, subprocess.TimeoutExpired):
+            _versions[command[0]] = None
+    return _versions[command[0]]
+
+
+def _source_files(root):
+    paths = []
+    for path in _walk_dirs(root):
+        rel_dir = os.path.relpath(path, root)
+        if rel_dir.split(os.sep)[0] in (CACHE_DIR, 'data'):
+            continue
+        for entry in os.scandir(path):
+            rel_path = os.path.relpath(entry.path, root)
+            if entry.is_file() and not is_ignored(rel_path):
+                paths.append(rel_path)
+    return sorted(paths)
+
+
+'''
+Results of weapp-cli test kept in .weapp-cache of a project. A result is
+stored under a key made of the digest of every source file of the project
+(anything but data/, the test outputs and ignored folders), the input, the
+interpreter version, the language and the limits of the run, so it is
+only reused when none of them changed
+'''
+
+
+class ResultCache(object):
+
+    def __init__(self, root='.'):
+        self.root = root
+        self.path = os.path.join(root, CACHE_DIR)
+        self._sources = None
+
+    def _load_source_digests(self):
+        try:
+            with open(os.path.join(self.path, SOURCES_FILE)) as sources_f:
+                return json.load(sources_f)
+        except (IOError, ValueError):
+            return {}
+
+    def sources_digest(self):
+        if self._sources is not None:
+            return self._sources
+        known = self._load_source_digests()
+        digests = {}
+        combined = hashlib.sha1()
+        for rel_path in _source_files(self.root):
+            stat = os.stat(os.path.join(self.root, rel_path))
+            entry = known.get(rel_path)
+            if entry is None or entry[:2] != [stat.st_mtime_ns, stat.st_size]:
+                entry = [stat.st_mtime_ns, stat.st_size,
+                         file_digest(os.path.join(self.root, rel_path))]
+            digests[rel_path] = entry
+            combined.update(rel_path.encode('utf-8') + b'\0' +
+                            entry[2].encode('ascii') + b'\0')
+        if digests != known:
+            self._write(SOURCES_FILE, digests)
+        self._sources = combined.hexdigest()
+        return self._sources
+
+    def key(self, command, language, stdin_path, limits):
+        return hashlib.sha1(json.dumps([
+            CACHE_VERSION, self.sources_digest(), file_digest(stdin_path),
+            language, command, interpreter_version(command),
+            sorted(limits.items())
+        ]).encode('utf-8')).hexdigest()
+
+    def _write(self, name, value):
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        tmp_path = os.path.join(self.path, name + '.tmp')
+        with open(tmp_path, 'w') as cache_f:
+            json.dump(value, cache_f)
+        os.replace(tmp_path, os.path.join(self.path, name))
+
+    def get(self, key):
+        try:
+            with open(os.path.join(self.path, key + '.json')) as cache_f:
+                cached = json.load(cache_f)
+        except (IOError, ValueError):
+            return None
+        return RunResult(cached['returncode'],
+                         base64.b64decode(cached['stdout']),
+                         base64.b64decode(cached['stderr']), False,
+                         cached['duration'], cached['first_output'],
+                         cached['stdin_bytes'], None)
+
+    def put(self, key, result):
+        # Runs cut short by a limit or a signal may pass next time
+        if result.timed_out or result.returncode < 0:
+            return
+        self._write(key + '.json', {
+            'returncode': result.returncode,
+            'stdout': base64.b64encode(result.stdout).decode('ascii'),
+            'stderr': base64.b64encode(result.stderr).decode('ascii'),
+            'duration': result.duration,
+            'first_output': result.first_output,
+            'stdin_bytes': result.stdin_bytes
+        })
@@ -0,0 +1,560 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import math
+import time
+import queue
+import base64
+import signal
+import threading
+import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, limits other than the timeout are skipped
+    resource = None
+
+# Limits of the production sandbox, 0 disables a limit
+DEFAULT_TIMEOUT = 60
+DEFAULT_MEMORY_LIMIT = 2048
+DEFAULT_CPU_LIMIT = 60
+PIPE_CHUNK_SIZE = 64 * 1024
+# How often a cancellable run checks whether it was cancelled
+CANCEL_POLL = 0.1
+WARM_STARTUP_TIMEOUT = 120
+# Set for the app to make wegene_utils record its phase timings
+TRACE_ENV = 'WEGENE_UTILS_TRACE'
+# Folder where parallel apps share the indexes wegene_utils compiles
+SHARED_INDEX_ENV = 'WEGENE_UTILS_SHARED_INDEXES'
+WARM_WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'warm_worker.py')
+
+RunResult = namedtuple('RunResult', ['returncode', 'stdout', 'stderr',
+                                     'timed_out', 'duration', 'first_output',
+                                     'stdin_bytes', 'usage'])
+
+
+def app_command(language, sys_name):
+    if language == 'r':
+        return ['Rscript', 'main.R']
+    if sys_name == 'Windows':
+        return ['python', 'main.py']
+    if language == 'python27':
+        return ['python2', 'main.py']
+    return ['python3', 'main.py']
+
+
+def _rlimits(memory_limit, cpu_limit):
+    limits = []
+    if memory_limit:
+        # RLIMIT_DATA leaves out the address space numpy and R reserve
+        # without using and the mapped index files
+        limit = memory_limit * 1024 * 1024
+        limits.append((resource.RLIMIT_DATA, (limit, limit)))
+    if cpu_limit:
+        # SIGXCPU at the soft limit, SIGKILL one second later
+        limits.append((resource.RLIMIT_CPU, (cpu_limit, cpu_limit + 1)))
+    return limits
+
+
+# Applies the limits given as its first arguments and execs the rest, used
+# where resource.prlimit is not available (macOS)
+LIMIT_WRAPPER = """
+import os, sys, resource
+memory_limit, cpu_limit = int(sys.argv[1]), int(sys.argv[2])
+if memory_limit:
+    limit = memory_limit * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+if cpu_limit:
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit + 1))
+os.execvp(sys.argv[3], sys.argv[3:])
+"""
+
+
+'''
+Starts command with piped stdin, stdout and stderr. On POSIX systems it
+runs in its own session, so that a timeout also stops the app's children,
+and its limits are set with prlimit right after it started. Nothing runs
+in the child before exec, which is not safe when apps are started from
+several threads
+'''
+
+
+def _spawn(command, cwd, memory_limit, cpu_limit):
+    limits = []
+    if resource is not None:
+        limits = _rlimits(memory_limit, cpu_limit)
+    prlimit = getattr(resource, 'prlimit', None)
+    if limits and prlimit is None:
+        command = [sys.executable, '-c', LIMIT_WRAPPER, str(memory_limit),
+                   str(cpu_limit)] + list(command)
+    process = subprocess.Popen(command, cwd=cwd, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE,
+                               start_new_session=resource is not None)
+    if limits and prlimit is not None:
+        try:
+            for limit, values in limits:
+                prlimit(process.pid, limit, values)
+        except OSError:
+            # The app already exited
+            pass
+    return process
+
+
+def _feed(stream, stdin_path, stats):
+    try:
+        with open(stdin_path, 'rb') as stdin_f:
+            for chunk in iter(lambda: stdin_f.read(PIPE_CHUNK_SIZE), b''):
+                stream.write(chunk)
+                stats['stdin_bytes'] += len(chunk)
+    except (BrokenPipeError, OSError):
+        # The app exited without reading all of its input
+        pass
+    finally:
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+
+def _drain(stream, chunks, stats=None):
+    for chunk in iter(lambda: stream.read1(PIPE_CHUNK_SIZE), b''):
+        if stats is not None and not chunks:
+            stats['first_output'] = time.time()
+        chunks.append(chunk)
+    stream.close()
+
+
+def _wait(process, stats):
+    # wait4 reports the resource usage of this child only
+    _, status, stats['usage'] = os.wait4(process.pid, 0)
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+
+
+def _kill(process):
+    try:
+        if resource is not None:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:
+        pass
+
+
+'''
+Runs command in cwd with the file at stdin_path as its stdin. Input is
+written and both outputs are read by separate threads so that a large
+input or output can not deadlock the pipes. On POSIX systems the app runs
+in its own process group with RLIMIT_DATA (memory_limit in MB) and
+RLIMIT_CPU (cpu_limit in seconds) set, and the whole group is killed once
+timeout seconds of wall time have passed or cancel, a threading.Event, is
+set
+'''
+
+
+def run_app(command, stdin_path, cwd='.', timeout=DEFAULT_TIMEOUT,
+            memory_limit=DEFAULT_MEMORY_LIMIT, cpu_limit=DEFAULT_CPU_LIMIT,
+            cancel=None):
+    start = time.time()
+    process = _spawn(command, cwd, memory_limit, cpu_limit)
+    stdout_chunks = []
+    stderr_chunks = []
+    stats = {'stdin_bytes': 0, 'first_output': None, 'usage': None}
+    threads = [
+        threading.Thread(target=_feed,
+                         args=(process.stdin, stdin_path, stats)),
+        threading.Thread(target=_drain,
+                         args=(process.stdout, stdout_chunks, stats)),
+        threading.Thread(target=_drain, args=(process.stderr, stderr_chunks))
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    if hasattr(os, 'wait4'):
+        waiter = threading.Thread(target=_wait, args=(process, stats))
+        waiter.daemon = True
+        waiter.start()
+        wait = waiter.join
+        running = waiter.is_alive
+    else:
+        def wait(wait_timeout):
+            try:
+                process.wait(timeout=wait_timeout)
+            except subprocess.TimeoutExpired:
+                pass
+
+        def running():
+            return process.poll() is None
+
+    timed_out = False
+    deadline = start + timeout if timeout else None
+    try:
+        while running():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+            if cancel is not None:
+                if cancel.is_set():
+                    break
+                remaining = min(remaining or CANCEL_POLL, CANCEL_POLL)
+            wait(remaining)
+        if running():
+            _kill(process)
+            wait(None)
+        else:
+            timed_out = False
+    except BaseException:
+        _kill(process)
+        process.wait()
+        raise
+    finally:
+        if resource is not None:
+            # Stops leftover children still holding the output pipes
+            _kill(process)
+        for thread in threads:
+            thread.join()
+    end = time.time()
+    first_output = None
+    if stats['first_output'] is not None:
+        first_output = stats['first_output'] - start
+    return RunResult(process.returncode, b''.join(stdout_chunks),
+                     b''.join(stderr_chunks), timed_out, end - start,
+                     first_output, stats['stdin_bytes'], stats['usage'])
+
+
+def _read_responses(stream, responses):
+    for line in iter(stream.readline, b''):
+        responses.put(json.loads(line.decode('utf-8')))
+    # The worker exited
+    responses.put(None)
+    stream.close()
+
+
+'''
+Runs a Python app in a long lived warm_worker.py process instead of a new
+interpreter per run, see warm_worker.py. run takes the same input and
+cancel event as run_app and returns the same RunResult, cwd runs the app
+of another project that has the same wegene_utils.py and indexes. The
+memory limit applies to the worker as a whole and the CPU limit to each
+run. A worker that timed out or died is started again on the next run
+'''
+
+
+class WarmWorker(object):
+
+    def __init__(self, command, cwd='.', timeout=DEFAULT_TIMEOUT,
+                 memory_limit=DEFAULT_MEMORY_LIMIT,
+                 cpu_limit=DEFAULT_CPU_LIMIT):
+        self._command = [command[0], WARM_WORKER]
+        self._cwd = cwd
+        self._timeout = timeout
+        self._memory_limit = memory_limit
+        self._cpu_limit = cpu_limit
+        self._process = None
+
+    def _start(self):
+        # The worker applies the CPU limit itself before every run
+        self._process = _spawn(self._command, self._cwd,
+                               self._memory_limit, 0)
+        self._responses = queue.Queue()
+        self._stderr_chunks = []
+        self._threads = [
+            threading.Thread(target=_read_responses,
+                             args=(self._process.stdout, self._responses)),
+            threading.Thread(target=_drain,
+                             args=(self._process.stderr, self._stderr_chunks))
+        ]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            ready = self._responses.get(timeout=WARM_STARTUP_TIMEOUT)
+        except queue.Empty:
+            ready = None
+        if ready is None:
+            returncode, stderr = self._stop()
+            raise RuntimeError('The warm worker failed to start ({}): {}'
+                               .format(returncode,
+                                       stderr.decode('utf-8', 'replace')))
+
+    def _stop(self):
+        _kill(self._process)
+        self._process.wait()
+        for thread in self._threads:
+            thread.join()
+        returncode = self._process.returncode
+        self._process = None
+        return returncode, b''.join(self._stderr_chunks)
+
+    def _response(self, deadline, cancel):
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise queue.Empty()
+            if cancel is not None:
+                if cancel.is_set():
+                    # Handled like a worker that died, it is restarted
+                    return None
+                remaining = min(remaining or CANCEL_POLL, CANCEL_POLL)
+            try:
+                return self._responses.get(timeout=remaining)
+            except queue.Empty:
+                if cancel is None:
+                    raise
+
+    def run(self, stdin_path, cancel=None, cwd=None):
+        if self._process is None:
+            self._start()
+        request = {'stdin': os.path.abspath(stdin_path),
+                   'cpu_limit': self._cpu_limit}
+        if cwd is not None:
+            # Another project sharing wegene_utils.py and the indexes
+            request['cwd'] = os.path.abspath(cwd)
+        start = time.time()
+        deadline = start + self._timeout if self._timeout else None
+        try:
+            self._process.stdin.write(json.dumps(request).encode('utf-8') +
+                                      b'\n')
+            self._process.stdin.flush()
+            response = self._response(deadline, cancel)
+        except (BrokenPipeError, OSError):
+            response = None
+        except queue.Empty:
+            self._stop()
+            return RunResult(-signal.SIGKILL, b'', b'', True,
+                             time.time() - start, None,
+                             os.path.getsize(stdin_path), None)
+        if response is None:
+            returncode, stderr = self._stop()
+            return RunResult(returncode, b'', stderr, False,
+                             time.time() - start, None,
+                             os.path.getsize(stdin_path), None)
+        return RunResult(response['returncode'],
+                         base64.b64decode(response['stdout']),
+                         base64.b64decode(response['stderr']), False,
+                         response['duration'], None,
+                         response['stdin_bytes'], None)
+
+    def close(self):
+        if self._process is None:
+            return
+        self._process.stdin.close()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        self._stop()
+
+
+def profile(result):
+    report = {
+        'wall_time': round(result.duration, 4),
+        'time_to_first_output': None if result.first_output is None
+        else round(result.first_output, 4),
+        'stdin_bytes': result.stdin_bytes,
+        'stdout_bytes': len(result.stdout),
+        'stderr_bytes': len(result.stderr),
+        'returncode': result.returncode,
+        'timed_out': result.timed_out
+    }
+    usage = result.usage
+    if usage is not None:
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        peak_rss = usage.ru_maxrss
+        if sys.platform != 'darwin':
+            peak_rss *= 1024
+        report.update({
+            'user_time': round(usage.ru_utime, 4),
+            'system_time': round(usage.ru_stime, 4),
+            'peak_rss_bytes': peak_rss,
+            'block_reads': usage.ru_inblock,
+            'block_writes': usage.ru_oublock
+        })
+    return report
+
+
+def format_profile(report):
+    line = 'wall {:.3f}s'.format(report['wall_time'])
+    if 'user_time' in report:
+        line += ', user {:.3f}s, sys {:.3f}s, peak RSS {:.1f} MB'.format(
+            report['user_time'], report['system_time'],
+            report['peak_rss_bytes'] / 1024.0 / 1024.0)
+    if report['time_to_first_output'] is not None:
+        line += ', first output {:.3f}s'.format(
+            report['time_to_first_output'])
+    line += ', stdin {} B, stdout {} B, stderr {} B'.format(
+        report['stdin_bytes'], report['stdout_bytes'],
+        report['stderr_bytes'])
+    return line
+
+
+def _cpu_time(result):
+    if result.usage is None:
+        return 0
+    return result.usage.ru_utime + result.usage.ru_stime
+
+
+def describe_failure(result, timeout, cpu_limit):
+    if result.timed_out:
+        return 'The app was stopped after exceeding the time limit of ' \
+               '{}s'.format(timeout)
+    if resource is not None and cpu_limit and \
+            (result.returncode == -signal.SIGXCPU or
+             result.returncode == -signal.SIGKILL and
+             _cpu_time(result) >= cpu_limit):
+        return 'The app was stopped after exceeding the CPU time limit of ' \
+               '{}s'.format(cpu_limit)
+    if result.returncode < 0:
+        return 'The app was killed by signal {}'.format(-result.returncode)
+    if result.returncode != 0:
+        return 'The app exited with status {}'.format(result.returncode)
+    return None
+
+
+def read_trace(trace_path):
+    records = []
+    with open(trace_path) as trace_f:
+        for line in trace_f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # Cut short by a killed app
+                pass
+    return records
+
+
+'''
+Adds up the records written by wegene_utils when WEGENE_UTILS_TRACE is set
+per function, e.g.
+    {'process_raw_genome_data': {'calls': 1, 'phases': {'decode': 0.01},
+                                 'counters': {'snps': 596148}}}
+'''
+
+
+def summarize_trace(records):
+    summary = {}
+    for record in records:
+        total = summary.setdefault(record['function'], {
+            'calls': 0, 'phases': {}, 'counters': {}})
+        total['calls'] += 1
+        for key in ('phases', 'counters'):
+            for name, value in record[key].items():
+                total[key][name] = total[key].get(name, 0) + value
+    for total in summary.values():
+        total['phases'] = dict((name, round(seconds, 6))
+                               for name, seconds in total['phases'].items())
+    return summary
+
+
+def format_trace(summary):
+    lines = []
+    for function, total in sorted(summary.items()):
+        phases = ', '.join('{} {:.3f}s'.format(name, seconds)
+                           for name, seconds in total['phases'].items())
+        counters = ', '.join('{} {}'.format(name, value) for name, value
+                             in sorted(total['counters'].items()))
+        lines.append('{} x{}: {}'.format(function, total['calls'],
+                                         '; '.join(filter(None, [phases,
+                                                                 counters]))))
+    return lines
+
+
+def percentile(values, fraction):
+    # Nearest rank on already sorted values
+    if not values:
+        return None
+    rank = max(0, min(len(values) - 1,
+                      int(math.ceil(fraction * len(values))) - 1))
+    return values[rank]
+
+
+'''
+Runs command once for every input file with up to jobs apps at a time and
+returns (results, elapsed) where results holds (path, RunResult) pairs in
+input order. Every run is a separate process, a thread per slot is enough
+to keep them busy. With warm every slot keeps its own WarmWorker
+'''
+
+
+def run_corpus(command, stdin_paths, jobs=1, progress=None, warm=False,
+               **limits):
+    workers = None
+    if warm:
+        workers = queue.Queue()
+        for _ in range(max(1, jobs)):
+            workers.put(WarmWorker(command, **limits))
+
+    def run_one(path):
+        if workers is None:
+            return run_app(command, path, **limits)
+        worker = workers.get()
+        try:
+            return worker.run(path)
+        finally:
+            workers.put(worker)
+
+    start = time.time()
+    results = [None] * len(stdin_paths)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            futures = dict((executor.submit(run_one, path), i)
+                           for i, path in enumerate(stdin_paths))
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = (stdin_paths[i], future.result())
+                if progress is not None:
+                    progress(1)
+    finally:
+        while workers is not None and not workers.empty():
+            workers.get().close()
+    return results, time.time() - start
+
+
+'''
+Summarizes the results of run_corpus that took elapsed seconds. The paths
+in cached hold results reused from an earlier run, they count towards the
+failures but not towards the throughput and latencies
+'''
+
+
+def summarize_corpus(results, elapsed, slowest=5, cached=()):
+    cached = set(cached)
+    timed = [(path, result) for path, result in results
+             if path not in cached]
+    durations = sorted(result.duration for _, result in timed)
+    failures = [(path, result) for path, result in results
+                if result.timed_out or result.returncode != 0]
+    ranked = sorted(timed, key=lambda item: item[1].duration, reverse=True)
+    return {
+        'inputs': len(results),
+        'cached': len(results) - len(timed),
+        'failures': len(failures),
+        'timeouts': sum(1 for _, result in failures if result.timed_out),
+        'elapsed': round(elapsed, 4),
+        'throughput': round(len(timed) / elapsed, 4)
+        if timed and elapsed else None,
+        'p50': percentile(durations, 0.50),
+        'p95': percentile(durations, 0.95),
+        'p99': percentile(durations, 0.99),
+        'max': durations[-1] if durations else None,
+        'slowest': [{'input': path, 'duration': round(result.duration, 4)}
+                    for path, result in ranked[:slowest]],
+        'failed': [{'input': path, 'returncode': result.returncode,
+                    'timed_out': result.timed_out}
+                   for path, result in failures]
+    }
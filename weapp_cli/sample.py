@@ -1,165 +1,93 @@
-__all__ = ['data']
-
-data = {
-  "inputs": {
-    "age": 27,
-    "format": "wegene_affy_2",
-    "data": "H4sIAAAAAAAAA2y9W5LsSJJrO6IeREmVSEv\/1\/zHch1YWKaMPDcyY4c\/SHuoQgEYSaf\/+9\/\/\/vf\/\/u+\/fj\/\/\/ve\/\/vW\/\/\/s\/\/5PH\/\/u\/PPu98+\/\/\/vtfv2f\/zZPfz2\/z3\/b\/+7\/\/zd\/fO3m9j\/83W\/H+f\/\/93\/\/+61\/\/\/b1Mi+xjP+npt8\/v7d9Wa5HHvz2zD\/\/+3kob7Hc95520l788Yrwd8e\/f\/\/mf7HN7\/M\/\/rOdfj8wrraftjMG5Mt+OvCPdlpn77\/Hv1ezXvv7771+EfrOmZ\/q0f8Zl5NI+43Lu6Zm+jUDH07YTv3\/96zf6zOc3C+aT1xPfvMMjRpfoORci8Hulrfef9\/Nr4fdCMpCZ\/Xpo3\/mb\/fNKduM5uSTaeZ1t+3evkufMyyzQyg8Ie+eT24yk+\/La798kubP7L60XV9nif5P73+9\/\/q\/xz3t5UERkt98Gv146gzzncbMIPhgfr4KZ4bAYa+\/ZM\/NoT2v7v\/\/5v0Ole2dcoJmIibDElymYk3QTPBzWGCMxIhfELm3+N\/PsHmSLesn+RTo9DqHNR2eW\/sQm+zGiwyg4toLJKVv8RtreMiJQIU7SG3WbqNyIWxHDHpFJa0Nix2HLr9J\/r6YiqANmSouiF2y\/GkhUf\/ukSq1r4vIHVb84BHlWinVuvp39IrJKprJfHbS2qYvGbc9ol\/hQ\/bIN2cn2tHEctjromBi3j8wSDCkaXk7aD+iUaYqJcRsdtSJedMMG49\/lH3w\/hmzOVpfjxzH06viq\/1sj4ojKpwfj2TElk9QKmG824Z6qgsxAaZZsxiHlYaKZKICnHyf8sJQwZmNbQxWckexJToj\/WLWcQaviln2pLbLpe\/LkMNORyxHDfpkIBJvxxv3f\/\/m\/bvGr7UyIqjFb3x7t+apF9HwrzhhaK4fjtjxEt9qLgXFEWKBMa1Thjca3PFw8lq2ZTyt76mA8jM63dujl6ic9f9nD2oDrqnCw3yr4Xy9uaFz7bk4egzRLZs46ziui71TPupJ1yXD+Re9kxY5qqvod7+FWlq9+lZkZn\/rl37YEjzUSLwuJ6\/i5SHl6CCM\/RUTBXv2eh0D3Re5fPkCjisHyY1qUN05hYfxV9mKOs9CLOXcqVp68tuh19Dlsw+rN5HwSmCdnqAB7ZW8Z\/SqQXMpasCfPfOyc4E2Zi\/atsGnLKWjztN6rhjoJsVP0\/ze6AP9Yp8cDjwmm96hvWXc1Qt5IJn6CuLW+X+5hedklWM\/QqLx\/ViAj4X1q8vAv\/0TZVb+UbMKqo2HGZvV0ZZpdpiKzS8Vy8kkd\/Y9dGY8\/32qTEVHh9psqLsASE3wKfmujnfIUgc9vzzkUVYz3P\/+ZHnWgl5dD9Kp\/\/gV+kCWuIldvyVFShPZtVFSxyDuswCKg81p0HLqK7V3MgHs9BzWQ6NL27\/2ido9fNmFbqr7VuspiHtn6P\/\/5jkCEjn8avf\/+9z\/\/McP\/+c\/\/\/X7+9a\/\/q8O08mDzJWWcOXztGepCnx\/36LMqwOkOvEJWjRD1mn\/DqWTiZqwfog1r9jwmvgfU6qaOOWzHmOItwe7LVNGlFhHLsvl7fQo2FwP65JTjKHRI5jFyx0PN0fHIcO1a5f\/+D4axDZkPtl1FbR3SzKPEhSNILIPOuw2bfc6Y4O4\/ujHtod55FydHZshJ2Op48vnFMZ74ZTwqInx1Gq77Od5\/82RdMcyrsqoEOS2ytl7IvP4v\/gcM9R24Jr\/\/+Y9aYTatIfJrFan1VB4tOQqxkG2pIHsIq\/CqXCHLfNCTXrrPsj1XGsYuw+b5VnVr7f+6uiTLAORVR73Mr7M4F9aWP5Rks\/ou\/RbM6e9puO7hNPd0qpiYvrTFOue2CquMOekl\/fO+PFWHxz7jQ53M5t\/3ysg9HgGa9VXDYqNk7B3R8P\/rHw+QPcNSYkh2eL5oeL06pLJ5H1yIK\/WPvtzD\/NrDFztkGmXxL+0ybpAuGsXKYR\/eIdOquHh2b7chXq1EVtZjoMRYlk887Z\/9Os8d6wIbi9A08\/hx9YJXq5v8iX4zBCN2Tfyrd\/DEilfmXjbGGPTKaDu\/5\/TF4Tj9cRwrFLVJF4rPRTUq+EWfvgIkz+e0KlJ58jzolctlRGKI1j2vuhWeqw+we9HDW3A8q7OZ7pJV4qNntZamNf\/QMHiM+qGlzmk+APTT1qlcK6T7wcGJeI5o4ulh5CJmK63Ga+z\/jrXNlTFKneIi2x7NpMzJzDjyWA9ZvGWPHM8jGa6fqb1Goc6PkR6ztgKIN\/nutta8nt7av3pAR9taZUy3xHqCqpq\/au3Ixdbd9GkYKM7nKq6yz7mANVRZtWKdqktnflQrNTEnsOOJMCD\/kUOya66a7\/EwEf+q3Jtd6\/P4+lx99jeqKBMtwGLDxGaIZoBcI6xnL2K2H5jO8xwPodoulrSuAqr8L0NUZ1c5jO1+5vnGbVSP6LNadA3yY7NZLSHrXxW3luchyt1W6MXkYgpDLY7LllqTWmkuguUeJVkdFZtfxYcrjDJxZtTH1Xp8WRyOp7ZBonxD7Y17dryUmspk2PIwTnXfWiMVSL+6C7inY2+VfuPfGY4p6zf2pn6IUR5bMUtYeBhfRpmFcRHfCRPrivNHi0DViJExffo2p+fQO229\/HMUfaW1w1yNFx0e3onWz+stwj\/f9X8\/B5YodW4hRNgmaxYz1xbaDqy9in9rfnNsVsWY49A7lI+p77ABDIgjfhzQuPWoYZKctB3\/p3PXZqCCrUkLFYBCUAlVvs3065UYz99KGhd3f+qgzFgNW\/289SyIIsOg7xyXWFUxPor6FApl1H07DqIFJmF\/kX9OiLqgvqZTq2hiesxzbO0+vs94Gf8pF6iKD3\/uNFjMEbW5kTxC20DINLkRJn\/k94NV89EsMw4xlRfoHYOe4ajYjqXor\/6MPdMDFfrDQfEBLnXufUVMLYPlH7J\/dWcdiyLGJ0sZbzkITe3sWUykpWh5OIQjo8kWb3Fcvgy5PPeo5hxo467\/UilYo+pTHCcpwkGxRfCI8oCyW3n8ZUN5HH0pn6\/CwN1qrPoCj+MtqJ\/XOk58asU+VXYUFUV\/SL3s6fxQbXKF2n1cKI6n\/06hRxaqeGqg8caJNIMqDY4EzKjVjAyBI77tbxxaJ7ZaZU6rs4y\/iFIZ5fpbi6Au6NPiseMNnd\/mwSxaE1XKl9tllsqUuT\/M13qxfeaAuvo6DKN2iw6Q25k2QtQj1SlHM4qxJEzZjBvR4xJY9eW6\/EdFw\/nse4znK1\/1crxyy2r61wbul4iP74vgscnYQf57M1s+rxr1BjCYvPvlcas8zm4V81M71f+7\/5f7joGJNLx+LgYs2HYe54jBuYIcw5A7Lj\/n2EIT\/\/4dhYZHPCoAk+2YfuYzT0Ml4geoHLP\/9R5EgHh+o\/F1uOocjuP5XvRyfA2ur8pELhokas2NDPqU7xjiKaEIGza69jWC9KZSqG\/HvUaPOm699V8rRDXgmIlcBeLZvvU\/XZlCdYwPw8Ux3OpKZU6EUbJ6p1an00hs66H6skjCxWU1mcjsHtKIo8pGZse3ZYlTYfhJpXTdYM5BylWsGaCiWUPW7VWV0tQPQa2gcknnL877+tY5eqZ3fUynQs01nk8Zq2wxiKflcEZQMnUyt+N0mGheePncakCWoA+8B1kGK7KuOOfqIY6mfOLWlRQ\/zAQuBAGwYtskS1OEx5fr11WTnM2YWnfO70WymKiWDcVi7vlJzmK6iiGOa6kRLQ8uaM3WY9oPFjZ2roHKPrAY2JuHyFmyVQmzR\/+myY2L0eq6YoHSoebMxKurpoP2qfs4wctC1bYxJKZokvV3THn4JBPk83qWy06Ll53iXowyal756gX4fy5lfg4EiJ9zlbTHXO790z5xd7qTCFqRr1bqkscemcvYa6Cb2xzDzVc0qs1Httc3HB4DyjHhWJz9Wf25JkV7jXvxmNE1j3g1cyXq1QGdRnke8lomTpPGS\/ogLGyVR1cIGqkE3PoeVy\/MKwhCAVEk0SDOsm2QdihAz8Ty5j4tIxtyIV2L+8OSrw8R47hfbFZhRC68WL2Zlh5uzVcygasHpEYfBtFhjUUep+QMRtriyGnyIpvJmUaeiFyVySzUxRDY7PTavDm540PqRf2Xk\/EztEoELse063tE7i9Svs52\/qGaOHfSuj5P8fE1rHbHV5y7uGN\/txqld0eRM5\/AMNtzBSKrxcNH4158F9voGdqLo80MupesoF+lJdiVmitahtXjYOufaH21jUxxhPZiygzMEo9WBit8sU5uchyRdrvnjt7IS6oB8+keddTEyLURj4+VZBhiKVrKIi8OX41m+6\/uOR6vhSUeokXP961FVfcYGPzARbAgTuPrku31656NGZGT7+RS2QatYdxcYcB+qox6BB4Pi+qCSq7XPAbTYx6f2Pfxaq4MybGmoejq6Jemf\/WqUDwfmYm7IvqidJz4G0za+T0DW7lqtQXaoxNlljATjIRzOF4AZ43Pc+kod10La2fWANkX98oqamtEKi9j6hXJq3j4He6E2Y8lvrot67CF9fFPLI3dHX0rP\/VWnu1aQqdJC1Z3zyrTcckYZ\/pbCeFQO7s0w3GcXYHTSFCNML7awjzM1udMS1+bWhLdubOuWV+9b9Tp9bnf6utWUWrcHR8gkaLv0EnU5Dzib02IXjmad6mhrQOamXBGszg1XJvr7XFay2cxLb7MK7wqmy1KbxxUtducp7bi4uQ51u3x8lhHj1zRR1qXv2UA2TUxas7KBuXXVoY1KgfPNTzkz9UVIckDnKdaGMnzCmP\/p0mCaSNcROh1sywSlkNFpv2gK0XRthZlchSVCPrJB3kFh8dvvFKur7q298ayV+5nBF1r+Bwsyx7dpz1Q5XMb8sNTcDwJGPzw8FbQae0xCo5828rT6wF+Dc6muSodYzpkTo92fDLjtyL0fvKXcZpvqDaqiM6yEUS3f9OIV7I1+ciqWBxSqqwwwMYq\/\/SaY4attSC1mDq22fn9ejkz4xZfnTjfAQ86Nq6HMBo6DXuYs2hK4De0HOZhrvUuPWJOLfT39wbPqyEcT+fKtyISLo+2uCZ\/GtusdTZtIexOO0WYqwHc1XIfLitOaXnuHgR5DJQahR1kCPHZ\/aZUtCnuRACMYjVYt3IdVQFznDehF6rqvNRv2+e4monWslzA1iDmraFag6BF30Bt2C49+66PrW6uYNQhMxP2gFXzF75zlFf1OFRaKrrQ4LVws67iUG1iqfHwmI81TxapQN6DneaeF6\/l\/7JQ1MOaqS0yzTUl5IAIyk\/EXU9V\/znkodlfJ+JKe8fKinOQdRhQj7\/e4sNjdQPEj0g1fuXFZJuxPb3oLKpzxYqcmJn9\/JTHL1IFzgj\/kRZ\/Df78GXrVWgDrZCkt8QkqM+VoXHvU7b\/6apRfRVvZX3Y8XIkOUC5KdUKnBnoscnJXIepgOpJEIG6us0cPXfeIMtjFulpOnl6aZ3BTPSiaCst5tI83aqTGRxwn7PVKi2DzZdXBIlZQZjAm7Ba+\/rhvWT++JfIy3LV1nL\/a1u\/j4BKBgoba8hMBeYl45zgYe+o0wBkRko\/mMgjDdFY+ypa\/4\/erOTQFnc14wYWemXjM6eBRM65dbZjIybHEjc\/H4AT+\/3nwm0s9xK13qLjVSV2C9ZKzYeOOoRoOosJYCxCF8ytgaFU8tpcnxGf4jugeNxtdqvzjcCpnsGUecVUzRwplH10Ao\/BHNyV2cl00fRqlc6jGgFHAt\/Ir\/YlRXlcT8jIqsnMqq5xGQC7uNiJIzqc9Isd80XP+69z66YCO7DE\/+6jWnsdhG3rc1R6tAv2D2tv42F6znKPGab2rOFYBrQmV8eL1xb+Zq\/coN1Jz+UyuLDxm7KyIRkdX\/jGiRiV\/k9eLsRqXvcZTcY1l7sxg10BV4baiqC+aD8ZFL6pqi5wk6szkZacj7KCMGDEMwn89diysiOeJ6hLQH2omnGOk4HL8cUYDhtv7q3u1EhSofNtz6xqzBv71WfYIfz8ewaeNU\/oOMcoc5uIe5nBa8KptdIbVu9+A5izLUTgiXTRsvNxyvKCfg9It7+qCt4ph9WFEAocxxzL6Ij4lIVayJGikJjfTxjnjyVGQutvxp26EaA07rSa88nc9oBq0Jj6ODAYMJaLoqNrtOYYu0TAKOUbuKPqbdf0BLXz5B9x5joXjlDJYUdh3v4z+jv1ubnJZUfEbZdrKrOPNPFv8f\/\/3+2Tzr3OvdZffrme4bxh+bEQlHEPTrt6Y9QGfdIJpvgwpS9X3zS0Or\/ix38zjpALNql\/LPAmIw1oU+gmqzqk9FWvkaEzZbEaByz0dUWuw2wwPcENRAzv0cM+vrd\/L0WMeeVS9s+vqdOfNU79Ff1H227kIZx1YV+Pff6FLU2uiwzGnXdvWQm+s6iIbN8meWX18UvmXDLbOUEAyBOJUj\/PzhddYqJgZ2lEVvAb46\/OOhp8M4+5cMLbusb+KD9FsJbcekonmLVlRTVpXO6pmLSf7MlOivk\/B0wHnuRvrV1mtFmYqu+jqrRtH5z5y0BS7s1mU37XVX084jZxSgJIbw2O0jezYw3qkKqwWMoFG60VgAhgjyIR9OdpIT2xbv9af5aQoYB6ueIrculNUMC2WiRupevcpEfzcI8Lii34\/VRoAvAsW00LfLfkv8vqHMnVbXjSnI9X4vN5RX\/bwnrBrs162nzIfKrrWePEZhlFMvfNFdLU\/R7L22xF3TjjNQxOL160bjXMj1fzqOuQwZhJ2ecc5F61p3CKjo5gLaA2dX1jum6\/jUHAtMo41d1+N4e30BLySyfmLVPo7yjn+6ucVPV6Bg4IbqGJ9SrZZXY85GG9d4zuaqMOlznyH\/RhHI5zxFAW8ioO79Q37+vnpklQxzHjKxvV7\/CRDxgbPkW3hbFg7vaCSOGDYMuMYg5HfVi2vgoPx6Y6DgXm3osyoIM6ufM6\/hM071n5ydjXavVtpzUEUpkxNlsrnOVbwajpBKuM\/twHO2ZZI6AlBvysmmf1Y7LhIH13Wb4USw7EG0hPVHFMjJt3mZXFesNVJbRhhGeyivcpuLqhkvTZjlpfUENm7ilg+098VleU29hsc3\/hpD\/SCYNZ0oGbsuCrx2aqYVehQzErW+DJCYl3H1p7TnlecGFv+Wjcwj\/hjls7WvkB4fg7dZpJRnx4xA1758FTRvp43V7V7mpSokN9FEl7oUakWC+eqbDl0Fxz22C\/4\/G2lw4D76z5+e64+8n6IvfvxPg4O35LtsmW9TlR0NfB7vjPhfa3MmO2sCHAnAxFtZuqxT6IKy+S6DRBBhIwWyioG\/vP74bm8yic4cbFlimJBbIEJn7OFDth805o8KAM61mNJWxFzjuuLZl5jrv0k5y8EHNVwbng3fQMjDtKZGRoPPvnJ\/lQjcbr1sDFhxmBQdIttGPQqzrrj8xT\/bdv8st4Ax9Qg87iq8dN59GZmsydj4rO56g0zoR09gdUi715crrLIoGwoP36ZsNFp3VAhuhT0CYcFC15WVf6\/bMk8jDToyJkXEKGef1cBIBVmco13USOrmYtnmOApf8w6kfk6peOgL6PgheHcFmjHtLFNSbtKSo384vGuM1bRv+yycwDF32KDBw0Owuz1dHBMI7gqa4TEl1nP2L3+EbVtDe0oDu6KWhOlztAIya\/WvVo4h1AXmcinBY\/PHX\/7CkwBSvjUOHgjr9QMcZb\/1RdqXgRAMd41qsc5fg38VsiJfd1Kj\/TAVEHeHDaVXBpuVK1y+Uus2k+2+rW4a2TroxLprm5rfWDr6jq+ityIf2YB\/p9zeh5gTNb9mtEo7ZxWZfejfubFOFE330rlKFErsXUN0zITFVYtJQ+dSxzY4vGQ2yqA1UR+W+EilnH52G9cfBWf7YoKnG7jVd+is58u4khdN3C0g7HGE9Ybdlzctc7MjBH6nByCCzFPC2qLWDpeO3S57nGW4hJ+MGq0Rvur3PYm+x+Cffevx\/gqGlgXxelBDbUqqCpZjpHhGUW\/WgM3yZPUDpnRydtb+pRpZDdmeDpD9q536xHciGL1gV7mcVqvsgNOKWW6vAZ5U9PnaMc1qSu1\/OKrHsHBzPapGkAo4mAzs8nYybqKKDOdag3R1Crlm\/\/g018DxWNrPEdEgtcdK85sl4O8m22fijDjMb\/rv56B7DVK3luCFThXLeHIGEJ8Hdc5dDbgrGzAXMgSx2g27iD+HbvpvlvX7DhBnd\/6TQ\/tZUdtKEjWNL896wkZ0dwpLKaqk02OzZZXmGn14zn44dVjXOaIuKP2yfXvUXsmRlRu2TqDaR6akWmXvvBx\/lwnTIC3E7Vjz\/bj5+G431a88C+qX\/Yfp57CwCD5l9mij7QJc4JA8CITTUOnxL\/3dkwETKqOXCdVB9k5Z298T+OSiM4TgUNiD7L1LvqW6ftvM642+TJPlW55ML5zcqjSZhhEhXOsnHO2xwDfe61al2gKxxrVHM45\/Vpo1uAGs7a4te\/+4Fd+MNRH\/XfH5P08ScYfnUYRWntvZdAMvWyXGKbdzVDrkeiuytoWVUplHfMuz9Ta6gwkwjhlSFRI9HYSvAtap1FkrFlbbfTsUhP3+JSWT0sNyLK7SmLWvaNAcFaM4OhEOS3q54a++Rdzchz45XkrJtiul9lc4Jhzw\/AamJ9nWUTITTKN64IBMk7HAUs5uuym+6AWzj0TZ\/2IOgJCffUixrapapjZ6jM7j\/PnuYZFvFFrzeycdo+frGTSPc6DgYk8zKVqsYU6JyuhzvL\/1XS4jms0wR8t0jr63D0LlM5srKN+qXK3xhvSHppYlTqiZATdANP4e9CMK2T1H6A3ew0gjHszZEVBHltvqehfx\/ix5TqYyajR2b7e+tBDjofEbt7Tm4ADuQ2cndfnPbFB7hrzaQ+MQDyJJdmWuXalc03AzqWCgY0P5FaBwWqZC\/WsXvav46YCmNkUxCoYrp5TW92U2\/G4jQX7DgGP099rZKi4J3ogjDYew\/yJrZHmqBz+ub3M9Vdpynxk\/dYDwdii1tcXP68O75ZEkmp4+qVKtzZ5fVlo5Nnu9kRV8WG2xjZTBFCyvmQNZu7KMsdhjG2DpGdIjMq2YEONeE4BzzO0lTNwTg1uUTG0MRZqTPygF\/ictn9zqKdwrMQHr0CExxM9wuexNFwODnBrTfV+K7xmfdHa+rXYHsLh6Vepq1cjvffQqo167XOue1yAPi3f8P2tPtRrM3uRayRWiTdv6pZMHauP48b9X05C4XiF1jrPouxyJ0phw1Zr0Dwky4OpKV1pVXi6G7Xtqr9MhlyNWRsrI2ukGpmOybsitOZ\/DpetXzx3x5pxRrNSt\/P6AOnTNrWG\/p\/joJrZjlGlX\/wDtbwt3oqprxPfqX0jQI5f7K04RlyTMPTu6ENHQQ2iAeR+\/nPjXnvNBnWfQarw8jpZbGMo2cO\/8yDLIIvecAfDG7WauOPGUJ23HfFxb8b99WvftUirq223ttBnVlT0vogSsba6s6O5EoBjZb99y9cwbEb1OwreI7mrvSa5Z4eGd7gZuTQUzd3TixB2VDHboL2gmUfsf2tZ615ftG13pJLqsmqOj1G6rqLwyM3F8Lz2ZTXYnDjBBWNNOPPl8XKMMnOt7HLdmDIO2jldurUC2y+vb65EvjPpGn+r496nMceuiSxzWM8flzwf3zNx5KKjL88S6WX21XKyXB7B2zTqoAFwJfpF3phrFTEuKiaobfprcmFc4t+yprVxGaMYV+8z29wPjHjPEVLkjzGnR7DSVkz6HeIPG6qsPLbu8pA56XDUi8Wwa1B+YOU0pMYZb8bD6piotMWqRxkOx6q+NgJzhKRtEV3UhlSqfjEpD1BR46BGTq8oh5h7cKybSQQ5WuXv+GleQzdx+KZnz6rDFx7P\/zBs+a+j6KiIK1XF7zmcZkz8jLevprkCDTYt13VuXL2LG\/AYyY6trBqKydbluKkoqIt9kS8SubMcfIwj0ZPXGYI7OU6OGYJR240AHi5mWjNjjY3QbPX14ly0kn9iSmtlinDs79H\/\/A9nkPBpnFNMHFd1bAtqh8DOfEeF1Qb9F59dJi8f7P5eAKlUL6xkcZIb3z\/OIsJfrea57bSNh3gqkLasFrZdBT4doqJw2eBSRfd11AMgNVpTJWKPdxkHtbptC3V99V42VEuDi4+mojG\/1zgX6FEcOP87Q0an88DB6MBhOdWZ4\/OPq1cFjqdHplbVoLJRWqbpBUaDFuBHRly4LaNi7w+TlTcI2Ph5+xLj40FjrUehV+LJv5cRa68Ky3\/1381yWuUxfNFz8pw\/z5n3rAC573pztyzm22SSP0f1352D5\/gwrMdY8R96F6oNVBBxGUd86XieZnf+8IOxI4eLH7qd2h+mm8uinVFsdmXzPKNn8l8t39VTMAe58sw+o7VS4mXYC+w0KL3WMNdCLudtJdee5Z2ylFz4Bn1eQjZTdWRB8Hh6WWxyLUPZL1F+3rBcSa3miHbcSuAGM9j\/Y3b4szHVT24U87\/UropuzYjIaShNFNWXW\/chOV+W+jplawHWPc8xJh7L0J\/tyDQkfZqN\/+KofsOVhPTYfa8BMfbmmYokZ\/uc9NQ92CGnoCp\/g3D9D96bbKSBZDckkL56tev6T0V0W2u\/zmwVt7kYI1pDrYvneRO4mh7\/GQH8EVHRgU5nP+wCssm8PErM0NNjQNv5sg1YaBVfPYwdrKpp7cfjGr8f9liFbrYqD5hSdVZnqEcjr1cGM2OJ4HOKksG0NhIvVLnX4\/uJTa\/8bOYToeKBOswe4TiyK7fmMXXEeqCPi71zo2Vg1tSPU1dVOJDiBn7rTOsNdI9j8K\/2TuNAGnXofGEZqqsZDAYyx7XeapmnOiVRS9jz7f04a3vhlTo1csjqoxkpBlflPTfd8XfNg3cSb7JgojrHWKy3Rehq0d7Rnl8ARmNXA83Gjivin+wNxqwHpFc1WJfQvsbzZXbqMUcsWkXjzCqoPOE3S8DnqmIZGZStx7FpCwdEtv3FvpyzUfF6\/YjgLusyk57PAXmwSSlu2G17qNChB77Q6TEOufPQmBHoVmanVttjzR6D7Tg3T6stiPQoA2pPzstioKDYXfzqWxjly\/5qZow8djAGHCsW\/9kvLaBFO67yoofaw3gcAYCTy+fzs0NosMwIxM6ics5PJ0G2wQ0qbAy5Qs9M8IkDnGL9xFwl37CHa2ceY+Q5SCsTXcg2XE9G+uHjt3afBzFHYEBvMwYeD9qX\/RHfa5dR3Hxk0HN2jOfbl6qw2m4GrIZleWuK4nCqJvuyNerBmppYBjHznvXecOV83o6EwD\/GsDkdgsoljZ0OibyqtoykV3JSOcvMORfw9ZDe0itm0I1xKPmco19tZ9zoqW6UVs2LLtPW1Slrif15xg9aQEyhABmL9V0R2ysDdOLGnb2G9KFMBup1WNWSKlXjUPZ\/fMAoOENGZiC5KlfRL3Kef2h0ancg59+zH07LY\/MW29vY7Fhgs0t7cOkXZVchrseIgpH50OKcDch42j\/atH1doP7073ppvNyxg8VzjXrKty4kur++OJ42TYOC33O2CAqOUZ0jfuk7UhiYOuc9WT3P9x0n08ixKspRlmXE9s2+8t+O5rHN1DhEUeX3+mOwNcbEE1B3qGiwUgRt1L3T9NO\/jvo5GhQb5Ztujn9PqVA1Oe1xyRBAnNMO90RK69eimpE1Yx1GrNhGNz85p9d957bUijIKrNO9ixc4otG8I1+MysjKrjAPDMP5TtpolQ57eLy0aMxaP2VdVQVk+CkedcDapxcQ9LDYHIMlmV4sn1KLIPgKVMsgV2mgDVzvmGe+EXc8bR9orBEiGtxxT2\/RLOIH8XjJFf+OC8Soo0GHC28Qbj7G9zgX+Ot4zfFa39ZKtlqdVRNOsy8i3aaIGD\/PgacarJyxd9HCMVyqJmNBs1JlzrRYDAqsmn5Ll9zE+ax6ivpdRmLOgla2lBsum4csvTmsG2PHFWA8544Zrf0+ApuQT11OZ5sgw8YgFGR8HYfoQWdEl+pGjpmpMZahdb0gxfo9poU7RfPjTaq4w0iMyG91rINvTN4KufGpolJZ6Hxmk2ytwpwr43gu2vbU6XmJ+URij46ghI0KGvXr0TtbU9NuPY2aj3cMO04y5WJUZLTntOYpe1aqpJ6abxqGMLYt3ps9fQYM9TJEq3DZvPRGCx+NpxqDRHcORfzQDrXCvcvwWQ+VRbjzb7RA0iVxnx3LKyLRiHNMjBH+xi8DPB19lccKrFfuwksiXi2Xq3hdZN1sQIw6j7umwsZlRZJ45Ip79PQ03L1lyEO\/umt9yta2ZxXRx7Hzoa3RSezGGqBnGhR7NO+qk3lKUjZhvrS+umi8qE6RYd9GyPxbidRJVohBd3D32591Ip6xLcENPeZQzjsFk5t+W\/VagDnEegdaTEsttrfGxna1r62R+VwTn7VKK6XnRoBznGpS+f69agWbxdXpNOatbqariXW+8QLEU+Od+VxlkO49S8HmeGw+8bFIFWksM2YhCqDH+0rBZ+KP+tEvqhTJI7GVtzK6xG2MUcYB51QY2Wpk+zI1xzzAruNESaaBasH2nYeJFyqPNCZPZ+pu4tF67j3jG5MmM7io+QoQKSc1Yh1vRwJHgpxxB72prONRtDsRLXcTAV5Z3Zf\/q2zEuK+fR+irhdhUQK3o\/NmSKnUmcJKOAR8HDp4vrt8ir2RrHqMjoN1Fe\/3OG4WHyI1RqKOYT+k7MgbMjuJ2bMaM1H68mFh2bUBVM6+nAdiTsQJ4iXEPx7b6wjLTyHqBfjsj6Nt3Y1GmzXeaZ87GGaxwNhVWIFtw2Ku25h9+KFKYxzzRIlaHnrVlrvaGGfB4T71lGBjkVHd5sA+wR42hQx1veX\/Xc25VkigMm8dlZHHakkgM+Zu72kUmZLTp8RSyajIl3tXj8x6q7Cq4q2Fygp7TzpAH4fV1dBuscs+KiGli7rH\/sa811S2tU\/ZIAbEydQ1uNvG89OV16VPFsVdVN5VO6SZT7284u\/zfIxfng8Ch9Ur+q0rhAZRqbMqreGMUbu61r1vvy+mHT8DkmKpaD088jyMjFyF6AblJ58lz2pGtZWWqf2u8zm0oG4uLMqv3vOyxIFHo\/N+jMU+vMqWNx0rNObmQMcZVfaP+cnnsXtQnR9\/ZbVgadw1hp7tEeKuH9DG2yfyfFrXGokTJFf3iZZvFjk9mp\/JfZMZeMuGyQmr6I1+hfrymP3pcNmftCk61oAk4mvEWzzsCSC2pEkXiYmjs2a\/ohaV2nW+vHvx5HOZ011+ybX\/DT6xnqoB0DW7BCPhqkshT5\/Zl7FMo603GbsvVfarGGlENqTauM59P6Kjwhfuc+K6myxh2JcvjocRNt3H8mPGP78cb1h2ZQVEuT7zbURYzWVHim7Y9OoDElFHKv1U98+a2VAWj8vsyqPbzROjIQ5ZK32DTDnXdv1UWVoXow3et02ygeL8ucx+JInnr9zTF+lzU+pc1zp0bAD3UG64LN8N4utccw\/MV47zmabVpLA654ISZ3h0OXLXoD4iP0S9D9NgL7fEZy7LG\/CGfnmXMonXuJXVAouqw5Eb\/niI0u\/DsP9qxnpn3OKq1LIvX\/RD2Og54g8jDGrrm+qr1A8tA\/TA5WdgeOUO6NQSq1CrGKxZzh6BUqjpWl1o8FQW1BUNEs8g9RqimojsqV016qrUYzvOVz9SVUdsw7SjUvFt9ilqVxMzajloHftHHahq5btVRy325j4q05pxavHshwEqgbsc\/6\/hWLWgOcXuqA0f52djtuxziQNrWWGpecZGYsqKjYzIrtF6seRwDl+vk\/a\/yUElE1ytNfR9nJ7cwVtqBS6gh9xeTu6pzLRJJf+YLOjN0cVhry36+3TyBQn2VuMerozuJD5gpimGF\/F32yNn4Z6vmeo\/NAj4JcjPOzralYFvMkRwxFjIscoYRXdP2M5qrhq2d53tw4wUL7RhBWr538GKMBUZ5GX\/OADam4uHNV4Gbz9P88TXOxIg0EkRg546oaJSSHzF8TsQqpQpEVpnr06tKIkMwM3hlmrte9ITch0IXcnlYDMpSXoHGkbqmvNowv1CV6agbu3TJ+4dYe\/86I10juTEPxVE5Tv4eDrbifgoxRmZPxo1Og4RvhfEulcm28hfPDm3m8lwxV2A4W69ItgXvB3AKfuM4p8G1kLIqsQCBp+68lvfEQPPWWfLdK4zbzKosRvFvD2oQGI2evmpdrmFRz\/mraeiSPZP7dzZ0GhKd2RWJqaZhIiXlOWN0NK+wDldpmoOOhPsIU2vWIHMnIrl21+OScJxaoLrfWX\/ZgboUy+SU11htWlfe1Rfm9XvHiOvVv3ngKmeyKk5fffYOO46bfFrC5Ir3Vvnra+uZ1jD3ohLprfYe0z5knOvwvu3j89U1pXPquqOpcyzUoXO3yqgOOP3Y5tuKTPlrt2xjtOHGletH\/\/imNdXCVmW0tMaqm5rw\/o\/p+yrVXHzHlC1xzzLxVxHd+yqGOxQRM7a8uzB73yGV9BBxs3PP72yI0tUlzNm8qmTNG1q19UEw09jefZDUYe40Sqzu6hciA3rpz2r4G1nQ8zT6101Q9L0GBlVFm59i\/1rLXW9wm+GDelVcb1dded8+szc4gnWClefNWrM74xO8u4ou388Blara7m8IKrm63si9DMEBeKmifmOnkmBNWEJMWqfyJZFkz420nIIfJOrk9e7JvVaHWNY5eOeuJDr27Mb991aWXYViD+dFy2098sTe838Zy32CWWczD6Kj6Lg680aa2fi55qsVxp95cA+p+XeuvdxVeq\/\/xHB5J3MizRifOssLzQ5MDGsXwYyVmhON4MFssI283DkWd62JtxecIKYjBzga1mvciSpj5hoR+k4bjSBZ2ZkhxjY+LdIuarohmVSsgCkwXuVhrTVinhqdK82WXZMk6z2X3EyzcqiONa+r82JgkXqrE9rOL7PJDL93u73owcXZnx\/ifNUPx+qDwAYIbx7SNLWbuDUT1OhisD3J1ypraxGeG7+v95xXnM5tDk+Lzj2DjdVKR85CM+fJMo5dN9I8r+qfp0MTVAa+kw6tdIWrPmZD3hsuYaxSm563\/T4k+Jli2KsdoYzsmdruvInJVinz3kQFtRf31N1D7x4zelWEtpzPV1uYJ98MzWP+qkyuaJJ9Oe0y07rp7NDbxuCtQaZdMG6zUfS8ivebFMCU\/KeOiSorehxMrLcuvZnwqixk1auB5488qrNtqfxWtTgGr79XWyNgyJo9rdlM5uBVgPN1jpIs6OYSAb7PVYforOmDq02n23MH3v\/j1phDybw4DEF9khn9ARyARpEZv3eEuyLDXL\/3yiDoChoGw1KxHMHzP1p8yrJslr1aU+mtGKAiYdCnYHkEklh5Tdvb05gC3droaMEYipOvzoJK+Tux4LvuQOFj8lVSj4ONK+DY1n63n7b271qYnlsXW9+gH+XVad28FzOT\/UDAdz31UdASp\/ezpDbAlt\/QqtacrtG72CDP9qCLp7\/zl7mzprjKNvhbmRx+oI28Y1+yLagH\/1ytLKc4E0cERsGdLvRioWrkPXqDDBJH7zb90dOnr8xK7pDZj5EeZqo5w1Xrx\/qC88UITE094LuYcVHruP44iWNgRt72Ws9UW18FMTu3h9\/ZsYV2zh3CcpfD3TmRWttx8B4Jv\/XpVvHVjsyKbSm+7vWtYu52NqfXQcXp7XNMsFi9Vyaop5IbyCy5JXNml8c8I1Giy8ii5bovWjh9I0+vPqat9A\/Xpt+dW536qnXj\/ObGEcpDHa7eQU4bS8HiY5NmaR60rMbdtVrT2b7ezjuGZk\/UB3epJov7mzsMS2RAeXLEmGTZPPPbeJwBDgnUNLYPQzvbUTThTetOumFxVVsJCtDY2op9X6ffopBt7n7EbM+5sh7ToNke9qSlHldPbmHpjr7tzoWRi4yI80H65786KAMQn6ft9TBhbViVd3aMZM7RHseiGdvOfcyFNZec2eoVR2mH8W6k8w3LYnE69tS1TVk84tc5kP\/2vlbn4+deMgq2GCts3TlmmFNbxPSSD\/fnV0ESVQRXFX\/1LItWWQfGk\/fy7ipyNZln3KWayl+WvcdS+abHvY5Ptt6alqH5Dy+4s\/JNHG9Xg3nWAm\/+8QvxSolSVgReezOHB5TWQniJ74erlxazVf1W2WqOXEyPq8v7vB2jYdUTlurPqWdHsRUKUYJ7twIkNouC91XMeeS1MoYyqjALFQhbwW+qxmmbPhC20406ui\/ev6\/Zrr6ZescTbe7rD\/VjRnCO147nzDOxXz2iln3O6Iujeo\/5x7mxx+KZX1kEbhrfTBNp91VZ2oUVuKJ1rKavkO3wlyiBygpSypFFE9d6jwdbYf1cVWNMhPVunf2URyWlVkDBWyuWEenb7WiLV8eY40rGJcuizzov9oaNN2Y4rXqhZyUqZHyjwdPieRBgeI0RzQ8wavvAD9J\/j5B+nMiNQezdXl806vNEK9E678ss4RNRa5wXg60iXz+puURsWVNNjrN6BLN8B\/vj7w8vzNCRtddg6ykbkVF\/ySJY\/T3WIVV9pmfjJtYJ5YQekWn0Ybt3Rv2hfpHlOte52F8\/fmP8N89Ux33XrWg5DkiOnZUzy0h6\/Ho6DcapITB8bkkeKIYy8lXzoUzcH\/bZn6yR09MtnjO+e\/8w89xQK4nzPXyS4PmDeSm1uFmmvcceVsXpUeZ2LhLFaI7GFI6gMZkGwl54ue5B7eKgVm24tltTfNH\/ZXn3bJ3DJR6tJVrjBhz173kzkbbhBvajFRj7ri4EhbI442k8OjvaVm\/IOj+n\/17J3axtv+H6qyaskvqKx5xVmYyYnL5xBO+rJZh6iFv9EMW5p165TWSsYObcEW1GrYdVG\/7z+TFm2TiAZmryXSXeqOk9dH6uB1QK+Oa4V2ZlRtS+ykCMxfkiudxQESmp8dmQPs7pioK+GPV8ROdKL7J\/2WkrtrbaeaKN3WvVSgsgVJetGq22M\/5mDyShYd86vxWBMaCtoZ7rsGAw6qJDCTy5bka9Ni7MghFZIaIDlhWzVz3kcAhrHovhjh02eGyzM3ONZGPyuGafrvvtUwx01Mx7aJTDRSpjUa\/HWFUdxv3X5aI9VBAKCNeZPZiSWiB26ngjT85B6KuVxuy5CPX71h76OGZP7cqyjFCm85tPHDltiTfqxWvwjKYIo1VxQ+3pJ60fMA8+j4l4DCdQgYvaw6i5tubcn\/adMVF9+jusUiUUjPXRGQ\/H1ie8ZB5WG2o0yOpRo2jw1Kyq\/DhtPtn6e3fj\/bgEsyayWnlUcVcCzHtaXtY1imh51ISrJfv66n+Ym+eikq0KsfLNwMvRuEEE0jfR\/yI6z+7+Zuf90g535oKP\/l8kWBXE4nhJNr3MfTVXn0X1omkoKR7VVm3zxiu2Qd50rOjOkbk7puyxP2LKvSzGutBGcW7sufPV2LjbrWYeYkAXdcT3BFCnovlql1gN42WrRW81qWOGdWyBYyBpBdc3\/lgsmutfv78VNG1vW85tbty5Tj\/ecuuPZlou3poezX51fFvQc3MQXZKXi8K8NqUlXvCb0WeG6ZU2yOXTAXiuWJ4y9K9M\/vwUbJf\/mtWiet4LzmHkusi5D9Yl+JdtBV9Q6WRH51A9ym\/vXB3QoUp5np35BpZzSmCAcxGMwFgTcVluHmy1dpVihKwbtYI9zyGcjtCuyneVaq3LisRmq5m6op1vLCM+Tzqf9x03TA\/Cmd+xuoqkHqmYVC6o5LEOadq\/Shx2Wgpb0XD2aD4Ex69WyWAw0jFLndm8k1V73HPrHYAKYmV93ZKfKDFrXYXPiRsdVQVMMa4e8+mRHzDE\/PRM8KA14GNycorX1eAvTjAQtdGs9lkIrthFHevLpviodKt\/uKRS5Ij1ja9vlXfL1FzdAdXi7+JCzGFNHsktV0vWFCpdndLAdI059za171XcVFtXA+cC0WFrqNW82FEhIoecMWaQLCUTib5TN1bfVj+LWs1Fgq+NB90GAaxTFrXOAvQ18uVJnNQb\/VQQriBWw9P8ZNl2jAWvZRSLJz53zpa2z79YJbYoyjuK1fnlgPNK2Vu1dbzPK021Noevpr3ZZbZwyPSjZ1Wop8a\/OkAc4Ow5S5iyudungqbKoBuGAQewJvSDvy+v6nL62joCPO84vHd7o42+l3ZXB79RpzpaiF6Po6cp5qbgU10aSOVmhtMcxsqVDcfVKv9f\/8rMJnd97Cvfd07r5HxWA3K537JHvM3hhw1A+h3z3iP4RYUwW\/SmS3O8597lHNu70V+V33oQNPrp9Ixf7LzVyFth8B6q4v0CfpiI5nL0KvhoSf9ewQ3oFpKHcdN8wqclKossSSrTgLGjzGDtUffzAnBD67X5bsW5WpNhnnMoh4NjskFNf\/3O6hNfMMG6lRzVUITPQZCjf7hDaqzRymimSXFJdSnlptVPM9DHq6Snne71XROoV7kfruMWbV8XUqShxmNGtIszTNOrjlJHzt\/Ts7ZAbHesYSrQrPiaGugqRZ2jF+Mr9v6qC\/N9yhwKKQedw\/F67NJLFZLx0tvuQNac8vpffqYOz4eZc\/HP+28UbZOMHyOfEztvlnf5HsuRUbHAGIxnWs41Bd4593yQfuHGRp+ZOfE\/16VefvPk1qwgMvp9N3RriteKcSq1gcrzfPs6ngBVxoHjP4wRz2F5ahZft8jh04pXYw0fHW5EEx7NnIgEr\/2V267GxA9xIidyXtUaidnKJncQvbbpZ97hU43y57AxRE7XyiHEHAaQnc392n94lOc7wtYAkSE3jWxbgYHiNEJsEVCuPyWknltccnb9Ts9Y7jx0hsW9T1MOcA1n\/xqSTxvZJr71qS09ZJ8GsffN7SqGNsbRj6+3dUe4XrwH8Tv7mS\/Pov9bC3HdbGDGJ0l+\/+XdjJbv\/4Vh5wL4xHfG4Vz0\/seZx0lhzV6\/7Ewy46w7f6UPKJwFlVL+9gx+zU3GxBWfRPXiU0bmPKrruh+O2gErvrFzDheST3NLRaE09CmHvjHsrSa9V66BqOf3\/qE6oEv05PFzYK0899SpzVO0vvHJoPBGmLvPyV5y5DKX+XWOcIEVK399XQYtqzKg2TwdM81XsRbY2ggu5fgK+x+rGTFbsO7m2cfSfP+B1c82xO\/LrozusHO1zzc8c3TSKPkYxkn7fnoHZ\/Rl\/L9X3asLlyVY0n+\/nHxXqDEye\/877vOSzJIRgIRrjW8kTSt3hOpl5eMT5preyhRMjoMed24kqZow8lvx4OKwNzBaPxlC1ZWDPVLaituVQOhR0pWahMMqzeMPoFtD31UR76AF57aID7EX3z5jpnCxFYIiscbCvbE0eHVAzMfDfbfDRwvVN2JuGzBz1yzd+K2iicVcr1rrSMr6iQEM33GBiI54kXu+rf2B3q\/GXLWbdf6CHPYB5WAkPY6B+KTvPAK4+f\/LO3XJFY3p+T410wyuD0ZNpeo8GOnlx3oUseqyTk7nkJHMh5DbRgXN\/q5h9Fbi9Hq21qnC45rjk3vV\/DA7XFg8DaoLPjrTKocRhDOpkYvu9tc3tBPaGMCH+AQlSLFWVQDaYhxE8xj0W+GqyUX6vOWHk7cqEEsokbglot\/YPXQVM2blXD5s6jvklRkedswhI1NDDtHkjDbgJFvA4cLHX81Ki14\/\/jnSVhyz9uGYMUiDe2R7FGrHZF7NjkjWN0d0un+zlB+vq5U9DpmOnXFyHsJZqHQ6VD\/NBgPLw+dkda5f\/THq3ptNXjNXvM+nunTA38rnU2Nol2pDbVKf\/IXt+MvI7rizsfuyh\/Wks2DOf9XsGwU+lQcPejxodbXVzaLNkbUgvRwlFhiVI70slCd3ZsvKvsg4J\/juWHBVWB7mPP2NvshEuopEGAJMyBtUvRiTt6nsb43qlGRq6gKd80gXrMEI\/7tP2MOZsCVXp994vEPuN2uOVeQxBzBqhjPFyxYcR3V9Y\/utVqPPa9\/q7uy32tjxhg+i7RGkwtedcfkNvYZBW4kw25Q0r4AUIg\/rMdeOdNxCjnhtOMJVd995CCp9cbBOdQpg1eo6r9lH1MHYTHywDcd0Gb95daYJKO+T0fMU1e9amuO7uSQQjD3qhB\/KGjUY7VBTpOQo0ZgJjOXn1gVfDBq7wws5YXz6RPcwKrS47C1Hep\/W0vL4jSDf4izmv72gw+aMavP5957uxAamE6ungCAfVZZbiqdxw+mcr4Haqxjusbw8Flm4F9o9xy72qLvMhD3zgxLc+PUYoJTt53FZ6QUUZQaOwpX\/grsd\/ciA8JuM39WHaq+O2xKzFXGnvXw2RAU51YC\/9Eve7\/56M74d4SqOK\/VXB2XOtkwVZpxTOB3w03a8\/NTESBBeryEuk642jMf\/clyo6+Z6+rDLVvhw5XpYHDlDdpHSqVEZED1ZJnrEODOAZZspXh\/3bGWlN8j9rX5vT4tWaZ1bX2v19BjPsNxjSMQsanTtUzMi4+s9xRMYYyQquBmjHq6auYId\/GV+nik85DZDnbNXM9OqdblofPRFDnAL8HIcnvYY99eTdmRoebL9UYgen+mMYBiz5EwY4fi8cVt0sl\/nxX5y1NW6nsk6YWZ\/lewvKmjtfAH1dQ7t1gfODXbAXTKKonhn9miPmfB31dntytZ9qSPDdead3cex60EVixRO6zqueqPjJqKij25EuweMR+9fHkeViI1rR\/LuOIv9F4HvI95BbTgGS28e4\/exR3VX471Ofr2uRpiRKCxXBB\/GEm\/Xlqugy\/2rb1Z31Ura4V5uXUsXZXkZLeVOtMeO9gr6\/eU4KpXbSmtUUfetFcoAGSMru8a32+D7cC4wlnUp8t5cG9dze2CBvfQ5jWkjdnuJPzAHQ22chQ4ZbwutDbhC7mNE1i2PbjUyPWuMG+tx37xNK\/SURJZhL+IqLzleIgdurq4SSXTf9w6hfqOi8TstQk8fG7V+7BtmBupWGOEn7jeeqdpvu94B+\/c+98ugNjJ+NfH3Sq+vgbO6xW+FQy5YAVBNaYcIcA4GBf96X0YqWztXtsB3yHnLwJsDMX35bbvfXhmNngEm4n3OrDF6XmWE8ixjFBfwBtuaSWNyXDBea+uwFSHGlTISZsKqcojYUbIehaNu+LRMXY0twSOt3Yyj5yh2Pfs6uLMWd9x+F3vgA9DeeV9qHnTDbu2XGkZ38cqJQY5Et39GVhbzU9GdGi5DNqWtOuox4DKQbJaWMw76P9a1Eg4ZRTNq0U2JNNXb3G1FdyzSs2bNG1zEDLM1d2jDt7yzlNWTzWo8BSZ4vfw91H8c5fSqmA+zVx3aNmdOEq2pUDmgLAa+YY1xNNFcnYTJ1J5jcR4Vk5uvtbZx\/nbiHj04M3JjNcHv6QV24d9GZ6rIM7SF+KM+RCrzkySqO43HELpnzBAtqT7vExzzglUePpFM78LEymy80OERANu2rbEWbGHlXB057zFlvQEYLqEWB6eHxzEPqo1G8gb+h1pw8lzB\/Mr8pFrDrHpWdnGHv5eDzZRIquDGGC9JVhNX8fq0bflaBYKS8tyw0AC9KzSK1LEYarXKeF5qjNf5JbK0A\/NNyWVkNMT2QED9Az+wBDqeymjWiyq447kCZl3dL7rSbN3GmC377b735Ze21P3fVUnbFi5itPxQw0P3tETdJucgQ0QfClRgFEDtOG0LBk4PYSJnAqO36ud4QY2aW62CR+UOrhOpZ8ns5hjGOeo7WzCr1hAeqf\/yHn\/LMq0V52pFVZuss7YBwjveRoMIsB+aqptrRuh7lU1kXSMOcY\/BiBBVQKXZi3ycTF0cfcy76ZvzZeSp3rFzvZ9p7TArY+lmQKc5klXMNLlyRUEVH3M4x7sacnU1d90xon35zini0KOZzJaqc9bUb\/I63mvcmQ\/4hHscDUqUDsDHc2rjqCF7sfg6D2dsFuklZZwIyotGUVfhuuiyLv+q+p5vIuKrTFipz4Zcjo2oiY3pjudXO1QVcpGR5affwLRZZrNkWl8NZ6BoQbns0QiMk5uI4pXxgCqO0VGDzwVM540+8W9mk48yx2\/Pol4VhC1p3\/tvWlWM88u2VowYZF9bGC2ON45z7I0ciaCxJBSFynRk4\/p6WfpjDvUYnU8ZwjngL+YloOZ71y11BnKU\/MloZISNaAqI7qkAp1xWWkcH4uGI1uKHmTPG+gDQAx6GyWEHtmm2X63KWMXC3NNFWBSUe+m58zWuVr3fayBzW3MgLHv3MwFtpvrR4ct2fM9x+rf2i+ffjmZkWnRnKqrkzp94ML5vBPN+vyVuLmsV24rg\/DBzoc4eytVSdHrYRbUyxl8\/tQDs8RD7OI+xgzt1zNdQABkIdb\/t2hbaU00gBhfvMWxh1iMJ05Dpf6u+KECDNsZpb4PfKu78PLIJav7hT+c7Dr8qmUy+6\/sXgXHty5h8BDpa1XAHale+QmX9\/A9xIjJ3l8zOpvvd79UPFaOP65wfP4H9rkmaRWMObvvNGt32t1XGFCzKgaXCXg+WMXX9xnVYl9fsPYQuzzAo6zfmOfc2p0KdHh5wGauS1sfYWI4fT5yXwpukDY9QgDzQ0v4bV10EsduSrwoIImG1ttS44uZYiZgvmOUhZe2iG\/IznAwuiC6OEySZJT0FI6e3zZor\/d41dvkcUY54ME5aBzu6e2oH7FAbviJ65K3NZ155rMw+v\/49+7ycUvldEJBvvo+t9qpVVg34\/fVauKw8e1Vl3+d+Kv43LPn8ocfrysJQXgkospjn91+ePT3qyIzCRT1bfb9D+LjXM+jJlu3qbpt3NE0nnqi4JVcQPn0xE\/wl+udh1Vy9odWerR8qWiGihdfhPCvo\/MG86d63Zk8VUROywcHasf5zxvJ\/2uxxOTZ6qnl8npyPI+DK5zCD5De+RmP7dyPdOrjn+IyqVhfbkc2ec+anDQwhPIJRyjrVwLID3D2WbjGDcDI+hPzVhvoP+J2ZUZGsrfesFWXdXvUc5nSHoOx+iINcYPvfqgQP12cfh6eq8Hh817qoeRU+HJKrXH8bo\/t3F1muRiVWVCBnGniURPb98Ub5LdjCnTyen3JWaq+WxDA5g83wd18fMI0l08u41YfagILOtYkue5clwmGw2o7\/4FeaI8YEZ5\/XpDVq29r6jsB32uf4ctfqdvVeml5EcT8951w0uZ7Az8LnrDiZtaPUUVZJqqGqLS1flVcVGpep+a8xj6eCLBUC\/W2U5jp+bQYNdU\/gI1SQzzel12z7+U6T1oJagn90DsRL\/6qCNlGFCHXUyvwN9reG3Jqpsx53ucYTpbvbcfpYpYK7\/BuE9urtxl9kgk84iG9CZEab147mZSt8LkyB\/tByhls1RF9e65wl6nyZy9puBdBH71CVyMkpn5FVX8NteOmOP25ElKRSysClnA6jKstYcKwNJFXGMSFqlfmuWldbcga6yfebDd3FG58WBf3f3\/LE7t9N\/ans54fVjXNJrj8oKBEHdw75c4pgD0Zgps7ZERvXZKb4yrYFf0fQ+SRHoRiRkNjUPYZj6x2DMPiMb5gqMzDbZmtuTJ4zq9OAMlfWwTqVYr512OwD6XoQWGJ1YxnX29aLZMv2LSbyaC41qctYe04jsytpqr+yx\/eb6XCGKHjZoZyuu2qpDUVfjdaZUK9jyuQW9Slfml0VK5kcN5XDx49DTNkG\/vhy7tQQZh9vdoQg4rSQuek5ZNqhfNddoo2wVePe\/+h3\/JpXqLZWQYspNUWlVSF1RmKOFomg6ut4ZcYxVucAX4rjc3uNSN8rBOBfPMmUubGuM2YlUJ34veLd2fWw7zxSVzfzrZsPn+jAjYyhyjR4G18JJnsGu68WsxwLoxX0qU9RQN7fvUPv0yVP19sGVUK19QgAI6DX5WPHUI2jLL7MP23Vmcr+ac3PN2Ysrjz1t3nunb7AEWqHWpO3ebCOBd7E04iVGr1W+ZS6vZj5q7G5iYYHj7ftN+djSNU2ARFFYlh2ag8NMxyL\/3mmkwT8frhDzdPkYpKoyY9wtde6cZ\/fXBWW65UXgc46KwoRyL6uPC5u7ado6LxbL60g1O3jekGGtZZsT4HJf2OEmyEnVAGuY6+XJZeRX3fkbPqQWOAS2k50d7WDM6hsW+NwjLizJpNOtJFI0\/qr9Y6yLYkrz56YkY0ZnVqvjQtZncr0r7x4bmtO6vl60MGR1GJhz3usV09SbRpXPzeCt1g1dR5FTdgtI6d0W8U\/98VxkHYx9ivX6JGJBD81dlRq+VntOzWVz5oLfEwjltb5FO\/QTW7Hb3qE64m7V8vsV13m9FhAP8Cnyjw6YDV\/2VddYDxBv9dwcN3p+84JIH84C8C3WuB1762NAri2hcnJNf1ay+hbXvEq9ux18wMP4kNGyyhpBdxYxygJPdEnP0Z6mpaIg\/vpA0yd1\/CarEnvE4BkVq4vTqoNTwuoqzF+1zplQLKmm3sIqCoz0iFgR9vJIZgAl3iA6dm2X+2ueq5+wONjc7ht3Aofc05cNoFzcSJzu1Mpxl5m7zhKSF1lzH10r7QjH9EvGKAiiK3xv3ygMm7t56FBy1Zp9ZDO2ntH+flAHQ0+U7yR42zrtT1E\/lDoiG6EKMKYpy3d9crMy\/GgAdbQOfervq\/G0W6vWhqviQHaFL1iV7zDZf6bfc91uh\/I5QcuZV7N4Jhz415VyCA46XCN32iCYlolqIpOazxcNeT3byTLklUNuMrocv8Yx+6eVgEVV281Rys+iG2xORyBze2RfYZlnYO8TRStbGNjjcBBd\/Wls7i2zfFHUZt3qqLHCFjCsPzZ9YMoXSuKnFIxoHYj\/yFgr1bZV9XL0yKQZ2RRTjCSLyI7tnJOXr2Ybs2lBclcv34xkA1Eoh59rwdtUyxZoara37z3\/e4bGJH\/8KFvjV6KQDfnYogaqIQOmtciZogjHt0G75Y2X8WY0asR9THbc8aCsQC\/9w299e0yMd\/Bwfok\/3U+OCCcOUemyts6sH1+vg78GB3+9y7hHLPwu+82sddC+yBWtIBT4tvyiNwvSfqQHFPw6HrPw+hf\/lwd+\/cT6VnhmgGiUDw3frACrrCohfHLF+civhUIix0Og6Ceh4JRWkGyn9qq6tojKzD8IJhCWVo\/8NhTs9VCq+y04tyBfVHTYpURuoLQxcA2rb\/OsXFBtUpKZIGjkR+emnNr3Pp6t8sUUPYiWua7o74eBy+olgHPd3CXb3xjOQrUT\/0b3fo9K0HWeL2M63RG76zMvAHOYMXUejlG5voJ7kSomzJn55SaDWLUsLUaOq75VbzDXJFu5eIeIIA1Isa1FctrS+wT\/aBhvppvPsITzFfIIqzVqgmi2BzrzYx12k6lL1fbo\/v1MeyiJzlFYr6d4XnuPWtVlKfUI5XOKLSdshf\/UlfMhUdcK0a1yXRTnR1VYgTzddM5qoJs0PtWIOPJz6dg55X1BumZqpTps7+fA2U2em2qEK1zlhv7alrlMfOqUPQNRTzfpI+1bmGHY+qbJYpbxFJhjWLCXFWDG5r3U71mopzueEVLWmAe1oaxIAa4TpgPF6MTEqkXLVHIXNwbpzX1hvPgDxD1zquuXhqT1TKuqozzewU\/TLvTp44qMTh27n3YnDk+l9pkpotWItWI\/WVGosOID72LbDmhI2pdbP4qb16prj1la02d4mQ9w7ijVEN+MymmyuflTPyQ\/M1ZDzLKyGRv1y5XE65YmLmIZS5lkB5\/eKpcXh27znfciL0GHZ3lrjWqbRQX7f0c+3vqWkM5V\/Acw1TgvADjSCjgH86eTEun+ORadityWtNJKt+gkaMS0ZWLNbMmMUT7842Stts1JtcBbN8CC3Xq9UN4nbTxz7vtnBtpfsl4zmEcLvlotZ6ImXoPnLynv3leCaQkptGRna9stHt+BSx98vaOxaiRzFNNdn2dPu+qgYwpvaz3OCVqg\/Gfc2PeIP395xqG+gZR1jw1J4sV6YVvwG2lwFit5F\/jXtNYhZkuNrPzqdQq\/C2XwM3wu32TsHvGHUmcD58V+GCjjAbqxHO3L5PuPnWdiW4Md8PsYJFVIOo4fZOp0Mgxe\/eQqVnzO04wzfeZRWE8FsS+7MfccXl4KRnsHUFMvOCKzop5zRM3q0E315C01h4vM3JYpi4l37wVeFQ3s92+NbKtlLNb1PiwjSgsWj7yOMq4fU6ikWP+5Z75H9xq\/unZTPFVzSoPFFiNVe6e9IsYarF2GpHnV0Uh0ZIh0UePdPB6x4mWVRG6PWq03HYkc9Zsy0jmijoycaBvhWWLqLIY47mf5009i0y1vSsUHzMZh3H\/dKJILo8sg\/tGpT+16nUKyeJqHefHke1liLrPOmvaC14ojmJLfDVIqznnq6ZyFId6JSdW\/XGB6qQPIP7kB3zbqtqn1hJHfEHXDqv+y67RxaGfflMCVGbms9qpq\/6OtzoaJOoi8DTZB1D+WUdQL7Q3LBSZcFPEnpms+t9fNAxeZWXMmalpXAvGd49fVZqUPirdV15bPff\/zmXMyZWPMpyyN6vjzlCt6Df3PR8ix7cP+ERHW+RlPrknYWtz5\/N\/rzkKNJNrYqr9nPOiRlRpniWcfB6L\/yqT3eabu+d9iindi1ghzjDiWxk0USLw3DhbgQk8LJ9hpE3bpu\/TE+9KYEZpw3XD\/Z1\/+owC5yaC9bj1jfNeYD1YbgJ0vmVL1GR+obVPjJjPCH1cdOzfGL5YwKlsbTU6f\/XLfjCm4BwkF7NPYWSs1sAqkHPcXW2U46OltZQbxZz1nCk6nsyRYWIz3p2r1VvDmfyQK3QVPyjbgyLVHlWiTXFhLcLCZmOvjm1gBTAKz3y5C15DbRzdFwtiim2G8M3PUTiX40j2ynGeYwuQ6PcycOchr67dN1JMTXED8Gz65dvtM\/Ls42t535UAd7sB+Wzt0Xej7IrId7hnlJ+LUB9lZtr2Xra8SlURTT8tQ2teAco3TjBrzlbxuRqeoxP9Gf+b++99lqwjUER10bdZpybNhfg3w85A18h56X2r+wcJZpK5iBHvGoS2iBs9Htv95aJsw2dLmOU\/2erQetixuunDb+cez9fr4RXDwvUfIPRFcbHpNmc35jS5ikBXX981Z1Lfg8OCFer7ygKt7pa5K4OuO3DxXZegVvNnu3vpVix1jHs3CvS0hvVPOknLeGwcYV\/tfmWkjgQPwpjCVnCTLKvjtF5h9FMPUAIyLkdWNlf59xcd6ucQ6BVGgH\/g1mMLXh1To0WNLAyXMR6vqDrHUIxVzwg6Drciw5Edh8vlzE43BWtdXahs8w\/jvwSlqx+UoaswlIXKOO177qn5EGfF3fNAuFdQ0nZe7RrrMngjdN5uMeP4Y9rqsRtW+QB2VVotS6t9BzRuPZUMnYaMtTfSTLX7ZIseNSga5hMa82Vz65IXhSL6t1vjOD5bzU5rVqV1iWCqSU91BCeLoXyB7hRVVa58tmh2p9c07urZzg739+7Nm1d6pd6ulSoiaQ\/Fmy+bLycCfKPtZ2yNvvN9WlZf0NfJK2gdiw+VmdnyZpWohF8nBUeR7bTZOA+F1cxWbUc+j\/xl7EVn\/u3rlUDvVbh4EuMvCrB\/K6lZG8eWoc+H7CjfY7S5Tq7JYvEB44HNfS\/BcyrySLbz\/q6wwM2mnnqMpEfk\/V+Wg\/9uT3RgVeqOsYv5zuF5ULnmFA4n9PiF+l\/L1P7Vib0dY+FtwkwbA2vduXErNetPEDzOa\/4SW\/ihPKHa4GanIgGSiHBNB+8dv6iS1AyRN3vUZmqbtQdjyPvc59D1VsZCnFAIZgjOxMB5fSqzHCP7Py+nJ7sRUg+Umd91LZfqodCW51mspbEhXl6vSsvneOUE\/agOkugWt78s6RlwH9T08ttedAXmOMYDlaICn2Z3a\/KzOKwqlkfm+rywmZga4WnLwnKGKlEMD9FgSl7YqgUtwVEQoamE6AHr1YXxB3kkflT4V7XJS3oyW08VYL1yIFkx4qrz4R2XytkC0IdiO8Zx+s6YEH2wN1xkJuU82YIIy45k8anDRzttiQgWrbuuvmvxOizy1FFXTeD56gMoHttRc+d1YRxGJhsyhmknkSMDC3jnjIqOh6gPYjh82EZ5pxnr6GmD0XCMONnd+dc7Fq0fapR3p4fWKazdmkXbW0\/MXsa49RQZPW9jJV\/GAZBMYu1bUVTgebepZOfKPHll9d1oyzYgoDw5foFpROrN\/jwwVyu8o\/E644xw3km1BQvEoOd9qkcJhp6A4zVxC1TSqgcMuS7+g+ahu4quS5fPZRvr5daEr73Gn7aTZdc\/Vsvdk8o7PCY6XLPIe2QBjFg\/VgxwkjvdjgzsOGvzgJcUnec\/0c8iebxxLuF4Vp6njpyZPnJkM10i1+K+NR4012P9E3UdE0626mVlUqnz1GUpvAwYUr2PSRqd5RjGPbYLv82H8kmu9XIe5D6n\/B3hxVJ\/Tu1TVx432boNbpEPqNINgbGrAyCsY8g4f4PrFQXUPvVbKqCfasVqQ24CA43J3mtu5+nRd1de8bysJOYE6udgwmZk13bCHee2zDc5+GYcFPOK\/JGJznO5tm00UDO4mdnIUplh\/xvLgyhmAXbY661ndhyb3OtUxsbvKBEZuxHDiqJVbhJHrilwB\/TIFZdUmljgasmrgLsPm5HgXf5lTypiVD\/M+kwmpD+ecVXJ4eqjWeOtxoXVW3I33wvLwtTmj2fWi7Oez804P2xUXgJjeFZmMD8rt4CUYn8uduN+597IGmMwOz4SLUSUWldTnc\/2W6448wVi0KBri36OhXjXyhyfd5RXIzS0ms0YgumMIfNWN8sKr+KWmYuALEzV9d\/LOew2P0zsl6fO19GCOLLOjEC8uZKHyarR8qpe0cY5TPfqq\/UQcv48hF6sc1\/9o4TTksUjldnxG++NCWSWx1QSVsOw8rHA5tt5UJ9yA\/rKsaBmfsjkmvzGAkYA0b\/N+ncr3O4xDoERvgpgZuSsY3M5YPlvNT40uN5HxYYEIiZGtrJs1H556nna8Q5H3ua6QzSdIX5\/FR+38T6N1XphrVVGh9drfBLanZXsymaf+sx8U\/Gren0jzi5dcPcZ0XU4SHRhutVYZ03cdDX4rFb6q\/i6o7WYV7NNFJPKS5iu745r6i\/KzzXLQVOC5w9BilX8uP2jIK2Fx2E6gSFvNfJtlTqV7zaD1TG6A2OI0XNHYnx8M2eljkDcz6lv1C8mz3WWp+GLRbNYW7RvpDuitPq\/UYH8xhYVHvIjZFzBkoL2KphxW33sKHHHd\/EQuqtzJKJ0TD9PDt\/AlmTBv2rzcYrviyi2RlnfnKsbao14gRlsES6hBnAlpxCO43ICUmFHULxW52bJOliiyhO7c4Nj1OQ9lfBWL8GzLEb9tvzHKNkSJtIZzZuUxdGNmxNHsfFLq6O35l5dVt9gHFEKEqcuHy9LBOnjacL4EJWhJWpLh7E8zAd+oybq2YsZcm5JDVpV\/9YX970457wYMzx\/uWCm+R8OC+O1zVVE11nxeFtX8Thb9rMKr27AZaLLXxhW56IuogBEuQCYUwWtzd3c4O05BjdO1U+YUNSfO1rEGRvcVBSDCv4FtuRzSOM8z44llJS2\/uVT8bRQ5D2GbZWPXYPBXSuaPac3XCO\/T1+EEXssBvfOSoB6LTb3Dq9sJQia4WzGJCMswkVRx7T4zanrbm2fs4fm3HqXC1+9NQq6tWK2mW\/vrF3mPZvn1eY0pD2\/ullN53qp\/AeDJunEbxW3ew5wfM5VxuLRPDmyeiaP0m1ScxesuIae8KU+BAeEL6nTaU1TQ9aEbEGUreLPGoNjLMOlzMJIUSAwNH2uv4FpMoup6fjKiqUyQdvl5HzVMTnKRvu9F9onHsEC73MsAW\/82HLRxLd4xHf+Aizt9a9ffRVVtOdeJGiYSKUq9OQd8bTmv7+t612a3WyScZdLGtnde7m84bFqWnPeW3kvm2UoULMVgHU7VS5fNjqPDVQP3jHD1E2zkgyXd+A\/skQPMhGYJnPBRj4XRa75mxbGKPhEquP3ONH6z384e99K\/7VJ1aF4tNGItpVX5YuvcQVVeTdXGl1V8z7jBj34A3jsxXuMy3ZE4m29fUWJzNfqgCPn2nhEpbSNHq2Gs+kvfXdexT8VR4bMT\/ZgL\/DHusrZ6ceH8KnZq\/yMNHMEO0\/TE8HP5zgymn3KmRh\/M\/vUfqtSa\/Q51TnKIrZZOcwE9cxy2jjtyAsdD84lLTR2u28nbYhLz0DqTp7Ko\/WHC5mEvH+d8BhkDKMOwGZzZ2FcmJU7vBRjjXZfJM54qY7s6d2ilRmx7Jfj5\/pAui19mYjHRIB6R532ir6aCipqrbdGGiUOZqst+au\/6Fqr8eVc7\/hEXck6bCqQkZ2POV5UB6m33RelC7LxUKq+iGpsCeSuCG\/Wh6NXq1X9U59Ea36igIcP9dOynxVPlVAfX\/bo63UTtIyuwkOMjkc539HM8SxwXy25XewXWD0+8xpNKq9XoKwywk9fBr96PNTpJqdQzSHvtr0aGr9DlGzB9K\/OR7fNtFo8BJyvPGYpap5nhnOGgo0aJWUMogkMgisYW6ad\/iyGiV7PsozdEnNbZ3+w01yu\/lZdxBydnP6HZ6khFaLRbCbRuF3ZGZQ0vY9tdsRHtWvV4YM4sy0SuyeK2etTq6C0Wi3e\/fPGi\/t8BbaUujmmFunOnXnDpq6TuP6Na9ziMHZHJNZM1nR6DXvtDM3oZ34SflE3YQOwjF8RTx1FGZKYtbbfsSHyp6f8uiKqjBppe2BqfcBn6Lftg6FPf\/AQkf344+FHXWZt2vikVb+hFqbN3uifDrJ9HA6mYKuoxsZYpHdjooI3AmC9fK0+wiR\/1ZgIri7mAXjFDFlBeY17CvADJzfiT39VZCPIjMD6OVcewRUYqKrxqzYzxHtrs1vJETdma51a\/Fu55XMc0S87fPaJ1WXvgpZ62rUNS\/4ii14RNT3v\/GC9iayEy\/UdesGV5orrbCkLEEvyxMzlRBmKLJ47hHfuNf3ZVLvBXzXU8ZFz5rp8p2zHR2xptaQtjqm4kkBr+zPdXV4eEnjnZb2ZR+LKMFXRrlLLFfqlOTp0JrmuVjJnWwD5aSdbkUFeoVaYET6gEZyrhhsbIyPQblezY3C5FKTZxhzGwzt9ccRY1m4ch+xlbSqFLoECmAV9Ct46q\/KTGBXt55hgLzLqXJm7awauqJHfwfivj3mIjEtdNO\/Ef\/FpNmGqoeI39TRyyEP16dGVOmpnvV3kmIlYgbvBqj5TFgFRxxFsK2at3+V+9ysGl2IdFkApeI1qPGfBY84DyFL2Yn2xp8\/GMK1A+VLe8DMFzvrLbUQGzMgsxkpvdpFY+UwF7Ic2gpE4+Wajqw\/QY5WjDY9Jl8cwCNyJQugWi8bsG96Es8DvhgCXfln0ofKt2ORjK9oMi8ExYLMnd5iJas9YZpXc0a2ymy\/vbHMVyvUDaDPVI2OhMGNctL2z0t+edrCVnsxxGfn0CybAFDm+1sEU8YKzqCJ0gmrRjcqOrG6uMmnB2p5ywlBzQGC2sKVuqu9kHXdSjD3GyOuqjPwPCv\/MgHjNEaYN66zV8eo4\/vnuEDQWn26+2WeHi3nrQn0ypo7k7\/XyVrD8rW8g7ve9Yo7O+tFP0C9Hla1t6v1YJfnzO7HpxxraWmnMZgUyduv0cGiOiY7ubm5g18B3ayrrfYp2DnSet6veX+OtsfqHhAtpKuI7I9Zf5HzuF+bAu5MhON1sV1n0UEXHqgKdwDXZlvhoOxD7ZlxmSeWPKXFIICdheUgtfvLm1Y+t0At8xDUfzc5UxAhdFLelrvEfKzTmXc4bIxADVOG5hodgMk\/NfupjAsAeXr3w2HQt01PnWteAA2pPrUeuzGzL7zgEmF0FbF8Z3m\/COdwSSX6mRfQ1\/VZn5XLV7nTDbIBT5rjxTi3N0Ucpm4PyX5kUdHV3lmPf1cZ49OG2I53SwKq\/H46fglG97ZDTI8jsA9d919ugF3YDT0NeHSRYocK23ixmQamuqFDcCjKPnhPnrKRH1WXiEj98XDbKqKfCHH2gaueB\/uQd91rOHfpRHNTxsWvXx33tj7p3juVGahCc9xqKYmooWDymYWNpPkF2lVdmaMU1Xf0swVbav46L0t8o9pmDItyj2S875Ujyp37LmaiWmr0K3dEG9kfbkBG2hJtUkEVjGuU7cOp5A9Xz6xCpU1EMkqmMx37U2+p9brDIUz15rSxTXO1R+6bSqGOOqI9Bg9Fi6zA3\/9fklt26TRqEm3ucO9ibCnt2sZoMe+9z1tsKnBZfZIQjn6jD7tiw+1iRT1vc3d27yqTl\/NttOrJ8vup6z565LpVXkmDGsh5Ro9c2p\/beLBqlMkB36XXKH8bGE+qCzOeYd9XC2ga04k\/PMek8zAXYOKVS6Yh52hFduFJrEL8ihuXl5nPepiiCvcTp6vbV0dRVLwQHu3YcsnneswxgXofWvuafd692tEY+HyLP+027fsOeC+1ov\/GJgo8tW1U0l14ZW7d92qmuqsTkbU5uyvIQv5nBmqp42udoNBVspvh80bcSXYmoVadyU7ygukqi46TqpkroSxlRvV2V9D5Fp1G34ln1ljPWx1TxxeJ5XuLC2BazOfnHwyBj1e19dMokYZjywPFhxn4tLaFTV2KGyyeW7Hk+ntiQx+EJZSzPT9GqOrsHQ5kkTM51C2Vyjq1z9PRhjsrvlruzdU1g7+2xq8a978OHY+qUenw3CUCnZVg0aTo4\/JIZlXPoQmgKJ1YbWznyDawwXjhtay0Q7rpED\/jbBjaSdesC01dH9Y5P9\/FWUo9jYOdsXU7SHYzRdzSOcy\/qtEhRAXcuJePlXgzBaLG51ePyQ5vmfRXVGlSRiFpT0RnhI9KuXKvi+jfv9bj49KIzGdurFuSo0Wj2qaAeefmoYPvbUYP5CT1UUf88U2fQOhp38HytlsXVRh\/J7TIC\/kD1JSu2aVtEcfxBZucF4VC9nVwX5YVLqzDLgJ\/7CqtSWV0VVUvYhn6orq19Oy\/PMTFv3WFzU8x2vu0Rf0LFUrV6krwOE4ur5PO8GdV8EVPd4AzVKG3iCYcMUdIksiXMgk6RYzJcvplzPEcoU8uAbCc38iq9wzjnoBP1F92KEsxMf45S3p9jK8bZb5U+jUWNu3dZHO8EQ63rcqhKr84QG2N73PF8HnpWlh834pA7HfwZGtjeplNpx3vgOmfnpuuAeUUuykbkiTNsk1nlLBvf5Ny41jLRcyFTzpnqT8ee0lHzdQgiFGSbkbe29norWOMhQZWlStlvcV1E3P4qk\/plnnpjEaXjIs+HMmvv68Q4Fyo\/iJx7BRxEHbsy4rF6BNJbEYlUaprrWfBK+btPNHKNAch77ABu+D6\/aeSvHT6F6biIA7gW6ecpXbtwb2u\/F8AqeM5jVZHjVhy5UoONcv5yV4hXTeNNImLcv1VLFRNLGfFvff\/lScY4fmle84zXPvH+jY27i+pIv1UhkomF2rrZjOPhq+nRXLsjlEN5n5zpwvsNP11DtIViq59+TnXW9xIbKwreIoJ3dxJcKiMCfcyP2sse3NtM3IjhdyVW26QPov3xDXMEh3lHgxLwEy0AoTiYzDUdg15ZmfdRVT6pOJb6NSXHdbZU0PaT7ZjbFHXeXCVxpuPocbVYmadpJHA7u\/apXAQ+4B5GMTU51ZnqG1cyQrTr1+ajVmeJQV1R88268UVqqkvMxmoi1AxamcaWedvfanLZhu+3RVfW8Ir6Sgzgq5fZMaEo4S\/tUxd7xbYXIzC1\/nEjnduN81jxy6Z\/97Ev2CrI0RkTE2psCOr7VVSOr819wlxkW7YVHc4W3KCNcMQ0v6qyWr7V0fME1AlasiyVhxkRdaYP7gT6nF63VV7jyos6IZTd61WJWLeHMYZKtm88tg4RpSDFIxWqMRFA9WSUZr6ara4xGzN7jACe0OIU1a2HjVRRSyTGJ+OFRvN8SxdCVH4xoaegnhKBjiYeApbbeKNc44fMvG3CLcXDO3vD7GVRHSScbr\/zW6zjlp2dPU+Nb28cFBxFBZ\/TSS5wIXDCxkEdTwyHwSnZ0+Eb21TZOFmDqHJHO2\/M\/FR11mLMuLEd7jhzHZyAp0RwGtKUlmO3ksA3lVGCdKvCmc95l6meq+v1Vh0zDEI9yv4vc3xHcTXLSupjXiW79AyKqhhEEKYct7ftvKh6i9HjJ5WdvKSPLxpWSV1lbk2B3nTu+uMicONtXbx6oypQJlynKxIw0z7PW4GTnaWYwoFNK24YTAWgS8z59GQeZtlYrhatcUM1BH04\/f3Wl3xM9Lka5q1b0LRVpDnoLFdLPkbzybDZoeLkwrnwOVy5DydCthOjqQvtvFEPtxvL5Xs81zsXO9+xIm59UUOxYDEe85N4+ulGR7o25wGZn\/NAK1DE8QzVqxrrKoeaVAqIEPv2rXfoeIoTMC9u2KMcPo+TbofGnSMoSZah9WJbPYOzRWSaV4YoPzeq6oyaK28xK3X6q0\/pbeioaoKrKdfLflkD3\/VcwfNh5RMYxjooH1XFqPPfCPs+zAFyycx5yPmgvudaxqpHO8gXyCbvfouTowILoNZYwJ+ZE1jto46MkVBF0wJGttrIaHc\/F1ZJKFN5j6ph1bQRd3x4AFmBHnpfADQRT6LCd62VvpcBWKBsTh6GJ\/pr8OZHOopiqHzDGb1ERn37u1bsuNueYxSRhwpUXr4WK7qf80uPq4pxtHi6UnzKGa4+9Fzkz+wwFjNyjsRVhquT9Ea1qgpfHMNC9rCantucRrUGdRTJQ\/PT\/dAK0GGraGb7mqoyJ1YX\/H3+cfUIIlEhcg+eDltPeVrVop8Yc7SFipEteadlNbVYbW8rZi33nv9uBKbvF2vYd9lvDeNV0LOOrRUwTeHdd04Id8BvN9091mFnMpdx6v+tXf0jkYa1VYT2jUspb6u8f9igcSaS\/GWdwqs4D9HBvMna9PhUZscliaRe5VyEHpYxmt3jS7WFDDgXcf+QMf9JncpStOLcYePDj2orsxLF\/ZvZENud8ZYNjOtYdLVXBlw2u+W8YVG+ClUp52HKRvQ3je7YbB9VcdvMs9k5z1R4wlRdB5cP2gdaxBoXJQQnfWZlgG31my0ehqaTvEbEZH3qXS6RL7xKiJiSK1rjqj7dC6ohT8oq4kJ+hu3HFmNr8UHvxJLWGCV9cpSI10WC1Yde0Y6+BASL6MPGIeihJG+OQfvwxcicEYs8YwT0JYPIqPy1fu5oGnzCsTn2Eb33zZ\/GlDkeXi+XtKsGXOQzmrzH\/RqsIvHOvfvgeVnBe9WqWniPx4ONGmuRRS\/ITN91+TBVq6AoRdfaL4rVvbz2nt6NS9r0\/rfG0pGaL5ia\/p4zWC4ZAUzP95XPkdSDZARoAJVZPFSVqBSd3Hn04zqQA0upzFxdaZTMELkhZtOlx5foGJ6uo\/v9y3lBqjfDx7nj6OaP6tzK4KxCP14aHSsXUvlGYnX7\/2rZ47mOE6ydhlj3y\/Zq7HclcGMq81tnIpHn6gMVaI3KIcf\/83yrxI65iMIrvfpLHH5NGuG58luN6Snn6LPYnh\/BgRKxX7fFodnVTXTWsqDa5ivopZhe1ItgcYJHyRRUUHWJ9Rc0MUdfna2XmSLKnVbHsaxuh5FZGYwVh5MrTt66Et2BkWDs1kTOlwK6Insr1mMrWYM8wW48ArX8pXLVXsYKg8NC4Ge\/7YMIZaZcF\/EcenGfubUyttf1ZT2AepuvavW43FOuVW625yrQHivq0+WmrR\/2+nqqPHPaCKnCh6vWs+xifcOVehUZklmrIOxF\/Yvyx+5zRPpKVwytarBZjLLWwMldthkduXyYS4ZgLbIMfzHKzHm+bi13XOABVXAdr+rJJDznujm3pQ708cQCLLgOorVeRcD8i1V57xxF21k9tu7hPVZVKP1WCfZyMZVx1f\/NozjlrKZ5ccVO1BjNeUaj61rh+JO8PdyTXbLROS3fZXM+cST+QRCbPF\/SnqkjIqhyqmFte9lrpaTCpqS4A+qQx89vN891dq2PcxBwSvdh5s2Fyin3n0qJUkaMq4TFqEuUCUVJDMzJZtUZg6q3TSNm9on+44WnWcxJ90FVESNxVafQ8aB\/sh\/15arMURNz\/ak12Nl0\/EVVk9PaqPvnr6+AvJsLtYiC7m9XhlR7ozOE21Yj3ljDdM7n+OHD6pSOTL3VEPcF46p9uN5cMAdbZv7kWUTpQRgbKOS479YNu24x9P9rrQL4i2+jcAw+jlu1g9uOsnlcvb7K9mjiy3\/xKJfSrzwDkzOeRBQeo\/WLGJjb1aFcp9krPcGpLDQV2Sudb\/NCplC+tMn3KJBxxjW2nBLr\/jIi\/affLdrRv1EuuuVq9VAcXv2JwlNKmafxqyqQUxkIBeR1qm57lBOawSZsDH+O9J2vXSXCVOPRovipW1ri6Nbc0IeNyJysNi4ZE+SZ2pBq2D3Qdr3c7tb+m06jyuc09ll\/1JecyYvFzr4bgW\/U4hhGDwIOgzpk8qwnmt6vHuESso2a4bdAR+8PgIfZmkCm4E6srsOKinlZuYjn5\/JQAZ2wd3Ch76F6biSzYDRQGErWXDefp2hwxDDZVloL8GJ51COauiIqfcIzToDZo51UuwwPxo7FHqfD33Ww5GH8vlUYLE1L+XPrPWLCShFeeVitxuSMlo7Gfp3hY\/I6UvqG9eDW5okZ7QylOKUanPP0I9vX7aDC5fDH3owsI7xPWY0dO264cqsqXWij\/RjpVm6LDmjiPvcqAHyWZ7vzTdHYLVCJ57\/kN3onbviI+wHkIOVNty1OczrTQ+Gp4yLQKqBOrYBx\/xwoOPHYElx7PghP4TEv8ju+39EN8c97IE2+g3l6XP4xCxrK+drlCITjiTpW5r9qqyg\/p\/F7tfFuHf3Q\/RsamiGHk\/3DodzZetxR0V2tX8ba9FPHKh66x7998XmM4rB5S1B6ksItz\/8UL8MfmqaGWW1fRdZZfu\/9MxcyxiK\/842L46nUeKZKRLv0X44pdToLNMeViz5FbbVWPGr7aihRK+XBsmQCjOSVfo958d0t1CJ86nwt2OhWdSNF9bwUlc6z\/HsR0z1\/dIJrTes+iXDGsLO\/w8x0crrUSGyVhJfLPPt5x8dVzedQSfUyEpEoF64WyvljaJH6kN\/emQ\/R7\/24YBB1CG0nCmYEzENBW3uPuebWiRoz5p1sWTHRS6CI8w6v5al+WILqBA+tKWa0cXYE9kD7jGn1t7mqJb4Ld129DXslCrK0ih+GxR+Z4BOlOJnjnmuTHINr\/Z2P7xVZAxWRsZbHp89jYUqXlUNZ+eslescuPEnnb35od0w+gmJ+z9kGaVVR3l6F\/J5zR6LFqOwBi3oVxameSCULsDxZAUfHxqIa1RTlIqrQm7\/AJWRfrgjNnuxVtiayomjX6uJHZC2PN\/T5xs+31OkTimbw1awS286gCEs8zTAKRyyJs\/XEnpkN10Fhj4rXMfKPa5o7mTre\/7G2n8nq2uB95iNjiX6V32mLe6z2v+fO1srj\/W25vt+e4KVb1e02ID6bw9W5bPxu4bm4fJ4wM0DBiBxZSdY6Ktk0z8t0MApMn6j5jbZzZM+3U0N87rH6NBXNHuogyM96CFT2DEKDTj7AL2jN\/lxXeg7S7eCF\/Mu97cynGscsumfqJIjTYRYdxXVdjU7AOuBqSxnl8eLmzvUAx1nid3femAJ27\/mwQiTj6+80ZlGFcWUS3m\/oxpVZ9VHLjOcUHNXbJ01YSQXtXTcPF+\/IRD3JYgzyPBqCQqMOVCRx4d+uBeDgscsYqJljjEVPMaMmy4bmEOZqBjLmuSNcRdyUq1Q4H\/11vvpSx5e+jJbvHftv\/7YL4ww7x11F+Yq2WrvcELJmvfMF651584Y6VU7KaIvOrhBoFNA19ojNeZWKlv\/DV8JK4Jqom9+2Uk0KP+pV9GfUwtXJXGtVNPPmrBGsLWO\/FWk54cdNtFtIsNU4fpl3BIwDhQYJZF12H\/uvkq1I2pvGdKQ8Flu\/WCRexJ6Z4AmeR8FhJVPMw62IFYwtSok3FU2MjepfPV98hgjrl5iBl6eZrTVVWe65IzU7WldmZB47RlAuBlH2bUvWsKMnM\/fjqEXDt9LFnv5D\/IM2kWOcqZ0ioThvT\/0cDPQaxjuUJrrgObvhPs3Iy9DUdaw0XtMPtlZaMwNJtS+t5BgKpRZANk5oYesLXH+QstEGLo3r8rHRzSMYN9l5OGnnKr1nGVB5\/MdUDM2o307vqxLKoVFK7nCDXyd1DCwLFGOtcn6mJ8VfW++0ExnqDO0E6bwHN4Fs+KXM13yNCdruW32HKZor6+HrEzuG5LyMArNOz459++pWbrteBO7uOFklwAQv\/sdEZaq8P6bDRYI1ekcbuOtoFWcsoJJTKxx3coxi+DnPOaJsyex13\/51ntOxJsBact7HOT7ina7dmwXGRq00YuN2cAS68k7PdL\/5MWp0LtvwCSd0ARd5+kwebYtxpEe+90c94\/Xbn\/Z57jFifI7+lWesC8wx7DrF2hG9yykVz3jOaYy7X5ZAptyKI2ylNpNFMdnuM\/Sc2U1tno6haaD4NMERPHWqSqUNtpvuvj1EzWHM3hbZ+ZjGyqopFsZu4\/SxNHW5qB23Oxqr5nL7RYFRIdd+q4C6zRxh9qtJZ0+EbJcW2JKZOWIzEw6g0vCM1Fk2l+vcRy6sQk8ViSYsIf4SCJSqvbeOqUQyCD+CqXLQ8zlfT2I8VDZnq94cB4DMdrZsgNjtWZUxh1Zvnuc+sEvkEPYU+SF+s1v8wFjZl5VTj8e9FdFWRmXyrbiyA2sT7\/QR4NU57zuNucsMipgKDJ+1YlcH8C+YO76kpuUHYmFlH76JCWj5MpCsIevM0TYXZuR5HzxOY\/th7KZbt1u0IPZl9PHd7kPyWU3WiS1PzAAvNS8JQ04xktUqvc4LpSjW6tfUJpxn8d1tvcv\/+GQ8CCbkD0bOSH6\/ycGuohC5hxpUtXEBscsViF9Oyuho2n0ST5Ua5nWX9QMd644MoH\/y3LIxxR4XzqG7TXP9WBK3AU6arf6M16ea7PFivz3GdsWe+eUOQbsKobX+vTKMGeNY9HxD4lYwokpuAJfyENlmf6uxWjBPw\/oiPzk\/9f\/3vbncdVEPRBY9Q5ORcPf5bMGRAbLeeE+5xbYYEAk9\/jDXxGvzTMs5tXH5UW9AFY7k1h0qjWyOCsDcKro8PuS3hs3hNAp018XgKRiXvYnr03CZGxysXsq9MIwjZFzihVb5lrZlCG8+DX9qM2bP2h9nJUce17RXqro4a9\/d+rtSM2bdr+h7ngKP+BuaIxz7lOk74zEVawHV1CNyVENa3BGZVia6Q80eW3Wl3J7xZbiSrwIfPy0zVUwiu2V8DqKADSYJf\/8qR27azNi8lTg93L1XONeAluSc8e7BREVlfNEZruJ6d7vGkaocG3lnzDwaPZ53vu11AIJBu03zNK\/1VHSV+ZSZLVl9mMvWP97itc9qi6OgdX+MpRhab2UTcvaceh+do6VSzgEwahnt8NYeeg\/j8Z+ciI6sRpItdJW84kwYY3Bm1VpRslrGy7eaeZ+t4icZqCIsu7+\/+14zjoX1iCtbcfUXuSXCw8PYmlpfoJ4q8H2+5GVXfD7ekamI3FUHjInWMy5qAp8ggmUE9n7rQRAwzRgjnKeea946dVkbyspLcpK8RV23DMZ104c5MhkLvgGhO67V6TFrs7eCyivjXv2I62lXmOOi9opXgPNlfUZFbKIMHlXmHhF+L20D2asiiFDGwWtf7gIreSd3jE9bOcoVR4kW5LXcJ+KrY95fnne49ro5tO7lhLJUq6PZPLZiVjD6IqXLnbPn1fN3lwHcEnMiEtHcRJVIES04kypfFLe2GieCnPLevhGrfKq7lOHPkR\/jGkHaZqVL1YNbEENkwXl+yETinCP3iSG6aKS5l6t6uu+6aOXj\/\/jVN7kSmKKWoZg31cQ58L4CMsu3rel+nhunyD3y\/rtrd3YssTE7rJRdV+dwM991sVXz2kbY5Yydnym\/7H5eyebWFdty35nnst31w\/v+k\/W7NuknGV5kRe74mdLcyl6HQTS8f4iVSOYvY\/DKMMx6evgpVooJtp5v6tE4VViPIXLEJ2gKMhlZ\/+66nvnkrRqK4HrgDKKYnJZNf6tKVhBVkWdgjIp2zVT\/+XCCUlINr1ZwEK0h5mrVzFvk3eoLLMPsjYDvHFeCdjkJ\/zsPMub8g83xORj7rE3+5I6+9aDOzTprVQ\/rlze9qzqhWzdG\/KWaYJd51Dd2s+TIdJRUt6ogI9Dzl6OoGlHoHs7y1Gt8P0eJenROdQEihcq+PEwF8IKphLc6khmCVSgePYYz0Rv0mjztQR7nbCLOt\/+zHZ6T1REoKZtWjUA17EoP7N296o3QPXs34maUucJ0omsedKitp2FQrw7w5+J4HqwO6MuOzpdsqbf4ffWvMcIxoED4qObt6UT1hHiLNPaYe1\/1pNJWoVPpOEt0ojOYO1xGrbb5NmZJrhqlrZwZb8ZZT0hOyuawCbF9\/oiZLb\/MoCvO\/O00ogXcR7Xs1c9aN39xouWFq4Tu3\/HhL1TUmzlXK7EPbDW0zfVafczieeU6AWLtcRUylKuAenS8\/fJfMdZ4HJYYK7wsLqxjME2cYOjhfiuvzhcOzf+tn8xjbparn9qCuO7bjVyjwPmDd+xMb2Dc0KRGdNVPRuUwa+5WAuLxnAP1gAoUda2tIaOr2+EfdLT6wAn6Ir71SVZjit12HBF13Huqr66Oh+VI8vtly+vp5kMk5sHgkY6JV+UgXZE17P76JfLIqG6sspoVDt86pqGLqM1D3r6M5DQEzvP6UVtCsdmO+O05VTDtaw0uGqL4KsBMye5+I853XLT95QOidHEqJ7Y65W+j92qwVblPITb7KDfYe0h0FTLPSC4O27AD1MqIXXuIjbLCVqzkpGOHm1o76AkqtNV5mYnXXN0av2mYFfK8B72gFmx7umC\/zGquJFgM0oYsMgyPybPFBkrUOkc14JVza5\/HrfePHnS92mhOP7mLu3OW8TxXt\/x1ZaaLgof4bQ12fiAM3ppmvPwPq48f2cJKApWHcLRgTInHb0xhhauK9m3O2iRjQgNEeuLFq+P9bNWoNqNzjuR9fbDe4sjBqh38iQp4u112XdEzDOuHWIvKqx2UFhTYGhFMO99rRcgweVOhV41l+4294ke0qRQ4ivYZP\/jBn4MrKmWeC\/4C7a0A+xsbrDZ0GkPydNxZiL\/itHoOh6F9apZ6pRugMo2Hbonv37E2HbEOyFhmdlaV1YuKNhpgAu17DC1TNs+Z69YjOr7nB8eSYvjL9n\/GLJrmstInjCqDq270fNzDN9pS94+NO6JjibFp3cQyVL1RQU4X71XaOtbGO8O55wPgQqp3TLcsyJTDQ\/d57LS2wc\/1cwoIAzCDHVcci9LujvbCRHNAY+22t1Waq0Q+iTNNAd\/tobkb73xdZfnkyzriUPYr4mX46EwxagRufHOFD53OVj\/9eb6M+62enXsRDyb5V0Scb5AnYcDL1+oBFimKVYtV8fRDFKispw20p0OAickHMYf5+X1XIXWU4\/KnMuhuGbr8kL9TMTSnjPo4XBdbTaISG\/\/GgyOBX643KnAh105NOcaQXvlHpWZOagvxtX5UyE6yr4Mk\/70Yuz\/ugCNP+f5jEJ31gtdw0ZstMGt7tKaZAXOyAqm2anmRNidvbJMBlbsMSrZWneV\/teFmRaVWd0X\/6gx3ZNXJpcYAPgWFVA1otMrGLx07KnLcavzYV4waEVqV0YgNEZMd85jrctnnb44YFxmSL2zhXqNyxiYfp+Y8vm3QL5Gw8ory+aH6FrSwMazD6rutjFattWRWZZyt+9Dc5\/XpkX0YM1U15e1jV1OiCSRuVoB9TApvMn49UEdcLUPtz\/HlyPdXZYxyMEcbW2mWP6n9zHytMP9lTPWRrRjV16M6Zo66M+Pk9qrCyOt3chZY5JgZHQ\/Z4UjlVWvHXIUgpiDusGPURPOfz\/avKvIteA8tmTV1xfVx42QUn9ZwScwUXZmH\/23gt9aHynpnqt\/fNLI6xMOqqcWOMR6\/DmX0u1FsHbPPJWQUnEWB65mxitvZs8bokYNuIYfiq8jGXMxbi56yNAIoXOuyeV0kjC8YvUoMY\/usCHt1XU4b63M\/I\/ZVTVg5EkF04dSO6iDzZaI9qsIkC8X3+nrqWdylpY288ZkmvVyhMlOioqjsmz0TOfaREcDifNjcrhl9R4kb0VeDGXhr3n\/FrS6IarFGmLUYtt4\/0S7S3AdssNrlnOe1Nh4pehOnl73nyd4RqbGQUYYZwA0Zj8IkDk\/DeI2MTMNdUxUhzfXem8Inst+4Fr15bZwvMzLX7AtiYK9sRd2BLnXOeh06i1j2wG1kO\/bFjcBj5dOikWzIGK4I8G9klqpSB1jdNam8D1e2\/a0KcjisGPneHbzRZE037JJxWAou5NNLcjHx1RfI7taAqnr+4d2zqqHQv50WqcKyJlsR\/81ksROrxBYWTWWW7eYcrg6G3L3bLJZV+i+8Q9VtX3UnEVmdN6sPaUM49WEdMRYjZg0cwxuPzQr1LK7Zh3Z8zesr2X+ssro2cnOqA55bijNaZaYZmNl9Sgb6mj8UJFurPh9P\/hANrvm0EnFZdYW3n4u6WRmPkhP+Ie1XN0BVsVGM8+7TrW7KiMQV9WRtbF6o0qoUrPaMpuvQcjXlxdzGtx0tXGr0yeU4aF6JeuzoxlHEqXnqL5wD8ri3Teu5jGk1p1c+fwhLoUdJ\/bCHR0OCqfuyDisMGIFIU+lFWpG5uLZmWYMwEva+XMIEjBleQWd4ZZ6OvudYUDq3n3+e17dtuE6fRiVcRe5Obh0v2aWGmUNxQJ46cj0m6BVpy33zBuLmE6dGRGKsNT7PzuNS5kAMYQcVsXUHHuyLenStYS1y1FAOhMuaWwhkeeOv1QsnEhtGQGTRrGPTKaksXx+HkoC5PmrsUBmUY4y3utkqeuNG10CKY1TrU2lkIbEvNp92vbMl6fc3keKuCCIb34wbM9F1XI5POq1QG74z\/yqKnAHWUExxD0rL7YyyI4fbT3cOgeQSzwZa2cptweChVeTNrZV74J\/giSsuwPMy11oTFbI+fNI9p8e4nR3HLX+BTryGTAdqWYk\/rO4brtGznX2a\/sMK1P5xEbWb57z6emF93h7BoHUt\/r5RyffGZPtcM5T2\/Bwpef3P71Uz7PVHWfuwFdngG1K4kojrnK1hkEOvd60MfWSb+7ZlYpscpRfYMiNKW7TMlfFeY5PH36OoIlX+EbffT1aOt9sD36lzdzqFdxILH3mOye\/rgSdRCVb+oomKZJ54HCLJ9\/1w5S\/XXdEjGUlsuDYrz6nXMcZvz+83ydDn3Sc1n493ZUoftEYWzKRbkN2Mhuu\/8ojvCnK1y+hvrBlNRpZfV7nmkGvSuC4NtqSiqRb50flYi1M3lindh\/nWl8wByU1XqWxN3NVYKzI1Nh17zLvVajWCfYy0aJV9xShR9mouGU++0jlwvZfzDXpd\/f9TqYJX7v2acXpdGPMV81ydZ8VkhJwJIP6MjPoCw2RJtbrRfhF\/NUvevMv79cuYwKDfNe63k1dVypf6H3o+nIZ7yzvw8XhVPbvK0EHidMal9WeJKfwOa81vJ7\/ZbjyR1tFqM\/Rc5mpETlapycAp1CnzZz51VqjM1lfzD+DvfACPut3cG96vsYgusHJspY5dn95iCFyxUY9PET2ryL3eEonulx8+C3d31u3QMq4pEMyP8yWu5fPff5yRi1bd9yru3O1boaiCeEpVkehSpeLonxFlVNbbqaH17gznNDYvoqTK6wDmXxtbnNhh5lunRFWsNDvFvh74nBycSGbECo4BD4W3ZpZBGO3i9l0TyDygjcyTe8fdnDZuY6xGUE+A1oA4mS\/9UE+sA3TE3O+G+dXTbZbV7eo96HzurXvSU+7cxBjnA69GqJ35QuJADRFD3BOOITFJJBcb\/GW9Mdyg26+XoV62Htm782icVUD7GVOR0Ef0q+MsTh+\/E6t+Bnv11XHhk3cfU\/ieymIGZmsjX6RRzG8uxlwdzXRlvpHR5dxH2jV3mbnI7R6\/rXuvsGLOYzG+Mzfe6OGs9DX1d8k3HFGn1T+udIoO9gJfecxR3Mxp6J57A7nWanM1x8FfcrgY4fm3CvQOGVZeRkB\/d0S1IyPmw0Xy5Viof9eDZMss2ycMBIu6VoGfTqXn00EcNdVoqBocsU4\/ReDjtbQDcxAl+hdhbWOaxHdjgnXqTbXRicDeOPr031mRp9XbVo1gpavQMcN4TOb7vd+eaevVFG5nI141NP9ieziY4jgTZsy3mq\/uGVvnCcugCsycePBsiJmvMTP81XHkkZ+tZr\/WblkwbXjn88K8bU+RFyXW5Y3ThiOmG2f83dYkRuShvhWrslD5OAbmheY1D12Jbr28DJMhM0GuQfA4vL2Tp2SD2oG9GGvbbFzhwNMGauFx4e5rQi3\/PifzH7BZ5up3tC3LZY07Kt2+OipZvbEfEzAieupIMt7jxa1jWZMx4MsajDAMPtUXDVZ0x0fNL85F\/yplzN\/Vli27AjiEXwvsy\/5pEZy4ZxVpjHO4Y0Sg\/dSJzyPJKOCX91uzRqFx0y\/jrxgp2IQNl+sdkZJRYUTe5zhXx8pItpf+aOfDVKLmbAzQ+S4+bYn5Lzqb7b3io82ltb27TL7xHbZRdOcDr06zo4vrJ\/xNZZyjNy5GHFRxnKZqtMrQ7aBu+lPU5mogZwTJhSwrMjh7JUrhsvmC9PfeHZc\/NgZ3bbPjlo\/IAtkGV\/opuUkG+jrCtIEmiBgRTWbUEdcfriBBnpiU++mTf13Foep3NyzGB7IOvfLisQxsc2stWz6EWrXM69pky8f480X2Cyd+a5eeiCTvUIEe84cbDpfWNFtaubZfii+\/XSbY13\/BZjFTBI+rfJVrA+pARaXbTCVfZaYl6trxqxYwPCs9mDLQ0CcyRpwAWJrO9PGYYvWsAp1Cdp+er8YNVINWVah\/kNy8d0uwbyYvN4zCyBB9szztKN\/vaChZrrM7LhZBLw7jc3DNGKhvsYSbYTTWIn3g5lAyry3Na9b2y1SjVnYZE1prIlYMnIuo0u5KAKoUniCCWINbS+u6xl+sCqqOF0URKapo07osR+xIjQyhOn2rVE8ZrIAi+j6Hw5yoF9nmRmvlPB\/\/uImRrj5gCxxBcjGUgRxXRJ61ylZB3Rg4bF2uAVk6dHgaVl57r36tYeJ7jCNy4ChiNNf1UPFlAhBp5cMwbi\/jyIxstczWTRET4nDKapR1luRJ5BPpi7fuQqaxZo5P0K8PV7Rvx9JYd1y26b08r8\/FYDEub6DuX1dchWAtreMjKz77uMHfpImvc\/1WrDhlxFQQGGg+YZ2GWgdKOxk\/R0vBx7cdtPjU5JSDGh2q5bld3\/Fivbohauh5WQBc9bP0aWee1aNyy6y5Pd0Qc2ILDKVl13aMnQqG977sqJsDiY3QonRIPDUkEmS4WJSPmy\/wg7cCzcaSUYKcVlGP0Zg321PfRLF4FFOdyaqc+rAONpo6wyJlnIs64BpPu4jicfLYe+z4+LqMTQ0yHxjEe7iC3a8Sk2Mrd2w1ZyObecS33P9yRW5kCPFGzrjH1n36FXZif2vteALsgqrfWGBY1tx\/XB3jka1lGjTE+raOj6WPoziLQC1YHWXdh+\/md97ed1hH5nVdJ9qJ+188P1n1rOWyhbd4mdP9yWqriqdf7eVXWtz5YBwM6j6ctRzD7nOnVJPR6bGh4na+ZGhAIx9KmYnbpI7jx8ts2SYrpS+PgyZqa2Q\/1FqTjetcYlaUVBPembGS92Kn\/dLHYcuqPlXaKosVS7cli2kf9\/E9o2gO5c9EDg\/XQxn1lR1Rc8qIrPy5njEowYR7M\/ZCNLxb5ss95FFn1vevWqeo1AqcIYOg8af5MoIx+YsTsUJNn2bpXWCSc9LM4moBxtC9cw7M8zQyOcd57xzQqS156M8qkUogd43pfkT6qrijgulAo88Ya2uGel\/9OOqy4DzceP2532nGeII24Y1jXPkFjqIW1Ninphnb2HHj0ke97Rnab8+mdbOuoo6z5wKH6fpTPfRQ9RnbqaZIa17hMir092MMi6k\/juicz92FUNZlnriJ49OXN95p3YG8chG9DxdjEqp21wHk3Z6rcSTZurPMNtV+Koi2go+d9\/AuxnNIqQ24JT232qik6QzgmtY1p736ZVXaoc1pdF+w1GrqgIaRzpIWqcQ3rlY9Y3SlqDbOmVHZwSRtVnFBfHGF5yraFsNFmlEzquxIjfz2CjOA\/VXN7mvzGF3\/hMYbxxfdekP27\/vlmd6VtT+oaJmwSJHx5QjZ+jm1cQdKJTvIVcTKtZ5rmyJp0bbumouipHciX6UO+eXWMN3Vonw5nsbLRNW3iq\/KDlPN++qB98lu1+pz65ynQ0fUklyRQk25lqL\/4qJxVP+IZvdvZnW97ffFtH3wbUOJS+9P8Gu5JPrRGOvo5W6p6WjlJOpi+J1PAuEyMhzDPl+GH3Nm2w\/HHQJZEehTdaSg9OkajurxTJkrc2+WQOvuktUcpEiiajnSvyi1YmDojg48v3y0CltdHQ9uffPBI1sRgVLuyRIfXOBs1URrad91DjHbMWvyOP16Y2llJdvexdXMgxlG5fFdti3yxz1UD9XuGW1USiWFRafdK655JFl\/bEJ+GfHO+lKTU8ZiGCcEt+4KA9yEzP+cD9eHNIs6ZTVyjqjxwOPhoFYl89W4hceEW6nx3Lp0P6vGVZL8KMMwcVoc1po3f62h8BJ4kh3Lt\/LmUMqMnlMpfuVx9VltVWWpDK5OAgeMKD+0Bw54xCg9hvrxl4lUOcGqMxrWJnzpqqExLdbBImMepwwnD0NgqzlG0+CxfVfY46TzaFO4sR3cRC0zvmnaMK7aZgtUDbUnAj5iDGIfLBsj2H5VjIA1mvSk66IF32FfPCWcYkZuT\/NxI2n4u2crsON8NRvcUwNTduKqQlGzwGxs1vNinfP2e5zRXphI+6GStoJxphS5Y9FrZM5z3u3RiBsj2puClHsbk3EZGWZE3B+ELXEBOwL7sFQkzIMWIeWChD33pKrmdmecEbrWmOzs0zL1ZgoTUP0i1pogk8zukCpPwEJThvZBvbx5lnPa8+++svBSOqLB3\/Yo4L6B1ft4IQr1RY3z6QSMkfZgOXQLZ0DW7ztgqFuzOTSNGVFxoo5rsJKrOH23PcxRVG1gKN7Hj3GGdS11z3enYc87wW\/6FMYp6pnLvEmzRO9qnjhEx3AZz2s0V3wio2j4jaPfadaoeV19XifbvRp\/nEs1wmPyGzU+hieP\/S9\/02JZgBG2B9kb\/oDXioNU43au8tex5vd\/e\/f\/3XV536bT9U+bFIHtyygkEs0w\/X3HyAxUEHwdrJuIOIbepxF9nkdc1S2Ooh2GGWJAEs\/kiU4JzhYd5qQTL0bHt6jxakZNpLbY5rHT0zwyJs6pOH+Ok+FKGBAcdSz95Ud+bFyq+MTJf43zwwLRbuV3hs386nf17D7Xgy7mYaAcQQSo8V0bvZyA7LELHAcrlaGMarCz8Tf2+s2tnzpb1Q9crhp+0z4+p\/VWxbjGFZrjZ5w787qVGcjvWJ4rVEGoH2LtducqiXqd2Th0rLI1NzNlP5TULKFImbVsQiiyPd8peXgE1Zw3\/+of19SeD5V\/xU7Zsdd6waWLO0g1apxjY5pyWx0VeDNP+CrG6nude2bX7MrWuzLgN64cJyQ65coyKk7G6\/SirowF3D1vACuX0\/XxV5fvivNWpUcWWK\/dOODR54OYi5pYhz4FXq\/Mlwjz2NHAk6BTByPm3dLKfFt29MQ0o1zVL9urdTD8GApnggZ0XsVN+8XfFIdyEONUCb+4cIzTl7YwXSnCj+t0LccoPBrm4X1UMCP9eG\/OBcPW9JPnaZmogq8ei5uvoDJOe1xPHKbhtn1PKYz6FGqVxlym\/u2p2iOPwf7BFwzxt+pkunkWRl3fRj4u37zKkcT6l3bfWXVmTxuYu1raGgPHXwUANbTF\/E\/x8qrsAHpdebSPXj8QlqC6DhFtR02qKvSVqQN1mkmE6\/rdc\/2unWawnglX6Sr++RjinRg3roEt32yNy963Kuzxu+Yan8e5uuanZxjGjVYN2ZVlzT7xMGZEY4z24nXMqZbBK038q17ZTy6fKhfx4MitdYu2Ivdb4bYrD+R1royjii+7VL\/v77M6v1hw72A8A3EQYVT46nHj2ruUx5yOWlQMoAs97vHveNz5VbjB2THvi8ypmWdB9AJgVDWjV6IOt8gf+csnLpgl+2UUxJPRwpnte2OE4TcTOOTVsVrY0f329hOFQyx8MwfkSoK+wAiuYedG5h9w5YtROd\/cf6NjnVptT1Pnyqgu4we3EJu32rDOciw3VcQdRdojPgMnOnyMPTvojoloUc3UoJGZb12szO8AWxRRrVQsulxkwbqsdcp7MnIx2e+sbO3+un5v9ogcnMlxOv6GK8IQ9ekNNZXPfYtZWTbltLdZhx3zUkZT9CzvRN4avbp9R0QXabbZ\/Oq5y4+dmLgX\/eSC80ljig6njPPbYfdy90jXsoe37vmNstqHfcdqsJsRSkT0GvgbMgqPyGL8BeN8gunYXTbrmmxRsOKspkOjrVpLVlrvbD8ngnZasbKZDpEWTjfkAfanHsAmqgAa5zSstedW0CBQ3cIruEUflT42qpLBGY4UzqNyMi7xWJcjfIq8p7uJ7tMlcsEIiqb0NgEG8zodxgF2WrtdD7OKgRl9xFl\/R\/gZc1ErN11m6skC+iGQuNs2euXRjvz1E3HyZUbVtUo\/HQLrMiKZ9\/H5tK+5sQ7CsQ93qDoVr4PnroPoNAUpdpjjV+cQlbKm54+GdRDff637bcO2HlcrErp\/UsZZ\/OKij+AoI4+77Hp\/eISb4wRf\/jdqcc7c5cPHKzLXn3GLYcfHd62ni37HYPxOgpdYbqRyIOjoTH6bc9\/gjR\/PMY0hfqxKiqFEr5XQ1QOzxsmQI\/xZGVoV0iGoJ9QjID5sgqE\/ytgREenzR+zh6oio8akjtjldmUYAz7IYmCP\/sgFrra9OdcZVXTVpEH+Y530sVOuKLD\/mBzFEKYRMHzAM+IQ3wLE6eLxO1P1056k9c+eqOT6pySfH8gpXAG1WPT6PLkQfJrhjAvhKp+Jd82Xy0yZahenpjbgbRYQ8jcNdjxFai2o6zLaalQt3\/JBqoT7JylgSDKIu\/VQqWMlc\/Bzs9PXNg22MIRlansqKzKWvtNVilXGy+o2yt4afd9eXFMrZjHkyFhnUGPGO\/46bynU6oMfQWxFRZ\/aHJ2FYGUEr1W9q4Zuwx0Ohu7it7EuFW\/9D9+q0ER1bJr5i35i\/2hoP4wRg+g2ErMwB40VkYLOGNxjjJrZiAexUu+66I5AH9s9bFrc4KLinGcNVTaNxHEXS2L5NoBPMTp5fpXXkp8ZNcNPcOM5vPg3FRdNO3+sWb61Ubnzjobo3Njkv+2EONqZWQKHD\/dRgVWtRJFmn991+KOoxGnhzTxTUTOltqH319GrBSh+uwW\/Z8PwzNWCcT1Pw1+XO924ULirAJXJyF7M7T+FYqDcyt\/VKuaHtZQ7VSmeGly9KywRk9Vhbv0dmiMDz+e\/b3ude+51Gu5oD0xU8tnSGoHSzep5CPJ8GlsoZHqNHP1eDzf+qbsqfPcZyumUrhbjI4qWPOMlfbe+z2VWm5jxjLv9ISmTgKhw14RhlgbcxJR9zMI8\/MrlwFt\/3ZBbbwzhj34hjGyC\/CpVvJ94MSwetRiLw\/E\/X3r\/4MOa8D2e5eugIW6+edznsP4Qk5q615nEYRb5P5tMefddSdOX2qhT5qL5kvszgZYpzUA\/T+\/Z3ef75pm7TaDLL9tCrb5j7RvbrR6fXam+Fz6vhNpAKvHbRk\/9aA7AhfApyhy95BGsQDK1HPEbrslUBfw8pU02eTcsymvEPzMUe6LSOSe6FZafamLv+yM9UGPxhS7cVM5jaMuOMjxk\/71OP2LZT52zf8YwTjq+oNkZZuoPppz0otQyvSyCC+pFS5hgavmxU6q\/C7eWLtoNTw5F0JNlr3qYc0bnA5Bfvts2BAAbYd7\/ejF71T\/KXPgSvd2dCm913BhWtmPa29Y4IHI2DbZGxXj7PN37feWgsT41rW0BDLJDPGPr7jpU0yb3a97PuWkam\/k+9p5HqDbN\/a99FCS1Nm2gen6Z\/\/hfyBSM7hmAcW2NP4et3GplWVpUENVSp2H+a0N6p\/HzXWXaqlmXOZQTe887\/cxBlOnJGBgIwtBE8qWRWpBicwrfqzIPVpGOcgnS8OA1GqHth38Tw7iFkZKhCYqlysQqgFt\/68dDTuBoRWGeYn7Il77csWd2ufaJF741pXwf\/oP9Va7NOzvLD3Zy+XMKdjLKNXl5Hc67Gyvkyi8xDj3Ca6HK+ROxc5VXoZ10yPuA9R3ZRs5JfvX+5aDhIdPCO1EfnSwbLKKh0B7pDi\/K1TGwsmQm5OZYmP4sCK2qcOGua4QUueK5qVVvObU64H5asBFq8FpERmsW4jSkcetdVMPXbLcFBGR3crd+5nDvWu61SHW3\/UPPquCztvM0WI4aHdZqthz6jZtAVPCJOAj\/Ke\/5LjHBZh3OZmtdgCkYhYkTtq4zHX2qRdXVol6Wsgbf23RzFKhWigqkd7i1\/J+KqLJzPlsERn9GKRpAXK5EK3JWXZaZX6KhmM2kWTlXLlOMA2dc+6Vf8U238EmUdADUo\/ztasezWD73NoRpt\/BtLMwUuzvl3XkMGR16HA7IL59cGislpsGcCxtJViCooMZ1W+13bzIpKyTz5VkYZje9ypj\/zKL5AH59vevw6\/FKX+bdrLHx61\/j4RNyEq5rqT03\/wy0qk5jNn7BG3\/2LO2\/qk1czLz1N+ygzZKNWfp+7jiSWolZX1gqYEjWusFujPgVkDj1m0ig2O+2n23emY2B1QNX5zHVj6ogfZnk8zLbfMsGqmRrAp45pOzzmQSs3o3tHl3loFsHmsyMfpnEBrO7N52a+\/Fqf522Yp1fBMh6YXGZ\/ddy7AYImKxJcETXyw9G65bbagDuAdd61GS9WtTCcvSGWOHCq1b3Wnr19FZu+idixlDyZuYET6x58Hv9MbVvF0wV8L15heEa9cRwPhQgkro19wRGayDtD1LVNluHO1ky3sCL7DkemqfnWMfi11q6iWBc4P3nuKf\/2kJ\/Rm\/hHFJG13f2X113xYg\/jNvOf2+TdPK+L7OKa1SXz+E15rkrWI1LP2Tbu4MD6Pby5BpC7iLfselpzmWPeZIU5nirI8cV7dVhmAgsbw2qnbEO+f62889ZgsFFj1XpeeDpVVIkgMKL3+W49rzpNV4WcIVhlJjpG2hpf6AYSjTd64sTnNY0SvDaXxQKDHDc6jk9EDc9jx1MhdTwgzHh+58Baf2TtRXZ5lB+N6FiwuGU8GwFOjxkuSlMdpr7tOpzpoNUFJ1\/dNU5lmjFwIzjNoGbKJhz1ydGfLXl67KP+sHtyTJpn3Wdnj\/wOsG7TSkgqfs96HYxHy+4oGm7U36xDcjSK81M9ptR2Wqo9tlchYOxZFML+HUWO8\/E6ivFy\/LwOGBMprlOINmiUj5fxuY5EnvVhex2vwVzPGaTPjne\/L4o9bubnV3l3Co4619GWz25dUbbvtv0s2ztOm7k3Vwn9bzQwTDnOc2TFnVd6ZU\/VoLnasWcZ8WpwM2du9Y5fVI2NmgjYhtaIuOyN16F62eK3X6+X4NONeRc0cI6D4y\/L8Y4XgpKwbD89tbbLkfoZar2as1w0ht65TEx0HZKR\/DZslIhy90Ep0KRTMXJDhfGDy+KRGHHeU928kyNKD3kwa+amwvQK\/I4f75Qq2BnYfjahkW7lNVl9DMPYhr7EORPhst6YfLOY5qnGaN9zEvMncBEzQmVgzFTU45mxhmrDyg+ezbjY\/xwPzKMzPKfwHGzqznl+cCN\/weJMnJULnk\/OlI2JS0mgtf9m0eiRv\/yep2G2RgxeZPTGmVyftnCeiuO6VZLfvOhNJz+EFj0F7DwOkSSm1Hn+Po4Y+uZMyK4OoLjr2HC7nYF755ggawgIlUfqal9ZJsU5ChhebjxZEcDdZG2zI159byOg3ecIpoPUyXreUYtXSXDPPNM5T96fms8VbjSNGzmZks0j7g6bjBaOgWeKx2zN9d3HOWAyLf3P76cQLmo8+iQS2E6vI+uvWhs93ieD3g\/afLK3mWzWp4R1ru2\/L+bRFMpvYuYY6ng7fLK2UCgVrKj\/vaRTAOk3O\/xY5t2xl6lBv5iWycwtCrxKQbV3tTJnb3rEqho\/Ze5z59W9f5kNf6eR7q8LaBc5w9J7bk336hWm+Lw\/9ZrghV96dAx+Z8t+s5TqxRjzrtfXZns0pI5qZoRYoJ3MX36G+YibiBHNXybUCxAztzDHq4jyS\/PxuBJGorrSjTgYP5S1ruaH\/ec59tmkoju1P08BB49VQdmYeWh0lOPeN194RnRBDylD\/ZXaio7CivK3CgfeVhnF+BS0Ec8niXsN0XDBiNHFTCA79HMZ\/TQVftUIGGMiHHC\/lWDZVseuCyFfRJv6VNV+q+f2ygyCo2Dx8D3OfarIdwSwLXzAKv0+saoCwKtUf\/a5+s9oPKrOSLifBzF07HwL3Vb3fQc2Aql73oplDxSlMQKj9X2nZXgP8s995HlECx9dXe3jdlW49TEtYx9iKsJfpovJKkKjunhkxNPp7ld\/Rv7r4Ftn6POt6lbpVUz9avss+wRQ7bUITBvHnKXxIisvrwbGbvSEA5rKNq5WepWCuRfdGbn3VSHjzNsMg0BjYX2Z+79MSsymx2spmTqmOKScNhFFdQ3cHefI5bTiSpPc8mN\/Itbe1EiRRz9uxayoF\/JP69Ycr1PX4DyRum3Am8hxXP4dEqfT55Lo0ZEzbzwaMZ+WzqNubnl3jDnEbSSded0fih9qySvNat+JztgjmaRv8qBL1EsYkW+kz0kyVnLM7DvaHcewxznAzSx\/GGG25swlOSgm807DWCuVmur4SqCL9eqmr8+5tjU9PrNzXlYu7+tSZAaf+953m0OTCoj\/QwOIaHOEPyTaOMCMrPGmLAkxPlhvQhaYN1gHtTwmpmDxHhHktNStmuNGfKMhqnCE\/jSt+SmLL0Lb45j4ZT1xfrijd2IGrscOWwPceBnR1cnNCjdpZR8jywBW0mFvruy5WuejjrU2cWDzS8Hb2LVVg7\/354Ou1dKxy82MEV6Ft4qJ5jLKKldVkR9RKJx181D8ejTSc8GLXzxhOZrxVgt6tCU1Ge3\/tTO+GQs9RwFGxF8fNUIdT3MjWo5ZrpplRO6gRW3ALmLLmvGVq49vZcDkZtp3bAnMJm6sYVor40xqiVFO+ZorPI74PyWcQrfyW+M9yrsC29EFood\/bAU2E15LTm2ejsgIshS1CvNRVf2kJ6wSF7m1GQzFOFDP5Xr8z4qQ96yTsdn0SedEX8TISqAtcgJmzdrVvoywsc7TEVu8ALy7NXZjAVIYGZUOU6kqNZxvr7HM5wj1ZaW9wzdDW7OEHjWrDxH02GNDqwlmxZXzietUTeQRBf0Y+SLzVDEzmwIE9OXEjZtKGkcuQ8HeLxH11dU81+StEqqJdR8xm0pyTQwMjfKWzzmSvSphrOQpv4JLN5pZwu9gXMS7DzVIFqwNlHlrmfoznB1xMhJVkTnRoqeKfnWpDjVAZQkjM+PYYyDMZdGjona3Rlxo+2y7fEMxr8KiHXVjmpmjujIJyEDr0CNUD\/1Byn0P9Uucmatayh58iyHZ53tYEgvUTS5uzlaJqvIxC7qf8fQ1UtD2HEVGwGugVuyd8va1zQPsh68780YBth1LdDbqO7lh5lRUt3rxYW7zlijq3j1eXHxci9BCRwsGflFvZsYjqz55bnjKPk5ePZzLIkKMbvy7dVYrpBwyftuMV3Y9IlE++f1wFJbevPbPSqkv6dHxz6w6ziHm8cWxvdurTMvYO8bEbE6riCuvgcjfuHosOKCieriCd\/GuWyi\/B6PGvceW+71rT6\/gB7xdZsKYf0fA6gQat51NaZ57viYVQ\/X0sxV9v\/X6wQq4BI8+srbSky6lEV6dwnM9T+H6raMA31+eeR55bKoij0Whb5HfRzyTY1U7Wi3adoRovA8Pd+xF9zBPBGSIY8jLrIiH5cGPnls3vCsg2o7bg4Tu9bga7h2\/5EzQYlkUPuUYejvDfNZ07ONRg+rK7tP7lBc8pUe\/iR7mCzezqqfuO6L2Svaf4hZRsOed2TGavaobZ7QjD1tn9wydvoUjgh5vCno8NgOfE\/thpqMih623aRr1y9gAG3rYlFbb5pXG38abSoIpYSDGvvH2GiIcEnlJLaGeao78yXaNPFX44ibqjhWas6nJxkzlrbanAO0NRYNdcXszC9Oe7deh87g+rVHCjc8t9pPGmUHGIxOqBt\/zZMyes5XcK65HWLfSISPcyw9kZ77Eu4pFpSSi5S14iviCNbZsRtCnuQbaI8+ywjd2tDB0dks+cYYTOm6grx2rQIP6c63TL590yb5+uyXqQiVs\/2KCvbm2RpQcD9E\/baFXcMcxDb18vRHbpjXn2wiKMnpNK9Xgrca6ZqBfql4to0JdF71IwCntiUdUEWh+PsWxrpI6hh5TQSttAU7fOezwYHM7FLe1Za0TYi4iibMX1GBUiGJs\/W+O7acRy5y5IxGZm7OBQ357\/BD5I8BU2edT+HV0wemfo9Zla0Llmdp9kp1z4hlDB+a7zwO3gso7qaRy7DzNeMys6Ud4bgY8qpDeH4MN2zJhZ7N9RDyZoqXxjTU2HL7s78zF+Hl6bXtijdoCaV4HnvbvykhdmauNl4Pi0ooELZ1NszSuA4MdM3oICsFO9yff1fG28VZ\/KD+9geTn7LrKCI\/hXJsljhn0X3jOcVt752hBoTXvGo2+7MkK0pvlHb7FgOom3zBL+WYjZIyqG9FRg+H0REP+yLaeaYRvt0omYuw7XK0mf29UWfCsfcQJkjx7tdd1E7y639Y3K5NlreNs7osUNLSszQxwWMcQW5PA8uO8ZhAvkLE+RqiKlJni\/+Y6ex+LeoGNoDVEJF+L+Hg0AK0eQlCMYWSvEXmIVVadkx6jH0vD8CqJ9WO+yNrNWFYZn8O0qHZXB66+m1u5ZdoJtr\/8\/WpiKGbMXBNsr8PKnF3GQ5T4VmtrAKQdtuUKNIqV+dwKzJv7YCzGGzPxnTc61CWT9S2s7FlHqtSrXK+JIg4XW\/UjI\/abpIm1mM4s\/SQOYwzvoXpVe+t\/nqgrku7N7J2Vj2RS8qi6Wolk7fJwW9FWh\/ZQQx+Mm1dv1NS9LuapJc7sYeG4P9zGVv09Hmr15d0y3vP5HHXCo1L7ZbTWo2wx79xqAu9jH3gH\/zu1nmfY3OCoZDvZeJjXIxYtrkfAoXpqJV+OQdW9njGqv2t9TPiiqJpvZscPYEftmRIs074jeoINtjy2lS1k6S9CGNWtlnTZi1Kj50xpF46dc3w+pVU2fGYbOHHbJwtjf\/XDdp+yza29tudn5hlYJfFbi9FZUvaPO87lilYjQZQc9anjMRPvny6PPYcr6k1kVJuTf3RVRW5dlg2m7I8NwebHg6vyHn\/kUw4wVWv91+9PP\/EB1QMwPww93U+hgyY+LzEFKjO1rfpCssCCqNc0s8tWI3DK+JMcMout8n7z\/u3N55FZWdY94FAShbbNEZJGsfeBYE3tdYaMYg6123fvupI8w\/gSyezYSxKpxGzSPjuDtpFnDK\/tch1nGTiWkHU24+zhNjii4duou55iZYWH4pgEKlMn8ZsGdzVCvxhfR\/oLpqpCleX97bfrm4qvQtA7S\/IYGlV5fW4raC07WpXHIGWycjScDvOcauRVrkzgviJUhhzALMnzuTn4TB8Hryb+bk1vbj+ubP+OUcdJX2iFGuQcrkc5kXvUpT0\/fXGazf4wCJEVKTCHM7cncsQ4fG9832qilxx3y+r0r97SfoHZzFiB5sE1w6rqt42fRcojnlGzjkIWvrWNeaP94yBzCesw28sZOX74IiLri\/5odxq4byiaVpcn6O8QspVieSQlhXqHl9XxpHWx7JoDNpPP2Go+FvqoLrY6Ov68mF49oosidKtyGphBa8rklGeiv7lYfWPiIAFG7shWh6vPD+uOv6jtBK2skhph9C0GdI12Sh69ggZfV14s9+x+amUCcKj2tZx5PcNuhGHCXDOtOwOzsFGYaSGst4Hr8C\/wI\/EWv+UiX\/v4tCrMqk7\/rYKRTb1VblFOi9QjbMMMj31EK2hLLJgrrFcOQF+sPtxBI9XI0Wdy0sANI1UfYmb+wkQ83hrlsclQUPyKZfGtU5adjvWsH1sEYbqj6tYcOZg7T9t4LaZWvdXhdo6Jv1fpWx9ogTvi7xwZVfOukhQi3BsZzrUyqalEcbW+6KA5HC1hRuBoQg1HT8DPg4ICs0e9U6Mw4P2L\/FqFzfbyebOHddvzqhPMn4rgFPgpVjtPuKqV8RzOqobK7ozchhpkburojgi92ReDaMm2be11bvMcz20w58Tpi7x+ArfZmJq0NbDY65GpdqL8xtZRjxG4sq6V86f+qA4i8HWe9L58cbSvo50TfwwpRqhUWb4za3vsUw5t32SESDSa8OiOazN7tcDKeXgr1+EmDsX0Sd7Jr7E9R8L7IuqUH9y7XUmJgX\/Y3ayaj9vC+XrkF+0lE\/BIR46Da73mde404zaN6qpnzgRuLzN7DdjNkAgRA3lIPQ87cSc1owFrurdVDvqIqm29qi\/6UKnDobHbQNszrYBH8EpV9hnX7OzdsTZuARag\/87DKFLNsoJnIqityyrj1eOVX5LXvorybiiNvWNzrGgSFUAM0Yn0wiyIzNgMkhkaPuiaesNyqDrV8Sei8CT6Q73k71fHHkOOK6ncHbsyd4xR18lnF57KdNYPB8ysypySyPXS1lrGhrKqXfKpqDg3ay2jourgVeHX8xMv7jsGavBS5c9VQ8M8H9EUjc3rm4oJXiHTzbBaPa6VOT0qZI7MmNw7Hk\/fpz7PWbpSAQ23bvibY\/zLZRtv775EQ84BG+XUVgG1P6YcborPeTQ\/0Z59PB72XU\/o0awsKqh181Tw+EdNnCsUg40fkWlFBHvU2bAPDq5l9IMr7MerrZDDgfNfdocKrhAgXt8RG1teZ51yP8TdOvPuB1nPfNWDnPhNUdwDYVXPmaKMf\/xT1138ZMahdJhXX4L7IE9TpFYmzPvi1P3S8u5Y\/GuSb4Po7F7tFJuJz29zco3PBJMf9M\/vPIzWdbZfj0rMv2cmcCdR2nqxhb0j+Tjwqkh6hm09KgCjwfmMZVzz62sjAg1D9lUyx5eJtbzDVkSUGeUd7vZynEkF2SL8BPvRUp7ftbUimOttXVVaheAVjIE55mJ1bQ99+vS5rSQH48YeIcJlwEAcIXisLG+eloFPem0e2X5\/ndvw8arQ\/YkXaumIjYqRUQ\/Y1iizD+MkanCAyiYLZIvfKLZuNCb0amyqQa81mfWYTn3jkwyMB0TDDsHOSBf\/CGbwH1lR9knj7OcuHpPzbmogd\/eJBvbsaSK+a7H4G5fnlc5pGYSiiq0GxlHFAnHfSMBJokruMAq7VrMjSdp1WbgC6qD7NrqqldiCOfQBD3\/VJT0GHnrRqp4XZw+dOGyqER9xPX+0fPkmi4BbTJCPx+bwzRiS4+w4DLdiS7Zxv82uSLxoUY\/0aW2xD0iY32j7vwwll93ubyWmb89\/vnfBJvCAJeZ5gzLukswWRH71VWcMKxlVWqhf6JFwZkUUcXdWypgNr1bH0Uk810HWiFf9RjHA6Kx+sKCnpPYeBmGxjU4tJ5r4gfSX8oMldEdWU9Wno962XfGd1onAc8zM7pNt2f+z8v6y5M4WTD9b0YyleNhIYcHFs+Pse1Qo+W3UukoAH3kUJSYeXzZy9rCh\/lTOOvb6OiQ4ydZsAZ7Sf9KnHFoX2J7tX6Zavbz3VAdUSSSPKT8t0Lsx+arJjYGowCQ3d8ehllljPa72nMufd8dk\/Zwr6NlIivLw5zgxxgGnsMg1J2g\/YzEuRPDX1sdh8HZGiy8Z5TWrU+PlGfx15PBN6\/TLIV8VIyIq8Pkz1kkdeyvaWDH6+aISL5XWMdQL75zC\/CR5FhMyn1hSy3r+YvpDdMYaZVeubWg8HkphErM4DGRkjbC6QQzwaeQBRW\/dl40+LqmvMh+34oxOUua3g7HPtWMF+ZfKMsLyLXxhxVh974hKUTgmKcPAnVSa7MVG5be11p6agbatB2YtUK+YN\/p+z0fP502F0EaiYa3AE46mfRMrMAybVmnh2WB+ikHvslJ67UhxCM1DfueVtw5PngqaSuzOie38GNdsUZ16hV0Xknzw2mpq5856NRBt0t88rxG8WRLBbtGRTinX1zQNfYFnnpcgBmyPg0B1iln6\/GrPIlzlQNungWiN29MKK4S2UqTLFIkqx9s9yr\/Its9pZcbaXFgZTzFbD+zNdTjLU3NPbTy9PjfZeYMwRoXW\/1bEqGFdg9jJa+AEPwR7kFixR01R2fAXfCmTwysqEPXemVOrAO8dK10VuLolmq2GbtMxJiLnyViVgGKQYO7Ofedz4InQr89WVdY+zKKr3e7ZM8JjGXEN7uWA0wHmJuv17xizmOqkFiPe2bE\/erIS5dixQmcmyhaT5aTjSL1wZ4RxVXPfpKBIV225Ijn3wfEuOu9+QOW9z9nxbsS5891rm3t+z3Fm7NTKfBJMsMp4q+8xgDPuHhlTz3QhIO13upe+oPJsM48NZ3MEoNkdL6ENfQduSFuJaI9+j4Ue6+9aHa4l3epxfOuo1UQZ2O8bUnPwH\/cvmW6O4BUYr15RhhjjJLTcHyzr+V5ZAJ6jnX\/1Cc6cq6eqxiMPhcMiVxfNE48rSgdjQlx2o1NkczzEXucQOdbRTI5fsxX8AGyoWfCWWp6bkUXIy9xD8Y5yGJ0vJzdfZUiUCVcwDM0d4zupHFiK+h3+8Vq\/F8YsW2vDzOwLI+hAyN6tkRuRuSSVu21WrckuPTJ\/GdrnHTucVz7rHvDgZlM0NjHNdnO\/0ZUzrdOODDVv5Y8tynl+liaT4SrK681ojDOGuOMOubYc+pR+irVojmGsZtZzY3Ni\/UXOOeEvl8rfRG1rwEbuucQXa\/IyHI4fx9g4juXcPPGcPZivWo7egNW3XiniiScYAOd6CWqKEd7o2GKa29zrhreGmsOZ9pfxfYxTaD9TnlbnVDENj3ngpvxLbTArjurNo6HJ5wEbHnA1pIKmofOp7ScqGxeOpCObAw6+8AX4Rub8cLvMQVj0IN6bldUi75zajVOWB9QXPSwPtHIXzY36HCZzuzxTb7qGfD\/EasYItFUUfKho7HD9dU78Zbww0WoUtYDLcDMc2aWqyxSPN4g2o847sGiroq+IcnIiwvM+\/L3IV4FgRHp+9\/lLlMD6hwOJKf11XD2mafSsJau1zMYxj7FzPJOxpIrg92gcW\/3GgsqSnGovnw+8Oysm1NHe3UeuHj7Q4Aq4ha5+PTjOK+8+pPBxNeruW0sFFtMzH8V4SHvxbD46UkcP6s1qtnvGpaNJcnq\/\/aapiJkbGUs\/9q0zEXcgk7n\/ukB5y1z41bc6TKzggi9Cx+PV+PIL67TyNntPKzsz+AC+VgFlVjiriFx8wVa6QwHQLMYLki+yW69MZUBc+gaHIIgaVPdYeYEp\/cRjsmaLnJXtE6VqkEpG5WyGq7VdEzKlAsfZA5WuixgTEF9XC1wph5q\/Gt1+vDZmgj1a7xkzTL87T3bG7I0LMVbktNuHzfN518f0q2IqPhXROmBmvcJySgVOcZDUo3eX7OeLkHBG0BkgNIHzfdK2bpWa3\/iBXMZKfhpdmJijH0\/7pxzDRd7mJFFG2ruZpVvvFpws53OFVGb6KgBsbV57KG+00nsZoXH7\/et3s92n3uA90M1o+YWL9HBphyOHvKpKsS0M\/dYEq6Mi+flmtvoi\/rkIKgrkN1ZUFBjEN3V8rUOcdh\/9\/u5zD3OWZOGxRHN783AuzI68pBe9wXMEb22alWBe\/c9\/8ugx22bMa83Uf1BJfjmHVsz+\/nInMFWUSHFl530\/11BaJtn8i\/jMmGpbhEfIuJ1eBfJ8CDWyiFVXVSe0oDjoyOE6OAA97LYd2ejyeKpINKbUoHGQmbhbm5jBSXwYhpVhM6vSmmUZNLpZzgNHHWMztP6aq8c+HbPfZNAZwwzk1L6nltQ8TFOWaqxX9VtPFghzP8\/Nf7FePQMtBaH5XMTgwKqCThM3gt8HzUSlXI0b2zqIcb7Io57zFfAgz\/EyoJYRjKm7ihi71n1Sk3n1nZ9pq86gbZTQXOelSbwJR1HUIHoiD81PXQb1Un4bc1DZcM1WP33ujI2AiBmLbNYwCrhRO6dB6CwA7TaLHOhe1uf9Hi+M5Znz0+V3xC1YhTOneiCvPqOE2l\/mOC5sTJ6aMnN6Hdqqv1bU4rNcM6tp1mKXKPJJJOeHlicv1G364ChUa3ee6cV5DMa7DHt1iuKlx31HoOt3sgqS5tepSNQWRAxt3ba+rc5mvS8yuZZgLKLi0J7YYL0DtkDBtPtheL5h7uV8AFUvH4t16023Q5Ufo1J1ZI+4ji2zVed26ydiMDT170ZOzWzE5Mz7x2aPfd8i1fBrz0+90+v\/y4lwESOxEh4K8BFUEFEfb4wffr3BuHMVDeO5U3iUObLdkPzbnk\/04s3o+\/XFCmhMpKMr8uM6Wry\/PL4j80kg0cJviHfixzv1K\/XScAtx8H651us5PZgKrDN+nExqj+uCuCZ9KK0VgpfEESwLX\/XRy2HjVT3XyalJRNFWWh\/0ctiYijIXI4sjKVNkmhwvA827J4ezltfHAFttM39cMv3L4PWx4\/3jGOp2n+BpTM6l8tkT2rG3qw8QAf7TXpzaz3nUr7UicMbtkz7wuz0m\/JiI2rN2\/GRW1uWwhJ6RkeMjlsWiXY0jEx5\/ov6ZL+Pj2tVzkVS8n60hgzBH7jaxGXfWOcJLRyXxrVCzuu6zvQIyM9vOlePO94tzZy3cz1elr2pCP7vW7wagvWR8R61ZFeS1+X7qoSKPaXrfR\/C+YbfV0bWv+3KcOmsVet8R8Y6WOxmwFnlH49MytQZWu15zDH4Ovtnpe2u3Y8nYiEhXz9R4e+I1\/MQXnXrYW1WiSGOZuXqxdisAWBuoj8la46v\/sQOcD14KQDxLhrjzwYgtaEE79JK7mqF3FFBbwJLX8L1vr2o+rLux7LgGfDeKaG1ZVG7NOS48BpXqrNhLFINbGYwZDvetAbRvoycreIV6ivM4jgAPcJUOi6JmMCUsfnzhSFCr8hNDba+P89C8sSdzi4fpv20d1FvD3XveQdfHSGSM457v++SdaB4LiSD9oqMy6nCeqmdUcEP8dGZz6c9H9HqX8jauvmrRiD9cOUrGbuwupvg+coRjeplGjd7R0s1e7QAn3QYMPfc2lZ4+4gJ3pC1HNMcC+I4aOWweNc27la1UrQpT7VffQajXyIL7xGYujVV+caMrMLriyuMixpfYk10yjA8qv\/ZvXuV+nDjo7jBHLWpaq7w2J07dkjnHov8FC46MKOkQrDB8OTl0BZtJFSHUFfWnWysGytilbOqb8bfqEvBpyeEYpczIXQtfHRwrrM6ThzHmnROFUzXmHd9WBOPhOqnzTWGBY3UeNVLPYwVbxRc46YzNEs6FnFO5MDdOqKCC1TLf7k1FgGy9B3k24niN5mBxgqWigastjkVShE1cVaRb6wbV\/FYs9D1PQD\/hFP6+dXGZ9bZjlrIbj2UztEKunW8Zb6s+DxFjDo6VtI82g5rI0Wnx7sryl5VksO3V6FRDV8HNWjP00VC1dAqfVHhc8BCB2wiO6q9x2Mt0o95W9kn15fG+1SVB7JXk+Zej7+1DVC4bY49UMJrT0ban9SYT9dV+f1hrMJUwV\/tWUWYA\/FAuCak+IzGhl+L8ExFmR+ucK\/DbF8TNa0WsfyoHR8MW+y6HV0X7Jm7WpXNI+26nsWhj1F9zMAyA818hcOezxj7fXtH9uCN9vBIr3hTMOGzIBK+4g3L7dJPWH3Yf8mWw8cyrOfz\/4cwaOSxvRdT2x3HPicBsdTdTHHm\/rNkrrxmZdW\/1w9zUnHUxGYKFn3\/obPA6qEyjVgWoM0P31NavV5KrdETnn5ixfBbv3+PI4zg1Sw0aI1fvjhmqVpv\/ep0+yHXUMnmGPZn9OJUUB+f4n2XUFSB3HsBLVm\/KsPnPVtQkeLWc2ymjMOTGNSbXUOLhcCCuy2DyYxhV7vymTqazbcKNna383RY91cU6AnNET2CWlheTOS3Z9lwwucLRqhj8ZdyXZ8YHfyceetap7vRFLIEszjThj3amC4w1c\/MH5Wz8j5HSOzALjhR4zyTu05effHqIla\/RJ35z78U0bsR6yBy9+x955VNMV0fc5Xwje5H2My+0aAZQwZfBxg899F8dV3rw+0BUIVzweWke64SsH9Ts7VMmoJZ5jUiYMZw0EWAcrBK2YnkeDNdAhsoqywHnq5r11kLRwRbwwVMxuWbOn\/dpse3JMec6XWfp+onV86Ky1ZDHDEZUQ\/VVulXG3Mezmyk4tWrmKKiKeC6O5fze52pHYihvsL7w+GtRCQfLj80RHABvPse8FQlrQV7do26jt5lDWV6INe8ND8uMr5GDMfyy7dzwh9Wujjs1RWT6GYp6vcciIKap6bEHNLBugFVJV+XsNc47DwfEcIFpNbF83HnMUTYtmvoaP8TuLyNaRZhNWXF621o39+eLxfN5x8f4q3T6Uw1RLkfho8xOTZQ9+ez2rnZrBb1PPnXtqbaN8bvl\/HtzvEoqs7EOCdtxT3G8W7LD0RnOYKM1U7Cq7LFwzh\/mHdd\/x2HqL0g5LRFD4K2K\/PETaED6MNiu2Lbi4juYkqnmdmchdtSOz\/VVm1eMMg7a9vX6xl+WpP1z9HDI9PShnnmAF9ZEPGK7X+9dCc4dVVHQfZgGziEfHeHD75RwdWUPVhO8I0KMJnO66FIzUCxIpT7GOlbeU33QR0U78+989QnWO+4p\/\/KdU18fQ6m2Nq3MZrYj6coiRy\/F5LzbjgKtn+ER\/gFVVx86ptRy0bFDrczAil0OljlydZz+d5bi+eoO9ZmTrHbaQmPZ1pJLFGp4LM7Iw7VULwFG6m+mnF\/fUjcPSs0W0SHnjZkZZPW9jKKQOFR+GvvknutuhtovLxLhKEXdH+fe0kJH9Otr\/vVxxuLrnKd9rzqm5C+26jv+gmvLUFgwY1U1c3OnF52SfGWDyih+Nz\/i2PXdVhbZzvVEfe6cP6jXm1EF6g2e2XGUAVsnahB1Q71Eca2errvevdPWYjR4mUm7XBOe9TH31GDF6bU\/4GU5GyJUG0mqatNYnhLlFZ6hp4wOUivbwPWeX+3C8Hzw5lbGkzfVNuemKpybdI2Qlm\/PLwamlhsXak2NMk5y+vFvnxnBv3KK6OS75vAIzFRerl6SDxVhWhZMjFX712+Tz6usyxiX41DNz2etwjYiuKajmCuZNyxXD5ONebHXedK2XuHr\/7YHmVtd1aX188nHaTfT1jJ1MUcChpj73Kx8M0c\/J1uW4Gjx6mAcxpVBq7UyDTXVqGYOMN2YAzZpK\/9AW2ullSLDGdV5yY58NNSx6nHhTn2lyDis0JM8L5fpFvAR4N+VxmOMx824I7WX3lOTut16GSLrvMs18CyZEv+798SQYAWx1fCxR2quZ8b\/qDVeJnfG407DsEy5aciuP+AxNWGNfh4tH6eCII37XHyrBI+rxuFonROoyn\/MFE1pC3MiyyVHFJqPvEOvrW6Pa8\/DsCccTWTBtNyKA9FXMkO0q5MOc\/3+rgVGzhlI9Iz7NNfehT\/xpLu6F7IjAy1DV+njsea07WeEWyt4LrFe7fde+bpH4XY6KS+2TVR0dU21wLPMqNEQSWL82Lrx2OhgG9mY7IMz2M\/jmYSkravDcx\/jlXk5HExWgV717Lnjeatfs8\/tEdunEcsUeJ+vojUx1DySIxikbSXEIlNfbD3K1vMfYHha1YjBNg8pzLCOb84NDmJtA3Jfjekgm5asfq2Q4RcvUBbFP3WDPOsr5K399KcsJ9cl\/73Ue6PEJcOy8ERekTFaDsM5Z\/H639gOzqNHXm0lq4DUO\/WP150LaJuL1+LuWNE\/zyFvFdHxzS03J5Dmq0+Vt7hSR0CtzGOMQR\/qBYLlTfysEd4WIH4qRiW37Ja71hL5o6b63vzdY31GtPyTqinEnDE9DG0gnT7PVehfeE8lOpVhZHDp8eVXE+Qntthxg0ar8xoOp3R5Po8qq44dxpCqEX2J3rJOf3QHZIu4oqtElixYVd91Q\/H0cPfbblVbhAWAQ6Heg3n579iWELVP+r3+jZOK\/ifvnc2yvEdk99ZsuGVyzHz9zcREFHH1TDZsXB3uBlPo1GbY79fWj9Vao799OGLTM0l5s266OPP+\/RRhEhZHRdXJHhdrIzBl34o4e7ZtvDPX3LyjSDkGAqanmdWXjbxcJSqnnxkAKliPe8djjNnA+lnljU1cuSY\/Ww9Nl411ZwWamB2PUBCiWH1phldj5bVlZGtFndPlnfwe48JxmYOeZmyTPgz2uPocu2pRVMIA86vNaOL8SylnuX6jphCOtYrqVU8jV14tbquz9E0e+vP321HV0bs+3aqnEqwzGOSiSPVVFRK7P5xhlNn3api4LNrjT5QAMrO6X27Wqio176ditWeYj0f5kevkMEYwrsJNbhbHxtWjl3F0qH4TXawyzft3pOXoVfdQO4YwzvicRfDlJ++qq9TN3EWLfMivJqteVf6N2vjDCDCRyPbOObqsh8S2y8rhKfm0508FlvmSzepuswT7MhLya\/0s761j+L4ReusmVTq9wniL4KZADLLK96gyuK+p7NYoM4\/IXkfUd3Ff\/J+SYMQgXe5rz2WSZsT1QRVE1kVt6InjGSBxDP+UZ+XWNsiMugr6ef0cAmNpbBpNxq6jIZatml594RYqDFkhcr9\/59nOodDOXLpjH+uA0uZt0SiuVxk3emue2FpBjWN5Ob29b4YrKR0mrWCqjWzIAYcX7qpMfBqz8u3xLMwrwprJN0o0jb3NED3ZDy6D+tQjqdtUtVoNN+foFNUGojoucgT7bC1\/q2sZQ3VuTufx1I4bv1fkUGe4jmF3bA2+gu+eg2rFBEiNNkd5ue\/C9KdquashwhGwENUh55nrrO52rOwXBNdxrawG9n2jQHOlEqJvsBeIIQu7+n2e2DNdfx0XbHp4GR7xg89DiGj5\/xhazIGCYxEZhtYdqy2yF5\/M4t3zZWTny\/nkl60eG7cyYTLG\/PzOmIxa+I5cJA1TU2cUumdzOLf9qgg1H+NN64kAvxxJ4swKe3G1Jqi9Xz2Es6SOqCG4xijJrbb4Xl+UdMcc2bM+5CHav4h\/lYW+Lhp834\/jUFmobNvJgzFzdGNsctkau02T3Yv5nHajna\/Os\/ViA5vguXvteznSuDQGjGAybz4PM8YOdlqJzCdFbVsyU4lS4ZAm5pn35Yrso3S6xhmfh+6x5jQEdm7Of83sM6h1DJjZtV+0lr\/mQb6a1sqBxxhNXb\/ecWgqu3lPWrY8F6dnYqxV2x4soiZRQ9STqOIpvp8Ih5EZHSuWVEOnkD1Qp7Uqag8t8DttT987CrWG7Bz+eOexu\/Fu38Z\/10tx3VTbnUbQ2aeCDrHIjE4G5yBDoNzmtZn4RBGPkj7Qc7Kx8U\/1iaUqqUto5uGsRmho375Uskr\/19Fuj7ImZ\/rlZiO5qA+Nvy0aApCRDnllCpiZV\/\/Ym9ppNtCaYoEz5FndeS\/Qr4emhquBWw3h3ECPESrztoS2Ai60j5\/NzfvbFlQIkEWeNlI9IRq6IxY4BD3K15V9eY4siL0vQxhLcGYWYGeZ8asReD3ZYJHYEXaQrs4UZMO2mMbh2TYjJy+iilE4n2N+Of3lqHkMS1IfRNHqvAgxIzEHwhg9tSw+9XR4Jfe\/GTlW6gMf+1rAefcqCHQSkgV9zDcv+M2G4BX+QFHHII1FJt8K2xjDL1TT3Oqr1\/igix2PwBBHJ2BorgetOyvp9ejUXK86kv68h7W4QRGM3VZTeNS9TmyHqsU\/21NRsvM5c664xyfqvjaHjpgKJI\/oKAqDKhxLf5ntOMNMDwcl\/lU\/x2r6+9ppu2w7ziRu5YL279+nCGiu++hXPryK1y5jwok6udfqq1ZYl3qpkiVDeLe9BvaGFRA2jgH1ZNRXy2iFWRr9tTxjJRsVFeW2dOBVUPXKO2pFfKLIfqJM5Stu+h93U0kPbAOnZ\/DvyAEOoxVMrQwxDVNbyfh2bIzxkyl9PFkiBzoPr2R9PDIuXHzaIi2AEnvoY9S8R5+LZ8a66m0Lrj+LNLRBnMB95IhiNrfjnbeioO46PcZyzjm527qZGTQup5NThXO4MuD61tkZlXLLGAYH5nmw9co5Ku6Dk5rP3\/yXM\/NeEX53vYGFgqfqfYJf7mCLHPVMMs1cEJJ59pjqb7LvSoX5uqoq+eBq\/fIP3FPUJN3tj9vmoACLvI\/rH\/QBkEwVuTo7THVy7w4ZdUDl7erTvNwDH5jk9c00ef21yWpkWenMh9zpu+\/qdWCNBBQ3g4J0UuOGZq0ttb9ib6z2\/CjXLYBNOG9bkINwffe1BbTGq+M5L4QmjMGKKHzbZsof5z2+ARB4VVkWNlZ5GUdbWq2ABvSk3rNMkIEzU5A859JMwm1VsU9dQyGyv3yeXh4Df8abNmEBtV1VZk6uq4jD1zXr+sUxcy4emy+qi3mSR2NNrqkA2sQjUr\/l6XJNMVYs6yesnHAzKwJyx1gbn2zd2qhP\/w2kmzUe+sLDS9rzMxnmE+UctjOGolnNkjPGXcXFIrhjUuomqmQMxN+uocqorZ\/O1+xPc1Z8pZNGjhpodIZheNKsLBKrALIl5652WkM6wGDTGpBxcZKgATYf3sjP3sXv4BqsdHDiFR3WVU6+5B38yD9mshqiJrpO2pXguiY0g+oBn3gIa28a0VkNA5uh\/gF1zGpGvBRh9oxaFaVWWLKiqoJRjpQSyc2jc++nBPbNiuHHXd0UpLq6COrxxYnV4kc7cP4+SVQueVzTqF6m59DGaGZZX0zsEvk5gfnXQMR6pAYb\/7IybLXz4T91yDUwiRNHVplpGUi9Lsa8V4XbgAY4g3keipvPqXjZregxjtQy1c1Pry3\/xxqarWn56hamUENtAZ6I6Z4faMOMidoB6cs8PFFV+fWqi9lWGZm\/q7nmdIw+\/u6nfBYBrtzujF4dW3kwlwzmqODGYar4Y6yoj161z1ARV82lKOueqj6vRn3IlbTpKHlcsI+Z2fN00d7Pb6\/6TFLx66dk6MoRMBs8TfWss0aZ\/ZHlYWnXWmnDu40wr6\/eqtggcS3ITUXo6Q1zgY3N4GOzGge4cvpezfvyY33l+xm7e4R8ColmpSPcXjPz8RypKTQWRntxGP6p3hs3Y9K0wXNgj\/ipINQ2+dP\/jsnXS78xeT+wmbkxqrxGpkQFGYRnn5t5RzxQAJhBbzWeJ8jVNn507EbjO\/aProLBIl5WYt8x8I7zMPdyYKPr+3+cat93TubWlkH+rnB+W9ne14XRC9s7K1Biz7fy1C0nZ7IZPcvLY6ynyipv7kLCvVCWx87sWEAeZda8Yy2o5bwKe+oqLm7fUVgLuHb3I8kfr6LGF2dwjLgzt3LoXq9XxR9ET1pnUea5L+oJ3Jjn73itYvHi1l8fo6Mhs+in8YBl9osnYmW7ePC4HAS3wUiNJ4jjuTkwxozbHFJGYO54mfEwGhS9ijDPy+faZaOs\/ui7SlUfmuBqU7gGYIoNJzTv8OJzYXDhlBIVjdJzfIdBMmNa05UVxlsT1CuN9+aR0NT+yjWglBomX8OfV8aR8K5NjB3ayKvwlPGh\/bwummTC9oIdZ5XTx2CarPi9MjBP2a6MurUBfPX8uNkdxzWCtMzKCE\/CVlevYBvO2xqjLuq5u3lbawAnhK7ZIxhPnD+8WmXbzJqVMTkIJEKrRiLH3LslM8R3EY\/itSu5HbmikhuLXzeMhZzmW12\/zEd+06qr7M2252F+764d1omL2EesqTt52fyAj31LZKuemur7uPOulvABsERHaraZHyQbdHSErjqvR5C8FUEff5XA6uD+YMfN5J7KZaRUL49AqKy6WivHyqZuNyw1d7RPzu3JqNCyd638vvthmyJm1wcSlPMgCwRZdOU6HrKe35ycl1x+3HjV6ijbxqrTKJBD17VgTGbWebeSu99qZX+tFtA5TBZ95PwyPnUrAsaSqPiyAgqPf8W\/CCNP+jIZgCsIt7bsIzOsgspd7M8o9D\/3itrKFnARmEnbfNMHekLVbDvw24CNZR9uUwPzAs1hmHk4ggmeN6AeAzi8Y7C\/+wmXg8oLYwxm4RHlRmNxH1e08lQK6t5PnFsF+BcxLf51OWT+H5Ep07hOw8P\/Xnn1jDrCRcH0q9uOHXTho8JcKmp5FaZsTuQaWul8thc8AsMZeZYzqSHWh6vHrXJg06tT66vzbtao82im+gWHrxTHn8zpFKnVWGVCH+Aqj0d57qlH96NOj7dzBPfx2mo6UAOUcp\/+htmqe\/KoqDVDjIN6poWLE\/pY9A49eJ++Pg9ZNM9fw4FEEaXyF190\/LQ84nFA\/pgUZn3KRAa7SSNbTMEj50qcOf6G6ifavy1bb3Mzv7cy8N3rRSYivuS5cSTv+Au0\/sM7xS2+g7\/dt1vB5SqneBwnc5StI1tFz\/vpHA5tbHOxMzaHP7GXvMkneCKYnjEusxtVMfe48Wo3we3VKHoFjmrGYc7toDdig7\/VX9l8GdlK5XmuElGjqDKqnbq5tQwftb8iobkIcr22lzEy5ueakN0Bi\/tOHpOyJfxIb2oy7G\/UzaT1cbFnbLCNzDB+eI6Xand9TVs3vucT5mFQ+qndmKVMEhQl5\/VeRQds0Jg30uXr8qPxHC6pThUPx403BQt80pcfGZc4zsP8HvUe8q0vqob3swez2d5lCeL6fR+UdM9qsb6OSroqILvbkmOF5Q1z2vvkT1mP3Q8pYid7cI57dzdjvL\/pNXauGp\/mEQX6SZxxqM0Z\/LRorGI+WJ7K47BYvyVTVZqnIZ38YvuJ10Vuqvb74\/0NUbqLlBEc+odw\/c3U+sXqWDZtcLfTY88VxdhJRjqvMY5rdquoW42RCX3N+p6i3mxBghqhxuuD2ZsjlzcOeOyjDEUJfVnN1OO8aWNjhZq30xh9AdXEeiCc8cFugcqxMit3VTeOYAQer65+Fx3D49QQB+Q6iLetBu5ZTgZuJUNmndXXNVo1eDDqQg2RQ8oFxel0t2tx2+9edZSteTIIT6bN+Q5U0qtRcM4iXTTQ\/9h61ZsWT8uPsc8rj5mon7EWDCsrorrmbq82+8au2Uy2HkcR+VZW54MKUd3gKLn6+d6d9cNbvYrWG869JDLyazMaX\/eN+FiKPI9ti5XXax\/BSeKamYBYz5OxP7rW2E3pwCK+4e7FJirKIcM6iD+8DPFjGdwN8ZVfxMucQqp3eB7SOr46X70Fzxl5+sXhHHYaTXjd6nPejM3adaRlruKuDMZoy7Xk2dzIE3ACOZnKdP59\/nvde\/7Q4rK+segcTpEcza+j+cQb97d1\/Uk9Laupujhi4yo1mUuPqwV6HfqIBrUzjwVrt+JFpkwGOpyjzuH++h7jJ66theGbx8x\/MW019JtDdgyJeHHEmfdwtuz7XHRrg\/c3JrbYtulRp6o\/KxOyLl3rrA1BOJyE81AxcCFw\/K0E8FRg3KyTVeMld4Nkasxxooh9ZTM4Z\/ywhT9MuTUHckxe4fwhZ2OJDdkZt\/8ZexlxCHQsy3jGjyamfdiG42PPoT7n\/8dZEg0qkRzDylRdRkEeaAn1ha05v4d\/ok9eB42r3jknVx+0BsLGFPX\/MDs5GDtzjjyvrZ+0cRk97p12LK6sFxjLcLmehpfNFkSDNe8\/KXNctfzP76eR2DFoXJg6w2hBSdWssaCe1KqLXkYG0+l3FwXaO482FGb2uovzLPXN89OJOrzoPMZvbxRj5+YXJhN7xwlyu\/xaZhyjlJHB46eXUxiiRy3LaYzByj6uf1q1OqD+UVBXv84EtFltRv+c\/bXKCI7Z5FMr7usXrBliRt2BfhRRv3lcCUbfyJnleKoRLcMEIWYelNqrqkx\/RBFsymZUPTGzfzHlXuq6z6lTZmHk5LlrA0y4trQNasw6bCvwTrkHl2dM1VxV9C9PMKNmIq2kHTLfkzpJMtywCLUiNvPqqjwgY8+HrUZ0+OSJb32SH8qhQz4Z4NfaMibH1hf975xIPeOXC5w9fB0dLlPJ+40PGV6Vz4HCuMPS5pfxPK7ovGCzsHtbcNR1I70zHK\/0eSLYiBVdr3qXJfzRYU\/lFGXHr+VQFBo17F\/iuzF3RigP78MWthGUWC9sUW5aXZi\/jJP7LM+7\/1afXKU5x7d5cQWMmKJnX6H1HWWEV5sYPlMzduv7bNV9G9V5pIz5zTQhgsvQtVXy7+nuRTImBbnWMhrXkXSW8CJsNUxwJIXjzV3DgYdv5WdL4malLq+t9h2z4DjM\/AOzKBk1syofj45jtqIpiqp95ZSrJ2NLTMxje5+bao3+BjsP3Jiv9zFAdZ04iOXfPoxoLTYCiyj1rldpPjumxnTRe05CdoEN3\/tlCn++s8FdXCTZD\/8mwxlj8HyKVvX64B6smSdHIBN9\/9q6FX0uBNYfrw1ZHq16vDYNIEZjmD7Wl\/D9Kz23sPqg7rZ62F7UK2iAXcgJNQg+jxVz\/jxrTjVobikVydHRPEpqe+zNXHJc6bdtL6psxn\/\/eree337ve4s6llkgjkLMoVEbzK7KxNmL4hi\/2IqnRsgee0wRHB3XpO4e6kNlxxYE6CHb6\/BGbJ\/vdc0xPQB5V208Wn3NCdFW5rIzGA2TqvV1LzA2NYoGwApoy3kwqnezbO9kMRnob3BQR4UWjLng\/Xk0IrfodcyZC0dvQIJ\/O0LYCDe18w20zOynrOUVsT8H0V5s1VqEm8kYLEPV4Fnwh5O6tcierTYYrXlXd9if\/Nk2lXu6SwUfi1+9ExN1lBqVM+UJnIgeFbTgTKpnG0\/7X41tj\/HcsLxzdKwSj2M6MtY+O0chmsnR4tQpw\/unZ7w3HHZI5E78bAZwACXabYglLEqOHSPz6TZD3kLb9cKhiIgS56ZeD9PUjcE+GgV6bLV9t9yJ\/d9ZFgXPQ6OLiXWQytlef1BV9LuaYt7HXUPOtIR2XbnBdSgzdapHd0RXgbL+ufXTKmqpLW9lfbgBk4xWV+3KY1stdqcbD5vD8\/Le6NkPVUc0Ww2ZS2uJ\/sgTqPpid55saKCux1hksHuOUcviVPjWlnsuSw37PVKCToguZgPORc0QvtqXtal63M+bUdhhWSlugUnnwq+s+PwczLQZIGTUv1H\/OPPN8nkNqrb5SwxFBL5SPXk1iv8b\/8CDxzrjusUSxlGlf3\/rFxoX7g\/ROtTv44pAzN7bcRPQczzZvLUayBljQC1liW8bx1w6GDn+5am5OmSubnY0lniib8PIjsGTC\/CNQrDVXZMBdk4FdGXn\/KIB4pTZEF0rlaiUqWSQKJaOg7PUO\/6F1o7ZmlM4mTyK7kzmW28iivnrFJ9KswKY25fv1DCY4ZTHSrCuqFiYDpRne45Xyjso+nytjm1o\/10j858ocz4tQG3CtdbM6RXtq2d8ruCYxzWBCs3n5uobOFff6IA0flkRX9WKDxB67niO\/TGADoJ7zoCdoWN8RJv0ArLkCpECi1HF1nDO6h0znyO8eIjCc0+OP93JAMSdLMuUjuV8AP2L7zw67Vs1btzOjR70oe7v+BkbW1zFW4dG1ByiR5cNV2Fw\/TGmcbRe0W0zhGbaH27t8WRnz7a4O\/KgWjEruCj47Mj6Pha9fzkus1weS\/NuXmYf4yyLX\/TFmuyuK7Jfq4w8hktYM+K7eA186NJ1xvL+8zUwdmd7LKnuW5egUXeWceZM8mVenZoPeGslXbZsMLyhLFNtKw9VkLUb43KmzEEt4GXCbKyr8fy8x9wOwXoMXrUeyKacdgp7+lkcl01AKf6Q\/ecWE+vGuxzI+oRxfVxY8qKaircbHzGRiU4vzjH+Y5ztA7bmaDsoZQTogkhCT\/9c39D3i78XK9VHBk6W+a5hFc\/HYZh5pFbfw3ZbTJu\/85cdCbmhRPyENhkBY1AvtRVlfnXbVrdqG5qLQrZerIvv586IOKtx77PAGBjrsZTcIFczBhGN9pKNzmfUylHIc1a07FnIXku30RAn2HCciS4vN4yZMfE6XC\/zyHxjkrceZR5zAT\/EbbUML+2InNzM3ER\/og2Cc\/3LKfFjrqeXYvBb3dwTnfiIAXXn9wm96o2qa8357d+7i\/j065gDpBspIn4jk1fdhrr8fUxln1NJfzcTVZjvELZNZ3JIzVj4tpG0z\/ceqYLocNHcqDUz8Z11AByTaQbHFaxn8Tu9I8KOLchCXFk1hitTeGzDeytwLEKuSLsogSqifzbr+jrZ2IoHr0SsFVDczhXMzXl8VkTIhceUOoyrCVc4xeaOlsO0oooRUKXMNTxoJW1M3aHZ3THl+kvrooO3Mt4Ri9LF6mOo0NGZMauLmTw+Wt7gQ3hJRWxNswKQl1qnjx3aCox6LnSYmGNJi0SWWqDiYTYy6eca0jDH4QOZlFy1uFqyFWFH4mGS7DnsvGML87voCd4sOGtLY83i8VPzrSOr2tgwZjjmapj9dK54EaJVLI4RfA3Wsf7nH54XYmud2\/Ee17EwHlrgx5h35EUuqzLztuvsguLOdo6u88+wG+2uE2nyr\/NiClYxrhDd8Gr1RZoZBwW\/R3yvSbNb3keTOrZ5j5s\/tTGFQqeqt2DHarSC9A7OhG3MR5l11aP7YUaHsCkhGNhs4HRwUabas8ySaxScT5WpOb1VHln+k+kdTWArqy8R6WYwHLq9NTBVYG6dk0yELsDCRMv1nMemOMf0OW\/LMY7ppG5+c0ctGYpVi4uJLs1dcFcRj+mOceoqmldYqLPALTA3fUTy0APwursXBdRgtbUcE7s5bZDCfKiFouFpxJiofZIpvqUzI9lxI0c01iqzTIP6iPfJC06yNTO22joI79\/XGQn1kaH\/3uGcG1cvbIV1XojcGqNxjpECZWVO85v5c41cW+sYD4Nzwh3k8Y6RhUtwPI0APPTyAt8xTjm52HW+jey5jmuPCpKBxMyiViYY\/zYj0z9iWABztrHH26\/3bnk8VpzAS2+d2jlSZVtzrS63RV4Xv53beJZ4Ok5qHqaM35FX8eG86qhVqY56laxLY8vnYLuFfnwobabVjmFunrGz2KpiFdL6hRkX92KBMag5RF49pvrZT+cs\/5g5ufKU6ilrZ6\/q6AzHurLv+Id3z\/\/AGG\/NUZCRd4+HcZ6tF0n8phEFTzCoVuuTY6uPkejhvcZ7OC3q2dokU7ChOtH5zo\/QDkfdOAI4hotixV9FexpddMXVgS7qHZnHd7RSxmLUykP5MDnP0\/F1VKlW8Wzm9YxgyayaQWKzbarHc8jwDR5qd7TB3\/p5y3f\/qPJhwr2ap4Ve8QqOdC16EqLoe\/cJdcY27MGltNTxvRXPnnufPv2A7HCORIWiKkEzNWZ9IzpbxA7PrPtwqaiA84NfYKrGb1DBkaIvzXAdF\/xNnRBt6wbsPW\/3Yfr2FDO5a0rGRkNr2b6xRh2qBWA1Pa3Nj8qkrjPe\/p1ekG2u\/yvKUEA4MFlTwzv\/\/sIHVMjqtRFs652tNUBk4Shc0DfSq6cpBErFNrTL0a3qBvt3fjxmjnNt02t6un7GRtN+9Wxtb0xN+HwAY4NPGbl8+3zdMkfVPw6ePnwZu60OpVTg+XHmOQVlp7bwvG5VUrV9\/hbc6HD7qDHpWa\/GCS7M3c2feqK5jJ95AtMouqxODI7Njs11h1NPqr8ZkvkYOagme5c\/rgUR+8\/dlUH9vnPWVGPtMvTvv7B4mbx8\/nn\/z9Y74xFu91tAaEcN2P7FTSuI0U3HTnPQns1DZZ+7YB\/9rWi5V\/Xx32o2AvKKatkeQParfyqSquEdsUXOxp048ykyCCcX8te5L52EfOrcZDtGZ+5BO3e+1kuN8YsV3DC9gFORT9SyP1dKnGehB72NyupRtH7f4zDzYUOuYimaiYRML5+J4MUHjns+f+5x\/CL3o9b4IFgNFqOOUj3RFOxBxw9jT1\/OYxWVYSBXXMtVXkkLqSW5F7c4KcArUHd9nJ4hhuCcKuhYEpOhdEyHajTT8\/m4hN\/wokn02AjMzYkX1ZesgfnGduy9nly\/tKVxa2IAzyZesHfv3dho12ilNbDg0dnTIGJ4fqcxfs5fBfQv80RhyK77M2\/i9v5ljGWqVcONs2sh8spRBldlquIabKWVXdm2+pkxuDJBN1V73kWFifLxOAwI51lbx5zwpFVzsROZVz1Ungrj+83vh3dUNd43481t+QP1FjGMwxaYD7U7x9zZuAJRa5gbPVF994p+i+sCnpNpPJ6Lah5BkFfHwGnjAvC3yk3Mh+Fin+pfJTXv7LXo40bmddhar\/P7O4aSFZmFvgq0qljOjdiZuZqJ+aiM0ooAk7eVHDkNnGv67Uml4FiSn\/GhnznOEW2OY8sCOBtY6Sn5WL65Y13G5lTC8JaNekVjuv21wGdiYczLqsiEl1vPrZDyjavjRearJWKcHK7PLaBWfa2a4qSIy1Fx3JhR56\/3ZnnegBqnahuf7+xh5p0JaQ8Zp6+eYvaVqQt9srjD5YAXq0ucqmSPgcDVzsYmNrRqnaim5IE+rtcxX19oZBt154+yqKf7xhGy87S0TPVUAtUD8TTVWiC+9Qz5r1mc4tEaGr71IxU79k1bzIj42S7IhsVX9XleNcI1VRlfJNb6Kg3NyZ79ThZRu4hTy4wAfd3atkcYLiLyiusu6nH8zxyrljni1Db6zBqmFobnOVqvXjmfYiTg1UTx8W17eMwyDIJcv0uimvUiwt58IgKvMG3qPvMR5bV\/9zsLmIs65R2HXd2dg1r25pvFoHuCZCODfhCpjIAq4j\/u4XmP79FyMG8Dj6hQ8ra4lQHG1OPOclMx47hYzSa+3AFsTFKkoi\/w1FOSxgMUbtSgO63Cs79321Z9Tm\/f1DPJ8R1B1Nocbo1CckTvwxxw3mcNKEfG1zmz7Vu3pK99l3RZdt8ggQdUc3q8FqTpSpll2H2z3fEDcOasN8byALw8nvhtMYVs9VGjLL3KYH2fUjh1aO2Mp+GQZLsYmH4e5mCjqsx7FAXKnHL+NudCwbL4hBGTh3nKKYOehPFbqzxWk8yxmHGlwPu4CDkStXjxS0THeujWVL6cGo3KS12\/hZNc1f0ixLdBqV9KaLBCyH7v7a8rx9Yr3LR1Nz3KOzdD2Y0ZtsrnEahoM0ls0RbyvgxWRwJ3mJSVN9jxGcjc+1vltKJ+e42Hf+\/y6STHOcfy\/PYcLF5j2dkI2+OHhTs+Maiygw4w6SydoYqvAn5zrF80Y98YmOfgLEhLddXLvQi+tUh1r3F5eRAxriTJzvhOfGxNxcjIAHwmPmHefHotSLfWXAe7tS4KRXIuw+Cug2GsmcntRQ3kOXefO6Y8B8CrvJtXuSYi\/fznd9Viai+v3JWEcJC98Z3d9MhdbdifTHF3G47acM1FxidfudIgImyR+0FfTYpT2kkvftuYo80orW3ie4oI0mmZXHNVxflavvUr7zI\/Z8Y2x4Lsz\/UZ3O3EXHo\/Y+\/jM8Eq+6QFr+Pg\/r\/28N3KWF6lm22q4jSXvajhrSaGSzmOytApqNsX5zJt25jH+DXlESd4qfUfJYtDbuvloI6EWOofGcVpCKvXrWTRVkbaEfH3KtRVwkUEhS3nFl1kWIWCnfGQrFfwFbgJrlVRc5gdLeU127mxOAvet8rl\/tAaLmntoCW4iPaIa+h8L5LFJ+dOdB5WkpkT+dSLPKW+yntUDtUI6kvA5R9qhSr1dbL\/lzPuGdGUR5m5tXqsBD+rwIzAEeraTztEO+NSNamRr\/byimc52FoeknOcoey3zH+Qz9zu95\/zoQ\/2z4+Pv2g6\/mYr1rhWys2VOMGO5MfoXoyJ2lUZn+07hJotcUeM2MIIweFE2ahYvTdX36Xt4bRIZ2xfjIgO9vmNntqY3tMLc2A1lati\/+Km2vXbiFHpE6iiQ27fM5XNfVYYqGDrg+j1WfvqrPUlVFIqKI3QY2oNnz2F3wjTSLyR3+DCGcUy1os32DOusgo9EgczyqibuZbv2mKmuQtxVyWOY1Eqr+g728\/qhBl1vOlrORQtDIrIyENm4DD3gvinwq+icCLfqlFNmAc4VFXYzlpUf1Wdb+WJRPGd0Z7DkDthfmaxSsKu4r+2Vu461nj+tu2R8vlmxyj7X5Zw9HIMOaIi5cTj\/mG22TTq7MGvcR12qhqrgCmh8wQ1X02Z8\/m1AW7dT\/Qfd7Lly\/lntSK+5Mxovh7yvukxOIBPi\/2pGJGnF2vaTDCiqxxx1JpP9Lqq357VikZ\/x0OoKNC8iutRjtZe4sZatTb\/zj2lZJGYjmcrY6u5owXXU\/RsUw9Vj7B17Tw+GigjNN+t\/H\/U5LYpg4CcjHGq7HnqbzUXf73rbEfSFQs4aAwWR\/thFOzvCskzR41OZzJMtw0Y6hiP1wA52x6LN1adN+slsijTWHt1a8sHvC8+qAxRnKbLJfAla6LfX8fCcQFQAWv+4Yf0zbGW\/sqt6hnzIk5UgvVz\/C7TwdasZfjr1kb6OOSrIczrEE2Ed5Zs2mecGM84oPXHSrv8gRpMNZlRY7tVKs+mNUUquaGugvC28v84k2Km7cSp1XE+\/WnHyyOrjLzQWmaKzeG5gaddDHkKByqpuMas3pSJ9ug3xzura+1s7OmjDw+tBbNUZznGBxXgalcc7Ijl5gZScQKgYo5VvepdpcbTfp8SDAfGyH05YBkBtcYZTFoT1vTD\/1t5ydNUjn4GiOy\/Vpt4VRPIi\/6auaS6iXR7H8\/QN2P3uJH66HhgQbHZfntE9VVW2cF1IjUpYzRyHTnRfzEFga0ntYF63HFvqnB8d84kIYQ1fn3A5Ovh4IBG6ItghVUF97cXZW8N5BX8UzdUADw\/RmPebWlOZ4gcKueJuJ6GbXEZY4p8ioRrxl+lFhwqcNn091SNqNIU\/W+d9nvvfV\/xvk0dTfirgHABcx5+32zASu\/c33tV5OhrItfvGFx96rpgW1rn0xf55QgFWg+ezkWpEiin\/Cpr0pZog6zKExHMdxx33xsBZwwbYO3wRn1N78hTNQbWscpQJ9jnuF7FuCOs3WF4BnWNwBjfKmC+5uuhru3jvb8VYXTOa1E\/RpG5U3UXleMH5stxFPpyBupw\/iYruNpjk6tlsuGnRmUJjgWlPe\/49J0\/0WL0bkHt8\/oxEVFlPh4F+OdMnD0+A0bkR3SWgcebXDNZP9CIDoeNr32LdXgM9J8HY60Dr1TvSgowZa8amn7l\/f\/8fjL2HLnk\/leJZI9l7j7CxoKIep5j2B\/znIeGi8CBsRITtCTTikbrCJzLA3\/rw2wQbSvCZ19sq66nNGjc37EwRmdmfdsL+X3uZP6OsX2dyen4c0F1BHiM46N61jK618uU3VpfRIRK06uBMvLuOV6UG4eouwy3yDFcx\/h1nI0OviH4iCvfGtz10bt+Qi0cdxDX03Era3rSOvwyCnOgbz8Nd96udPFcp2w0Hug+fMOV2aTCXQk9vS1rTIcasKvFY1h56bTUscnQIjBNiFPr+dhlHMqxy83s1m46G5hMLwEyDwm\/PYecVmi8ys7xwqWn4NydM8\/9pOEyhGb3h1e+fcCH5iYZCEvCa45VlvGu4HfcndaIIu3LXyCPzwoFXT3r9tuY71fwSOlzXr2Hk9cfcv1idvSbGrL97tc2FkJj3zFjrnrcZ0X4nua2V8x6vSQqzbXtnIGP\/9hnPeqDc4asrGdrtpRWnjTSLveTT2s5q4Zj6Wtzk7srFb67voY5MZedM822vX8H7xKFehXP0AbT278x3fxz1Uhbrq8bXzXWcPXGN7+vSsSrjv13BbJXp81P\/1rgDOHrKeWtV\/ttxLvvePw8kR4GLIhmGZuqZK07\/BXhHKuqP+Q6tyCouGkNVV8Yz7xb8+LIjGWj0k8EzDHNcQRbMh0jYGzH+64swLp8xTNYwhF\/mYDH2YrPyBr9Oe7mA7W4Cj1OlRGZK2qcwaELVGlWF3zGx5Vn22s4ZV8YohW3iI\/7ypHHH8ykP9tbTVLjXNWjylOnxQqf4ZZ6FCOgT8I7LI9bDxLNrtmmAvAd7AMjogTpn+9gYs4JKWxCGzxqTBvtzlhPPncOrhnDjkq8ldg\/MysD4qmNFRESh3mjqwcqdnW11VSzxli6wSeTrHV4pS3setzMr9ie+6QFc26dXOYuVuo\/M1czXhSemu+dctI8QGvLDBoXud95g1XOG4hNxtNZNEL86sZ0G2SRe\/jVqC07aqTzE4FTodBbj1\/QZq\/So2LfOsi6fS0UJYmlSKO21Ja3Dmhmuu3+BfO4W\/Yu14xZ2HpcI+L72SW8sHrG\/PNqpjjdqDczD7rJy++rpLduco3UKK\/eifk51nqBIrzcPlfup0qIpFxkNVpTdf+7Ji8zO05epEsgXevPERDVzbNIOc4kusaNQkiFkBs9C1s8vp7v5n1m4ijARxR6Nc5dG6t7aOD0G1UYz6NyrtNzboT3ttevjTsjk5jhLH7bD1+vGjOafhpH5DxuudXTq1ckBmUSO8UDjPaYGSSTPeaqXnwVZA6rF+WUY5pDNfKewV8hP67T6blvGK2ssruV\/xpIpyh8leKxrFwJWz7Uk9mtu8jjlGMcm61Fk2w7rOHsGqNyFp6LUm+8m5NitawzHsheHuXo\/FmvZS6JbKO1WDYWyQbrRjRBT5nXE5FSLVW9im6vGUvdXaG5XxlOT1t8NgKMkQyQC8eMCu\/Ft+KE\/dBlVIvnRM8V53eNYl7vWAOxVY9hLeb6IiKzzaN8HRF1Bwrs+bwK3KVWMj56QLNFI+wMglmurrKrR\/czvhsqZDDjlAjBig20iNjq5rwdkSLecOvflYRIG3fCSh35VKEjV+0el+SV9U+lwBMBlp5RttcBdI\/Gr3MY\/yWWUZvvK63ipwpTiTlTOECGLx73iRdqE50HSekLbWf8uFzVkbjDvtYoDpV\/s8McQ9oF0FZr5jC3xOvhUhiv30W7803l0kYeFVum66BwaEUGiJiu6e8oa4ujc3q4J59b7W2URIaZdF0DUyUtHskrW8pdjoeKxz\/xuCNmTNbnXCdYnv+jhot4WUMPBf7c7kX3MZ1ZZDvxRZUwZ6+loi4ZGzFynOw39NS5sN+Ip01xdZuOJDXDHlePN3LyBF9dteIVv56GCOTnqxtGn9eJ4FwmDuJzHJdKxEcvX4\/TDqnNFTkpmoNsFRDWAL+4hKrPiIk9cAbTzeINn\/zte22jKY10\/R81udpJHFGKb9Y6Alhgq8i2O809dLbirt4XS2IM12WvfcdL\/dKxqPlN7K5CqUrU2eoFF\/Cq\/+WVn4Ixi\/0QeWuNWJhNnTQIANnPa3b\/h43V7FqeI9DRcE392CK96wleTRDHzGq\/omMeZ1lfpvALZaP5j1fPY4GxC+idh3ysAk6DlVaErC3\/gIb2AVrmK4lZR7mKb7T6KrmvRs+nW1HzOajNh+GwkNmR\/uS7xzZbH9Kn7GF+rCbrc+PdCnn6AHaCeWuCWU0NwIoZZBznh8k3o3qoHL8xHjwQ85RRYQWdzdbqnZ2Y6vtzYsxVYyTLH\/rApshj7nIS8JWfx2AvNzcr+XmxJ+NoFiv150hutQwnMOvLOPgNFyy3c8zyqSx5e7WSUZp3lMNWwc40ncmwuuksieBV\/upnkAWbKi8z7LfroNUca2h+dFPEzXWV15\/IGbiLVsrq0P7wlnpa8MRrBEjOYqzkFkex\/zZixrNtWv2wHDFthPpvfNvWKejYMEgkyTj+YFqS1+eZ1Y+nnmMd8mGN2WZ8OZ+ZyNHDTqdTAnNlVLp5XijP8EWwC5kKP8BCiZO4u6rRsxDdNElNTlFX\/XozemOORX73qYtKZLuWSRMdx\/BzPqvw79FYVmZlsKkhY8cDmZzMMy1m1VonpoL9ptU4rJ7wvlxRYF14dfmH2YvgXx8JDfqY0RRT6PKp863+ZT59HZEj\/h\/1nApOgymitthtVjdTsb7a+j5uxtWuJqw0PayuUOSAFhlRnb16LIPWpVHbau2p4wY4B5atdr6zZchct+KdyxRXspBjKRam6ztL1v4690+9tu6ICGiXuTpGmWh8TXaaoXGT9VQncB5sEvlcJpGBPQu281TUyfC9DP422RHWaQUO76sf1AGv\/5P1ZAei9RvXbwOuw2hu4Kb6ClmeLBOfYaXqNOaDYz6fNxSnjgs9HAJ1k11n0AZX98s\/9iMPTlM6to0ALHOsdq3sSMVqa3ocTMzPt4Snl8nnPNXwDlG1HrsexDktqs\/NvjFW65NtIiTronxwaGNYvjFrnS2zf3i9x3Ic6MNHcbyrVDX8uCqR+YnRVcr5C122VZEZJgVzye1lbPZBdXmnkTglf1suz3leXOHghtzlIfsXdW27CId3iRSV4WOPy7JCfGuB+sRqGXzUTPCvOP+uzmQQ+kKRdFHnrdtz0cbMxoXEoUyshrWKp0\/+Hd\/Ppw5djYEjp2YWv+kQ76rbXNVkVbVeN78xz1sxMM\/OZozEzNjH0ZqlRgeHo89or9GM\/tu4PJ4G44VVCALkJ96JyXfN2Rh9uKDzIALNOxi4eYzZRU\/ZMghO6\/DamLRcdegbGoonYrh3qzZ6yVO5siNs2R\/cw6sfsVk3QG4bH4AIk81rGgVrnRnleq5wbv6DX8SpLdD38+jF+qLy\/D3MW+xPMZ3bYgZW8sN1oo1KgkcWySDZ2VG3urK1N58nZlUiojFef4iWA\/QaQ1YxwGMqIlPu9QS\/NxgRs6RFssZjcjWHprcounmtc3vOhAiI6HLbfMs8wxR9LXP8oRh9TFpOIf5w6xzNY9\/Osb2s4h52mOVpYUPe805FZSO+6inzBitcRQUyGUVqF4ZCI+FOy2H11qhQEXkHlAylHTGPqSOP9K2HpR806AjYfF5pVY3aoH6PxbaHHIiGL3pTbea6+ZaL2sZvXJmt2Xkxz7xbQeB\/NUaFtGUUYGwaGzGWXvyX7\/bzPrcMeq0eRwvWOmuwU6Y+t0Wul\/FpN5+yAiPjs\/HaxtZVeXPRmqGWxgX4q62Oxv8fd\/qcQHHcypgrogK2lprSUBPyj5CgMqn1RAq0kbHxNSjv6AII0D\/8gNFyGVECq1XF5hN+sV\/2+laI739dp3tRQ0T8XBaZRoeZjdouHom058UTX5h1c6wP4dO\/VEndcBnYCroYgEX0zdyQFdABuzCnq3dwTSz6+jwJIyh6xmlfJXM2xFMPIar+\/zjOCLEtVc9YyCUxYCvbBL9ypipjJRrr1TKZ\/c1y10AEY5n16mtrAOJLvU8VYVj6cisUsFuged2LPDyNnkLR\/\/k3o6G63\/jEFkem1ZBjtcv6iuTXMtfDgj1U9a6W2Srp8ZKO5pAqTqhr2f6w6Ni2vhrHFQcwLajrzkVa8cf1a+aBUbPOho1QDHgtowb3ctzf2sYtokDD+PTgMf\/Yeshty\/CPWJoE6KDKO6cNohJ0oaRUDzpBPfHuuR4xSEvMRZSibcXwsAOGyySrTe7I1pm\/zKF5x3iZ0QmeWWM8n7vANNJUNhkmXuBG1zbdHeOLcNZoaJs1fzXrI7Db7E4ltmbtDFVMR\/r\/sfWuSa4rTY7tiGoQ1+ozu9b\/e\/5jaQELK5y5q\/KcnQ+JjIc7HECEKEqUiT5yt6puJJkXx8MreYx3csBm+Yv3O4MN5zIMzQ3qCuVV76lA1o4\/8rzvnpZn\/Jyj1IvVZra\/XGz80JxbTZURiwnmxjllrjm2Vbz68tHw5ByeaY\/L8ekC8yb39N8qn\/obC5DzdJBqmrrhEait5ZX6\/PWG1quEVq9VBq7xwFQ1OWe8wUGvNM+Vo32E9YLX0aEmKDF90Br8CepaJa3Bq0u5fWuHInyt7HdQlTN4\/ZAOxtFDVXkajXhuA26+fRM85a0niLQt0eepOrW9mDwUnkqb++NgWc2rpLlemrEzJ8Y+fV4G6ResW22Po0Qa2rKra9AnNGn5ofXFmvwGoo4fBhNTIA9lS7BhIlTAWaOPc5xjef0TXAeOcbWXM6oWzutseq5rAkZh9dubnlvHZP2CdtDH7HQPCBZIIn5GVgRe23v1+NcQnwz1idybr1oo67o+7ESyMmWHvPtD9zl2u2aqkZQLWaeMRX7P9OqpZCNXZf+eyDlczcPV2hBhqtd5rPa7\/+3VVh1Dc+qOeXbIm4e2kd\/aRiszo7YeWhPNiFhX3c536vq+CjLnNw1ZZTcL5IE59wpv5gtDrKLMAizEPWFwTIf0r4v\/ejtyzmf5fPN77AoK1O7TCDXlve6Ma+3cmbXjocoTaT8\/CoUGG\/MqTfbzKLi98racTz0d56sB6hxXZxldRyfPyT7k\/xif48a68GazkN6prs6EOzD1i10ER82IbuZEnu\/Oe1WwlmUn48T7jDwaZkqbf+8hkcepKDhN5wFTywNB6Ora6w9xKwVuvVJZBE8ornZfxr5HoayWLP5C\/3veCoAVlhH3jGAK8sYciVc9567jOxyMRcu9qKb5hZG9Jz7RlQtpTVZqZNGrPCYvUuwo33bSHe0UaP3RY2mFf+V4\/aO5XP1ltn+Q0H5fRHLXwxCC12s2rnktbe\/cgMEChsair3Rk3AxapkvwctSpi36E3ouSzv9QCl4OR2L9Vic+T1unsyrC+TzUrZhb\/Kwg9LzXRoJ8sDd\/oYtFF293ing3Tw8d5cu5Ih5\/nF01Qx3xEuXoagCYBXNcock7ZJI5RpTx8F7rIruPbcy\/g34Po7St3qpnPVqz8Pu6d1d1DvMcsIjvbXwzCbfpp9Vw6GBO2jijxrDz0PN+D\/\/V2Rfd4L8RDqdXeYOEn3IWV5kz2tW\/Vl29DwXcWVQQTdyeagH2O45+n2dsJDhqfrjoRPeaF\/eJxoj4ioe81uj3H1ULJ+mh5H4ZX0YGQak3MtFZdlLlX3xN\/QprH\/51RIz58+r15vk7Ow6Z17rHOosSbHrrEsen30IX4Wj1RdU+d2Pd3DpARZCFVUVqk7mrL3Np5KG94PKoq32KxL3jCbez19\/HDsUDiOYlPrgcBu\/7FKiZIlznTTzJyXT4vS8c3wZqRTy1v+rZWg48XQ6TBfkb79vjm3sdCsqDlxuf9PetS6a5nRF+2pjNpbpSoE6J5nPmbcmVvbMig+XUovyyrkNO3TSuVExH9rueDXZ6V8\/vlcP2piqCqb7PrkoKA\/muv8S\/tcm6oHiW5U5dqE7yPd4rJOGhqk+O2Fx1SNwzD633c4DIhHfpzDx55zfKidsg2zy2ncrm+vKon+dd+ne3P1oQ7bCaHkbH7136GHFXOyGtxgS\/zvvaxmxTeRgCbmR0Yk+f0B046r8YxBkSt+V7TqqZ7JeKJdJUAyJ7a8xvb6vysUpC9bISXiqS75MI9G96MSN9IxiHU9PNgs7XKKs2l5dXGUHEWK6YK350UuAHnljrcKxntKLIdKPtf4sT0SHWF3G1Av1uvIvqacGrNb0FxPI+Z7S1JRtRCfoa9GPv3Wy1cS0RuOjKaWur2wHSl+jEiQwoxLvky3flMqbS477Iy\/cv4s\/dlUW9TEy8Dt+3SujjY6kpTSvN2gK5YhckH2+CVyuM8+iJd7SvpTElLsZs5VBZtQxRlqi37Zh43RRu\/aPLqxSOdw1hpqcxRQB1YFXJqUUO1gruqr\/Eq7QfrEeZkL\/QlYz11Wc9zt1LNFyAXsCLjox34nJlMlG7yMpbkE1dXVuBVI4vUZuye9+VTPxWIRw3jlPNqUZc78dnJpbFabp6rcUjvv+Kr+IMbmDUfX4RfY5tXou\/O99+5syqon97jQvvacjzPMbRKAdjljFEG1qn0zXqjOe56q24ugbauutpXEI4D6V7r97VFRTPcGzXmed7nDG+qaPp2FQ5fJdupGhlPs0Od2ZuqXa+exd6Y6LrZfaskRLcNj7XNMQND1MgeI4q3MqN88hKUasq5G\/WdOPjjnDjjY7DaGAp74yHua4imcPe\/QX7NVHu8uSs7sF8HJSoPqUgG9Qs3ME\/7wDhLshfVjL3tI26y94ggFzB\/Ozgo9lmy0\/svqPFFnluZSd2ZP0T9VT6VHVORi6TB8dF8xqotLhlbOirx8vhPqMbP1VinvD+MDmGUANUsYs21WkkLs7OZlWL+y37Ur3wAGcyE5l8Cpr8zKPIqLAH1aXW5Dk06TyGuYbt4V2V6XTYnSBG4Kopr72wXvA+yzyrOsqZnAEiDgUoz929+UZgZByJvki8oLGez72xrRnv3gpmuXO2WPxinPsKpU98JHeYvBgcGvaayngkMWLHi7iKaRUryJcVRaWqKrMTfdcL4MjYWI8grytlFAwvklpOTT8WY+b9JBauV84OThz\/OHhr53ZNjVpvN4a51mbp0EyvuKap2LyiivXXaVDZcnOYqSxXkvzNpfGqE8oYg+VxXcbBnfTKVZ1xZbfesNFJLOKmfj+5t2N6zh2O9Fx\/3tnavFiT6sP8QTm29+WeG1BrxTRY5av+Bi6ErwviBPbX6tTv8qgrQ7vY18CjoJM4icO09YBb2fybNRBBNiYOT8uJMX2N8zZimWUriHE4WazuEv\/6kb1a8FQaZU3nzVhzUNdbViyjVU3dCXyTY6U8LD8H\/FaIoO24+s++yK9t9t7nCsbJibr8FpQURR0b\/8etzdP1CsbhmRleHZEodpBYKc+ZP8X07zEW+F39EaVb5eCnOhJZqHl+VQxi0gZ33ipUFibW6vLbZa4+YHu\/w+dcjz4JnOJ92ncdR9EFA5GVoYY6NcbzG6mGMq3MjubCUWPmnD\/XsZ7Ar6FlPdf4tvdphOu4Vclao321lEyCZThT\/DoOKw58wkCgUSWVZVVlW7dSrXVVnDyiOPv5aooRwNrMXzVkZPSsvoyxn0dR24rq1eZF48sFuByr9dwC+AIrzMPrcFa3H4\/imobRMqbvJyDIw2pPR1UsTIFXRyAbbwnrq+eqdbljvKp3Om+GfhkpMmn8ri3dELO7v9R8PBw8h1+BHWHJeRpWF41Oi72Vvkjtqsw6QVANQ1ODsO1aavXicllLLM\/wgW7OPPs3eCFGY8TWna6nagwHLId7WaqzipEfa7\/XC9pDSSl3j+jsyypZDFSpM9u9pvXWW79HEyj\/zvFdNxab5KHctnrhfi9fPwHCyHQ\/Tc27erAu7OqGx3adKqsamKY8xz\/UgmvjXWizN9Kx\/wazFVRa66NRD\/poD2ST72+lwjOshdFRXvMuu00tolCOG9wRya7UyoewF6xVlmThTXTnMgqIxo47VrXnMmwaS3CIRjrevcEKAeL7qgoFHSM1IqyW2853bun2c2ez5nzxRsUW\/XutXi1qvNJqv+o3wuNvN\/2qpEais3SPJi2rW5mLVU7UKphjOqrsseY0Dd6rFi1z7BxnTPGb3PEFTpHH+SycYrE6t542x+YcJwHrdAetkdUhdp7HKfBqr0oAV9MoWKsZ3rhPGxh1YvEYYQyTEOl2q1xP4eezRCZcP96Ttzauqv20tnzZnHRnOtGHAZfvsMv+GwW1xsokjaXktArZuxWphD4WRx9F0lkmTnA112MMuxz\/31mzYG\/GotsQMxb1Pc3Y7duUbjmLX40oMZm7KYdR9WRcH0BJJ5Zl7eSoTARL8H5EGafKTQX1iFZP2yvjdJSwB2r810PCASgnPIbb5xFYL6NQFVr9bX27avg08NYBMhK+0rqf3tN3VIzdv3t88CwaL8O8uVazvwpI\/6uGchG8gImQc+DKscfYutHMaBdXqoO55XXUeTzGwZzaD+o2jeJvuAyf+Pvzcc1G0r2i47l8wvG45QlnjhSN1HXPaX\/9z3frgRRrVwfJezbQ2vF4mcyv8VqA3mgVFx172XXO63J+KuxzzWgr8etehsA5FL0m8aCizQ07wUQLPgXF03CVhFp+TLa5wwV1D2BjpTRGkycaGXxr8WmPqBRY1zmBrhkfznnVAC4ZGcUPAmBD5vBWZqu7w6qOyRr6On6wG9ajVdHTxzfiilGzzD\/mUi15CjX+KzYd6dh6db0RM867Emd3axNVqVzrJVWDKc4uZb\/gkMaeytJPUMtTYLLQU\/Mo130uSyhIUQxvcQUirACXbV383DIzpS0YrKjekOat58GGp7Zhe1Rox9u+\/IKHykvDZR\/ppM0ev5\/+EfPNtrE0E538yz0s6ci5bgIF2ypNYVoli0XG7cjoqblvdKpd46e1uBSVwd\/rK6DR9Yqodg1Hm3I00S4C5yhsay4E5zMFMnMByTS93AQHXX0xg84\/PVV1h95VTXItv\/TcMkkRUJ0b5y4jO3sIrNT2WOrim1UZhDkSvTFh51kcrs6Pu6z+59Jo35pLL2OHjrtzKOugEHmo8\/R9Hbd2HlM9bLdw0d56bdzrvPTWYZ5Dm9TxUPlwgJLWj7A2G6J6Br6AV4KJc30XfTcGVBBV29G\/voZcdk7pl6Nkcz8fzzlPc3qU+KZWOTOj9NMaiRFrfKrFyhc\/7+6SHZQuZW7n9\/f2qBh356iCkQm5QZdJBDIGOE72BDdEddn4tcb7+xr\/NkDeEwWzjJ8IBHCgywI55atuiqqiKhv9cdswuarTm\/fc4h8knhrxOzWbL\/ZZ2SX3Lnlq6ikNY5EbGRORSh9V1GkqmRfdcJ2uk1kvh+UUeto0+9dYBnu1tsiwTI2rONVaG5sPNakPOHbbqBYP1yBl6\/mrzinY7j0ZjEYVSsRv1yKfaevnxIQOnvoD\/h9Ss489N7JPR338hWLWm6B5q6AlZb48x3QMcFKzNmzBP4tNZ23\/6\/3NcZw61koscBrloaIdvqN9te5bU9xz+T4XdPlpO8Fa0i8Tb8UvDjJi+sGLDj9ij5wPP3g2xlLme6rVI3iU\/IvsqyGqbkq7GrKX+\/wIFJj+YKHjYFT46t1ZUkP06+eIMjLZ5vBM1KhtxqmHUvtpjZwTeyob7WmFwwy\/f35uIq1R\/d4z2Mg1sm\/XiBjsWOg17S5y9GIEqafVUM5rdBnbVadMHrfQ16c6kq\/fRoVBbO+5M\/2kbVWX\/J3fBAlGXB\/PyFWqsAtaxUq0fU+JiOD0sl6e3ow5+rP2d\/Z7TXrZWdvzfn4qjByviwaHQWZHNsTISyCwow7jd1rR3e74DfXvdbL6kX7+bXcEvK+uWJe1VHxmc+4CbI1Jf1n3k3TNBzhEeeaPhndGCfuhLcNCR8I+nfe29\/WfMF5CzBEl27AcsI1S\/b5vz7LXHHBZRdIThvm1+Z9f\/BsR9pHKNau+4WiOmmqi8niPRzE150a1l5d63J6vnoHh80XMnzgQJ9b8YMf73FoBtGBUjQ\/573XQ\/U2c8q6KjmMjAq2Z5TC6Mx3lOI8jVpWyA7U+La0j2EjwCWB9z4+rcFtoS\/WUep1e\/QIGqvIaMquCOtSicS21lqplb4\/Fs2UGnIVrQnJwXzA+eJsesxdbBhhSFw0y8UXvaqUxNOcqjp4OD3nsRub0kof\/y\/E5G\/s6lbhogQw5m1atl93LOKvW+t1CgqvKWAn0t3z3HVrUz2I1JwcuyuKNd3NTtEz\/mk3msqz1Z\/HVuN7Ow8162YBheHg6Bz\/5SZr292u7I637n7coLsIE7ByNd1HmuoOZ2a7NnXGFoTOHfdmVXDS+61VaXBZWHdbh7Uq8OoK1e80lkbUHeGW77Ys1Y7v3r6AgrHL0tVwtTT7kS+KrLhNvHvH6WetGZFkRRJcvPFeZS7+2Kn1VXG4RzS+bv8O\/HDxUtEbqkru\/i6vQ4dILd7COG7\/PQ5UZjL07pveeb33I8UFkvEjRL5c5v2rItbwiUVa9mesmV+WH5Lazag2fNGnJyDEpCEdd+Wm1f+tR7gb\/jo4xnYrz+6kt6NW7DHtDH14GTvWMa4ksMCIVRQ5AI4gCuJH76UH84ER+Wne7r2ZR8RsS5606UtvSG6Yfr46TSbmDsYhVv\/SPzIl5gxlj5DtYL3NwxDE0MQfLtMDsj\/\/sTWTteNaw\/fKM40\/WC2jR43niR+7hlrihsQwYgXXCilaVKxDHnePxEKBLnog\/tX7gjTzfeSxzaVd+7Hzbk9n7RuiLKn3e1ZnOQs\/+1SoiQl6sg9FymRnk8ZNjMgPZZhW3ER+L4m4Ws+WusXWF8rBB\/ohwqwZFfr7QisYZiJJPbItP8gOMQrA6DRgUJepMp+u4FVz4XrmYEyiiVqFAhVoevsjBaprsF8mdxTRhV8e++TQOcBp49TP1mPm8CU7HmnU06\/t8ghmx4smaakmM5RSwI9tw1NcrkXUe4Sj9l1k5brIGibzuQ869fp5TmBJQLa2B4WbuYGu84ZkssH67Cuv6q6N8LtjxiwX9Hpg8HjwW16Wcxp2LkxmN4l3XwmeXmTV6O+a\/dwVdXDrLOYf8vE8\/k59dNxyj816jVzdDEKMCuRxB39mapIb6yIwd+bCKD2XZrcEFy5cF\/1Y67KbCNeiVGsiIGAHOZNyUvBT9+8SA7u2tplmbtjXrXESV91bh6lGrenVh\/Rhh9REkXV2dFxIpq8nnV83PRUyfs+ofznVx5\/HhfLSITzsHpfO2xXyjUH7y1Zh6YRQBVrYyyg\/DwtZJbds1Bb66Z\/C4+kZ1kdHlXC\/dDPm4eD3Wlu3VLpil3Dfe+XoQleByHWCAOKJeqIz1XW9aU1tDPOaAf9sXOBpHggQ5BI5MP6w79zpTtbHXWvxO7c5Cxls1hs0f\/nglAFPdIYXXY2A5l+yIus7h4TjHlbPKRuhDr31qPUR22TNgjREcbVfjqf5v9ZxTtpobA7LK2Y5g0VDkPK3vKA8zsLh36+nvxHuq+NEk1lQo1jwOGPZzIohyh7\/KfdjYFVLNyBxF644Ca4S4W4U7oOdGGaFfUxbWJ9Pfc5VcpQ7KqRyPp5flfZqCeh9rewpn7nsRqF4Rm7aTjHzqQnwlPsQw+zPgj\/VX\/Uez09ElUn0UWHE9RyuX5xvjMtge76zGjMyPEfzO2q5EShkuDCqThGUyR\/XgXSeTBAXGe49VMQYLe7eVxG2tdgS70iaIy5Xz7FSlYCIJ\/F1dqGP4jay2sq111B1lB0z86lrZSct\/rm+oLBwZK+KiqeePuzbvYvHrIdMqMTXLIGYOMr\/NT56nAHdy0NRt3oWIZQ3N+xhTi+fDuea+fXZ+EcHFevWU0BDmZfQxmJ4KJvNr1dtOz\/EM2c17ZtKkpYbG+KiOryqpya6zYI0Xg+aiTDU9pAKTLUI5VuPZfrH7+ZS3v+kcrC8+m5rR8brWl6Nh+ql351HooDarTjkqrIWn93m0gFkSbXJah7vMmcO58mk4WiY7GoeMmaIVPcQHldarWfFq9vi7eaaKO4ffKXCrM2G0ok7GsS95iXkYJX6nBfvHWxJn0QAjwC3NFHmkcsajXqlO\/VBzeJrnpJZX4vD+PRTjqnaNGREfLyUnOCkij1LgHoygM6YGiapI0jPNY33eb0lExQm5ee+aHR70LiKbn0RMfJ9DNQt8LiusyYrK3F+G7\/MhM3revUQtsO6FnqmZYff3k32hjbouA9cJc8srzF+FoXKuUq5KxZ5HcmXd85zLFShZHSQXzYg1604kOWMWOOXmYI6A3lvauzLFVSJcAcLIgY8sIKsSKgU8JaJ1Sovvm58OpbV27RBPUb3YtJaqc9QElTiH8he7iTi5fcyxdOkZ1RWxwN9jyfZMhuDuxXIV6LE8Zy\/nMq4dMowied+UvkrzG1k9G9eZxxmyUqkW1gHUCfju5b1Des\/i9Ob3psSaNSiHT0\/0s9G48t3W2taftc94CqJpzmXuq1dqg7joUuUKECDnwtp6pTvvjhAVui55AX6bArRexcRD0Vh5a+1y10M6XqEIg5le7W4vP8\/jTPkNXFEFq4Qhhp4bi7my6dGyXdSsQthBZ80xHWk9PWT4PIiG74Kb5nj3gqrjcheBSea6n69izC02uszx5kMduPM2\/pkvpf4ugqqFfONYjyPTOnrfTDZiVxmNbr0EPGY9qtZE2Mepr56jT0WRTy9Wq7S3TJRNlwMy+vsGcvNrWRScNYfxfr6m5+zhj2b5w\/\/HawHPVIwrh4sEYkr9qZnza3AjeOBro9XhgWN1njqSJamaOqHhhOdWy\/Uz2z\/duh11kV8zhs67\/y2fRdZUq2xFnrhWQb7vT1fE8mpniEpZ01NK549bJYLF8\/R7EZIHcM1khPH1quciIABGVftsmG3348pq4Pv6GlohSnUK8BJ5RGf3St+rN85BFcHr17eSd\/eKXqzT3lbqHRmjRlk6u+zbZQ0Nr9X1\/p5TaWEFXtvFT+\/Vo82Vdpo3WVpW\/7UTqJoRWqB3nETxPVXNXHLVUxHcXMkGh3AYU\/fQGH2Z7LGyzlJX8eZLJc0v6GamqY0yv18GqGIqGleR7\/BaZ555jDXAe8qAFnTPeCT4hlV8Gafn926gnREzRpPIg4wqInRv\/LQ6+Z1YhlUzw2KQetTjDtOVkOfFyiflGta55GN8OIbVBz2\/Up5mzPvCizZf6syxG36xWGtfXCVvfofHooEo+VW1zKNdsUNO1Nv\/6g7CLM8ndG3am6uwA7Czy2jTyq7sxy55cE5N5KBsb32mW1r9WHvHNUNV8zZnuZnCKKjrcI8+tF4Strzyvyr5Hdpae7Ptuo+Z9x+ZatQ6et7hN7LCia6+wRv5AFf89nf1gZoN71Uk3dBqutV5XKUOjttBTzmweRMBYmg1o1eiN2Ixjz7PCepdxaqe8nv\/zsyCENSKdx1m\/slzIvz2ZajSRqpuNOOD0zf7RAiX0rgc2zevcKPHdybpdXy8Ne6OaO3LyNWPMQR8ofpSofMWpeipYTNEpZ6qjuUz35YjlXc5PNX1vhiqBsfDHroWuAWd9l74PCfrWI2y6\/e+RWbFdeUikXiM1cYEHWXe9dM8zUskKY0uGITz2IGdE8iBfP6Yr6eFIVb5Qc+HkQv+jBpn3or9k7vGcnrV0cGxWW1wr4HH+I0tleD3eZXqMtEiHvCQ3Pta36psvNUZMUOwVe7d3Rep3qhbr1DMzMeYjY\/j7FxxEmaE+i16MtbGsgra6nlxGtvjCXAqRIaejgdUHfEmqvxMBO9EwtxbG9WSrYBQrjFG\/Dp451jdnw6JOE7RgkhQsbG956qtKDlt4G1WhcPpcZYZAeN\/+njzFPtWu+xIdthNn4eam3irn0WPitajed9k9jbQPRlzeHt7A0RnPoBMfONfPD0H0OfXV3N7\/FQmLu+W61l\/BfMkHQwNm+TH9Sq17urzfOaxOFFzxeZ7FYebeViepZ5gIP+1QDpqrhrJHqf3uMEf+nkJ2ffOl7nKs73y5MWAWIhyak2vHxScfo3ViGfGz9zDELBCNRJddo1w9UtsQC9xUOdQLPDFOFVMlUrEk3eY1ixfnYgxPy+lbX2dbv9m9K1g2ZM9lbbKjPhtSg4Err47ZWoKh\/dVc8egCxuyynqb26SyEXzc0LVkuWKPUdNq1pQEBMIYHEnmvPpDnMtde7Y8agxVHUbOq7fM9ztmFFcswAvNdM7ZXOjtaV01RtYWs3PJG62ovTWmFQ7mOsanW8kRLVaPynMZJ59+0Qwsn48JcHmbDRgcz+LLWDdujee6Ql8AduEAjup\/U05Z4hz2VaR3KTIaMCSVY2y5VzoZI55EnGPMqdimquRucCxa5C+wRlZSjaj+y9zw1t7yaJGfyFGdXK1tBcP+\/d5+Osu2lgjmjtB4FyLC0ejFWAqP0drU2VjpVBquo\/lZjS+fjUmSXEDyVyMiig+H7\/GtZ6lLzj\/96PvTGmFHc+xihRynkiciSXb8+1tFOGaxPu+wPsBhqzX9NtZVis7krSvIz4fdZDN9DniAcXPkxrJ1v+93hXfBTHs4tzVmZPzj7SKaf2SrMakLuPjQCv0xt9VEvAN94BwapWJowbg2ZcGxyI5HDbZSYs01RTaiOOzx09MG8rc6byRkctpr\/3tdGEhSIfxnjcIXXVW3PEIbfa3Ue4V0XaIFyOr1d1zxVF19+FYXwAe8mVg5GyLXRxYZaqs19Pue\/QVmAE7WBpmWTl89ftRvlXLt8xyVcgxDzj5cPNfwmOzxEZjRxR6Dl\/mWZ3HZquyseETU5XHv\/XgKIOMxQkYs4xEvW4gb8XOd5jXLIsN0O5WrrTgiBYYZDbjUqcCDc+RVEdW9y\/Ep+rkp7hmYMbkbNJdcNk3jXnt21YliwiXjrEHH+ll1PZQME2\/MzEJ+gWk610JTxRmOyNO+rqYZ9e4hXKYWRWoKiAKlpzb2hau59Z3Rlhm\/jlMOhWdVaF9hlHumFuVuZzgWeJjRk6mZ975sslZ0TBl+x6RiuwuT6xr6qtK7w1Bd0mqptqBV3R2b7T3lJ+r08TTJcy2eK7+GN0jdKqMp3V5o4hYHLYt25lZ0Mra+cu64Kb+lx3pgmD88292lJgQseI+ispl7T1wjw6wTje6c9Xl0JbOBIef20F\/f0wwjowvPme4Tzlxj6a9WzVR6KqpjVRbgzsaIZ1pTRRNOYA6MKIIw9fetG9vYWxsM+\/MeU1jPzozMhys7fB2P004rsIzQcQ0bXL9CzryfM8\/n4hbu8x4ZfArcHb4cjSZ81u5vPVCNK2p2bVs0puMpouaA02l5vu+bS5aITTNQZ0LGn+du9lFKuYN6trrlNB45pjyusCpRNr4SFffJpzbUtusrVL+xXL31Ger1W82P4dv6+SFcCArN+P20tXJUwoK\/SLUWKr5frCPnNdAiKufay\/2GDsJMzOlihAPh76eIdZEtRbieuRH79cHfrZB50WMvMHp82V6LkLmQjLTJk8mpp2bE1X9r8lwMdc1ReiwzAFNPrKhQjy501Rr60wfdexZ9fCzzxznJyEVEs3pqTn0xj\/NlL2d1S2a0kdroZXTGL9LIvJruSMXqzdkeicWKc4rHI\/xzHLAVSm9ERQKj44w5wdafMzKT4JXRnlrdWHGuyfDpnFGdn52b4HVH8XGIp1fqVhVmbiP2cbuf1QNeuZ+EHMBvzofKwc+ARp2Vf4FueaBr3xz\/dYuLT8dZLrnWbrywUEovrf3X7wsVWcxXP8Zhc5LxaZO6XC3mRNjt9CDXiZZX+Vn968sB4Of3U86QzYhMY4LStP2c2WUJbWT+v5Zgce\/bxys0\/lWNfNe48H5k7\/EH54XtuQ8weOxsLNjWZh\/9jZM20dTLzPL8amhcAILroqvxIKT4gX1bXePGMQuee5+VdK8tGTNWJr6\/VPX1NafFldi2CPLzd3wt0zyCK809y+sxy0cGm33Leopq4vLEFQ48+vn95TMgUHXfK8k99he1tkSutvPnXR5Zn+\/OdMtu8klWG2nvYE8W7YcMtlLaBq\/FsTeW80DH16HMCzrO4Ih6zyOMtCPpKwHzNdx1kpn1dco3i4tXQuunAyTK2zj5td521+rn98VavPbq432+wD7xsfkgmsECc20K83hmtzWSu67JLZUtV3LNq3zEJyKqZ+gon0hy6ylXBR4l73+5jDPlN1u\/Ne65R\/g53vj8XkanelnbjIFHVUfu7rd7mZTb4bvyRKsDnwRHqbA8zufYkdd6e44tv+mp1Fl6huNcd3LUWCB3xhtrO+4w9tjaet6cjAtel6tqaX\/j55HCco4k2WrWvHYEXkCLBuGOnnnzSGPxUU6VELVA7dtK6oE4wKGlNOOA4yCO5\/PwRr7eyomwVZ7Jfeiey\/pE9jms9oCO8Cl1c3fTAdRqGhEiy+MZE7\/+MJ7Rt36r3+2rUcuZfQ62LAqH4ovvvOG5CrLInA+5cHD4+NsS48q5eZ77qTBa0Tcl47FqV75nGuEGWKMMMsSdZ+Q6e2puaJ3P\/7oWNd0a+esT9bvK0tcRMernbarz5OTiBDMUmZ0hmvvRoO02gJKOod\/5sur2W5LVXBRvbJq8nOjzuJtHOhPPaZH1vRWpv3kx\/uN9Ns5WC8rsLEEZYw1ey9tEP2Prf+CgIxu7gO16lT4KK0TXUy+ymmeLGLS+ia7HaTWWJeQNa0jWmG9cncZ3zbs8bvnrw+QJP0HjjXtsLmITPzAKp8D4lfnlFBy8OsejvHni73r8kD3Er8objc7VvS4YAo5M5niN0D099j36V1tg736esRmD8aglfT2oOrVRjfS9aW3mLr852qKXddC8U3mabZ0p0BTuZYxxzWPSEhz6ZrUcgkgxZX3IjENJMV7Etcof3\/K5EDAbu3addVQIZ9r7g43ZcDN6hMWtCJOlwCH5JceyGIgm37Aa1Un1gQWq+lsxGTKYnoIGLa1bKhVWAmNTNv9+q3n4f5ZqyktFwo+MpMyRGE1zVrPXcw9m\/OgQbET+mMv5EZXqVApcc\/UjcxWb8nuzWH1t9DPSzn11k5onP6evZP6xtpnq3H7\/re47S2INf7CrtKyODVBltXt9FqNUbhKvron6MRX7SMPlULSMZp7TI\/ZK3m7vl3WHiCJ0rmIeIT1TKVQkHgE9FfedbVCxuJohRhR\/8lZ4wwS8uhicSjfqnWPRNtV7TEj\/9CsuOyq4o3FF3Zu1Rp+4qDfUMxycI4q89Ab3v8rxXebgja+i5LH9+cr5yFe\/aAgiAt\/AiuonqgP6Hc1pLTsIqK\/6tsob\/tWtQzD1m+\/9BOCPutzoqVOqgt\/EZGtojCAPqItEZLV\/2K3HrPKlEqt\/4Jpxb\/XhCqRZnc\/EjdYjnEI6I+cxbwVrNJpUQ2uPHbLebdv6hBJzTGpTpWdeVj3s8I2ZGeRxItAMdx58PbTNr5pHjpc3v7zHq1EdtrrSgxMnWasK2lyABL+fJmeml1WQ95txFaitz9GktvKPz2Hvc6oovL7\/vMaqsLwczP2Af1eDIAQA55nd13wRnn8Bn0OEyjUNsErBBU5SXku7xrX13yMaGdRAdJotfRWViKts5hs9cuTaib\/YCRXtcJF4k5nMtudbP2jRoYGdLDIlHw0a4PFlkWfpy9xTO7i\/MsxYTR22r4KFup8v5Rn4c76wjGfdZlCr0R1DT0j6qrFjftdalh\/gbTg8P\/nEcFb\/ycxhEqbkGdzwKrH4YzcB1LDfEVqdzutHikpyDOLJSZnicR\/M1xi393Fiq4cIEBeyDN51E9ZRf06zfWVkuzCllqTlXqnp0OsgqEfq1J\/gvorxm+hGyk5MV+Yg6e3GoTV9vYLaWvabt424j6Lh8m9aaC9FtM7\/edxVCG5h6juGB7nHPt\/YcD7oa4w+jI0CPxz++kclb5zUgMym6qlF6ApMvXmtxvTiYtc1BNXA+0lVH35yxtppbHRwjdIcPo7jlOJq09lTH2DkOKG5K2qZ36JcdyB\/qsAqIS3xzlcr7\/FKM9xXCJMzIrvKQN7NoNm9GL6MLhZWJ8oCBmEOuYPZgKWxcDEgv3yVk4r9ahrjR1fU\/rEMelDkzJW1J+c77ODJWm3iQZcMqy7azR99+wgIO8aDjWCafJmNL36NwF8ddOUyl+EadZ7I6KqczMKxHfvSJmjkedi5x4+TyCSjgwm\/zGsNcD5VJeaeSs4LGa\/Os7zIkZzHd97\/szE1Vr7H2yo0ptQHLfDb\/e3jx4zk3Cr7qsixw51Fq3mG3FlBzJb7kfIbRzliVYu6FY\/E4Q9Db5XpqL3frZhUt3dfwaHxKoMYWBOyDREB2XK3UTG\/8BMjc83zRdhyON5XU9JidriZxzkQ\/mYsoggCLH5wLvitjqlIb9TyL1zy3SGV4XhnxtcneIVB57XYWpnMt6qDArM2j8VOnaL51aWZofJ62CPPEhcc03xT80Zsx8PoVqikr43t3p1FRzGij5ySE38zQVvEoSDPmmrrY0ZXLp4LZV3QVytyFH\/x6k14tdwauLEW675of++cR+c5o48yWlW6rzSxh7rXcrxqokTKdQP0XiLaasV7iuv68cvvKFDOCfB1I+JqiZ0c\/UI\/O42MTNsDGxBCtc0jjAFU2\/F9sYb2oA64CVeIceH1RiUTXb7rEWpraFlFyvP0nLPKcxlTS7AISCbrxdZ68zjNrAqt\/2aVO3C5NrZv31GS1rOb1+umxwjpyNeJuEcKNXaOh3uQwsloIlVgvN2fa2yqd1lVoyYd83ZqEjjuHr105fH+nvVi8EP7Vse4OdmdzjZLYxjZkjmFDlG+7sj9okAkj5NxFhtXM\/jnvRJ1wkSzM3vc6nxh5EZtP1GKRmN6zJrxvBNYuDF8teQYGR3iSwaFA+AU\/smSzID8iMTnsFhcTEE\/zut5c5+FH\/hrUW2lbL8A+InCsZXOdM+Ue8BKMx8vCxp7tU\/v1PiUKUiG7\/Uf8WtUJmzUs+fBoYCOppyFQ2lZde3oXSYf1053YG3r+Nzu8SkrCrnd8cC0as9X3ea5xsbqInMGD5m7++V+uvUYv33pY\/VPusNzHV83QKWpAJcd5ryRja3H68XDjUxVFs0yu\/sPTwuGNWKIMv6eAw1RUHi2dCBj792+UQEYeoxt1bTvefHxcpgw+KFN8JHHnp8eZ49Fq5y17KGG\/JOry+yNwFamv6fvTrm3fgmmxpywLX+N73UnejZ1Vj9N5Bl7RtJcDIVwU8ZP9XzP0duRO5Cnh7PSvijUD+Jzfd+TuBqTvZo\/fgB3VvYhxd44819fqD\/1KJjmjuS3\/cOTJ1PWyVac4\/vqxrBY3Lj30Nhl9irxYwiqeCuWait7Q9SH42VUsIl33Hdk9KceWuPlHDjyd6JzyK+oIgpSJDcjrdjOTx3JTJNh4hEfpIceTvss\/NOzpsSd0dsluer7oo+KrxuAW9+Mt95Dr1oP6LzM\/XX0YUY5I\/UpKmEysGVeyyQP\/Xog4ivzwVoy9yGNKHQs5RMQ7HfwWn2kHhj5xpxK1HsVR8PFnOlWHzCLLCZLN6yyzhyYyvadm3xGLqlbZkZmqWwjt8zDRt1hI\/PMTU6+OqAFlN021e6rJhXFiLrWJLo4tWXzU4dDbnlxbRVvRBFELbrDi9riiqQc2KrMROaLphJjxDpFXKeRAdXmApyhyR1l8RtmNpqNUf0zseL3VtfcLMez3zWO3U\/6tOdT3qH7nGyjYP2+TOoVp91mF4zAHuXeRRlvTd71pG+0UwkxZTyoNSuJqBUPz1nXY3RuY4pmi0qhMutLfmPhGgcqhZoLxsgi1z3DOnyBsiJPBcs4hnnmuprED7H7RmtTZ3XKSnaUsLisKVJ1Zac8cj0uGx1rxjr60xMQwJzOTZnxZb3P4ifGA6sb11HgnJHRHnXFb2WROUdHrA5wTKJI1TLKYywcAPzg1aSJX8YyNK3OssaRgRfh1hAqDqOTk4fm5v\/qa5huNvceoHQ9FMndF1myXrYf74AKub0nv8q5DKoG6gP1eAotQkCJnOfspqpPRTlXjmDmaKz53LP4suYCxSY2MA2x9MxyT2u4cYYhkt3OFJw+fX2ZJ37mYMXQ7M0\/tepbRWXl1lGv9eHROUnyNMbHb6T25IXWFio6zi2XM+P1trOne7KrFTiclpVOaRml1UW0M5+7i6hxMq5Uhzk+7hav1rD9UedjtS0CrfhGYzw5LvlNO6vnckhZIcE79wxRcq3pXSft1bK9r82urU0r7Nvc\/Xdz5u+xX6d8cn1kYyuu7fB4XTfnpS\/Y8rjueATUDS+bofHkqlSdjjEne+BN\/uV8V1dklRXi8xfgFF3HJy3j5yDMCnUgU9ITVXGM4idO8Y6vQ\/V9ssY0hxXCW+tTK+rEoT79cYXp\/CiautzlYZDbOf9G1B2k34DYpxIfsKA1cfxEj8WJK7GxWq6i9o48mAL6bO5QstY2iDwONgtWnBWFNyxPNE+3S06M8HzzNP1r9VeVZA3n5yXJ6CL\/OYRXw8wwr6XjRLifnH6TcZu3pzJbr6HItPnWiox96zHPZNjls2G1\/rexof3WaXc7iSCRpOqaz846edMFJG6be583g584LmNy\/TS+O3a6DO5THi\/58lRso5y51TMxbET6+JetZS0R\/pDekU1ZGiEwRwV+2\/DqQJlexsVhVbvnWmValIA4JN8fLWGdtNVEohPsbD8PToerWwFUCvkF26g6UZorYRbF2+GYXDFCMrjqLif4LzpujcFjHV2xNVYGEa0XlFBO+tY3\/LYxNnb9KiKYazm7tdU5gsXVip6NNngUvuL8027nxyh0vPTX6S8K4CBx9ShiiqrKq+fynjuDOZ+WdlprB6Xd3NZXnnuV3fjUDzde+Krh4NSsrzAmX3AcFY17cF291dkQr2c8x+J5X0QbARjdfMtl1AZjJ67WNH\/DuUSbzFw0G+l98ShZoEfyPA5\/c0Cz6JPzQdOdycho7ZQI1fC46xcm4DnHKhLFJBikrdVMK8AqZJSd+1TP7M5fxWPDfVt1rWKs1Yfe25kIwrhjE218qrbxJK9pcSuBotCdgWEYRmjtuRYY6l5krDyQUUQ2bqmA4vo5U2NqlM4Dmt+cBTc83O1sznm5bxWCGOMvs5vVMdDOO+055\/JVVpXaLB0zPyb4Nbw6JaZ1v62rsZl3U0X96cdXN\/zkMOPBTyrtRgzD6KvIsbimTvQuIHyMJXYfB5NZquX8m+zFWvLTno6BWD1XJ653JPwyP+JYqBBee9abgYCLVkvv\/SfSyxRTNCptHDu0zYVN9ee7Nhtnb0VepMg6o7oWVU4QJB\/dKui4G9zFSegp7hwzdS3b7kX5ZgInuJrL47xXiSgSK2PGT3R9XDJ3WDZ+aps9fSPZtcOcTp1PXkv7Xd3uHcK34uCd9R7Xo\/oOiDmkMQ+rpbbtroOeT55CG3B2jTeKVZ2wGlf\/rJR+x7kGakaWSf2HFff4Aw+3mv7iHFzI\/cSO6uvxifPU370KYplXSNH98wYoVcYpQs7LfXOn8vBOCz8Jnmj5vlNf2Qrixi+dJ8jGk+T73reYRxs317tw2vLd2aMNhwtGJEq+j8sSv3M6F52R3IPb0OGul\/IVq6Xjvtcvjq4M8NR+vppqp143uxdFUeEn9qLW5ITx36xUyAKo+Ccfrcr0257BFrOCS5jJVgnJ7PNL415cUWPbn4l7Mbh6b4zwxlWm4Ux+ldWs10V0jhDnKzeLddh39drImfXFfns21MvWRLhPVnybpW4l+u48j4WN1Pkg3UvzVB10\/aVmiXYU8RDUGaxe95qgKwRiPe6ZL0glnjI0tlSnLEaMm6O4hHmq54ISk+1EkY96ziKvUSDrzYlOhBWLbmh+p9F73quvaVC\/OU42hfepbbF\/lcEIlwlWRGMuXkMverYSINsPg6w3xqDluqchxcTLQctUvG1dQESdVSu9R7leoTrSCl+NcFvN72YYJ64+wH36gs6fEaVVZj\/vQYU999x+GwjY+On8HDMjeAzEPh+jUgM5l79o+auO1No5s+Pygv73pWsgc65YiJp8AAvpbGBpGVzuPic5JDzH7nqNs\/gaM7iiw0MNeYmajqDHvhUmmTULe64z1IURbdiOSFDdVbh+J6OL+KLz5Q94uTVBrraK0HsQMXnfOHkOa9gqIW2HUZZVOJMogyo47apP9m2VPm3mPsR4DPjU\/4KN4XO6QkymDY0KNZ2zLqeuCxYZxjVaO6YCHc18ewGT5OYUvM+m\/UWrs+sOhdlOBIKruy8ROsDo9BBijPFO0+Y\/5FdiWn7rl6xHNmBtj725Uxm2ymiia+WAV93ojSzPT7PTXFRlQSPcpIaw0zg2K+suVnNlyZIIg212VQa6Vzdj\/I5TbAWGzFmg+u32NGvuq916kdE5l+fo8kj\/TTV7QFqj4mXJi2vB1utO6JOot3dq6NfWe4fSMiFfPO+F20rGihB25cAwvVITII1KgMH0lo3Coud6hqx8lRU0ipxhSk\/ctskInxQ1Rt780abHFo8taVN2fAhr7R0HgAHiPa8DAz+mzp+922dzpxMK28\/3dM2JguFDWz3zij0Hr7M8EY2x1NyErTKC18520lYpb9zlCLDAu80ZL7pJFSsqywO7Iqs2dPib1\/FE8zbd4xh5Qu6gRnmcbFutRDotjDWpscb1KTFU3qMc47E8XIJGwQZmRncpZ7NewIdy1LxFea6PvNzYF\/klTnMQHav67itozkGNGN8XGzK3VayDkMnAtZqAa6A3kE0dffGqDhUQreYx\/zA9TP1OZJ0bOkWhpoMgsgaIfakx\/tO4tWulJmq3ithR8Kieif1hJrx96qqwUS13lIH7KlxwxzoSHUTbkonWp\/iwRqmE3zNhInwuyB0iwRT3\/D+N0gdTOY+fh0T9iXiwvq76RRn4\/PIUvMX8QJ1OhCPzXHp0NHLPuStzznHnlawOlEP9kgPlbFtf3ayq5LunpO1fPYMPqUPHj641stR3ag9eCiPOsVQdOk9+W83lXn17Tcd1wnC06uU1aciva29yk1qbr941jrDdVMHdUXoZZuatWxMcDVt25lQ289zc4IqH51MJXBgc86I5jWJuqe3+rKNZ6+V1EUcU4XEUkXoXB9sPSbzUfBl1VT2e6kmXEzDR5+a7rHS1p8wYPetPXjGaD0Nr0dy6atquh7motXbgmj7TOY0p4cAPpku8c2rHOeij+KcN35s6nuhIviu3X0SGG1D9FGMOyle2bBf+URt8t4mz8+rWzgF\/P3XsO3orlVQg\/nP8OC5G1cDWHCvIWwrlXF25GUovuiydeJqkP+9LWnRRN9ulwXuVmOYZhptmDjwTw2Vrjhuv1JEVE\/yt3h2fwcBkdGOeHhR\/ZuI3BvMrv6IJ8NXbcdBrQuWr+oyDd+Cj8EaL8RFr+G6q0PaoMO7l53Ntdc6zGehsyy3TKHNhfR6H3khBeGb3eqWyyg08hzI2Kqc9p3XzIG9ki4FcDJ+rjK4kNidqtK\/YwgP4PjKw+JRJOj4emxokhOhCo1h1xkk2ku9f62rMMse+tZr+ncyqnWRadFij5of+qLvTpdOeFvpTuEVw44dp8h\/4cT1IVeVfX5vuyKsQxYy5Aqe6m0aL4\/ueQZmImtyj5S5dkte+ywVtbM6oLNIRwHRUCXEtouYN8yzXqMhuZO2806ogSG7VZgg4konib9JcNeRMyQ3f4\/TTG+8fQsmKxXEpufVTRPJ7dsP5HBHuG\/Tqv+OiHp6vQ437d68yinbOMXWcGcHG2mcU8r3vLGn5HfH7Xh1mjdJ\/6sNQMYZwDrCrK6Gi+TGM6xDQXhx2tlvxlnfQ3DJh1xr8G18\/X\/s4vSUQ3Lh7DZEXr+NHmYI9CzLOjsNzg3Ut5CWcDL3tvX+wTWGa8YIQ8mUuYbmr+45u3AgbU2\/Lr48U4o0Xe4ibs\/wEy+5doW3ReqB9Mv4q662f5uqL085y1wM0Is2N2iAueczIq3NitjUJz7RC+zdOtnPqDH4\/jN\/46WGlbFNHj4P\/jRn+Sp7b9Njw4Z4Vba9\/8iot5oqvM4f4xLkZOLMsmWH67slfQ+zU5\/84SNCBowQly2YxR94Y1V\/siWQiyqzVQTKhvsFnagDHT8ifTzoOVV3JKQhdHQ9Fww+OqlEFxZtF102yKw4uGS8+V4sgHn4N5tKO2JJz+Imj2lwezlmQPJdZLHzGSTXDfKhSfz90ucuQKit7FulDf2L5HIrjfC6zwUhY0AxiDEOiEGgsCGKE05bVX4c+XTCzx+i0eFl\/3kmm6b6O\/aatG4VOw3dseZ9U8sOo0W8S+rinrcx7ibRJucij7hNlxkadndMm45+IlCHJvr6V+tLPgsm35l+sOIIewNTcVYtIPTayMqm5d32JNzivH90AzGU1cLV6B8NjA9i9tTpmQAGKJPtnVmOzPmo0X4\/yQn2NlYtOjUfAjao\/RqIOVN6re\/AFH1q95KE5bOStAHifrzfKxZ3jxsL9rTqzV+U+atjHuMqu7e281WTxBwpdsaCNU5T5HtiLcVWROtsiLTs6TW7IcSuHYRP\/OwQsyqD82BC9lgHfPGHPIVSkwuYgh39E8ulg2ZMvjiCbHpXrbbz3ALFnNBwNS95f+juP0dVZtd+1i1xBX\/jg\/oNT53XgsPNG9y753TkZWvudf2s333fvtR1FcPwD+szIYeRlrRoblaqeVa2SGeKc79RezxJfeCM4Bb6bDuEL6k7Q4Gpl312q9+D4nZ1ZVx3ABr10d7f14zsqwIDnkR\/oirNQYvY68Axz5vVroFjOIh8fxh42e94qkFqZoxgC07\/8n1FTEfamxln1YL8zop4++sfciB5472\/Aa1FffqCj9NJZtPqGVyNILKz9HvsUn7NFubp0HIm+y90d8xQOpiN7YAH+eY858lUAsUIJWQtZD6iBOb6KCQ6JHpmDdZJztZPIMW8qIxVR0I9Zh+cqZO4xzGxFBgj27PmsPs0sDk+gwUfXAKvjjtHZeNfoq\/Fx88M3+r6c4Q\/HPRtZB0fOqAlqn5zJa41KqwfWGf\/DzTwG7h9ijpPIaI0nvquxcvcCxqQe07P887S69S8Hip6rfPqR9cj3uL1op+ZBEjlHQ4nhUDpf8MXeMrv5MgJ7wVWhWaLQOcFe1Bf6gaYZXdRdnXD0tEKerZa\/lfO4sp7J0V82xanKEfhcDpj7MrdKmiq9kYE5avLqVKbCGfOJBlQ8ddyKBNMftQcfNwLny3hvrqgMJofcMQYdU2qLe7X46d78xqsW89X669+ju5Pb06COrPsiq9fgmsjQI+ut5B9sBp20t9di3NP4ci\/IIQaZPb\/pu8kfGBnKl9dWWTkFf7IqKJt8okndpRqnElQWbRmZ50fnWZiRzABHrCY33\/adnougx4asr3cM6C1yqVhGBueg2SjIOCt5y64LI3ZPyDE2u60xPs1Z1s3JgKgcO12ewvbe748NOztfmyfzfMoEBWO\/zJdZ5Ix8nt6qf2Vli8bQeFNzy5ieZ+fPERbHx1mwhN51mcazvIr4xUJsjTfkiqK\/nAlTMbyv5o13V0HEVa6xdkCd\/FbkzulSc3ijrweitlCvvqurYwClHovedKcAPz5kM0fyRaXyvuNwDmj46MaQjZtgjBtJqwUN8BNYtooaKlVrVx6LYlvA\/1CnYLKjy2qq1ZxhyTpyCNUN6q6O52TS50ak2yvDjSlbCXUO3pncPEHT1HCOYVZywDFcsbkK\/h1XjYeHeR+ZuONcIkhb5sO8U4dWYI+Z6slijHbak5+w8XhDfLnmIZ838kTwe6drEA46Vb0vgzNKzgAz4OO4HWaEMdxT3CMPLSiGtUQ1yKHyadq49dJczNDGuX5HNx01uPY5ZqFig1uet0LAdlYZ9Gh1fhWJbMx3tm4ZZdobFn6NTJN27zL2vt9nwaGgu4tZAjYYbz+5nmPrnr0jFrYL2qK8Wzm1zcSWnWn7oi4SlZ6zzydkt4\/vaaI8DlrgX0ZI9OrDgvs5p781BQt+4sYEcAbzWOQLerYWwHRVc\/pCDT4Nq7eEuQ9J1aDmgrbRVfmampFbdj1Sj+0x9VhD+DzvtYxzCHnBJ\/tMnY6NNe29Kzmf9BjXk4nqc479N4rthoxjWwnFZh3Gr99EglF1XD2rETe+Q9W819dbgf7N6h+lAH3HQ1b0HKduvepdRzrn1jA+Jie21hmvPT3nsdWArEi87der7VftzWfdFGvh5K49p7cxd6slu86LMIjoZ5r0s43KWbCZUbTqzmOBLGqXDORo7tRzjAQrWcmHIN5DfUzDneYWmvqZnMfrT7QoS3AnB1rSRzSqY4wbC9Hc3Tn6vO0wWmbHT3s3A6f219f5hMvxNHHu5DyJuWw9NRP42eS0ddLKyDWHOsTqUmeKNj\/2Lp\/2DFiR3ejn\/9B4Wu8M8cDNHt6Eem\/1PO0O8W4Mj9vnisyqTm6t42xRND2Tsb6c\/1GQ6kJH3ErDsT8f+9ZarGn7ysg8RqKHQ1M93l5hZwpvgatxHvU8PRmvPnS+1ef8k66ongVffU4Vf5VZ870sutkv+okBM6NSes91VhUlPPhg0SnOYejHE1DJjtgIWrm4PSMmLq209PR4r7EiqqlvvrZCBF3bT8CftNX+Mm1gXNVP7mfClwrrUeRPF5HfwOg6VH2fc\/qbDz21ruTLDeS9oZjf4yejkHPn8ua+N+eyDliSmVGttFCO4rW2xkGVtSX0mVy9q36XNxgZ9SLS+Q7nwBNfPmOs4TyP+DoaY8lsdCogOgjnvWM6JGrI3nWichSai8JTAXIAbiWzhbfnrNJDvZ\/sLN8yA0ZBbOiXkeswv1hYrIb5QzdRUicYOdG3fjeyPlr0be0t74pGcG7tdMXhrvRh\/LmQc+nnNFWO1SpuquhKHa8WYK9xZceT1pcPYwICQHjj2ijurzIPjzAjskAd0h+VVpasd5K3OcYdDFAExnI8muDf3yoEOY6ngCm+h4BfO1tJdnaNfj0pXO24Uhnwyx+GkGk63g+fjTFECNgbw7RVo9XfxzYd2suk6HgugRjt1W5UsYzVKsQH\/\/4iYkXz9u7KsY3dVhZUIfyvOoNc21TfZRK8wwiuP9R7RufZzJDj\/F1FA59XF8N74NW2YfflCtoZXzBLZisP0D\/5+LOmoUb2z5WVPsdadbzHLI4yR8j7uB9HZUx81mrr+Ke0b36L0MtPVYLcGke1gzk\/5E0tqJOhrmqoUtJGn\/nsWHDtFJxUmIDTjYxqa02BkmYaN019MS5qkL+I\/mFWzTr00l48sa+L8alMHcVzI8vFENFzqkUgfxEaRnksMKD6rYaMGEy9GRYTOINDRXTcuI5J+ze8IHeMg3Lrl66R9H\/79NUpnrWRPg4vNyJrAr4b+xbhU3i9aHM3hivCp49EvrMge1TlKRX7lji\/\/GvNrsa\/6wkrjbzBvuXp+cFv\/Zya6fepSK6uohJZO\/Av16BZJa7gyIF6Ln7JqF\/g8G8lVjk7n3LW2Ivz5A3uT3WjlwPkB2ZH67d3I3fIMbAIkSZjVH6iV5S3Pn7\/+sTW81v\/+sq6euv5adEojXFUpAauuoZPL6ZQc\/Y8anu7e8HnLtdZoYq\/R3M\/gHw2L9X6NK+VhTvpfPI+CJAQBe4\/etmzQUtXKAEg+wHtuzqcg8qWvSNZ+n73EmifywwOKGOrfmTVy89G7HcebeSgjaGL4N9Zwykckr9VARxV5tIlNJUOsnNestMKQQXnCjqO5vCyVjSZabSLe5+JJ3BDHak1MhnHwHxgA339HTttFJOwkoBE1YvRxq84GmtRkXJzs\/6UFizoctQ6xtU7LTLqzb\/a8ngGbMLgcSr0jsrf\/Kw3cF5kjN2HCFd0dTKtO8ZN5OcZWqHf6P+e\/UW1O9K0YxW5WgLjRN3n8DBEzti2bjZi\/YKrDe7LbZbIKVe7Uu+nZLevkWe4H78q+1nLdJRVPbBU5BdMVAWvZJjEzrgxLWrlCloGMY4FT6h6ewR\/i7TFs4jaWumtBEBcn5Ebtnagp7QkjxE5x4C+6Yxo+dhVlSELuL+HhB4Gzo+n6csxVuT2LJUILztX1BZsN1alOF4E5rN7uSou+7OnWjmez7oIfkSaNUQ90CLB635Kfyc7e66cia\/gDPSBzxQ4FgApqhazu\/d6ndd0VmSaCDM6cQZX6SeoObPDOcTD3qYeYMDX2XrUVHrutxGED0FVe4R38C4kgezxfWzcJxr08X9HQBqKpbtuCf9Vvvg9ky4a\/d\/Psnb0ptFko7uvKrIj87wSrNA707S+YAeZjrmPkcd9jJ+YGx+iQ9arGWUAuKnn\/87NSL13odzP63hW4nN5jQqq6Cc9bKVIP8+XnFuwlrc2R802S5nMcz1Wx2aG+Um2dSnM9p9nGHNToi+di19duwYSNyLM2hPJuEPiKb59Ve\/3zMbj+Kz3c0ZU57ey4WP8m58Lf65QblNNCsYxDTP4tVUmL06qPc0FulQc40tw+eCl6OsXsap7aCvj17ablq\/uhpgp2Gm7jHyryNRR6rK6+mvSaFx94eOG9\/U8DttKxipm\/uqUaunY5XDZF4RvTsts9quy+0TkiADZ\/Goir0eaWZVNBdeRrDyWfTgYXXUXH6WEq46FrMDv0eT6Zu2Ybq7NwFbi4g1GgqNW9\/VEy7T+Etf5yyz3qm798Qk0dXgJxq\/\/ZbdHwFHw3PpllUkWV8POqRzRDtoWcedvMnAIRE+f66hG36prJFn\/ZD7a6750VuWm9T7dj3o1frqu\/Fate1jeqDow+M666O9y+zlBduxRvd+0iPp4siPM2DC2q6LMLnNuDT0OZTW1mITMObeq8VjC8TA2WeHrksGLqLPCUPl6gKKsdTQvTWwf2Me85K+tid3Oi5qnB9PHO6COC+QFGPbTT3mHFcMYiNFU9pirCNbt2wdVWCabRjlqYwbq3lqw6ntxoh+RRCzO2fUqGmp52BybrVJ1MFzJAfJZy5N3o3FV\/HmuSDWa9gmbgdDW2VzRc6wbB5hYrhd9dq3AdFWWEVSRGXezO7b8PTsvFzemP0vyM4b4ueHo6Yw6375Xl6AYN3BZlWuZHxYkSKPWLyrNW9zLXOjl2ay7+1C8sxZqfKg60cuM9S\/Mec7r91tW2fWbzDJOKXF5lWZMjoHI4bjod0bvZ\/DzWLza\/uub\/aN52q6Pt+eg1+N8xkl1Pgc69B2ng237k9P0\/sSIR2VHPrMHl8Ojaa2vfsucfcxIn\/8VG7KrmUKhxzpDg9WoK3qVVp58MW4pTvvHXeTF3QIi7bxgddVNV0JNnkqSH\/V36qGCzX2hGzDE6cVXSY+ViMWUlApoj0TIqgkSilkyxyzZJetvc+nNLdFepa3uqDF3CER7cfD7j4Udqxwyythh3vJO\/\/O+kGF40gmrz2Y9HR0Ct49Yt\/3cyCpvGCSOizDV9juAXakidZ8i6A6sHJERMbaivhOoAvyit5oYchnd6jLZ7toj1YbQ8Ru44He4sldasG88Zzl+bjW3p48PYx78+6qcLE4UG2w4ovjAQ1AtQ23uG1KNV+VAit64vw0xVAyIEef0MQf0VmrU\/qsW1kPNb9lpaCXHdRf9ng2y7yPPz\/b8nt158PitJpzzqdXl31dWiYEV92zVY3S5A4TBYVTkuV9rg35A0VUOx8pLV9V3rM7DSgdB5xjsmz45T53a+8umpWo9Cn0z+zjaRAsdWkxBWwLHdbXZB+2OfzG5q6nksqrLRpD2hyJQzxxXRQ9\/joUcf6pg42OeMDj1w8+horxxXEz79PdlSdYArbBmSHe06yc2LmtDrbixddR7lRDUfnRqKlaCY1+6ceLKJvdsMOJJDkNHC1fZfE5CMP5mI5Kc52rr+dfWFPrdGqVOUaHzY6qmrZyP6mrkeSAwFp0GO3LmN2dyiWvdRnOqnM9JOPx\/lYi43x2C1eJDNRnz1RMV5Ztrru7iGBXNesOZwtZ8tiPz\/3ipD\/vnKD632H\/gx4w7Kuv6au75wnlqog+zeMUD+cDLwm\/khx5WATpxXM0IakwWbzbWz4rnd+6qsJ+KsjpwhX3MeL7wU\/kdHbzb1QmYTVxSz1XMKdFjh0at9Usc9ipusQ\/3U9u6gL\/rI2sKHZPVng8Ar+gI\/NSCSRTyj9fy+rpFVRAehev+N8Y7HoDzPMbzxEA+N1aHwqz4lIswvOwOG8IZ1y68ihIw662Tyt6ndDnTuzLmOOZOe\/ZA9mUwHqU\/uQxGE43jmOerRE\/j0moP06Ii1BZn6nmJHbhTb64qGb3Poo9W+tUPo9H1MVLHW5yDcMaT39HoOR6cUZ5PRQTVPNti6Y5U2sBvwP1js+YIJqwL2lqJtdZzQ\/BsV4zRpvmuvijFY75SV07OqDJcdCt4zyjKWHMnuMmVfZWoWBSPY5hGnqrGo\/aYeayURstj7hC0q8Y\/hsSppc2uqXpXqrFmsdaR47acT+p5GW\/9y+3Wxjlv8OhXfv9eG6bjAOF+gTjeVQxeDuM8Zy0y\/6nEc45vhUYFThdbXcHNHN6YYz4UFcGrkqX6C3dG5+2Ckt1VEdfbLOYr1wrv\/uslkyKPs\/Eo3IEatsPvJSM9d4yY6oPRMsrmdDXVE1iboqbE1yvxVE\/u3dQqSt\/zXcF5Xo2T+QDT\/b3ECjJeL2xFccbyxSvZ\/Swe8AAGxihDH0ovEq3euvE\/lT18pOt39WFC2VZhWZxr3fW+z1Ohb\/RB1uYEdYbZ09mapPUEBTz9lS\/aMjpnzH8Hga700LU41fQQJyJdX3A0UQDpXxeSCCXzIKVXcc157XW26Yg1Mq5vfp4zLdO1hotessqIVxVFCTRRDJPQp07Ov8y+15RVE9l+KKwyoM7MB6yU9+YcYSmYQLUgW6g0\/e6qE7BAfRJj3mcyXizzNdqsGRvVHkfUmTfviOBVsR3FTOu28ftEBOUIkzGf8UIf03mBfJQXZuRZzw7DT7PShihDT8rilIXQId6gVQdiPlVb2YuWzzWQLeZrVaqUjEr1BMGLT7JEfRKnXfllXWw+xQP3OapwVdFwquDjsTYCE+Ryb87Eqlkfwz91oS6qFI1Cds7KgEVn1XaoQH11XomHn0dJ25vXWBAc+ahszkh1CplC8zEWJ3u4DWtPX4OGUycv14wZLikeixUiU71NZ+OTRnhcTcZ\/X4x5\/LoqJEc34mZ3KG7lWLVgsc\/+ns+jyXuOrdLgDPLIFFYu42+0CTZijd4+ySy56MiLBcegE6q6N0YbW88jZq289Iz2JeMJideWTEE2ap6ge7K+53+xWXutuo7FXZ+4XHqmNuFs+iZLXltgTSf2z3tRm29n4Rt\/qn1s2JGDl3miIopzRb9VT2XIcGYXLQCHi86U59qV52gXfhwuGmUyFLCYF5zkF99WmIxF5dv3sTVMRR+Mzc\/9\/kcvik3jROT0RdY+fVDZYDz+oNeOQblD0fVIpU9NyC7q8oe\/3dH0XYB7N\/TH96blGlKulfs9w8+1BpJ6PI8nhD5X5Ccn6ZXe50b5PUCh\/THQm8Ux3HI5NpD9QQvYMN\/gj2jL3EkLtQLOiHwZv0ce5ryy+Hog3uQTDVfV5brTIccAQg+bnJkvUQ0j3urTcVBj+hV4AW15\/00nrUGyK5egrHgEFannE9\/un4FcMMWMyqhjS8be56uIvq6MDqgF7upXMcb5bWxeC3zizddFz2UunV93C6a6XbPHbaMH2d0aWtZKEV8moN3V42OOKh21i9vY7JmNroZaEAEVz6rRJ6+t1uO4jmf8IP\/wiiNKQOSJn5We5\/Dwct6pn4xDm9b1a29cV3yqLuVXr0MUsxkDCJ96kL\/Pl9jucY34\/HT9a\/5rxc6bN26NMVhZDFcjxBBVIZpXbU36IsDnVeOwxNfVzYeNu+VLnzf+D1+3zS7lPxlHaTrivrZeZEXtgQNOunUyjozPgQJ+\/4rUZK2oDgOqpzvg8cV4o8PpVVq8zsvrte2TWPtPNpGZ7zreDPHXV2Paa9rnudMEOwXz48Hx+Nvr9nNe3cQqv+8x2T28k4K4iV0b5riWfWsUTCYV1Hid3V7rLVpXzbLb4tCYrzI\/zNdKfgyaaIwjq5Xg8rEDdARmGvXfz5w9VrI25imqe\/Y+TkqW+5oTnCK6ifFhG46bjmRt3R6JEzs4jDuDKW8MUzp92QtkMxM1QrQEaX0dbHs7v5bmeuBE4jhnVq8Bsnpnr6EcnvGY62NMOy83vtQnjl3SOyVLXfK6GEpBDYnqctEeaRbn3nXZ1NpqahrwdRxk\/qtw+cu6TXvlm874j2vqiOGjjnFMpKdiHHBv+Xbc1gg\/DTonl0flbd7rAPd4pbFqfCgFQecGQBMqcBGCpzIOHgelXz\/Qc+CRHNVMy0SyH+dQU\/x+WXRE37Y9njmo+xypq7Q9Iud8mYXzWhVXTpmd59OyfVojPovSqGO8r9McNR8996LP0fZmtV2sPNpe0SB6s5WvqzCb99P5Xa9eRY5rKrfgHpr503CRv7g8P9si52ru8X9HREtjraL\/H6R2psXjXpv69TdEwBrDURkG\/kS5umruIms4ym+9Wn4rmO1MTOf7+BSLsasW5+1gOTko2N0sP3yXnrmumJFXDX8rAN43AhM2WqmG5IUjtpoB97UD5bLoUdisfFX\/hTLitTg6fLNjtiPXuROPjsHvXOHFuHGwv1VjntVuPK6ESahr8H3OGDTpCmANdKRc8fi+j5Wr+ppwSzBHcFVbHoc5zl9QBz4Ly1NJYLct7RMGidp4tRzA7xtHMrU1ormklcZ+eqWnt15lC2sOhiZjidm5a9uCHS4+chr1A9ZUOLQIVShj1YvBsHAz38cbaaF\/ECtxjSPJqwfeMaPatyv\/GW2wMyPB9Z4w2YvPUMZ7meoZxsEdWV0NWze\/WDPCYygcaMqKaqmGdozD87LOLI4bzEI18XewmkwkR\/OrXniASBAXdrWL1M7mGKfPNkLwhK80nTOToandd0\/ytFy0mZ9\/VTHn8YqyauZriSiAcXXnJXPgbmhGyzpZ1W3dxl\/wC3pp+9HPRmP6ogqcinoXEisFNiJ+HnX+q+WwvsDpQ\/qbFYhj7kTRL\/Vz2vHQ4+yo+faPn6obrm9+ews82sVNfTZc1Wsjdry7Euz7jgfLGuJSf82RVj0cNh6sz8KvcyWW10e9V\/x6xNw+Pu3tyIz8rPSQ72Mz2BWO3noic4V1W93kjpir1PxFXIm7DuF\/+kvdcbww7l0VhN\/Xxnjhj37jkdqHVYwKysX5GR7sbGGd+qX65cZvmsf1Yz3acWdcc8hvJWLdBnDDymOsZvYzT5Dp\/IfSIRs2x9WgLNOA5xHBLS1QD64\/6AN0MGLmcty8eIPL6ZG6EofQ+ad+m\/FyPA6jqBsf4JGnRsv+KrtXM3akZIi9OfCIvwaXrGvwAfaE8sC3i39FCFSj2elVFwT+0GfcRHIwvmC7pee9CI4PpvLtDcbFM\/MXPeMApkB4n35P1HtNQSPzcbFjzOUqc3rIJ3ZoP1xuxIs3XKB3uZ8aNbOdL31vNGCzrCxvqq\/OEsyDnodXmbAIhhL1LMZIlhND4iuPc1UQnyViRdOf76JCj4iKeINh4U6rfajojFGtp9Bo2PaKbmXBiI3hjY443HPUbB7pGKqj7JvsvWHbRfgdBNf1PdT0WHbmis2+2w2m9m6Z8CrP0VazudpUbbdaRCVWnaeD05dm70W8mBn2xhUwkRhP\/vNuq4eXDHxYpALbQ1ntrXT6O8oP3ugP5lPjcsRyI4+QrmGrWWt0e6VB+6WSO+ZmWyTAZDBR62nj6jhWy4sIY0MhihUxKnqb1dVy2Ll9rMU43IK3fuc4ZfPKDKubrKHa4vludGr1Z4RyzF3DZAS\/uBW7RVXZqpiFi4o4cjPGQ83GQa72QIsuvC4SVzx8zhm0QV\/LYLeb+8X7Xw2cPuLzKkQ\/e6aPt3qemvsaRn1AVnvsUdeD7J38faZsNtzRSh1zHHePzJWa7ASm9fzNKx7xEriJumKCUfLk0e34PTfT+mpP7z8qLY81GqLqW\/1xfaAXvPCebmMOhqkBVzxL\/hSJts5HUpPNfPW\/uakGlT\/cAVsN2+vlgKuauoPZs7IfBJtSAac4fPbpMR+4KpP3\/446580fmsPONn5te93ZOyVOid9ymPwnLmGxxK+Y46oZahsZS244KtDM+dQTKoASOGLrUfzrd++dP2mZuiIjzO3y45p1aG\/\/vaPW2Imj+35hVrp9KnsCf1GelVUnNN7teqXZ8VVo9YvM8oWm9JGqEFnWc\/AIr9vAA\/iSYQ4dbhjRMbwI8eHY5row7fPjEhhCXZUVH+rmG+DO8RYrimH6eQ5m0ALiHTjmyRnCG8Sc3ISTeOSeK6\/DkNPdFysYHHfnSr9zgck5i9\/3OYh9\/aBMjfKwmslRrZ2ibIx+7+BkBHNZry70xFkhdAznU+o64VZ6v8hb+f48HiAzRIH4e77aRvaNj797LNWK5wgGi55k\/rEz6pHXqIn4w0p7E\/e4t8cTGw16h5Msp\/SIoD4Pjr1Q6boLHvu\/vVNNpILR4nt0am2vg6Yu0i8FvO97FIR2PcjMQtickwL6\/X74CqbBN1UNF7aaWiX6O1nTz\/klW3CnWGR8ZAGkEhVZXZ4gjjzTcY5Nxi2vbq2hb3tWjqvB77qefNOyGHAcMpUSRb1SBdYue6jkSWbk53R\/zIrm4POOSdX3zdYKaB4onRTLPicOvMLSWJb5MVWE605hs2ACFRymWj0ZOKsD8oszgfLIJ\/Hn+XEWe8yr25fv5pAxOA4U5NYIoJ0RuTdJDMApWL2ci1we8XopME6ezZQIYrQigxk+1W0M+7fIL0EXshTZ7zdcip\/Jw6D066wzmqPUXPup52B1MLRncmZ373hcjVIj4a5yDv3wH7rs+OaMnl8a\/6NmzPxPTFr7tMCOJuuVzGf3jsyIOaJAAnXsmTM7drxppapC3JgtuR4y+qoxW1BtjfgamY2COHFv2q14sv9Sxwhbev3o3NvaoKZfOjbL8cMy39W6NSuDD6dRjX1Z+Z3xkAXPNA+Q1ONHfuM7X+OWeQCepY48lizwahJtimI5Cx3auq1lJceL7RulfMDYqCKYE5aJ4qYK2FvRZ\/XYje2xUV1MZj0eMmNbYxW15SR\/Xi1Zs5AXXKZ30A8QH\/WM8TFzZ\/einNGvHseW41bP0atM66bHxrjRKxOtpse4PGYeiIk6DoIjhk0xtRp9jFJ0hKf15DmKquKQK\/8m+sTaiMlXzJgu7Nt3ivzN+cUbjIgsHlfZzCrntueuDqi0\/vbcip+aYOwZAUrr2V\/3piqeSoK\/G89j+uF+nmzuzwgQc2KllzE2\/L1ZwFgMmOjMb+QROFC9mapw\/PjGvDg+xy0XgVcxd7l3XJyvnuGf8Aly1hiAKFNx81kcR4Rpw\/ad6efnZlXOak2oYWRuzLnsGAs00L\/UxOcukoH020h1BCzZi7ZDnBmkPqk9FYnK1\/WZh\/wk2r7S+3QfBWnFlzeqSem2K\/Wu9u8dRnInXh9NAvkigB6HYVWHdxzNE3Ad9dVSZ1yUiIfWHcw1rgJ73jeIwiOWl+9VQuPx4DcUGjGqWs9\/ruS7apDhxlr1eDinoYrUrPf+5IFm6nKVxys0UxY0eCunIKZx3aOrcHzLMg7ShyVmJWs4v9aakcBdtJf18\/hTZtGf9hXuRunXY\/GYUapwq9PmBQbOiPzs7Of1F1t843z8q2TdqVkB1flOVHQk1Ar5BvHtr2EoBvAEjQmaRI00FkYTNEztG6nHm0+Ptt861NrH5qDqWvnnTWV5eFANkWs5T0+mw7U1FYTc6Y5BnS2di8kB6O6zpEUF2M\/5tEF964Xb8vJe7XdV2lIlanDzYRwGanPVSmvJ6jYKp+zU640Cb3P1QPtUxap\/a8+XxfXi819dVQedm5xv7ogvZ+huiiDyjActu41F6n+ITEcGV3edYyUsnOPZ+asw0BwjrwDQpu2DcmdZN5\/ygdnMwxhZVdErdA5lCjRJZ6KOMy5dKv0QSZTlebo5s6ICpFS3ySbHPnfUAV525WgiKYcdMtQN+r5jIgdUbqYKzy0ni4isR4RVIHEW93Ueh2etCDOyil+GzfW36q7SDici8jRPt6FbgYETbWJpHTVjyYNrBJxJYrh8cwRfi9V2bTnKina+HGNcjdBFMnOiYpgrLV+tq+WvYqYm39rTf+nw5CTbVjnlhGIkWjM8requnuZ0GBP1v7uuzO3JhH1mCoYaMvq9E7lzH9YW2eCEiMDjYJVMHU5BZ0aIgz0ngy\/g\/V8dHaNejZvx5LB57Ui+jHvRRZ\/mpssaKjE1J8vCMkSCOpclp3FcncCrKm3O1beveKSsp1hjhPSrl+XKT+KolvEs+w5cDUGdxfn1WtFiTfwxpkYh7Wd8ZTTvuwAXbQ4PzUMcr883cTI9LPLWWC8a4ITjvmxSkqkPubyd6n01Bv4V09Yd\/YpIjjHSsAT5JGLw\/Xpaxchup9jq2tThqZA+D9Tle1CAUxiv15J0DdkogDicMvcD5t1KjvcbO+fna9tqppW0luZm2jdVUE1SjZrtxGNVQA9UTo7nTmdEAFeD\/2nlza\/jj6ycYzlZiwqmFeK9tcScBu94eD2PLUA++Vfn72wqRCSYKx8Zj\/TMtdI2ZC1HIJr1J47PHeab+XccOie5D0ZfpY5ZwY3IWB3Po345GBTJyd4dUzU79TSr56PUk786psLmJ1eYmTsjkb+5qo31jExzrKi38kz+Pu8h8vm8Lb2hOWLmVO4hgEyKElegKpj1Bqd+mc+WVHXGRF51J9SsvZFTe2Oe\/KWO9a+Hi2FqFR\/4uzIdm8BoOuDllD7hTtH9FOnNM89Sx5tHxl3HiwI895iahCU6q45ie0er1bGU7HXMJXYPGarHVQ7+I\/wOB9DPXlVBLW\/PilHpC5LNDi4t6GJUQ5gqo22stoLyCg\/VdDkYt8Jx6i8IuOjkilN8ZVVS5X6rlWZ+e2nklNyQg3OsVhWzdK2wiAw9HA\/TT1VgJNZ74x4+gRA2\/LXUrLEKaC6KWLL3dSo4vfLS\/EZ1OTpbD24e6eXLHYnjkF3XkHOaOxkcpfjcCQG19hr66ukQDy9eNVozzrYjDJIxgR0bStTxt0aGx\/mfadx0eVXWeZH\/fapl+q1JhxrzaUKJHQ6oroWrlRL9RPauw4RP8Dlptj5lkRx2vUKTSkdNRSE5YZRc56aK62GYU9Lla0lhQVS\/2ogHwrE1O3rXRW0xvRij5sXD53WUZgVv84uMV0C8V3j+x5UwXlfSI7jO1qtpfm34\/vbE1E+1bD2vNnEP90qK5esOGqNIdpKEz2i4006fo1da4jfWWvNFRcLeX9z84XhLgo2YrsGsviiuRlwJqhj6gan38weivwAqOnqLhPbv543kUdAEH6jkuo9TpZzFZ2L4mWrotVlFbZ5PiBeaRz3lgI1kuSEMpZgf6m+\/M803CiQHFFeJbLHNuF2tdPZTLFp0BYJXk9vAoXqTSqPmHsaLWOIFhr1TBYhXH8kTsWwc1gv7DqhfH5smjdvm2zqjaaWV5TvD4MAqF2uMH7b2Cl+Zk+vaUFhqjLbP\/8AFsDGF16sa609xiGNLz95YiMxYlFw+D9tWfpOHRTbnvjgIdpg1LR8bm7lzisbfzKpgIE4Gly\/zQKh1TEr+Qwkd1xiqymEVXBzktaeLj8VBoHGgLzKrf2YcVJAaRMv3KE5haC6qiKqujH711qqk3g29C86MpS2NKxrnjRGmn9\/RsVsBmw142G4elfmi1Cp5qKySoQX+FoTwiD4C9BgHj6cNPKAecuMJMlZX5+lE+cPIWqyTpyafD6W6l0dy+6rY\/NBv+veaOjHTSI5\/WnvjsqrJGI6s62NuPXWzlk1uBXP4fOh8qv3FrG2LgrF3WaluYFFHaflvGcLR7PU0rimlFSqaMw\/F+ih5Ex7Ba\/bM9oaSguCrS1p8TD08X0WDG\/yWfKEGwDUyDzsODWfiW6\/H3\/N0w9Ox7dWUCAaTzs1RfmKPFuMi8IePe\/iETvh\/2B7\/yEEg2BqlMpm9DsQWiBJc7asjjz11ZfrQ7XqAXXyekbb+QfIpE9cW6I3emHc5UNILB8jL1qXj4n5FRqs+rUytphCf3EM6juNX9ePtqQMhYh5DXnTET4YrrucfXUmdZ2Ee4OldcT1l0akc+2NixBf3jzjOnOq8CoRDxvmrdY6uutWj\/TK++phzGGbe3gnr0Tmp\/PZdvbCjNv\/ba4ZhEhAgQ8tu6lr7RumeOwL7hC9lBSLZR5x7rHf5XgdkgswcdVr+weHgZvb6h7Uq\/o0WyNgaDfR1LEYK9WMVmkoc1sYjcAlZGaPjTGAKagbXzfWyj\/dzBvfsfPFFIeY1QMZ0eK281lZlsiJzkYtU92ON4HERbZ3SahrJo963jjigiyDayLDSwUeunfqG59DRRjxD8r+1Es64mXxquAz9xrC7rw\/RjTnOAQ\/0iLzPsH7iynpw0k\/fS5ebA762cfi6hPYH07cOF9\/Og7ik8mL42m\/yGqZoP12PULsZ1dzo6nLu4XxEWYmrBWE7ynU6BBrm3mCUdkuMeJ9nz5dXZbRijufAYBE+pIM6eUAUwBD4Y9avIDBJ4Pg+lowtz8RdxFojMiTtq5aggqpua89j8Rsqhjsq4sdv4FPPa00sA0aZsY7zT1XocBqVnD+fiuLrgFVr9JPRjAEZV8esT9fVePZG+NoucnH3YwB3nJ8rI7JdL1yWwOHFSS9EVYnRP9xBXtYOFcjoMRRW5PlcnUBVqH6MupfXyPApgNjx55Cw3H19W37nXcFTpmG5JdnK5IGhlT4\/K9151+kUmgEPj0O3FqAWYFf1hr9XNxtB++xs8NDn2qgyUT\/eW935XPdN1ij+BhyIUXltfoO9OhSv9TAlKbM9bWmuiTasw2vnPA8aqaGiB2fVZ6m+ebr9NZUoYpb51o9\/U8WnZ+PJ9FLsgRoc75D3PB2vFrK\/67rBihHt+ry0tnbeVShbDbMiKVPyyLj++T01vlO69\/xxhWsZNUTXmCZ2qHz38vhUU3ec+m7BHltM\/ObNFbGcURSxN9mIsAfszlUzuTpSBdz9Z5dh+V8Fymg8al6G3k6EjCWmoNgqH47L9kUB+kxtFKdimvOmuaFYdKyWxpzpb6dOxYqcbt9AWDbnek7RJDuTAzim4x4i2s8UZwrNXx0H3Des\/k7P0WJlvScOY3RY9fwqM7V9+BJ8qXc6I6JMVOmT6IJP75sv86WiPAo142jqCOYg8jwDqzcqW5f14xQ7Q8ZLRlrl80plTsa+9YH8cvc4uFF+FY9dumPpxI9PjHMVq3c6RVb7QcNxKzycL1okG7wec\/n0OWrWHI9By6JZy7HbVrZppLnPvEhRDYi4c1bjG9upFj85znXW+XnP7dxaHeDlZnBKNGwWPToPXA9jlhPJi\/PhSDXP377Mf7XrsYzf6Hyq97XaPqo0+Tr2g0dIQrPcI1Yfeady65+af3hb1fSczcfomeE8oxNIwsebTffN1vqTgdCm8NZXgQ\/\/5BYt5mfYAD7Vv7XKtxIrk1bJ02fWsFOpsR7Vim8fb6xqEo3n46pmfxSpI3iYL+uJIDw13pbInWabWaIt9o8T7FU0ycF59SU0BP9z\/W09uqqQne2tAVbtjYhKMURP2xl39aRxaYtdudwarMw2\/wgCrKu\/NcjjRhhOey7+rYIfy672ZYrFYSus9Ic7JSuoBXoLm4Gech\/vXymDsWJ++SBOzL\/j7nd5dO6ax2DIRnuq3jiUj65G5nWaL\/IqBpmX2spxt\/JXTY9H6Ov5p99Ydg+8c0lz1F6PGFyCvnF+WxjPtabzZNaiCYBjp\/JQJ0bBOK39N8qmirhzTfd24Yn2xwnOxcCoQ8PhWsaf79sYG5nkqLHFxRW3eb7PrU4b1eVp1QtLgDk5KH1zJfkQmXFMJ9YDjrqV+XzKfAGVKDv\/VWK1Rz51LaHW0KL6JPcM7e3p+Bom+Va4zGzvnmf80gtXgvgIGIMhbv3ko7eGGhZ6tIwi64hfPqkbPWM+y1arKFUPTviNuhm7bE8qqepOVF\/17GuR7gx8fAUcAN7QE6rXV9ywSrCW3FV4Tu\/I5HENUfWdiTKirzu0\/VbNMDYvpgdojopsXB0ssvtJVXvrf0D+45qMzVdO4JnOot4alTQrRUy5BbyJrZf5+ZD\/+i8+\/+bY5Hm41gaZU+Eawc6EnulT9ny4Q8vxgG+VphqpObAE0Wmmx3BwR2v4w3P6TfrqGDODxsa5ortd0YxzWJcQgPwbyTa6X29C\/MCe9akLEfMqu0g11nB7RuvrLu5FzQc870gFhW\/4ElHyJY++6tx59EMezIctUcUFc6Ky\/HtXMrDgrE7b4YKhhx2XZnMzGvoa2SlwxzWkoskrFvxJEeHr\/jwjJ4qJerY5K333OK5Vjac6vJ2an9+9940dgw1jYwj2pKsM5Le+TuVlTGp1RzQskw3ie9+tHp6lJuE9fJmI0YWTBVZBZsZ58NxXe3\/PjE9YoarseAj4bjw1x08s6wl+R\/cz1VDH2GG8VpWLrKn1VCk+syu\/5pI1CRrq6sAMoGkg8VXJOEiOOd\/dGRa5cyXjnb6eVIfO3q0KAJZxxnE42116+jUVKK6M8QqmuKOntsCKsvz50Y7iFoGDVeQg1snikGyqCKiBnCaL8hrA6ZroGKJWEWOMckydH369zsI+4blqi69TLJugAoaad0yGySKPVzuZ8zE6vHTrwvN5w+vvbL0juCGfjUaZkme9J6880+Ma6Y6oDjCzGgNszeXrF6uuqcnDV1e39AcuTn\/IpbORlW5eqfJvDTrWYzJd7Xx9VR3NlqdQC5XLuv3yCzwMO4B2I9LxEpvtioIRKp4cOyOdN2fT1rkwK6KcMGWxL2Pj3+Omnm18zlnrX3WcMjgxoecgq3+hy60dY9Bi6PPqC\/MRCVSuvay9VSxz4whnZ32YS2bo2shPzvv9XQ4mMxzDyHJkmOhmS8YZHzOaGm3P5VT35pAx6cccCXFkJvKXsy+vvlk5J9qzNscmzXX\/lWdO4WEarhAAb46buXA+Dob1zmMs0PapChQKLUFTHf3Nkdd9bq1DbehFvmsva424tWf4fkjgTGOWo7yr0XgbTZizYw6de4PsCmja\/vY0WOG\/vWBtwed+s5Xj\/XuvD87DJzh5vn5xfP3vFYi7G92YvOHcZ5fA5sQYB0PG0Fz9kmxCDZovo0Q8lv8iocg7\/Z5qy0JUgzWOfujIZS3uALkc9LfVR19TBjkdd13jW2W2lsHi9K0oZibwVY6Wc6xZq9pz7\/MeqdLTOGOimpxzpLrQce76kX8AefmBH\/EEz99Z01Z3npd7wGjfD\/O7d4s1TQ2y+63ann9gvOOAaSmxqJNvfSWJU\/Tgsk6ir8+qosnOq1uYR0eEpxg0UgutSat4mZrTo1YeX+Fhxv3kaFkZN8o3IgW\/DHc+TqiigiHm8FivY5l\/2CvfdTGPLWVEveUchey\/vg77c6mdLFFltTUOmkO5dcA4c0piJuQm4uA6wcyNu7YHwhFWgyxvfVGf1Kvnw5B9ZjWLc9Olkbnf9+fwvKcIrEQt8jy6BwOj0mPvMbgr0lbcMLC4rL6K1pcHcv3RvLGN3N9e6LHXuaOwraI5NdmGVz6qeSChkNjWQmMqlobW+TQQAe7G9GgRPaGhz6mwgoC\/50JxRtVT9Uq3cDzDyEsVU2XyZK09nDOS39He0XpuY3WeVnKVPnmBVGUg+ndsRGDOfJigaloXnQMajg+wzqh8fQvVO02dP916oSMl+kaUefOoEbEXHyOTVMo44\/fU4+J7tbgRPQ+rQ4D\/y3pTqz1ThSfjxBWdwrswSjl1yjG9nfZ\/fA7HcRb12KwQxd9xuwcdrqEZ5QqP0xTUTqwUlw9JYKER7vpSfjzlII+XGapsiCbd1THwlj\/mxKpcOBzqXRUi89Qs2boqeu2NfZbvIomackWmJyIzjuA5Th9bPVCH6q2tzDk\/39Q2lzNq44s96n1jHcdSr1NmkOQOXnWqud\/Ml8NF85ywseb5zJT3HrjqSRz3HidxVmOAD8NhjYyGu+GSqoMpt6MgZw2FxaMRpEbNFz\/xUOcDxjOrGDNIFVHvVZzeQ4t7sWRsQSpKYI26T4c2oe8cR5+N6ZgFtiReWzu3FsmmeDR6jGJi8VRmKBt24VEyDaasMpnHdunbvo6znv9pZTl3GMwRUBnHiEZ67DMVoLbo1yzRe7BINbeHqZzYJSLX+5dtd+Za5d6asJp1fK9bcO8gEHzfrw6jO3zBN8GCrBa+Fyf0kC+yMh86nwlvXSTnI8jUZsYo0FL2UpKXXudbtmucunJQSfEArgRAKtV2cbffy6NsxowZFWNGPUWScd+rtMWI6vJ4ffWCs6NaGAdzBRlW0jl5nmOOOKBUsXdC7vFzFqE3578R9TWn6VEjtiuP5g70lWmc11FvX2yfA8Pdiuuu2Q\/M3mBeB+P6nnc8XqWrENxra2afUwKeURe\/uz9RhWq7x9g7hrm25hqqzX4sPmaZg4FBt7ZvdoOy8nCZDUJ++GQ1o1cHBYztW1mZyXI9voUt\/sxmbqS5XK5Q7XmcuQSwcx4DPOFhpwrjMZATSqiqDGtlFI6g1onz3MbGlAx8fFFRtbiA2otmq1APyWtiL96r4vmhzuzjwODyXVX30RHG8nE\/QXkjoSMhi\/NwRHz+0oxRCzqQ1d1q6R6HO6xeWq8bJtdISWbT1vKYautVFcEpTDkemK\/FO0zLn2LI5mKNns3l\/SW+4BTnQpvHeXAPflMGAQOHUudaltt8SmpTx89KftmgemU5Ob5us0zlWkJdhN+P2WQ3sQ1\/j2fnpqY0QxIcziypnq3U9kj\/wr+yxpz1QOH1PMR2a5WyiyvJrajXm4wIyqgkZrkdhMfmuQZLjqVlXfU5D3s17qKp5d8qvhXeMldd4Zm\/avAiRqz7r16LGma37WHp77pFjHz5Xqb0scO6axSQ8K21r9+BMZ6GVjsyBmrhXEEZoN6Q6piz+MXTzyA\/RUSp+LQFnuVe81nx8RPVn6P6tcj7aOpLULvl8bzZW\/PNOXYt\/EqgSkel\/H4Ux79TYb15hu2GGdtvdkGeXnGY37uYaDm6g7IYBaKWZ40szAIiD6NftD+UDDXoru6AMTdb80Krk2VveOk40Oaxio8E442b71vVf5yObpaNHN6a797n6IuZ7j7OHaN0Y7qtq6noctVYWp3JGIgZc9PtkyM8s2OzPlU2fNYxDb+1StfvVRxY7\/inlWl3e6NzjYkJEX2rs39cnCtF2VX\/2yhPv62yb01Pk3m13Irlr\/Y9t1n2cozfWHxjsHXM79i+qx1tDDPUadEiVaNfz4NUI5jE6zFmMDQvOT07v5TRuCpopuZAUertfPziuZrEe\/YcXd34dx4AXuXr94w1UTclbnA46so0uI6G35kt1+jSUut39TEn3woFHcSEs\/hv5+A9H+dvPTWGo9ZQGmNw\/kxHwqiuulinMBb+HReNycpwa6nnPuqv9sDAerCyTeuJbJUv4IGeBo8xymNusvDWJUOE61UibT0cv59+5LHb87QSPYe4lqmHev5OhK\/uy0dbWZWthz00uON+cweNZKzPPb4aRnVhfa5ZNacw6MWrrZNT8iCfkAtqxfzDHbioW+FSkTuq7KQq8ygIS73h+Q4DVO6L7\/hM5sWbHIdThZn5IvX2AYfouXD4F1Tke1WXeFHtY7VywCoa\/WHkOJJhC67Z+hKvZz22vjvGtD4ltOreGstqq3rI9Ku01WCrcWuJHoEOpt3Dvm6RZ887dpxFwdVVUVWldCZiL\/EjBsy3PZjLsuBVIDwgg9E+ff1+SwtlhlNZkKg+n2s4j2YFMopxeCMso8KkzcJ4p6h0Fcv6NPlJ3nB0\/a\/4enExX46fKnsjXaxwXMZokeiMQKi9XKUumu0J3Oa55askQkUSyOMXvBjHg3bqueNelMtA24dkLuALtVtu2w69oibkIn1ZG6CaWOzMeWCxvSxQW6jA+NcZtMKHMWL8mCC4zMinL9RC2wARuKytqb7ef\/GvOlCH44HVDpVNzyApE4edxBRaqLMFqfir5ugJQ0bxRrKKMlNUPBFSXdGE8yo8R7\/nQU+JwQE9ch6\/jTXGUuCUV47t1bnAtU9jN97hFYc6N1deaEUwluIojPZ2rxj7xjtM0jc4JWJGHW2c24BhHofV6hSDfJpWdbLMmXc471qJRYaYr45fRGUhY+Xf5ciphxk8d\/o0AS3b+5qLf2qt31fnzef5VQirbMlrcK1pBtnRd2cG5iWG1N\/93iz1Ol\/Za1kqSolcMdm2oyZ93b0IJoPU+tivXIyvsYb00aDgr9MBG+T3Iei56I52aMDvT78\/\/a86Og5GBh6PpcojKG+r7tXzrnwzW8zFWnKkuCcx1vdteaevjv2rmLATlcnVZWPzRdy6wTMw9\/skBPgH9qfXRVilH4L0KbIB7TAOWoDb\/mj1Z3XEXBqoqf3X7RBP2oB3mc+rsVW9FQcbzAM0vnIzsyD7ZAXksdemem1VhRvZUemf14\/mf+pkiIkVXG8+N3J1Li+B3aCVNvGLcnlVsxw+P1UGIivWNM+tpnyu4ycuy1TjfkiXR3EHsiJVxFw+u5Ddl8blrP+Okry2qsY21NayXM6XTYgitUGE4YDMur2nz6ku1U9e8zvXYD8ubhetdvLDb4nZjpWvG7enw76jSp4HxUNHVX50sOrXcTwVyQjIfjVF7MGPjPRce5bDYMBZEC0r7fmnagVn01KH9PYNmGvXjc8\/0XLzXuRe5TcuzaCVlgh7jBxVzW3UrZ4x8djIGiDqsiZ5c06w9Xj6ORmwgP6pbM6fjBrx0+zOvNx8Pof6uyiTRe42V8ZojhaD4GoV8fx9aw6uMcO62eJun1pJbebT3fHmMj\/zQoPkBFaOfBGVvxkFSvQ61cJ5qBhP9eSHPPMysDowLsYexfyysxWnY+A5xkvPcKo\/h5Y9y1GXexEpAsd+RVHmiOazuqX99tF8kZNV83wZozk\/lpEwFnc9z18Q2eyR5pi7E0NbHBcnPmCYL1cC7WWIkS3gzfJMn4PJ4BwrgoiPVeft5NdGjP567tS+M0LtrFBQ4b9THKKbz5u8yKgq30y3xzkB947zk56\/jHLxJFrNZmdwo1OhcTowDnlSL0FyM8g8NhePhVu4T4\/vCpbL8wysxz97o3+ue53aLSZEfGv7xvickygdZqfZPFo8Tc16x\/NxZzO2x59uBBNdGXIPzAyL7\/m3fbG65EVtWDkfxKzCq0+Dp7Uffh3upjRVt1e9vysxnzYXOVR7OaXJXvU3fh0Rdfoep\/hXXc3AdmdAwJRmPrDn6QA\/ikP9Dauqc31wua2MlJlmTHkVfONTl8wqIxP5oAXl6GN4+46wjLrfVfpW1KpE9R4TTRuI1BspcbCm5w1AVNmLOhwqwFer7PVO9eC0XU0wXyogbU+dyj8g\/mYRP0M2+ZqqZxbDDyOoInesvvsmbb1KrKjhQorAxjthkoPq5lax8mirqNmhb3jMq9Mb8\/o4WOStbcZtcSH68o0u7XW1CaLJ1GkGCpgvEanbtVKs7vXo7nLPytXk4ODjBz7eL9rrSmtuGae9q4yJPcz6vHGzUTzB2T0eps\/sVX+9N1G4WiYnjA1eW1Wuj9XR4kElwazDVLEwVtJLzJ\/oGYgFcWyOx4NfNltEnz7jqvE4KJ9IEWfFYmdZqpLtiI5pstKmBvjm6VpR1op47E5vnv3+qhuGfVvbz2UyLo9DGxo\/8FHvk1HiieAEMQVidA1o+99Z0pd8QEQ47o2lkba69TFUgy3qu4x2c9CRFfONro8t6tTUlIJ4ZdRwx4tAsThXliOOPYrAopZMgOIqrqz0ZQzmeO0TT+bFqNEROc2ZfPzh\/ObFb+4En1HGTlWrVI6Dlt+85sLV\/tYszLnVBPx5fpbWRTQ\/+8g0o1ngtVGQFy1eBGEp+4J7cSU9avpm1nUGeqDTsDF5PbywJ3rGh8fhBXnr1W+VeEpUpH7rDXbkDuyoo1dd4V7AlpmhT0ZIlZ67c0SOkvmCrc0Yw\/GLFj7OmfI6nn18ddtsk6cgDcYOgzNT3Gv1qjBqKztK1wcz8njOzCv+YObY32oqHTnzRfQcMX3ihJgdnHqOt\/PrODvrqm7QBaevLmkhXPw7IPABGVXo4ny5WF0chvwUPxWLeJolVQz1orZc71BjMNmUagiy1jgabYbRGK8V5Jj81FYVTtZOf6xPGJH9i5UbDcghUsx3PDnX8liwdZZgllkb6M6AWPH5fh2zNStTunJRq6t+7dM7MmWcskJRsVccXbVQ5R1lspP+6hOLm+KpCt1fzq3NVVM12\/O\/d7vJNWSfTIDDOc15NMYal4Pqn3KAPpmdz3qx6lNFVEd2ucEXbq+VRsTyd372U62\/GaGqvWtu8G3ecSSL5GNHsOLVQGOz7awvv8sYXhIXQm35PVnBL3ZPu\/vRcFWiipvOf6xaUth8FvJ2rXt3Iz77qZ69+Ykss\/CitV73kyhXl7pu7j2BYKmqTu\/fiwYMj43ZZSnxV0NXJcX4\/GNjTSXeilLVXQY3M71HovGyksj\/+u4VxtNEsv7aqDvMLA619AaGdie\/cT8jA9t85ci76op5XZ3KEV+kcRdXkNIrlFpp5SreVev7LHtVJBgmc6ua7jL9DkMD0HlQAJ88FMunRcXLivEmQ5zzuAhFWc0bh4QzVUz\/upg9i\/6UaKlz9L4MDCrnIuQ4R0UsiTS85l8yGLlnvLiXv3yEH1H\/rEYe7XhaRVPe5E3278+q9ThnFYnaNdZo3fh2mtT+2eID0\/TUuLQqtkZq6\/MjYrevAqldqFvXVh8ubL+sz32uOG0PrkkPUX2k1bQo1AvohDYGxrkagifICuNGJ2ibWRM1tFuth5tldPDYWS\/G8JfOxYpuz1thelVhz8WdgjpGUj0nt+gFyATl7Vv9LKep+DiAPt91dmuzfEwkiSVRR9X0MvSIgypGWbfsZ2uwlU09W+ngE32RdWl3bNf4dezMaWPFp3Wenclc9RRlNd420xpHsop2RWlUrJZlbrXnGAEm7c8BDDuvvuc\/nn69upvnBpebPTDHY8Lpq2weLeJF5pBLzt55rYziJUeT+anUHMqNOUMhT8e9\/tZxtP5hCfL1t7JFIfpCzvkS16klckEFDDHzAOSfOnBUsItaQRTBhHWjzt\/cdGcd3xh8XqKYUJ04MwFDjWRYzxH3L+rVLyNuL\/qXfhqludrqhapdL6snRr7RNoLWNfOmPXoyeqvjt4rIe795\/3ee4XVbqoLcyyxXP0YRPTXS9PXJ5epeTSXD8tPfv761eP4gj+rjL2sghr+Pe6zDU6k9W3bCl80R\/v7iPUpJYDxNPVPwT8ij5njYNsGM8HVf5yJLulYgyss\/uYOhqLT813VZVR4uTct7\/D6vnHmJXRmKCBX\/zQgu5VOf87vTy60AG6deezdnmN4a4FQxvlQWpA5gxw8PNGPWKngYi5Sty27ldOYI25gjHLEs3oj0i7PiR6mfoWwzOo8IdvWKVipVA9LFqNpn5Kx5sAyeL16Pb1YVcFxb6\/xwAtOS6vdXVdvafBl6bM5ohVrTO6am7v2hjAYFFDmxuCp\/2+5f5LqRnOrR6zzN0+3Nb1zPHG9+g3R7KztN\/a1mGYQRy1bj9ae44DR9k2k4l7oo7te+vmHss3g2QjmuSux\/qYUqOuq+mKwePrmA8XOkWDieGxbL8xsJSx3wUVdAH6gwOi+q\/nom+1kdj9ZQbedTf9DqfHzf+nhcVGyLMzMsb6N\/4LCvy82lWHn+3WhMb37I2Ssaczy9cn2fFLeIbh9q626yRIVlth3POJP84nLId\/clf3+7p0tEuaeoGiK3Mv5Mcf5O34AGNzZX\/yqPsRoCy9tWPNX76gB+fAxTh3WomzsBgdTnnMtT\/zLauLdupXPoTMFpI0GGisrHYaCQK6WMzptvWyD31G2Zjj3U1SkccwqYOI0FyvbzvFMAKqjfvUptbPzYdN4dfm61zduv+jZSxotmzvUV6zKZnkvdzax9vmNoDmEZ11\/zLot3sYDL\/53p3VOtdHpnX3eRKapbq\/WUjTF\/LIJ6P7MPl1tR4GSYe1p4ig\/Gnma0nvrYVKW61t\/Z51m\/8wD1rbLgrmoszzcObWcVA1MEE\/DirkwMDqqbIMh3BIH2RZQR4XzbBughLh2v2ERtGp+JyHMZqz\/QvFf2MlJHEy5NY+eMdATUF+0+7soMYK9UdqNBa\/RsvHEltnQrFJ0BSs2o5b38xh1H0kpetTvmsyasQ12TunPqzJHuOpJRsRCf2c9gmB\/VPZ1fB+cgiVxQ56qCSCD2xLQxSOT7Tm6U\/ztPsvJdIzAqehiLiLrlnIjCPY10PSa\/ExXONsbTimJW58D525OjspnZcIie\/v4DybOteWyza32MXTrLYYa8ytXVHzDSLoqQ+bLsU5QdEpl5x84QNyL7dj5USWuKqgP3VJW8Sa84qg+yt8OxCoDZc+3xXNDweSOGo+aeYJffTMlkH996serFSMgpHAFqGYfVIeJPicDdVcWYbbgSJWiI1xG+iqPSwd3GTcxhXlWi14f9nsgMms3fH\/3c1scSzCgMc4iaP3uxbV672lz2Vu83N6oAzL4VBNxULSyvbqztnzx2DeQdSzI68rJ7wfWvHNvHgkJ26F4GiPB6flw0jhx6uC4IRIBw0TvrtfpV39IcuUN\/wRNXrPfTbj9XoTRuaxfWcO7ggCw8dmgU85hrHflrqjIOABWohG3wF5UxZij3kzVi3PPKMrmuPr\/52VtGGC7n+kHWaqjY3iu4NkA+9XMVpsuR9TrGOp56i9aB2jv9iAYwugZJD1Fe+URO5vj\/67d8benLrGKLChHdYI4sju22c5tMtUabs8w4\/\/oZNq0OeGXqXSWeb5jGFyHVqnHgdMi+3Pcaw895wXAFQSuyn5y2+i4TPO2o8+2nPIAuXJT5Ph5Rx5nhxv3Rd7gk36Na0\/ytQIuWcu3nE+ymdMc50VEQVHYuAvaaz5wo4zu9httwi2ROtoM1yLbHjLnHG99nqa9sgYPp05SwwjzOpwKJJM5H3RlPwSTRtUax8+kIOpaOlZlVoaasokgWPmQdi09xnsOep2LarVErnpZbS817owNf9ovciOnOdq8EFKdVsHiSfaZNyyUzbYz2Cd687nav9NSVdXXwm1NbWO6q1310r8p8PQ5jZ7yL+1jx2EUuIzdXYXMTnUd703meNvzRHufuvMFookSM58Wr5lQkPXIEeERzvlo\/DlyFNcs6lTIiWKW2qEBc21YeIAUOahZ7ZOnu\/hLl9DXVAFxv5HpMvLLn4kzEtFVpJGSVjmA1p65u3BndPMAXXee6L3po1rnnb13DFvoPRoT26R2J8nilaN35nU2jCoYbG\/jfFYZViB94s6\/DsKdz9+okaCqmix4Y5GJqDuhHlKHbcH0ysFEwqjZ1mXu8Xd3lHPX8fAnaRdyp4mndZmp1FDfFE22JqF8dDjXbGyh+1JHF7FYuzedvh5lMtbUWOJmwkoztEP9ZyXdUqHL0lhUE+r5KAcXNEbrGDOSgv5lO71wDQXx6XI4nwvoj9mzWNzHAzXxRiRchB9P6co8KOo3dnN8eF8gUYanMMuI4a4hmdFWCq97fQ7ixXEGNn6FxPSI1D7vMQ23H4twxuE+lMieRCk\/LljquKc+eY67jxafFRtPnVkmHmuY8TqmI\/42wucsM408ZDbsf9Sy713HJb5+912rhSui5hmpEjuB73elcsHoDl5CxepPgri9id1VXECaW8dfWAvuXcDvujf70MocAmAcVckXUM4gRzrlrC1YwOJLhjs9iawtGWp3gDiD\/i1I1pyr38UvagU9xVeIPhj0Hrg9gFxjuKVIfZmAEem4rZWJ4Rr0HlauwVvKenY7+OyNcNo+ifyog46Za4aC1W0WEq+chX4Uu5tsFsVUiyUqw\/7oDiMsgGvn7+Y\/2qUvb7BY1yul35DLqHUy4m8zTRVS2rIG2GSvP73MtTHqymoMsPg+ieOwKwfd1wET6kheXznWwaUa3Xh8qua7LM4s3+AUHsNElns9xtybQqr87KWCriF6eYLivBxAZaOs80nLfSO\/qnPq1rjRQ2USid7+s40sFUrXoIJ98sgvYsj7uPjs86ru3GstR7riCGn14ZNa9Aitnwg3FFQybDlVeVm1UKtVgJcq74lNMceTc0\/avV0msilGSzSs7OkkxjNZke25jHO6DFVdp5zCaM2ILo2ZsWTOBAijtU81lNRh07nA+gVas1mJj\/H7Obnh\/I3GNrlPljPnSoHNZKs5QqE\/8ZSj1FH7cHMaXKF85oXWfduTLw5vq6504OQK2aUZXXUQ1j0VTeA2QGfsax8v\/5FL\/QE3CXl6PhmLAV\/Sz6hYj803ZV4JTQLTHjxVK82Wijws990A+wZ4aLFPDIFSxIwfDxeNnv21uuiFTk4\/ZyJre53znmOq5GY+hBc9hx81IiACxoje9CG3MQ7mYQTVgwsuLyiJ\/jCmHdvd8mDsqB374aty3MvO51fieq2dq7tRKWFBmpIKprL1qGSZbHy\/W5HBVqMOhR5wrOaaW87fH+FpGd0bbV59nvTF1GtNOOZyr9\/crLqbLXR+vv86MvTF5q07FeZ5284nS4JgKBMcgjnaIE7oIS8MPRgB9ayUt+nkyYCOvIuzNrRGpKe2uZZl4K1rZFWWmExy7Ud5jOoQxRMdYc0Ck\/79fhfPePTTKWi8ycGq76hfv3Jk3adPotlPNaRP53hrMdxR1flGGpRanFe1B9FEr8jqxMVqyJ64J7KE8touHXjWaqR1r1ciuV+HWDv02KssSnx5o\/ctsIEANAYOXaZC56pnO89eryXC00RuCO4\/xUNCAAt\/9lMdF1FddEkxFvsSXfVvRRIz5OaLp9ttLtsKM6ZdTGDORmoJTN80SZxghesmjqZPiYZx\/mJo36unzUs\/lUFOtBZxF1jO\/mc7xpCbrbalWNG5rOfmslUUlpxX8UUe7nZG5t45zldlZNLPmsCNwVjCajMV5Mp+z+TKnGDI\/05hFTa69CI5Pixd12AjL8sfQ4ghEynfW61WXfhImAA3Uxt+VC7UGd1GN7+\/tqemlrJo7BvZr8Ho++ICNn5qUKWWjQ+FVkghF6\/91yKCE0cFVVX8YoxSOSmz9jjfdWJgvNWLe8gifIPWtG48i08bLaO3veuAEMl27Ot6rYLDoqhYEA9D58P5VL1t21K3jzINNr3ED8b\/HEv33Scd930PUZO2VX2kFX74R0VIdMuv2t8v78x2VENbmeZ7fKaLq4mmLI+8UOCPvu\/uzJ7CzGb395y9eVWPm7PnJ7sSid5BcjS+L\/bte26JubkVLYhufTh3\/csV7QvLz9ye5f9crNirVHeLYRINNos4+CWN0zy3ixo445222tDV9IVjQ3j5zOe922I4RMafnrVEW57TKpxP0k2O3q0JmXv5e7Mnn\/pmbw9Fes+x8t9tCi8yphVdQZSTNbfFFls36nk2lwjnBdWtIDHyPHT54zfTFQxQtXr\/H90pY+krLb6Qita+XpcfiBZSubhnvwxfzH1b7Gn7H8DvTetqc+zoUr2BUh5Y\/Vojidu9xwaEtkhnj5sqM5lTu1c1lvf3KLs3ZsMPNHDqb4uFh\/uWKem3Wl6GHpmGv0RyWGRGYKONxBSC5MzMw316HRWvnk54qqRSydPUbEXhrpnF06iM9FNKJDlhgTbNdn62AWCWtgppgdldRLOrc0TCucwdqmGPYYNYv6qyrRmddYaA8aL1O9+M9ni9DvelTb7QRz831VdOhjLonLzyGiFEgHXd5w5LBFXA9Vr1AfbbM1Wfba0dIjIrFPtoVwFrP83i8ebLnSrZX2SywFnhXjGY0nX3PbhaPJYuUr2JmhFuBbZ1K3Fwnulb+usV\/\/WTGnZ7KnlRHdI39r6EJtiX\/oU4188WoPTIWHSTa+tFXnGWwXnQRDVYvVezNtXmozhPRu6vGVBuaI3PivLyA8+B8dMgRgbcPZhjL0KZDmq+pV+C+x+wu\/9\/uMv8Y7D8cwe4Ijpd4zDOa8Y6rcay3oN4az+48EHFwvjrEtYD65rsoI73NB38HwUV2Vw6qLvzq80lUfud13ujGOKmvC2fcvV9iW5tmwlsFHTzPNQ7wxjtuxxSraeOn0bn6qTzRjBn5l99keTySOLY9vGO1\/vxpswMflpnZ4Vwqy1IdV\/vKPxzaXZcsX9AiqxHupsRVDdzvH5SB8Gup+OsoaQWnfis6HqHfMcechjkLR0xbP7wyVJcl4AzQQ33MnT+mPk6kHxga9MvVsBXs5xoFp5sv9iq8gp\/Z0JdcnXfOnC6AWXySKyIyQx\/tobh9fNtZmuXpSNVE58aRIJnHrg24fo+0Ij6Vcbz21GEr\/e2Q1LWABKqNVRpcuwwRF2N7a4+\/9U1FMc\/H49vf\/bBVycTY3ur6o3MfpSpmiipa\/TrhOp+ivw7ho1oJVhPEs6wopmnfzDHitpzDhxlwwnynAR1R2Q\/+KYbGPOyw8pcVNRZi5Pc6A5j4Rk1ElvO67gnmwwTTjN8pHXp9OZ4Gjs4ZrkFBFvnrcziL4qTIQV3K7v2tCoji8R5WOJ9aRQepKbEmz8pZfTZVsWu6XLeiFYyG\/h82O9qX5WGEvsguLJ3UcebiCaMUM1eTXOOlY2CPg5bqxRpInAURIce4DdCSOMCZOyOP9dyM\/t3tdllu3HSRt45TO\/auMZh0983te+xZT3hNJb6\/q8B2Vl7OQIqnraJaGkEU7iqp5IrLYxv5ZVcboeeN+UPl2AQcoH1j6ocG504Nys7yHz+pY3JprcJUKPTGeozXKiPPcJZ6PFZovFtDlcXnWWTKc4fw65vR27XeSK+OjQbeRORmCKB\/wynKntPZjOBn0IJjwsVelVoLrZKtP1yzBT5cxbgWGPPjT5ji11qzzPcejWJvrlznYLWoZ2ENK6krro2YOfLXFOJVq\/WfZ3gvD6OX++Zwp8NB+89\/Vdka6Xmj1ZCxEONBWD0SvefsuZ1W6GlO57bKGxOUR8EDeVMl9APUnXqjerBnnNnwjgAZCSSqeHO4weT8OSPrPLjnx\/pszKiEPjZdW2WMffY6zPCuBpaNiKc+Qu2wclQg7iWKYpz7GPamJDi5OYAg0JbJ8\/mYeggiRnWP1YZGNFBslTTrVWC7DDUcw2pcZE8Vy9S+ek2VqHlkhX6tDzPGWBwTWV2lzwnyLJm\/Z2gfFtcVnVvQH\/HIvE4znL\/ON+ktuFvrjdJViOfKMHNKYyViSwRZZfRdwKw29jdngFIV9ngEfVTVVk+bEWNgxMaN+YBrf\/Jeax8h8mCnDNXfGH9HVhdDpfGqrIzEuKuXn56p92PgcwlwjtHn96skEDlW6tpclxM+MxMgNvXdI9Mir350jucY+qoBivHxJTIjs+rZqyn6ZX3UPQUYOXedr1cx7ofGuqDNSJTdCHjlHgbsHX4eFql+dpl+LXTHqUvN3\/e8t6ExbXfhaaDavA7lvS5\/q7z5Caq1R+V43qN0SHnOtTMpltH7ctvGuMyiuGKlzDKeoi9YQ52jR\/LY7C7v4NfKJEeHxJ4zxMmvpxHUqZjkefNoxI\/paDkRFVvWuS61uaGiW2OwzlYZb4+KzMkC1kZrE2p8vkANUdf8WyWx\/sgAc\/d9rf2LbK5nHT6s9P1Ou2RJZXqqs\/WWz3iubLVMwOnjs+zIyH+ynGiWd+0n5\/1W1su8jHuexGziY\/Gv1Eu+H0M5A5n38ja+qQPICjfreHVZfmfmx79ftBI\/7xchWnxVHzRRN5evxxXbAyAy9GFO8kjYkTs+HHKpiK8ScMYqAH\/fv46ruM\/TYV8XRNQvJpdpWrRffaWaRVzkdsdnxZJrUcdxjPh7DhVqvm8c13a9dUfhXaud6amlrRhnsc\/rcWQD99yo8ApJ96G2x7\/dKFaU2ynPlaz+3lfR+lyv7i0rooYc8e53RXusqbyeLPnkdaFgM897XR3hA7UdaR2aaug8p2BFXiuya9TMJug2w3gcEKSakoF+50gZJ3\/\/jtteHv3C8G2T8eU1rM5m\/J5R9jN7x21ZIbydxGYWDaw+L9vMGYWQ8cwy2eg+WWcms4IcPRtrq9PvUzxWE31uWK9wVQddKdAXyNunzBcLqs28xfom0hz7jaOc9RkZPI+LKZvPn4ygi405cOau1qHsjEnulYWPUTruD8erYDLdvBN6V+5h1GAAue4Mqq+Xj\/fOlfqq9IBe6ZI8Z+01m0RT5aF6L6bHWYz3fIbROVdVU5FKzmfnJE9T\/Pfid70dHO5Vh3F4ssEih3ZuxxIXoLJ9XTAZtHci9Z2n9x\/xmWMnI3puhDv6VLvXolcgzu81n2ZBBoUTZUaYVD5N0H2tC2ygb83hKqzRzKOr17mGVd3cx7ievRo4aTXxGPiLENrHd+ihvtiFK1KXjMg1C1VVfuh5GXFZsUfhyL+OFxXlnX7w88NMeWJKvbUoDA2fkc\/9aLxl8NQJrLP\/1i84JoY9vs\/PAZSHcby3e9IYNA4dXSNGlTzn1TZ+j\/Leh7TKNRFp5fd3oZwlpa\/6lYsy7LxmMRXg+Did+Wh2TOgHr596wf31iu8OgnbI70Y9jRbRIPmUmvcrnHvIed8rkHUUcCw8g\/KOt8scjGf32foNwGsj6lAZXzmj8QInvrrOKzx9Zq+A\/6LQllYDnefshJgoBrqXbYYZG3+dmm2HZ15mFUfGtnZNrOCuADf\/iB+PVTPgutUY+G8EG\/98ia1EPx4hGdqKJlX4ewwXEKBl9umaaMCy8B38\/vuJbr3\/OrJ553J0RwZT56hrgyM7svkv0KmnIz7HGOPMEoXukuNBFfr9eDV5JneZd0kL3V6bjeo4ZGuvVuecW8c6DEybk\/teHcRVROy+ZIeFv9lrudet5QsyDa\/e7ygSzlaUyx+u4XiVmOvxOb9Vf2jq+PfaXrEKLvE7zV9HmSzn5LHR7ipA7IuIty6Uv9TLBDsR1DGMmVj3VVthUXDlDK0F3YXzRjN1Ac6aWqAHcikKqNNp8+YNjowCz4Juua7zwkXql3oux4LCx\/IBTSPzeZeE7Cf96o7fMVxl34pQK9lIeD5kaG9gqiR1szqMRKr\/0kbwNraEZ0T00IpmtvryVCuxOM0P7oYLvmS8U2q0ZmNEgeZFcM6sSGiPEZMJVMVMmBniRlzhbN+pJx9br2QUyKJY1GvjbxWAu6KhGUyBLmPOCO6aL9pPr2cvwsfNzAoOS5urE7Qfrm7Ed+1cHQwoM2ZEj\/E6x7HqqrSjhbWP1comcIaeoKPYsTIbmsD4rPhjyWKylWu0Tku8czWzhXPJQpM3pUHdaZlY6zO+3ELr9bSNpTyIvrTNqYR44myyCo7Y7+Ns8gpirKy0ZD23NWP\/GdH8ylSryBtSwFU6o0W4wqo5VUkfMiIRITrDQPI0RJ0P0DeRce6vwKqG70aEGTEzOZc6eZU0tjz+lpmNfsc9F95sUNfP3zWSvHbcajCmI\/mM\/fUui5UBhrzmZEzASMc3e2WN+vmzRpkmH8de9u7o77qQMVHHoOmwINrVNH0WuQQfoPDpfsMOoeLJuM8c76htxYrlrfBQuvL0POx4p3FoztMO7HgoU93LUr72DUYYD7MCK1YkrcB3nfPjdWZODcir3LmGvQR8NBXweLJtmNdyxu+PXX+D4+h9\/Fbx1e1y+6\/VXjNQzcZBc7R1rYoVS4vvlPrXw9vhLBMyBnSSltJj1ge7kw+vt4PUxuIiUt7slVW8KlHeIKdV2annVmSPkVslIBou5Ywxx65OWLXjZsgAzEc+mle9EcxzK+M9kzyWr8CwmLsM3iiOJ8Djh7HaNirg13EayJLxVSFkEUecH3F8v4j+AtBRF6+JIkepKI1+T1tANvMcpTKhTvbDJxaMRZp\/Vk5wHjySn+SirYRROg6uW9fXkQ17ghZgo4wqfUYg6+Q6etd9rOfmMlo7G2GzWqTMh4h8xgu3o4gLEuMfybQKqbDmuiMok5mDOZDWHLxC3bq74IysZjBAfKYbVfHT8bHYuGf+ZnWrCh9jL67DNtinls3triPpCJcQr4jo\/RwLbRAwPJAveGL88hSCVmgfNDZyna+zjt+kTsA6zfCKfDPauqTqekU+fL0165xX+nn+Cj\/CMJuNZYksy\/rNEM9\/2B9eFldgc2e9+mUswRaYXpaLjHS5vDKPMYyqByMta6pQEZPRqX3sc7RduOOjAkNo4z12nluRWcwoyeI4NcB8u3ehuyUjKgItyBhqmsyDp2KMYuiwrKZ8qvONAEwtNQXAh5lVxCFFx+gZw\/ZelR2n9k4WQ0pxIcKovy2ni7hT1Mu3bVuF1llahMt5vUK8Ek+q1qhS\/DIwLcpi21HYuMxyxzYtR3+\/XD9uxAE97W7VD9fF1Dw\/rz7rl2CfKU5+a8UdBsZKrf+oLPiU3UCWf\/MTX92Mo4\/zTNQhVwG2rvqJx+Z369XysfUOBi9qelIyY9QOPVSOrKK+XXxbhWORW0WuNsuaaC4sshouXv+OZHtl4GPvDFTXr36MIkz0dYxbufxmyusqOppE5bzK5R6eev5vMZ9ywW3NCSMloov\/NJ5R9fu8KGd9cSp3o4nTrNb4F8+6i8XvfaYsbD3Fq2uRCWlq7mp70PI\/766nGlcndcDdiat2Uhyoco+rQs8yDGIwfgCRjoa+\/lU82gRq\/muVneEKSxlT50RNVVkdw17nm9o839j33U3RtkNR\/\/PetTXP2llg7OIqq7LjzfVM3NBs3TNsB\/+KHHKqf7saVLFpRaTBJ9mJz2+8Hsp9ac\/Zm311+NDhGoIsRp86gY4+R8+N1TdxFuikRccGQm5Oz1\/OyxyT4k9wUcVJax4cJt+rl9WmLAAzVI3LOuQbpsOhjduKI3kFt5IxwxVGjRrbCuvXIed+Z\/CpA3zqmII6Au\/y0iFapB\/DM0owd3NBT6hdVqrtex4SrwW1TbHqaOaUVtdqDe4J5Cf7GZ1X45xuscuvH4DznC9VL8+uOnPEZSr1RdX+Ycph5EV5efwgQ0YZsjsjV3TgPv2kvKoUzRa8iEtjdo0HfgfsLH5g0IoG7fytJzx39HU5mceiPqcOqtGiKdnUKQeoFbz\/hRUPsbxaY3zz9LnHbXEFpnmP4XtXTT\/DorMY7pq\/35G8B+XHWf9p++WJ27kuE4rlf6ox93KjPXTb1\/PB7aozUaboyqpcp7BdiL4jtHX9Ml8qfX5Gpc3YxLmYorLgtc4MhuurEsTU\/Z5fr5RuHm60YFsizD4yVUru9Vnjm64EVr1TbaIOq\/h1uQEPx6XHylTMlLF5YIb9zIpVBDNBlNCOZAd8cH7+onbJYLKW3798Rbym6zvWvMIkemUrgmpvNsHQYxBnAn4ml7W4pyJ1A31OL0NNqBfGVU6EjTkWFqC\/jhnnOmWiDnscNdk04gGJBZXp6K5axYzMeN5N5UgL4P7Oh9FerImjq7HpVCu32E8SQFJSMEbvDBi3Lh3eG0+MjeaDhy6RDA+lbfbrykp4lmQlddTrLDsrYtNmQ1yNTh3QqnIeGSTIbMRN9wR+zJOuCk5kz0s8Ewf\/Zt5wGJwEezIPcKTn5udhupFbn1TBfMA0Cx66zz8oMlsparB9bgxgZdWcnsk5uo638G\/9A74juMtoWs8owUcrxAb5fAjtu9BAzJxVo8I72HQkRDSz2BjmSjpf1Lfxybh5\/bvPrKY6rkLqv9Nq8ltWpw42674VpWNfT4lTP1Nq2ea1Yp0HdUQuCtexhvwCy8He6uFD2fZTGoMPWqj4tACKSt9bP4x95jmK3hG6Do6albcuntwFOC17jaJcL69a8apvmak5wX3JQxnMw87v6WPt+RKuq9sr87xXfrs\/085p79YJWx+03vIQeum9BMhTnmOnkj1ormbpiqPZbrTyV6OGkyISuhHXPjqSZbw1XlYrctGfacG8+zl6XstWh2XaqmRGPGTsr7Hcy2bRDMbLCH0eL4eC8UXtVGlh7Xnc6vWrprFDY\/WUpw5seA9T6K+qaBPrtpbuyl8debWOPK5exOyt5L\/q69jhMdRGPsMPMz+e42i4Q6cqQ6A9eiGOWYurtq0nhwjin+bT4PwmpIjj2XUeNRI8Vp5\/90L5Pcb72fa+Ns+bv0MPoDxex+BcVH6fFJAjelQZeWYn42kv6TGtMp4dO2zu6or28FktWw09652HLvl5BexwJtAIq\/ty5FW9+HIntACTULt\/HTbVgX7+ZYu\/bgP2dR01nKzE4E+ckj4xGaKWzNVTitXl7bWB4rmu\/VxV9djEl4pj9ac6ixNGr3933Dcfa9W5Ginc7bQMRZsjca5WZt5PLvPJKlPN1a6v7Yj6a4uV4io6d2lGyMsCVA0ePO2Fk+dw5g7URqtLtiAfN95jJ87wWaqN3QOYm8rkOnfHAgtxxfppMfl+HgSF7Gh3T69pt96LFun9PjNcZF2WVBB65fGbT3rkvegXOdbBczKdta5BlWNcIAl+fbw8Vr1KuLjdiE8tzn1YK2TEuPpX49LKMr9DE0w8P4fXKFft8xhwFZld70QCU5dbivJ53jrT3197rTWlXn0rU4+vjl\/KZ2OacmI0oPVXBWmF10f0mDxTHkk+iwr3EqaVdTP5h+aza6SXh8HHBVOKzm8MH6XF46By+7SCpo8VxWqhPU+HOlddFOfp70k8brx9pI05dK6qJ9dG\/PtTNPo8+bbKdJQi8NRYdYZxMmq+i+XGCUUu2s9rgWkeV\/Ody5cHQBNVa2WC6dv1gLU5xr6psG9NzRm2neM+GYeaJerXjpX\/8rgVlNUPDq4qqUUyaixpF0burIvPsXyVgPk6Oyp4NnWexPqb\/6lbp915j1YE4yayqlXw\/EHc4x07kUX3inyzJNLT3vucQDi\/NTL0t4n2Ocdu7l0h8VxdVsY0b7zVcz0W87xM4eZ+EeyxVB3ZLqQat7a5dQJtLtet0oQ6P6met\/pB3e0TDJx3ZB\/jcTq4aT5+Z6UuYYCcoT7BDWD3EKWi+Bi8DbZAqbkl20\/RlxdVrYLb1sWRLlqsyNpWtRpAP47LeYTfzCo1qltuD0MsmCz3wIpbXzKaPlI+OX\/AzFjfLq9tndgT0cVk\/ma8DUvP1bOrUjVYxjvaMv\/yAn\/ytaiUoaeHYzd9Coz8VM5VQ2O1XkTIRTxpuvcaE3vdVrOuKqBxZbZg8Q\/zDQvHZCIg3oLhk9PjPdlVFZXrOn4yQi0UaeLocHds6Zg5w4yDpPX4+ErWyrO8Kys+k97MmVgno2SIyrSH0\/rvvHy0OBE3aqTXNHQFaE\/FCLqcOLd+VXYQ1pgvdqdhfWyMpLOjDTJE3dY1jLlUc5W9WIfDW+3zRFwJ85sqGg0WjM1FSWYCHcX0ep6iNvIyB8rQOTcPy0kjsWsyqKLOgLHPj5Qou8BJFbCKYWR9jDgTo1dzqy51duN77qa9totAK62qY19O+Xo6OFFeTW++i+IQAeNwzL1Lg+j\/wX3nwD\/etQsjilR\/Oxf50dM5xVZzmQwmSC7l6ea1OZXXWXtlrq245rfjrKrR7+P9Vio1RN4vHz7CnKmNT2WiPkVfjuDzXd7Zz9nRtMc5e3bHdoUe9Q+Czg22ryG7c7n5MU6c9OY07FYxWV9bydsrm6bNxQRCzIqYTp1Bx++p4rI1R8SWQXGHn99VHDgh7jqLm\/mtTtCQxpt8v5qfyyvL0\/rve16T+H0aXR7JvOoFWTEV978eele5\/\/CJXQkM9zfp8fMPXw1kJLuHZFOf93EVl60gRqXXJHfdzXxYAA3G\/y9m6T3\/xtV5afyzInZ1RN2fPykax3+\/lqdRVDizEMfWiwwwZi6CmXVmuCsuwjtvZ3wV0r2t8tRz1aBeRyV7witD13bE0E50Wv\/9+GdxK5l0bo2Uj+5X10bgwe96GXkVxPNdNhMtaMFcQQmMetRdUdVtfQ6Anxw1re4rbpxFFXL8noU3n97CreRso6gbpb4Xt0ZwuCzGq1VvHaAbhWPoLT2fCpRwGhDf76bXijRQcdRFOIGMoYdE8uv4ze7hec82K8NHV0cq\/q8FwjFlmdLCGfMgIr9uAl7p9\/m2rTvgjTkAZjg\/mj5g43mvquVbFy4TiQBK9OJU9R4eG9kPch4SVbnhgdzCh81eZ9icH1+nC3d9OVq\/B+6Y2+ZLZNJO491ssGcwNYJbYZ\/Ne0rA3z7W6MFv2y+R0cFtR72cHs70EeDMVcFXGY670sDwVNTiMPlybctcxd95vr\/nngrz21VhI9eYEFU91\/DQyFFF8Ih6yu86crOmz3EldepLvDmf+mVm81f73TGQNY+5NRHVS6uiMK9uUm3yK2tV79GFJ6I3K9X40U8rIHwE2KjIudeOEF9R7Z17frN3\/MvruAWMfecgB86XbtV\/aHfFCcORo6CI3\/UGf5Unz429iMiL7CHLScEuVHUjuzNpgS+qc25s3Ay\/ohgXP2L5jaLt63BE6jEmcwEDlAbfbZUxqCXmXHUlmuWBuSjXRiKdGYjJ76xok6rRE9g7z7jmIJuXAc4Qr1ddzn+9DdvsMLiPOFcKD7SSp1v97eqaCBFN2ORVOW4gR1Mv0w6YathdXlB+UUdVHybovwwvhzTx9\/oOse8IuZpxmE9FrB7kzLwCSfWutYSMvkBX3eFEK9WzutwUjzfoT3cOzuW5WyU0q5vLfDUu8tcr76Fsxfa+UH1\/zLsD\/rzuXGjn0T1n31vb33iVq69eVQjzXvpywV6HWsz7emkf5Q6O253NIyiFbSRusYvVld4TeNmn\/qgimIQqbbabPXEA84GGDAlMuco+PIIh0Un++Hu6t9o2yuBI1mDNp7dgZOa97Fq3mEIf8wchfZWwW5\/vfviNfh0Y\/z0UgIhXrVbeMQOaziy7RipoYJXx0VsvEatTEJ3jVxPP2amK\/1QvLFANz0ynQuqJa\/+6dXJB1BnXoRNOtmKsX884Vn5jnMbq4zM9551x4Gb4LXGUq6iwseRQjOolWypRV859DL9+XnuMP7bBr\/HqMesR36vU2C\/7uUVs6iKv6O5Kkarp5hLUUjG\/nvJ+lZDjeKco2Mwc5XhHpGeM3HFBVRvrDSuMmPgaV53lV2+IMUgRGWJGBT0u+eJKBVL5YXCV41RJJckrcR7hmjDj30r11Sw19\/xEEcNeHCNMe+wc6tV5BS+j9J5X5yXOxaJ\/1AVt3cpU7MMWjJMve0G33eHePVumMo5X3M7ZPhwZFds7bT214jlVcjpbnzSdB01zYOg3vAYLllH0HChavXY5YfvR08RyBJEE\/8d94J7x59G7Dk+XbFX8+p8TUCvNW6uGPOlIqP2Ofvt1rNmqyiBQLv61MjQai+pePmGRmm6VgIJTZa+XTQTKAvmHguY7rqJ96m3kncWktdKIFB3V7baf8WSUMrAIBh05sljNP2qtR\/cONKh9WZL9PGriL4\/Do1Pl5bruYi7GfSV9z3L2Vg+JK0joaNDw5l7U3VqRdtHO+48cMHfGoa+ATRt1tLNefgjw+qAibP+2r7s+iP\/T4\/bavKk97RH\/XsVCHz5c21fJk4G925i1ymfVc1nQG1iZjFyWOC4H64xiz3LV0qu9jIN72LpCsvL2mvF2\/NGU5qP5ZzbuR1OTINZ6n3sYj4gMMrbjyjDnJRaLV8E4gtYX1f\/8\/2kqc5XhmIU6CCasNutn9wDqVVx6eFatKGnbLtc8t7z2g4chuMXSaoJzikV2\/swYbR+67F\/mMweD82Y3CDaSX42iHeZJ5c2ttQaoyjlEmJA6nmtt5f5g52eF+vz5Ufi+TFKE39rFGI0l5ZQd05yVD3Ap4AM8tMjGF\/iU50o7lrnC3QmD8cu0rZtfl7zxGl1rRla89RLMCHfJndNzPDvQvU7kNy536FodOERQDPLAtGsu0WKlmQ1jQD1ZLeguX2LpKpp2aUG1OD4QBeci9GFWhPhpbjv2a5HoVOvSduPa89C4zac806NATld6iQdOrUfKsHM9+jCc3bgWTwKjyf2clx5dn19rHybZWO4YHBM1Y+W3MpaXMRtzac5Qo+YKhLQ2iSo9JTDFf7DXGY7wWwes3367\/BD777\/fGYCrca2fr3r9zq+i5U7EjS8aECT9evddIxkYukelxzVw3RgVypiIbN5V8bJRLNBu3lGjH++cmhO0iqgSfVipY15N8RpWphylIMPtL9mt\/rjuZTS850b0MC5w\/329l2PiWY9NG5u28ZeLcExqDPi+excc5siUetF4FLPtazwz7S8aQNQSPH6AlchCU+b8PjzP2GFa67C5S\/+s25O7ZZ81SCL6O8Y8ks1m9BQBhMEYzWP\/Gkf1\/RnywJj4o7WMhapTeWUb2wQ59ujY8\/f3E6A5X88N93PnQTLDI+YU1haJYJDPM8+IyC8xOufPKLjKVJ7hPEYMUozs5V2+GsU1Wio4RzEadXL1WQyA53dPtaqTe+mtpDmUzabOAzgydlln9F099KxxSXebiq9ClIrqUdM30LQzu57KO3jnAtJHW2gkgqJi8HxCe\/mNpa9Gvmz\/d96JyGgTi\/nacEeOiRqRONaB1SsYqUfDibtvLzH6\/e37h6Pd5JzzyaGvOOZ1zLv3dVurfzXKuVc53CJ2fu+czTW2axFHtZzOS3wrgOt2yaZ6BvrShFfJbl6\/R3hNlutb\/fxu7+MourzmBHYSz63aeYcq\/rI\/PJYN8Cjzan9cIdUyLhl\/ncaKaY7xes3vKgf1ROM5gqgUnX3hpvxdLOmZrHJVHg7e+x4DH45v8vUyjIT6d7QhJXjlOHcVXn2sOv15LRZNxAvamiz1OPr51IQM9UfZjQJz8fiqbtUHPlALwS0eZJ97ndXpGMcYvt2lzOqtBuCA50MeX\/HYdq56fIut46TOGWn77bhC6tTIxFzWebXZmMBccM80Q7+BHk+VeyRKxTlifipHFKZbA4asO9\/FoDKmttGEVcHnPJOzst1UfdfWddwyE5\/2kGe2Sii+rPXNvdkfCn6HFpd1A\/lO\/oupVWmdRs5JDlv5ciTZSH\/0YJmsnhu3nIeO8CiIzHjHr\/MpXD2FT+CuTcxANRiDroXpJ+NqH\/gBap9cUA15RKdhrch+q8itYTlyWWU2rCOGcFB3KmmFk7X65bkUvRc6A9\/pWYpNI9M897+O2Dz++ugReZy4Fb\/ULQpVLJ0yfj0L0VbpXZGIVqu1s8UTVserYXOoMig1+nIPyY\/3iY3oIip8H48UqzqKStyYVtSwv+S1klPVV0PEQiQy36F8uSXHw0er3zwIBr1QoZ2+eHdXswE3jTPUho6HDOHhMuy4YXHbVU90Oj6TGqkz5E750+D6kp4V\/KH6xBe2r0LCHUR9fxV\/jH2RL3MRVzIqnh0POSRDQ99vV5wRbuX+2rTidW7kVjQSTf3940vqdJXAGFYHMsQv6Lt7mfOnFoqNSvDi5G4+PLO\/mjTvXdfc1MWgLPV3cXQ8FvRFKVCYKmH5t\/4vNUclMt4qAPpNJOAt+J86hzmL7ySpudhu287FH\/SPG5sw3KcXoMtDzNqeEtM+2Rxtb27gqG3D6Kw7g7fGg9c\/Om\/i2HHTE3kicyjFv+wawpgK9M7cnOVMdvfAvo7YmdVPNtZ71916bM93l5bEYK9NftBM\/prlqStKDHGC3ht150wuqKHfU\/f5ovv89Yxp2lPVLdPQCjVD1fPY+HGPglY1QyTITd8KstL4adVRidcKKiLrn6qTi+QMZBTp9QP+tJ3DAFiF1a5PKwoGt9pyhIqGgl7lrbrmL4nNzVpGpIK9+\/z7hKS9tp5xjP+aLXkGvW5dgf3p9Rigowep1p8KhhJ0fiK2rDf3+ite97TPwRHd4rlbEG33raXJMN\/5HALzrvIya+pBT7iKRp32qFrIO9Z4hrUGbGHL599FGW3LeTnez0uRj+chGPf2F8BlZ1NuLre0IFA8opq+fz\/RpZZif+vzrdbNCyw0nwnuqzP4vEc9BkLPjBwzVYX53DZ7JxJGg5W9sbRn4+Jqx3xNlZ8qfPKxSviTK+YeNw0ry5ZvptbI0+3x5pA9Dk1MqLhGcsoJXokreG0si14+M4PVydWl7snZzgfh4caynfGUmkwZHatN3qF1cJR\/vAfiVAg8XqyzuuYzCuetmh\/WP\/AIOTTXZFe396qvnaD8fOKMI1jLrW94a3NaLcFSzufq53mOZpWQ6uemo52fntpZLzqJb\/Xzy7VG4hi0AjcfbdZX5fXAF8dkDg2Z2q9yWQ3xxBinux655g69ae11IPv59pBkyfOqsrt1blWWEXEGY39wBdPAf6iJzAxLE1cVCMydg7JueIwo6+jyi75nCjqNKV8W3XtVc\/7GWC+fa+3ygvPKaIl02Yl\/aDNFOUYY\/jqcMU09BA4jY80dCPtSyLgOPld\/mv3p8VPTObThCA4LJ80RUDM5Sa8GS9Aujked3zqk42kc+5qmY4PpplJb9c1RjWXIExEhT2Lf+h6T\/36I8WX7kyVVL\/1DxfNKensYqL613PO4w9bZzVKHzEMeQ4\/o+zTJz0vnLF0FEeVd4edyXrUk67qmefzbkxe3qgO9+iiOZp71N4chp1jvCMqyq\/VmPz7VagA5Mmv3IYYX+TH4Q1NRUCLAGXojn9cBwZSqFbjlsbEW\/vbtuMki7WNjOBwzvz5e\/axWvJqA4+Tnjg6u7k8jRfwZ9zQUBfr4CyKmm+TML\/byuzv0errL\/Dc7pz5Dl+zx67OfxQ3nIDur32V0XEGsn74mAz2ufEwEpqddmeDNP1HimDA0lborVdAumKUuEhaDhaNqrNpkVVwMWnwc+ZDw2BMuwimkr2Rr797PqBmJzy7rIK95LZbIqOtZVnwgzIyB7GH67cWWNVLXCWhjkZV+W++dcPp6UCu87T\/WJ75UY+PHuY1JZ8zKoJ6wqzNUqXFVMdCHcstmcIo67WmWMhFWc3XXXSN37z\/f5wZxo34aE84iZ7ADgqfY3kXHmSxklHKQ8SfvD8flufTqbEEc+1fP046N1UP8+1UlDH6M3KihnFbj84hba1S3vteMVysbbfGj9jKi427Qxj8Z8uoBXmUs\/PzsSr9XR\/zMYzgYBJ+PYmb0834jwkGwzq7uPrEnYzmhAOhrzRXBHdE8bUc2oS3qei0v98fp83v9cTspdUSPBbdCa51sFUI8\/E5NXkzAo7mXx5wlryU4X\/j7lIvfiIwOx5iKCrmZ6FAnRksHEryeKp8qWbGw9TIH6nR4cGv3Cszh4+W5Muuzlbl1IdcDce0T1xPn9XSrD3cJlsq7dR60C38O+0UVdQwrwXFtdXxzcQCt3hGDOjcXKiPR8tXW\/\/ma6rV+Chq2JTb0afy2RijXF3BbNeDB4BJGzvPDb5m0NV5kleG3ekU3v37rWwvoAGcvw21LecI5vHHjaqchVZFgnWr\/ffWVgD\/6gaurviwPeMpq2OqeGG8cnZEaXVeWZz6ZlB+I6nDdGOq3PKL9bEV9XozrtUSpv3N9bubgI2mld8csR\/Dp9FyvsTkXxYkHuqCzAxWnEVP75ixtNEYv5yqGfot58BcKKUrUYDWLLLJauRxb2fC9jNDxNOL4iKe+zzV8Vb\/5ImvN09xHMfe8AiwyNDBHUES1UUH8zlqf0d7omd+Q4d5mIjkEXFUyAtcOV8XgBGyYaSNnBQ8LmcU0uF22kvyk3M6CHNYp9FX76i3\/sc5jz9U7nsH3PL5XFPxEXcZafqtcdD7i8LL22H9KZp6fS172YYcS5lTD+oXlvwwq78Nmi7vK9upN\/hchNTzLX1m0yv7xiuzek8XHVHAW7ND676xxGnv8N4q+48Y2+WScMlP3uVcLOgOwfKtyGcka0JuxTpmbigot3nUlRH1+kzMZG1kASWW4ebegi7+jGYxhNTI8kH9isHPnEtt6WwOHjc92NnBA1lxVbBHjNZHTHe\/eSb0Yg3Fgk3P9b5yr4q7GY0XGA9VqsPdm8VzM3GX+7udA71xeX8h\/7x5+IBp3s4gFjHBHp\/j7b\/fxqxKXbX7fubZTz9P70P+OhyUyTsaC+90eSdGwV3N21SYcC9qau9\/JrcZpxtzP1EesNxcglExNRaJIW6GsgipVq\/gUF3jE5atV1E+3IBhdMQVfNY2tLlnmy9dUq9VDRVLDehFVCzzf+loul+n1Z2B4DuGw2oVKYtXV3Xgqs2D9swj0Uz+5EikrmcM+Fd1qXJu6RLRcByaTw0HUp46MEaodKrAzZr4oAtinHsmvild+pB6qe3Bmz2sOlonfMNA0eNLW9leVxTFznCsN0kWcYbnT5nNf83RvhIwVbgsvIAXfPmA95w47OwJHOOXs+h1MMm5QyphxteDs4sUMysJD8uOk99TaKltt16Nelgogb+eA6UN+YSbbIZjGM6bHZa0l8oeTnwZ0NuaUOVwtiAgUANy\/n9TzqyTqm3U1Fb7X6KifeS1cHGgReY0k3DCNBZ26FdlLPvK5qvHWYjkX\/vy1NMmABVX+vGPteYC5AO7T2\/2GxJxXQ1nJFMWwDdmm5hm7Xo7fD5vk4\/u8yOYY5owucB4c76ruHgV9kE3R0AwwEh\/dM1Rac\/h1TuLDWnFkuuVqN\/Q97E79EvfOuRkY0lGLjrOzKBKKIlY+Ya3zrzCZjgLMixs4Yyy4GjQ6xHfJb5T+PiM\/WZ853rsObX6vijuCVWr3tcc2l8WLFpUhf1Nz1htzLn6nG8QsiOVIEUIcX\/0uYnJXsZRz9jpXrhRh7wEuaQ\/4JVSvPeTZ97F1HWGR0fVwx9Es0AYVA1LhJbKmB38ecDU6bvl1zT1y0k7vI\/ZB5++YYYvRkUl6JzuNDvXdvbf22XFyNVxanS52\/vQi+vg7LSyWwDhRBQf1rpwxx7JKfA6WDAypHNuZOrrW48ZN333nuP3AeWPGm2GVyRU9I9lqqFNPi7CyLC9q4T88G300PstyuTE2bCsO8wQHzktwTu\/FXOYEB2QWVDTzy+dmTBR67xdwJmOBzzcf8J+8toqLNHdXEuq6xYwv3Jg8g6Vfn1y7vASxp0pT4fRx5lR265ivq1I5GruictHJUItdIjlueBo79wMDBk9dp7DGSw54\/R5mdFcCf0KE0DpimIQy5D3bONKn9U6FDaXl5szdjGcEqT50jLPz\/GIKYrfXST\/WLKikZg5xRnRubZWSZs7bjO+3ssRTwTrPa5S\/8ghVPD4rVojteGHtZ65ijVaoC1JSBlq1cxznd9yyTvFaBLT2x4jo5LiHSNYdFW8y3drsrmVx3wmafbVi+jc9OFUo4FoLrGp1NLRAJstF9NrRqQ2tmOKVR8YU9LGIgpZy0I65V1H6aKFKPPvJ4C8P7KgQu1a5rjiPlEvqDn+\/JCnwv3hB2Vib8Bvz0q\/CIn2P7vRfl9hY8Jpn12S+rkB1l4n6H4x0KDQ6ajoxW0YZzXREVwNqVbuMFE5uVI6FhiZyxOOt1O0wL\/awdKpjq9O3o8MdJlrl2aXhujQ0xmNahc0+ukOVVpJaAbAQtUd1t\/8yGVUCvq2yRr3vL1rfYyMiRs3COBnXbza\/8fkZ7rY6BpkOqo3WvyOTtfXvarJVZn7mzTZKou5zOZZ7C6wWfjPzs41FL\/Olrm9kV8Wsf1G4HbnoODIjScTkFHqUkUBMonR3iRyS8SfVdWq81f4P\/1nVRoU58a\/5r6Ogos9fWuXrCT54nvzxt+5HtkRnquqMZT9B0BudOLljUkGi9ZiqqOsc51nZSKH+w4N9zQhVYuxltDFSBt1P4dvrT6nQDHSfa\/VWtzpllAzWkeHd3bASt6uy\/ZYhqzXgpw8YpdJboyYXnla1qjEzOLdyHdl4XB6Vm9MTh+YOlrBl5ts9Dbm6z36yXFjAEIzpW6u0xCPXBo9kTLCUapW\/wAreTC\/cV14Kl\/XlcW+PsLUyjOksMkPugVAMd4xyDJV1ecXPWk2HsqlsuVXFnYdDpeaaS3iNMqMWNzz6mIyqmpbiAnhWXSNLa7f82Ppt\/GhFHp7r4hWfMgVjWf9BhpVfJKDyp9JJFxkgFnIk\/CHrtD95+EUyj4E4dbgbiihWuaY1NM9q1DNSUZufjGVzArE4rtRh44RGmsE9N68BEhi79QB+bi3wWkzclhWY+unM6hLXZLUMsXOfVP1zJo3YxQdmSFZQ\/rQxtihzgkJmZrYXOWqyGvh\/d30p+Cfrx3PUJncUpdLAEfEM7HHOy24ZBpaBveRUcESFUpEZke8IVI1kYyo\/XdAXbb6MDdf03VmMsaPC7HdYd3hqOIWs4sAZYz\/3avcfShaKgGKB8XPH+B5tXx37MPthJpnkWzMg1E8k\/aJ2ERhaV1mdI5oHUpixuBZzzCUj3L2FGc\/qyfEOD4mDjFAUTHlQtj1jlRCB6dWHOWD61XGnT9QXfVZHtF7VVanmoYaOMV5nNFYYOxONt95iDdWhwPz03grpnoWqPvyimUUnoyQaY4TWsJ5KDpcV36qv\/XcUObd1sFknxzDfXCnqISeCo9yvR8YA4fDT1KVV+9Rg+IM9c2xGag0RyykXHiCR\/vhp3OubwZKnXz111WOXlx9D8qoYFbWobufCmBNf2kdDX2bXK5zXWG\/W8C\/9yIkyEMKnQmxFsAjKJNSUlda8N0p7nDi0ml4cUZ6eJyvKceaSY3e3pHeurdKaVfk4tj2ofXqNZGBRmbLlRLKUOzefO2i9\/v51B2soAZm3uri\/QAnaPXz8mSNxZh7Wh8zF1GGHsXNj9NqcZ8S\/wMZWPedZxXpNMgV7yvZmn5aH2LRYnnqfGrj6UImZ0bhg3CyDUx5zvnPgoML2QaIqodOhMhalMc7aCfa6N0ruQMbxBOfcWqAKNIwT1TfL5zDFOL6GLzACmomdvoD8o+Fy+N+6ppZQUJBueze\/xT9xEIE4YM5sjZUxmj38\/niJHeZ2zvbFN5odXTNqXYs4WjQ6jXnz3wqam0I5YWiUBp4kF5zN+IxVYdS7\/6uk63k+SL0SIedP8DNkCnZKr7yvmHsL+JlX52r0qPBuc\/sydk7D7Kdd30FETuEQM6yz1muYHRlslV7eJoo+Q4XCmCCO1hnRVGyz4LjhjnDNj3x84DjhRf21SqT\/6\/c1LcIpbC5jUdjxsVZX080rsWQeaJZ4tBJWK3MHjkhVHQ9RrXCgnq9VlsbN8HFtlBvktOetafKblZX2VQoe5S\/wRYaoW\/V80ve8gvdzdj6vcqi54VYH9HI0zLUvIjkG\/B1RjvxofaPKqPnOnl3OzJzk4fykcok47AYj3ZpBfzQ2eKqOwi+y5HE5gjXedfB59NVjNbMeF6b3NSeYg17R6VZv\/g2\/jI+i+WCjPMNZmYsasp21PMYOC56p4TOzIMuVM9GRN2VjYiIqdXDkAK\/5HitzLbrzmOSWI4i6+mxeqUu+hqTNv\/v+VTr6RznQxOPgxBmWQVFwPKwYoL1j89VGh5GTcmCj8l4RGbZRqGFBDaZKrNfDyMPU77m8+8yVlq5FjqeiqBfyPBSTN2qG\/C0WXzcidlUW6sBRDHFVrL1ffBq7KgGcrRgrBSa0ThyTI1TbwxuM5\/QajQKHW7OhLvsiP6wDth4JUp4LQhnbcvHHuOBkc\/n7fasJniWLVonVyujnSorFImTxbT+LMhpXlgJBOMDxwvkasjQdCJY4ck6I+ZA72nkMXZ+VAHg2CicjHqtwB47s5fGv\/61uWUGo7qyn+4715cnxr1KY0+7QxDp8kelMdcuwxamd8cq+A3c132yef1F\/\/vD+kEt24T5U7DgQLiImugSr5jHbzlB19BX3PChl\/L3L6qsatNE6Uq\/J1uP6p0UyitWskuZneiMP+oPnEnALQ8tVvTVAb4+XGhUwqOYae9Bwbo6z7J24+d3PaCJXfG74OR7QwztRUVrPFGVy4sNneRlOdP08rR4LUwmMMSHrJyzUtzJOZgnPg2P13XERETCCu0wFtl7mNr5Y+KoFMQe97kmUToL2oLEEQ77mWt\/7afDI6mcrhDamg+rRY6fn\/XiFfbybsbcdWugMfxNL4yys3CGDaXFPw+XGhAOgFRQILOChEpbqN7Xtu4neXSDKPT0m0+5nkhYb7boQ+rU6tMis7CYtys1slAOly1+yjMqh2gTpuIrpy9NKcneOg3rotQHjJX7eJ0ZzXSivRPJ6JtlPHA\/h600\/9eIgdobjRt\/amVI2X9aULKBG5Cdrlhztvik4RE9RAfaf8VDEdmP8eARcifoxnRl7yFp4eKK37CRncDKqNA2RfdV7Ys9ff6v1npGvz\/ftfkarcR0N90AzUypMx1SsvQodnj\/Xahd7GSp3xqQ+uybdOhl1zY46jEBUqD96tA7rBBphMIg7m36MHc43iOz+XHE3Xr+\/uT5H71Gie7OgCi7moOrLr63hVQGs++EgOhtnvd2TqckugOjsqOoip991BpwPqosPWAicthZAg3GCAWBJs90d\/WmjHvl8tErVOb9VLWMg4jiHcfP6G3cVGR\/vBkPuzI51WH1ooaIXASqFFsC4irI84omeB0VDdg1ast\/8ca6OT6dMVNRrXs3JBInteqUiypfJKXVs\/uQrs3F+L3FvFlp38AwYlUFs1ZqfpzS32IZpldpg5BibGLvYzCMMBdQxTPMQ8R7raBZlcGKm8Cmgg6\/krLVbBcXbymugi3oHQ61OZz2mRSzV75x9awGUe6xOre71EJkezkikXv5\/PfDuj+UNtDdXv6MvbvVGy1zVr7MZxrwrOnzHON7xqkNr19rHoTjex5Xo3kf9E4MZhLWIb5gzme\/E2Q\/tzyMENWr1HMUcXNE53dTbYwzizafBXVGBRFiLKi1myDHfV2O4YdTBHFjX8gY8DBrlfudyx5I3eED1MqYgRiZCR6glRjacPh4h3lfzaGyzM61BabfWmtqBk\/Fe8\/4QJ477CBXxO07+wkCpCUWyyvFQtd3IY0MYgQg3\/1sd3UrJd8eMcKttxPodUwO1u3AlD03DsDS8olmMRxYyU5nrY95p4hSvKMUhlyGJdL83KmrAMgvS8HM6tFbbnzvKyIDOHTUjU2JDXqE\/1b8t43fqOGF+v4hhA4OS1CvCl+5MoSJgiHHKrLdPgzpaecM9Z4S7OyJd11OvYQMNlOk\/7PfZbYN\/YCtzv5VHIorHmCNZasv7zIuqa23OP7D\/cvnN\/lpi1jVJs4VnIZewa2Pfc2hTJc55qJm1SjTUK1hMFvLeRHcnZ+bEa8t\/HW3eqXq139msxuUEx6E+OLJVR7mHvBA9P8OWKganrhdRTUceVI7Vd6x1C0eoHMy5WX5umtW4Won\/zfPedVgkiHoi7XEiUcbFFVSL5wd+x85jER04dBXxdlFlLFVE3BCz6T4MmBzj3+odemTxNm\/y0Hl+5LTp8mukj9MOsd\/qkFOJv9gGGV8OJ7anX+DkNFvmVEPH6EWeo9IBqAxw8xzFmxcqriasyuviWhV4X9xIj+P4KfSqpa5gfqI807x\/HyVLY8euJ4w8\/CZ\/nA9BkzsfXunuPq5ZoX5xPW1Nfdmr\/vAvuvuLGh4lf3UmQ1w1m7rSV55Ofl3H8SyVOEZ8+YB\/jSG8cRhkhved5x6HvF3R8saYuLMqe4L4p3Rzd8VDUUvfsPocL\/LQa6DIl0hvRvpMI4FniZepOqS3vS9+jFHmns6QhzLHWKsx7ihe\/4vI6oyjHwdSU3Dyh8vHquDrcdB0d9ryZpGYWBVPtTqCoaCaQCt443AXrVA\/l+nHG7BYPRnI4J7+MufCWe6wnedW0IZWyFyu6wQcdJmXzHDOLwbN53ZvyrQb\/xyYFVHMFBGd3tj8q7RW+9AeLe+XV75Yc7cSkGWKrvlQMo8mdmurrMh4D10qCVjmaHUEraGQmG3aHNc3unBg5uP1TmbinrUH0MOXlTU\/8XQWJqHMPhgF2fNUxO3YEPak9nruTCJozKSyp8W6bccUCyIepVDrd84H8eewwYLtbBzjz8W2LhGmlNXSj4qgk3GkHnl+lPigvIwFFKyOMtOOHD\/IV7O6+XMGR\/scmR2a9c2PX65+vgpj37a7PE9fLgNBDCsA3SRjZW07XVIXOk7jyTjpE0Y3CihTKopHcxx3GcVRUTP3WX285kfdq2A5Eq\/F3EEd\/zz7GDa+bDgSI9uf2MptTH8eC9X5ajAs17m30s7RnRIZka92WIsl9\/kBfktmF4vyzPhmmp1AyPatSpAH6lVrro5LTbR+ic4iNRyJ\/NZX2lxVjznGPeOg5oXVcFtk7TNVtpoZ99c\/X2ZW\/e0FHJebp5CyjRUNs4Ln9NZ39RZyuBA5lNjB9\/PH8NSur3x4bYQ4O4KXg1uqVQhGCSsTh8u+qmRt4YSmg50rlSDvWZly3emtKHwrg6v0OTKfqQ8qY\/ddM8W\/DAcjo4LU0XR\/6x5mLN7m0Jq3r+Ls8eHuMGvFvApOBljkTx38G5SCIb2PuSeey9\/zr6761APGU1zNR3z98DEIc333vxjC7XmfQApO8JXPgVmJ5Kbc2uwVxSAQFD71zJTobfUMJqborbBynHcIUVHtlX6SGWr2kNrV9kDG7\/ROZvi+8\/CX7eci23ZPpecQYZxVeZEI9z8FQf+nCMczHFMcNYHzSl21rMKXdc6\/mliVFJ1dFzTucA9V8NxT++5ji8dq9a2VUIqH5vlQ8GFLfEqNM5CHrTKVi\/WWGuPMXIWB3jHHXANNwtmyFDkDxeYumQBZHRXxWY2ZHStbTBLXN4\/lah5RpwjKuu\/Ivs3veHYe7+oAVlbjuFNA6wU+p37QfeaoqyEOHMVvMn0RP6WBa\/bXemtm5nmGrvqRtlAGArayJWxVdu3cUzNo4bi4Y4SvHDXsIYfAo37f57C5Uly7RlTUgr5Tk\/kjYtApw4\/UfHHeiiIKfXb\/wfL+k1lR3u2HZibTP9ccjl\/H9\/oEb+Oh9tJRwNW0KetY5a9qe8RjrMKN7Ol3zUxbHCPAac5T12mErTMQdFUHIsiXfQ4nRa\/oYzZ\/OZ2Kt06JanP\/XC+1Vbnt4\/SWMdO2utL5VEN6bmsgoCWbXKcAZg471sSuJSybH9Mt8sOTc5OTO4qMaI5hOeEvqvN2G7KH2gKRpdWoW3uQHzLmTPYXXml1Zw65DoAZkw\/O2xw71\/Fp+03MMrdcI1JG3YrN9txHYRS4syIjUXlXK8ASPXs1yvnUlFmfQiRr2zO4Pt17GI\/C\/nwvVwzRne9YvzV9e2F\/VPIcV9kHXekMipY5q6czHGP1tuqnVKLpogjGj2eImAj+uhViRgxQr3mD37h7V0lYA4btaiX37SbK497V8sVSlL6oukZqld1V\/fmct8Zt9c1nk\/xQ6FV0U1doc++fBvg4nVYTrE+WUFMQJeuYtWapeIP7phl8YsLQbSSIJK97N85mFI3v3+U3FGJ4xBf1MbTtqQEc8I5rJmTIl3UmyWqlOCVasML0n2i1Dxh7Gp6xwPot1I5\/DEz1OeuGkTEuq2QEjnoqukqx2qxIxgbDHcOLBH2SPrt4C6aeQ4NzOiJ8Uup76qA6g0Eipq4\/Flml0eYy\/HTauPEcbSQa8La+5jRhES5HwSqgQ51pee3KF3RCxnKMxMcMWlc8gkbKZBvNyyu6IGOnzmCiRWz1duuDZXcreiv1qjY7ysdk4P9hdMh\/mlF8wVJ7X+lW28XGkAd7yPbMnXlRUVzTMhbqawxoxKl7UghWisUxJa4vCsM9+rifFZ\/as\/si7BOa8g4mnmvYan03p0SqI+HdBdXp3VToOcD2wbXui62o6lRwmXG0vFIybI8gmI2rW5gDbjztZjQoBdFnmJ+voWljfE+ciukD4GYqx+\/nD2C39\/j83e6RgGY8JsrIwRa9HBJkSNWJmmDc1PVb9RUqsgaqA0vz01ULE5pX61H8Tkxom\/b5Xe8l3n3U8R5\/g1V6e33D96uS8uk0641tvAhvELNmclxILPoqbWviMJ0jeKXPiNxYrWUVI2d5l9zWMO\/HIAt63aem9HP5lWWoJDgQFidfxIpnnDszYFfkIkqEiK\/u8CJK++IWtYIxm0HXCOXhxL+Pdxzo1xxYnQwqDfp3RDFDO\/CYGtrst277r8ywcVC9OQPuabzeTp6t0W4x5mwbjaFcFijw6nMYMfU7hhhbzec2nsZbv9lrf3puJz8HhGrCb8zZ6prLmK6nx91bb1cbor2\/2VB+XSG+KMQxdLcXzzIvVb8zNS+X8Rw46tlxYbnbbzEC45FJkHtM02qYj00b3B\/Du0MTTz8TpJ859fruXDsKP9utGexY2sdqmbHuXSb4rffqIwgCsZ6R2FJn8xrNPggsb78sy2vN8hiw+Z8HIx9UFuN6PmTrSXPWair1qYaMSOYmSl+3bm0zLpBEP3Ny1OUUc3iqn6BKlwfrynom3MEWVbxRFxidIfVVVUQzW4Z6CRkDzpw\/ae3DykNIowvP2s\/c1fZDVj9mcMz8a4W55tWrjKW4hIWclbpPDzgouf+rG2PJxmFj2JGw95ip7R9Todu0TD45FoYNfxAdWh2TTdNyhrrFeGUhfncGjtuRq9\/ph91kju+40ys1QeLyzLI7BBOjooceQSsxUyuoumPC6wNef\/6IiJZl3hhWz46KvMPh8vyUeI\/wHCOon67LejshqFFZHbfj6yiLcVEOt8M9595kZ5088di\/xUfMMkauvTncMnZcyHkaVlpqLNniEWdLtjjTFbDevVe\/M+KtT8an8y3zMWBpXoFcFGEoWXsnX4yNzIhAGE+eMvJ9Ho17a32zbFvwMZVyjEOOhp3mgVUdaky79D39X32To50LZw3b4lueE\/HTws7LamSm1I8M09666m29PgUar64uaMHKhyHsebzXkaOUzHlx7uOMorPvPHiOyqlulHnAnSOhPlBlY4MvIT7LOvzZ69ToHWWk11Vn4oXrioL+Z9xeHp9SBQ2NAHlUjazG5WRK7bjoWUZqzQVZ79p95gxT5vHltnN4SBivyDBW1tC48TEXHqMiTm3Al7zTiLU6wXjjDbf8HihywHejTyZoryOcpmSARuZahDlEKufbHrHjb2tKDD712DtJwC6fmwvb43vXYlpqFnevsD6fWfDOm1P0jLDozpmdj4+AwqKlVZM57HO\/n6peVTB\/2Pw+S0hdA83HvWrCxa3BfvGkTq00VhGtmGbdKuJ1fJ4zhsevrfTH83KkFac34DqAe6\/cQwF+7cXjw1INHgjhk5V7l8ZlstnbZ6ryOmIrCsLQbbXGQVergv1JeFCzi8ZUSXK07GatWBW0S0SGvz9MnPa5hpOIyiPGOn\/zaZfy08WYx4zUaYyvIH9mELdfhIHDlGtKQqXgWotXI9NPPJfrWhHgKOlPRROVibxalnduyYjqEExBrBvB7XzqCI\/1r98pa3nLOf91kEQteFsWP45MdhKtcgJ8Bwqdu2NToX32mIiz5NDT8n\/bUWc5dp7rE2EynitRbIPafG5g3gl+4eoWPq+Q+0aenl+N8sm6X\/dBi8SNMciq8ljmk+rSccB3p6hyMW2nd551rIzK43UB5whgP3nI58XSMapItvevp6BX56BbkuNxq4fEDA8GGD63A4sXIkI8S8m76sOJ3zFyo9qHB7NW4TSzrv+xTtv\/W0HgoVRKFCEjEVWwJEwDHmD6+oZca8hGIl7MqilrbTZ7p2bQlFcYfufTO4XYSpsGuaKBtcbKV1eNfnttlVTR+0j5DedS1tsM8hyPcQ\/\/fC8bVsewn29HQO+V0eT53xAyAV\/Q7Pn57J62kDN\/B6CFtDjnxmqQiPzqokfWS25d0Dj7CjvvxK0xSGjTZuY1H7f5gwDmjA4nEyAXK0v00sohHVS3HjpmlGV3yMnZ7M82OFyUWePUcd\/V9LrMhp3PtWN+Q8I8SiFgxsgSke5IWZetZV5voCa4TrX3ICcXxqk\/P697giV2ReqPsEG92LN4ZG9mv3XQmVXmw5pORjhcMbOyRrpuDw3A7\/u753JZThdg7T9FgxubsXvvxmet0jiAcHrSwfDYqWm5o7GoM3iOVvWC76k\/Jq8D4OeuWZtPmAbBOUupa4n6gaKnCexsp4dzcp96HCMlPoEnWZcXqMQip69Ik7HebzaZa3WNhTv\/VdwQBs6omZyVv+uH+Jy+HlWP1M\/kZFWU44OdjGef0zHc5jhqjDb7OZ4i6Dfkua32kDN\/\/WUXr1WayPAuoVsry3f5+Tt+LlEvozJnfnC4umYbcgSfA4gSmPPEhDs9nhKiUOcZQIe8B3vfXV3Eje7oiyyRfoo+NEwPrN2+UoF73EgSARyxOsrc9H66HHvTF6AzRGyc1Lz7KJoql1s79HtRyN8XPd22UWEcHmHP8Rl4z9O5Rr5z4DfU+Lzn12GI5IuCGdGLybu0oWa+qmntkE1dRDmoX0aP3tMC99O+aDVq43baZyYiw1Zk2y\/uVGudpYjN47g2IwGqbfkbf\/WdexiMC5eXcwxkKndpsVXdHT5vqjQ3Ac5zbFybrOeZ9OI7te55ooWozF38OMX3jpkzEFucPS7KX1Rv77DQeaYV76lMZpjfF034Nz3tdHI7Rbq5aWZxyhGqXnJOphk3bRFxdEQM4KRErpnN36LB+BFxUUvub2VvPYvo2zE9zOY3Y2u\/1oHjuyhMUVaFtOsVPbryi4tj+dvOcxitdp0+cZU7rEXVczzXDMkXRVF1GLa62IpKdF\/uITZq6FeXaEG0\/y+atbqUMxzlcbk9iiaZ2\/UJXAx3uGudn1b8f\/7Dp7bfagamAzNyIVjkfFtxDK5KOeZWVzczVxuXXZAvhqzyIbLIJA8Zg+tQ6s8VkyzjsyLbyskseGcC3O55fzNxvO4uzmVTF8M8\/XcsTNXIl1QQz\/KesW89kpVjwUOMkTBvsurjmK0SOV\/+EjGiTMYUj67u5Onje2NL\/ah8h1Bn5V1VVC9XrGTB2ZqTqyZwI9O6aiPDRMj3lqjAxu3LeH2Nna\/VKT0xv4Djq5sosc+jJ6LSLIB4smv081P1OdWHOeX1rlzq43ZNVtYUcdFdFYhIovpiW\/TCw\/Ilz8m6Vyni0WdlbWpB\/kxUVWLc15fDOY5H9Cnq6P9kc+dvRagz5AWe5xg91Jf3ZMvtAD7udA3+V2NPs+VKOY5eVam\/dW2tgXZ6Z35wqDF63n6uxNmHNL\/3QJtzqSfvPt2vGT7TyZVw185dqSWAX\/Rk9ZIVTsz373tXn3svjV7ixQs3kyOzb\/7LWFcEW+mxg9L09JetkYwzY9c7WK9EVRUjlxcHUOTnOhMtxs5ZX89w+55qjojUw3G+4+E3q85Ip90gEc1wXI6bCYpOq40xX0z1Udy\/mj7Pq4g669Q5Ug+GEIz6GOeoW9ebdWFtGePWxidG1hoZSEvuwXknAkfIXbf\/6jpzDkO8ull220v4iz2E7jUVSN27YB8hj\/FCDyvAlF4fW2u5SqSryd0VuftXPabr0CCMZWT3R3j9w32jW18GQvwX58LalSsCWQl39OwM\/f7qvabYsejz3NmsnwXUvRda4Grbd88zdjFcJf8CyblF\/1a0XefSX9BJW5s3+\/+JhT2zNmct3Mhl1byVdGdZ753ZZ62ZfvjnDP2U3rbRDGB629Kf\/wJzP\/03gcIzZIWOAuW3JD0tm5u55mQj\/xbdreSDCGLZdvOKyY8XfsdwZ+s8HgnrWFuGuoCcE2T0ysbGMODhU+fyG7zxsOF+yPwrY+sEwmF7naXM1djoZMpzYIYYPpZBu\/uV58dIVG\/XKGNhkJ69hmOg1AxnOELr7jRtFbCrrRgVePXdacUAtfzYkLhTN3yGX6Pb144yF\/BbBt\/gH19tjcJxrGrVmv7s8XLquwNZ88E94EFB8NB76PUTEb7rS31Kjs2Y5LlmtSvLBPR5iq2ap\/rP\/edv7synq5aJmoVx3X2qyI7vmvOp4PSfnezjx8pn0ejY4EH7gr3AzK3\/Ts\/PmW6dVfYJvrh+110xWm+UYTpKps83AhvFEN+KBWOLMo90cLjOW5eoaWkfbN9IVZHvmvoiTkvq6tcVsqt1j\/yrnTgIHVuyuSsOUvKLJfWI\/p37us\/+Ao7ETTeDMvM4PNN7yvbL2qHC0\/\/5mFPJw6wKH9dBlVm\/qDpH8qV3suXpVqOsEztPCEJVVXLBuGn1PL66zKOuBDzyi2haYE1wvu67oiJW909XKxrRdlpxPq5kiPG0Ns\/nWJjhV0Ddcd3uBtiHwfnNTJCD7xj1Uc7ePTx3k\/66M93tF+17xb0Z2Kpu0Vu9bF9BpJTdtubM2HgN5PdbGakyXT18LmYsgvKVD4uahGOKlRlRNehefwYev77ImIici4EzzDP5WLRa+VZuN9pTr7\/BwMp5ar7n54XRMxSyLawvvaljpDrIq\/2KZ6tQzrLeejzGpqfotPp7\/\/qNu9GobJWd+6\/YgavRlKTmo8N7vQte3NUO6WsR7xXHHShoGVf16tcpcJU1SLRW8koUnoks\/3d3AT2G2a966hpgTCOK1\/md93ZGrD7cSh1KOni4eOsI9lhgp9dLxwBTP7WmncYcJuvRtLvex0nMwFoW8Xgx3Eux1XUPv0XK+9vY4WGpj3xqplnKI76ST2xfFKuuZBacM0521RnpL2eg4Z1FryAARRJJxLzci1K\/+8w5rnMyah4MJXN0AsZ3HGu04RYKRNYMVh35GGg8zxGHKF0+ebEP4vGi35nqur61k5bY823mxzxWEhzKo\/\/qjjN3Z3acwbvDVux17pktFd9Xv+Ala0F9U32G0Vd95AAcJF555Xm5\/T2CmqWK5w2otjlCz+LcOo3OAgZo1X8Udq+1t6LqUHv0nH0nf6qQx8HKD3\/lMa4RoWLNO5gg8nhedZsdFNa1GTl7KWGZ6i\/ff8\/rslXeHdW+yIsYpmV77syfZoFwfF2Y9WGxsyfvL8ptMuuprl\/roGG+3z+y0pY+r3C23b3y1zws5\/A0y4O2shwVqMXc+m+bJU2ZppGYeo25f8ckhs328OTRYCax9CoR5rXiH+7NNzzy4tfzOtOuGs8EoRrtrFc0pr3xR3s7p0nf8oiuZAgnL1URmDm9se+bR4uEIHoOChawNfL735k5Dm2rqF150POSlbImatq8\/7A7LMCCL8NIcDUMJylO0EE4ZBHZ\/cLAOhEFyzCL6IYjjQCYrK\/dVX5qB1nu17xqznMURX\/b3rWU4xu4Gx7ynw6A0Yw1G7WgGyYR2aLCVwJl2M4UhVivzMMahXPlPNxSPdCUm1WfOY6WEKOCvdmW2eRnotR5lll4HYEeeGcg\/R87idNIA+32iESkx1UHxn\/N\/ep82NrMdh8GGHQjQLNlAuL48YylbOOYlnPar7amQCoFMdxnieCyq6pxQCo38Uxf885FZ+eCr1y2LL3PPa6nnonff\/4PK9p6od8DXEpExMahmcyiW67+tcualzxsdmQ8TTRbZfi50b6TTGdTUsfN4gDF3LmQtOlrfUSWmWZqHW2x6UrVZ0FQHficFYjgSJQMB+HPxAvMcORhVqekCrSvtkLukjEwCvN+XivZfgaeN3kYN\/fMVvgQluv38acVnDw\/rsIN2\/bhutGHxa5+GnKQYWWBEF9LMBvghby18fdFBTK+YvmTR5APd\/EcqCAO5cNICj669Vlir86hM0S\/sfg1U6+A5w8GphjHQ+oxMd0rYFGLXyvdre3ZfV20Xryri+CsFBtJ4b+sBBITItwJUlw9iqjjjldBY3nWCDSCFowbprF\/M9O2Vx4J7ypSxdDHx5\/ti3gQE9LA+Ds4\/LtLDFaZbZ266r0W5hjICvdoJV9ydmYbTvaa2sd18FlzJLuWIuca8wOHJVdS0SgB6Kg2tedBlki1zlvv5SqVDKwX\/1t7dA+4SsBMS4dxaUXLdtnT+CoLZPbqrnrfz7t71yIzavW0WNfX0s0jQ+Hzyukv+7s9CNw3hhlXHvDOEHNYxTjzpBpyfP3B73GucckuHDv27NAnDMymV3n21QfYvpRT\/I0Llt3GrA4jP93F55WBVktadf+1xslXCvD+5drmgf94rN2mjecq5zDXGmhPC0QiY+S9qrQ6Efr9vtw0b3WXfeUgo95rGLS0GgNEe9d\/nMNGm3FthL7TfyRYJWzrSWQhUGZudveZZ41EmaSeKiNg\/3l3FyDPvGJRb5WxEvWiAKJN06Ia7k923+scuvK0s4GULVIo1StUgv0BvqirzqvjkbF71LxdEgKPtuIs2HJBqwf2jCY+PkGFyAr4TxPhhPTEmWjo0GXhJELJEZzQo3bvicWCVlEGtPgcE2eqFu7Alql+fXqnSXTk1kauj6YKT0mobxmEvKJDQEV93pVbPN9YEGe9MNEFHJTQ8Zp8oyNxNh5lb6xciAtz\/x7x0kkxTLue+0+\/jWawtzyiHuO8MXH1grpgtuXnReAxQQOyI0FFj8u8oYe4ARR9Pqpj5hm9SnOLmNetMjbQdIoOAocxkTMVl9GMiK4MTru4Ei90694jSuWsXIuP7wxYx8ImrVXcIPzROh4XFdmgG\/2Ww+Cm31+82p8CLA9+uKg97Ki2PsmBN1HWslf+8jh7GLOWKcIO8OZeYd31xPRftOGdkrfqV3\/aQ19fzGu05bzMKByk09kMx0tjnD7f2Tb9\/S37A4yY2P2qrxHhed89Cj8TPVRlxqd1X4eQtqtP\/EcsjGcztl3FHgWE5mirQHu1Em+h+xZ9YFoN6xFVfda8D234vtazFZAZg8U6ufeV82lx2B5bwpq2aT0Vjej+znCM4JhRg1jch6OAdfZKZvsHjMcp1LgrgmOMZquRWE1yZteUjoNYw9Y6ZKsCfzIX3P6qUXBvMtgccWbDsiqG4fnXsc+NqGDydp\/p2ObxFgk4A1UCFefnicpiBGNv9PUyjBGuk8VWb4fRJOjV7MObTqRs1jGpAqDmnCifOcUoicZxszN2TckxjN9WOIsjvT5LJDMDtFleLBqPmUv69Gp0qCojVW5iTGBx\/fWM5YN9A5CBT2OERhdlAREil3E4roSw+rYvxtj2X1ugmmpj1igLfFS9YIeg+KV\/elVR1D7ig265foDNVst9nDFkxlSEvp5zrTT6IAPmZtneCIZHmemwv0wwxpyPGr2ZbSXSsfRL3invDp3FaFFL6Diy0aMShihboH6myZcndyO2PsKl8RoTEaQtrpxkxozGu0X4flMj4ZlvRL9Os7fsa5bZgWa+YuX8GIjMl5\/O4vuF5bm0wvy48oxskgu82+2CyYZUoTFhX5w2uJ7KEXt+\/t5u6q99etRVMksf2a5+2yEqy9TveK5zpg9xg9NJvXo3yPx2rvDOLiMMe9OVr9aU49kfdwfbGmJGOcfryMQZ0TGrVyXMCByXM5HJ\/vZc6LweGlKP2hp0lCIQH9QIVSn5j8jKAtQ2VWhPYpha8n4cQ0N6qVr077UIK6W388rUn1+O3\/ktprQCqutrUDhGQH3Lx2adTMre4AUnRNn5TPP8VFh1rFt8WUkH9D5eK2ui\/nBpmWx693WLdZTxL3U+4Seu8CITcCBYuSx\/XQQr9Tq0ctHYcDpELuHulDg5Xnyzz5b5zveFiMf2ZUmZodkuk4Fd3I17UY5FbUVfQJA5o\/pBSs69ej\/u0SnJCfiqMelQTCyJtc5haj1vXXGvA47u5Q93mNPWdyd+uChOcAVFDLhmfdmdGsCexPY\/xXkuKQrJSEF4g9NHPnsd+72z6S5pdlXAaEepK3QgDROS1\/77l6uF6mhd\/LSwutMx+J7A\/q4Wk4fshHeOx\/9DJfUqd54OZjZwKnW9a+B\/rfTVSDCZCgJbYxbYgeyELaYCQ3AO6jsdf51ubfDuhLJ5LrvZ72zF9hqIylciPF3uqoJ3cRZip4rpz3cmyRRy3qv3ZovzZDA5UjbF39WpFrp4uuAjeKKq99jYNGyge8X944k6i9aTioBPtnddDPFmHPz+PFgfg6s86hzRxjPGTIZhpmOM8WFns\/ngeZ4\/lvcWldW+XL5VQfmJSiHjujHbUUXTy70XDR4NZv5+2pp\/g5coUF9XabKCL1ZZ21brghH1O39lnIqUec+0g4FbBip1Za3u2iaJYsY13kPPOMDKdF7oynLelktmiwExWy22qouN9or6yDRkBIVrdkMWjaXqDU+ewp2HunUCVaGDRxvOc7X+plxkChYvI9HXHAD53z4hbPQ7mTsIMkeql+gemk9PZI7jez5V8danRT7uiQwPOcUbf328i\/WJOjknKjTzpAr+zvg0kSjrdpy1EVR5dgTVPJc8j9nc8CozOogiNM9FDTlQd8arVYTMb3z1nEuiCGfku\/cHmcohur9ZeVUSY8eXwcbNRyuf4zK\/OG6cdqL6f377KRxPdenhiRBRZB8HpdnV67e+7X4uqtzhF7P+bcS+GWL+HKdfptfne5qgvuq6NuVaoG0m0YlljGovs4BKKoRIU4XOjUpkB0E+o00eZfSME64jz+ejV42\/RvXHcrFVQqX31Znukk2lV7W4vLDVOHRXWfvqnjGSx0Gu41o9jUJAtJmv9uBYpqhj3nKOLphTxySUMwblxUC9E0\/Tq2JG3OEEFiMiXBRfpOjx2mrNNuuL63weURg\/jIvIn6jQR5K7cy2rsu1HXoTIl5rHLLwzqmwnFzhKUcsoVdLOYCt+cAzn4NfGvouLPJeTiegyvb8271USaGN\/ujNt9IubZGevYNDCVc2Y5mk\/f1NT58FE6Eb8Wed+Ge6cnJ8nmBZYPVrJY5I6BzDo+lJmMb\/Ekx0n2OXx0HMlZA\/2kY3lJ6JjTX1b1Z3Fk7J6xNtZdfKqvgIsqV1kUtyRO6IwhhiLy5+nSefFrtJtzStdvrkx\/7J5QTQWEnVin8r4zgBG0l3xbKsZnIC4Zhs+gmu4AlK+sgKKn0XBSmCkKiFe8LDjnoDK4LwuJ7oRmYi+GJ9MpaPpqnZafQp0OWPs1AkZ6UyD4+464meqP1UTXiGnlyJxcdKXkd8ggy93J6hC2IOreliFX5wYMTuuar98CqJRZnpEJ6jOxa6PqEmO8PyTZ5kxWO1GQIZRC9cDxyPqPxrGGKdmrM50879T\/JRmUEeoVB5+G2LmR74MRxwzS\/KCX7GO5Zfi5TTvaW07arXDimCYa8njw0XdxrXXlXpkyXT3mWEnYbr1m100AWdgXZj97oMMFa9PWOI0Zy6r6KLVRq7uGYTUL3SeY9tqIFHAsbquGCKKpa4cM9bf06zR+70RdqQNfuLxXKjMlnXM7S6OIOD\/vkr1ZjCfas+JZ2fBKrZIkAlOE8V+2mVfFiZWJVY94robALsWIBpRIHb3qNX4m03nmIB11dprVN986\/S9eqGvEiZP3Tlxd4rI5Pva6dl9J2jvO8VrA3wOYPng1ye\/U6ljSdyMXPGpYKoHtBN9mMT6vtVHns9xyfrGU4aCM8pXwy9uxM+D0RN15+vVunmQwXECe6WjdZMBk11qFw1S48g2vMksyen5TOrxq4k65muD2oLx4BT5gEfRwGG97fGofhvsl\/uaI5mc6oen+GK3Tcf+awcuWZuyXyur+ExOm+FPfXQljup1VbF3rAcfw5SvQh+mwA1XXxZLRGsxLSoK\/uWxqHXmjbyILYOkR\/CiuhBv2RhNJOpyHxp164REhivipz09YxFlZVFt2G7ZfM6OfWywlXuRylfwDZ8T97U\/RJyfJasPP6vSckeC1YydlslvaZOdS9FDhsHHVkmdKXMF9cxL18f93PI340ysW20dP2ge4olA6RUHZD0yO5SC3P7+y7BxEPACx7dOp70PuXl8ytSj64QaD\/rA88AG3UhlFvMnzp15EGE0i36Yf2aG5sx7LN70Ar6eOxu78sh3x4r4OJbGNXrWWLOuBxP0VpS15afoG5fYMjNNcrWmCvV6KJ8My\/wIg7pWgROfLx5rpo3Wzr5nP9W7SICj7Hh1pItIfku+4RQxMnaTQ7vmbv0MyTow1hCnR9fGWmoU30yf99JfchQZIg3y\/kB2+AVO4426hf4XhbWFPRoNqt+h38PxMRxYlg2ZgQzQOI1z4GAZIKn1bgFT1l7rw6KRR7IjP4bLuop7C\/QZ6sP\/Wm7xK8myz+VV+f7NtUA9K0dxxUy5uNfctD9VG+\/Seu1XokTUW0t4CtC5NSi5Fvn6GONB5N0JaA1CCNQmS5OhWsd5aw+copxgVH0UBJPnjp\/fGuNxUHubdy0ztz7Qh+3z0Tvj4r2fzJKaXc3vyk24BLyNOxpBZsN8ONdMEzsiKbo5ihjQF7NcvIcWMkC7a+PDZPqY5alaxrza6hTJaFiPYJNXSW0\/4yhXoqCt2zfePEo94ZpaX8sT8ynTkGPyrEdh3PDT32jwiCt8eRbWkDOuYnkFNMxSrsbhznvrh6lZ127V9VUqIwBlnemclL5IDB4a1dL12qpqAOh9al8eSC+NWpKpI4M3iEMjOR3RmcsHuiXZA7w5UnnDbPEcMxCbcgwZQZGqus2ELoH6EmUgwbZsDWeHQs\/Z4TN4pMjiH9jQr+r5Vs3TTfJubc9HlEEylrtn4d8q4TiZ4u5GdrVYdUytzMtDJH0bN\/F\/\/ggG4HEyQSsyEbOSPYIsZ8lvpKFt1s8wazRU5vruBviYKAAdKArRRzuGmF\/HrTX\/ze10mTHkekXk8XVsClgE3Ts\/BF1N2Lqoij\/38uLZ7JPNPYb6FDb9Lz+5TmDixRUDXeu1lvLM7zeutuzxbwa8O+CjRjj2LN9HXtFVHYZqWoQyl1bXzakK1FHtytC+pqbmuB+QWOeKcxxJ+CFbAuhjzy4jxPLVD\/V1Iqqr1FOi5p2l47TE6L1zfv5zStvV2twZfmAq87j92Dxt847SufXqipX1rXGyxLtxYTbxVTyNc\/2EAngdhDF83rUCMtmXRSfU3uOMPM6dWqiEeyWHioIVDEseu\/dhOzP9gG2gXvwF31hhXFnEKOZ35gbZ2eDaKJmYyJweqHenpMfN33ZvPG9e0yZ6SN\/uWx\/3umqRI2UwOeKrFkSZecqoY5p5mHMiPs+oOGpRnTrmb3NAzIbFF0Pz+o0ZXEprzEm3YeR51n5FBrxH5MAZ\/9IH+SEHXmV2jkSv8Ly0RTyflJjmFcL0Cq6dr0ixJ\/qWv2FUvjNDRqDmqRo8ps\/Is\/TFPLI7dm4ybdgKvYNBfQS1wpV9\/H4+9dwmRxA5r1b85j5n8ekjjINePJLZXPU03b8ReCWQZ+j4+myr2DkxH+e4cOu1nze8upPF1CjxMm1uS\/Bpn2HXdnVqniMk5A1ehU+s2kzQ+rYen\/NZLZBd+GhOZxFmJqq77MB9B04\/51qKb32La0nypJusUndEfbQYiovPt5y5OOBgi\/ox2RBvbpo5FKC+dvuKUbLezZz1UJh\/u5gvK2lRR1JEMR5ed3g6\/xu17bcc9SA5eu\/WJx\/MbE6jTuE5a\/e4hpDNGdQyM3heBuV3401NWfvUVnfd6l35TadT5d3KqbmvvqH57rkdsmWsYMl3Z6NX5AV0FsVmqZqeOHMNwXnJzL01wOoWZzSHwDidq\/WryolRcARqDhXFXXrvmkTO++pLAdtqEN8kbKufKrC45HHyxfeMOe32zldjKed+nCcLwRLgU19ohZovGIlHv1pyNYNGwIebaZXVWXWMjLrpfu8tbJ+ynvxyaie\/HdurE64c3k\/1jzXF0FSG0Z\/VGQZNGQk+lHen7TofvB\/+GRc8R3zaJrd+FU6PJZcwa9r48iWsBWbwFqgESpmoeZ212ul14qolcbIfNZ\/6IUeZD6993rGrYRA0LmT8X57jGXIHWuAjdYRH3hqmPXqU0RAhMr8z1tGKDlyImRcxp+0fB7wRGGPYVN9JK8fwsvHxMo\/0jl3\/YNPMiB8r5CIAj1FpjSY8OyUhi+B7bufpia5pVcxcO1\/OMvbl18b6MUVrkfacBW7EHJ9m0e8pJX+p2FcnQx2r\/XHO1GDshKrCfbZYpDOyja\/nlC1Tzdbs78w+WhVhbfD9vVrGbJj5ORCdyjiC+W72jr5zHNMeR8F1uhz9hY6NKKC6Pieibndoz2z9XffA9sl8BmOlJaoZXoBlx5VjRP7yeNBCrkHHOT0dI1mWualQNGpMWy9BlJsdmXR7Rlt\/v3X\/cLm94uLFV1G2Z\/YdBa86c0+Atl1c0Pu5R\/oGG1xbu7+Ki2F\/r296Fhxz7HhMcIhWE2QZuUuuEcdfb3YVcPHM2L93DA6j6sEXf51F47f6JZeLKTtKjMS5glCz53yareXZiqBC5KSucoegwyf1c4ikroamKcKXq1M\/1CI9M+7Qhtz\/aVvN35EoTrL5vctwlLefho0i\/cJbXDny5N6rSrbD+nmvKkQxv\/l1QryvgHf2z1xSH2WY5NDP1ANH1FPrrL27D6z\/yeeActzt43Wcq2X5j+sOzJa\/uYK+1zQ5wnpKr3OVzfdYzUpmZ6tOWVeNP\/B7nnGXZz6QXTPigzfsHjR6Qs4yS+8Z\/Tu2mX1+z+yiIzBryzZtJaTwA56zZ7\/XGqsmPQ+GwCeeezLaba7c66cMwe+Lc7XD+6y5M2PNewXcqaseUOZNfG\/\/E83SXePA0DzrSZc8JRyj3SdeqHyt+2EF5789vCJ1c\/5\/fJ1truRIjmxXlIsYoIBB\/5\/9r+WJduyQHlmNl91ZeW+E5B+k0czcpVCsMp3vpGLRuHfVgk+\/T7wlAjDDNzhYgRqWDakjfDt6kCORuTI3LEWup\/1+m9rD+Krx6zzqqTIiRr7ZoOKXWYk2uwrpNfwTDIPeflNW9vyCRFYFoBwEvN5GP+Hz8VpB1XTWCxnRLDPDE\/xGFlHxblLO8151AUE9HKVO5Q6A+X3vsomGk8dCPXPKHHg9VwOL8Dw9PV6dasjdOdyVMjuLeW1CzhhRE7zQfWtVJKgzkH+ZDWvosEE82fQN4wSXsuLmUYaBTXpPMuxVvd55H2pXAVF5cFIlLdrUHOorIzuvkZbDeEVg1Dbjc33KEfnDyHBJicdgBNXmGK57g7WvjdwxNDOXcZkLuaY69ds+ZVEXJPrST3o5DWYUO4sQE2xyXltOPl\/kT\/fKRObj8YwuZ6a+mCG1qmOxQu2FGCdWjiM\/c9Y4InR9RqFHBzs4FjQGtKO+5o78iQGYZp184s7c0YCJZLAUDOcv\/+VOOq5Z9J0yftCdV3ve3j1Uhjrnyap1dIEneegkB53rFFOTqdl6b2ZpNi4G4pB3zyUajYuYnGIc8ICrZ3X35ZXvt\/n2I1mIiMuYP+4KV5IaoJLEWp4JlTimlaD8WI1c4T7y34lp1Pb\/9nsa5hn6VHQruyy2aE+PPCFvqwO\/P+xf5y5ng4fWXBDwMrjITt3lSNowQty3y7v1jODtiyHa5DdH0S8RCZa3km4FdXkFt97vLpZRY7KJJl7+DwfMUSwXR8ETbcpd1ohjYXT+cS0gx52mwUQzb1SH+JEPsWZPV2swCmMjjlx9YnXSWm6t0jb369uyMX7rlzmJrGo2jBfmDafALF0PMczAao4KjmCFXs0ajSq3UU0ggNwxBloMK\/SqrxEwfvi+fiuIbJ2ZUlvlnzrB5DOtdU+gvtOrfuFIODM3OHGXzvfaoPUbSdcAwd\/U2TAiayH4lX5fHQynVIXke9hNfnHW2XHbQMBWROy+L0gOhbcb7++gPP+P67pxZH4TycyrPNhhMIuwXzxPuGP51d83V2hGo9dnSyRnzU+SHLwmsrA\/akmkE6G0EZ+SPM4fa5ia5ooZ1S764CffB7ug16qTS6yEu9JEBVnjv9XCO81LucFqclwyhgxglVM\/QVy0G92vKiT75eDygkxIe7BJ26AWqhk+U5qM40\/RaxCG2ya6VjUtyVK8Pg5XboGT2YFnX9aq6CgyF9aYvGtcrNj+uyyW6qZiitPmPAylc2plMZpMZKuQumrG3WUl58foXD0yXsc7x3fykjj0ujtaPjrAKvaXK64HjpIL6J2477Wnek3eo15TG6mneUWv0Kca4j1i\/SH2SYw9kssv2mXGRtuoXXyS52R8kZ7c0B461AqxOrzSzmz9w8q3Gsgcvr9+Z\/yyX9AEF+h+Wc9N2ogS6kFrUYCuW9p+5wlmWaPs5yJC\/ROH1sswE3yTT7HT+o1Y72kWxQSf2EN9QENZtnomM7iTpZKpZqfGp5teW37fc65oHEOf0d23iZ2iUitv\/c3vXosQ9bYoFq0z2mWeL\/NwNwPjNhpUCdcB1XGZstnbM6ia1klanw6Sm3A9lAzYea0KkPuU+BQHHJbeu\/eyClGlmGnP2uf15f3Zz2zwvM20z3dOBYvTdbhsntaKq0GJWZ\/ovOJl50iUPTo37\/IcnPveXzANHuSVruPqV6mdQ135r4qWSqOWWSmjUq230xSzBuNbD\/gOVbw1GgVgH8sq8gqou4dDJncX1XgmHJIOo16zEVGnUehECkndtX1ZJxRFPrlDK3dJqf3RKPeTejafnqAew108aXZ8D3GgL49Bq\/R23JvVHIaX\/q4F4lS9hjv7nYP4jmkJVptowa7cD88nQsJArjsm734mPUY8YhOsQphzf1fiknYwUtVnPzWS9qfPepDsTObJIRmo74L\/GYcMH26c0dQ9e58qWg\/iXEGJoAxPdg2XgPJFJF6hXK7WyQvHPTlqNZPqhpdaxnBQwkG0RQyLl3oCcp9glRTSu2O41mAPmdlj9Xq4Phj7mZ\/+Z\/pLr1SMqyLXt64+ZH18QfMRNODYkg\/5tTG2X0YUzHTXMLNkHcGeUmqycYpq6UL+PQsQSlZ8ipc98a+OiTk7AyMgR9cHVp\/ki\/qe5iCkmdEYnYt6\/VgDA02zqsrjga2ztCT3w6hdd31vtL5ZkTRGtAtO8d7Ban578jS91CEGSa2d6kcVlzZTO7BDuAD26L0I7Dxkb6x3keazX37ukwrSZVbh8B6ZF1wBtphbKrEs62\/MBmSPGyn+WwOnqtSI+k6szfWjNK1eapxa5vNNh3D4iXGmv6Csa5WQ9\/f048Q0kQ1TMA9zoqPQZTN+MpsoRm05mwzxv4lk5onnzsxXER+\/ByOUTU9HW8vif8jjGEF26Ioeq9AVQH6qA1HzXldCdHSXxrVjbxapDRwTPr0zaXysL2uHuRe5ZU7wdu9Qd6AXp05Vuqu\/2J145fOE42FuTTtq2\/V64++MwU25pK3SvpxKXuEdPALsfaOoa0qdu34uguMt3JEOKsJ3aZ1MU0nU\/a6uGJEcJJZh1qsjcnWxmjkPWNJaoTTcmJ29yUhQQD3tOqhs11XRE38rR42yPskbsAErtzdBvs2775BbfCw1FL+R\/OAumu2sKSYmRCbPTZH3i3RxIis5GsZvz7JlKztovFVHzs3YpzLkkWS2LUDZjC7Y2Gwkdt872UkpM6reODhyF8TBMWUIKp+ZwyqgiRZFwjJJeJueg6EMQa4iF63MHKliPWyd9x98h0\/uNVTxcmUEaVe1YtQTp8tT+aj6ScZxSnqizqssHKKknok6O2OpO+tIXLsCcpUFYkV+cxJ+S45bI2gK9cUfx39xKoOsY60DWYxdL+eo7r5icQf\/ZUzN24wJJsox5RP6T6WgCPVy2e2KH51BBuXlfuYG55\/O6WngCGoyT2vc59o29u1Z5ZOb0Q0wTr6rKfwO78qm3SvWRRXJvZJpfIm0TKQTYi+ZLFIZZJxocXd14lBvZStEaFQ1\/w27chycPRNuBY1PaH7r8lI7oPp0G+To\/hjn6Yt8AYvKVnorXYQzIYcwGjPjJ+uq\/fZVVcKqJr8qeas8WpzZ1aUMdhwH8aLP5gyOD0aeV8IF4itUXy2st6gbyb7z1EhW1ajMvJL4Fg8zmnU+X7OuDPnkzjTNXoG4hOXSUl0b+SpPUQdwVTnuXAORVD\/lKlGCsySjg3IQ453Q9CJryRujGPBj6mMmG1XJPT9U5mC+OjNxGp\/KrPC7YO58W3D4cPb8ZibzhJX1exP\/45dU2GRBxg6HTo8Z2ykd6sDcviNsU8xmcIN1XEmdPz\/N\/NnB4nXjJJLPDRCfxf6eLRdQ860jvEgr1Z1Q8L4xr\/fK\/LPfh9aBBdyVKH5HjfMwxmDbeekUuXo72ZtUsZNx+xncO4SXA4t4nP5v1yLd\/UCZqYjUBFFTheMPe+cC+g7DsFtlPQcbZWjz0oguP6mCr+IeM6rdfWpLGGnidvo7409lptP5PzsdUBkovTnz03DFfHMD39Tj5wFnTq3T7J0x49TAME3maFy\/HmsDgtawf7mwHhGNxnnMWOQ9MplslqfRpFYEVxRyjMgDa9NHW9xVmRwNEtRW\/cCisisAHEDVq6o5FYWmzhCpWRAxmfS5MrDIjYrazfhAdmu0Gp5I1Ft05IMl2nXnlCnDjEEm732n9ajF0l2byyf3Yf1hmhwf9mF\/rvWcOKB9o6Mwac+Z2OoL9LKiJXlqjGBifdVFVH8F\/nI30vReNcscoavOZ6ouu3J49GHZuC2yPVdH0a0qWXD98pU5PM1vrsptunG0AaZRpaed97tzmQ13bMjUHuu8xBDzE3m\/6LI64X1wz5GM0vHLrozJHifGc0WA+jpmhGVfZ\/Dqm+3\/+h5UQxfVlVFaJpe\/3P+6QdjzvNV5kYvN8urOznPAH\/G+mjxFPh3RfxPXZD76dnrEqJxH4gE6ogmrC\/EJONf7L2e+n68jrhkVDnV+azPs8HZ\/O2sJ1Arv3B2ZOJJWT3iNOorC515vOD2\/BcNkF9CbJbPbs76OeB4HlZ1agPNWK3BqMzvvn\/0XOjJ4GaxxmWod\/GWkuQ8Hz5TcWw3hqapGnEaYjLhTbVU6OHZmuxyhU+K7ZSa4iVZmitvTc89cyB1uhvGXW8Iq7kM86GiWHvYPN6zuwMub+8xDD1JfSDXq08Gxs6MO+rzOrBIdkQ4HjrRWVNetnzkjM2Q\/gUzTCv3IOdQxaJEDrG75wnHp9hi3jtxIh09YiyRDp4PE1tnSs5xNFjv+1Ob3c9AQocMc8AfvnFeOJ4KP\/E6eEXd3ktMuOMFTD0aqaMld36WL8wH2AT5573xFZxnXQk07Hm41OcTtiFuxjjHsDXvkeJA5v\/V7CMo2Ue+ERMfndwjy3BueosPT3alPqjtRSM2bp+PfRCpcT3TIFJXF2hhe8Ttcid606GfxwUz1KnFlfSazLq8Ub7wj0mCjG9fpADXdcRXftIm6g5S001fLbPFX6pTP8YSbqco5rnyZf13tkFXqAqTpxsSlqFBxmAfoZQ4gJJlMVYlsK4oqYnQqxlt1kzH4IUc+DGTFwm3w0ssXtMt4LpuMQX6fc\/LNqOxSxXExJ+JY3uzMn5bYHdhMExwdpt7PO03PId7KpD6xeHQFUx2ZjLY1r9uiSjrUizIZd4bW+uO2lj+4X8Gn25uXFzdqhy739Yrg4Fyav9+zHmRr8SxarQfYmzZBlvk6vIsZn01w7EImQOKeSY2ymhl0da6L1TKeDAsayfSLF9Et1zLCMEFb\/3Vw8i44QjvhB3Xc5y5SL8fmMgM4VXFEanrMn7d6mA2vVgHRS3wG64CMs2u2rmvn\/fJj8qaX0R\/IFleB3B2qbl523iP9\/lxiaFzIMZ9sYcbOFGa6Oal83nUk0\/mdTHOPlne1qrjkwu+BkrloUzy9kZWpNouNXc4Ihwc135h5Bi0OJ2tG2HpVMfeaLHtYx+55dU2XT198LOWqL+IyDfFMgdOfkZ504Mqdn6JNfcJp9zA4Bo7Yb\/mNy3y\/vbF3jPTu07Suzm0vjJ5ZZPxBafAVVp5k6QPm59F\/\/QneGdxd3W4945NnpEQ1vKpPnKO4mjPvXb2rKMf21DVPNRBR63rqz3QxjNT6CD9XN6gdse0zpvQe0wefC5\/jeIIJGAWb6gZX+89\/6QVtHeYCXxzpM1n4HBjYRHUSga7hUdXuLeAq6nnZcaR2cWepoOwCgJMdUf2Umj9hazSqACh3WMjW2KeBVabXIIG+6mvqeeMEej5+VE5h9XEVnFpJ5PRScIuqAW+o78RWBuN1\/iQeQaDeRDymIufNKD4epYwJ5hIh8HLXrqeP+z61xOAbUj7jtCu0Vl6rjPUavVEb2WnEIXR1XL1IFkAqo6UmnCtMA3LwKXMoTv+8kdzKyPVzcL1t0++1T+yMsHUUZAUvaF5dXPoKBbTqGjccfvr07tp1RMUCuJlannTQaiOdFXtXz6yUMh5myRjQO\/2bKh7cqPL1gFR4Mkh1wEFtKXVWhuKaxSHAWU2LPkm1q8YS5ZwL32TPOPUzoRig+bN7oezbJVBi4Bt+EAAq6S5sQ\/T43C0+9s7j3vrs8KV40+uYAll9Wuy7rE7gSuJLU8Vz8si+8nkaWJvVCqs0YtJ\/kwpdCGc1D\/A9VZ9yu7zhW+SAYrejgufVcdmoOWMUzQn1IpNZQ4lZ5t\/79RrB3n1UxrXGQAFjSbVk3zbPcSNOqX1qbrkt2p0dXVzRMhisT+2cdyjXtIrwOESKZ\/pY656N5lF3xJP2VAo93cSTc6kDNWTHmirXFcMXua4CLnOHw3RxcdJXwH7dR4\/rD7JGmXeNMbvHg7FEq\/6hCAyGuW8Tio6KZI8\/WUnruBVa8Jl+MuHPfNLo\/A0u6rDxBGGZxD8zDTrgSVcSVLjrk5410+m6EH7ij2ep\/WBEjSYLRjP8V5d8+ZBFdbvHsK6HGJv90cb5G1EpN9MjvapZ5bbOlXMZm2fxHZ3ynPwfvuz6t0f2XtzkNzlGMaYQqHT5PdrE7uKwRXc1kq3hNfgiLBwEJekwKi3Yb7WiroKKE+3h4PgPXJz8gJ5wzdP3ZrKpzaw\/wvJ9biLOI5ochpnhfiOvPwxHdJU2u7YtK7U3MYsLzx0g0yPcRA2664+DOLUFmXxWjcxW23pM41AGIQ+XNTV52nu5ATweLt\/7QOfs6cun3t9owCRjPjXUG9KaNTGzx2mInXumnLwkg9gWXEPbEyWq7bgH3zY5x511dmS2+ZocF\/ONMuvXanE1Q87lSlD6RSep97RYJi1DR8\/Q7rqf\/faH6hJh3+uDKZs5K3w8Y2hfYivvwV7xUeKYGuAa2fyBJ8IVYajWa9UkYw7b47Eu3u6GrGaGqaxdYq5adGZVBlTZJ23owkX9RjpgYF5EB+VRf5OJ1Jy4qH610vAFddBRklQ0fhxPZ8zLGtGD4i9VlyOp+1QR9y4MBok66lKlZXUVgcqo8Ef9b6r5m83UPrqR1py7qMYp0XN0CGOU3E3Pn3PLRIKTcmurhYrp2iPZpP7i3RIpuGm0Zisp2EhkieN3XN7TB8gfDcvynZyCQhMPEXY4kU9g0mvj1jvir4jAm4THUNOuODLl+pnvGD71weddBpy8B+OLLVrgKrHtkHE8A+fwvu7Lz9fkeJ8kX58ysZ2MgQF2mVVf12jBRsoyuA+X8pwVUJImMidilqtaOSHI6d+vlqNYO2q8Tj8blHpuLJZVonlVjLQ+f+kxMZq4gpnwRXQtvpx4d9wdve42mMTswElFULHfOaE5g5u+D7YG7HkHVMrdaktXd4winNu51BHEsiWXZbzUTj4nOO2m9mCaoXOO5oxXOUAyLFQPUjW8SPBTGWaZPRK5jBNub86qHZlT9aKOgIrUw4FFEg42zysznjxHIIymU3NeXTNtZcIqw5hmcnmG0A4uU9dTzcQI2NNHI5Ve6Zu6o3fZfV71aQByClpUbYq2oQSck7pOS\/oCXyF3VAO5wkfJEyCeWeRYqj5jboTJKdw66G8kaaWOlAjHEy0TMeCOuRzdwlMRrBtjxXyoYhAn5mf3kbiX5VP11D4zWyXrLGXOKkMVpO0Vo+QAtegMMmZ5t1iRy5qzU9dj5xnx5RjOJ996KSsPu9DPfgVzKDAA8g66nLfRneEOE\/Xzuavn8of90A5aDJ4dazNRn5athPABCrTM8qvqwYI6rd+BRMw2Oaen87ldZa1D5QiOAu+uMsFLK7bYmXhk16T1WJ+45\/C0RsZ9ayRmSlXwKvqt9\/FYa6T1A2tWR952mTmjuywu4upFqO9oV0LMWT4nfUbC3TSO6qqDiPBkj8PKoj9z23Orw3UN3c9h\/tX9MgitNp5lnPvGHt9rzXzH8ZleWEPmLq9nJYh35F\/ejwSm8g7R3NvjTBgTR06qcSUoYXkEZCVDtDxVnTuxpg6+F3mGf+8oY234KHHpPPfPzPHWAbklKiIerPmX0fuefcudvK5KMffTBlrReTIX+uLP8uVUYDIW1k4n1Qz0D0+gr13ONrqg1npyRqDa2jEX\/EvvVZugdo7lGX8MrbuQYcnsjibi87q5VYPI43qsZyUoug8RIgGEOAIjTvSYhxxh9VNb4b5EeM7lmhxH1DMlH7geoqt68zQ1WFstg3+OUcoGH5MkEh0HqiXuYMquRRtLUWQdwJE4zYmYVSe3MEIzUm\/b1wYvV0eodlqBqdKW8a5fq24QZcfGXIyyTKt7JEpqSFT8S+HcI5zae\/rQC6AtrjJvTXAV7q6iTsXKUXdlDbN3VQUOqKIdablfpon61OXp4MsoreA6hmTqNLrnZbbJaPfEpwh8GqNrCnx7Vi55lzUM\/5v3ZJHbX3QXkWstSSFteF72LrkHm51H9idpm9Xk03b2k3iln8AOy7mTOe2m\/Zgt\/53SmxHiy+DBtN8ZcjU25\/G8amY1XFS9F7eDT5\/rSNxkNxmCLFGjujXyCwuqDepO1a\/YLof3mor+msFNKbW2yvDRf\/bTnEC8AzUB83512p\/lVL6voFqdGRzPDeap5LF8s\/rMPKIW2ZkNGxQXqDzdwMf1vfn2la5nWq2N7uz7ZBrJEqsTWqYRIkqFRcwyGq+k5HN98bAzPjQAJbwIj3TJRFSGMzT+OlQVW\/yTGzPEq8yONRSZNYr8BDOBxgCYqHVEndPeB4InTo5BSeLHT+zgjjRYh3DghIG\/1cqwdlV0Wiob4skdJXhLb9W3Of8\/X+ZhwOoxV+eyXvEvvqLImhEVHnGl6UPMzWirNnXHEyk1emIxw9z1E5nr9eFl6OSwqvVBLqNrTC+L+G9GRg089ZTYTETb84y9\/ht+Taw45pvDqFwhiwcNdoxUVbVsa9bd08aZc\/zdlwBuXZlUgwcdQLx++fzbIp1e663gfHnDDPX87DiIX88nk51LfJGMpKbPGCa\/+Z1r3eU5GbYcOOOc+FF7M4667olprpwP20Z7Pv\/cbFxlcN0P7sI\/rHNbB8dap7iarPdKD7slM\/tZnwfYVRN4uLtkYW1U4T7VA0dX97ufY7xB4syEmmNkXS3hAsBaolPeZeeyHkGUhVvLMp7Dp6C6LuRn4kZLybpxMK8wGzmBe8q0wWuUm6vXjLf0I7fBPW23a\/RkABdX\/hQjjGWiSTs5W\/7KObg8UAq\/0CdVxOxcY90ak1my6kgO6ySa\/aoKdQo6mRnjnD+DAfwkMQ1nRMfwk3vu\/N5dk84OOTDSaeWdN7\/jgFCByyx9y9XHJR3hzMVxtiJdL7Quu\/c0XrUsxkjDnfSpN5MJxME6wtPcbw46c55B5Z1tc6WKO1WKjzKLT9kFi2SUM1kimLWq0rpamEmmqKaJh4w6Z3elqgKKPepyYpksfVH6vt0pn7BjZTndU2PeVaW\/1qUG7nFoRVjyR7tkXw6s9+SdMqGVzWtzKExDWzB76661cfxZlUt9g9WiLVVXvgfn+dNqxEttzM4PuM4gN+DJWYpKV2foxtYdMagTEaE8A5zjQAr3OZIN2v6NTppJ3YE3EK3S0\/6ti+633yMmfv4h386EKLsiy7+rdThG2wdReB2vsODCGPG6luj\/jLu1X5aycqh3uRU+hZfxsG0tE4dzNiaoTfJUk+boYJ3Er6wyn4+MLQvHsE5Ja63faEjYOs2jHLgimB8MB+m9Yyx4yiqCz7v1k4Q9i5VLNHfv\/yFxQ4v8f5pGj9GU+1\/EGDVmnZIoTYM5cjDQygF3cibSTn2kcjIdHIYehf3UQ+\/hn0o91F7bV2fy3VU3Cvr9XiQSKRU9GUr\/tvF6lipd64DeqXzunNTbBJXRDWtiPWXzz7Fi7BRmkZ9KMYuqjfrX+HWFSP3BCHG\/izxYo2xbTkVB9RwgnXbDb4OZRIDP7ufIuqPgLwqiS7xqFPfWx\/qDMqe5+XqpdyIysNXrcpyJnCU\/qgtEiPyogG1pFRpXDtMbHY73D7i5\/C2KepaafPM6T0A7VnwikgqZ2BNtkMnqk1qZP3nC4\/nD+hK+jwS\/otKUKauERNnRis5krX+oLliMceWT9uEBss9v5ZCEnL7kbVA\/f\/iuq6xeMrPWQWfBfIgqmC7\/krZU9oyAJxhezvz+hvqhaTU4wgVUEYfn+ko+t8en91DfurO0iDrmHeaY0We86ksiVp2yT9ZEuXMs6waQxzhlmznPu7dv10Ts6HCcs3wuYz0VXVfnGkqnR+SoEiIIM\/FX16niglLRxrWljjXUHB9abQXveFNmRjRAJc5yol5mhjmbP\/RiUDSfvZ4\/0UkcRlEptniKg3UFOtQ0eTvjbyapceIMn+CGWr\/VA10BPCQLpq7hiOAOlg7Q4PCcLbcfp+qHcmAzrP4zOxke\/OrqXo7pyhFkBFth17bGb+Mj1bC82zplNuVUfN7glZ6TF97HM5R16x6I4car6yb5yWwcm8FU1GOLcH8TOSL98MXdYXxzrrEgWnKr3wbDUziI+3mvcu+qmHkQ1eCGSJtTnsMsVyefZLUxnmhOHeMJ5icQasW7YjvVN3K75m5v04fVVL+gg87qOphqLplxxlDlBGfH4rBNa2kZQ9Wq10q95X9dfWRvgL5kr67E0nL6IqbgnQxaV8ZaVnU0qW7AkRGC5M1rZkblB1usV+PtsjbNHTbh9rJnRt0xVrGaa9QBTBzXU82MHQ\/hCsI5bD6LLHFktfb7pMPdtiK2TgH1TSIa3nO28oOhkCfVaJGsjoJKKhJUOvbw58PFnXVQEp1YrWlFtn7LvuVYVmKJZRwYY5XjVUXYlDH4bsaROJL5oL75Yv8IusRhkL9JTL12EMe1jbkGgbfvnhPuZgY688WycWQyPq8MJ4GV6YNXg+Hv1IAiffPdOnnWzPiBfAYs\/fYp2HjODCu77vPufXpr9sIj3umbXkFk7hvLYzmj7rye92k7d4Pl2omfieZs7jfLWqVn+NzhVuCMLtdF0jb3o9Eqr9DHXqVhzYNGJq7UMZGYGnDNk1daYUE+GYU1qYdjT6qH2p4\/5fmEIGCcbCdaOS580NVq72ujSt3rnvHVeYWP1LDksE4ClKenMuhWVFhed3Z+45wMinLuRNdVnQs54f2ykqR9GKyaMSC4b3NrRIAQ9VR1lEPEvLVABcBr\/pc6JO7FZnmWu2bJELnL+XvH1em6flUH\/fajY7nvVbkMEkmzSCZnxvx92QsU2Fa5OTli7lfzzus80Tk\/eOEUWG0WZfCIiiGnTYtgwbiev5Tn1G\/Gnx0OCYF1evAJ98Hf7mjgXVLexSi5hNvom59xaerXvWeLjE4tYZdX36Vfox2PUQOYaVcbmSvZhrl0DzJ1cV40E5utPzCbjPRMlT0cVFxnFG81MEeio8vsigvWy7yCvq5vOUqN80z1qUoQxgDtOi8iwpiNpWfzztvWYdzIioapAyvTeOkw3nieIwO11BBPbrzKEx3MiD\/vt+kY4fo9OI5oqE\/hjm9XS9auE+nVkGHD7hbNFPVzeJfBLGxPRdEuPEqFyoUXM1BgLK0pUIQU6rGD67Q914vQxax1ojTr0tCbst0oPCurGWudTVpMPv03ysAo+SODg5npCJYFjayw+HuOyBqx0uQn8AZGrJtIdio4DJWqpa5bwfbUes+76e0qcwQH5fHvxnj6SpvW\/czu0G\/lumNndqogWXuKbeYpkroOiKpUA7tuKzsNmlJP5XhUaO42l7PKwETZlZXMNIeRcd8nQpkhriyhJKbMmx4vdyCOtsOYYT3mUyaqWlQj5ULWgqQqkS6LLH+B1dO++1l+YN6M3ir1U9+w9\/GcNUhOGV+ZyTx\/TVABZL25KOq4mh\/8hAtQuxwdVH7z7pqFKBs1uUPmf0f09QcX4H8nRyh6KoKagSvEImoT15vnGlz2iFVZP3zMe7ACMYafVBUjm1daYTKzeLtjVDZauPaNmGecKl9bl6PVpUCc6FXpi5vOtlo0WJZvQWVikv\/xBFzWq6CN1qweqqpRKLqcBbXnfijVLkPsOUWJLRwS9y6Xh2XHV+eiQFrtSnJ7p\/U3qtTQi1A9jHkCifPfi7n63CoM18Jpt4PFfh44grbB7XGiaGrFBi3cS3RemL7VRPjmfjNGXOPkXe46FGlkmveciVzC03j8fDfvghGP5jcQIieCOp2BOqajmDNEP7MtC02ttKbcKaFuqzHZe7PS6jqioa46pkoZDeNXixhfYtJRwYKgGoWLnlVnUu1FsOMj19f6KlLiMdmdimfvp9+TFk+Q20j6hMToXY6a13l6VjQ04+hvrQxx2PsuUY96cfUV\/SQqV+koyjTK0wVg3ONvuJx4NLZ1elSkXohPPW71y\/rrBQ5nIkj1RyEWkx0lLk6uCY\/GMYTvWkFVxcyqGraaxnhhRXj9rf+0RrRh4r16oXuUp9GDttbIWFHMvmrRUuQ87hY4RjUuYE3k0M7DAuCqOmWdwY3VnUX1ann12BhMlKryu0Y0ttviunViclhV62EYIh1dfHJPHWTe61HB1Rw0qWBHCGW6LPAaf87dcLeX+TM+zX6QXwxUMWkPpqFi87mD5LNuZlD55Xv2k+DRqVA1U08kK81ZVwMoB59DcqzJD66mSkSqPWI1avXTupABYerLJ2iACVCUZrj+oChIocAhxLp7C8Q12ZExmpNzCr2bgn2TuA3iUJW\/GtQPqgJ4eOutd2oGDbzOflfvaM089Ix5XVavo4SXYB6qWYYBeXIGR7VeE5mgklVVeQV1OzUHF5Pb8Fo5RMZQJcwTUUTpVC\/OwUdNhKid\/HfXuToi8Mwf5+GYZZiZYTA4jFGtoXp75HltYpmep27EB5WVqFb1MrPdeYMF837Vg+\/Rw12Nf4ETM9b1CNZ4YzfvVkMaZ7KKJ0kepq1WaXIAa\/l+1gJ1aMRCTu7dpMu11fWgXDWkOjPjrjoS+3M2rQ6QcoxQdAwjZHzBRuI9o44msj5O5JlhWJ6c+ifH0gJHihCuWYkOMKj71nXXcwVEfbZ+lR9vANfQ9jka3F3mX67LaDtq1ViPgC\/kE5rXP6jQSYlgjmWlQXXzl7gZ82pgdVzukaGvYsS2DmEyRBzqfFJxVa3yI\/VEcH\/zJbauYs4Jy6ZG6clCKkyPCCaJkFG0SsXr3ekJ+ldTWxUw1LnMKnvqiEhH61hRfb8GWVW98GdZCC5lFKi0qzjdBdjDpZzGt00gWR2HE6dt46bLKt+H57oy736eR1qLDbn68R3vOr6qgb1p9NrfVz3cWcyVMa4kzKDjKAfDCUvm\/I0X18m7aZ3eZlmSdMu8jeKgg7pcpOI5c0IUlP\/BUmzL0v9+x+H37jxngOfgP6PizG+Sc17fGf7MNQ\/b0QXuvcjf+xl\/cvjM1p7b5gyv8wzS5k\/5JA6vuyEbh4w\/McroUemdUa73hKkHTZ1rERHOGQZKlGBk0KIatZqKlKtrjgV3w+BFej0DHDw7jrkClPlm3vVCXAfrZwv3ypTZ5UlrxolIkJVE9uu4EQ11xpXlilUdINeZ9gwjTlYHyqygyH3uxZuje8e4fQET+uZaWa8I5jh7c7c0PX+RzOv5ifa\/nsgX2ElMyK7X2jL66D66nG7htY6T\/Tl+l09QaOKfDFVrVZPWxjKAvgXWoKrrd8xgnQRqgUvAEXDvlFyLsrGik2tzjnWU96wsXOGMxutQjLxuvH6sFR6VuhWffiZDKO+jDqzuZDU0GcQyMmbIHdPcP8F7zFq373N4fCo+DvB0bY6bs\/1+3FfPUpHpy2+GbtWtc+RTxXA6kXZ0MqfKimahoXWU8vFoaeLKuDqPVDtuJaMIq\/o8OOo7+oQu5Hzix7qh2Q2u5Wbjq6t3xKlyWktl48XmNX9rvpjfF+3vzz8cJ9szO6Ihv5Cjama0BeRzjiseVm6b30QFb6UXotfV07i4cFKe3qB7iogXBc5Ul8DTO7lDDm+QSqvTq9YvpjqPjLWT9IocVR74zALtmCNlO6Oc0cvOiYWrHT1JxC4Ij04y39R+8j9cNy3P2gs\/FU6nVBOZ\/S9a1pCGbcKHg7KMAH7gmN4BUIxOX+JaX8e\/99\/TV7jhVh6M\/iqSKB9+wTBrH3uCJ2G85ixKFcwlzOeEVwu3Ko7LJnqbwV3jsqIFNbJnmDhxoKLemYVX4bKtWOb7VngyNa9NVHb0rsVA8kQdzJ8HJpNWhPwpZ3mcUYJxqIFoSRxaWt4+M5LMD+Rb7dGGKE7zzTowSLZdXaG1+rJkax3YpTrxXB1LcR6XmhrMMVWX1F3HOCSZzHDE8hiZal1mXJMLXuW6qKOR9+TNsGTRURSl7cSqLOUqEM0kDngoZ0\/74AvMHhL4GRWTL8oLfV2sdl1HqfWQ6ZLPps1RjMz76kDcVUVGszqaGE91pHxZAVQpq4tovWNJxHQCOQ+WBa3glX\/fFeMpIRH2KHGqrsJ9tkpLux4ve9Ff\/UDu3eX+Xdc3bwvygoxO\/auOXdclP4zLVsmQ34kws+Mu6WHIcjXPWd0RXlZPZ+iH38m80VV5adNYiToiYBU7OlpShfQsiSB4Y2T5XeeXOaUuqs+8m7\/gEk\/Bf8+lMSbGrRsIkr+WWUPMGmiofNvjyK9drt4V9WFYakEnafyZjXx0MwavVNbUD3OgMkJuzRX1PhzET8uo9jbRLsOHBTg\/USqn9FoZXOH\/XuU53CRGxbfjIEdw+Y1Lh3G+EjSR5fBFZpZvFANTRYBVQGtV48Qo2hA+zvm78kpGynwT4Oz4Vl25y5OzvjaG67iSktEk7jioNL8zKVKI+F7BJ9bVcFiZSP6un7POCA5cx9yTD+bVHh8o4FakMTmJKMGb4FkdIHbJXlakRB5tIM9V6uaiiph5ih\/OVLOa9W\/6RUeVAoSaDSOjihkvaofKAZNym5VrdVn1h3bOeq8T0joMQfatIdBlzmARtO1VMI8mDjeSYiDzedQvDuRY+xDKWGlbPqqe\/DDz6cmM6FYecpRtv7y4nAL7lDutS\/usro0jmtzWp4NGWD4RqlOTEZKFVBmIoLbgTBgPLmE1gSeYNtNu6gP8bCZhwLZi5ZZN6+2oPCq16p\/KFm+0yC7nzGR+Vp2W2Yq0BKNOVf5njFaoM4cd7xslzLwO+DIDjtZvZmRlkMcvz5xmdPUtRLdOAp04llMxqFBR2FgmqWjiTEqX0AzgA4us9Jlo4JRpSeWHLWWv41c\/f2\/lE5GrF1n2dRG8pqcpdooT9KzaFFdjPo0a6CgS4jngmmQlykNuYRJwVK6Z1+N\/k+meNXNNrfXuhs5tvrcybAji0AewAzJFtkruOhck6LpQ\/Yy9vmLVF58WBBgN3S+vnRPoyqqOr6pYj+foiRPqQDyoHdfcGXHqQMfiGg1+cB2k41AbL7N8FkvOYk+Fa54yo5UEH4MEESGSOH9qhZ0X1t3DVh4NJ1G9MLiMcn0fGrgHi3uHubo9f\/jsG31OWzxdzbOmPb79xbnDMceq1pj8yIzk91znBBFRG9gFltHfZOyMAUTnJzOgYqqQhybyeagyCo7\/0BVWgYvCjPJ8fklk40t4pww1x+NbwKV1DRJ1IuA3US\/qfQ4m2SYaMEVQRhyKIVhFBqPnVlijRCx0AGF\/PFTqVeQnXuxwGN3EOFyWXOE9XJkSfdaEjEykvxxpjuHX7kmnNfJlzPQ5RrWul3wnvpkTq7T+HNYMg1F9nEsci0V4NC+YBVhezu0zqTK9+Hly13qGubkfb11ZIibOWqF51\/kQVaonPqS4pItlz6R1Ud364Wlwx9jFeTwcWpSfshtVtsXj9koUbCTXFJe7grEq5InTtc6pq9iySetNfBJf2Yss25esIa8ROaqCtQkz5b9UCFqE70AFqRP9inwNb1B1sMjyfdjmXpvf\/Kb6p6rSU3trPdkC6LA2mQ1zILPygX7SWqdPvCotMypGsHPr+lK2nbP4plvO4SS+V8TPBGEHsqsZjoSNL85BTVYjZFed9Ei4rPrUNRRHTTyzR1LNnvUI7k2fNUf0b1drF5GsrjNfn5vO9aRHm5Mk2MB4mHWf9LrISz\/5uupZrpXbaYt6k0uHf6gkOSHR\/Xrh84bEXmyQuRkIlXtaa1adkd5+WMkWqJ4XwwVdkCBXnnLRl0izb2IPB8u7rHT0UuuorIPVC+LHbgvz1cmk8nEx03pY6nqk\/lplwddEptUXxMAgb5xom1qco9NGETG9UCPsNtflbxzISPGQfoJ+qga9ae2snrCiC8JufPAoIzuNzNnBca\/uTT3kquZ9r1be7TXB\/bRc9tz7ableF9DNwSJU6A97L6MQG5kmdVo0hW+bTWvd3DrXiXBxmuiT\/azhUNFEpdgZVhw89xuH+2lHYkNNTDystx0F7CNGw5WtX1g\/zBnVBgvWBfUPW5RVQyqyB2tJdRukw1JUBlzHf4voMnJqolxpZYkMsAAOyS0RSYytDOh8flu+3fxc\/D2qld5zytVy8GZmWK+64ByoHjly\/s0VyHoDcEF9yUjxlt7fGCTqCk4VWtPdeT33dqxAzKjD4\/2r2xRt4gLvHDu9MYdnzEXPbtWS1\/aSmUdBNza2o6fgWH7DSQRV8W+L8u8tMgaP5rjmqRyxs9F3sUKheqg1VwCq4fzLPeWM9o5jxGCMkaGlajZ1BRsxejqyonlNJQO77WfZFGXpvHPwZNTIMvKMo5EAu+ohqJhjWtvGjE\/NUs34l1TocBPyVk8D6jNzcUp8E\/s6h1eHz3GCjKkzVuut5uaMGelgXmxejKmXQ50\/edbv764hrR1r\/9G6sDutmgd\/P9\/lqNSt1lav0xyrmH3fZ4bUK+\/Rtmsb22VOxMzndF3uRWLPXZXmHGJvRdV\/pk97RIFlElZGnqG\/Bpfcv+ynJRh9de3rYECXNcrwySB3XutOB5WXMafGontFkbtmxEHUO3a12TVXfDR+sQjJz9VV2AUkEtnQf5wVGWQk03s9QeLVo1IVtCeTOXLcHrEpSW9OGOvLWsQrrJlvMuY3PPHUV5kiqMp4d7VHP16DMkvJSlEiV7xIhymOH5kn\/frz7IYUI\/MMnzACd7HAIKnY72efvN1d2VSfPAdG10slurxGT7bCaqeRLvq4gmRkcQ3wQtBPDPGC8uJquKreuWfsbT3xe50pr8Ne5ZCyndEwO\/J2MQHPpLVJF3iUS5OJuNQ4cVAUnKky1lRdX+vLvJgFsiZrM256mj\/nQV5l851XS2zjcH2ejHlfm09mXjebuNMvXOBsj0XJrUyhspJl1Y6sw53HbBcXuYv3nK+5oB1mrk6gHTBSNWb7sLZRMO4MS++tcbgFTHAX02IgcXZlkranh6By1g2nwUV0nBuMWX\/Q1uj72uU32Ns8gsmXV6GAaU++YJa5PljFpip4qniIMij\/fqxGs1I670ObchYzXy3JsZyLC30inft\/dl7sPK9rPMeBLxj\/gL\/lmi+aSK+M5lCkl+G9EMS2Cx+qatbsVSM4ojFdEll5\/AIasUfiK+CSmatcRivFQbEqUq9SiuxEip\/ti0iqf\/mcZrnJLGZkZSH64qhzdczB2qonAlWkN2jg98yCSFV9WFX4v\/KPNLIeS\/XSO4B65kPfjWrrAMY2vvWAxUid5NRx2Y3cro\/mTsxpV08WtOb9HJVZ5GoPrGL8QK3+Kgid+bfqZ2hF6GabkZdPgl0w8I5o2ucTUcSfeJPCiy6OhruuMu56AZiFMZfze7ddaw6klaHBWSpzWi\/ucTjGQ97Uz8ko4sgZDevYp+4l+Ar68e+gT+b+YZai1AqpGwpTbt5TI6xnqI+HQ5IJcj1r9nkHHODgep9z1S3+nuf5pMM+uweH3vsEcm981lHj\/OZvuuvKahCJsoKd5KjrkzoLcvOsbUAOEdChVHub5+MZ2iwnrY4eE9LKIdDs6GNUL5zdXpOmCuIEvMeM3FDjrtC6Kk1lBFFBdtWPLILLdZX1ORkwuGWE9WblUlgumAiaT2O3+roCy9nwX30wrKP\/L0ehRUS0DkkdV8n1dvAGHGENn88j3mq57M6+HzXYEZW0N\/6NJc+vNCrUAX+JXtgARQ1\/n2N4Wuc7ruOIFyd1JXhPjlW7w0XBenEcVeMo0FHG+FLCvfozyd1fy92tt0vSbyweYNezjEKixOGXxvmUKzPGpyQzFcEqGXOnSmSuaYt2qBfwpnKksPOfKgj1KweAtrB0FDVehwyWU9sSXgF+vDrlOZC8Rm5g1zBgrxPJ2Ogi+FVz9E1llMwhsUk\/co+oR\/vYX8ev0Dco6Ywn+sFMGZxa6\/OPcz09J0yO2D1gLTpsPSMlvbATiKIK+GRQ\/uf+RUaZ5jpb7Yd+uvpXrMKuiUudyfGWrKRHag67YpC\/wSAo3+xUrW9dU+YMgjAB1qhxPB1oZaSSWHVPB6kBfF\/dtQ7nHByBUsfWbZbtwu9XNVEr8uEfPMe6C1b\/4L3etLEiZqn4ZLW5VovrAeOA5I8gbLkOtWNuYrIZo+6\/V7m60mjlH+vzrk0V19MGyAzS6X9Gh2cgomTZNtE7fHGqC0WEd1aj1TFGdG4MtIAMuIi01l+lBfn5HBhxdm1EXqm743LPlI+JUN3n968csIgt2zNvmJk6l8cyUvKV3lPnjELWSbud9SCszhnXBL6M02Y+CE7ch12nHr+DVNDMs24olYLvNF5Zh98a41Yh5eCOkNqiwuESM4a+stonehMn8KRvY3b8LYrxqUMy2VUtV8F+rUn5TUXn8yauqXAV6JF1AlfzDNWMsVzCv4MMaps5gE4wmXnD8ImyuHuRJurVuBnBrRrwgDKtY6Lu0KDqTFna8dBz\/YRoaa01W9G6xC25X3db\/pU58x4YBStVLqohsaNGgkL03hjnPVhgHQmqx6rEaJJ7MkKcUKTMDlbIGPPe1+Ks5Iq\/vJK6zLjgCyIt61G1aRmmS3aOuVoDnUWzivEonxHlfMIm7FVmQ+br1RkPiM3YU3\/hqdYqcZTvuiKGMRJHapeRcWR2+sPPxuVY4deriKy9Oz5yO+PwCm7mUiXDacFwovKJeypyogWj0ic8zznuDFp9sOp5EFVl+le95iwqonxTtiAeVHXnmbUG\/bn\/I8531zIM524kvYMmIol31BexQoBt0pNeBlzhMAaTcSDV5Kpn0Epl4\/H4b7JCjTNz+CXZbpyMlr7CLMLjcI4j9txrw9HSU6ORvjvbZEW0EvGMNf4lddJarHJEN5Y5RGWO1RvjrbjOTtWqKOXtZOr47a002d8MHN8dGl52MFIXORHN\/J59jcSpGMmYZNXwW\/PlMewi+V9wBMaS93jWicJkPJlorVLtx705JrFkJONJfpgtNXn5Mke8ypHFNrhr\/YBBkEPsU+3BV+slbJYsDGOkD8ZySGo9wNytG3OkCrXCaSW8tdWRKnj1lGNgM5DnJ2RdD5Ff7thk1hzXygtjue6kZVl4\/qXGzUrR3BUPmeUM8kVFybV5l\/oNm8i53TPKSHbuS\/vQP\/mmZogUI4FnWyfo+1RT65FKMY9l6rRwVQujTP74rgT2icuPya+MLk\/42v1Laxnlgw5jJSvKjM7grXnmBPeQ3eCwmsQ8z\/GQK\/CWFWUddVxXo99oLp9Hvdo2x4fJyQTcmQHQU3osKlkRB\/pRxDroILHZrdvNIXUhN+b0lRFn5sVczm3\/1hyVRFUTeOrr1w\/03XknqQUD5\/kPwXqfzDW1rGMIpplz3TVRoOLpoT8nKowDJAaQqa83WmYQnIZby1dEDs\/CyeYZNzURdbVM28QVTHXvLs5M18CsHSlaRt6yX0O+dFuJjL4CVFFPzA\/1WVYuS14lw\/r8yVip56KkfibrBniCTFQr8M9dhXJMSgrFm9nTbn7rDFkvlLHVHJkPbMoqjAW+nb\/FVGf0PGFrxqVT2pohtsEr\/Ydj6AnXBq\/LD6yFrg6pJnHhz\/gZqplIWAlEhz\/V3vRHtGAL\/lCH8TLfv\/lc27DcatHprzgMato4vYrUadXPcx57wkGMzXMP26f9jknOFEnynd\/Q\/sup8jR5olcxSZ6ikgkoegle56kb+YHFWCJFdhgpf8CLXnt+mxw5Y+qTupJNi8zEx4zIyiK11dBs87SMnJcMNz9hJka1Ixq8ZB5h3LoBgJ1RZfbp99tHCyMx1fmk3sxjUDfck0y43pgJs49GPMJSfLYv\/\/o7mA2kGzeOA8cyrh6lWKS\/zI\/ZF7NBzUwVL1WWyoxXZ4srVhRynHjj96fdXdFPyacqgjtXBdQ\/0ZHrD8e8BnaWfwIKGCSVEn\/FXjetXBXEF8JJYR3eVfvJP6\/oVsCXftyf8QP0yxHiKJU74wge6upSp+jgsA7MM1MIr\/U5LDcDcSvPlnPSou7TVUtrqWsbVlf+YUe\/WMoQL2pV9+ROzruI6AtQQ\/iNzx\/enGX0uS+Jv0aEamPHcpDHnbUR9ukrYUjVfK\/k87RxA\/ctr9SXjpOfnHk1ziKgqouw\/hvmbrRb7+w6kl1yeWsv+JpWQIAMN7+X1Vrf8zaRQ19aK2nROYfHwUD4JqRW6soIB2EQXXrimgYxcVc80UvUst\/FjB62S9WkpTcu+KJn1KkGKhBcz1VbtR3UUpkbkbBwfo\/SsBvjuc1ve01EiU94adlJHzJMUiVDhWHgMlvesz4g\/ipCRosekie9N2gUWe4\/zOoebDPuqalrb3r03mPqvqyCn2i1yjoqrTxD7OQKlOvFG7+JSc4yomQeVk4R1Es6xjJsPAVHgj\/Q5\/dKq6Ic03Hiv1Lz5LfaA++rjhOL7pqiReAyuUWtgqH7G81tBfCqtSHKMjt05NYE9SqJefIbzTC2jQgOat77HiT0\/SHD\/V+U22pJFJtDXAAzBCvrY9mhSSR0tjozc6TrlMtDPI6PuqxzTB1ATL0LGR2EiVU1sANq9XxkTOePd3Om7pmiGnGKqcLFferPGhblGX1cO\/VJVVO9smK5qqghYoyCc2RMXqM\/Msaszj21Ah\/90g2ha4foIrGIs53JwbJaq7PM2J6sYOa1tdzrCFRuVDF8FiIEuZOTvitzpwXiv\/74Vl1wOrOtf2jE1+Olr1RCOYIWz92qBcSKfNer2Wa9H73gBMSI\/KInIHrV71QpWMZrkSmOxWOQn3fPGKWY8aoxqe+qulq29Ry9h9XlpeMj+ksN5YrHeTuilfPwddVcnQ\/uEEbuyqPXpeLh4LiydvXEGIe3OAr0h\/++ruBt+IfqsE76zNP6d9R84uXTd6pxjUmjmbyCMVr0boD71ix8cDSZ2sbdPGxYzz519KhrGiUzqZ03Po1nNJp4Mg9ZnNfIE5EPEVet5ApmrguRH5gL7JZZBk74jyElGYXr7nitb3a6oShE5ix71I1MRGcMjsVqCQyTycIkbJbW626iLl2lE82gsasi9W6gZLyIyOvDweBV3EWM8Vihxxs3UrkWhOAHyFQwVJ\/DOIgtTjY1EW2jmlTO1mNGRI5ZR8IyZpIceyw+jKoGE9evEQgrgvnkiZHqU2mP2gdLwUt7zBmsDuLM+a\/cVmx1hIyFuC2jTW\/fcKfJF93Hiu8zl8gNjIGWoV7kJ2MsftlrOETmZ98rd4lwWO9wjPYQqYvCqlvnkB6rsCgpKKV6Ho7an31\/Wn9xdfNQn+Vxc\/d3takwl\/U41WWTmWvdAKPEP6r3zZ5ekXjaFrGoDkQBmk8YbObIa5ktDI7\/\/3rB43Snh\/VE+LMZkx3rx9A72gkuLurAJEiMZxqU9J7CrMN6\/+D4eNgv35euw6LaMX18l2IiG+cfFqAKkr7\/iyqGg8+fEYNWa1l4P6uAp5\/259Lm3JfAK9RMrvfPfWdRktSWvJhWwwKtyeNZVds4iMc5ZVar4ByeWg9WpqJXIPz4C3LVtR9Osk\/DpTYSU+Ysw0Uvq1\/zM4xlRRO3161ZzbBNPFC0t7PcHb8qP4ptrILKqxaqFWXVzSQLiStM3xpb\/hB\/zP2b3T\/wQhGTheq0Vv4td9iOI1UvqU+1DQ5L71PVradgslUu+8PzYJjneqggYlr90kVR5+1hmZWjyLRnkPnynFHus0lBkvkQFem78WDUZYD+fBhR1eROe3cGdVzLrTMmjvHzQJe9Y2H0wvETz8OvERF3f+OJCuEu0Xvv2NlI19ngH+ktegmC0SGwgPrBgY6S1y5iN2OZcPac33noltb3hhuC2XpMsaubKjtG56c+QQ6K7ux0gZlrdlRy5b+cBqNzLFf3zDf4+LLQ9c3tkLeiUODUPPduJ169j8O9DHho5lAn\/ZO36nxGr64Rv63DIP6\/+UviP3\/VD7IzPd33i8PLMAKVPHUbHs1fnvaPV5h\/3d\/BlHr8o0Jd5TNi4wYzvSNN1LsyS7+V\/3qS1Ti8ejUsTBS8t\/pzVuqYP\/m19cjPcwaslnfbWn\/OsaisbqBakXoj+iCGqMADMCwVLp6q7mV4MLnzzznwMT\/J08wLZPIa8zvnBf7htfMIVsXNlmgv65lRda\/\/qlFGpndZpy4ztpknbN9xEAWcyzga7pCbgGdcZhBnt97TymZHl3qbWchu31xBWLStfrX5s2+VaSPz7LnKtzm3GZ51zKxcaJHPON+nXHFH9Sz0GVVG2dZr4aOYc8YDZkEQP+twiugcXa0sF0Wtiv54gmgwf1anqqinQfXPQRpY1gMnLxOx5fF9P\/Ug\/NfZzNkBWut6RjNOaTKUdLDSzXPsiUkiN8NLFrlZjPgVOYweHyhfFLHUXGP1opX6qfpNlUXDaaNM1Hqyqv5GuarVYosqgy1XNyCKnsjC1bJaM8e4g8j3zqHYpZycnTgmj3EadUjpN3G3+jlbd2TuYdXFQSJCZsm+OkjexMKjhamPccPj\/CY+s+s+34S63Mjw4InydMbMKsyaTTvU7j3HUoBwtGgPd7ZV6omZ8cQEI05GmPXrAHZ23+te24KhWuMZUfZL1r9mdoO8oGpCNvLN81FZCbyrD+Yqp+tG7cNIMiYz0groSK04apnKTk7qA4rZIlvXDksZMx2QjGxP1AWq0YpgbuhmctQ6GXUut4KmOuPHNeKDbvTM7huRewLh2d+RkRGfkW8uH8RV+\/A7HVnv3\/E1LvjmKlLIZcpgPklDTD8f3d++I\/6BK2AQPmP2zYRrk8PsIfll2K4VgobsQs30ZlEagTuNWV1mfOHZMiA7eCIe1gWh53dANK\/gFtFKNMO1WjPhnUqpe45Ck16d1nFdPkADnLX7j1V0Ga5IbeVVLarB+aRpKBqV2WwM73bXhvO7YplR3XqjjgLFptajL+E6\/APxACEwvhyQmSf8W4XJIG3Uo4fbcEroNYos0l2rgE\/u1ZhxR59VsXqsyV28NbpRh3DOZPl5xo0D4Cf6a\/w41\/pinJvVVo21AlKJjtzPSHnl\/uVdePaiPQkxkr6LShdL1nkdMjo8Y042yxT4guhrI11m6PqpHiK6w0zEhMp32lXEJ4foKjkB03gR4n5aIOIpL\/ktqpSjfZXqOHdJBsOM4ShWAcn+nPfMJu\/hJ+aTWDODZEzlN46oJSrKekvfp3a33tLnVFSO\/ckUYyR3r\/q8LOmKgLggqXq8XCeI+ugC554grpsfh4UOKtyzb2V0E6P6iIk8bE3GYQtnIveonnkvigB6YA2cILiTXfiZ31UY3+VT+6CVWMIbh+T67K0EHM+0Sdwuy+KfNlIRGSN6yCjmD\/5czkwLzVzebYDnGNZ\/x5tpr\/6gXPPw9KEcrwJKiJ9O5EYMin1WYXmusRtILI+Hv4xb0Z73cUPyOTCKMAWtm5Osyo0VcdDxvDysphpP80xMiojyDli\/XRBq1nrNyPsK3HnIrtIXXfSJU6a25MLVR11Wxu2+GFfhGVf4YVgx0SRr6ARRUFebrzi2MsjuJHhmHdj66\/V4mXc5qbpRl1j0MF7cHjWQWkJpkiddCK8cx3vvjXiA4a2Hq4V3zEQaNDsbfuN7mawKWsEp3Bmb\/9a7EYHNr6Kqk9FBalk2fzlVtieGr5esT1hXe87c0YAglV3WTTvdKQZXVtHg6mZCPoqL8qK8UveUdlarynM61Pjy1lnrCJeA4gyKqa6+kmgHWamhjRRxufzpT3RGxA5Okl1oq6gHWWWJXLtjFd67kYLkzvWnunt9ZRhUXUApaFsNk99Q05ngek0wO\/2XT\/BPhy1jHL1A7XPOhKQKZKX3Ti08Waxbj+A6ifrzfcsd925NVhOTup8UdWI9TqOuxdjqI7n+Ee8cvXl0YldxVkLYIXGE86jD81K+QhWpObrlOr9mlprxfI43n\/xMfdCPbkrfsqzcvRK4aeLQecUbzwo4Mauuvhpy41ZtwZzewfuVfUUHfW0c\/jzTuDB+Pz9XbWzkWCGLdmcJkgxN3E9UmW8MNOIzt+XoOrN8l1eyL5+EoVGP\/l1lxfv9T79DenxTtQKGgNvRxqLJ2mx2ZG1UnZjIU7KgLv2UEfaVXWmDipDfbI+2\/LyQsdYRwb3GZs51t4Hv1pNNYQcyTC\/+xmuyhnvu+MhgWuYIQ+pdWFnW11JlGfmqPvXefQNwrROgopgv4xHdjJfq8VXUh1GguayT0DzqhThvbXzvdVXVVoqQEiNYY2VGOOp9YVte3zFkxlvbOZd3w7PjCeoBWinqPDMkm0S4DBzZdq9Qdln2SDSMwdWebMlMTvHVu1Bu+tGv6XkeliueubJbr6CLCfLjY4cvisRjG3PHHDKFVJiM630uw648Q4Rva51anSvcflPpAIXne\/EToR6+niP5rU5t73ea9uD7qErzhkpl3uUR8gnbDc9976Mo0SojB9KLl7SBMpEf2GBeLV9Up9R3UP4ij\/aO54i\/OqAnp0\/rlHX59CY6yjI4ynpKkDZX4nEne6dDdy5sjf6ta2ucenM0xevgcXUPlBvH1NS6umkOXZ7aM0bvvSbMkfEbNbQfXkic0hfVzNFtNTECs3Ie2iGTMPbUu0jtZ8VYSaqB5\/dkHrVRJrafjPSnP9Qgrpp9qHUUfZ4rU6mzBhHMz5+DyO+Xr5VWw5BX93zKT\/2dKwDPfBo13BEYjMbUm5QViRwuRNZElS4COWM9K2cQ32RveRfNtB3mIkedy6GayjBwEfwY355+urZztUGeH0VKLdMTOdRZ9GdUNXeUoLLBUutY\/jo+PxUR52QhWLp13d5jTrx8L\/nqfhb4o1KiI4yiOgAPrAvMEXIFeCQ2e36xQUyqSMur05rR9ZywfGILa1BhFK94Vav0DLeu0t9TS7\/1Tsb4y1NM\/Rls1VcEKVtbeoJFk1jBLUwXGXFdZ1v5ZpA9i2ooqk+GQdj1repbk4wr32T7\/dHzURX6V5nnZnRRnz64XipyXYug3NXkelsjsNXQ7OtbicuelQLlO24+9\/C9EycFTuhS90E\/RVDVykzu1VNRT00nZ\/jZU14Ct3pGVcBuzhBa1zGlBrkS2xHxHhUJPq2bOUDky7J5LXzcdVVXT1N9vVIRlckzwPbTQN9o6ovRCjIeJ5Z8Ty9yDkigzsgg43ndLtEg8ioUbFa3NO+eu5hxZMZZF+sqQN9Xd\/EQegGvtrL6i+jn2mvO\/UYz883IdAOJWUbKWuzP94c75PRsjaNsOhgv05Apq3zxW3UuZybDZHVQ8zxzq9d+vvGHy+qq6nyNiy7dSjzcX622WrEwu\/Y8zSVXjKeqGuDFBzYzZnDugjK\/qHe9R4CI0UnMzs82z8mlaO5OQ1V\/\/QDRqushkn3aMyODk61b8po5da84HiWtDX4HJXWGE9tc9eAV6gyJCKd\/P8F84Kg\/VRmpDjGLZ4y3zDcD7Ghupy2YPoQfUxHhycGtdDkW3J3+UPr5dmzc+Ix3qmnm3Ps\/mQFxZUX77bJ9eI87ndDhZiYlqZfxi+GQ\/Da42iuPPYvZxHfzXs+acXEsqxl8AxVDb\/w2Y5zmyVxVdqL+jWxiH86AZTvXrCcXIUFzmAsOnlUa\/yb383Pj\/ehIFJI9i8SRO1S7OzQUNOsLinjem0jpKykJK2FZ4hsF301+NQFTwV58r1kqtkzM6Fxn27qMy1HTE3uYKiFYkJlBCa3yGufDRfgBnpZObzi+zDpxYV0wLnWfyhoRAEXTBnt6uc8hNYpPFKdiTyRSE4wFl9M41fW7b9psV9mZHd5FNUGxlx+CDF+zdSOtToRJvjZ6HzwqFiPE+i4VnjnJWubL\/nUx5z9QZWpbzSe65FVGliMdM\/EmlpxH9oljchF2sife5\/geQ5V2ZVC+b22VsebsrjdY0\/RM4pbW6EnUzc\/1C6yxEndQBCub52py0VU1CReUySea5Li1bf7wTFR4\/gvDZ1dj0gMCmVuQRxsZA1odbsjsw9LhZajWV+sIUqA47a6wg7cI9OqfeVCdGafe0myQJRmCyiFucriVPO\/5\/YVmz1zK4fTx1rqzm9GcVyTehxGrnszcGMUbrM2cQXO4uTXp2WaErIo7kEyb7FguysOdQWXytr432bPa3aVYjFRJuQ\/e4yZ7fEpADkLv02vRQ2xRYCMuEtUFUEo1kQ09FhHD2aSPjp08gaW0Xi42E7JMEd742hojAheHCeIrNqx5XdKxh5nCh+e\/YQ1GnsHjNFPPHFENTsRfNeFu6vNOIEYfe7E4DpH514Wm6me03BcsuxGxGU2qMpELlpoNiiznVkU4qjGJiuA5+28zdA7koifXqU3O52U5+I5R5+6COJNEhzuaos8w4Iwz2V3GDAdW2WAK3EMrJy0Nx8zd4Krh6lXU1fnTZrOUd56VxaNIIgcso4c5K95hHrvp83NTm8nxjCIOInOEg4pTOapIUL1hemYBGwaPjLCabitgYNGx4wbVvCdOiMEEm0iJU9Xo2O7UkJaZ9\/mWYDGZg1vqk+PgqXL+ejUMlxVEpjIysnpj9GFWSCKFyJaBt9LBwDJeRiUznS+GYX4ZNaPqDTYoyfzWp1P0dzRGzCVvs8LTIRWbhALWebFL5vRrIvxe\/Vtv\/P1c0sRAJTZzQa1Rqg7J5\/bx7\/xao\/CNTKKXsm1Gb0aNPHE\/30WMww\/LUMVkeOB1mWSxx7LyKDOH38In6v7pBVyEo5z3\/fTR8X2R2r0AiDDoSetg0HmARpm8keicrqbVec9VN6h73j1HOu2zq0SUWMVdz\/gpebNq0tVsHIuKQJWALFiBlfMc27VhdLLV1v3RxIYclAHDabt7KodBQ5m\/3AE\/wYJUI7HO7HBxOtM9Bm5iRLYkk7+YE+vGUNcKqlA5o0WtN4LDAqyW4w1zfPQVbuxZ829dozmRD8oD8sM6NDUS5MCJ3qN1\/MW7zFK+LTMtk56ueqWhrN01fAmkn1sEu0QY9ZNZl691u2hnRkat59+qRO+\/CdvL3EVWVBHFBm1oQaKa75Ig9d1Ybh9l7Yyt6tbI8JtKxBh0lOkJigzO8WAoEpdyEreuqMkcVK9bDSLmvB6JejGTyamaiEOykszF1d\/5blKMejT2jGnV0WoAA9Wk1MHy0AQIDc4cqGHuxioLd25puaskI8VYxM5mOeee2qxSx00si1vjeK6Zf92fcyc\/sn9zPVlY\/5A4JQefw2jipobm0yK2NzNjfn5KiTqGaVBcEKQ6orH1MIludQCkJULUsNVSt7PMT50tWhMP3Rb13aqdnvBqqZBpl3vdqBfGDhrQRnBwXo\/ouPZ0VQC\/MVIY8nQKBMIr8gyjLS72Zx0DgWVsRsbX9BW2YL4mLyqLroUoioHTlIwxCBDt+ohTHitV9JO38PGcTQQSx8vb11pdAnVbNcrc42uog9UFKx7kMGfibswYF9mCK1kvoln60RlPShNd61oHziAfTNhPKM3PQWOqj2d00A\/aNm\/kc5oZq4w67\/t9ull19DwyQSwgINc21coyPaoHB4EwZgUiR0vxH2RlqicslRHIhQ8fE7PGhl6ZQ1cxRZBrVuNC1MR+q2B52LVdx9WYXw2E+1qJ3yxZFc3+aK4oURX0mBy6mkklqYWHw76aHMxUss7C6yaP+7y277f5tg\/ytp\/Ui0ch57zDOo3rO3OHRF1GXm\/G59\/hHY6PVqWFMgA7EXUpnQff4MbrOrLd26l2Hs\/i2KoTyaM+ltfKbK35iwnoa6SDrFkxwyIq9fkFdhGj7+5SLUuWxfYqTkddzgpCg8iwG04N1OXK28BmV7zh9MnMrUe6U0su0phRPwXw1RyL5+D4fKJn5gQ6VIOIaDlevBKnRCWo5gjogd9WC8Bk+YWaW8ZPlXa9jkpXJ2WaqbiwPr46UZzz+Q6iGSFnsfs8b5GFil8rOVyYY\/Ehiclc04hKck\/f3X\/x3u9TwmgcD8X9TqLWwh1FhQx2Z1qsFWmPCG+mrJXvykd3L8A+mf8GWUUsY5fnlp\/BHNiXGdWS3bsIRyUt3yGoej0WCe8qYhoQCaCmtdrrW\/N7rmuV+dxfoY0qK+xf5ap2gZuJeyYUFLDWhxtFT6gJH78a\/\/XpdzOaT9U8S\/QgbSCKHnR0UaZwUHKcseGAZ\/TlnPl5a6iszjpC\/kDriLm9ijVfOXcg+s+dgUnOmFdnF9gq4fW3PnhnnUL5aV7hCtXxQRUwRzetdUHR12O2RvLvsTIXqmDmN96KOzWtGBjuerWW5Ta9Fu0wE2r\/dI2a5FldOopfPmAMIIYIGamui9irqseSY9Pn9bR9u8ZkLZk29bj1gu8oj2HWvXTOZP19Hz1Iv82Y4zWG6mYVJWffNxydkhOleND8UYUbT2YWz7TunGsZ3nlQRs0YwX9GZmwu9+7lwsFtEXTI0MPR4WOQx5yM\/Mv0GTO4evqvS2r7qrGVy6cE1S5aDc+S7TCCLh7PBhMUL2Sv\/hzdWL6ByJLdYCY\/VbNZQ+DwVYpEledg5fPyECA7fHjRvIvXGHaOBvYZrHPMHA1z3w4fXD9DGIZ\/HU8+ex9\/g8vpfado6rCqKtsWg4ZoRfXD1jKyOZ8VKFVPzZ\/XoGrRSVXAbJHZwxleT9+37VUtdYXVxlX\/6Ytru66x5AYVxvfAkaORG45HWpW7VpPx7nU9GR4MP2c9niOV45y7PCK34kqKufLh1Yj7c\/KV9YMbEeUgPXVXT4kW6JmN5bHW3RXGuLomaJVThzDx3RVPzcGqzM\/\/1qGGE2UJI0rf4ZCcpVMz0\/HUmTdOmddBmXoWDd7eiHTh4ZoAL8o7YSV1efpmLOqVyDjE6dae0UF+MyJmm\/qv6cyd\/l3nZFygaKPBGipbVqeqZAxHl1NWi15PBJO9cZV31dtbM7Q2Vl3kde5uYPS3duB3UUqUjSTPwp53uRfC6tLBeS6YYsby8LiZ+OnwO3FBM6hyYmZtm1\/rVg22J7gxGpxMct6tbcE8vcjwi0hqIHjKHPRRPT\/nVi2vdg\/TMFcjlNnkld4f1XvvBw\/1yOHe8mHGKY6jGETfaME0MoXVThStmasYzgSNtLB4Sjtkmkrbs6KG9Gxteqz9MCZZz\/G9eqnSGQlQLyLiuIktu+z4444pq5GsIlsLMz7qbtUfZ50M56fYhfORVc52mXuOLHQQPe5Sv8M9SYzGM\/jX152F1ZBj\/+sZHvl77m+rzFnn9vvev3+7MXEP719DzAmRyL\/+3FiJ3O8fVJU\/78+8cn2+5\/m5pL97Ylzz57To71f+f+Oj\/t5YX4vcFTwzZD7hNDkpLFOFrpsL4yfVOrtoQs\/AiVkP1AwRkIXBFNiDP8c7GiPjwp5MURqfOjiUZ4rVuo6rJBDe1Wa4m8\/flENSi9TcmKzy4lvXowyL8eQUFo0asD6QzWg1EUstrIZXW0OoMOo4uZxNVZatMme1nzp99LT77lR1mrDv+DLYWc0gvuQQX0F2aJ7aJf5+d2pC88Um7VYpOhfaL2tPbviOH3Z3iaBzznFwSNclcPFVPse\/7HrMKqMyF5mSqMFEVHCfwpS5gZw+USaRj8\/JvsI6obJ9QRYWO8UNw4LIKgxzvfsT9XRZM3QFr37weS36gxHFgW4J\/Hd1FGXVWagfxX8qw7mfB4RrJzvEQBanUlAgetVz4UFExLHN4SRHl+\/ReWJpZazW1JWle1d\/QciOBg1hifPetZAzZSdVESQNn6z6skBatUXj4J2eVbT77PNBoEyjyujCHePWXliJtSKKBi91fYhLCAuordG3we+zb8IRHrmxWfWv40UPs9IjFcw2K7rvNddplzf9C\/WPsoIvkCBzefdBWbR4oOU6gDgbPneeNqwM2Kl5wMUyPzJKFr3GYL0fP\/LMyuVv5pZzl8t27MTHiJJRsQdecB3krt9C02s9VZDEOKsWrn\/Ux82psNsimHlm9uRWpMG7ZaZvBH12Ra8FdLcEH6j\/y5qbaLaSn99lcnZ8z8GTC2ucCgRh\/MR4mbGcJ4ZA15sZIi43gEUixrxoAZ4wm7KHtXJrAI4blvx7fPpHcmNEw2roL8xcDMYhrvLDrM7bfAREO1bHbD3Rg7M5hiJrstTytFWQb4wcf0Iez6e8jJdPCFRNEvvlT6JkTvDa57iM5a2i7v1xQXzmChYSSfUIU0ugP\/\/V20ydzh+\/L2DOD0s1i\/w+x\/Dso0VLK5PMX35PEUH84i6Vyrjk+10T1AMMt4Kb1Fr4xJbL06kdanDXbqtbz6pk115gE+7IeI5pklJiFVziS2D31IcrYn2fc4fdQfOc3yeDZhyc9erHesZWwdXXtXCVB\/dYN0bPSlKPqV7WJcvEUafLhooIpww3NRJPtb4ZYk7ESwySP+tFTIF5Vd4aIbeHvN+jeO8YQB\/BCFRO232zbUVPtkAvf6j5fDaFTcZh9\/Ji9qSS8jzNeM6azKdui+9m\/+q4dYLjyzlWZn5P9ugXN1cOTyTQCHmQu42n3q72OIaVKztP+ZRM5oDyVR+qaWQ6310Y95xjc79H2qmiJwdpt86sbCj3yrz6dNBNzXOlp1nBCZE9HE7XMSJPR0t96vU4W26nV2oHvjzsqwugycp5mUp0+X7ceHgWHsCP1J8Q\/61RsgJPgZMirSgRwzK6GgO6\/a5n38U1gEr+ZcVC23pNvUmrJu9xFPOW\/3q9tXxhrGQJK\/mqp5XVFhgfdYgOWDHzL8975w9PfaFXtM4M\/F35zGxWCbTLHz9NxSt+7qqusPkEpbpOftZhMbZ3HlzL2Ky0L+oLDSVf8\/NqAh6QPVVXf6uU6J79MlMy7bjEHcdRxd5zKLeT1461+XTPr\/hpHEUcmiBL3fWgq69T81R4VwJm+dY0jvlcn+45ScgasOs0dtrKEFOzeiJjrGNhNpeJYGWRiFr23rddK4D1oGQZhJ00\/AF66SjlevpYXmwuetdF8so6RSamXmZey4+yazBA\/dOmWnSzBMW+bu7lDLFGhchKYGlOW77ImMx28NzaLDuJxar6rAa77kn3YcJvSrhsnpHvVfOJa5+TEo1BFLnSNdAL+LhOljaLwK65CXO+1LsKk\/itBs\/1vuLYVVDipA9J9eYXva0qCxOgdb5HNql1XRWvWM+uSazF5bxW\/Pk\/Khh2HK7oNyZ8bc3TpnElf\/7MswMme\/ccAat02IXvFZm+5ydauKcBqSzu2c1RfBsebVLdCW9UwZmPrq1iggPmzPo2u\/rgjdk2Pv40KAxiuc9ZvyGTGoFydLQOtr314nGguSNKZK4JrVKQSTntVSe5\/uU6R039ZVJVm2Pxw4sKpBafgjvic13Wx2XcGevY7ROFpyaZN0euzy5kRQf8XC96CkGUcRJlHeJd1cehNLawm5gmljALOGSdmvPhy0SGP1cdMrSZ6D7KzCLZr3vJz2Hiu88lxTzrK0qcfuK6Mjd6m3OCPL6DOSzuyg0\/cuO6mDDGRjOte\/drvU70XIWTT\/UAEE55+lEIPQM742QKleg8M\/piPRjsXKLYaZVJbD2YR7wj8+IIdo3QKlSd3M8\/rdH2xjpdXDKyRs46fHbdiNZxu7iTu9bnkDFqokp4rEcbdYO7b8AIZdK2HBSTCRUJhjuNkmWCVP1yd6uTr4zhb0ZAxevKihx80e7sRTbWbUR1HHMLLCp9fOF3EjrCxD86D+LXu4LYZAlln1GCKV6bmSxXdKR6r\/n3xQ1Iu1Hg1Oogyked\/XfU5zt7rYn9WtklcabC4+6Dk4mcFUxFJkK6HnECY8D+8Xdb7fmkU7JNzvQschOjjD6wknA\/NRmBh\/ZeHxwntUBeMhb0QvazF\/BCTfc4Khm0pz9Yht7JKDqkx5rRWMfE5hDx\/dQKheUAQllq+ixnVRWi6XKG0VB75KB6nxljmak+YEZcx8ZsX7f8Ww\/yiX0dFl\/fQY\/zHk8soeqX88LcIgOWojpBWXPdlR87mqDZsR0ynooJCngWIzzDdRdqQ96xUsydo2O9dL4JeoHn51junefmKNiva8Kv5c+d8D31IdHRg418FY\/KpfZ1P2ShfQQXM9QgF++e+QyAHWMqAP3JrgCKiHchInIYKBVR5f3sTawKgdXWtSzqOg99JoeDDTiB+pp\/+dw+kQZVRBrNyzmtRSJ\/HFLazvF17aC5yg8LTZly5289Q8J6x9ADWV7HQK3lr6NXSfQGoBv39bIIisqrwzCt\/WqnDON81VbQ6rn8NvP3Kg\/YdO4XCfo\/XZn2wZ94sIKtiFRFv+nN90T1vOe3o4Uf6rycH4xzDEbNB0sJlPgqM1er775XuZRKfsfIqJyLqnn+62JqXojRu\/ZgXDcK9zNLmM0xPek6WxmJIbNlDLLDW+2gkzuMzZ8Y0NPCq36jhloHVtzTn6zWz5VT3tnbOtcB6reo360wniXPHA6XzGrWOUTWmYgEWdV12iFjXvG5BMT0qls+1RGAHtSSKFAR9seYiZL+kdEe9mUOuWY+ay4nMAcywCz++Yf7fOV+IiHrqkSO+8YvZhrrJ4Jix9hxjgwvPoi5HvwiDYuLI9gSRFxE3xHKuacm5TU93bP6m1Z1HhOdP3\/YlztugJWck08A5Nj1EPBmnSdxmBl6BCN9I3rZRd34xB1HzF+e3+MdelcB\/z4PTBqPwzyjpk0+zUfGYUDQRE\/sRVYFqrmzR8Cc5p1537GY\/0N3vWmOcJZW2PvtTtb2jWNqxyNFNHmf33gaPqiWAyfufhZdbVLFmJ3Z510Q7ztEA9TI\/fMTKyLcdde0k5P4Ae5T71MZ0e2Jy3g+Pi3GzvyezjpyVHBey1zwbDOWYB7niKc8D43jpBYbi8lU3YQqzplTKF9Mcm\/BVakcT6xgd3nXbM1rPJGM7Hp1gX0yn\/vmdZm7co2Hm\/dn1okXyh8jMv\/j2HumRJ92OFGKQxiflc+9TLS9ph9nNXNkHvNv3q3O8zpzICqTkVSje3JpmR3Afropucr1def4NT1n4AP9dC7sWLfVnSzRI+6NpFxzLI2zn3kMHlKDq2dFHLnOL1aSmgsepg0cS7xhOEKEMm+YAfZ5XYfoZbzwv\/VTvxqMy4\/OUidLzxPvIS5Gk0xkHQSjpNf5tDUtZbTg3lohWxlpeSWIb0Z2V\/U7rUUQT8gKltXZzHtj0oJkpcC4Ju65I6U7TRlLnSw5wfzdmBn1+suuOmJKtw4ZbWK9z2nSn748U\/aMUy+z4X\/ySueS\/WCeXJBq6Mz4DOU6G1zpNzgQR0TnSigz4neOF0nF52SJOk2frjIcf1srtyQjdXrkjD84s9ZMItvVQuczY01lkd+um\/Z+jAeFXVWEB9VXkAGjLergt7I47EfWy0hUB7GMMh1WdSmgnpjgIGCJ5UezUj7n+5yNsNqX1rpiYoXnXvhvValK1pYrUGqH3W\/1U8WhSq4d5qCzulGr\/2iT\/hDnJec715kd++b6wmKvLlaHBMN7HXBaVcVlfh3gzJ4M+B25p5Q6z6p\/avKdD\/GHw4KS47NyhC3kHpp1U+CJuNO3zGIUuZrpHH\/diVGEG\/AB1pPXA6YuEGzuJNU7gjl013asL9bfkeo6G+o27bs\/0LiCMmaENlHDqPm8OpjAvYjfWUMMbrLGrmvks\/vElJa6YmoFye7UkyxODcDu1RFW5fkvEVHjefYTR13FqG1WkDxtFekMVJlWCb+29f6ya1uY4yqBEb+jPs0L31W1uPLN7OW\/GwfnM3rqAx7RU9u+34X01tWtukSQ559nZ4RgovyZjIF5XLZ1aSbhG3Xl5ikSJ0RyDSgpkj6U5Ophv6GyKFzsfL\/nWHeS8XPdUw0udTrkzxHTlyOCEW6s1jNYXISFjajnY51G97nHGy0OXnMltGqhCtRdoLJcCXxULOPIjHYer6+i\/nW86j\/awKsTke+IxATFR0eoLL\/JHNfGHQpxGRV0rmi0MjtX+idnZtlagodwoGDZqhEjRF0naOxYpxxCwc+x5bHmVoBtdx5mkBr4XU85BvsF\/86DrF+l8R6jpMrURPMt09yKi50tqpBMMgJxdGgHPfCtrPoqsdHuZ+2i6VaClUz\/Mt4xn1y2\/9Y1TRsfi6+riNJk7cN9suNdsmrhbkBWLVUV3VQdDtw8x5TRme38973vz1nCMj86Efax4uG6cxVkARRN5frusbhORh7qSFNhh2s4IFhu9buqW16sdsK59hm3qIvuveX4uzku7NZvKeDIiZmK20+eZb7oWvYnJtetBcBEdU5Fp7bin+pleZ0zgkFUTva2RtRFcMP+A2xrPFv54JxWvf9u3fDjXxtvOa+MM545CPF\/sybep7Tcp5\/zfj7VnLVIV4cxAVnZE6fvd9vZT1zgmfeMvJ\/niDcFbdFz+by1945kD9wo9R4UfDz74ygF3+dDC9NqLiV05VAN7PoRbsRhX\/2LThVT96driE\/6\/mRHaXLXJ3HOOBL7yWXRSHbiiFiJNLPwEnn63sMHgt48xYh1DEp2zMtPxUvVCnXS9eHLXg+ofsHoKhxzlh1xYwQNuaPCWTvlWTL5U66jKuCLYH744Tx679\/JyF0fH1o5tw6wzMD4l8NaQbABYybriUarjxFQu61WVq98M0KiQCXx38wkLWZ+Xf8YHY5izqt\/+YRGcNX9gnfl9O\/66\/iiI+UsvEjdTJHBejZqSaxb04l655QWwsMd9WkMzMB5MDV8TE8w0c5jUd3syUP4grJyXEAiMgITvko96H1Z\/9p2EE41zYhT\/WCZ1VBRMdnpKGFXOfNmfArMvfd6IOquripo0bX5L\/4HpaYe+F9fTwaNE5hp5aDA5l6dDeqrsPF7IaFGsa23KgaM6anzp6Zaqxm1TGNNmiurR6SJy1ufGJlwQpiElpvnKFFj1AoVg0QC5PKH2OIs8gk7VlkT5cQTXk4NNTsiTXYDxWSN\/6rpahDsgZKbvZ7RfDNyPdRxrx6du7lR7o6Qik0uQfGpYeq2M5IVdTV+11pVJ+rW3ZHwGrFjRkTcerfqZUSu3MB34q1sDfuGCzjiweDuq3S85O6qo2xrpKhsKm99RooU\/BkNnJkuZ\/MFvpvFViPPWe\/OIpUAX8M34f\/UbVkfFzSBIf7plWpGpdgn7GjKYyKt79RfgntrQWUBYfoy3TUsN+znKp67dppRRm3OMjb6qqcqH6y2PKtaGfHNrdUTbYmukHuq9BCsRlhRzEhNU4GPd0WNXIzmUoQycDVyFoGwWSqt\/ixxkadHY\/i+Hdw53+cy5B3tyT78EDSfWEioMoCvrfA2v4pK9Spo7XtVV5xI2kUBeLoySpO6S20YozrXKA7XKODZOZL56Gu2iqb98JDrvXL0VGQ1ti0sS3Hu8cz0lfkk82DyU4i4q6JJXOh0g5dGISoGgoyNO7jl+FSveDV6VCaeCJQTU3wemXLGXSPnHvMwbdVHv3FXMnXyx6VUSnIQBrCmiUCZhrrJPtUxL5wEY56KHNrJo+01w+WsVHo0gQZOjYaDQArnDiLkO\/3ixaao2\/0rvTHRtGac7el14zc9NO9ffz7\/jnqv3uGSXqZiPLRd4CfbMLF4FUPw8vSztRntq9MuinVOqkGVoVVE9q2eRVGjO8hUI5iXY2h0qahE5NxZf673IBdzlLgHE7AHTs53jPliqFx5TF4cdYdA5Ki7MKpcTgyvLdS26K7z4fjmoU46uC3boFhoExXDfEFz0Bm+Zt3APGRnFIUjXAXw71sLiV3GfbpCa6fbqaGkKmqaWKPL4kSlW\/VoNV2NiwxXBeBklTV4iKGSFYtVKl0VCUdtxZZbMj9ykbVy42Vr8IC8VceWNqgG4sqc+rMMDOfUxdT3daVDhGglUUhm6tIHNzB4PUUrpS0dp5Av+hcpVgTY79zqACdz3NFzqko9ymlyqjorIuRZ9LzKwPjbex0RuW3PxA2EDUYOY2APDDqal41EGrVpjeH9bqzHjsSTPJT\/o+d+MuVev8wRNdp7I2lNLYcOzqIcrE8mzckWdVX9y86bCOiIOVptIMq\/6wt1DCUXFcaJ32X3V0GoGFSL\/BOn4nNjodKdbzKGoI9osMJUIZOpmZVTjl865JRxG4urPGuBV5jZqaMs21HjYcsx0X1wEkYHL\/ARfYfpqNBwF9hR+3XZaYPPgyZD8ps8wSvLBuUMq\/i3WmXD8t1ENJwC51LtV3d6pvBcavz+imV1UU4is+JfPoNLQXFxxnoy8zHXoNbvPllW1v\/8CwvkY9WsO2kiiAio0mAOhrBaiBrYmVlzjdZ99Oyub\/aYuTwjuxIF7u7itXJu2jy+sYeX0cCBmFLLrgYu1nAJx3KV8pRf12YdMeOrG881q4xUtDgemPkYc+PU6N6OhBFjDDMaPm8dXikjJp8Z875z7IyPz340nAvr6PsG5Whgn6nBGmzGketF1Bdz0FfhBlr3WQOAZsZ6bqpZYARUXsAahcSlpQ7hDGPEHH6+K7iosorE0IP6HAGT\/ToQWqtOdsy6MzWAIzLaMIRzebjE6wYkbWKY6kB7whW9IpgYZLaPe31iyvj8E7Wup5qYyixl9J4n21Ln8tXiOSunyZbuyWg+jrwszJ1erMDFbB1dY3wrOUbGmhLPZS0fK1vL33Gsv8KqMKx+8DyFPVmzcMmpjeyCY5O733WFCqtbeXbm6jtRBPFWzJKrOMjkuqsOV7n0Z80T5bJnmFh+pd16g6\/JaljjrsrCHORCZK2qBi+pNxxfM44jel1JnAFON39PiWTYxKe1lX\/Dhrgq\/pKHqbK8H6SOoZkFRw6uQrCvEE6u76Fozt+1Ir4zeYJvindiNGh2\/lT0zDsnwzus4uclrkF7tzcxL4d03QrWQBncocuU3TvHehRi3KcQBS\/TN1x4eowGns8Pa+L7m9kXj2WvvnP3K8PxnIHTs\/6uPiZPZCWR+A5eHHd3A+ZghmAEDpxvo9XjFr1xiGoyuZFzaBsctZ20hSLIs667ijeu9YXb6r8HF9WhjOMZQeIluwVHKjPXN4qU8AORgREZWbUVBkDx63Tphd7kljBuskYL+gvqn9dQaeYv9\/oTMT6EWHf0u56lmTEnrkmK+xl583H+Bg6DC8jorQO7a1GccU1D\/bu80Sq8c3j\/KiFjU4+pWzLnLhN5BUu9EloF7ipkFZ6WYS9i7yjPHx3C9TV1bb3Hfn1duaurLKiizCBHNBZBX9V1o9yq0GEnc2Ce3OXfOt+OANb6ya5Hgebmv9Einugk1QaiqsrFjE7B+tv3j5nwgok5SAln1UfAWubtFMhPK4t3jtet6T+K3NSW\/0vrXXGYQc+eaKs5cNWkcK64w9zdMRYfqH3ZFWYDP9PD\/JFbiGurMZVlpYDWU3TOkF2f+YbRaX0IL9fbcX\/fKzxP0c+q5Rvv6y\/ItM6X9vxdnbnYqOb8e\/jV0Rod1o9WBjQ6FWONn5PAafA+lWFdnEtWnb3\/jzEaM8Zr9Khf58HPZLvOotj2tev18gFv0YZPLvPse68VlePohbyxEpIBHReti324U99E2\/pFosZcrQoZVXcCBokW\/xVLjAMVN14yGqsJv07klNv4cYVehpYRjKHju7uLtt3G\/FxCK1XtmNxXz+Yd\/EW4hjVNRMpV9jFFq6\/YiGauZzWWg6k8JpPzw6zRruSFfnRk1bbNrTE04q3NB4\/4squ5qnKV5q0VjpHZRTXZQBu5a1tPIhrkO8Z5lU5Wg5MiR37l3jb011pB26kimDgrh+4S4YVPF6\/iRFBynprq3W71suN5ondEPg2V1SfOHTNDAYsgu5759G7mHZ\/SmDPXZLTtU8HZwXt9x6m1o6buw4q9muAukc5IjdrnB6zbQo1eTarPDec7OrRd5xjtqcaE74OnOII6X31VRsScokqPUnyv2mtyUTZahmXVUxXmiZrgRsbkehdMHF8cbakWZnSJSrOsYnd9E2ix3sCnPLFMezrW41U5QWdFDenSqsjV3VZzeWhGGWyAikXmqYVsTR9lnIyPait6OnuO5i9aFa5UMetX6y42EqD5dWBEnadRzr1t\/SzLKOF4q8SW9cYcWHYMXIl3MgIy\/KS9OA8O5LzVwIzU0ddXUtV1L7insG44BmfJu0VAcMkIqvn5bQbI59hwt1NJPilTt1SMJevDs3KLK5XiMS3AHKjWZUcFoCX+nM6AJ2pDru0KEwbiT90EnoLXVRLrB1TPLPRnPuVTTgO3uvb7dhhyNoNjgFa3XARNulsLM8mK53NRV1jMd4vLRSSzJUvU0PRbn7YxsGbPaySrYXJjl\/roynJdbHouhgeEeKVqIhppNM\/TrK5R+TjhaG5dNbw3LUVry2J7TZl6cydh+pwW+XQhM0E1zp+hY1bioUG3o1elSkUa2nZqherolyZ3h4nLyvkfdBxl0nOUizJ+5ihjD\/8OmHVF9Jy8ojlddVFptxsqyzAHXZQuqcrWaPHUcuo2Y3\/cNzo2Y\/ZbpCaG3INnxFWYaAj3jxQlxVYdqJg\/TcUxHRvCibiE0HzWVfI\/TohM8hksKo1PeR0TEDvmaDs68mpMWJhjysNqTt1rkJ4Ix9lltqoVzuscGVhnDBl9Rq13ySqp6K9aFi2M72WriWDOXB3o73ig7nSgjMTmb0XK2eRbjQH\/qFj8TnqpAqK1h5wgJEGD7UAb1Tiv7C3U0wJcXF\/H\/dPL\/Kn6qNbG2SMbySgavkSm8ZVXHYm0n7DWx5TgOlLiOKPdp8KGl2\/lA\/KP70Xa4QB3IrOvIy+GfN2Mwd7rScNnnA+3qU\/HN7x3usWIj0lv7vRlJDdrXQHXh6QuyQ5MSDUSq+IVz5EsUA3UWtkYLHwDcMed1sB8f0otold6lO\/oQUdaCiLiAKJaYaVpf35fvsd95DhHJ6quQnVk4ZJmtRoA02ddxJw3zrhGlI77uRP5475jAiKwLjPupDHeDMM7ukx3N9CP6E2zSieq3nTPFcWLCtp6Y\/ntncg93oO9jlbCeUYQlvrIaFkD4dxYH87EUcLns8yZW7BFbVPFozq5\/hV9iddKiYaxxzX2rsBv2nlawBxPoc7TOL\/z92n4vZKDnPIp8fqmFPjXWwadn0FBf87+f+bjZ4rDsjOLRBcvkW\/2DF5QynJMVciY4C5QHqIJFjj+NAVGPdbjaCuXzxeKGlTNyhdldQ46iFR3GTEMeXsMYCc67J50KvmyDdeRVWuhmhts1Rc16\/7uZ6D0ELSg+1N1WKcZYXGMwlFv4LsZYNr1cjKwv4N1NMRMdHyT0wasxyThv3sgg1V1sBoSlmBXhLpOXDiuupmyT1yoVeoN3lg2CT+gKgAwSBZHvRpaRqAMYbldu9wrMIVKIlOfZrCCYby3oijalmtXHcOC3GsTXNarwk+w5xQcbApqXj3yZ2Zvj6LiWA9c6laZu9xeNm4UJnYT6VQQzDEc0rlQEzgwPBTf9yQ6rYSJAZ935\/3iNhWLAoSRYKXJ2Lp9fu7+fY6GE8UvlWGL1iWKBZt6ZOYMpwYR6Azal75hgDmqvkVFTAvVCRWaGiCK5ycYSX4HYYkssVPtwRMR8Cc0tlHJjEDE6zipI1j51X3r0lm9iCzu1yE0Iqhrehjm9q4uM728kv5nio6FGigKEsnEM6xZVYFTggmdIt8hOoCt4uPu0cJq+uC53z4uJspk5eN6MfAY0ag7YLQRme\/Q1EnyEs1d5j\/O7E\/lC8KMVyZPjH2qTFYBz8F9cl41mJlWhXGw4kBUEL3f\/XLQCy7jcsi2DqQopLIzru7CwbqZIeq3s4eB81r\/BYHy4D1RUZWBHUQkqIO9XdHDjbTM0bRmCyqANVUyZ\/0\/MUf0U9GvX4O35m9wMz10L6JoLFNS029twQqMxKiXBdMeleFuye4XUulB24wmq\/siWEUtFyer\/CzHWOunlUTg4i0PHQc0b2GFv7+rpZmvXnYu7LOEHcy6etto98oY484g6+KIrzFWY1BCQIHjZA+5nFc\/R1TKq4lgeisuysSuw\/NEA5WcugKFxBWMoiF5Ny6B4\/GR4Af1bu77\/Vrgg5qkEo77dDKwjKiqCnZFQG7hMf\/A6EVu1Kq7cI0evdEjSti+W82iAIVo52GGadnKHIZAXdDszh8Nwa9m\/rALiqi7JNrNeOoAvlGJO97GjGrQfeABqEb4I7F3hbTxoLf\/5g9kMWqB6MPwMB\/zzszCMuvkkh2fb9Rslz3wVqKAqCbOehnYbDkVfU7fmYveCD3x2cgdW86T9es41vGpw6CrSMGnhF2OOUEps7nq1zkSYeIBYhmL+Zc15Qs5lLo7hWTe8AR\/ZBZ5w1YX86klueXybMUbzY1p8IoqwVFyufNiBFYieLk8o2FV7nAeeSCyevO6oao7rNdW57jyB5iltm2XKJoN7tHUJVrfcjsqXn2FQTiW\/cFknR7wCpltRukYXM2He3oXJD6AOfZcnJloXAXsZzJav+LQjLUOggM5I5Eqfhp3nEzG\/vUCgsMDMgTxjzPh3cwK3JOrOMXgSOWNYkXt4OlyLRqfSk1bw\/KDc9iASFcRE0viVVQntt2FXNVHr7OeZoSt06mHrz2umXefqExWZHXnECYo5tdXTftzXSn+CqfXz2sm5lWEVB3MMzkLGuvBM\/LwUPELA1Qjujrs1fIyqwpg5app+pjjUSu9LFR0Ee2w4OpbZhZXA8bZvSSHPnEAzM4l\/VbQOrTmm\/XqnNM6imZU02BFeU19TV+swpKxXeVSozl+2uSpBvPuZVT\/RGWpb7JvtaPqDfNWzVO3\/A62wIXZL0LLV7AWHAdjwpagmozLbB5lBogT\/YLlaUQlwCE7zjJVskKF5LvC8ltVrnvK8FA0LFySMXVuMI980ioI69Em19nB2PSQVzMbNQB07OqVGm81RfWjmYl352XtWdtEh\/gUK3JZo17mrkeEwVLHKa\/ViGjTrR\/DhXUeVCM6F06svyiDhTetsjL+7QTBoCUk4rtoqM5FA9IXTmfQl+f551gqnSguu8Uf9vj1XGQVzVDPdFsqpSr635RQtaFXkKbizs\/sysmvv\/jjWP4ySzhK\/OmQeE39Fe\/GpZ9HzRzkjTACEdRdxQ3CIDjljGrXSYlDAGK1k1sQkhjHtx6uGBE+BJ\/C96cezz8xUWGK3HMvxNgIMX+\/fwylZxyg39\/Jlf2KQHnAketJWnFhBvNFC\/Zkax6ZWVYd4UiqEt0P7wZhaBVIr5YUl3LzVA2OFESiK609q9DMraMSwZMLax3XaO2BktYAnih\/u5p19wN2Thvkzrqxpo4py0DJpEqtEwEJ4bW6KDjFPzoQxvG6hOhtuGPzjMsTV5ORsFlUv5\/QR+3CzniV1jJRxUnCK4196r\/uJiwMtwU04LjVKXeSsaIqx6BPROuQF9RNazlCRUNXqAhfJR8yNz\/Tr9ULQkRhfsrM0F1wwTGMnJGk3dYdeoJaJQNtj5n0YNiv3mZeEyvWyctUVhcVYOZfPiQ21GBGUl3jtbBF4xyWN1tRPXLAHOMowGV1ZQKOF+FYKgoPgQ6r3ox8dqJbfa3Apjetww7Vn4yoZ7EmTR9kmbPEeD1DHQeveuYcLQvzurhFSZjVk7VGnloZBsZRLDPjN8F\/4tjrCFRWxpSZhvcSsTm32PDoHz48TiivfO1n7rIjR8eDm59ig962SMr2IsZ4egw4B1uy8aGHURNp4\/FyFMwBolPd9QNpHSw3Fs0M\/hI\/Z0VTB81r45TaYcyM9BRF3C66Ut+MmdxRW1HDVAkrGPUYdrvqpcpEAe2IjmMOXyceRIr+jBbeLpnNUxEdE2hnLdHaCr9MbOBv\/sj7sBS9JK6zIlxPzjvgDETws5iV78iY7Lac2GrRZTBG0G810buVxVzlkVQ+u+Sru7QgzxyKkov6uuMC0EZBoLH8Tv2gpWHl\/LWiBv3kDd6DSYjDMSHvU4eTGK611GcTwe4bwnp6ZfFv1M2xesGxgOwiw9lUZFmzbg8UoICoTpmy0QA39EZsyXaZNfE+XYL1Dx+HXXF4DvWtTZBh7ahIqBCKRrU8zqd7PczfUekGGQdZ8PPHcy9nS5O2Jvbhba+3hS1TX2JHvK9f4rxGktzK1cRp5\/A9w6ua2j4Y0Y22SjEYbQVZy+fCnQc5OcWwrtVZ\/UJHP\/MIosW18xLPDzLzEumlxq3F1m3qwjmHq959FPxFNHNIIf3X6Zw3cabTxznXv6twWkoV1qviR1o59UWu4eCVUzCdaZGDIjVeyUtRqodgzueblkdQqmQJVRDxvCL3mhcyp+v7ji8Wy1EoPFwbhsd\/zKzY+4E3xbcRiR7Ux2U0uJg6CngeXwrC1fH15pnFDC24gKemjSgwfxKV5M7fVM8Zjcf0rrTuamUW9U\/8zJEwYzLSnT2xlxqjbsOYrZBkx886t8JbOecb9D3koNNfFqPfRCm+Gy3FnXsVhn7Fdfk5CLwqhNtgs8sxvVE9HEGlXd6t+1fryd+v55MPnQF82rylF3q19o+n39799ipGIuMcOhnb9SGe7YmRmel5lX5kz8ws1Sa7+4QGRqpzFaHG5tgS9nvnZm2c3t4o84mF1h\/nqfpoCXMxM+cAbIt3tk6fHQxm7njlife8Vl2PMfOeg8qdRjILnGCq9xscrhreC\/aDROYTMa\/TqUbOkah5YpxSSPFNCrJb2rvARM5GJFGQ+WWCzDxM6kz7U3hkkgo3DBv3UwCwTV6fuZD\/ZBvOzzWGwwqW55DrjE41QLHVUQ5ohSwf1utGL8Ip5\/HgL2sFXMKCU8+\/NcKVw447ituxz\/zJS3BL9DMW4hPOrD\/aV8XpVSArnEnKjDTeNIxqreVfNDzt952Mo5WbeHYOAnB91PG8dTdzSeb5NxnWc0flO6fu7fRaRLNWp3mxI1rWg9X6eg39G3yR+MAAE61wpusD\/XqiUK\/Dd5Rai\/rZ8D81sOuWusLmoFWSdSiuv06BKIdx6jbLx+IsuaDt5eTjBJnuUYp6MlYsvC8b0lMqERVcxaKOqOAxn3k6drKobsgavDI5So0k2qgPqrNql3ezt5kcporqIV6Ghu\/kUsZcrlgcUYFW6vsvzqV4r8c9foav\/lKJ8shFG58Erx9vN0rNlaw70yQjjlE3eeMAdYxJT4PXo6ISo+7TFKuJT9Q6VQoeVL9lqCLPnKo36rCvz6QHb3y7iz0Qfbha7pqZ+A1dk6Pcc9uew57LkK7zzFTZFWRtboqCwILrMtbS1loqLWWgB8RDwzt6MBSlNScbWyd4q\/IsbKW3uVVmo8cITuEZD1y1Y4PF5rjZwUt2525h1AwGUo3oGYfXavnOyBG505mowb3ghFldDYKXalnvA8M36c7oM4ztNZIvkqygfBJf+seBtqrkE\/TQWa7+roqRLxm+ej3ZCuuqtvjYzvXWgLikrgquJuzleEb+R0d1VrIz\/AwmzJDeUqWa33l26S\/f3giPya2Q805VgOJp5qKXgrFSx+hb0TTDgXtS2XEp5biiuTalvrouGAXqCgUWcb2Sd9I6XBKFiEak\/\/L9KYJYoR5QJtYYuPkw74y7+KA6T7GoiPEMdWLz8c1kTPTh5lSB85VyZN1E3U8jnfmNY0re5\/MA1HC4FTYLP4MMVmIda\/rd61vhxEFr5uHdPMwQvuR1dh6qeonEYYM+ucZdxHd2VF2rIT04uhxJ5NNS+DcVYJ1l\/PSa2mGuZIB31Lg4peVmxk1UiR2t\/623VlKQ0v\/NoapaHUE5kXiTzdZpfkD\/QS8xB6sirj8HdQyIvmb86CoZ4L+2hBd9vQUI4a9aqo54D6VqiVY1PmVx+\/WbFY6BrfUbv05AB0ecmZeRDOc8+1qyCP8SbVmB34kWvfnbffeqR8+7PitQ13K9y9PJwGoFDGPsVCZeeXFglclIctXlvHxfbiQ3W0tVejkLttSxFF9xIq3nzL\/6mawxj6J4XXIqgHpOHcJ\/+V9SkspsxVX7wn1TF+0hLf9qKuorl+uHHO+prbFgpiDoUKxmnV5M9aFmosQq7OzYMep8qGfQ\/ioTtVmUBh3WKU4HfuHV3zHj4GRMnzSSUqTn9Te0wPmwC1GtaxjGTz\/gpqMMpzcfsH3f52xaAeEsk1tryVFyGJcBd8EW16LsOO+NzHKvBb2Vw5g0njB\/iDcOtfNovIJe57X6IY+YH2No3YEYKsvo0FP5d+Mrji\/a1K3ZKgs1nlb0+uvvuPtGY\/N77MUcG8flc2JBttS\/X1adnGREYRgxJeMxD+IPo4CkxNE9wLSdbM4rE1kUEP0kk4MlWDrR5htpyecgAEWK90jVlOkARhDfdjimnkAccsyxqWpltQVbeIuOBgbAacRx5Ldmoko8HiN6UsdUTGfu+hXdSmMTz4snLit1jyLRhz3xSyhaMK2S6n5aDVRlVTh+bn2b56w2NjMgkGgTTTXONVL8WSYdv5YqGO6TrXpcz5ycJd71GYyebDDjJqhVDGtwZdP9EzPeusn6D2dljdgSaABriWDG2d+6wi2vp5HgZpHQmc\/x33CH6xPbgGUKY1Ap+8Bhehl6JboTvWkAvE+Y6uRAchnPKMHboI8WMtvs7oW9uAe83uk0pZxU9ju+hxnSS9dT6LnZTJV9v\/n0l\/Za9Zc5k9f6hVZPaupxUnV09gxTUemtQkaf32Do0zE0gVzzxBxrb+a7rFquT95b+3x\/hpwCAlQ5dYZ+fM\/PrdPnjZCzSu7HTcvDW1WtLu6Ig6uPKcosyTR+khxVPxJt+4Ub4T7QYUunoMuB827mTQxzNE6EWFbV8l7X1TyDZj49zD7u8Gs+ORw0zTeNTFjsIbikbKvS20uYxrUUkYyyre\/CY4s1EKJPmbF5PiVO9vokkO9d820sbP04G\/6HGalK9CIokx+7Nxc0pN6JZ\/Hf8YVNItf+xDGMV3\/Fe5cV\/Y1HLCKfdUt5unGp8k7kcBBFsXedhi\/3zyHo9UYPD2Q8zuWUSSQd11YrkplGqehDCYkd8\/+NESwp\/sG1CAWbRF8dl3v8XTdEbGDbyXQdPioFhte9DZbRZ9B969PrDz3ADdxz2FN7qQdr9kNotSIk2xFUk2X1rgVhj\/Aq6k1LxRj3Q8ddLK6DDOBb7oXHRJKRAjnEwvTChXIN9UWewvDT+XzXTwZNNc7Q7vjHRwSTMqcuSmT8+JygXwYWVXAs8XQEHMfrII45iQB\/2zx0zhxzeJn7XeuRBykzyrIVXFUfHUUQRzuDZDGIrUoGZ43B8kHYGhTCs7j1UEo9J5hGadGy8ma3GIYdeJ4f9UEsyMnVm6+pUGmpPkIdMIa2IUcQz0QvYwQnuFznV8ZBw9a9wGeqV50dPkP\/lxrCZ80s8lzQcqIVbTYPJ0VaEFg1Khu+uX2Z0dp+UQgeJgp5znJZU97EO9XNJPbUK5xjOyoc2LZKwpFU27oDgj0zJStx\/105okDwFQzCz8FMdoZ55gx8eXjfTCyTMo6X6a0D69f5WfUzillnkEl65L\/ORkaQCait49JlEBwd3sSyO+woW101OltGTBuTB5Amk1exgzargJoB4\/P61I95OBdG\/cHz0yJP3iA2VQ7caIK1XoR99o4aZnc8q0l33bUrhYkG39ww6g3XHkaJpXUZJWGW+P+gjLXQPsVtOLOrxbBSP2VDuzNWEFRM5kxiVokfBE1MVk1g2csvvVK\/dRXzb1ltXp0o+Pxb8Fz330pQ\/VohsV7JRZ5WOj\/fVWd88rnlaYvMwCJkimrcvdgwQ9GKVnd+Q23mnYo499YcfP1NxbD7CVrnGJ4xUS4M59TJzhG4ms0V71Jz1oM4LQsH51b+Kuv6sLTQmd9RsBiZnDnxCS3\/zDjwwJONxD3tmcu6ZLWnuwjR+XFk1gO5+BpBBC9HQVLn49zAhVwUPSlvwyOnoxP5XN161C8x7lzKUVx3KLODMbBjtmi3syxzG+dkd46OdxjYzRDGyddNBJViP96iuDMG3d8v9uldNp94cPbUdrGwuolrIgfloRw\/z3+Ot3JlMtUNYlMn6HbxWgQRN5l+WZhRcWw4ACxVf1SLBEi+hX90PzPy3HuQPuED1iPgNRhOm\/KiMq97AsXrQdAO3OzyqPwFW4HOPA2vrkK3JVaGucNUHaucJ65n9FyFtt9We3TPn8\/v0Y+jLI+nMciTnE4p43Vda+68fnzcnIEXSVVU6UXhjZE64L\/Em8jzaaRXlzjneP231Y3FE+erIjjJc9WpN+L0pFKDUlwD2lGNbWaqn8k3vKg+oJngvfw8uAKtQbkxBvfpoYyVKo+ytILBVBj6Vq6ru6luc2bkGBEzIa5wb5FS1e8o5qjkl3f1U+lvMraabHR4kpB48kyiw5+igdxXZfXY8+3qxgZFZX5FY+qaSA7CUOtq+o7t9Reif\/1dFZdsywZdOwZNovb4tmr0ODHmR4U\/etlIVUvKbrIBq7yycn+whiMJ6JJqt8wM9s3j\/LTPVG9VWB3sb+jb5Cmec1o30TmbFXV3cgaAo2313yD8EOTvF0v6u1VWmXXHuxlvreCnhhVvPLRBDqujrOiCN5kT1SbXV2dUDeeCvwS2uQ3C5\/XUKFUK3lT7KlBiTrwmsSgIPiz9fT3nSanVTDJPtYrl3WvIKNsXUhZWzP0b7C1\/2jjKBSMwWjBELF8H76yoV9Ta+iEbh9geo9\/Edmx1wGu4yqIMd5f6svLjLr\/V3sy\/359cZXi5kZ7S0uQDNtPVrzOjiutJwu2t93og1H4imZ3i5GpajNKDwvopGOiYpEd0FUeOxQCxJG7iof3gY2HTMBmxliHklanQ5jD1Dc\/SfqsXZa72qGH1GV+TaYHeixPdAFxMrIpNWHRX6PmpXFCFSOYzjqI0o2+lkgFGKCKYLysrqsMK9WczWM\/dlfNViJzTccK4dTDMAN3gOPLRqqir40wqBOx+z5ZkBiC49Z4jUjN+mwc4sGKdg\/XRdpNHENUKGw9cLDPW6WYGMAdlVzmEoiPkbBVYfnxd24fK8mscyjJ+WSIRgGl4Np789Z\/vzzknEDfHuVdQxorKnb8UE2gSkRXBcDAz9d9OvCimF9nfttQCo+kRm7dwTiOYfDIeXV65Zuub2qIVqoYcizXGVyXpMcuQ\/d6IcxB35OmHIwbBtmaf87kC39GPuHo57jc\/IM+x2oZ+jzi\/x7xOiNhfS3IFEZLrZuaM0zq73PHqiwuVS66qBuUYY6qj7g5E0DXI3fVs\/JIu+9nFykhwROsAopj1Tmh6z7X2rj7Ju\/VjlVId6v+xJkd33PFhw1pz3xmOKH3Ba4MYeB1XF2ZEX+GLVGQVAcUI94dDGQ\/\/ln\/bIr3DOzCxjgF+kZeC9LYW3tF\/bC1N4RDPvD8zrjtBA6P0VTLuk8azDgPXhdZdVecTJth42p7+w+MwUVX\/uauXRecwVcYw2caCvHetdgS3+\/Q5CMZcpURDPg7NNbiw6TTIPa\/zP++uyxn2NfhKHVs9OpwoYHaa5uDeF8HYMwtzSSyMNs7ureZMYxlevMJn8iV+JqPIkYl42yx7UnXNH3kHITLWOSErXmdrT+evwMT0kmu6XJP5fk1uM1xeD6Zzpwg7HkHm5CbH6OLm7uyJ+e\/1TZ6NPPcEo2qNWJ+m6XXR\/qsfzKJ5VLIZG0jMWNjtzBjJB1dQ61caMaIIM30\/1enBto0X3B0vpbNSw8r0Sa2ozQSaKdkWzkabdFBwstpwCkGO5MhUUXdGml+qccaSSFPBcgiqNDnKjgyVB+4SAnQclq36UZvDmOXAwRMIby\/ULi1HY0XheadbjagQ8iLVHmbL+bAp\/EQV0Pt5iVXIPtXm2q5mNI5GMC3XDcFjZcMyaN15OXKSDXe2tbo9nQoRlAv72eGtIXJ2ii8CwBHxYfw6vcw57yXiiSrsiP7pVvB3M3Yjgnqer7A26YHedv2QOI6DKnYZY26U\/mose\/G7A5DElxnCEO5wwtNFT3SeWDIHZ0f+xfLgHUahAhiTf9Qurt0SPdQZdmRHNL6TO2cyp7dSjKSxkHVVU5ykUSQes3\/H\/h74omfilZEWyzG6xSJjgwNQIuIMP+jsm8lkj8yEfePLcQ3J\/Zxbj\/M6HetdrrdqiRjoSL8Z72GIqLHjaBWjvCAJZooLOr2E7Y6jdfJhC3tqTovv3qVGRb4cQdzw3os8cJ4q6tqsrnLRAEaos0a32ZiQ8v0pRVki4DpCVqjbWUScg6Z2rIJz\/uSZuIDdRGd+V6eqSSjPpxOJWGM1evRp15wsSujFuOvO6Ierma33aL8VPEW1+AvKJ6X1pYseUItaDGa\/tc7jOfYbCupHXIs1muu+aBfHlvNTwxC1CpR8DpKDrlb0cxSRkvnJqMhmfz4Yl7dwkeMEwrGM4PwtOK+XCwJaL3i+HVnYgUGVDWVEXtN9VI2Z13tFvVqYOYVXiII1zpWEcA0KX7zJbFRc1TRzS7yWqRyVfJeobKRedhDnjnkRj5Owvpc1nbZrNau97F0Ud8RPfVElfQ5iHAX4mzUejKTPOG2eNTQMMijLdxgnV2XS4AFtlr3Wuc07Ux3xxDgoHTY3qIe7h8O\/I+BA7qmrSiZe84rsiJfRW6CBzOBUM87ya6RjKuORC\/iu2lNPk16\/\/kV8UdxIqJPOGMTNm65gwH1GFf3B98B4dSrljrDDMAowzFW8qcpFThgStJWE6oHV9FMkODaqWaqxXqCL7uezoi6bMSIZMzHa6IlVkOhvug9VnBxllBvhoDvRNW9hCZgzK9Lqe5A\/v4FBMqEyUqNwzP\/Mpy+HL7y3YCJaRhB3jBJE+rMouHWOkQxlpN+7fiXe9VDHP2IZTMGC+kscGm7JFmlB\/FNFsElw0t+OAUUMrMmd7XAjqi\/LsQ5hNckKMHmI7nTl0yvBEpv\/TnNzjC3cOutruwpmNnAsgyXiqKaA9CerZSJmBqfJJrgK3VFw2RmhyYOa6ScIiSOMXsyrQYCf3ed31wDGkFGV2zpaEBa2Qnmap9VuUJpKgLupLLIw+nrry6zTJ8Z8QmFw2MyUo1ql4JvRWDnMG07RPfI+CB9HyPwbXVD+5W3WWN9fRh+PsxWZSFHc8xYooaJUhvHj6KK75eUI9Cuvd6VS7dK36UHqTbuaYfzFcc4Ne2V\/OFya1SBAYXXO\/\/rt0DOnzGhgxJUFcC+VdX7pJS+i6+h+eGBOnWvL3iHu\/m40c9cyGT12iMh97Vwl4qQz7+AEzKCquQcmSfBbCqeRrCAC1+7VsKe2nmky0MqbjJa79O91uc1e3gXp0TrSnnv4yGj1IdtO5CeMqLeYFwcZIncRHMTwjAX4sjoRXGQOXQ9l1V68pG1mnFpIj9GuZn7XjmqjuNWx8vt9hmgwSH3hLM6N8cmeYJK9k+5YGYeJBZ\/VLkMVPzO600lwe6PR94Rt0q\/8uKrcTwVVC6mhchb4w7nQ0nqA8LfaBgr5LyfXIwQ35me5C54Ol8x4wRmZhM8yUmOc\/GT04Z1BmTuIRUQ0bgA4fcktjJhvQ6H6QfGxTrMaTkbd+FQ4s38zyJnUl\/wFDmT6iwyv04aMS6SO9bbyqPEisM6mrIyqQRdgU42BCRMfGLlcmZkmw41\/kcuMu0JrLIkIf5h919WZpfWO0xajKHEZgAz6v+xIpnJinQar0ddjt7ow+M79w2SFPb+8NkwJ9u9u70l5GBRHkxm7t0gPfN+Pz4Nu7qjWkL\/zJ2aDBuruNyvl0WDGTONdYJc3TtPOfrdoPAr7lvmMEEzbdYBegAjrgmjPEfAOrxx\/wLggtpqySAVtajwz4jX+S29Vs2GNTxNOXed3euM+5Xk2JbFZZc5s228iCPOqHHidurHFwNStfu07uo4iznWyRlWsEySu5uRGK1ZR\/O5ncS1k2mAc9TeOmrOJozsRVEUULvjAv4VFMVbFKnhbhWY9BVeWNXRYVcYwyHrMFtExJGOQAYjHOEbiWTYi9Tq3eWf3LTie1VBdP5xa1xQ3FC7hKNv1CLGKLrYddg8yghlM+ot60lLuNZ6cV5UcfTUivBy9HC5PXKkrzl7Vj1rO34xtlCx8jtIVB\/lJNptzwTF\/ViGo3iqCPLv+ONx8CmwlaZT01q25OGXqF\/yt\/jceUd3wNZg89udI7gujF3WOn+5bfMkQDE1tZnzN4fw7+1zMqCvaOk\/rFgzXDRHhRC9Zwt+mCoZfZrVTlk5r1kHzW+TLPRs3nVzWFsmkSKs2jQ\/CE4OHVs+6oZlW8peKyZiyw01bgw9cUpHZusdr5r3MppEKktIGtZCxHNeqSmTRejG3ahT\/Um\/qO5EEI6BEBDbGZQLeAavhymCcvLG38M2ozj31GV3qePDvvQoX7pwZzqu96giP6S3waLtzRRST40GNDP5Eol6K+Mi20Va+bXTKeLQ0LaXmWU81mrJQq6TxwMueNrRCWn9WABhE0fIz2VVHeS+xnTnoFco1j5JFwcoTqWHXFB1k96FgomSh\/yurnWI1hwkoI5N9QFbbJgt5j3PlPLWNjOhcZ\/bUxjnAYL8jWmfavdd4UPJSrgKX739ZfcEmjh+GkzvAJbEGvSoxbaksx2ITanFKPmeU\/M2IQF3mbbXYTmqjOYyXm\/ZDLazY2RZHfryPiSgGdJFKq7nsT6bCbRPP+CAiyTmFaz5JO730++xnTcjqZUbBsePlvaMwn\/Dz2FRajpkRp14dNW3yW1RmaNVdwYxN7BLnZic4CbflVd3TojbvwP\/MDzYGA\/MTilbdCTefH199USeLfPhxOuvaGGe4TnZjEWTpjOfnfDvMTAwnOaP74TJGBYugW6rgsW\/YPHWLvwnZTqzWCY0mzfga3+6LzXiJPcc3j1ueXNG\/rPBVDlGOzc1zL4LOK+\/aajRk0UHJ+by47rihOuEMmQSFcL463byr7iRHL9d62wMcy19jeXUpQ+g1qDEqPu99YZWHrdnTj2mTHZtka3OyFZoQVY2CsXrTsqdMQG1T1VTutNzns4VtuXsmlQzW0b6pqGSNNdT0y2dM8CKwHmeWvRICawqcir9tZdHCnsrk544pklL13WNtprMOnHz0d\/Mez4AHSj0MFsh5tITyXPd0q4PJrk6X2fCKjqsqVl7XDXR1FOzQrjsvro+JMB6EdcWqnXEFe\/EfE7fRQXTlnBzMDHuoLc7j+Pz1uLikIDv+AKx1jZXW3xnpfspscRHxbXBRkQRaz7+i\/xfVVaxqAWcyq66ciyjwDqvzM1hUU5c5g0He3\/sGwrHJabKLxwEH+aSXNpmgdRZh5umr1f2uX+kBFE9r5tKnjQT53ZMJX4Dw0zK4brG+VwBSM1HBnoU6usNwr8qBkyye3Dg4wbvV0cbzZRast3K9jWvrjV5Gj8OhdtnDCi+XSedUFHYiUY9TTXf8Kh9QjTL2CRZvXU7lMeud3zr4i1DzmBGhiNndrX+rvwsy5Q\/Ys2gP1tJa0LyYfbwklUUErBEqvYydafFbayEVxjV9VLhHt\/6JEPUrP+qzrMEgNS2y2gj6gpsZA98ZnjVV1fNnfo4tTrKsmYiUdeoLiNexttVNReE6okL502oOb10s1Ok5Sl2jF\/iQI6+fjoAjwjW3QrrjX+ZBb3iP1+UYHbCvO7JyW\/b56Z+r2jNC9ojo++5nZo5ePbjVMXPmr\/06aqpEZ+bcidpFTD49JDoPV3H8\/sZ6qyZ6XH0sa4S744VA5fyXXUs8Rjg4WSdz72qcfoiJe2eZRYYbrO2uwkRp9tWKy1Ti7IPgJcguGA63wQGpA9S4epq7knNu3S8\/LQOk1RkvzptWrW6U6PW\/L2tnhxJnGz82V9DgNWuBTEdbYKtEhJUPwYONc3pGEMZhBDhoUB91o755Dx80fW0f4c7WSBE2o2Mu8D8KqRMnG22jGdt9ibxO5vd\/yWy4MuyCb7bF8i8QiA5fjV6VMYZzITAWTjMYbOzkio6xSDrkZ9aJ68gH\/Zk7GA0nG+YC27gj84tnKGOPTrg+y7lPXeEIiL9MZi0Gm+cA4mfIONGbeBFFsIEC6AOs62awHD0jjwcuCsipLEjNG0HR6b\/wEXgVcVWWODBamlF96+uOPfEZvf6GWv\/ZFSEjlev4OXPrbkt+LoPuT+GS+Krh8PJDUR59u\/t2rPm\/9UHU16189\/ygO+dnZh7eFYkSsbqjjmASKxxemHjyvjXYiqoigT+50\/jSlvlyHGoBd2uC4Kzw6wNhLF0sfH+Imt\/5LBC6w39VqL+ZXw445lBbON8MnZIxL8bguuz8J5G0jTmGp7TxR2Rx5QZN4lzOYJSv4ibbOYqRq0dUNTu7nH8xoCVbhrFELZhI5QRr+WQRLDMprcuc2i8H5Sn400XXaOz2prMi\/HuPqr9KJuT9Fomy4KB1UEA2GBOvwZh4TD5fEc7Mjq0om\/XkuOUZGU8+U2W4DzO7gDj5KsGh38iRB3veekv0ribUcaIOs5pfYir+4CEqtjGcf8N7qEiv2cCLu+qtI3\/4klaPWagjESxKZKbhL0es05mIFithBUR6vmcaVgYvo2thl8HvfF6QtUpGO5OduM4ZWXBkTEHKKOZGvHs1zdbdH5L4rzNIPLKemZ\/cO2O1\/biD7Mh4FD3RtfGiUloTpy7zExEdHQ0TvrtFgyRXUMkNe0P9\/Ae5ESet5NQZqyPxGUSXY1G35r67aqmQ1AbX9cPfdToJV3Sc58RZx9Xdahc98f7sgok12cKxnJJGcyeT+pmwxenIsYXukDbAPu3bq+x4vco8sHLrvCyXtaRstQ4b5adtM2WVyWV61XWq9T1hFNZhqRm1QE3syqJ8MegMU0QVE9v87Z7LMhC8Zp2\/jjDjXDYt55XjUbiph9Rerg0m0tnVmnfLU6ke2O9l4x+eZg9UBNQ3JqKwbBnbvAQ560TptW6Kn6f\/nMXYcEVEbF4p70Y76j3rk8hYEVNlevUCzDJT9KSMNxkqL7enzAccrgfIfPB55G6qSgTquZMlfPD0kaxFgcqq9gwaZU4w7cpVZOH9poUZBaNpS60xMEc\/uesCbzDsmt51YZ+zSIrCb2UtvC73QNN\/\/FpOjX8LbqPE4bGO97srYccd6rTG6gTSUrNaj1dqTZZbZcwnOfL4ZmA6am7grH3yJLEMly9unzrQheyaqM7k5aJjh3UG7BrGQbmuOObgKEdaI9BcmtXyZGPInX54HVYO+dz8jD28zpqukfi6RMknvriCqb93ly+1AhekRVouu4Wl5TXmD5ceP53DF2FmYUalisJhvVOmTsBqMhqsQYqwqjnigYhllsFlWbsRcbanvUGWx04NlCFRRqqy\/NOVXOo8cWPFTl1koOE++oAn+35w0r3BrKrwXUSM2c4fsYRruNeJanpwrUdW3aN6VhBWABUzOZCziAsjhb\/UHEdhxjKWr7b4xBZtqDH1yv39EGD9yGdwna1MnfIEF334tDmvVmL2qjke8T\/\/4dMQcAKfhUDny7iNDvVFG4dJVIjr3uuev5\/BctSBgIevHFF2O4jquvhWfSLWvBJVMBE1YEzlX0aST3oACbQjfBWCSTx1LO5m1b7BZfjPZgdG\/f6s\/6n7H0Qt+jJT0FckZRQ4fnrc5+qU\/xOH9GUO+0yNqBxYMTdV23AkUT5dC\/ozR3WmDtYoxvERA3LLsUF7oo+LGGjIH\/o5UA+HkH1yRzubd3A9xyYK37psZKejHZSBO+bJTmTrINUEhtLDVoR1T8vMDY3luNVj2FNvlLF1k66OZ1BCBvA16mquAGRU6imDtD2cIXkX5SqsvEEcwVaOWuVmptRK84VONW7JZMYKLMXAYZURUyF1BsHmLxfSPkxmLV1lnfbwnrgRPfT7OuNpnTvNikyRPdEPgnSizUZWI1RNkFFHnHodpOcsbN9Aj1gZhfJJXtGBzQiKtTI8TJrcNIN4IbkEB8Yrxy3NWuNSNOJhgqPLaeqBOeDnwkPwC3\/QhWrmRHv4p\/\/mTOa96s2aj2s\/818\/x5\/dzdGQetms\/4rrGfruI31R6t0FZbCNmurfOVD9jX9q25oFgTAf+TbXII6Yw\/HowPEX2L19MH53x5zs0Bq45VOZzVpzzHepg0q1gz6onsNjqrN1dmOVXcSwNXctTsTVfFV8Kzjqel4NN\/B5WvcCts+X4dp7q7qM2d29QUH7zr\/ghzjiyKgZVisgth4q4wjyizr8G61ZrYycijitJ3vOA9dSnKa5XRMnf7QmS52LhcGvyuiUFTx+c4qH3QJxjUeaiNVJUJflkfAx+xnd+8jnH6ONf\/7cPeJh7e6BBOH2yRNj8fAZwe6TNOx3p\/nQypx5dzAM9GhpRjz1\/M8\/45bYr8XrOLf5t5\/VaN\/0xdWQvXMmdU\/q8J3gLsw6COdJGSW526NxRwf+43UqOTFNNDPSjIJ5MF8inzkEMuzZJIX9aeIdZ5MdnQHUyzycMQ70uMYRctycG7HH86RYxtcRI37KHm04KkeW02Yn8nt31nl5hesg1aHJBlkL92dm+UP8O9\/sTG50p1JnR\/uL6D3BcbKk55h81Qt8iPe7FPh2CjwsbDKvDNOYaa59zhEi4M8fd8VR5asxdZb6kp3owd\/VYeoIndJvwYG8w9lwLeey0qNe9YHEGp6QP2XOW0la43McTpsdfP74fGz1cfrj+kTrsjsXzqO51v2FjZd\/2CHYHA0P4LZhMPn8HObLP+Qf1roxy1auUnjf9X9m++MZ3UFBs4khM6nYniMM46QcHi+Gq\/B4zlXlkr2ZT3RBX3eMiq7TYkfWOmGUYAmvMP4l0Um8WDOcX9Rzndq+4xdRcvHhDR1osdUjzRq\/Kg6F9g8ZnfdmHMP1h0gU0z9g6jeOKAz4PKUHtbM+cs0pbvh0PK1SNZ5Z7SqK0BhjavauFxVMV8kYH7+he+cKQn1V0tWsWi86jJk32SCuKG1xjffLa8VmriCS38Qsv+XKRHd31EdQn7aDNHcndQR61YvJ5XMVuvszVN26mLr6+9ROKqZPvZx5U4VjETuv+uI6K3xNVytEsNpfje\/suioty2S+OCvWGnUiuM78kQ2gPFwROM9s0+\/gI+rBTmvyRHVQV1S\/mNNHmmdX8\/oWmPKJTf0f67jEPyzQcedn\/iYzT6VbGMzs9W1UD6sCdGrqVreSnhrxsHfQ4rW\/sEFYAOktP+YVokVU5VB8HKobxgi+RvGHfHAIeZ\/8Lkszz3PCqNk5Pe5KL0pbgWZLN3IZ9MjyX2r1zjfa5hz1lKFl3tNDzh4Nf7PKGadwcK5+nHdejXQ1Z\/Y8ngi61pClnMt7FDyBeqZ624fnqrn3+7lw+dD34C8wbmyIhz0wO85zv0imOo0jqmRSZftFrAhm3u41iSbwj7dKhXUdblxZZ9MGPVH5jFNFJuqun+A3eZLjZAuOOxW52lvOSduHJUY45\/B5SfvxdbNQWYJfYM3hhrqJcujEk1VQaD9H5TOXaCfnynIy62WaT2ETCb5dg\/f+NVtS59qkvsY8GwHa\/\/4LDohZuHFeU0PBZlglDLCrrFbwnA1PZs+IlUcZx8p0nNtjkMyoxRk9yzX0Zo2J0p4\/PfZuA\/gMBpqj1WUjSaXIHrp9saGWo9e6Jn6ePmQ4cH81J9o5LscPavY5uonBvDNhLAJI29YsPov5Rzl83iU+qyw+q4vMDlzUiVbjqaZkZL0g48xnxmHtRIr47D2OrLkiV7AJaFn+mEwEZ+icdQvTZyxlIDALeo1pvFHyP96srItepvJmZMQs\/mKYdVZ+uTCCNmds77U31Dedv2wD3+pXjjnveb+uoYrzzBcua4Ewtz7nbVq7b3SY\/uB8ciZzgDHuSIKBjg1HSbk21wqQqcDH1+RGvGfJGlb\/qcgxHq8dIz3VQDWyZ4d3BiNhvGSlcaZG+T3Vo8fP8cfN0f9WU37+osPzyVgxQynAhQiAr81vW\/\/GkqOr8eGQ75iuIuq8wG84kD0fsGwlnq6XETPSb27cWTHncX9ZHEX8Rq7rsk7PJ4NwuINjtv2LrHkPCsnfXi+b9bo1XJ8yM6ON3CnCzg3D9o69OXJ3MLelPj2krXfnIPcpTYv9hEvu58wTT9Mv\/VDx7mXk3bxynzLj\/fvU9+x1zH4Du6w4L9Pw88mnvMcR7K4QF7iAOBmVvdEnHhR2S7bjoybqX4ZZVeS\/PGeoEfZ19nmya5b3eq9\/sPP1NDL4ciY7Jzuq5QJanzZm7L03yT6KA0exMWyfjM+Yxupy5sTo91MWQcnF6+Y2I5+z7vNit+Pma\/Pu7sAZYxAq9hLjVGA\/Z5YZsbOY56PN0eGN2CCulqxiEf94RUqWv\/Ds5KPK\/MUWJaeeuAeuMQgyNtsoB06S2vZZZL2TpbqS5uK50Iw++WdGk3qe9ybK8\/60jguok7hduwkie3RSDrh5cQxaQGEqL1Mc\/EzF0vPhdytzaiHoIL9kG0QU5\/k0DU\/kePdJrQJqcM9rfUyr\/Qyn+JUL9l\/Gl76JTa525N\/Ww7Qxxg5kMbIZRVKd4zrfxLfjz7WRjB7O+I7keCume67hktWAMMUxF4jt3mwZgx7LP0S7iDBe7PAG19PbV\/LvvunM7faiZQDrJkhp7hhHru4Ymeaje70xJ2U\/fkrPg5OoYVwYPmH4v3cb97q\/3vDWxqekfKOKayRfPzfMKo3\/umZzPcG5o6Mov9p43u1WWZ47Y\/P7El2jDcjv\/uNzLfhd9pd0Qf7Ld7GxZrxVouPHX1HWuhdGigNhL9Q16rRDe5zPWInmHO2+KZ5BhwNvcE2a6Ew7XHnXoYQtxuEVxyhkjrdayuFBe9cVZeBuO1yNPyuYgUnWWORGtssRuPzuuPh0jniy6TvcR3RYVehGaOl2ZO43onlzJ+pZw5RVr71df8VnEb9+Q4t7FnWirqnFDZ4RHJfJ4+3hKrmTSsf3V2c7Lxhyq94rLGE2q6XVlVRPiyo6\/Cnbj0uaHHClpZrE+\/FpIqAxSW5HO6xh\/KufoAqackUoa8esaLH9sf7zLLUwgWyGCqC7KM1oQa8FockT27h+UwADZaZRFVZSOLi9E7yeOroD75SpZfuqhs6jnFvlDW\/nvHBv8kJc51ozjMt1tZk9uIj3iRarmlz94vpexuG46yuX\/ea8KltihP\/hahGaQF6rp\/WyjCZGGRfSK\/CuE9Mjfn9aSTbRoTJ4dRQs7VMJnHnjhp+evsxZ8VMM3LWqicpdBU1PE4v0OZGMOrTmYDIZa9alrrT1J72mH9ahfmGq\/t7ssG5Idls9wyzlltYre5ruAaWtcEJ2Mm01O8rshrp6nHnP\/ZzkfuMAkoI+\/t3fxVlXzaoUmgEDcE8Y7GM\/rn5lN+AFC1XN3H+J+rEnE9Z7uNg1J\/\/C\/7cONm4yPf++K2fY9davKIlRq2msyqAGrnDhL1TzXZHCcWZvft7vfe0Zl5XTLkbB7y9vG03X24z+FIrf4UnXncfjqR5W2aWizq01xr3\/WcctX+iJWa\/2b2qwzioVmQix75L7UIhF0J2\/HDM98188buaXDLCfVNVJZqM00RxX7eq0ERcXZKF57khEFnHUvdAWmCLTHvebRY4imx4JkpyV3kgHVgcTjWK8yVtnBhqp9a4\/GiFGwFn+nJpqSxm5Q+0OAZVdvk1UQYO7w+xOsTPM+dWUjqYjDGcna+lr2qGi3CdpppJB20juyGg5KKzdUSRudUU4F+LPBIgRFcUfndw5SaOwrEANB0GZIzgzd13bZeQZGTskRDJ5gB8akRl5KzHvM3vWg\/LIyyauMJkF3q+ZafzT576eSBXP8s68OytQWJb9G\/fEcmJwHqfWz84mE8GJOx0o5+1kTluyjwwJTxLjIm21gjklKpO3mJfkJ7wdsxpjkqhNPzyBqp6LiNLnZfMqI7EjL3XnaTIVfK9an9bq1UTHlS2ZxDM5o6Ij2W2ZV4kg70yE7nmpu0Lq2gxKkLNwMfqg+oj1XZlZMkeNpqrGMX6piaCnnqeN1lpQ3UoP6lD9IHD0Pl4cXE3L+rvvJzxUK4hWeGotLH6zbXWy4xfUUC9tMfmD23Juud2ZPDU1YwM900NQACMykr4+bmvmXziDV3g5WIjSjUBkXyP1TJ3B+r+4u5VGs4gKU8NpF2bKhFIz+JPqel0TuZBJyzNhb6r1twpAvTFnXh0f3JrRhgu\/HwctcZvNXd1xHeZxA8q1\/JORsw7P6Hdlvq4vrjV9d7chM2dG01d3LdZLx7HH2e83OmWsswfSFcrwwRxVB1w0ZRxxyCC9fjoanU99lml0jKdBVd56q0a50VL7qsnJ0+kgOYcFxGJVBuyuM0WjYBj\/N8\/WSxzIX95FESOW5KL1Q7RyxOyh7RYPmEmV5fI+bcJs5LaIRol5Vk1xjlalSrP3XiRBm1lCmO3pYebJO\/orfl6Nq+\/B+4hFEAfC\/3x\/4rCD7slpZhTtmA5c2bYa6n+sUmojPN+ak\/dyt0C5KtGgNuVPKhrWyVHRm2bOOmVWM0fv9DwfpQqTKeZG7FaB6TE9lUuSIdQ6UWouEhtzU69CVnNez5mYgKvRkuOomdNb7fzMSDc3OR52zJhW15e\/Mv6ghp5Ze1TtPIpow4rdiJkxBgVtdVcT9KXSXkW8Y6NS0GmuLVKBesRVmoaZ6mkVUXXhs7QR9qwailzHmplwVLNE5tPjW7ujnbwSz9P5MpPqbrIWJ77soe7rpVKqAXCgVbdqGyKu8zAI+6\/vG1U9VXOY1OAkZpzvykvWObfMuVY8wlUMhvmzmyIjuR7JMcl\/VSg2p26H6pXb6jimcL+85JMpPRP2OY2JTcEdouPhNDiBVmAjNCtrwDpHdDu4VRWbM3DZ+QX1V7vLWI+3bmYznfqQJAg2IjL85ApIZThvMYcwtuazfVoVcIooVtNh1eCiFRYE5Upkqn8clXw\/LuzrBVd+zoLAlEXbCrw9uKN16kBePBWDdaycxLrqVDNT7rtoUv3FcdmaFEZvqgSwGG3EM7W+YEV4z7jCBq3tRh3GCdbIgv9j\/vV8aT2sdPxDazA7e+45JihFIdNec9E+MhZ4HR4akJKjsPSgonMhnyXCVP\/y3MTF8T4Mk\/uGQXTHCp5UviA9cR51sgqasR4HP8NiObLzMELUO+O\/SkR9U3FVOuK0jI\/u5YxVOwLQWgcZ\/PX1Ntn+ZMSwQtGDQ+FPMBiTYq9Vn6wN2BTE2VBBRCkoKxPDBMyaChQ\/pwkybWPDrxnhy+SgtK9k5vIUfHHPNuEY\/ws2YDB9HO8V50E4XATeiqeiwDy0ztOy0UBTZBlZTy+5uU4VM340NisfYjeRDzr2Sj4+oMf2U81N4PnQVD45GoRX1Y5ZVPW6oK06MSViGmxaKiPIt7wCAmSd49Cw+saiVbHNqya6JHI\/EaeqD6NlUHK4WWNexG12dWEuvbYoIhPE+e7OLiuXHeMKZY7qInmDC63NWVF8r2Rt\/L3HaiYtp9rrQlCYRia8dytCUHV86Hh5HgPf5ASvww\/+wf0w15kiPAH+dXwyhPUMr4krojraciP7+kzlESuqBVaXU+xfDMAv8EUrBPcbLOrFsgN3keM+oMyrKpjIbdsoTtfKzBz2ZNYogkhKJtMTe0fNjiOuHqBJzPWpzuU+MtCKDq9T1cva0WaY9hytqJErrOYWWWKY615co6I+gyvqNe0Hrlz5wSVFkatKM3zXv5hJMR91AKdiq+s54sjr\/JfmYP5X9yaWsMapSfxYVBx+xp9hJegdz+mKybbFgKxpnTXEP\/3L4567kQ\/6xDbRvmph\/MSIOYJ0vAk0wjHMnHNn\/RpeUIvjp8APakVeRBFRbYWrTFl1EykiNts7YVHYxoTVNwS7qS+ZENygMJ1jmRIMkTFdprMuHmk\/V+fQz2QrLdV9dh9Ft4C\/6DnTbq8S\/+y9VRnLx\/VbeJTzwozs1Ivc6JrIgXxDVjOqvObdk5MTHQkRARO0Q\/SsP+JjjR1uGdV9XmuO6\/NL93uZX4RXq62ijBNMrEJxtVmOzjiGvWHuqxr4BOY8t8iw+06YyrZ4x3VBjwr6Lqv6WeZuFPRyN1YYlc8PnooeyxvVa09HKEfpOuznNJUVCNXEFQF4n2pQc+UWqtuqO5cVNt3RcZdm67Btsdc7p4bjej0GfgfHyX5Zkn2t8lJYS9d1ut1dj9WIqsNURtqpQ\/9m1av+g\/S9+joCXQ9VrdQNGOXMYeucFkFHRh+WuRyjhA+uvhdgSM6MzrXPRDHE7ed\/83N2dPASkNm0kIhkp3z8Xsk+ClHVKe9lrBkhDgGFaRVV4y8rVTCOTlrwKtax9Skyb2awKr+HK11nlTm6FqS2gwidQfjWaxGpP6oLDFTq8Br7euPbV404+FTdrBcwnzPQrfw0GZAji\/LwL9kfLgVrpaLwKbVfJ8V1q\/qSx831moDXGZYrkmuqipYgxsSs3mJeGx+SlVD4j9kQKZ4FQ+SrCPgBLMJmrJw8M0TLUl+zqAh+Jpv5qd8NNvPlfg\/+5i75eS2OA7RE0UpQaccd9k0ubc9\/60e+lVtwPMQxx0\/SOcIdCEgwQQzPNHXfK31uQ5GQKo\/z7FwYWWYShLDY2fv6qI22m\/rx+0t9p3cicx8zVwZaWRlt7mWFl3oE\/qFXOBINvGBel3kGK95VpuM4TlwH9Vb7zBssovxo7rZPZusGuyoE1WDwWgfdKtx5K9gSBLX6h6mKw7GLXu3Fb5Kpc1VikHpeNLVKYBISK+edIjCKqGidJmOMBwi3M1v1qm6hWkpdyCl3lOpPzB5YlqPq3lpR6AdsV3eFqlTPYeCrad7J8WlvRjozi3pXOXgdvtdH1rP1G9brZ5LpIem00OgGcQlA4zOM2Jm4spr3+dOYhwfIRZmh\/AhDwhFgEQw42449iuQRoEH04rVUb5g0R0R7w7plPbif9ybujQouJ0UIk4HYYY7OOsjj89N1ph1tW4vLChLCBZkAascVvfincC0VknpHgc1uV7tPPTonGBVsXV0QMTN5roijjGLyS98JqVgoaz9r4c3Vxs+KPF+WMabWWT1mJvUOrC6oMp86By6ro6klFbNpaI7QESI4saMfgBDcZpxg60VHcNJ+ySq1Qzvgj6rXvRi\/zVuOGWXimRP3Hbpbb3HR47yudTCiX9BxHpuRFXAJpkB2sh9KZHLOl1lyL9gpKZV92ppsrztLVtPL1CcVkdhUX5m7s1jeytVO+pi6EIGpEcbT1WX9S+YOSlMj7Gi0ZdgUTSM\/IFw+imLDoZn04OVrn09y4DVbb+eWWIfOSTk6uCV2YhZmKK7QLucTTuhIWiuwlU+QllV0VJulztrZny6dOur3YBH7kYdItv3LftnTLMe3woICqrSjCRpA7HLPMJZ2ogyffGFCYDy\/9Z3Mtb5k2XBYsF3kpW37FL0elbPKvtZ78rq4yM5TfFNwrHYEd6IMLoelqAoYakYdlU2hs3oBRYyI5QYsNWf5Dcp6RbhxGBp03U5bx9KelumKQFS9+h43D0tV3epUcg0+mJp2zwvdDPQQ6CqKT+Qyz6gL80GLM9\/6FT5hileACRiHul+vC+Gh3fqJepypIUaFEsCHzQOViUrDzOU+2oelOZa6YBSJYd4BsdtG9Y33k\/1EBOx2FO2DnmAEmOo83WlQ9aeRcQSdLZwyWG4b7imlz3VlILGs3hnDrHAuLHKOzLV9ORbmLR+b4a7ygkEQTz6daVvurhazJ+tmHmYJuwWTwWgrLlhPzMVKGXd9pLX+6ho5Pk6igsmtjHQ\/U3VxTME48+BbSq27jCkINUpBZjWSiIENkOEf+m3dZU6Tj1RtWamVGGfDrMF+KmJGXGbH0YFEWAYMxyvlDyo07aFp4JxIkxdG6TMF8B\/TX5EsDmnnYRYUuuiI9IB062TasB1jpjIyRlczrevGlQjLoWrBVlgip095uRAUFm3UKcPJivE+1cW8zeOhdzmA8i8e5dnDcJ1Qj+JYOQI1ro9dhXjz\/mKuGIs+6Q1QXHLtQOQ0eqqafT\/up3f3zi9cXtW\/+aKoBhHcwakHskZptSjLASjtvHJz8TNc1A9PIcLPOVtrXYQRZTIFt11MecdMEtv5pIKZoVKLsGRV78gnBkQwT96dtrl2z3n3PF5mdh6HT0OALcZ57NzXUZ9gBH7hOKKl\/vOv45BJFktFmC0ycX1I6w6fqJ9sVVOp8EU5GWaOsuMD5bbq3nJnnWBjyKiPb+ur6uCGQWCK7GeombPDgw9pjV3dytDk0Xb1ZMQizyyAx6qKoMNZ9hlZ+tph9+QifaYKHgWDUPJHVUAPUBGzhxI3T62OcdWoFLOsq5scoK4ZAQws4zMnvDh5ngCa+WW5IIdRvEeBJ0amZ31xdz4EJIEHogUTcq\/HVOk4pjJ4P9GoOmW0rgHY89rdMFpBjYDKtHY7W8TW2FnZYeDRBpCV2Zt71rOJRDQhq9J6IHWXObjeS7Xls1W4st\/aQkXVWnbCxHSZLa3PSm3alH9+HNS7fqp+WBvmC8xddqmLxyHEy+FvmrXgHXU7rk0bmZGYwLfNqJ\/2wVlV3jZnTPhsHYEOr2NLtPtkEvh+tVSnR\/z4pJqYgTuYYZ6tUqUElc60nquvOauuh5pVvMRpgA6t7LRMDM5TcfUm9VBF77yHd3irwpH5LUIzj7fWaPXwATLp+xwaesEf6spPRevD5lWeOum3DF07VvAMDIe2\/JGI2ior4bJCfUnzUeVgnPw1TrAzzporgT43zjUMTsSRb8XFu5QB+pPRZS+0+wBw8UbZ9cBUotwlEqw\/Vdx5Mkdzg6JZFze2HL2RP0xlhkWe2nroUwVSOTjYMAXVCLuFT7sLxrqwTjbMGq2Ox6nbKcpudvJiOCZPgkvOuOmN+KfF6S0YTSbn7xzPhXhZGV\/FX0fFXk1aw6ugH7smG\/3wPsW0Pj3B1swx\/rxuodUcnmnei5diRhZKK18vfOuWmKrfyPo3k8t7jOZ1Kbj5e5eMJtp1Dd2vSmyuessO4fHRR1DRHMGF5b86lby17FV9Sw7hSuMRDFvNal+5puOkb2c7PRXZ1RcYdh1\/55f+t\/VRhWMC+zR+58dcG+jYjEGj3sww83OMsLMqwbH2Z970rK+qJUjs16G+8bUE3jGmhtNc6gHVCtt3b2O8UtfjOJl81j5OhetL2QMoJlBiai1rnPQURLIPeHd4dBzorg6lmZ7xcn5XKxd\/MaNbQFUWLd2d1H3ConUJojBt6qyo9HMf4lJdf7MM4jk+lenMQG3HIXPPYdS1zsKxgNDfcTNKM3srEHQIH1Q3FIcowzEaccUIX464+mzFVtd6dRVlKQwnF3JVUf+9ENfH1UOuaDR0pdM+wUVXCM5uXfpgeTG46zYiQ0VZ7cXO+WqQ88W6e9aDTOI6oxmfOSEOu\/KUmLBokV4WoV5A9bzPt5ml3SKe2KM\/MhaJThF1fQOePzVvlRxK5A++DRr\/NL2BbhwXcW619Rj4+f6k\/8l2NGqasp7cV0oVfQ2CDFcJ8KP1d2t0ZqU+Uy24Rn7GtRdjYV3n77EZD8fXo3AeCGR27gCCRpUdNNMj2Ddexlo3KTM52rYTvx3UZ\/3StgaJ7HkfX0ZlqDii3kymAhOZxB8e4srVID++rPvnk2L3fMJYrSrcQvpePkv9piKoxIzNam9UiQuxuHa38oN4fT8xJ17EnXdqGOrgJm+gex3K+ZN1EOHx1Us5m+ifF64vKBfCUnASbPnkbeeYkVXRs2rNZ9psCRfL2YwwKM4k1p3naHAKqw3TkyF4sv2HYVsz1WlQJKbKwc+K6\/gTBIIZeaS4D\/afqgmyiLpMCbLlgtRycTa5thcYhihtFeRdPZGZdK0f1s\/\/oog5nz5vfUS0Mvd4GFU00XnqjQqICnekxdWcNUc2S+lDR9h1hpqUmQeZDGOcZv5Njv43HFSEZ6yNqhU1Y0T\/GweqAAzBvlfzZdHvld5zGxyzMmEO1Dg6gKtNFqjyVooV75rhrlod41g3MIvtVnGDt4yt10LxL8SO2KtfxDHjJvvl84kXn4yqsUy09IjJE\/5n1KgswyxZg4Aa\/Ymqb9WJhxySqIA\/\/dGLt2UVFGPmERmp21lc1xvVh\/RY4p1x8x0xxJbaRF+p1PAnyslKJDVuxSauRbDuITwZT2ELcgk5hg2q6skx9RYnspwJGtQHecm5lNPL+mHFMmOqNSpOgma+zWqV3vuHqrPzamIcB6wzgw8zIuqjujhrrrIUdb+6lFyHb6y3MJB8MNnpuqNxrf9AG3D74LzsxfecUQmTna+vZIZoMjcqJqgSA1ltHVusxjuH5Jl+muNwBYykiyCvVo1uJvnn3N1PFPHy2moECrCMF0Uww2mHd5eD6kn4bAioT29dC9E+M7feYHe0g7g1+kHfnA23El2ZCWzwXpGXxOcIWhyU5kwi0uyX\/W2n71eVwJt5UX3I1WnWo0KALaNjPlQ8Svzqt8eklRn5ZqpedTAZnM3ErKL6x5wTFkyOeV49scoAoknEFQ5NPWYVl1EM+1mbZbrhzvI0fD3nL3KtEysGXoFV52j9S69lZ1RkbiusuLHqZjx66La0bVYfyGXHru7g\/OAX5ggfEQlibb5EeP9tTaYiF7Vglcwuoxm71F9XMvUYjD\/R5JzOK5WeqCbanyebY0ATmaA6wcTWSGqa6OlfygGZYWvi+9Ez2NVE36oJ1CQZZue4UVNvrdcgaREZF8eViq6QWnmpmiIpkek5UVWqzPOox7rHeqbjz2Y\/c662rE8D09Y3\/os\/voZ66sL4mUhRu\/KnSAtbgv1oJ4wZ39H9BuYEZmDYd68uGj8MoyfKOjJ1y\/GpJaNMVo9pQCSuw1lEtaryzWWZoxhucaLw6T\/xpOXlvmJdLqkHy7F\/K2xWN2a0uYZhqJbWyvc7rcOxuIHToJ1Ba0LHPijrd8+lTVeV1ATKBa85CjNVJoO\/6S+oZTy6Evlk6574NgeMdv0XdZR3QcZkel4JsuAD6ifnmfF5nazJTK4RQIt5mMxR6R4PHjWI\/rxOIbNeLdu1aJk\/egGKEp2souC0mSF\/M4dmGz7jW9bgdXKINvKoS+oZbRW5VZvMEBSpaOZI7wKCGVPXujmLMRKjKpuVQS+pqzBOVUZHF4yXO6wFRp5qVE9yVQf+ymzrvNNbW6T3Ridz4A\/xJZLMi5yVCVvxsKwze7U6eBlEoHE5f8ZC7TIa2I7YoiUyybgn3qn6dQdWjCSi6HB4J8cV6a2Jej45tTxVdztnEhOwibbCBHIhWa2zh71z\/PzxGzJwQMFG+XrdZI7LM8vUCp42w2cD+3z3e7JxYpQqak1VcadLdu7mPXE7bT6cmiq8WgZT5lyPF93cbKAU+MFEDC7HR6OU1VdeFQd6PvSBSAzuiuVk7CqXGiRm9LSsFccEl7jSTB2wF8zoo7HkGBWi5sCn7fE6PVBpaZW5dgVxmJ4j+x2\/OzZYQgTYNqMli8TJto1knW4qaN7nuuUc7TVL1xjex3hxOA4jV9dmo5BIBg\/LqZe9vJcEFaSt4QkONUp9xAdVy+cl\/Am5lImsaseWXgNG2LxMWY+dV2UmfUXGyZ6hDLexo430Kz+hiOCNvYtkGuRTZuyad4fEUevfypZhRfBFdsAIkUTx4IUwzfeWcZbRwIl\/8Sxzd9Hcg8Tepp8pJUdWwqGK+Mvr+iggH\/ba2uj4yiJwpjHIL8mJNQcXmUtG5kirwO237iwIDauDm9QvuWj1WcGsXBo3+sCN+fNUXuZVTFGJiXnq6Vb0xp13ibu1qTqJaytB5VZxOKe80Grvjl9d\/dU9\/KsbVz3\/r5\/tD6bCG8QyEQC1E5evC19nRvObmWT+M2d4Leob5ddnUQ1o1vxMVeCAmoOeF6zFP3yvowrmI+OXweQpWVjOFRVyM0g5\/hQtMyERc36pmcIboK3VbvwP9cAIZ34TmdmFnrG2atrXYafzjL9gtDrnu3+F0dICjkIe8jdiRaUzSnihDrXZw\/cYQZlfjwQjwkrLV9\/BfHfM3TVD\/yq7tevIjJojprau3phfFYYo1Y0NOq5nKouexT6cAvPeGMiPOjP6Y\/WfV4SVTi0TA9x2Y0pNMXrYU7479sN1892t3Fepn+Ec+iWHtMzvtmDerI\/6ssWEaiEG9E8eN6FzzOGZej8xhJ+zglCXYC+RxdfcOfjFY0YVZpBsDJxJ9SSRJ\/6gXRw4e6PK\/Fcf6ifMWat74gX7BXVhjrRqHDLa4NhKK1OkWooNWsh\/G6+vVdZ39R3kZdpIdbheER1WTp9iEi7CV5K7cdvEhnPnD98scRoHvvBrnXsQNmiklqgH\/rV2yHNjiweyMsR5zgZF8q5VIUbBcsZbN6UyU0\/2DT7B4nQsi47yMMZpkft8adEKgGUc58s+1Etn1Jbh+Lz2qLqR+62F3um3vsp4gED4nIjiaowe4wVtjIcogBzydt4VdsQ3TBM5Ju2tC4gvmzzDnlac9WtMGIGMw7\/W\/nFBNSsjOqZunIpu0SO\/+Ukw56IfUnNlPFxosLnMSWZxZKOI8\/7MMLqbGcMVXn3Y9RyOacZZbMQpdq1CJFVQ85DfwwHnBYx7Xt35gYzzrPIhyLoo6\/2Ilq\/f+7K7+beO9BewLGNI9IrJMjHeFd+dCMBbuEA4kvNxdolY1wZEY6KTaKKvn4uGv6bF3HE7aAmeQAN1KvekGnJGPqlb1DIGXFCzlX269N7oqkXV5DLXVjBIDTvCnq0TTs8IQGqQtrpu9K1popS\/E6Gpc3ZyRr2CKhy+POJKoJiLxgWJ6e7dBZOfqoSJl\/Hmaj9IYn0v28iymcGNvhyXKu1YjsnxWiKPu3vZByFLL0\/UHQQTYf4ggCjG7dY9HDfoaKzqxqbVDe\/INqBQfIMn2R5uF+WPXwCT5SXyu1BqHrrSbB5BESNPjlrp5IxaVteD6FR4GRCfGLST2Xf84he+VyuYEX3m7zK9aKAOmPuyf+fqqphz5cNjAEZL3fA39VgOS83VRW3\/zRwVUJUrkkCgDAgG0P\/iKTxYhUTpUq\/UCB4ElvBbR+yFYc5xg9l6riAHN7IVn51NMoaDgWPhoX01+Q77h4vwPaz\/GBUOx\/UyqlYfVMSldVb2dZn5\/qDU\/sy4qJl9sse7lBHKmLCEjHE+Dta9jJxOqQnZfwuXv4xOtDKCRPkYSJUgH\/R4bJKMlwWYV3CayEzkgwIilZiZdY6VK8gKvb\/6Ix+rSNzrMaECeaBPjwI781pyDecwFsaGYpDpp+b7c+cvc9dNZlx8t4pegeNh7m2zHuaYeQ7ioynmG5TiV8gU6GDMYe6sr6\/mTTPRAeFlyZnLtNS8wIs5CvYKs3IeSqd3Ydz\/zuQyXpPnLHn9XBMRL+Otl6N\/8l\/dLu8xv2MskHjZY9Q5JvmTxXQOVKIc06glx6B2MZeeg7KuAo7VjumWFfeKQFqE79uCLHw+1UwX29VPeAqXAZ\/g88hROTHu9fBKrhkZPzVm8GVR0TqMWiQmsGtcTjwLzBN3A2YeTH4t82kjfdODt0Se4Kt\/ZdnsiZilXQd0PObbqFOvVHPmnzWraHblVfztbg+VKcuIS+LP\/JqdVu1wS9ruOhDWDbInX+WjMkbyDsfA9l0\/d8fx0c\/qO5WRmmsemElGQ09bJbLSuWzXKtTCy0Nl\/FZ5qpCcJYcdX\/0QbAo7kqUg4uWS8mvrC+9Q5wpiaRNc0Yr1\/b1TVLb\/siAVCgZAWvgC3t6aonXq6Zi7TJ59VSu3CA6yYKDqG5ybFrjrFsa\/6kdh3xgWFWpJ2FN\/yojKk9XyVsfsHTx+2Xqj\/V09l\/nknvdfGQi8MeqNWqKkjhAvPmnY5+4ka3AXqs5VVXb14Cn+S49gHaYY+FA\/KKLZj5cIuzOSSS4rDRWFHvLUsjl3n0t0qJZr3KPUQ9xoxV\/H3spgDB4Nq6prxwRlvPgI8d+ZhIxeT1nNWNa4ypLXCQ1ohtnweyIb\/3ZINVZwNBzmLPRAVc3J3iLeSjsFhweIydU5HI1Lah9wV3gbtq3asD6I8sA61R+wC\/7DJkSqbaatVEtX1sXF1EgYLGeBlfAjx4JP4r2rSvmi6KH\/8huI6WoYjzq8gFuiNutIZyQgLr0GX8yfeaVSOb98X+ac15IZ28r7rGj4s5F8HJoIo\/7VSOLKPK0ZYnQafjyXSq3DproywtY8TFSfUE6nPs0FeTT7IvB0inPZIeRpg43MOPyuc5lllatqYE4Z6TJQ69dYTYQG53zCA5SU32CgTCnRSNw7u4yYe4bhYDGlr5huGC\/a+fWBX4iV4rMeXPkcyE6hUnP5VE6+92rkfNfxQdJ5GJEobzfrzSFZ80ohTww3RyCBT0hc1ZGPefXr+\/tTBcmrRKPuoJXo\/QOt9372mp0Dx3kVkpopknyVfMt9VEpjXCaQ7a7WU\/vJw5PPtAyLd1eddWNYy8zD9slCajsVlnheVNV+0IhKGF\/iQPXBC1FXkljE6MPoGxVSK6nyqWDQRTzG46TuOyMdSlei5bo4uVOdfLYChsicGFG6Qgn7fMiZbfDV4ZT9grDVSrxANbMzwlGSR+v0oiSn3RMx1FayM5HyvgK4nEpPbfWuH5mVqIBOcCkPxPs+73h94FbOtMrOABUKxtMVeGA9Edz15Wg86slYZav5iWczWyuc8fKiT\/sANX4b8K4gvuPnWRTN7PLh\/U6fxo2oM5bVlZ4tQvwmavNgvYiX16nSuiOWpcCx363tqD2W63A8A2X+wGJduyeTb\/bgySC7DqvMFtxwLv4ARUPb8nPQa7ZOZ+gXdzkdwzpBQ9zrnP\/mYLESRZ9Cwt3Bi6DoXA3cHbJNzbnmqyZPRac\/+p8D2GUWk1HiaaF\/GQ2rMv6X53ilg\/mW+vBP\/ej8tN+MPEqQgaRaU5fzSUWeDuQAWZTku+ImhtEJ3+ff+S9Ggr6J68wKX48foQLZK6Gm+NcM+dNv1fnu20Z5ocyn9sDbx6zEG7y9FSyuXWVzRCofrOSJ\/UZzclB2DMKC0NT2\/Smqqu4daRgUrIndwzJ+wBGDZX6DUakOqsF\/b3bqE9E7N6HPYIZWsAx5HgpcAlPqoPn7fvbbrs0lOFj8BCXjAYbLi5M8NaeoAw\/hPxjMLKPfl4ubVXcjyEHPWwxM7OLNjJ1cYlSvRXEWEtg\/qe+shMq4qRKec\/d\/jGhr+Ys6K7uvqcQlmaDHOPQwd7xX+QMesrPBPceE7+KSBjsykEw2bfoEUOs\/2Q\/PnSIsMutJic+0v6MabP\/UkdwNU4ss\/iXvRuzw13arSHWP8Q\/gfOsi1RFk1VXKTzA0yNWXiUbmBLqd7VXCMeSpTcZI3S3T4wdYX3WlW7cDC+p97t4seoQPM646p5nmMBm1mXceZ0ivoEbu0tN1lo+LIB4zghkZ4wU1jJV20HYYECSp5vBV3ivWQBtYGNzXuaQNZsSBwT+eoFmR7xLnZI3YggLxIBfJK\/qa0\/vWS2AI0kEBOWE2qai0Xo2KgtBPzqqqMVvZzrk6ftX4ajj9ZHY6o+nBWM47Pp+Lsc3IrEf0FBafGPiMNu65\/X0mzrHvOQwjD1K6MvpiMO7iWaMkDuRXHi1aovyqNk+colguBmIYN0JsQd\/4FxwJ\/waX3TeFzWUa0EM+h6ta2eHzYp7cVW9f7+R19J6NuSmD4ZnMYeJK5PuabYPy7h5HpfCWII1cLse0MmklLeG1qz8yAgwj96kCtQddj\/e3uqnF5Drr1sTyHuOqp\/pxW5G0qj0sZ99wCSwLrZcN+ZFZ0Oqdk7f49GRZIwoTHQkD8aqacaxGjk\/1BgvwK8zRLBcJeExY9LxeYg0LFZFBUjKhDhMJplB2Lp50V4yimVvu4hts09rMAtZMxaWuzWkqBJYt4+Qntd9Zkut1zROhVEwKfGZ8rjLpgaXzjeCZGe3IuP2Z7FM9OPRHC2Cw7BUy7Kq2rEwN8wlxrw3rILFPGdmsVnPuOJtwV8Z1ntef9NEp7eQd2A1n9VPxaQf+o6dT4dW66hSVGd9hXINIqr4MlLwHKTi+8ifKNu\/AUsSNDItt3kNnsuuTlprXjB38qljJ7\/4ebqBOCNXOKbwHPqJ9xGEkUG9ZrJS\/yV9QHBUxIkG6epP3pn+1OJXQOTJzftsaRCGZX\/m7ceIqWfU6yfj+jFq4WuAVNWJ2qcYnynDwEL87InnUUVSrw3WphUSJz0NZh3pcGEimqiNp1onKmzF6rC9odVYhM9Owy8593EjjGY5QUTKIqHVR10gSQbiHemv99\/iy2M7dimp5pQfWUGkn2Gd1uOtMfHFUMTuKeX9ey7pz6kNJ3hXrFAorkNQimpS1bc7M\/zJRCo+xuguVz8uYLSoE1wRnVu2DVK6H1dfoPIN5WRNGAR2668bIalvnQE4b6eC4e9SJiVgvCooBxpa6r3pTx8wItvA3jsp\/dQ3gUhQk5DPz03juPRHn+M5WabjB0Osx4CjrmWzz\/GBrObXdWkJfXO3Q2j0jGpYAdcwSDDoe5803I9hK9buOokyWdqhSGJHXeQ1eup54lzhQ1axD\/\/mHXTHauJgQB1aj6qWYYLTsTLGHrl5QLc7pRi\/D2xKtzn\/Z3VLtX99kVNgftwVG+xs75kNErWbnxDg523jDW+9On8xF2+8MjAg7m6\/bRdmJtUo\/r9mbc7nZufpZvgkyJs\/G\/3BD1OkDzJxvIP4eKxrML+eFBYYzk9mLN86ADKV+UcRmfhQB9gbxGWn4gBUlnErdGyXxp2Kl2tqC2gCjNjuLVMaHKqfd+IUhr3CmbJfaqrh1JRsar0rPO3N9d76BCW8SvZ3Rpq7RRbzn1d3iJZUDao3L9CzHqKphXXkmPITG1ingGWCGslRXNPAYx3YPjrsawX91OXzm+OQ9FA82MsovFkBFPSDtTZ30jPLaehp6qDvo2n53AwDEICH5J15X+WR8Wap94FemTz\/Puc7p8XcisKPrp25Qa3lNL9\/94ltfVLlZUVENVA9\/qc4bZ5TPlUvXBLLauI76q4orxzI3WramxqWkZbQh47RuzETqrJyZDKdORlN1g3AcGQKNx\/f37FvHT\/w5ylhxpawuNhjp2\/YBQopWa3T8ltyPxs\/0spbI32\/nErdwNfb9FDWjvWaGGkjMUjmJFHzUuLtqVNXgHLLC3NXSZiox6759d5\/8RASKRbTgEirkVnGyL26MKicmsBpEmRond\/ByI0+v1NIck0\/FhFtmesVQcUtkuv9AdLvag0utls0ZT6iuOxed8NvN6ZDJT4PImejxdHh1xhJPllVXR8G6pXXYOw3ALxxBJdYLQaHrBBNRZl0shWrnt2BD5B\/nCUN3cnP0RKAoUE\/We+2+NZnrCrjqJetmnqkBGQaO6it5fZAfdpW\/g4JBnHe0hd9hTioz2SwLPp5qWhC1Zes+hwyUJnfWrLUHr1QJ8JpqHbWg5ht32nq5gYyDMkelkzotv8ogOuqR3sZ1FvinrfKe4zju6XMOqBwwGfSckifzgxSf\/h6uSOx11IcO+gG7KM9cefP+Xjh+I1OGm2y89U4NNJfkO\/3JJKk33USyyTq6+gQHlW3KQniRVIQ4lFvhJHqTz8\/7yCb1r9E2FGV3rCDEzJlKOlZBUWFkWQ30gN6Z9+uUdoztxTjTIzXGGYcPWoPxHrxF385rmRfRrhaIvnOcmcXqGRV5rvPWDerprRPozzNmzDxlGURZ2zARVVyebf7BVFU1CKJeySs5h\/HISr+DrXxIBDiL2XIkKheGb5\/FAjtDwdJk6dyLWTuW2KPiFMnz4pI95qd+qIZBJOp79exKSWagFqofjzNx5SBqzsOZt9lRmW9otcJ5fXotrp\/fp5p1D\/Dj+dXL4ssaxnLG5j1DjvO8HIj\/fWKBmQaxdSV1XEEzWS3P3ajJrteRiBx8CWck2smg9TTp5bkaakQwEkYEJbzOvKwaIxRnE4doXXrd0QqTk\/AR1SbcTJ9sjKpVU8qX6DhjRIPLSsGivcmAVi441P2oADLKHTVjQnnaAjMuJ3AP37u2go9yJ1vnWw6knYlc\/EBZi1hP5VA3E3c4Ba3vVctEJOpWdh2so74oQuqaik0t1Y9QF\/AjSjnJi\/PoGERHOCdeDI+mZoBxo6pjvvjIg+e0\/CziE8NdAR+vBRWgC0UtpzrLchluK9e+jSMeCLyBRf6cblBDxhsE66iwqjl++QykwkH+cf0n2uVo4hQOqV+Gy24E1DsYzT0oEFe\/6+lbSeCIwl9kO3VXxeXMcm4ZfPpKDjI+2kd\/0wdI2xhcRqvSjRBcLR\/I+vCO3CFL3WxNja1SN1Sn3twKmEHhDsFSI49ytqazUmv0vR5HbzO\/nJuzX5ZGTebVjBPmz3xnMOv8p4o6R2t1NbcugnGQe5SansFfr013r52aU9XgRuaVPumpV2pmXZJrQaxq2tKdHZaNMlHDxBysqbByWDMMSxQbzJWaqYIVVlSnelN8lJHkOOdJRbrGAQ\/6XiJBporHzPgq7fUhnldnEZY9V8917FNSNacxrKuEm3WuapzoUo3Ikupyr\/r8i+NwsZt2Uy04AYqTb1qDIW\/drNrxjegonc6E+zrnD1fbhlRZs+EvggL8zu5tXHyPrbhqQ+2RAbmL\/Z10kQrmnGpSVRgVoafksaOHOXRY5zASq1YJ7ErFyFsZCddEH4dI\/cPF9XPpH1Z9edbMyx\/kBkTrMWBDs2aL55iPu0XdpokKx692BNb3upBGkHhVGVOVjBa2r2Klfr1TkxqSFdlRZ25zVvJS7eUosdjopTqYl1lnnvNUQedPfHEM87c4iRbEyS5f2Qcxh88ye5BQxkoO1RzyWSx1nl8XsgMRq66g+GkWxPFfmNVWW7VoSw5EVTyHeM2fv9lKLrlvdTHnqAORBT3io692vFY\/kXPN\/LIMEcq4yWeul8G5GeVU5GajRzINFC2xkjlBAm0aDeoYXoX5lmfh+uCQuaaSlufUPNcXtGomNpfDXo9aVzPq7eDlm7mYg1UYCX2ujiWLvEser\/pag3JcMgnWWxe72jFmRUKrt367c7Rlzr5acIa3olFBrCQ4zNEX1v1dvTtMiKNJbhQ2nlf0EHMQQsQZO+13Xdh6A933vvW1859YxZ3Am9QDudcx42\/V1Pt+AZ0Wnpxz+Bu+Kc4exxCfDWPV4Vtj+PzJLuNmRdDKpnYzu61YqglMkG2U1m+B\/trvykH0ysnLVUWJmtSMVek4OmxRVcs3xGTsIUasHBnA\/UTKtirrqdTDckrq5dUE8HleU0zJE+gjR8jUni8TW39y+KlQZxHWhM1pRcSxzw9iLopGVXSxu91VDn4zzFBe7QzgdfB2SFJL6tCo3mUwals2S1CTf1rGMdLu\/HsoFZupim88fV7JordjS8NUSqujcahXySxkvmYazSrbH6qLPtiDkYDzzDaV8Lkp7mNwFQk74v31JMxBlqIvPBQoryNLMX3vlSgyokSOssyuf\/qvd4P9ik\/wgtJWa5ejj00fLV93IRpBwEXuOPGtOKrSYhgc6QX4997TMSXWdVPWAfUIdtW5mTwo6455+wEFZAcEgrjvPDji+zFArtIGN6v23nsy+wJgbYKWEU0FlF+JOp7WuOcesZnRXKXNcNG1MmUVVC5qZr4j8o294UTumfe5dOEVuMRrHltNWdeDwGQa\/vZOy\/JcnFDm3vgnX\/BmKly+nMjk7pytgUTnC3UJm7tbW2XeH9u6CC58Gjf9MV74AJmo48zuTNfcGzkwpLs6zXTcba+KLitNP9zP\/8a5V\/kzZ9cMKlV9JLcCzfioqKw9yfp9GmKqdO6TS4RzB+DE+ctwVEz\/TG3h1MDY5cT89MpSvkcsVyWDYNE0KVbpotJdaeWYHAV\/qM2DR+YWTsE1hVeI7IgLHIF6UkegkbEXKSECOAykz2+9SpbckW3Plweo\/fNY+Ch1iCf74msP+TqwJ0rAZN0kbcpI\/qReW713zK\/uzewPFRlxng0jfm6NrzY2JtWU6kvyGrBSxTDneqbTnHy\/m\/c8sg4i4sE53M49GhEn1iMgIwn42m3qOI7qnNfzGZs8BztMx1OwY6TDNGG0ZlEWTVaPefUtjv78DHVFzFkXVkPzmpxgDGAI9ygu5+Qb3Oh+9ATFDHhsxTDvsgBKWMS83pR7V95ZlJ5nJVvPB2LiphrNiOpEu59iI\/ID2W+nMDnIvbitSWvrKp6IJ\/JzZPSSq4XghLHmXta0PAMs4yaJYfu0QY7xtzO6VPQyNCOfY2H01OJU3Xc435iS76bPsxsm5HyOKLNsP8XA1PaMrDtmnDmt8sr8EYPhiGEuHMLHlJ0DzFf04DrAPDXFfe2ip8w87XaHy7qgutW3qxfaobapHX+2snwVnxkmDC5x5nJCJrOe7PDHKH\/H9be+ovrMgfgmwYkq\/AemdNm8yxqK9if7u0bgtW2T3pyf82XWyUDplgg5e1fztEVsmEXdV4TASjY\/b7S3fvfpU7ghV9NWIxg7l2GWXB9wHKwNwp0RY7XyzAUzci6EHlWqOiSmVrZHg7+86jzrw6pSMFxdGoySOzVZT2UcqfaBbbWqWYtXSKXJhT2OzDG3zGMcVZ1Isp34tjJCrNQZr6tYu3pM6VAaxAK1x1UHT8WK\/KkfpH8xkqtcaEvWmub22+dtvMU9OHW1QRToyV2gY3OzfQxNxPTUVBnRWCarX41\/yZiO28goreloiLAOFMcRvBU\/1m2x8J3Lc\/3nzzmAfU5kYshfmb5ZifkmV63QqSP1BR\/DPJp17pGhKsGHzDpHXbZAtFXoOFHSvDcRCHvKPsRwYj\/4mAh0R6WedvG5PSaK0x73tsPb80pcwroCXcAwtLydd2F9PMKUiF6Z43yu0PSxn6eoIqXfOYRe8kcmJmZU7s1pmbC57klFiGur8wlDX8bvML3r5GVrkUcFikT8Nxi8LJB9a1WOF+Nl92Y1NbszIGPlznmWQEaXZ4XkSd7kUC1L\/eRKRmo7KsBsygJdX6cPIlDlghnCTTEH5dMR0nqJqD6zK8vQu1zKWfCb3sfclHuDP78Tw4gEeY9+8LssPe0zTxlZLb3abwUnM8TcNkTBqdkoDnPIeHvkZe3U+JT8vL76JS62qoMtkAkUHr0LKud5NJPJiQyf9xpGYg14yqqiiBTiQtxzfrgufAx\/wF3f2\/zuEcy3GakqoQpwDRpE72HGMh4+oR6sDjEODsUYvGC5hquqCHipaBatZP6MeI4pw6ZKrZO+G75mztUuR9fRbybVLZg4\/cXNxE1MHLjjduNXhUNXGBOjCZsOSuC7wOz7uaQ6B3AXbbzvszbGMpRzVfkwNnE\/9BctGcui4TuXu+zaRrI2TFs\/0SqkSuG0zXVaQoOetVDbDpLQgtWGwTiRGYadNf1pD9E4BhLl5oAoctcOx+48elbH8uQOFIIC\/RG9UMUyUP0iaEneOA806OnIJ7XsKMDTvM6TX97WW3PlZeZD6+uJugacezyOc6dPnhrPJ11OCTyGe0LAVPPVkeLhUxG7mtAJUWW4GNt1piVAqiPjGzbcepzjE0FXI5nHwyzGGE5E\/4K3jILnSl0dWA3pg0ps\/fjolGmH67qMwlqxJuPhHv1I3Gd24beiNKvEaC89ZD15jqT9VtVAj32JQ\/TJFuvvys\/knfd1h2mzzJeKSgzuCGLY9U7eS93nDDA9I81\/62hxfFaB7Io7C\/eFA5lVRpTzib\/4cGXC68ag6K9Z0XMlDt+53A8G4jzHdmQ3Ha7IhvM5mjopCqadRJe4gnburfBukylKeuKJS2X2POt9JjLpC64TM\/T0V8U7\/9Q79alm0m98zq404kKiXIl+Ipkzk4EoV1xgv904LjG7lF9TOkFqhTglY7Sig22NLmbLGxdR2EWOwoeBqiIteCRmM7p+3qVxyqvmn31UqpS9ys6DKBQNaFMmMWNHiRnFxVXsyIHyMtVMzPNa9QrH27Go7lUG2dIotdq3t+p9Is1ntasXybYM0roOl0ycj0HFc1mPPCzG5A17FzWevzWSOOAtaclVSa86xF2ASjE+PRERxjxn5hnYrcTJBcdTs6dttMQoZavJBlm2ruWOSZVrvNXzXv9dti9DlUtSX2QWFdMn2rOIUMdgKTi49RAmYbbHLeDzlJc66251Zps+qZ+MgtaS5WK7XrTagb1Zlgw6vzNWD45B6kmnHoI38Nsr58E00Z7XRQ4ZPY+yGsR5rSl29k+z5DzykWkQz3UNVuWx0Dl7PcOyQrM9mLtckJ8wQ2tb1hrcZMzZsQwZ50CQJqLLdXkrV6zKhalQNL7MQQRVkerU995cI0rb+QfWYXGXbIVHdOKZexW6rqZeZxAc3snVvDRWNYNl4kM7EjxpmHW1AQ7JOahVIy0vqSW0fH9UEudJZFXqRqkRWy1vHvGj8PxVFEje6p2fpoJzBJkn2zNckXFVrRrJEB4tr5xSote6y3AA005MDm2nb3y210rkGHpWZ7\/fsypIy0GJziB3XMWVtlbrM8hVUds6bSaI4yJtBqeaqo79F\/XJqGcOuNXGKg6f9mU5sqJ6nPvQU79MY8wT9+QABklhVNHIB85CB7V5CqNzJHqL5qXKMlp5zBmQAY9idGTGrMh+vKOf5yheQaurp10pVCkzB3KcWmvFkVfrGm8oF6MJXVk9PsFzOI+8kmE4ykyrvSCF2fP5c46WMw7NVD5jo0pFuKtJ\/UkVMi3lKgizq97JEZ1xvWB3cYI8Ik020Tdy2LtHhEpeiQ+DS7o6bibW9zq3lw2Odch6+KVeCjTJp8wRDgIvZIj+cPR+17VKZrzLCBtRWZ9ogB\/y4jOKbZW5l+cS9V7PWvdhRQcTaCjuqPhHk5yHODj0yWXiQjwwqvrhdffgfPG5nhNMW9myyTGtV0zlHVStSEDPxx0Vybos1pnznnzA82G7K4gjiDu38uVJohpc4E8W9TPQsFrSzPNM6CE5CDei9K2zJDp5ntG1Kq1S6pJY8V8+z7SVn7jgyKlSesNHqRrhZd7pqsD6BFvMuOeXxXQp4FbGlMWtGjFMxbifhF76l9xR6+RcHyMzJhLJkWiZiPZdlC98wMy4kg\/7N2IPwm91KDriIVzTJE+glOqHsYjUrAWNGk\/eALWirzlPXG8OVE99Bp\/IWg6PAgcfqlxYrWfn52CPmjfKeiVH+swkY5dJg6TgD36nQg4p+JhWt44oSGL0p4JFB065jOvoOCp+OvFa3yJbZhblzroq+KF1Vn5ZbMb3kO2LfVW0+OgquG7q3COZg3HosfUUlgxzJAaHvXpNbrxInnN2vUX4OPHL\/PIe45znBHAF\/7KBtsQrVz2oK\/FA3c1ZoAHHIMN3fOUaZx4H3Pi1yutYyzHzWw7GB8uOegJRWqYK3Fa4gns1uTWYKM0RPnslcYyLQZkPP6dNtNKVFXsSrQuiY14YHf+9PFBtrblEBWzpB+HqQXKeLZ+RdF2S2tvqYW8kLmS5LbV4no+4UgV1puSjcSSGcAlt4ITV4snf\/8bz4EPC35nh4OE7I7GaSWYe1fAwTHBDlECBNR+nvavauX6gU2Y3KeY09xTOgShulTbveRVxnkLH7k\/qC11aVJMHv+uOz9eSDcYBKo6LZYtOJ7VTJinDwR9UQi51NWvJVjWNXtEy2eY33tUiUhB\/we4gecXzHF5UOpmGOlI7mIc70rJrOZ3aS2ZateUJcjKRhvXILa2GOcsHV8vUfSoZR7jzo74mll4F4LeyyugT6by6zwxPG1WfVb9y9iH7KpJoJCt1EWhQ4rWOEX+SiLZXqtWKL1\/OnHv1c0bI+Y8WUZlThZ+\/0J2dBqYu\/cxN9vhUL\/0q46xathqs32hHonh9LnIugsECelhuJ0PhROte7Ydfy5\/Jvawa9WnWbqYqNUhvH7iAjIz\/mSkZ3FjIbDpRq4p1cTkNr0JNNGd6ClkKvDinzDb6qlKkhey\/MBp4UhzQkxwN8ldh1pkwIkYqzuVd2Zffq5vDSGV06gS1cYXWiKXuVfpyZ\/L0jg+uJGr8WwGzNoMbPg9o3F6OMj6Om7NdYTiiiwc6ayRomQizyjwsX12hUNWHTA7swH9qGqoCLXKMMeXb\/uCOO+dXk35Z97BL\/OmNSr6MHM\/Rk3zltzd4lr+rshcVW7B+ZVbmQjSuf\/UaBb93POtQZIaWVZpl2dCWUV0iLT8QiSpFezJj9KCb4JzjHp8IQPTBkhVvzua9fitMY2nP9dZBM\/VEnfEN3voikVoODYs6GxFyHAAeGCU+oCoPoiNysmsVF15Z3dCbGG0zDb5SG0VWz9fxDJ\/VV6J83TOO67y4ZdeU\/dt1o2QPFWPfY\/jp0T8xGF5SF4w41SQbWHkgSX4RgV2prT9XPyYmX3sZhR6WGpThbnzzU1iQOw\/MXu+GhDuNzRzQeLPmSPqWO7pmhCPk6TBbK7DxkNnA6foZlDV8nAi9fApyrSk8BX3jo+7fop85sb4ugpqX1OV+a03YEfefSqIfFKrukquAiU9UPfeFfcOL6M4Y6hHHT+83Y2VMx1YZByxUrfm6ncgU0VQxZ4BKHFxOyH3ELKl8R33MePqH2fKLjh6nOODcZ64Rxah5xtc4vsw6848LqvvqNdgAOZFIlTFkuEV8765P3mMKoiSsSKw3X7K6bjBBIG\/VvlcVaAmNMF74vRwdvKfHqdDMwdUEnKtPFJ\/HRuDJPQ9ieCxq7akmsq6KoopNezIq8WSsE+XUNKsI2Svve42XOZ3yHofhTWYuoMPZew\/mdALBsk5QWxg1\/eODTwdmpMSSEdoqx80elxXV6LZWrXUnxozrT1PJopH4iXcjqHacJ7jYnau4eHtHDPkguue01B6Z4tidWVfVyyRqvIq5zr7zp3SSrVxLd9+LGM27+ZSV1cZ6Jf6FPL6xN5sXWaJsVPhJ78b5cj75U\/PI1Ovv5Fw1Wc+mw4Oz6a8RS009bcARy9O61TmaT8A5N\/YtrJwglD2ZrFyowrbM7Mos7NX2GYlhCdHHKGBZxpD9jWRL7Ttfc0oiU1FBqfSwIbsjd3ZXn91rnfP\/fH+sXL4h6TdTzuFc41xfdc+G3FMPukjiZUaJMu2iXZfBwzmVQt6vEjkXDyBD0YrtwQrM8NwedfRWBTPkThq\/6Y+j0Ltp764qylyigB5+IylaySqVrYJTX85ORsJ3vMhVxc1PGTKZmx17NAtfMZxd10TbvQ5E7YEs8LIqV3WxAsiLjLLoqAdgvGSt6pA6CyaiHcQqd9OkWnBJaEqqYte5U2FBdQSad965khvrW1yby0PC8XAzpSqHEax0UdI45\/VjQjOHuhK5aAY8sj6pr7I7k+haQaDPejTeaaf3O9WIlCnnHfoRAXi3oc+p5ek19d9az9npb8JKnKy28pRnoPpTvd1\/6x34rXU+cZV8+fmucV\/zd86YMTCqOaK6mefNfslKRCZCHIdrSw4bj2G6OD0yWrfyk11iSEWCgbrWeIeMXVfbOBPtiQp9Dvb4pjbVRraXVahNUWwFW2OyxLR4SniVuPwaFzX9oQtX36lj3s0fdE6nALO5NrxaOj9O5Z+HgvHkKO+Qd2zcJUvrVC6oxJeWi6MVukPiyxhcB1C7RAw\/1LYaRaqFV8lKZkFuWcvmJ5WOOaiQf\/FxV3IPw4brYZ+wAZWRjPp0JsazR4UxmLu1o6OrdhmJcrse7ZgfhfSs1HyypH7x741MPD26nyaqq3UDtJjYFBW2W7cADwQDc3ocnOfEQZ4SeBQRFjf1fMPwbav3x9b910V09cMxjKf\/i59lJdGMftOGi5LdzGTG0bGlbvM\/rgv02Jw\/r7jG7IhSwRtXWNLn46sgxG12LuQq\/p3onV\/gJ+IB46rS6oEoN4+t4mARzm1dBretttCEEYWLyrW7blusVbP0Q8VocKqPYLdzIuEnw1uxZarVDDi230fNSo06alTSzjC5+kOFtLa7upBp5AjcolFiLs56ejYy\/SzMgho1ou75cxyABz3XSl+jPRZE1uWjCF8Nfvz\/z8Bm81R2IarfaVkPw\/vc1R9A4iTmvGdfUh8QTss3VxJ5XYm8CBtWEcI68HiQAu2uo6Du5F3nbNXKATPnoAJGqx\/iXNpClTgfnDIROJHdLN1xzihjUqfudqBWVFSjj85Qe0HDaTfzeP\/67bnUAnifs9UUV5bzpNFlR7L1\/WEXOXlhpyRjBP20c9UW5c68mVnnncra\/rpaUZ3RImZwvNOxwe1xDuknB+aaXyafVzJO1x9lzNuvqiKP7iRPuoPMAqQwUjiWesvfzmLmBMNRyY1c1bYVjf59DTQpAdXMmSeqJkqtnSjso9XVlDkxmGeOQfnyL+o2HoGxZcZ4hKov3qeIhW0XfyCfFRf1lUpI1JKi7A63flIT5td6BhXnfckZ9cP6VG9xyOOMi2IQkQroZw7OBbMf2yK0nuR98DqzaZbFyvcan0i3dkEbuHX17xOWf1fzx4iMyBpljNQoqDw25dtaRCtHzUz8zpdzfhxD3vG81c2qiUxDFo9VyQW1I1voLuAjRse1V7PR+MyZaHNxSv7feMBBsAFR6xiH6ZZ1nb+6MA95YCZ5gnzroJyEK4FD25f8Qi+rVFELZnx5ospfHuKY+6+ZOXcL11oB8Dgt8hp3RwXfdSC+f34QrIur80pEm7kQP34XD\/czOWxkuGuuuXEk6g+6gGuDPZbHs6tF5e6ncpuVUx9nzhhcxfI+WXSkalp4rDwHvjzyeBbe+60oKj\/KE5k1M3LFW8tE2zyhq+LXKpGTQJvqQwzUyMYj3EyEQGU5Csx3JG2nGE8rjYkYKLuVqYhzcDDcASvCxFRmP29w95W+GGaGfR4JSOgqaGZbbHSc7\/xE5+Y7OoVPxjvDwPpoYo72Fx912h0tq6sn3xwH98kejvY8C3x0GKXPV6\/lcCsH5dMVUeEPypI1s2f2yQJ1Hi2sR7jxqO7HpOSC\/1kdvFaXw8qxVR7uHP8QvUv1F\/WudaxP+YVYMyL52jpW16mJt55R5auvfudXI9DPlYVn0mr9hMq6Liij1B0x0jqGzGErbOpW9PDt9p3nW1eyP33q06i26DeuIDEPHlpHVWa4pmvGq9AqRjzZ1fGuL8lx4w8LMJ+8Wg9BvbJ\/lNEV3TuKRNNrWsejxL1zSZ6I3Km2dyK2Rh5duavhtIK+iKtztrSWUZe7X4WQK46PbM0ok2O1SYWBs9Qj6oqdleEIZ+D9Z+Bv\/rxuj9+rvUEfbhB\/k9pMVmJu6wzkVV53NK8\/nSPmuyS8J4tve26M65oYIa6oFRk+yNwt1mopc+zYE0F+5r\/nsY71qWJ7SJ2K16qpvBQUJXfhx6wpwDURuOwEG9\/ab0bOM5g4hyO2hfiPVy11HYxAV8aM1MJgltzUS4dHq6d\/Ib7xYnaMinGA78kZCBJtRp4ZzXvkQ38OJ40Tw1GKFPAkVhclPyxfZ9KjgoJ4nfMWqFPyXGaQgfptLvBuarCM8R3PJ41VOLxL8dkVg+uCnKNSwD9RaRWWSMrt+FH81rOq2qqGqeuf4J3wgVFrLUwvRRgRb0S7zpsZdycks6j7mZ9mrnNmd565gw81j+KAi915TfSqMo65fJsMwmoC9Soy0UsWXmcAWmQ8dn3AStFU1WNG3MveWGUUxW\/cIdra71BdhySig97WKZ\/gLYc1curalnp56FlfbO0dRxnneSv31ZTRmSf1BLLxNZnrHFeP3k8DpOWugoLY+f413YdxI+PlpzACHsnqhpFvPUDVUEnrCMJcqJ\/fu0oVwpd6G5msFQAbTZ097qLY6X6JHge8Bm+sWutJjsESpebqNH74JqrNLT1zFmj6+hxMFo8dZT0hTFcVa3arGHiVevXCkT0K46L60Rt5oRrB1fu5NkmadQOu8ftvV918B5jI0UvPFRyonHsnWcHARbiOjD7ugFGV2ep\/uU9HF1h1zRm6DO8e+Rn1sFrXtanPzGm1MzWoLs28WwnB07oiHEuOo7\/X+xTZcReiSZ1YDV3k4eHy+bhe4QeRoLnsnFoUz9777orwHCc1y+zscR0XvGGFXx5h5\/JlxjExTO9UZfbedzfPp4ASMUbIKoocwXDJn\/kc570a1BplNdRPRxPv79xke\/7Fq+Dbi7ZeCVW34VmiVO2t+lrl1jSZUkdVG5Alh\/CT7sQIwgRwBiwhHs3jeqscc5HnDLDz4hiVL5fp1HBKw1PF2Pk6YpH\/ph1yM+BwZWB17FizCwgu+Tv8CNdWqZK5+pmiNH5xFTK8mZ7LuWGZBGi9dlZTxeVlHf579A4GSiyIr9qln9OloA\/EpzFK7uFoX1\/dyCvMB5cG7+OXdHO+bq\/0RYvyyeGBijkvTbuMgbbzb+JAVemC\/t1GvURjjraCU5xGOKhPAtFTM6Iy8iCvsxO96pds6Hn0roahTKIOBBKHjnI1d1Wo+07inLVE3Ru1RR3WDU4yyQdxpi\/GULYM0oqCcu0dwU9vJW0b0WrQ7ToR5ktXuDyZobP6ZUHxolMKy3T3pNoCXqJmYAUOEc0oJ7HBUfG7NeW8whjhlWn\/\/9H1dkmy60qP5Yi+QZT1NSur9zv\/sXQAC4uu3NWd5+TO+JEo0h0OgJRC0bZbm+3feIm8hxjF6osYOSvD4qapkl2lN87oWuR0MEpflZwWfvabXx8mwfewe3pAX+CZ9qo9e5X2axqnuzGkP2NzmLa4TdQg6Ma0ZxVgbH3dOI+6FA9gBaX4cpOjHmc0hsb7t3e2DhuMGYgx9ZvePRyhOKmqMmVbyZXS8JXH5WxKn4va9huG3AxMnbBmYMWOY74gERzXDuNwLQryKmD33QAtzKeJftmj+G69jY3IqvzMXrRVBkaTx7+6GXJCnbK3aOSdYxB6qDugzacAVPXj2ONVfYXt2oa5ZcQwAeziKNaPjUAPhNcq5ufNyTdHfAgqLsnaOKNj39zg6ap18WUgtiGuPdpmsWCa+ILCZL61UF0EdawifJWGnBF32Czcx7z\/q2llh7R1viVbb5TPXwZL2W7VrXMxe+BS12Bsxg3Nly39Wmnsx9HpGzxMdScnVM72KYO3Lorn+xQBldKYGM9msvhoRYmOxYwo5lXYixqHu+RStcFc+D7bfHUAtaC2yBrzmQ\/vlmL7ao5VZKhl7en8AgxUxphnhWem6PB0Y39qSW7pNSOwfk\/bzjGpFjAZUaKG9Dw5RhG+tVUivf36t9\/c1iPyw3W5nGGUQXgXHOSHewhylpC2YBuxzJrBWHjnBMKEEFLvNtnahytE7Sq3nFbkrMUvkn579XWukGYL42WloyIqpnUBAqg395F9ZIPEjTp01YNo+X4R1miSZ+YW+jYZEg4iC3CmaiovPRZgw99mXgHkjGDfzTkErIo2k5INUfDR9ZgeVk2fpiKrtrFVe9tfVpRg2R6FUerrLkrHoY09+zc7cNOYqvVO3MomfUcEb5hNvygCT4zebKtaea6PJmuiwRb\/RRyaZdW0slb\/5P\/x3XqOe6OXyaSVg2bvvcepoHR6V5ehPnFnEbgKnJ4GlFk7S6qilPvKK6tvsW\/dXSXYhrMldRK1A41EiPrOUblPMu8Mw+UattBLbpP3ymqO+mfcPQIcITbdizyVsX+DEHv0G\/aVRxaVOZD2oWiBDZet8sEMGBlm5WSV2uusOga4An9iXe\/1dW3617ZzLN7dqFD0rZVexOijuDeqKA31Ai6KjRfbMeGLgwqWLfgWAtAKO+UYVAZtXobmOqgaYjMCu3m88wC809VLKWU1scg4N3JGuOpkxnJV\/b4noVnkuFdt1E9LadyKC8GotI9DF9lwNFTG1Sj9VfdxOsHU8azsSfTBGlyJ76JXRIT6oEUcSFss9+uP9mpxSN+mhnmU136\/+dxc3RPz5xLkO07fkY0evtHtopAoUff6PhnHmD11rz40io2Makj7VCijuQoXH+KA4TqflkHNO++Nl954bY8aVvlOv+BeawpOsB5oz\/pFETJiz1JxRoOqWBS2+ksrMrAKsTrF3+WoixqIpGpAvdzQPVc7vNZsF\/d\/PVOxtqyg9daprhFs2jaVY65xDiAl\/aLiySUucr6Ox2SrPaHXY+EygMrA3svpVBAvTWvtzWqLmsrE9RcTGG+zrnHC7y306vwJeXns0ezwvt5NLzQ1TexWW3zb2Nf3uC0oOW2wyKhcRp\/44GPLy33tahZsj6enO2M86rn8Nz0ae5Ox1kWriZ6FY\/cJiUxauq365tjJef5NZamfrASBsOF5KnKMyyN6eq5Rx8NfnAbIJ3qnu+ieNfnYYCxsnZKl1QOBmY+5llcNY5Q808s4DzFzY4q9z8ga+UZg5Ls+cSzZQW5YvZeB2J7zkF806MmeXjaY4q2tLkfwgZGSK2WZ8V2ZR7YuA4oe0Nq2aEXGJQYgyTF+3R9jnhaTG3i48eieGddr4eFisZUnzTJ7zcO\/qMrljsv4gguV8RhWhqfHHNMaO49m3uFvsSGjvf63VsySWXwaUs0AJ6JAL3B\/UU0y98XzjpHXx21UVv5FKflWv8OPGSVLp0Ae\/zT7jt5Mt5H2dbMDMhtOVlthbjM+vwwDMZNI9QSn7WOD1u2tbece4BNsuTfXJnefxy6Mfq0\/L4aGszXOobrRPIqux57ViIdYPOVq3ErVqZIBWmu8+YuDmrdtnhgjZuQ5Ys\/XvTbGzeceOJ54lqsOuRsH+WU2FtSNbcGV9f6HdYhX8ZlYsxU\/8qLseSzqe\/TJ2R5tGC9q4+qa5HwZZty513R1L+9UeP8DoeA42sm3NMIMZJ0t41KmWA9FqwJqebUmMrzT4s05qQB+r+LlXJhjLL9I65ub2\/4Q96KqePDKu60jNirj5+k0GeGYHOHu+\/VyM4cmT4rFx95vJbCRf3wtLzw3NzfE8egv16voahrb5\/JbH1ZasUt81FMUud5gsxnnHclJflutjX555Nda73exqls0ui2e24zjOlfXQG7+alcZF2uPzVBujoh3pMaf3yayvK7Ky5d5ne9ixJs5c8hzPtvZd5gTrNJhDlWRSPrZFPyfOMI\/PSVuT6cuv\/a4Soqrp5gDpZ18i0Wx0\/PS73tKf7PmfqPkb7PNbBquXcvP1fnZpo+6WeM\/fuxxdeFWJ1EDkeIg17EFQjC\/qpbnUQwYeK6ZeVvzS10RXbmJelHhaUFV\/VdfwZUe5LS13NxWWifBT51yYzU+r0toVEH28yJzaoyuaJlyhDfyPNhNlKfSq5xpJZo1ZE4jygxj01XG4tbzLDICUQGj8kpGXvj01eF3miLjODvr0eZFbYsRmCtjxRGmPx9+AZ+uY8xNqVGN3VPRXTEnxzMKcEEGOUIJY71iBESN8bOd45Vd1JFtTRtFULGJx0MV33s6ISJAD06\/eGR1oTiX9b\/zGh27PoreHePPR07HHC1\/vfKU1uXmU4OyYY4NsojPm4vAm0UEvFmsDocgYLPK30ger4Jdx+2oQXrjnP+6tcwatg8ccRuuevSlbNpX\/p\/fGgjfLtftiiq0Ou0Q9+gr1cQP8ze+yclcGj1Q+I2t+oWONGNTcKI9dOroxCU82EjgXLb+SHbHoKAebzfm7JYoceLv\/K+101w0KtT8iz3b0ztqc+Me0nkHHbE64REcVeM2pewzslFuz3HaanMkVlQj\/SnbPAYuXt78tONXG8AKqt3Rkyd6XrdgVYxFVo3PjT3W3dx6sbU6Oo43KxyamnRQ8ntv3wjWqDeGcolsrBKguMYtGSAn9EUMk01Yw7pPTjci3RN883udMyMd65Ck46OWq+3NE1mp54Kfgq72tu82H9Qaed2Msq92LEMnmUte54g+mlglHZI4V8SZomIJxLRO4E24CbzRPyqfOlr\/k9WuruBlaXP5L7I2EwqaVlFVq\/ritroaLsp6ZP324ReUWH9W4rFl2rHfzmJvvmmFXxZ5JL7Z+1yUTLxqh9ubdfKuvtP7YznHYtTYx6NSqyKevsv4cplKeSrK9qo+mPryHpWY2LWtVe2xL71zfHdU69v6J\/coWO6B9uo5vDEHoF7R66Jh1WGsOc7XEfWd8tlQtmzrptACMLzzomMX+gObZnS9\/8zjqsYBtMl7Q+3ztlYSnwQcr02pqxTEkZ7kmfh6n8p9zoCjqR\/uN5YtPuDWtCCfl++G5lZIWV4WpB\/gSWVOTMEY7AHH2KLYo5c4B\/vMe3Jc9LqZYITUPJyyn+Fomvn1BFbZHVXFn2oPS4wDR7MZUXu6Smy8hoXHWnIIGMZLpDnXSlQrGMaqBcu2bHSImlVr\/kCeUXsMPR89li6iZXCOZZ2ajfFXEjJl50o5eA5NR79A2\/ZP5lpBjRUe5PcAHAdMxfN3C64SYfvLUhW1SBjCsy\/s\/1xJlXwVQq5XYcdrGRef69b7fp3JraJN31d3eNUOrX3AH2wEZK6qPAUn+6sn0KCLP3\/C8Y\/B5WruKYVTOdYkg+wta6g48hn9u4pUlagLxkzf52j2DaEhCeqye\/BbfuL+lS2drs3I9836VvcZtXoAt6WjcxuPNRP1j242nhwxveZOudTOuTSUQk0xQuzRiFSBF6\/1HcWE\/7cy8XELehh4hRo5NShz7j5MMIo9BNnwU4A3dXmYmHMHkT1yzk3i1RPbW4m5I7PukGMej9ib7Di2am561yfuY9\/1DOun84C08EsD6xxgmC1X0eY9LfZxYzoetepRTdRYTrwZ4LEqlYMzOXYSa0A6ay1trsgBQ2Bm2FLFWqLEOaHE6YGoZrW4grevjpK033u\/337OfxxwbMLd9\/PLfQDWWrtk3T+G2lHk+zjn5gDvqe+k\/n\/drKfAWbSHFepUy7SQ2Mm5RAoVArE6nIyoivZBvdoJvt3vq0S0w69VDx\/JMavsTwXMuS7OY9T1NpGG11qz86hgXK181fFhN47S3DzEiJrGZ6ovnzSOy4QsRQtgjpgNf+nP82zjlaF2nFuO2HmvMuW0E\/38zLNhTThlitaj9QhzJSjXr+V3HzgclgqAnpF1Mrnq+O3FOia85GxM5ewx2\/L0MNs13nATr3KsbNk+4X+N1o4IE6k95KYtk7f5HiqPyLutSFRm5Dzu8mjcc\/Xf2NQK+erqB7VjncVSz9Arlaa7b62132HQOMJVsBRqPa\/wzkI6zyB3A3ijUzZoxuIlGwceh7+oSRXUDGzF5dWjKkDFvjpHNR7HyxO7f05rInvi5pd\/2fw5UKvxKddDDpWFC5Jh4Us5CD0Z88N61WldaikdjuhWi3CH273AYo8IWscOQ1Gj3uOhahcpWK0jRNM277MGwW333cpRDpYymnsoQ4+VH8JX1\/MRq5n2FayRVl3IJ2JBbWM8NuqIqQwzBMpz9P6y8vXRQNg+V54VXVMHNFTefTyHwoPEorGsUpeTfX+asbU1sEpwbw\/26SuZwf06FJeUVbh62V8Lh+D2C5fVwnfU2dv6byx\/R8j+qRn9GTro\/QLlDNmyuSlHl\/2fSn6UYP6o2S\/39Ojlr3LYqxxzU1zMM7HK8+snS5Ddr31ovuE2+KqYGNJkN0aqJpWnfj\/e01AHgp\/l1eMS9sx5El4PV9GCTkF1TYvklzs78bozIFwjdyE+Nb3qo\/Xz1TIDR6ElmZ79v+i1v9TduJcr0JrBgqazEfSwkZt6oyNXF+Gy+B8iS3VXBmR3eOq3GXXRYm\/FcM6otVHM3qxwc4VyD97pekQl4zKaQ9fUhqn1obBkq+5fnpmilxlRGngLP8VodWuJirkFGTLMuMLwNhbnzeAl7jssMi5XshZ7JMNyGBgj7\/AMx5T1QQIuUyUhytQgTJrHi1pHuIpDEar25Y86C+8iklcYqdj51NRafT4XdoM6nk+CacEEx7BiQQ9I1XvrOHoWcXVNpbZfYSQKEyTRt+XK+1ijtb\/fcSvMQMSJ3XxT80tM4OMq2nyVCCGjC9GOyH66WngNFkIRu\/2nOjme2bRFqz\/78O3F316qKfe9DB+WfR6nEWgc+UQ\/zAl\/iYhik+xyfvXNq8rf2ayqwYwL3PQ1Gvr96n02I1n9ZosyKVezZfztSlvFOValD9dyUg7pd2iBACvIe3h\/VXxV2p7nB99x0ZYF5zomUoyfNZHj68sqd427vGQr7s8xt5GRBCurNo8uE4OjRpMQ4iH613PqqgbIenwzKQMRsgfP5HTQYF+s9UMh+xENv3FY9IiTfE+nsb3YWQN8Lmaa+XzfsJtEriJg7lZPI2OEGA94Rw+qnoy08+HzpH4j0hDe9dGxXJDa+nka+MbFNlzxwkhb9binzSRb21OpokiVmcNC7bvG3XkQFSL3Ec+nsB2xGvac2RwS9dMYo1AlLrPQTM3Dc4xifU48d9vHpf6iTu1+It4tO4OCueQjvEePhDaOX6dvxccpyRi22OonjjZfQhGIXXpU8gS5Q+z4cistXvsVDS4MfhvuDuNvzYOZDtzBVR39r65x5+Ccc6bPbWe+tHPrhhmmKbeEY9JW2oRriEhp9J37EjGIKxF3HpDt01VdEtHIS8j79QLn15iCpfJ\/t2SlJlikMkA9ZxzrAMhFrq5p7tNul26LsHnzfjNN3W0cco7NWWwYdv+2Rf67McOkbNM7OzTDVsrDgkdu39P2zRq+jAZa0O\/zZLLMtG7aKwutkjeDkkeoenWa6oHJ4au8j5e1ruRD\/Rav2wtZTA\/1dLRH0d3IcGQSDyJHiOg894q49OLG4TpA7p4r+\/Kud3xKJP7zH+5tla2yB8fyXmLuB\/eoDaiER1Jb6Bs\/3sdetYJhCvq5dmLJ90ii\/EQSp\/HXb+k+jMcxP9FQfY4j6YkOTA2+XPmO2tdCLCeQVbVH1TGyZAGVG7+N++2H84C2MiTXe3bP1WTrBTyR+VM3R6++nwpOlxpJ8gT36RPC\/BSUXPniOQ6GVVForywsfU3fHZPuldJo\/Zd9x\/5ppQGDJ8stOeyr7fKNtd4D6JD2KL0ov6mWztTPA6mpREmM0TNxKqpQZHN+kTmv0KgsyqVU3Nr8SMbJJ1TRs\/4tFJxLfNb2nl\/3mw07TytE+825JSBGV1e+iuaYZEzu4Jo6M\/jcRFWqTIuLrgtDT7neDaeQ10Gd+tYeNxSVk8dX1uVF6I6p25JhVMbxTcewE8atkNYQ2Xs1Rq7oP\/XBc5mMd7yvHB7QOiOX+AK+oYba1yeNF1Du1dCxDFltDVFF\/EVVepAeq+uJ8yzkJUcZH4suts2rfG5KbriKJrJUJlzCKrG1PyfSnC1S5TicRnElt+EA9B+4v+f\/gk34iHkrxQauVRCcHo4KXUEdsRpyAn2sgRm\/nmqhdNYXR0qkTn+MB4gl67BL0dWsPr5h3oTK13Pk77xMNVi3QdzjR3VE6Dexb8vkcdEe1ST3RUCQ9\/rQTFBvjOYQSO3IKGozMSX7DclQuxgW3cQsaMp2\/C3lUb\/tCXWWw5cD95yMonVF3+\/BrjtaLZNFs3AVicPQJegpUEY0oQzwvKvsUhR0CyIgwzQv0zSy9XOVyW5z2Ly0ahLtsQW5bZQ5Vht7mHflwvhbadkuQSQuQ6BOlLoNMstYeoShf\/2Vn5bdVvKwMC4G1USBLJO9RmzXDILlvUa+YIbuWj6r21CL6oj3fUG\/bxvHbc6dNhK6Vs5P9NjkH90Ca9Zf66G93b0BPDouvT2GacZ8cNaquu2V5XWJ63vrGcxmf9aEVIf2Oe81FJw55pXhttVx0V3u2\/f1pdfrwWGcjwkPlT+ew1n+WmewPzn4wzlRuRedHJVPLue\/4G7JK8KpYq8eunPWKgIslP4wUlQ5WISh4JYkpLOYzSKK1fqQ317TyHQ3\/RoLToNce4Q3z5maGzVVbaYyZV7RR1bhCXjROF8ds5I47phuqB1weePZ67Xg2uvNar6FYqy7xfbi9fHbapR7g6CT9QrFqlve3\/JWp5anZPgUfMEdES7T67sNI4cx5ZzbxncvYuc\/Tr+sB0ZgO\/THWYC9nL4vYigOrtQ7Tr\/ZBYxX3MAZtJE2+ZcxlDF3ZVIRJK8HQ+hS\/z1OiDjlFXRjFmMub4iBlcbXRI3a4cjGhVUOIwEObjbBXuzJSKxUlZclxqfFoGZVyVlZjwZLtWo6i\/\/btk7CuMj0Ohz4rVFsjl59wmXBXysTrkGfwATYkPMadX0CXgj+6ciSnuyz7yAqc81BLpPT2K7gosZzRWO71nc5Sa48dkYvYK75AeoBViXOPSSltXOMfs6bI1TFwcUwsWymoXONuACZEY9AfDLI32yhEbn6LxJbuQ1fc8q7VMPUrj5iPg1eb0IW0jIpfG7WUfUhxHasgrU2R7ecwmCnZbx7Pv7Qu56O08SmPMRYdCL06LBPbciIjMiRqtvt0NQJNBETsbQcTptsTdd3NS47yXQErUxLxnCYOy8879Jqhl3+n9\/6NQ6K70fu7+\/NhJFYMRZ427syMd4W9wd3HBnm4UqxizUsIC+Zxaug7zeNPXw3xhz92xMZh7i57k1F3vZ4h3IJK3tB11ji8UW19d17pGzXETCvwCX+9uVskzOz1XNzhhvwHO5T9Lr6lkFUudWR+ouiV9lbhV0rTN1g+YLg9nh+K6239+Ce3DEa1fE5xLIkmC1b1e0EC\/Kylbf6erPON84yWVt\/XMh7qe\/GZF6I\/smw1nSrCO+dfEWZqyPMjojGPM6bWY1nSiB6qFV78cprZauxE\/h83PTWYUBCKXYcbjXmOfPx8xbGRB\/w1w+xUveXVcQrr3IU4k3tH3qt3+ZrmaN6\/Dk\/MgZA\/+StCkVfQdnLa6D6qhDWsg9UmaN\/Oro7prEqSmUQJcfGlr4GQxFJ+Sh\/P5VcNQCl0zrmAsUNylRGcAR7hkLKaD3qsLaedy4+V733iONlyBi6lkEOjdqxp6\/LN46G439ZldyRQx4dixPx8V95Mj3utvBDs4uY7TrW4dzrOH2dUD51hY1B9R6nRjKnCf8y+WPrdw1az5uEqXdu4Z2hvbZ+veLCBvbvFc8+D23BHK5CdKsKRY9Fde2Tu32VV8okH6+w2tsch9amLswwu1bwiwxM0rtYt1rgFb+7Ky\/ChvwQfTMpTtUKawNHcYoLxqiLnIEV\/VlH8EqavH\/nBlARMQAf+F1qPPMe9n+5ghHQ7vlKr9BgjJ5f7ax7Ssdf+0Ws+Dkkwu9z\/figVfvtiS582e34qYr25kldjB6bEBkUK5l5PP\/mvNkzeE4mULHCOT1mdQvPXw6rjg6Xhc7U6Mu25gY+kSVVCv5aaVWhaVNZI32kEOomu15cB8ixPU6x81WorbVWQgb\/MdNGE7VqCXaM9fA7MxzPA8fKA+dzxC1I+Hi2cbCjaZSH+qwOJS49Apfh1TPQ9\/zohha\/xaCxrO5TN5nVNwrEQnOgHrSduYBmbarKikY5HK77su5yvZIj1mGExmrzmueUhpqtvsDh3Q6MsHd7+o5xPAy+rc20f99\/zKtlrfKFOkrFun7w1SsUSSYGi41xB5D4Bts53t\/oFvNk\/Ply4kG\/SUhe0ftF0rNLdagc5ijkHXVt+t2Kquo1byrVjf\/4plHuykl5cTzAmRj83nRzbRGb9N0rs3plZN3UO\/9bnh9\/dyhPDZjbOdvDM8LGiFHjsuhXi9Bs+A0dLhP9Wk28Ny\/oqllGi8d968I4C1itET1lJt\/H7ePeqWnDXR0tntsDE5sjpVVnlsRpjr6RfBikP61D6vi0nPGQHVcsRBM9c0XitIW4JGZlwrHiIrP21K1W+Or1RumVM+XUxrttDbI6efxEEUHdjsVbuRupvdP5ZyS7093wfiOgh9R99gOH5gJ08hoKe6yEkqqNMjQxu\/fc\/3wnqFZxGD\/H8fsZZSL8Uw5C9U1nVolm4nrRnnO\/E2dj6XmZluoky6fTXEnGjPUbAXEhX8sU6HV+jjma9VVB5sRoFLGEt3JOgcN63UqROw9J\/XDE9LFRTsXO7cE4N9fQ9ZAnrvAFr0gGLP91PWW8xFJFRmephs1LNqppTnkpNTHtru98j0uezwEGyO99HGBHt\/anM7Q3d7GqEm\/OR\/QujBjUgTmrhFqXgw+bvG9mxgFzlLRujMkkCPN6DTNvu8fcIl9+Oq\/SbappeNQ801WRBxmlY35xHp9sTSpVrPslg4yvrzP0s9zMaOe+de77BClKO53a+icttJGONzlzTlCvP4vwe6f3Aur7\/bdYye4qwq5n+vWgs5Zfi3w2ckpyf8l\/rEjnDWKmmJhCqBffukkvwTPxuesOiQbbWmU4JV7lHTIvl6AO5AS4kH22hnvaizmEY3l5y+pmX\/BnH2UAWfLjRxpQ8oD\/8Mgw7Kq873Akj4deoRzr22+EfC8FVdrEbASOW9XSNYsgnjMrSQusY\/juYZiRtKdVJCKcVFgzHKkob9esHfoYSDmvzeqt+Vuenl9gTJwb4LqauIR69+FCFYMTOVpav7zDU41De62LIwu5RuvFsqmu70mVxetUJmEm2CnPQT9IrwfIsxwlz+uSOrrbqyPmHCDKyviPX16s5lB5\/v8Xed798pFsd2qsuh6CVet\/t7X+cYWgPJiZguXvmxcQY7DamK6WiLCIpyrmQ1pRZaO+yju4HaKx6puj2rw+DNL2Qe9X60\/RUHZrwva\/\/ajXAaWrqIBxCvWpTiKqRvw7A5OPtyZboIMzdWaMsdfR1K9fYLv5+FfR9cQgGWf6lI6t5SX5Ct9CPX2ZQt8ln3kcuQ3cQ2PnGRgF3ERrOoWr2HOr9MVxsxetJpcwUFv6zI7IlExoTOSzRnz1yOhdcyAuPWJRzpHmXsanudIZFk57+XZUOJJR4WRQ0nM9h5yx6PBTPg+OhmZdBS2x7fQlLdYTWcM396WXU+nGVJY+f0y8iIiarcLsWpNkKGZ0TGH\/Gen25SjU0HL3V+ucvdhvGSONsFcxB4sXGdO9toZGrnKq6VwFa80\/Xl98ywnjV7+NYmsLby78nHkzxNiNl0zGCMlesVVVa25A8DhkdVMWaaccyXItokHsF7dff8ZdKAdQ+LjnHXqkIvtVZ\/1HIkYVvflrt0kvp4Wcg5oWG3tRYEUfSqg4xtxR4AOd9\/JaK+DYdaxQ1uDI7SuV3dFY0aJOF8KRxBG4oiL89zKzWp7KwxNgiKumjpG\/fnsxi9Ztpg3erQxGejyoO6Nlop19wX71qBWVQ\/N3r5sL16yY7zZWsr9aY13cGGXmr9OyWkWlo4VBOBv1WHr512GD\/mFxOSGy1hd6l99kCsQwxlbVG7lsapaKxKcaRFfmhTWIpvEddhcNKpZapa9QiL1B6ekVCMo2Owqqirdrn0HtzwtN561hR1m2A7n7FB331wudkNe32vjbFbS\/1zb\/kD0ZtyPlOpSH8bo73M+ri+kIPYD7rV9iqYu2To2a6DhegAfzDSJoGjWDf6QPw+RvFEMzf2X09nQYbmVZ5VTeVSWIWlUS59Y0bIz2wYxmCsS0utoYmeP5kIWXWK261XQMXJRdHQUVDRpRNVwg+QKf9NCckDPnZGx17AAPgVp6xAieWxj+0lqy2jWI9OCLsbfCfvmFd3EMj\/XLyrBDYgkDvrg1ks1F34W7iSWMB\/ucg+OdRbt7Mt8QI6cqVMP3uWNsT5p96+x\/9ZOTq\/2tJ4CJVeu4lN7KjrwLvkSvNShX3exBPr6KYX\/ykv3ggeYNVBXJZdyPduJdLkKMKqvj7J09\/f4Eeu8exC3XoZNrRs9nYWSz68tpSXrG55BVOd8jwmRqLDbHSW3rrkAW1x3S0vA8pyz+0AU\/r3ktEHWO7ijIAvcf9uhkwk\/FkwtnAESF0WddkL+M2zZka6NjC3yWExbljMRqmnPpi6T4ClgYUcZ6a4q0zv254Bm1QU8Vh3yIUgPlJLNrxbE\/CPEaSiJe9LS3RMsK57HVxJiMJ\/tcpYly3r\/I9y7mc+2rzBy\/hP\/7239\/W+xcc17pHulDZ+lvxl02zbOYI7jquTZqdzyXAbUKQGn77Oez6HP6o6LUm02v6aetFidjVfWY+PVsz2ZH4IwqPeahQoifMVPpL1JqsFtSeVa4fE5\/P3utsswa1Qk7oA6yAuxvBlEU0OAxfPxcajmVUfeY5VRmbN1TN4tq0i\/YuluVmR9HfedRsopHvF5MzXfuBrd8DIMuEm\/+8kj3ASpwB8EVmkKWjSd\/5dyLF\/xxTEGNUcXWslWl+1AL5TLqBnyAA47z7nO+mmMbe\/aXl6xMjkGPwIR3grP2zYOogsnvk\/HH4ETgjil3eDW3vVZLHIORUndkB+v6PFidUxWavFt\/wQKvntK92EwBipxlZXVaVHOFgRzznaMQZ\/TDmCfo3LtzPLTshz\/AgdF8vIdSNltgqF6jZr+InGd59fEcHIj8RIdMtVrm1+DNsb3X84OHrt3SmwUMT8jaY45LvxgbHPR7xrmTxyLWN\/1cpf4a4nzS79W2icPBp1FbrMH8icerczzDxW9sM5+XT4Dw7u5vCYZf7HQg\/D3G29rPGBoOLmPTnbFvHsK2uF4YqiP5+F2YR0alp20PxngrPJcL6l2fZ5VzXGr8455ZBW7kjsGtv6v2RbKRJuc3m4D5ttqXugPZjXrdqlHruPW9Hfecd0ddFkXHcJdEbK8VoRyHykZdHls3lkXR8LT+dPUOjtQ9D4lP7cQ2GDzm0A9YTcSgeWpr8NVX7YtcXEF6iWa3apZz6gv8LkuOhf3OfV7rfW2RW0ZWE38jAcvQH3pq\/kRPXnwz58UevegxqMk6i3BIs7xZIlWQ94K63YlqqK8ugfVEhzwNIbCKrHaoBBuOXU\/cswztu8xUxyPHNOtDH0AsmvxVP4hjy0b\/0r47uylWH1NZKzlvYo3Qt9MsqoZjt+X2s0fpmQT6gRsA8YyZqgAPjUTzxvd98DunMc0vJloDAJyoft1XXj1tMeNyD5V9vW0Pxpaya45wSH8q9aqa0XyUlorffAJ+50rtv7xUdrPvXXnM4MvwZmMOQBFYpVTxYUa1jxHQD0bkO9nH+9MQWe8l2+L\/xY0sKjNk3colcs7pjNMyO\/dBK4dPene67PHA4vzAEzYxA1Zce7I\/qJQtElXiOEaeQ4Xn5CyjAYPh9pzjwdlkYi6sz+TpjgSclXHsb56\/CgLHwQmZ73otXIFu3syoxyIrcwBV9nJZX5\/P29XuxSPboxhT6iKKWtKXkifHoS\/TwYkA4nsjPlVrzcHzjRHoYdvA6TSAWHts0c61\/o2dZ1mareYxuAFgywv953qrqVWOme0YZ\/hl51erZwVlawSm1an3FVjCzBKt\/PPJOLo41S3XhBgbX\/Eqcr+VhGci0zIg74OFZaZZAEVsSw01q0SkFUhdONczctyRA9DZ4vEHZX1MjHImjsbKqhQJopfcip2y4hxScxJUN3QIF3fiwiK07R63lVsly9H6m03nxEDfVTIjzShwrG9EuhEyQB12R5wrAR2qXgyIM20WLc0U3oC8oAuyE\/jqeyBttaNnmr4OiGudyt4dATNqesj9AatXfYU79aRl1IiqxsOhMyCSyrISm8VyQSr719d47dZSdp9K7YisjMNpZIrsWYXwFO+\/ca5PQ1d7Q65og5zbouoKytKzfcdY6yu5775+IjP9+h1Ub5Ltqfxp9XiC3jBqexfgbEY3V0m+xP6UKytWxKa4mG5vjGP0sbIa40pMsfOQ1761Db95i3ft1d2VjEqc92ieVJHkkbsQkE3wW2y96stIe9eRKnPbki\/bJNdF4ghbWOOmxmd+EPRnz6H5scsxhn6hCHkrBGmRMDNjIOoyR1759W0s2FoZ+wyrqxOyIEZhbZiIyjXDhztwedkFXSJdNqPe1BNjfAo1F1fUBIBUDyrfwTRWr5ZSJQgCPxVJIs8pPq4mnENKcZWbzF+vF2avbZe\/ud7sfaKl82Pex3hNQZ5zR7PAZ7vcugVj06\/eNR31kflB5bGVs5nFF3zhFIqPqh3a3wh+q55XiDxYhm\/I\/Biue6A3ZnDoHbqPDavsfIvZPrU\/DaoOkwZmMnBNlRccvXUEqj8bj1nqueiDnnMRe6rRqtisO+\/l\/Mfc3VtjRPmoR73MYQvfNZhsvBerccWYxBXM02F9oke4u8gQsSGPEZfn0LupWV+DHcjzKrh13Px1PQpFQQmo0se+jRGeU79xuSb2\/EtO7afOcfxe5n93Sp+a9\/ggqRXw+KstUrcZizWOJvOMkZwr8LzLuWKYEnw9L\/HXQXa8OV8HTjuW9K0s9QfNjRXq1CjAAcVSr\/GqAgUEIC6\/u\/arFdjo8W2PU+KOew7EqHXPqfAfxRxjt83HC81QWRy+Z37GFZSgeAqwGJfjMEi8V8Q83ZvXzfhA63wy7iBJasyzH\/rILILqplW1kSOArcXp9z73rnBFrihrzeJ1aBuEoUPzoI2TayBk\/6lXUZo2n7b3XRDJXs0PCCtjlzOL8N\/vXa\/bfAVSva53eISDyXD9BN4Gpoa1+1UQeVbvtfiiRWITf5DnjOxQJMbVQdB9Lmk9nnMk0s1pa9d6w83tM4pvG50nyADh1HYxTkvEiZw0r1WyuuSpWdVumGCtcJ7sqe5wlgg57u+aYtklx6EuntJSJWkP7n\/Vjgt\/fC4nFK846vIv2EIz4fmNsGjksc4fBKMJsAbM97RnCqCbOM79l\/XcC6Q37mKtrco3VjRZJ6dAaevh0+WxNhmgrbbH6PCF5AplsyqJ\/vkd43daDi\/PA7wtVd9vjatb+ZsVDs+8cD6WCrWtU0swkffdnv7IB95nl5hy5avRam4ajbJGMD+\/IkqnQWOyjhU2Kw9db+jhadA5v1OjRR8HRGw\/bNUuwEHTcFpjbN9Wju3oJbkWIUZRH0Mf3cYeW0scVfdhVZtFM8to+lnkYhwfSBW1Z+ClOFHl6GV6trMhT2NeFrtXK4exb+9l6rd9rhWARYn1ae6pEnFkPEaLR+6pS4CL4QbaY50O\/WNFzraMd1ryyof5HEbcSuDqWO8SaJyJtWs55BjWwN\/5qSqjzqtkoSq1swXHKWr5U9Ju4x32H47mDKzJYqIMNfyMP794MFvH4bSGtskuogQ8ygNXY2QU9PDvcaDtEXE\/HyqGzQVZNK4goBz7uxrDFsiy9UCuF5HlhF6TUdH3u67hP0R4ev1c2LR5WUnP\/l7pAQM6EmtC9bM1+3HqZE0Sq2nR1ED86Q7N+nEf2PWaeFq1QsmHcQZ9MPFTkDd64yQWzaXoENnHLpdXWltW59TkebJi6+QU1mpk6nJc\/+hVrWhacoKoZzv4vKXRPPN4RzVboA4FCoTN4PWOscukxI2Ib9TFP1loLbQWUfWrS5gHNtuRyvN4hB4BH1aGw+kZBWIxbe26zynxRbwj\/DXD\/EY99d6MXw5aCB\/SQV228FrxY0cfXWTEpi1utMwaz2VUvagwIvU8ympQHgUbKpuYFcPqLO\/TT\/CJz2EOQdS8d+9h4HwLcf9qTfG0ubE1f7xEhdh\/2g\/qyAMObFVSbbft32tFkVXDaul5C7RIDokT2CrFnB18DJKekwak0xAUbJpYR2tNFTeb12Uro95t5yNB+9X7GJC62kyKY8tyrR5G2B5Vm5svf8z848TNVFKCrB90jtGotQrGLmYTRuYXfp5vfWiiwhj1omfc6jlX4fB5eznNfz6qV6py7M6LvPN64zGiAVKd537iTWbVkNUKnFG3ce\/T+y+HEFVYYL4Hjpqbkm3OE1D9zCEYy9qoZ7aiWuqbdXd21v9255jfeJjXbUU8TOm3kBVGALZt7\/V0Ovej3PHCMWOz7fA7sE6MKj9WBJnl5vb6W6d9veOgxtUB6sPKN\/\/ykqypxrGlV1gS4ynHeAsVaVUVnbQvmm6GnW2+93\/5OjXdyNOk4RH+OgVg5FEd6\/+rq2T0XBqOT3R\/31NR9DWgiWcii0eyiSosWx\/2rGd6Eo\/BOI0VOfn6mi+vEufrM\/0\/3M1dVKOu1z9EFDO3grCqLU7RNrjirbitNqxNHCf\/jdV+XezKEhqe\/TuIrS7Vh6S2\/\/IyjCA\/Nop5hbou8jIgfMDt2xWhsRnOgfjDIWSge7Z3x3h7p7UDW1fznXEtRvCkx0Tz5XOd1HKQnlXZyGvvTjBnTBbED6PHadgfGciakX3gxHD2uVTyeLw95nvujxrSw9Cy+n94OeWxCr\/1qjMvioc\/ZvcywJR4iAQhx7fs9+ot8a26p1fEDSUDVfSRrHr13TL+HMWx\/nA2H1b2w5VN0ea8wujll\/\/+aiiV5B3RjClXq8OMxAsk81g+fKoLEoZDeAkdlc3NPXs+L9I1x1bAZq2yHKwFgz58z2X98fiNDJEnes4VdFIvJ2GZIXbop4Z\/\/ck6ru42BZhSks91wrYNglpJqzS9D1l3fGoi\/S8uF4SUAiX\/e6cc4n2S9UN85nsx2Dmgnlaa5yYHKUg8\/RR0\/tyZKnGy5roW1FHigVjFq7dsjn\/OErVtz8JRPW9V4e2h2tcGOu68GEVP0HoQO29Q\/WU20HNZq4DnKRsNEE58kmYzVZUb2w39UX6uwYgGzyXUP7yZRPmwt5ikx2Pdfu8RqywdgVwDL29VLqPFlPSbhVmVaQxyd\/DeiYJmFwfuPscxOr15EUoum2vO39YVpPPzPN1yLbY\/sj3qQBS3Gv9BF8pMdNEBqgP9au21LyBEF9OIjPmsO9Z0wRGc04Gtf2OhYE++al3KAJBdj9AcqJVQe3qSmT\/tiz3nQFYz7Lx7JZR9N7b2XRScM6ee4Ga5\/dy4PDNn\/Xwt3Jn2VGzeujXXcwPG0Vav\/2iT3J8Yn1qhTjBsIt7vDK6zJjcqoIwqF8pssABsokY3j2st6JYnpsDv+o+KcfNAJicRHS1cIN8+Fqn7oTo5JiPBUZJsnt0s1vmfV5cxTjiKWG7\/YnxXZ3AP+Z17Od4Y5olXetBU9BwOlVoMtra59qPu3RkZNX93jWwrwyxaLqaPk9Wfttg+c\/+k37E9X9DxUAdUUWPQV8zJVRxaxJEuwmaVeIJ68EIkr2o5z6tTOc9RJZgvJi+inDZhSutpWIUzXXPou8t9Oe1bJ+D8qs+jmf\/DCv5U1wW60S6A0jYWM9WRlukz0aEvfr\/goe5cNX03jjd6sHnvGWdmBx1hZwpymS0M4+QRGm\/+ZIDhiEM+jkGLxPye7TmjTRs5pnelg8tlOn3G+RSirsIYDbC0\/mR0rdqtXWzrvJvPipVRV1eLKPhcr5n1TvMJOzqLSrPtHtt7dG48U3x9\/S6zL2LLvyL+5o2MuNeapK32JzP3udR9RxBXGKGpi\/hwOb9BDNgqfSxvkX3rxcoBITLooUts8ncXC64qQbkVJGL0QGLGFsrrqxP9mViVlYu2op+sj40+8\/9uiTMfL3b8W92Ri5vRjrsIbpRyddRMUq2SeFg+6zPKlI1ZjsHaxRiVuxn2ndqL8SH3ueK6q1YDV4fNp\/Sc3Foo\/zYJtOFf2JJrk2BZOZxtuDIzHmW82ke742\/v7pc+d0hGpthDYWAvsEYmYAtq5jyOiJgf6vy0NUkelhc8irFFmaoL7edmWMS2iJuP6Z\/jJZ5N0coI9IhewZsgUWzZbwrwRvP4fefh\/GYDa09nRBTGv3BmOB5v+fgUBA81QwidaR01JiSxkcPLzTuKOIwAe9CW++k7uOdsczJNR7PUP40EHNuwPmVrnHqmQI9jFInU047UBMz8FMv6nm+rXy6fk2c\/T\/FYjVXW3sN\/ef4eQQ7jmPeJbfgEzsVdzLM1+mrZdw2RCmJW1vpqR5MK+ILRhwc3up1jVKMmMsM6vGaux+i7YjmjZDQgl9lg1zSDYBmAzAeNra06xGWKNYePsowJqamibFlAVR5vF+Ud1doCOUCvWrWMJht5b6rU\/PV5daq9wsn93uCbP9MurIhDU43UYF55WMRXbPww57irx13krEeqA4xkHthtf32Yvytb8P7qCEcn6n1XRkTj4SD6mf\/EP14DHpWj5hVXecmg79FSs73cf7FCD8gK7YMLapz6s66s+44uDIR2vNyqy3g1e6\/Daw3tW514H0PG+7DsJ78ZodlYezcHGC+g6a1N0C1uuL4Cps\/f1ozRB\/WoUNllWxWF+a9NNS5ECozzmKqFI7r9onPcDH\/Zn9uDsZqv4mTaQ9xB8LU\/rtua6FeXyrWLGFjoTzM8xS7W07xuHI4hWziDVRMVO2\/suFChc2byJa+cQtGe3EtWmD87EvvH2DgmLABCQAVjNbLfaBAnVBbmt7\/GgPZojZ7Zvthopt6o4wh+W5Y70J4h\/qEMDqVWaYuMTmu3JuEaC9pekdz9PYsKPiOSOHON\/+ZRYnz8AeIeF3IUWMgMMIrzIASEuJqJvG\/cyXi\/d546HYPDGHBr4tE7QIzzYCvHKRdwHF+tw55a1Z7JduOItfCdXxMH9ukuG156kvMMRPlie9lon+UZKpcq2X3C0MyXbfTbO1I8zVKj09qUe9l6bHd5+bJcEdN+EUEzALao273\/eB\/NhslBHCNQkdDqhME4vtigu0NJ6yn5bhbf\/s0dI0OLqnZrD+5bZc8RVMWrw1VX3g0oG3N91Mtvc4WzHv6R3dYVx1PhxdT697JAfWeUw2jnYmPSopqqQt3wAc3tXCDxY8y92LUjBXfEKvfMpUf0UdfGygiug15ZuXDGskLM\/lQWXLPIbL7Js+\/Psft4t9o1XW5WP6z0MIAzOkYCO4MHGBkX+hePyLhhtfEncSWCU2yYggrmkf7Cau64wU0j7LicB9Ib+vdldpBYZEwxyFP70x7Rd1BnFnFqZJXrLubHxlLyzuJdFLbXTwk4W4YHmKuQ1YcoNfHLx\/SirzTynb\/mNRh+mBdZDVXrSHfw9S9o0WlrxglSx8go9bFoR5lzvsSjtQZvUGHHn3l\/8SNq+i36L9oYCf0QAcaEyFBRbgHTkBkQSbXqxFX5RbZbU5HcX4dj3CwJ55If7szk2TaPjcLPDy9SxEcsdC\/XUHY8HDlxX\/Ptx42Cfjy8L6eHWN3BWmkUQA9Z5\/sX5MdhbVXcnE5VeQdmnhub8+D1KcmrPRhURBLtx5nT7dZJkX8OBRxsvL+GP56gq7xydXBq9TJjAhqulIALKu45lfkDdYJe3ajcUr8J1kSVXoteM3tl5aetVIiYpYgPYkYtiL5xmfckbzQ\/SsGsug5eZ1FU9D80nO3FO+3x+l8dzR6+Duejx346ANYptnC7TWtytjH1mIw1r5LR9Ou3apjDjsfX6j9zkNVCvRKVPm1bTEE+a8oyrP6VPPibu3WXRVJbO6+NjKddfn\/cn1Yc8NBWblH7yUtHUn4ZKoaTMQGZ+2IHtgYReB5ZRed9GOH9bnkIb\/bIMGxnvebqaOc1z2M0vcTGn7T4\/QR3s4ItnBsYIkFilY3KDvjLwMQhIwZdb\/5ElkAUP803jisB5lMBVVC1hbriB3bnZwyxaFn5p9DOMvYJsx0VD8Fd8v6nP6r31a7jtB7PxVOdy2cZ4OZDU543G3PW9M0vrCVz3xgTBeuJiAzvi2b81LZZrGl1itceUZdtk4y0dk6dEuOpCkfbNuRh\/AlL932\/\/YaaJOKzQR3Bco7DF4eNrcnyaFXc6eWvTx67szs9UAbdysUdjY9gBiope+JvrKy6huGIPIx5ewzQZRWhdip6suD5JZzV5VG\/U3UeC6ElxvzqlWq3mmRseYUxJzTszf59F09VvcMDkO97pVHChzRGlF\/0qZ8r7FCJFerljLvVWEWbQKSqOF4ytnqEFcbkZUhZQOaxSnVG4+Y3DnmJavqXP746ZOapPOr0tE1fa902Qs0++bpYy3LzI+kxY2hk63fLH2OktVHcdksVUf7f3u3PnRWATRnmXHJbbytG8NjL9b0wUyvKTwxNgZtBKxOFMdbEgxo+XmSL4y7eLYqaVyve\/Y7fYUf+fWcuii70jhHhwsgPK+ogE\/6htkQjaxPF0eK8OtxMZmre1uffcRJPc9RLK+mykON7Z1AZ+FuDFymxyvbwdt7N9ZtUvGrClSPfbxxctXWk6iBVtbpc9Z3aMvrmu5zVqPRHLbWWjTbvXD\/YDhYnZeo5kYYdeK3Z2vF0Zs5a5N23dskerFXn15yU2UCIeeSZuCILfEe2Gsq79AgdEhVw1H1DKe8PkUVJR774MBpbpgdwEpXniOVt2LxVz6OOitblBlGz8S7yIH8jXCXIPuTnrc4Uj6e\/rbv+p0pcTsyQMwD2Ww4XQ10TkTk3oD+jPhkJaIS7qWP8rxhnFCq1yAVrMiTIausflm48P\/O3O5Z1YL+toxzfOxQ3bj0zVKVtalDXPOQxTDoeWR0zhjsWvSDr\/6LeUZJZWiYn8szWeNocFUMbjIu8vzGuLmRA+lZd7O+rj8pE4s9a1Pxo+4c68Hp1cpoK6ncWqYaT8bdq69DGe1MqvYU8MF7ZVms7fqqDGkenzT6mZnik3jPL2crf1nbABUrTPswloL2rnKGsOqdoWp9wO2NtqunJKT1+g3mdLpPoXWVY6VGLvpdINq6yGriHP+RJOIBjkTEz\/FV7mdT3bx+j9q0hHlsxOp0pbXvUnHesfL7NDJ7qcQT9Lhj46jHMyFGGns0\/GG2GY8WC5iKsba4K4MN5kbLQXG3dwBhjvR4\/\/raup9sMflET\/0SXGnm4WTzPHVzWQA2MqgOQb77eu1GpdhORjYxiGBNP66f6l3M5UH\/\/sgITL6ZEKq+wyjPXyCwRXBRRfa8Yl8FBJK0fftpe23HdJKDTYxkB84BTGcdwPqORoU\/GdPwx10wf9yXRsOBYI27590anJa3bch4sJLfDFPesBdMj+si\/q+yP05ZDV59cQcPVN80mnPlfruryP6IjU40n6FtRk31Qu1f5jWDH1Dji3aq8ZZhXsXATvWFmRYURx3NC8km2ed6lW7I\/KMSBiLaxAuc2YYihT+yZ9+ACPi1GipNk7Bh0nGNV532+cTbuu\/eUYKwoMqr8Gccycw4MHIqP8UUa7S+5p77aUtEEllhfoY6IHJynSsi9i2h71OiX4ZML+dO6RVWpi8OSmoxH2\/zFq0a4WvZ3iPBJfrkj1GrG9cxeU1XlL+v0SotVgNuz11ipAOIKklzrQJfDZ7bAPerzDShqE5m8md1fRadO\/vP7IV5EiT3QitNr8Hq6gfadNxjbQc7L3Uis7RlBdMrqnGshQ1MocWgWqVyQFOoImlTehm\/5s+dyFcdEGeBCuK71uKgEzXz6luo7DwjOVmHU0So7h4MF\/CFoIgx2f6hr36nu1vDclCyYNngXRMLQe7Vwc5\/LyXxBEau6N1tlDiqVtan4BT+Ls1ANT\/VdzQO6TC\/gJTNvxhkN0eTzQ2SELJ6\/uPmLs5ixTreuN\/ztrJcBb+1Bown3FVGOvxVnf0DVmCP8ACdOz8UizPQi9PTs9h6bzildRVP\/5Nx2VU7mUJB4a251iTbsGhki2zsOgbNi73Rh2VzhPi9hHOizOIJt0AjwJNaZ5fE6LAymi2DUdnkpqZSJqgJdDQYTcih7ikXw5JH33qv5BB\/W\/kYHfkXrdBoyJf0mf8xdYdhpY9Vk7gdnwLX85UVWg+0Zx6XuWNlEi\/VC8GC\/+ykcSQ87MmoTZUsr8Iw+DzWDQcswftp4ISXftM55HpBQT4TmUG9bP9PT1A\/8UWpygUfNPu3ZVH\/VNxakIug4xxt3pSPNwXOJiTourOc9GpPWqU4TNLWfq2FnUgsMPqJtNg7tGXGjEq7+pg+NHu\/yPijXMc1tPL2VE3TNuM7zG3cc2vr0+LULsrx65XmhZVOubJz6WyZU1zePa+k+jn+fT2tUYDEZhGjxCmOmZXvHHjyzWq4NEFaUTTX67LVoRDkm8z4yUH4U00V3tuBubGkPlA1tzlJhCEhoI73cubUcBH3l\/PLqmJoqZ3B9NTWF04ST034cAtEwb3\/OMA0nc+Ttd0ecMZSb+qm7Xh8z77IR\/7YrVcxlLEbPy86BoM0JN1FYHqin9fjFp+hF58tyVRR+yKTcRAU2g6vfpPwYBR3+Zz5gtS\/HYJVx0xt+OUpe4ToymR1PkPcTUfYUTcd07K9eER\/9GdXIcWzXmNgeeLm7fYkCY0AboBTnSlbpDVhFYfruQy6juq1Or4rkIrC0ufmYHqFj7H9kzjqajjTmvEn0jSe1B1f2CGNytuqRtDSb76k\/jJB2wo1olmcxn76ttqly6upFZdFA1+w3+JmSNC5ECuVQn3LEc2VmDE7VUxrx1NiNN6MCN1Sh91cBM9PYVduc23ganF4WdXNifoh8I+2nnx6LXYTJP\/HmZ15jWOUV1d64iAnws2sL5hfVo4pQFQZ3hvscVxKX8rZuBDQsg0XWclP9Fisw4o7bdr9+pt+G9nv1\/\/yfsCh3r1Kp71vPUFlbyd+txb15JuFQVz9zhOe+N6PIVmMk98jn8FnvJZ5iCJwnmn4PEwjMq9zLKL0nwudYjwuSF7+HjC223jaPnLhzv5C8xz3Y9A1+\/46I8RsRcU2g9I5N1NApeSi9Jqr2UMVkC47uuaSMiLP6IjRb8C2MV7MZG5Fy9e+nGL8oJA75HrljUcZy6izjMFbdDhFZi4+VdC4y21PfYkqlfq6lFSlCrjKDZVTp5kNUBrGzHo2OmiaHnkez75xH42jUuhnjOQwKy1YxYYk25Nmo7MOnZPKpMnOe62WMtDxghMuM5a\/7QV2yesM3RMFJY\/cdEe4uAzY6Qw7OvQyWSrSf4lO06CTmNXZwkDM9bSS7yk0rOUY05rlVeuUqhNXpvQM7pvIt17bJWnMmjzPUCXwzLHPcrf5\/5zNlsXLZ\/GLnBKARtzTt7GjwqnOCm1cmCmy5OccIV+VkbeGp9C\/RSfm0Q\/Ztuk4fQSN9s+absWqcaNIbUT1h4NMFPdjcRVPeOg4ToHB8swDa1JYTAXwGoyF2ffe5\/K\/i93jguK5IjWbGnb2ap7ZBvmm3eOr8BK08D2GVnP6tDzi78bNbHf7UOPqi7xhKuN6eXnBea9XHGInKcl2dJiJwB1FR6XGIoNGqptj0HNadyPF1eadtdXtqkHigA7S0PVkZHy6OK5vpN2\/Qz3pnT92ePgHs6jVADrpE\/60z2lRL8+ppDbrl1Wp5TE07atHoCAqzVgrHWyWuRu3N9YxthtN+bx3MDSria+7YceA3r1OLUcTjYFVH3uZ6Bfzdc5LNqhEmz34mkZhZaYwiv\/epEnGgfsp0zKTxIlX9qSfRoEb1B2xptE6p6En+ZU4h7+exqy56eiuB+wfjdMgteb47bzkmIsD3r8vj3guUGIElv7mWqHhXWDlCzww+3Qb2GBs1ZhxNZhDhrOr7PVLGXvcEHrjChD24Iy3fz0vPdUDUyuHVu9OqnDdWdJQIWqOcQdNbc6QvuudoN2MiJ\/aKv+RVj1ImefMI8Uj7bn8OlwzQqlGT4Wx1qJkrtqWrAGIBOr9sZX7Ayfi484\/M2LOqFvKZwvTz4Mw\/1b2xUPt9zAv3yWjrc1c5tgqUVnIEHFbFoWz\/+z\/MW83p7LCfrM\/ZjXdWJRTtSEQEKy2OCzX8Pqd2YDEYxNZheEdY9foFIT3KiiAq3piNidEhNECUbgzzMKyQpKK75c6aTfPXR1laXtWJVf2edmUcOCCZxToE9WAaHC2PVBlIae9Z8zm0NG+P12Wl416qZOqP4m3uSqxVhvO5X51jG1pwjsErIM\/4W0ng\/R3zRef0bLxRvNjC0PV4WiUk6vW1zERY\/26rVgS4UJW+dWLfiz9c0pv5Jf\/8qoiXiW\/tG+fjOUfM+KkblI2qj2O3F1X46vy2HMLY9sZAdK\/GzL5Rlw0Z5WENP5XoyPo4KpF8jMXxZApbYK\/EgdLujLEeiBFsvWXv\/rcKfFhzXLyiws5sMm9q1PGJjkHc5C9rkack8s1FkxirJYdDx+gIneWBZnIEV6JERFLe\/jLyzrr0zWzSOMwd5Hk9ZVrZ51W6nj\/fi315o8O1L843BnsPN5h5MXPssO9Be3oh\/5a\/+iM7ipXDTVtezzu3ZJ71py19kBxBrIySNWsu55p3PQO9ZYbJVQM2TfltlbnR6Lb1urhpmPZ3pPGpMV2eEsv1t7F5yFHfPcPzVpwbdVYai7Zlmb49Jas6q+lwd3uGIrRLQC\/9U0leHQ07YvMQJGOm14zdGgTprab+JVr6NNXfvyjYVXbG0Yign\/2hIt1G3r6qPtYT8agx+SBftiQvd7T07sNdb9zNHNr7dRanA4wHtQI9m4FstMynytjVM9xF53z9T\/2D07\/1SaWyWraMsE+T3HaKqI0avqrabEx6ABT2d9S6jF2LQYs1JkWjtcNcjPUHo32s5FbbU\/V5c8VfXx5i0ehGqsjaI7xJHcxYtixxV\/iiyPSOmHJdxLjiqa2VevxO745B9Z2HVllDFu04N\/5yWuEhEhsdPMLqAhc39p57eixEV4uzZntnX2UK9IbsOMb+rcKAhWl763QaX7\/4ctrecBRamd9rVYBtkKr+\/HUA7HsKIo+q3eRssdcJThWp5B4375jRRKdH5L6jZEwfflX+vM2LWuqOSKkDsu+Yue\/CbWPjsRYxeBX8WPtyt\/iA6l9zOO10fWsMw3dG21iR6a3slXUfYpMheFKdlMd0pkbsZghglUhZM58aK4DIkNlQFW8fGYccG1n+br855NefVjn9BIG4Lfw9UdUNPC9AzazWRCYtZj6jd3pXOTS3KlOi+6pkzgb9iC\/3pzXTWYm9S68O41SwDpLcGltW4kHPX1TB8UZDBBt5dYa9URZxCSqY6bjm5JzvcxQ0A+dgVIt06md12Ajxmrkhu5yJz4zQTOtopgbVge2HTo8J0OYpwhwh\/b3ct+\/TE\/LcveEX9GUz1I5TBh1HoEnEA8fGajfIAZvLyVXo4tDrSp5\/Nmv0TBVUsdRh2YjMggtQrA7xDEdL7uAmjlVOXdzpuQ7l2I5IqlVk+3D0fW\/OrWgsexWfRB\/Urj77vPmHnTe7LzdMB+Ta9vfhivr4tb9oMuLxdRnPurQexTt8UNwUe2CK7Y2amP4+t0a+jk1+AZ+qYBn6cTna+9tr9ynjHqf5BR8wwHik\/E81UT3oF+oNL8hNecT3tJ+e62XYUtYyLoxGfZIDvnVPFY\/DjGfdG3wXBk+UfjNOPnPy+491kF8fe4Vp7\/uXbwzZO+XGaELvPNMFmtX76SjjpMIZi5hPz\/n8dkbr3R7MqKNkL\/keUB+TpdXM+8DHMcvX1ehArRidz5057Png6TCVcd82IP99v6vB7e3Vd2TmBhWUT\/ussx95VGTi67olTPOql6op0kEfvs87UaeifxnJuVBOrpV\/kqv5oTHA9A++nYrOEasbVvdDx+aGYOr4F9ahnTF5MYNGMqLLdB4ZNXLgtS3nULtuLV93Lpjx6hEzYrMGfmCaxbbHpQLxQceAVJ8xZt2frKVXZPf19qPsY9zfcTkL3c9ytwZaDfOJaqx6r0ex6omB7J08+Pll8S+fyeM4ErCtlwGJ79vWFvmyS2cGuoDNYBoLuF4PT01cBlFumDoxBFPbZ\/GTiX69KCoZRVFYTob7dAA6izRbbBbOReU8Yw6Pc4Fi2C7JAbEyefP+fuCU8gKc4zd01oVmgHDWqmPrwFAN\/SPC+HEdINH3G7nDHHCGqjfXOcYhdtYryDd\/VBP5ub8gztemV+M+M0yvvA4LhF7dkCtVwG2P3WRS9yA7p4J85yOMiO5Z946So4s0RugorWvxfXx6Xts4cASecTXF+UmiqqOw98NzYwTj9Z0mDe0CV9VDrmjAd7d\/rLqSddyvrkN3uRa6PX6dHI05li\/67MyB652oOPLVfKSHVsjWQ\/UPDZ\/s18hT6cS7\/XM0rz0xxEg5ln6p7PVa1IeQE2Osrt\/1QnRU73zbwp6077fh8S6tFavzQsdBxEiEfpmcz5RnjJxttE85Brjn3YsoyDSexlbVMDYy0ykOaDA7tnHY\/FYFSJLX9ldcVA+SevxVY9t27TMRUJshpbybozNfWj86vulR0dyfMeCqaxiFTVnJfeqFu1t9qhUyJlqhm5+6z8NbufNAq6X5Fv00VdD6aE2gIHMd7Uvr\/FCd1xor9vj9iW99jiN4n3+ncNIy84Z0dSvv5ezVwNibqmT74yXRJb8ar+rXco2nJuKoQqja+LOyIWLkC2tB1rW2DnFheFYUPYusaxGtxwHUO2j61gDZ0RMe1mEroqhS\/8syx\/t1ZuVgsD2xAI0bN7VnJsuai+QiWPUMr3PHBD6jQcvoMizqZ038ttlpPXrIulvVXzUv4rYuk37RU3h1VQePfHxM1e35lDFZqkztVuLrQP0sveqrVpGNRq8zQzIJBm5VP3vnFfKtDznvb06OBw5VZPUUAM0jamMFXOPzQTjYafnV0M46nKafQjyUfmv4rWuo49bgNGWaKA7hFn0ePmXoWksoE9sbJzL6Mt82ZPUeZ0ocDYvN6vOhxWrUHzXzW7PEew8Xm0FfFeiNgkIcFFlxC5HS18q\/QXJ5Bn\/PAP5Uw1\/dBc\/0dFo6VdVrfXmxbTdTehw9rWxEvN5h\/zxWZ2Gd9rf9HL8\/N+7sG8WYciRmuEquO3x6RyzE+XS+LNzK6Xds+b28XI0kVxxCk6E7e98GxWx9w6eXy1ZZs\/6aPsJLqZx9T1\/45tfIvg1x7O+KLLOAXfGzs2qoBsz71kM7DpWd8WQuOgfVY\/7eZaw4PLTz95PrRZOpXOtbTQnOx7pdK8neer0oTHVpM4pqkFkSceOexk9+1Z0\/Jzbtk9dkeB3K9LS5Yayb7c4dE2mcA5kyIkRZR5hA3FmmT52uRrvvm5NcdMDF43vP4bQ3OBf0F5b2zPfOg7ZOF5lihAjT42MU3Ywz9265GSJxaH\/62pCzs69555e3tLls3mencFhTXI5sVnv0PAM55E2\/tdeaMdna+hQxzcbmSFT2qh53MO\/WnKBE5KeSxWf2NvreifB5OSLd6uTeOvjWP+6o2zxd6ahRKfC8Nd6tacLwtLTtdt\/GVEGqraguUtKTPO5VdUScOfVY9FCt26Gvb7wtNhRMH6TTEqG2KYclKvk1S415ncUQzXg4OzPW3bfGd2QgjtqxglALczf0pi7mbd64pmpD\/ougMSunNWzoX3mtyenqYvmICttaVpimGMcw4lSJUTEAoh7fW8ngjJhRpYc8WYPs5meRTKO6BeY2RRZHhwtU2PSY7EMUnXf0Fxe2tbG3L8iksg6BRBRsTtXGNeCR93d3rymj2NVnnLZa1bCarOB8GL2b22m8xCG6\/TzSO19QFf24QyqhGB+6YIgX62bDkKDAeUaMyWkrtbW8+dFTMrdnZahu4bHaWq37qfKKHUq\/La5+ygsw26qIWWmR9XweXfrt53e5gQK9Fn0W\/agqnkJHWmf2wQURxL8QM+sN5QSpr5JfO7QM96hobDVgfR6BhrnZj\/fUG9FnK+0pwXxX+bix1WvaGhljhNb79G7VAeaMDz1jD+OmirLe2lA32tbTXMPGyr2QUSaP6V9Rr9+gyIxg2wkKO6p8vrseaQytI0Ar6MlQP+ds7dM\/MJbhd81yeAu+lg\/i9VTMDDa3Cee+CyV\/c8T3Pdw5Z7KV4+l4HQHzu0AW9V2\/g97feHL2hRVPV0phvZLkXIoxNyPkwoov86xK8Kgwv4rrqEHc+lCepFayKgBSt6pXVMJXZsGs+hpbGJk3p4Wu\/9SRPHvXrL9tWsFiBASYd06He1QwftGYMq66\/rvPXllJfhYFLYgD93Nj3IeKmt5ZvHj05KaZwYv0jF5ysqPWxUwk4DBrJ63tU0W4no7fMVhz4IraIQM8qpqgIMM33olZEQyia\/k6GHyRuj+v0qtbrTxygxpMVTtG9qIKpz867fn7jQDVa3zJCzz15mVVZ+b7sB5VUB3kG9A2o+hY6QXrt\/NOa6laXBX8B01PDcZAZF+udXVSZl5Vfzz9MavYdDy2AQrLFHi6qbycKFOl19YDo6EbuUM+DgFdcmUu1VQs\/XZMbWfE3a4aQXz5rErRWdz1nekBkYrelgdaBTIufx0R1WekeSZe1jpc2GNaZ2oS1UV9cxTiQYunBOD1q4LWPij7ckpjSExfTTmrs129BJ6EQzZYRdK8RiMDr8mcq9HhtTxftf\/bGysLvIoCmYUYMCJ17Y7drb3+pJmmXr4aNcQ97W5LZZRKQ10Sea6Xba5EGnVfNGyvbE+fOBsOIjgiWfcRqGR+7ydZ0p5nCMyS+nxcSn6s9qwJtAcNeJWnKOaeD57Ty\/N9n+qvM33110K\/H7I\/UcdSRGc+PU+KNNYNl2lWV8Qi\/w6tqZ\/WUOqHCuGuEB6dFrnKYK\/tG4HYJv\/6TbG9SiH6yj0lGAlVyZ158tt+7Rg33rTRcQm9wA\/A2FJ7Znv9Ku5EzztrgY7aK8DLvb2Kg9sr776R1StwHGzmi0ofdVZdT7BKgDtQguePUS8xqUO1wlVkVo+L7c1J4QmqDeT4aSprYn5iKR6fBcfzEvYKdfq6QTiLmkRxjkdAosewGvTFcNwqY7VMJVwF+C78podUIaakFRb2ga\/4VldiYCTGDlNC2efa7ZFbGO1XNaFbVftu7gS7mAl6Mg1JBbOOtrVdX\/8635tRoMP\/X63Jqxz3eO28j\/12C7NKiVKJRRSluswbpeAML6r2uFpAFcNNxQ8urajcKKrb7VdZm1jAMTcbQVlUk+\/8oP3L7L\/YmrsYclAE8PR7z+JqL8VY488zuOYpGDV1fkXu0y3rYFpa86+NEwrZ2jIm5fCG4LiFWKJyU65po\/jo37nAwyN1Qc\/Yr\/ECiRlLE0RVr97HX3BL+uC1KT16WnnXZZU2ykCwYXmyv+NnGr7WtzIi8uwZlc5vM75zQzCYK2lkFd3UyUz\/upW6Kyb0jdY5yCHLH01MhGD3ZdYqqiqD6CEQZKAxMEtzOP\/jo+JxOEHdiMxw82Yquptvxaqn8om6l+d8IyqZPE71M5Ks3XKUaUSrJ7\/kuo+ou\/Zdn8MYZXoROl1l1tmKRDkaD1zQPIa9Is+3v65R5IFUWYuzjFcXPJOzacUog07ZCx8CVzwPB3qLjCC0MZivZJ7wWKeuhPVm6zkZRj1aEapJeaYt7SwDnA7W4GL4GQbjbjn0adEeV7Ml8QEzGTgRfizePqDGzA1kNnwc\/44bWnY9jmWq5qT3qxMOidpcpeu7byuY8Diix4KPWho+g9\/Bkl4b3hrzlaEYFbhlbM4zxjBzB83HFEseePGem0GR1f8eE4c7s0YtmwkV2BnG16N81YEsjkjR7f3b0S1iq7KNFNbMu8wPyIaMSl7QlWwn8vUw8V2gkDMWZJYskyPq\/cbbx1Opq3WU45gcpMlo8A8OQE7nCDob3dPV1iGZarsK5nqNaApOoshvUtm7MpA668oPuX1zp19LrHW2TskiLSxCr3LK+kS3aKZyG2FnTK9iin96ZcTgCfA93kNfVw+rmB4BbgXtHJUt1e2LX8e9pmW0P6\/M38IU5c7Gea4PZh3K5DV7TN2R3WEZlUPdmTkPZXXmafruKMk52+kiTERSfq9GZzLCFOCc4GIbuuloqddxwqJ4sRYNMg55GLob5TFxq4RzcSLuXOFQvHiPtZ5u6dVgzmVvTtOMy5Tk69ALOv\/FN6ypeidm9C0J3Dv9W6Wsebl2hqciY3zXKjBeoKrIXVaor+Pk0yiO5\/vyktvqb8QLQ8fdlioX3dP2eOjWF+OYahg\/eAu+6X+pnq4jAADGm3bROesbpgHV5AYMURfjpDH5PFG72ijE\/23W2yO25+cEwOs5S7jpxbX10bxfvtq37gcD4Ep7NComXirdPw1tzTUicg+5w6fJPM1E26XVnV2eH+v3TLZvYN54oFnyBIxAxujPotVn62fHyDjNBlsT32AH90Xd85erM8RLeWB8upaJbXzHcyDBsFq1ujReb\/6TNkHaGPnjU\/Ne1m24atfxdIR9LktfzRD\/vJ4YPo769XWrkMFs8vXR8vHRuJbY0ms\/zUAPaXl4WI+dzap48sNex4vgZ56bOu9g3nbElsE0dDxChuQQuPCTHRCjgwGtqF+VC9akWnnPfrIaT+WjiTA7qCtLM2sAJfEKBQdrLGPlHkUNBoHRJu\/hI0\/MwTdb1HWrtPV9LsLKNnu8R513\/K01EMyrjM4RqY8eRa4YSzz9levVIZ0ktTuF\/bC8o1VzRUH285MSHAsNOBzDe\/QVpNo+MZMtrF+rDZ5zG47zvRMgR9LBUPHkB06ktuEH\/dfivjVVXIvVXlc0NrWHxmHHwjEsPjgIZu43wm\/0jBHjlq3EmyiQndiqHqEcVbSNu+i\/7221CQyUb8Z1\/au+jBm6J2OkFeOx6BbjsIp5S1R6JcrYvjGE7TnXNXWDKcnBU9CisfvOqxFDcSFvmIk852wwuHmsoGsdYqgL3jUaMmXrl5jB74uhyrvKJ1bzfTjeF9fnDOjJFK08c+thjezyPdXAQQdtr\/WXtTKQHlkXsRlYo5k96wC7XtRvBln9tE7qXRgbvJ8Yb666aJBT8nCalOfchYrrgtXGywFbo7Sgt33J88VEvMgnznJA63ESKM3e3PuU\/Hj\/1Ktp88Zs6qqkqlBv8lgfN\/37vfPkvPLLXsZUu5DHuOnmKG1UY67yZUb9es41xmqkBZg9Hfeo2epzn2nO86f1uhDOFmBAXdvr547qShhT0pT3+rklPh\/JJyV7IO4NwVmTq1nO\/KEs5JisdBS0Oh1m1PDPqoB1u5RfHRSKwLGgP5hgRNg+dcPUx\/rBmRhGESBap5wBT87yyR2uw7AC4VU+uWfFcnUjn5qDC2RqWUX\/4jkEUJSteCetsTbI3V85niwuzokNz\/LYO9blFfWWd7\/vuJcsmHFyHgzs59MA+eFo876PkUDrKQhuAV2By1dJVUvVgPupcgR\/qB17w18\/iUWL6Mg5EqsOFrn5Ux55NyNG66ws2eJcjpF\/9T3fEQ6nx2X0MifMr5\/gOHDRX40WB94xkLFnPzxiMbzP2yYSd\/c\/GQcU8a+uyXs+8g5MyRXkxpjxnXIek5WHl4+L3LkTouYnPYwxfEleGaWfYzKOjMuo84ic8\/c0bR5suTNqZF+mJJ6MxxaSP1wSXJ3X+bwhfeI9IyzqiJu9EVnm27xxFPrgXRbPFW0dtvE8NFtzXqlsfhwfLalQ5lMlsLdmlrtEOhLrV0WkL6o+iDn0pU\/eT1KsgFd\/V6nzMtaYDpMe14PsGFPh37NcaQ5S773Dow7juEGGo8VjJK7P\/Cr81Zku5VBGzs4D+q2mMpCIIr7E+PwiKPS+kuISdBE19vcbwY22OPE+odaz19V9q8E7aj696Wg5Jn2Xu+QalerLW7s+ePObb315Z1Wr8S\/uxOHFg\/rjdUf514uYoy8H4y7NldzMeA9JtHufgnWMV5u2I+fSpup4fC9T8g7xJV6wa7bkM+38yGG0JuZ9R2U4RfnWuuizdRmFvc\/X36PnJDZ2jm5MqUDrmG+y4pef75ZG9DsSHzNTdQv2PK8gX8jlYOmi9I2YVSIrX\/9vbcS1B6LHnE1NdTRiVb6GyYi5733VRJ2+urWX3kufupTrZHCjdW7gEEKUWdPCUVgNHMVrbL\/8SezRdmIqbsceD0W0feMUMd5FCOTjxtN1IlSkrCcdc1mDnqlq7U\/PVnvVmbmMS+yZzCF364XFPWss3bMetdwKLkF5V5rMq1tzPaBo62ion+zz\/FUr99fXy5+sS\/2IYGc0zncOwbIq8dDL6UDk24sBObiIWNtwiFhs1Kbo5yOoRmrLGufeXdTvl9\/P06CHcr6ar5bKdGLdbH9nzV8NpKV7xSjZc6M+FW2kGeNfPlOBZJpzZ1Yhe8pSbMfPMRKtcC0YW6hD8oBqJxZcd5h72mw82GX1gbniZoS8ux97ACPqC2lX7bbat0KoE+3opzVb19GjzMd19QNk9jiZNXXWlX5xhM3uNys9LPyrPzKW1U9\/\/yrIl3HkZK77zVFZexqfdQZJL12z\/\/qr80Xn0qyCf7lTJBgv1fV4s2huFG7lKTPfzk3fXJLHu4fHVji8LobPIfLfZvldu9mwXAvICo2ZftdiRFpgk994O7cNIrplcrNzEGbmOzoYcVlbBpNNWihf59OK48hsQJxlbqOrmHsGoozwWGxVRM+aqYsgzADKtnaHpnQ72qUfW2sOw2xmn0JbW5uzdUsQF6RP2UD1NKbKIw8NxdvuXBLYkou+XoLoHQvw7Jzg1YfK6QiOO6s+b20sY3Mbxtl1ixePVhcZaOAjNh13t335+73E2hC4+91M5jeFBxmNyW\/vrscQyVexp9\/yNZ\/025i7woYeMkrioptBS58rbV5hbfXzeE3mscqsKqr85tRqL6\/CF3IFSpM+NU4ZTSNQlfX80npgjn2\/Pd9qUqtjfvRFYB5VRMo1Kopxu2tbc6+drDSx6pV\/rc1esZp4t1z424y7Pre1TbZHFJvSnsirSyjGuk\/1gbjTZzKRR86ojycZl35EPUeNzm3xiDydR1C1RKMKYQ5UZPdGz8SAeeU5Pbw6AkG2OLUYbVhT7MN2zBPQFaKAlrCSvLnIsHhjQfWsUGvx+0kH0SqGwee+L2i9Nq6njyDxvEn6yPdK8alzsOKVZK6O1YuvlvVLzjeIzMbKGMthe3WM1BGsxs85sk3jPHWlHdhsWjROev4InYZemKU39SiFNdA+1L\/oD4ihHAVXd6z97VkXvMaqSUzpVz\/MBqMFL219TrwZbwWXSTgyOKASZRxQCPsfM7Mlo447Z42TtVPXUl0FnXf6dW1njX95Z1XXeykXfevZof\/mf6LHPhEqcU1Wfj0cm4lnKkIGdXxX0bp8dG\/y3rzrfq1R5iBg\/KHuoVaWePr0KsZKsh5VLSvVyLb5YDHXKTx0slIPEOpfmiHaciviflhJT2HM9JSzCFw5+j2ngLh0Eb9cx7drjbE9n10dwNedTqA5L+JlIdwt3GJfnLe4OtsMjwutI4bGD+8b26jKMZlcSetEG4yq7WrV9zvipjNt2yO2V2MxPCOYv9Uqa2D1VL7pp0eIaOPOSObTWoEoBtUNqogm7+weOauup78VHdwh38\/CMVAREJeW8o7f\/kV1cb6APjti1sy8E6TZZHycUSBavEI7fhcNkaZ2c17bO3G4alrG2ff5oQU5e9Uc7bqg9NeIXNWnImVHK0huz3uJWNm8cYVvXyzHdKuQx3+6IGu8tbEzrjenhsWWq\/Hs1T893\/UXn7kwfIq37fyu39diPumbUTxXxrg92i8Ly7x9wEPSbyvH+OeVoN+oqAD\/+c9nTbdYJ44xLaeOVMtF5Psex9IPvLur\/Dp3a6Yc\/VtLIIhX0PSOPqh+7I+Cc2wek4O\/zFQWcn2jmGaOyAh01tHB1uRqOkjz\/nxURFEyRuYR1bWZQPs4liqKyG1GYH2uNqnQ5wvah+IapupIxrzH53mNH+vTXMOJU5fVPvGcFo3TVA0zBfMTW+P\/w1nX2HiVaOLF6reXcbFxmZWLuFeEus3dcaz0Hm\/MNP+hs0tmx8gyMWOVYb844BML5b7+2yvhll\/GMawUEW8kTQ2zCKNK3BibWnVnexfuRpzK+NYG7vyQRuWLis20HzuDm8ZzTMvYcmSQctnC4TrbVRf0DiLAmmJMbalO8dpKrNUoRtceJgo4jK2trAebczgvBattY9XL2HalfucsRM1z4qvWbNXS6gjQ+zEYM1M8ALMheRYHDTrK8XM0coqM6V+zwXMmDUSG\/Ot\/OH9JDBOhImYu5K8XqV6ub4ycIGUfusW8o5mad94WRKrrOjjpobKPuU4OpJQ16\/NBD\/kw34+bixTcwdg2kWyVqmHg0RmMrtljk+UihlHt+GBsyjaHAxLwCzClyG7+iqn2Me81EOCqbgwWLdNAMjjzq3lCx3cGXh3JSzCoDqt\/VyNck5KGyQqzabDpatqY4rHi4v5Za\/1GCWRdDMGFDEjdUKP+PW1hT5kSlI1nhlaQAYZwGsSaLanuMfQYXk7R0cokbAee7a0aZ49vDiLviUyOKHM5ZtBHi7oVMGJtOB6PLYfCIJylbNbfOgz55Lpfx+kY5X89uI6Dve2Nxxcb6B485XyK2PGdxUSYnholfAHP0XKiLxLrnnpdYzD0a2Wsm7t\/wzjMWnvv5RtLQc\/6za+\/eby7k+x6tvKLmKBCWm1P3aiL9nksOu1vBLwKZ9e0b1TdIjmCH1oX7zrc4aExK99xrMt3YvdRyd94e\/U8saFVNA5Ga6zOOanfF+PDIzUs81SV+4v7aZmiVyWFPCMb6J19pLqbl+nb80WvWjib1fZeFQ7Dnyq6urBPYF7On6Zypfm8oNV0mJM7QZj9pULILUdWo4ujKhTbys30mH+JLDkf18p6nJVoDKK\/972k1ggsrU9YbFuhf\/rWPKIkqsnu6f2qmQyNk6sS9Nd88ViOmAqDKzxfs03W4YHvNwXIbDIEx6LnrsKCuAKPOwp0bg+nT2PH4vluhOyW\/+D2Ami6Ox2m7lm73lYV0q67hjTS7XcdYY\/M2\/icrRvOJZnZZMLIfPU5vUx8uPLt5hKLyTSZnOTd39U\/rS50FZ7ym+adwWTfX2ura+Y9zHCzDsXKI1zMyrtXFnLNkd6FWXbnTM9DFmsdGde9Vb2HM0xrzt2UMfALJcjmgLMgdUWyg9xsFYgTGVan+Wq6c9TnGt5aIP2Ydr8RPMTm\/sL04TmaVBa96Z0dGo8wch7XURTd7VeReV6hmrT3VDhRjHL5zcSLz1TsHCZIXn1vbgAPcpUwqvf3u0GpCrbw+i8yl6N4V\/exx9pMJv2UMOM9TwEbGW9G6nfwjknKiPqVHF9kVHk6+xgL4h7rIG11RVXUcu3FZ741lzedQB1SHauj52jGzXKffk79P0ZqLtGXYcuVXuqEFtIHVBLndIzF8SE+mGyKNe1H3bNHfomaGiXfGVvf\/eP8yp1TGv42YsN9e9certrH6LB80FAP3z6u9+RCf4njZ4Tue76V6FSJnVGsVrY6h2wmMs\/tMo8an24GAbcVzlUtWGtsMU2jT7wHu6Nv0SAjI9+DR5wwmQM\/KMIqoToP8\/319IwmqHnrRT3GKZpKa6xRNudmoLc9mwPiEY7CfrMP2QafHWG5o4z8fDfug22dbW12vpmV\/qB5Kg+iwI3ncu0oza\/RtNdU2f5tL+aTq6bWv71dRNtra\/T0lChzxMvUXwVqt5oTs9VjUglzoOOLD5+AQn1be4hWgLPld\/mZa6Mf8M3fGYXVyRjWj7VmnMxShbvaL95oD1zaujMuRqUHtb\/zFePh7PX9FnbqltGogLDCcF60t2bjP7miGfcTYE0rf++9enCmlD7C1\/dJv4zZu+P7newqifFiZCqyUTKG+s7Hmus5mVj2N\/\/BbV7OWXsZt+NF22u40OqFAXrcVavs6juyZSL0zYUMLJ+SJaPKSPCRVHoq5\/fuuI8KJhNkshGH3Yft443VQtNQJXgq\/Cp6vpKZhtzazHWE37hzBN2S\/sTIuYdzBJxJ+j0u35EyFlxw7viSFfcQjbV+rsg4LOac44e3trJlb6yvHPnmsDqZccXmOsequksrT2w4nkOKcbVmyFc54eYA8HijA7PHTqFL6W+Ze9cnoKtkoJEYEq1Lc0uG6Z\/fwKnGgBPUppw83VkW6B1MWXagGtu7MvqbqeId2ve2UzUAL3X3xRpYeE714wVkFVafwMtxRWmhOvZwO\/yy1XmK00yjK7eQZRnLsYJCaovm03eqlD7rDzpjbJ2qIJxv477vzVBbQYthKOJOHb1sTDetc\/CCA8KHMG4rRJY+fs\/7nJcze1YUNawm2WpVchrMCueUbyORXjcbIbcgalluk8t6r1cql8199J1FiVlF54s4Pj6v5ae55MN5318\/OENaP1kP2Sg\/VYG7zmVsLWUclPfIFIqZ9d9dt\/O8mi0UF80s9aKeEVV+yoKPm+tPqMxdB7R9nz+7Y8uba6UxwCOn\/XOqZqfZXc6tIfPMfbUzHu4umv\/eJ6zwDS2tufS0jn+tC+cTcMtkGCExKt\/RFLnp0ts+HXifUeSqswlC675Slb3Yr\/v3jlxhIobPzGX5pmdwA2skVERiSGM63tXEWElWAB+feXS7zbH0l88f1RerRMQpx\/acNW2C\/cezZQDwijMaVjuyzhMWn44Z77U+Up+ccsy2wXTvdfoDbu6RSHRdQSF6sHbXPRq3rZb0qOnaXeu5nvyO3zl1B0O8ydy+j5LzM0+9fo+Si\/V7ayzvfM30rW3UltP6rmht\/vdO2uj3UQDxofayhcedg8zRUaaxfCuqz7BpzhDx6DIsMec5vEX7Y82PmzQzPQZnYZiZTZtQErA1fzX\/rofnXXqN86FveJOxz+rIkcnQqA+g4zoF6yrttL\/5d46JnhXjrv92m0\/v3vyE6MJXxdDW74bUIqtH34inWHtF7VIX0Yhu29KWg\/VTOGezBMN91d\/2Th9fhseH+obvrIajU71+s6A1pWdBx1hX4b1Tfh0AOeQ9ecL8PhYpJ4MQ+7DZwEMeLOvKRTmQfIxFGpd97uzQKCoP4VzJNO4oSlnzQ539RLCv+IkYvQe9fJgsHpLhIXDj2NFWZowITMDm+YmbyCrlRlT2LMphq3IoDgFCB9f5DpN3p8I+093jKOQ8KuriaS0S4\/u8Jw6DvVjfpJe6RBDrePkWUR0c66XMxqx3rx2xHeqf2IKl65Wv8BlgmUK0oHT+gqC0w\/0Jv+2LHNFnX0SZM1vx\/4ep1qq6RJ88Gt8\/CYK5EjE\/eZc1ZJ6xDTGDp6gves+4qJAvxm9ro0NrHEnmPIaBqTgCbfOcTzGSJdrneOZVb0LU7MWtvvIZ7DmXrn\/PH\/UIop0oMI4ggF6MmWYk1reyospiJHlPxqUXouz42P6doyY2d3RHKTPNq\/Z4HpN9iMSNmLh0BKvBjqS9tbp5r\/\/h\/vNdgRVUPJgRZvQ9HnfiffHX0x8qFv\/Vaav51ROYttWLCr1EJVbRzJHKHebfeDqidGmOYVFTGw8fNy9jdWrmHb9Yt4Qv6dU8Hfo+u\/Bm0hl2tsXr4IVgnq2uEvV6LFzorxevX\/iTbJo986ie5zc0zh3hc3pV3buigG\/6mgdNS1wxgsfCIfWME3OZpH5YL1bHqYskmNB3PkfQDM9DWEPVFnP++1um7t60iU\/p+Syyff+ufpfzjqQC3juCtE6zeVH23Ja1Zo1bA1ahOLFP8qG1IZZE87dqrla\/7AEq5G7j8pD9OxDXiU1Z5qqont53cU6wmf44IVWeuj4GAa+cPXvqzrctdeUjGZBRqPNqY7K5nspTsuwxv6wlx8ra\/g0i5QejcX5Q9thc5TkW916fn48x1vIZ7taMvasLi\/53hfWIhfqve9kefNpUt9gKL\/b6Kefn+Rqlor+93XwBB3mtoZqMUGegkwM513f1QG+e9zlrBnam1vUhslHycZ7KFjqfnA\/6shtr+bQ35lp\/W5edxcbxFGNl002IeIYjartllCmPHIYzp6f71Pw8A1gu+KYCLb8dx70W5+dQOIJrDczrOyup78T3wBOdbZMLZgrO88Zzmw925t3ZdN\/fzHpb79xROTKelLUT+HHfGzB2hXg+c0wQkleoDzSkOUObyZ8MMRw0mmb16uzxRfO8OFdJyoibXdmmLu2L+HQOTuVKkbmD5vSwl\/Z0MN0qcShzVmmni6rdjjffDHZWN1Hk\/D7WPW\/JqKierl11lYTVUuf3xXKR1EjNzcvEuhSVE3bE91AbtNXRpCP9jrdkY9cR\/FoFI9Vp9Jo17aURLI0BXsbSc3O2HGUOsLoYG75zCTDB+LJ53Z1C+LTr5hswgdrv463xPhUsWbys6X3BlGPHAaGPOpOt89CTxEUX0BgtTgnSRtZlCWu5UZUX9Hj8Zd6+ETZ2yyhq0OJFlfmcF5iXw6YUrV1iv1E0i2CQ3Hy16ZzXHSvoBGfmstrZUTYvi6Bql47JXtbRY8qaFxH3KqR8Qv3WR6AMtDPObYtlofb9twOM2T6Ni\/tuncjcT4lvyMOpBAXztpxpaz7xLxwhPLT8zliRT1fe6Ff7N\/czdINnHdXpsN77dBFMrJaDzSngtCBXJZfTyCdOrT3tjzlW146Jut3c2vxKvSBIrUoMa+Nw+vD7FXHc6T+veHfIjNHv3YY1\/Rbbb02Re64aOjdBJaclKpG6vorIq6yZ3Fi8v9LgqtZMi2Fwatl\/uVMLmkTU5ZAhvzMGjs5dUU+Jna0aV2fIacMI5A5\/fNLC+HufPo+oBlJJMH\/tcZBW10\/7cD0M2PpZtep4yQLPNrr5Ke6lvDxtLGhI0bh91CLOPXF0Zhz0wooH31e3wTNc3DGCcD5vtLUvc2ccOTLxcOZJ7eU46G958iqKqBcn3Q1Pk60y6mJTlshjvAS6QZzJKxGyusTA1RixM59ULTxzuTn\/qzKg3DDuMcQWKohg+cHMcM4h\/dbtpZd5zr+8ru6vfqfGq\/uq795xr9Y5s4I6qUavf1OnZfLFZbPAYLOVbf\/jsC6TuadgelEUZcsywWZsr+qJdtl2vE596YPy1soRVR3uwrNpce49TAOXjkl1FvPMIJ+jMMkFJzgQqgKPeTXSUXd0RES+9gyF2AcjjIK7thwPwQy0SQVQZ7JFnrH3oQpnbX2ea7+9ZDLRZe15Fl0+ghOOlfTsVi6Ke6pxDDflKl+ita3ZxQkEdpRjRDOhhl81qbP3iiglH9Rf4zzvkrjrXpeT+b\/2g\/gOE8WMNTyupe9lELLX4pMPtwjQ13SjoKG8MLVDy+YzynDO2r4qoqaYGXmCz3gaffkDbn1M0hzPBTjTay\/IyOHerFDlYIuKsubB2O+9+Al62ld653M53cr+RUy2E4kyLDikLRg\/Le2YmwnSHlIjQ8MU5YMehasbKavWJOtPzJfKJqt1OD+ttXpFW0ffnpBpshwuScSocbGAlhCTVvRTjcSIMwdoBUdta88H8Ez+hAq20rX1MngD7sM9ghEcfiM4xWTNrJzCSG+1LizIe3OUOCxnk9tjUV3+f238rvLtf11f67toGxnKX9i6M\/Zd0bTKxL2B8fkeGJizoNmZXlLb8L2qAo8mJ9RSZsZFzS82v7rqnotIkYa2oj2qwTKWWLVWx7lBzaJGv8ad3Sbxp\/bBmI+GQDi6xxlzTLOo3MDl1FJ+fwzeVuUn0VskcLjldqibK3y8hn780VZYF\/TtHv\/U3T7nqVMDIaiNKyrp\/8YLopvJjbuPu1e3TxL0HmwpG4EAleOrD2qUnHG1KofQCvvAOmjOaqHPVaIPJ73akR\/gAq6YoJbkK+ZSRLgIIzsl2Ww4vGzlKWO\/T8TC\/+QCtqP+RvuLS1DZ9Zo21fl\/uwM7cmyqpTrff8HiPFU9O+x3MTg9VOHnEd7WiY25OqUM0rMHK4Y0GM8Ccv7n91NObC\/QLJULlqOi7Wuql96dShI\/KnsVSR3i7hl1a2Nth\/VWxXA7W6trcJvHXM0VpXeuGQyQUxGRPWDjvDTJVAPGDvg69rkzeBxPDSSGjHI1TByKR6KCJpOz8lUZZDnj2orfDlwREvbgvtt6Nlp4Mfrn03rEPNGQ5TMcjpsecaZVhid6MoVKbG9lsvNYVCfZbpQ6Apj2vj\/seGfxCjLGilSUrjGP2Prb4z5Ly\/0MaOggAKG+1vdWpjyxMTeO8\/SbS329yeqPuEuQlFfXQejZfEoxyqvy5RI7rf0gaLpZVJPlVHeqN+\/8nna0yWTruRHLmsRw0m8U7be6dr2+QGf9N5n\/tQr032ovR24rU7zMl1U\/Yim6xgyNLrGz30Mph5vWUaepbCPtsZKFzWrGOGgEreiDqdgEsfNDcPUYStaTVVVWvLjo1vfjTeXJb70y94QzZLghbjmU82UNIq4qmGVrGd47RD7X1WwssiuJXBeh6hM3n+HL0S2iTu8mP53ZXbR8BBLVZxkC35mQwA7vKG2N+pb970jEl+8bFoteUXTVh0Lv\/eb58VA9yCkxPO39QlQtRwELMl6zkB6ACrND692u7MOWqjQxUXfMsTpJjBaTV+sgAlGcj2\/LxBEu44c9eaRDsKe+ciMATXdEjuBoaZEjn3oTA0cl3okJx5ani+6KHtzWduMZiswWb8Nkv24MRBlMGUtkr4j7vRSsoJLxVLtq+NckES\/\/1CFT\/JwBN3bgnva9U0trtqz8+QTij4nKRXjDh+Sq+\/M0V0nUWN6jJaLncyMk2mixfLvWrKLjabNoptUNXj+EsYevUQkqhcef4hTf8E0rlXiOr9AB\/E1HMqeHF6lrSYzLXWGJDwdO4fBL8RRosT15nmX5tndzQO3tl0kuQ0S7aOmsAUQ4bwKxHf1penOrHwKVlZgGiAzJQbq+7rFrSBuTnGmuEFPJx8xX7daVmQZPVs+NwIjTDqhwS2tU3mde4L5Xga+2qgH9lPEY1G+bqgYNB+73V6vEozVvDXBlwvkXMGmN4\/7rfGSxOXqOAq6fo3l7LuoweXEUP9e67epBnjl3dT7AlWAgNpCgQpqbHKf\/mX94G19s5VAR6H1SZ1t+jqJbz9eC\/vJCUcH4Gc9lwJzJq+YNTZJvgy5YjvwTDXuAyoPAsAyV272rFOWx8uawVqTKgXUnYU1qYCj\/VoFzCXWp+ZtXiotG\/aaojemLYauBMdkXItAjzpnFjd3d7PpZ9qp0r\/1ErZt1aksGUNEOlVdHHlUm5h2UHDb8OhMqjn\/lxtO+bj1PhD7Ox\/1BzLh5Ea8udb\/Gpb\/sC3aGv4fl5gBsTfd1vaEH8L0xNLbt6WW3vWbGtKjunOfmFc3QHVlvcO5Q7t05oiA+GVtF9G8zXBWjVotGXyuNlSeJLf92nI0d+eNdWpvPeR7jqm7erzMiGJmqkiPJ5NedgEYiIBuri3Do+StfB8tDZjFBBnWWn3c\/IyDC1ZFpNNW20TTr1risbb6ovWMO0KHCyTaL0dCOjuhQhg5R1BVccnGOzPvvhQTxHI7odOrrH8N8tVBDUxDQqFcTdb0YJV5ZZHZlk\/nmODK20SUvRGVqVnyPQftIf4YuXSWeuzRP9uH8I7X8kLVc45JgT70KGWJU6hQ9UW\/VzLn31ilbwqSpUF7Df4DPjHujfP4AzqXe4xuIQVxPulM8L4fBEewM1vWZnuEAbVQXGSrrd59+vo3uD\/n1pWQddzK3SH\/Jgf4EPvi4gqp9fvh2vqKAmkVXnt8Bj6vrVXRbLUhALCP\/y3SMQSYiFz6zbnGFX+9x\/om+TK3Wd\/m9kSgntg\/tOdUMA1l3LzP4+N5Ft9Gi3VZ\/HslU6QvITmQZnzzEjAMO\/eL+cc3yAEcWZZQRHN8+\/s79jBV6XTco635uaX2d54arjv\/031OFuhkrRpaiz0aWioGnxfgxKqiZ8wHIG7ntiiM\/deERsw\/bD5Y7BmPBT6q7x8jnaDbm1uy1aZ1xHxGrvdgqWlTz8ff8La+iSR0rLK4LaKRtTbeAOtPDVtX8AroiLuiv\/uDpUms+W+KI0IipdmpSRWzt4BFbW63w6SSeDrAUJbSRbcxe67r7Pm61vWYTBD89L7On+jkGCIZL2PKxVJ+jJd1qNSMOeY2eeAyORsUYS1qgnogHj6hdth0aQce2b\/3OLRKZ7uMZvFVG2XPV+uo6o3k1S27A9kYKReq6Oq4vVs4ZZiyy1M07aA1MiuDxSWGeNcdELlmD4RfdJlFtiE7bB9RDr0Fv1JWxy5AI+1qL1xZXKXOn\/M83WXKOg2PWGGQORJZq+Pk2+H1WkjF4BK\/zht3BZI87jwT+rUo8AO8z2vSTHFtNy9+rqLzbO1iA38kak47iZbO29m\/XYdNfI9UaauxWX0Ud8ctrjOfNN5avrBRXwcBfe366X\/x2b7j+3jNDzJ1wfmAAbPG4MegY5WTbprrHAGWS6xvqTJ9pw977HN8hA\/WoYKZYsR+idFsXLfSX2nk1N\/6fflV\/yKUjgW3yGldULZ+LJrx4WkA977MA2\/OcFkxI9c9lcP64VQ2ijZ3xNApkVI1Vt0AWveqo6iZ5F7wOtdXVHreM12hUjebqYPJyMWzJuObCNkbvDz4Pw7BfROEwlQ5uuPjQGo7t3ILYOqdqfh2Hz\/dZjTlPWdgZNZkhT5\/ctTNzItQOJ\/pbU\/1FZd7e9Jk+ysbL+CoAbdDZEH14yH3cWywSCXL0+L9HSJJedVWP0BK52uoEG1u1eZXfj\/KAnmsXHDSXw8a+nwdmoApwRo0NlSoC61GJZDPX2HFNKXESoXUym31PvajB4qcxV+9Wzau6IKwz1\/MxuJDyENUF7\/0e\/v41JqnK31bfb0LxShBymW3z6D7bzmdW+NQ7qyb71gHa79V14iDD4XPsXoHCNvK5WPYObH4TrHNZxtDq\/sUuq94NNrzTuurTx+\/wOr32vr5Uz0Ww59nKlUUJLeAF0CBqr9mc92p1gf9t2RVX5kciIPv7HTwyNvjcFTIPI\/CsOjD7VZyDVasftH0zSvuy3HkPmJ73rAv7TsjqpeaGYXTw3L8w1hgK5bLXyWS9W1c4geBxYba7NfGpYyOpRhfP6sL6Bgdbu4sRFbN1EdmavE2F9DndSkZ31OQmP6erxhH2zTN5ntisphY535WnyDjXz+R4fiM0vTQvnZc3PPqGlWkJkXzq3+vP45KqFAlM\/qRy45t651rPGSfWiThXDcCp2S6h9TlhXgV2m\/6Xir5PC\/H+7tQJn33YJlvrm7\/s2IbHgTiB9HIHbNHAYiBZHwSrHN+yPf+CNzwJ+4HBc7ZUnDoWRaUO4UhWNYrE+aq+8+vjrqRb1aKw1Ezb675pAmdp1sXG+PrpGapET\/Bg1JtO7evxrcWOipEOC1MWR9z38HdvRKvVw+x5ReMkZuUd6\/dYhzZVQNzfKi\/ZG05\/f5dN18QDQxSWPai9r6uQhc4Tkjt+\/+S4R0HeWK2jihMNNtd9f+6MWHxPhz8KDm\/KGGTeSjvHUk5tv2HsMXDXVogIfAdZ3TmZ1dAUosqCbwHpO3J95fIocr8+Cg75MhXOq739xBXVTvOwHfudR5OPRBbjA71sS5T5tkn3PZ4H5WbEHpovjzNFmIP8VgYZ+27fFzY7sR9Ff5WrUVnFvvrq\/jCduuS4RAHR0VF2VgpKO1r1QQXz2jKZoUefp3uZLp+IQnwan7p25k\/L\/pLf5+fKXcPH9GZ8BytXJXjkXBinkFfrqYpJlOmqp7ldFTGaY0eqCySoCMZp203VTjGohaLocShsMe0q1nEqZcbnKEAn4z8k+RqxYRurXM2Ty48ddWi4AkZbXM9V4R7GluuZsyTqUG78+J2NIW16pOvTw1oqapyv4hNFWW6oa7XISFY\/FaPeGTUY8Ua5AG9Oxbtfvhejx3pXo9mONXadw+mGfHpzDtD5qb8Pa5FF+JJ6aHaqeLCKXBAIgSBjywib\/4Zy3g217f7wpO5SXjFrMBJ4X1W\/+UgdR\/3hav9li3yvfucA4DFrjmePtwp6IrU7GcMowdHrI\/1k7vXbt3nObuiHKzn7xtWs68Tjs3cjkjtlRVfKBr3SjhP9GBD+al6\/vmoO9tdSP8mDJ\/mgxBg1vzZoL1E6tHNozd57hgPpMDh71gyVN3CNaBieQ50griJ1WLqZH7nvUc0t1zKoveDFs6hoU0c0L02LsLIeg1DDIeC593AILjZzkL+sxY9fJO9oQVkuLXAPHL81YRqJxLxjgJerwmpwKhyG3XqKOJOlZEHcoLXdcS4qOQavE9PzuOPK534eTwCW1sHcHoeZtqMFqqzMT1\/hpP5H\/5\/P0znWHbBNXQG8R33IXTAER5dlHIFKT5bsFRUGKlHmKnVbhpeoJPWMb4Ez6+iKmPvqxbR6CLk1BZ0JV9fYT3WGaj1\/IveZB3u9sE6tiaiRSI\/mmpYHRsORs6frw3pOuXdsw96b0c3XZq9S764EyDavVZXaXqmnHE\/1ZLz09e942Ma60efQB+pBVu2WzQ7qOWVslGFjWh6XbM0oOYXFm93hA\/+xiOAzp\/RjmKGNevyLXPuoPwERYl2dt\/aIAvdupg+PRvfIzKiR62O1Z0zOLIyuvEg6zsOkjoT+UgUy1de5ir5zfO4prx7GyACjMLqPEcqZYTg8VB7rxopEan99l7kYnxzBntYpf2XiMGJ1qf+iHTBRHhMvVfFcxOk7M7lqH\/cwqsb5bRrVvqpl\/vMaR5lm2eox5f6Mhby2D3qFzVqro+GeRctxqG+0aI2\/fne01okMYb1eG+cWQPq548PNdHPRmcvzLPlww\/0JioBVCh7MHpCZ6+twXDTpl1utY2C1iBpy\/gMnybRzZDBV4\/bOOSb23RbeEOfGSaSIpaeZw4w1UTYbg4+v2yJtUgvjEXxBc0Q5UZPbu9rRdWdc5BiIVREV55gJxT8OtbLkCFwCujTns3lAsbIoUq3zkU\/PdIDye1EYx1YUzpn\/DtBMlhuJfvvQbFPFVBE52CtDos9EnZWY17nzIHyQOzXYm\/HpmEW\/INckT6tX136mrHPAc2nt6a6iGcet79Q1bahbqjmooBrTj6EERW4Vf9ngvAPcgOIRaVlKRYCd9RLF8rz7vMHvrV6JOr7h\/pasuusA4CbaLw80J0MEuv7UaRX4ePC73\/fqW7BzigOSZGtxfeqlz5GhH5PCznOKxta4wDIi+VysMe1RW5\/WUOL1441m8TmQRl8UotAJfKua1bTVPflr3fcv1d+5Q9mWvtr6vuWo6xg4c72EarjaUbSKdn+5rnjrv5tzUHtDf1lgCFqFJP\/WLViBtUE7+nOuxW3P7TC3RDfUbJBJlE9Rr+5F39\/cyvUv0+sLueoawjzNWmpGHBu6+vzl5iaHKBnCzPNX7FhtavJc4EMjGeV4HdXGaivEjD6A2oui1YiOiUzjrM8gzu5P5fs9yETXqydBjdv+rQKZX8XkExz2SEd6Podq43uwvtkCpVwhfo7xYmamjRM4lc3QOI4yJI254aPy4cetTQmJT36ZE5fd2TLjdz9Ys7kIRpML50vUy9j0eJp6TkpgMNpG5zJs1JEapg\/8S0xkJLjYPLFfW6Benn\/\/zkcv24eU6eSwyzjy740Y9azKVUvrJJ6Wg0MQ4D6HWyMO0vSaPvZV8jAvUpTj5nThVLPYbB+foqY3RJK4o8hJSbPV+Q39ZUWI7ezv1KeadvMQPe5Hl9onVhbUmrq1r+qMx89\/GYfWZ1V3qlRckHP4Eqy2n8PXPMtwlUjVLa5mDxHniNFLJkTLtKi8ynnu8OF2\/LB6AeVlSuul9dr+gkXG5yiPYVR9s\/x4tdHHuz8lpio6q\/CK3rYPqpmVzqWMzeNvrBJno7iK3SEClriq8jmvwFIwkfdynnq\/HG67DnW9ZQ8c6PPZZK8jp2Y7M5LLHSkcfMj+zrYOb+AJPP773XGnd35qhi13vCH8b1XBIqCVipKF1G\/Q9jxB6qwug9wYqTHfHIRug1pvC+2v\/hCP5TqO5+ySTxiWmWpnps253wbIMTk699tela8fq9\/xJCPnuP7mGI+VU2Vpr8fgyDCQbEoeGc18EfOE9g6DAe8we+U53wXMlZO8eHnlGDAfOeRTYP40jk+vn9+hjtK79hAekNPn1spcOdiOWzRNP4tncg1qjQjxsULZ6nqo\/9FR6VBkbmre0Z3GkLdyVrm4mNnIjXEt9W+TXhVfVcu\/5lSMzy0VoXL+UPFbKTB2oMBPD6sTjib7Onp9DA7k7th\/nsRoiB4\/UZwRcK+528t74Y2xVpnqtHFGnegB99cg6mBYllMn7ns9TxftHS0HL16zzXUb3IEevZ\/WNpr+ygL567eFeXd1YqdTICc6MPNLHfk63v6\/fCvoe51R0bqeB23g6CI\/PcgYuNO9OsLK26m+W5t3DhPUd4XuMTesXcV8M1oQBjLPuYxJFiPGIxro3dUHWOT3bzWQReuX+hrDpffzftx\/JHvCJCr1+Ep1\/Kcd+8sR\/QUFRIqjyRU3Tylhbf4gs7CP3vicoH2mKtjm+vk76nq+Nbny16\/NxRhGQ43HgY19+xJU13MT282s5Oy6XmJOnMji2NV15L7flvGMO2P0nemppmJLVSATv73ne6i6uYY54mUINh+roMBW29eZ6unDu3N8Y26YtHX8MHYsQ0QYL3oFBqbFnV+lZ+S4j3EGqyy9lLqkgp\/Dh1EflzvPWGSPzcCMiDlux+GqTIc482Z8qD+ypOcFVY4FviAe3H1XtyLaXSPiKCoxikrGirE3rxoChmirjfuIOt+7ym7ccnS9Q7NC7alNezb9s1pgJfWPUcZR33geQtpPxtixgl3mej0DW9X\/jaNnW1cDMo7zHY6VnofjGTV36GhVUapFP9+wRuTnkpxl4T6YAcFwr46t7EZs7qCEQev9F\/7amunvaZmqHMqMoWPHN2+Ol6NsJt1jk19+8OIggatyu34Tpna205aOaY89ZebOF4qhOS\/mFI0K3ynhDzNYZpTUz54zV6IWxzvOdlGVbpmIZZuucKWiHU3eZUxlHth2fi8QOo9IzTrqxWArVN9ZDrxFDvm+PI88NnhX7Xeb8QQ5zfhWJaskXrGIyaLseOqgm8JhnFPzk6Uyvd83SDVyHdtpBpVidVutjEetz1\/y3tx\/ULEq7mrTRrPzdX9nufOycxp39DsyWIAr+LGX6tXXeVIPvCPHwArt+a+VuDidD3W\/6nqzHjibe4fpTPwLlxyPjdWnm4kD40O5RBzsLq6qm\/18agLJSDd7GBMzxuDh\/OStF+014jq\/zIjBoXeTWIW\/HKruYPyD8N\/I4aGx2rQKr\/dcJF7Qedi8Dn1ABXi\/iEit\/HZPdseRj9t1bK0+Kte5SZkCZmQcjWd+bXfPVVGwR2bJUFGyveU58a7GgmkZHf3gxxbAxdP1p2sNZccp5sSkWBzflmOJMhho7xoZRqaWfquWcWw8MDV62DG1FT4H10w1988\/URPPJbz24Xsy+VxZWXB6u5irLhQOuKMnIJTK3Byu78Cf+Itvvlo9\/e885W2RdznWfMTL1RwbXhUfUQ4EqaACvHvMi322IC8ooipyTg6lwE2lrsavH8TSsiiaFs5jgxVdGxXLT47gncTVT3X1642onBuB1abnIUfgF0RaAb5K361R6k6mMzrjjccFYhztJ25ck0WNTDfTDr6rN1uiF7TvUYyOOSX26Snfqydu5W1mpUX0lJqtgtkq8aqczMEJBBUV5HNvZIsrV1d1IM+6KvOUb+pcaLf+47EI\/kofPNXnm2tZ39l8QK+HLretrtL5unUr4\/P3nFzHN\/4nV+zxjZwqwpGNWjPRHNgayAK9f1CFVnT7\/IgwKnEqmUg+lSbb8mQz\/\/vhk6jiSd5hBZy4yE8fN45jLYb9sS48Xw2jq5qqwrdOwcA5i2a4bpEjE4PHlvOXGQXV\/WGGtWIVXDxBg78i1lHqco6FZS8iOhX4HclPHk2Lp+Cu5jHnXbW8a7Rg+2988C2sylzWjCTfoUK10ONDnw6WFpuXKWZQ+17hHj77xPEwN\/4\/vJltMgXeRCYjJur0lixdTR9S3dKtUfw5g7gX9t2MRG\/w5Uuy7DFa77idHVWv5GiHSTTlNwyuhkkkxmC70urN9T\/upUN56KLlnSnYrOatShLZIQxGYi7ndwTnvlf9XN9vyLyHnveFyw+cUsUm5nITW6uW6FGPs+qnd8P+b0Nxk+qYao3D6wjKWodhjlpVgxNXwbb3VemvV\/L9EuFYRQ2Sl8j+qwz97XS2rbVnKn7Vunl1ruXcplzfatiqxXKTzFKF\/CS+8H7y1bnfdPHr9OjTRVmMwz\/HzLiBw3Ti5Er7cZ2ad3VoRuR5Wcuq+vpA4qcmcI9dq0w+\/NsDe0jcfQ8mV5lxQeQFzV6WW73sc5kjGmCCirOqqU9c3Th7uiBTwbirjuor80+u8IB\/4Izk5ao2KxRcnd5v7A5u69lSS\/RGLVTRqs+fkUxhp3cb1Tm\/1r0+pv3rqBzrl9191ShMD6cGOS6jv\/fZwlfMl+oMHxoveGQRZcYyRQDTy2DH3HhRj\/Da3Ai81U9bbx4FE1r5YEYtIIfkk\/Hyl0q7K8p+fASbz7P\/tiPT3dI2\/E71PMdFmPu0ma1RNtUL5Q8sdATyCzVKO18U3ohPOawI1WbjKL7mxcb+GZo+hh7i6\/T97DGfw1rDOIFZT7bk+n2\/r4fHZJj+OqMXB\/TOauVofqsZNdR5V49EhIgmrCknysK6IWuPnl\/+aJF96ZOqRyT9rkHjS28uyjlHRK585\/DhSNx3mlzANH9PcefKn9o+LZ4iykZGRc7xLI1eIOjws4\/ZZsy9dZZxVseJvp+6OCbyJy9cPL7MVS\/Rme3VgDUpw7e+ykzhJnTnuDuc0Uj\/tuI7UdFrZjytuFSYnrksuHe4h1jyxdxo\/ArnkMuhhKqca6qPsM+8Jt6Hm17FjEMt5+IX5szGt7DGsAeKugWI3LbF71U42DgMOHv5enb6LmbFE\/jhX9gFt6\/j5lsPqL+H3jITeTOneABZ2Sqe85qmoDXN1Wvz1Nfsy\/m8860J+kw\/HC3oENugPc92p7XmG2Vd\/Y0bYby29O+ccSrzVjI6WngGVgIZ5G+cPC0Hr4uWKIPRFr9FoFdETVPa15tBtkecL2er8cbUdapFZHCWZfAiBe6Ho1yjeV4saGzPWZuj5\/KavQF3spX1mz1SK\/IaVd9ejpXosecSqrlPy0ELI8fRVWGemz1uA0NqhzP1Hmmjos\/UL4+IAshbTOYz8gJa6F\/5gXnK0vmq8GYC9NZa0W\/CA2D+W3FGXNWnZ8d+VoUaf75QRSbO1ieqJpOC8GtNBXfM1uCL8lMb1d64WP1TtV2LtGonj8U1HuWD7Oc\/1CA5Az5NQDhbO21uCzrXZHuf62b2OR9TtvkdTOYwaug1SNZPJQT0c7PI9pOzjalC+jWt6VoBLCNLrV5b6TBd\/ytDjwcexz+mKK8z0irBKm8+bQz8XNNzByiD3ExmQQ0tHzeDSr0B7tiqkN+mQUEArLAWROHbfjMlnbfKTD8uN2CZqEFmKiywZsSfeP7hS\/O3Mbz+O1eh1sgbmZ5fLEpUiHHX1HHZcr0QVli0xBnxlCfGIIaeSh4\/ZCtwoBPIm8PlPAcMnX8ZK+9bs9Qb8YUiiNZmru3f\/Fm9BNxdFq4LiS6wVyu4LMno71jndMaiv2PtHqZTH1mLODq3GnvrZIbvqHZzN6ViNPQBBRHD3bLuVrfDatd0+refzu6pDlmKB46jdBQy77zQZidv1nQeyWpAk0RDUAzPwBl3fLlSViNq8O2XV\/XX8qbtkGmPRd3ridlGpiD3tnNHCFvR22qV2v\/iBg6onlOftSPz7QxzsEFNywhqAJU0jzuEFi9FTQ6Po73tu361OaK9HWrp7XSCaJKp6Qrnq6doareov74Zc3SO7847VRmHrirIk9VWvh7mZDlaYQTWbvtfNbZiqZyssM0TrJYyA\/29wh3o37iptLETdfthlvmex170kGhQtXNy0ze4lSphdLi07JFvEDBSjPJUu9MIvOOLkOu8OqpWXusfL5o4oII4T9R11V\/u6CdfYD+RN+SY0adwRcmvP+VxpKwz9t7\/kTsD1ObtLpYRORB7fHDOmh6pUEG9iH0stp6il0ZSpaG\/5T9W8\/tNgzHorivAHqjo49PPlRjDQvvYnoSl8k1CYfLeCyGkyCgzslbOnvWOsKQvrzSK3IVtd5LioO0R93Abr6fXsGOjDXvqKotu+ppemalyx9PHrSjfjPtFEi2AOZZ9pNYrHHW5bIG7qMYMj63mN8va+25Z7IzJMrRGfe1MPWDvZKCxamWK2GKuGdGvqvfWOmiFPWYR+gwOI0ovZyWN1fhmiUPwPuXY+lMfWxWyEXW3WQ4ziaKIuqBu4f1mYsx9jAJz6dF49P321fOE7E2LX16igo\/JOB4\/mxOPgc+Pp3e7euvpzHhlLuSOa\/+ORWWOHIFWjDaPHev0ZPNCskgNo0tWCppIBfJDsZA\/X7NH8y27oupcTDLENQdpa\/5sygdeyICeiRqytx7r18Ic328lDowUgzhCnl8GroVzJ+qFzL1PpTNjLG+Oxeax6K2ItKfik\/mj9RVUNruNWIJ0d1t5d51rHBfTYKFzjvzAr3hBEHzKY7XA5mWUKTCsAhv06FMv2k3PmrHv47nXizQ4gZOtgingKpRvXkHlVt2odDGwmP8e9Jh9db6ld9Drp+23tL\/PLtC7H1vl2kQiiDvWD1BNXwZBvacwHROZb8T2386owdKPzc\/doorzpyAnLbU3fWf1C7\/gS0+31sdi5NVLq1nVPXaXVVTB7MudPrz\/A3F0BQCkcwVZPk\/M54HAvT9Zc+aaCD4vIKvC+\/ftODjKsQh8vztMoa2MiiqejkwfHO+XhXW3x5HzfG8Oc5xitIyD\/C\/bfqtTHMGOsicY\/HKzVQy7Eteh+vEqSDEmbiPvup+cZeSiz8f\/xpr67yfr+S3jFdfJx+6A7QhRL2rJ+vgyMH5o2H69nwd5Dnpqi+7x39p9TvuuVJNlhjt6J6NQ8cee\/zo7FUpdkufl3tZDqWuqvkotI\/VxY+O57p1xS49x3dZlqop6oj1iUrbO75yQ7KGukDn2bU+7L3mA6bvF1v6JEvfq8IyZ86Xf3uMF+4FjyX0++G4ytH2zIVgEzimPoSfknvxuDPUNp96\/67NXw8VzYQgDfipsdQ6arIXMf4q+tqwXEEv0rmOfX5ja9Z7wRhWPFVea\/OU6kM1EYOK1PV3v557KBGrF+sNMrLX6ejK\/tVmJOVSHiYUVmWeMhbuphFR\/Ww7C4+bfa1tLqxb1eEHu1vRuJUf3MeT23Coa01EX7Uan+lO09E4uydfjhM4kcv\/kkvxvn3p9dJjr6KdV1af\/dgR7P1Gom68y1KHnIFdVoFCv\/7\/eJ8rUrH52qneESByYlVVjp\/XTOTSsWORTW4ywZy\/KOFZbK4F7B1dbp92Lo9XFJ71kQjElg6itVCLH+vLycXBe5\/NncjFtcPdedIoMcLXXf34\/tC7boAi6OTBZnpqZyvsyr0jKNiopf+ceu2\/a5qiohT4BFOlawOe5XhT2W6Ec2b4+Zp7SytycocwxbYu+NSZ1x9YHvIOTiMOlnnuUIcw971iolaqp4qn0\/DVij9fHQvI3cVBDbUOm\/fpyx0uPqXI4ESbObLZ4KxjG4WU+M9ZM4ZLaN6Oa97naxWz8iwFdvZq90EwHQRg8R07jcA4ZZAGuBR1fNXGM5x0d4bmE\/2bNc86uzN4xQBGQCgwK04ZGWnEdjvdxJ729FyLKO60ZElrRYEwPiXcs\/7TCH7d3+GUr9D2jxp+BlrZB1dMzjqFPVD18bwgSgZ2JeJessn9XMrJmM2du\/8N\/7QbM2pyXI0HBVspSVTv3cXlbv8fHeKWq5GY1aDFnV+jDRnDjy1EhIPS1+zIHOM1Fo6YzxR1RSObgTGYZRWX5smtTv3\/yJuNN01WfnZ3v1vzHZ2PKWc2GsS\/fNxjvPAio+v3bkVHtixx4YiRgNG2ir53w5Fjy7vnWqlGzS9182UxfAmbkGWqMCJwPPx8ghuFzj7Q6Zd\/2vFxA8Jdb8tSaaH\/JiyPK6Vy1hj2Zd8IO6Z4xzXPWaPsDzxRhKD2vgTXiTcZ5j\/7TJmM4\/pfTnIcQoRtjq3l8Oo+0OHmVt8jRY4D5cAOPdJz4ip1Hx6mNqWAeHRhMkKsH5\/mHXpXGas6YG4GpBjB9q+wdw43UbCf2KDQakdf5HAC599WLGPyr9p4uHFYOoTDERloOqrMYgz0enp8HMbrgxW0YmYbAdI8FhqPSi0goZ87LUu3UfqPxNGWUQHXCCKtE7qzlluoksXfWNf86vQATuo1uVbyXDMty\/XaAukJ4El8OHovDMQCKoPrRd3SzfAlWp6RkDY1oXcGgbWkaV63wGHoAouF1VCJNNJ22WhlUlTwId1I7Od563FcaeZzkao1+vzqdn4JfPMfXvqcOodttX96bVj7lQKH6arfeuhUMR52bV0ZL5bI9OnnVK+bPXdGrcuqcY98bAscwZAhvM16VfeRW2ElHLJLgebPTWK3KqHRVmhy+CM\/gUXXwMn+\/+cxY+bbi4y0R5iug18r2r7heTno07sUAV1xV42RUBvs7+p166JKMPaNQXdgWV80jOPsYhUpyFG5PTrM1zp\/nRsTHVLA4Ps7miBe\/bJE5hN9IKL\/bL\/\/ChbwLI8rJrH3pINXF40qOcJV1sT5mp9duczGg6ogQOtlI5xUqv5rmZ1zhPaM8Rtl+6aExMXOvGjbf0TGbEfIiHmnBkV7GuPvgZYDo5Fsp5Udx5jiG1Y7ZfJgRUd3afo4ne3D\/6cvdtycwBfGbp+0MbqzVyqLqx6DzXvbkseav+TFccZV9piafTBQL1SaqHz8xV\/nwS06JDKPL\/EL2muK2BjmiTkQ\/pbItw2UXfKqcc9oXtkvusx41JvroBs7z91OFqOJ0zpXBVZ2yqlUdSsi963rWNPp6xlDRSUBY2d5aS9vivOPOx76o5NWqG\/tuFpAjcM47MJ72sdbRc69EY66IFYhqb\/Tstvb19P\/OhkbFXD1j7WUa65hhWGSYMyx8Xrl75WwskW3XyElLrfkBF0MkVfGXX0UyNZQfa4d9nUcxQrHh3ELOc6\/pwTSKK8yOr+ei1bDWfHLoqiNjWNZKGLlCGD8w37Po06\/iEwT9\/vq97AHH4tDa4sxQGaeTKLzZ+cUxVJUX7e16WbVc1YPH7MVjvPmEdvUXGj\/Fwrqed9whAsyo5zmYh\/UIeLR8K249T7nOSrYGz9XKkVZec7z5y2nKNBhf1xERp3mHRPN5ZSvY3K5XjQTIycU29ePzInincX5zyF11Gq1fB11xgnVBzO\/RYwBa6ixvM8cyXHEJc8o7sAZ54Ie\/Lf\/5jmarW\/EeeUVdGRs\/IvUdudzH2h9KgdaC7PFv2\/BHRWt\/nu6r6qev5JB+Ov61WTZrRVb\/iLFoKqbnehnDuL9xJRYNc2dSfntEodfVh7xXLul2sm55aUcL2jqv+nIWFbeoferqt6pkdIiCLgc9I7bue1Fy9PAhYziPpIvSteo6ipGPElZx5a6tZpPhqci0RHRZ0eBlY8aoPtSC091lY9zodWDbpySrnkD39svRdmbQOgYHGRHXVztW0STv5T1jIZ7+uipdqJh5rqncQNtJb368FwznM0Ua8S+mENuM73luvIqx6nutQGoosZMhn4JND1e79RaMCyRTUVwLV27Yysi38jgOnDYHUfxTO7hCsrVMd60kDZd3hstV2jBKTU0PXtUS4aEYH9XxOge5GicyxOJb6+IHF\/XxUqc+D1VqIvs3O4ng1mLRTGKFQrEdqxoclfnHfCBbN5LMOEHvy86o768GeDzywDMiuUrcTGZZmz+ot8g2pbfRC85h1WfVyYXHTaz\/4Y34Pr986+bO9jyv1PxXXyDdjgUOR43GidNElNFsNe6c6SeG7MUrsAgVfVhGn50x\/d\/RLnraKgzD2T240auagt\/DAke6ivmiXmdO3aswxP+YzLuP53WuEfHumfjfbNojjHXx4Kx\/tl8Z99r84GRMasT8VB3P\/x4fVPg6790db+UeRpnegRyOTeWRN3hHPOeVbA1PfzUXjFMNmdteZcBSHMdZBXwDIW31BF6ZutvSvpd5rAMrqACiwEzV5VBBjIN+j6sYkPNxeiOKji2PFRjz8S61bJRtqaOc1+cbZ52jYOxSZ7zi95VzBNi9aGT+OjyTgzsqYj+ewDV02OCj\/+Jt8+DNZyAT+tL7dD+GbV6mWqnPZrD965adp1T7zG97CbTmizfX0\/0TFzL7VXLdgbovY8JTVy+qEminHZBEfRGBi3cUJ7\/TiPGLY3qoLzYZF\/HKCDh9QqWtck8HwBWUNZahB8cuU\/HNZugrmGD07uedNvWSxgJd4a4Tt+9pAGzAu6CzbU435kp1P80TWXYWiyvk4q7NBlmhZclz8+OkE1xa6XXca7efGW+MG7HOEsSbiC0HjLnAIGcw0gpncfy2Zep56vfbAAVUpccgDd9UKWMGl41Bs9iH+JPO3Z5bHlLU1FTTb5dq22\/zRgelm0rjVrLomyOKDPpEDsGRM7+Hlp2rUn\/N+Po4lWpvh4Y3Y02dN4qHpcebYwDRMMeBm1Ip3xUD9I\/q8fPQ1Eaagd2Ybcpmsjbty+Owz35\/j70jnTwyvizPfHRgDEBEVvv15+eVjl\/PacIc6bWfWTAXMOeQxLeClJsymmYOcejVJ0Xww2cACSecTl8OcQMNrRpTnPMqSG7FTefQIdgCLKMrty2tdQu9FT6ifaBGXe2zX6hQo558Zu8dAfZjlM30uE2OoCfsa6Wo1rAwnDCESFh1oOgxlVtMpxoaCLhtVU6vWsP0+ynCkKwuFm3jI7nNPVvr3d4ZoEqwozP43rGW+LfH\/ds7VFyU5c9xf3Hw8Kdiwy\/qtnPrtDc2kaXIa3Pt1i9I4yJqiUhdnutHxufNTXN86ky0goKNKBwzHIEv68o+wQYqimoAExwLiGO05tRqEWr2psJF7tDbuoKf4avh6s+5A2cnRACeMy48toaun3BFeJYMF7u7DlYuPzWnmozk2HPMsap6fFZFadXXZ6wiptJcWTEH4vrGcjIuAj3jwTkrRl9G2DUhc1frAzktWbz6B\/9wzeqgvWEb3EEzj8cvLvTS9GDOhECNTd+qOhperubXeqLnuHZyRtyOtTdHQfvKAzdP0GHJ74\/FU\/qb3\/Daudhy59O1ruW04tO837UAEkEVzjnHHus9tIhNFcijgHHrBha3uhiXrrlq1dzjy2VZsW2tgBp5ifqUrY5V4bSpRvHH2GV6nDSViJbxSMazV2ABFT0fQI71YpfFqxmOx\/EZiV4RhydK8LLpGWfa\/CVK06r13\/sn64D5yyhFzlWv1\/VdRr6900cfouylTKWbkbtkFuJahVrNhI\/BBtdgnNtl1K8HRvJxEHWmtulrzATzua9vsJ4ez1On76qjv\/wio4q4ctjyXezplTlGEQDaVdjs8b3612jJk2T5MWJHe\/V\/bp0cDYGw++pe5hjyNtPDE\/hNqEX11hTVLTKgFxTn06vVFHGfFhaxzW3XGuQocSZu6CfVZQ1Yr+6tpp\/6i\/Tts1mKKIfhiG5YpH+n9SgI2i\/vtrXWZN+lCurv8S22S7ZwSVWjxyyoVbeuNlGFU+zNN4wBvm1Zn1I9z4L3efzVvBCfMNfcEZ54MyEc0Tzq9pzCjMmGGDhetGWVDH3LZ3pynLg4a43Pr0Cdm4NnZFWlZm6Z3nnz9G1cQk+IePuNa9mM4Ms3OFayU7xS0W2\/ilxE8IxY1uO13p2RghgydMqli\/BqK+N3M2I9gk4WvFDtZJss8EivAoatwed9mh8rEYZkRPJA\/n7nQvKpKNbziFpGNH8wNpPZ1QF5\/qG8vbCq5jm6dje3thgGAfnPbS821u1Y6dW0qqPzfl6jZ4yYHc\/7bZ+aO2ppHFR8zGs34TAzeW+tkFPZg2Oapcst+07bhsLz+xdxtfCUC6ZqNTGbGfqZk\/\/+bS3kMwKcJd\/62Fx8Nd+ZSVWnZ0edT+GBO9YcA\/TAFTsD+1YVeWfvw93Pk20OgPo3QjoU8ThGbFmUXajbxorqriYm60XQ+SC5QGd2CBOtIn\/RpRBxa7+WPMOW4\/b+Eyhw6\/vwTIz7X4fI5wXhJ+vmVFfsPbQmxvXAjBz2rh\/YUZIOjqf\/DXzafjI4hpNPzlVnK5ko2c55gq2OZkJflqV2GHM4\/DMfew72jZscBbHLOLlgLtHHfcRq59Zc3yd+cJPgwHrmTrLyjT5rI0pbrNjSenWg3PlW0wIAPiMTnmbt1P+Ccf31wcrrJqcdPXubZrOt+7N6leuxcQSVc+5s2jM0b37U9\/bby6nySZy1N3eztYDFp3H5bcDVfDAlPKoe8Gpev3MtMAqcUc7p1vWFz1fzqNVJlsYxVczt9TCvAx+rH5fAwVcbY61iUmRcxTxt\/8ykqNmbTVGVH5359Lja0\/jx\/upozrD4hh2N8RT\/rasmK0xli6jG6Wla9b14ZUQ3ygpnEIXa7j3ckXmhbjfqKbk6eLq+s8+tlPqgMf4p0tiXqo7O4gzaPPUuk20G0yqpF6Cbzd7ra3PeM89NarJLFc8pBB0Xi43gL9JwVLo7NBFcqejjmeIIjUsvwFe34Z224V4dJ5zUdDsfY9yO\/rmNZpZjNnfPLV0vZHJ9AnUNZqybu3rGeFEb+JhGsHXSOchWdsAUsFCv9Xe0T6bwY3rWtEM0wOmqsUchgqlIMPjVZit+7prKaEuoHBFlnx439\/WYytEWWDLWIF2fZGxVBt5JizoyXIT8fspGbBjnjfn0AB9yLeFA0UX22G8fXa+mFY1tsQDWFkn5heNQ27BY+1B8+YoV+NhkGEEJjo9kHKLaY7bvOikq6PevyrC+UX5cvZP\/dlaivUiiZfkqzinQGLK5GjrufR81RxuXtdw2dgePL46qL7D0kABjgtCHgMftO6c4Dfz1nnExp5n+dTyfDDa6L9pEPZ9nbeWzOryaHbaCuTRC3W+OwndXwaaMZi3UAYIMPejju23tLOSDt+YTdIiGsXjiUUT0KoGpLDm6q61aJ4nCcDZF\/+jPx1\/D8508AjEzBTqoKd2JSiCnMTa\/FYhv1+OeuvQXMl5M2nhi13NfHSFbETc5taWPqyFneJBatnlyzijiz4fd5f5zdvH8zHYdB8vbaBW5gfRUSeeato2XY\/vozeYLqLHMB4bbSc426m\/naqdasDpo0AucXyYWaIH9Gt\/WZTgzOt6y33L7tHTcCPuo1mqbx\/coeZ\/7gBwb6mA4Iv2qLnx8B\/VLtRcJOw85ZBZPYZfy11iP0eTHM3sbLxxVrI11UNgcj2pMbBO1HqlHHdvncap4mt+9qED5m4hSeVz9MR17fixN+Rpxyb\/7JFmfG1nWHMbdralltJHCqcFY\/LhuW+QX5+cGcC+MDb+leqKDgUnvJ8aI8Bmbz6kUxob96emq9rc3WfOzb2Pud9a9mJ4qo1YgQEf718eoxqchKip5+r+RrU4Te+oJdk2fYJj+1Y8+xYNZ4MaNaspFL8kVKm\/9ci9vlXyssgxz\/K1L7DF4XWZx2jAClbzVsbx21ciZcxC8b48vB4SPuBcdLJo2rpo4CipAW9aVbbNFYFMsgPT5+ynHJ76oLuiyKl5l\/prP+zICnD4fGXSES8v5vT5uZ37VybzGzJF3tu3To7zaeitOXiW2F7K62WXEw277m09tG91Vh35o350Bo1CfXScu5\/t5X\/S5n2vsqsw+AdzRcn1nIshWokJMkAG9s1f9z2eVZXLQ5JC1ntZ1589578cE9ffVoyqvMQXNq7PV+Kv9zQN06qIN1VnlvnkOSNynIn+P+Z6XL971CtkOjDo3tA7guEOXKkM05MCnzm1BNeIaYdpmJm4G3yfHG\/PzY6ji3OnOgvzanl+jf\/ZxSttYwZPhtwCnraT6YMfHmA8hc9swpXeZz7tcsysHr2Y3Y3CMRLpQLP98cFcWx7PMs+PnxuSgkIhaveqpLCmqZJZzSjviECdnoRY3B1TR\/+J1Erg8krnkA5XOPdLMcXqYq+A5N5d7TNFXuJM7TnGvi9xjStdBHYiUQ8Dj3NYQa15TsClVlTd8gu8vg6M77pv665WcYwj9Q7+FZ3g7XZnTnabhwGDc54GnpjAPNaNWgkXrmjyBB1Wg7zbg6C7bw\/Ss8waG3PkovrkrgXObad3KXcTg7820hw6Q27U+ep3Mj6fo3VM170oHNoiM7NyqmM8xljoZHMdaL8QcQcdR35mfRmDzoawAhbFWa0U6bYgd9MVj1Bss8uQYFdMLgNpVkSsGjfQ+WzA07POxPVY19bVFS3AMj\/huzeQLnDoG88jRqW\/20qO4l\/zG95jf\/rRAhtKNq19aw1eKfB7DA2W43xa9Y8nnahp0K9nC98IbKorMTOY4NkxD\/Mv8qDVeIJGZt4aX7r9axB+ivErRVb13zeAUkuu9QN0iPS43XlTGq+rme8ift8a700JbauVUY7HhjbzRh2G9wqittR54f++Wedqftcwq5jIJbzQx4FAkfOomVbQ6Zu0BlmG0w3ePB3+jXzIyOjM\/9RAHFqZu9EsUwJarnWaoaDFSZcBme\/mbP8Z7deS+wxnZX8M9I9L9FqP0+iGhd69ZBV+viTcoq58ZzsjeEEqs57y825Vuj\/p9qt3I6Dm\/uiPqnY8UmYPKOACmLHfIEMNHa+Ip+PBv5Y5qhwfrRDdrpvgs3rxh26LPf7V17PGq53Itcw65u64KLSLHavY5mOGpfFfctP6s+asflZ64Ec+x4lrmmQwGqs7Pk28rH7yBIPaAGdRLPuslwx7rWxkdxxQWl9XeMGur4oDLYII1N4622h1PlcfU6OLV48vpqNBXy9nnywrUy5zn0y3bbRAaW\/jzt91nbmIMHwOObZnbVjn7yWHGTW5kfhjm\/Te+o8Y2st3TrXyzUVg1rUK+RaLfEOc9hFrfabU7tDofj1H95Als4jnUWPyD2qif5X7Nl1\/2lGX0+kFcjzzeOpVsSFcNIoX9vRMirS\/G5Sz7RsarfuOuZEHtbX2\/iErpcJfsNk8EKzKTgml7HlDu3Vys1D0mnpbRd9p8eaiqrF7KhfSyKGo\/yVb74PnD3mtxd6L8ruZtizZCjsnCWO50QA6aBg2Yahjc1+PGMb\/KVAPDu2jF8LFnDwUcr6PqXIE5utr3Zhgi4atxMpj383MWoC61zap1smd8YBvWnBc76rnnlJMtbE7PrRfL6\/mcCNU0Hu+V2TopFRHubQTK7bueto+IdLwxMxxmHtXIuaNdCz3OpYbnLLdqyrH1CAgNx76RAyPfgTVhcbJBPBm\/mDqPJZOzMntzilZgc0y\/GPnGOi5m9G4hkzdmxaaeAX5rzvlbHLbPeIBxBVFq7JinvPx0qqEiW6ms8xmfRtV2qc1cWYJWDRktgTn9VlhCglrrjodykd6aoV7KP8M3o7DS96xjww2Ps+ZTQR+VcTjVY\/Ce0dP\/qsNkGoY7p5Zj0yv4FAYZV\/PqZjO6JKvq4bXtEj01Fhz57Kut9lFPJBb0C+WFdvTlsKhtzHC6457i0apH7R663v6drdRX1hGIZngJbXh5p+SnOFcpjA7XwI\/1cPphrI0wfVF9tt5GVcxD2y8zvdpcxMs2RLDIAg151FhwXn3Ktgy9+pxqll\/vWpCUXobRk2af60aixlEaPqvrV4z1XBrCUDbrjDyPuOLl18Jkg\/OSwySouiomGh3phz1wd8SUHDiLOE4kzs4\/5Gz5g4wY4687PEdYT1bEgJIv7u2NLEWuss5aFHLdUvHWx7uCqGuP4xL4hK2R3DJ0OayK+utgUfdBLu\/Cy4E3ffO1cxvGsJiqVx7+36ivyu5eTdYffAxXE12rHc4\/dvfdY16P9N3OWRz1Qk\/IqNmxZjb+xfC5jCDiVZu1AztMVT9+Sm6BMbhG\/hBy8TpsyMJqBSh9+tvRr15R1\/6ISc5D0T3QJ4OKRRwTbOtrjC1ZNHZUJpEYOue6YNSum5F9nMVmx9SAkaSvX401SjIXOWXuZG22Te\/QPIfJ5wi46xdrOtxthe\/X4C74+Tet8cnrHJdVb+877Iom28Yv\/c\/\/5E5ieZQ93Z9VHxk\/fcs7Q+\/vvRy9K6LVUXrG0anDBmw+mXo4Nj3\/ru5xTzRfz2HNIDOvqdW8ODo5BHAlQ7X3VUXZDWH3O4zwlptRvOvYAhrmYvjy\/EWtxzD4rQ6o53Twp5lSvSomT7gEUHJcWFXv6K1kM\/2ttPmHHv\/5elDzNAIdn6umC+3luOyj0bQM\/sC2rxzjyhJE+fyDKEVVVd7LlxUm\/uRcVsnvcy7w1SkH7+poiIZnGKwO2jqmk6N8nzqnzuD9OwZV6jduWPnqCdV78eg6\/\/hJ\/6Nvtm3qkU+nsi\/ntXjdqOFPrF9RTq5Fvdn4Mut5YUfzdR8cB4aE533Gp2lpWb2gh2QZhTB7MAOt8D0Y7O11JDdLor+oiOdCOOp5K0dkT9nb\/qlP4lwHaM\/5Sx85kxKuAGP0+yKt15BTzQmR3H3zh+1rX0T4\/rmRanazCNZV0uF6HplZd3ux6FJlfCKRyneu3zn2WB6WpB+Hj7wYf0qbiZNXEcnw9V9VUePSv8EaGlmG2fXA5Vn4oCqxs8TN2diqCOiZgrkR6lfF+vh2qkiO8BG5AUucDyrndBZezzJ+HLuNYVjJIKqJT0dZLjzdJMd\/FZLqRTQ3qo7EDM0j\/xph3MVnq68a3Tvl5a\/zMji0ud1MD3cNp7Kez1wurXFVOi6413v1jEDe5vqnNrUzWF93mMhXBX4Bar\/pTK8R05V3NJufcmeQu95v92l41\/ll\/643VPnNNv2i\/bzO2Yo\/9wxUy+o4e6V+9+iRnodYq8nGW2uyZXKVNntNWwY0pXK8ASAzCK8RYKRVhqLZvDQ3ReIhqChFnzZrnGNqzjerXDbBNCu2c8bDz3kG\/eg5CVyaXMjrraUhBj3GRw2lYxvQT+\/5hAXq2v9Y1cjzZkFHz0wAHJJ0614mRqfkblhGteiF+lQ6Vdr9bw2EtYb5mLKkDrg9cVqWY9ajECcZ+nmnxZq4EIs6HKusD3C+s0fL2Gp9Hkgf4jFARvfrX0ZsxOnf+l7G0pnTSyL768Wbaf2wtjXhVmXQgNJQBZ+ZRSttzFIWxdlxxmea1fbXm8sNdf77t96MNvj3zVDaznH3+SZYvP0pmkBPr9roO3ATjE+vl5Nkd0qxKLUKRhKtMBgIZKrw7I0\/HaO\/+dFXC9ER1tZRK9YPHF3B8dwcTN68DIensI5NDJXTq3zlfnpK3+cyHQ\/zHbTWCiCy9K5jnYJMS5rTaufv\/d0Tq\/li\/EN7o3hMwsqOq1jLxCLUrRbZ4jjP+i+Hb7vvOqYJA9rpp8727qJY\/JLP5ZI8vSp9fi6jprLqJ4qvxzevHqdt6uiUJzl7DoJtGTP+B8Qlvztz3HrbTPNP31g9hRlA37m\/+Iw0NhafgoC5+dbxomigJ2SNK5PIi9x1\/uC4lJoqZBpwnAnuiO2HzedNaV8vpO+DQ8AnLHbowiHwCh5Hb9NeLjerwI64eKEWBeLq3sLL56sSH8\/\/7\/r18nwCtKSXh+oN4K6qmL5xGRt2x7PFHHkwG+QEtWT\/9mpoCffkdTGPcyFC083muHmcB9ApcBVhdPlcSEaF3aPYp6e6H\/n591ZWAZ8rLB\/+20cqigrt+Povrx1qdPFZeTj\/roMkm86VGD31hVaQdzCRmkITG5Xs1xyCSzl2CEoqd0cFa7Dqgjuebva8Xnsvf64\/Gw+YZ+Tie5lIxNtDs0n2yGUQVjSWf+E91x3AMq9MD9dG0f6OrB8C7cyB9DGqET0DLd6pHZZwpk2c7+7iXIuWPZgFx9XZBqhkvYjI2wfZ9+NUxkRqCvimLf\/lEfmlB39VSE4GO+f\/\/PYP2ML425K1cQ5KVJ1uD49VIL0iWcDTiDjxfSpVtBHSx7ccmejwJmPVIzjO8ey6fPvjBsY28OHiIg+wrUz6ZT22fJn\/xePV8+YSaIvbyJGtm9XR\/OrA6uhUw312eEzMyB3x7lRCGOdky0+\/w+1cQLi31+jKhbtLaHIHoPFwdSMIAfMtsNwKqf8sCvEtq07zCbPovitR42siRkts1Std4EOuCvo1bs\/kxe9cKfSRYiyPb7aWxrJNxtm5z+8w85zV0bEtM7L6sZBpHjdKPXuPLrRFNfb+ZjCohkfc3K\/13\/fYGybB99U9z\/0xvm7Z2UmCk2f7vHFebz6YN9bPuEIQb34joKcdLfrhf6hZ5yNlqY6i60Kw1\/uGnqpuWMVvdJM5UFi4gOoH1wkWqwXj+RZycxesF7N9lK5ML\/WZVAlcjatynjItpJ30aT5SVdB3qLRy5tBe\/OQbcwd1XPMcjpxehS6oeeU8Ca9RYMcVMD+17T6y43rJrGaccEpK5GiRPcCAxymAmtnzAV4rXI5TrdPTtc\/ZIn7OMaFSREGN69Ea43uFccvh4NKazNaoMvlZTH+cryLY75sNclTuwSH7ycvGWFew0c8T69zg9fboHbsZkSnwpu1N0ZIMPS+sX\/P4377P1W5GA3Jhmec+WpNPTSZFZAP9JYZyPb2kJzcfqotx\/GVXeiX\/gulx5PLTavy17J2B1NvDKLWxSnlKdwp+qs5xRGAR1pziWfo3PmwoKwvgRg+RZY6uT7anU5rihKiLG0aV7IAhrsRAF+fGaX\/u\/VMn01r8SNVCCZuew5BwiPg2Y3jHQwAt1G\/kvwajqsHIYdtOkHH1w3njgYPDu1nrf7lgKGtc4U54NMSdoKxum2fQRK08PrSemU80A407DAKS83qzUjxl73OUKuGqwKr2ng5oeNV4dY9XBxPy0GJyrz3XbO0lZ+bvGAWn4mdQ2+NWgRws\/vP6KfpQNld0Y0UFQHJfbW0QTbP45IqZALGpvwBZIPz4TReXFtQS5wvDpVVaBOTM7T89Te7QgHFsc7MIkiF1S26tqq2KwFPeocKmDEUK+KK3fIJDB+S8iHgcw1C\/8rnbw3ach3Vuc4jtvA7tGFOAv8ZkfAo+l6WM56Om0ybZuH6ZEJdvH5\/TK0cB\/1i5py4qJnG4udXiWLbR28EqYBBsgKhVQbgq\/itHejw21hovc13GorheFzGrG\/TEKq7XaEvEymPpMY5rYAHefzMycdqannZTr6\/S2It3ZZQ7+mZ7xYZIKMf2SOWnxgaN66NFo1x1Y5VLmmHRQ096NBzeeq5jWCyKVTX1Ko9RjCkanVNv20x\/PurMGph9AfFjPqqeipSNQDrMdC7oeJcR80nvRm9RRJdPab9ugrFPYV9UYQiOpHqOlZtXVVIuUdd0SLB0YxvnvfNExAasNqa8N29PXaqHu+YTZVyMQLMM38+0c5ZhCqXiEWWz3RhTMWsfX6+nbj\/gqDIOY4JXqanif1zKK\/NQxQeoaEQAXV\/RtZxLRD3xDuSZKLbemy1Y2ldVaPIvP19G8P0v13\/OoKj15l3NoU2ORQ7GXZ3LoB35gDejBlke8Y7nJ\/NBCa\/L0c5pcAVgmD7KCKsiokFEtkbE6C+CuJBVtPM8qu\/lZrgm5uUSUMUvM9iuWZLxXzdgCR5n9rg5XrGfNDQ3zdI9ps26n9TFa6vb\/N7JnHh1Oj5+vPtryXvEkF\/4qlGD90pRdb475dLKaSV\/dVo+DHpLPzs3sCpKJcC5hT9lAvk1p+l1kZ7Xh\/mO59Xhmx1nE77P7WLgWdp9DrkxYH5ve6u+zfrz\/iurxvTm4m8NeWal8fw99kyya7PNQ7x99+03thn7VGZVlpk7De3KcKpiqpBYT8ObtXxmGqWn6prn7UnlWxlts+9eDci7uiZYEhaA2dy2KF8NjAt\/b3rPf6vECrIu4Q85HiahR\/ZUTwrRqA7n7Z0lwJTTGzHdld5yDlDvH3o1tsGxNApoZ\/s+FQW74Tn1ntVy8rQsfHi1jmmrvyjM9LsKb6Q64r5gf4kCxx4n1QlRk6npqQa6QCVVW8joKjnF3dfsv+KZvD6\/2YpM9X2jwn7mFQWg97RWrtkPr98nRc+X+D2dZPvvyqptqx\/uleir9zpBWNEITo\/mr5xRc5XSrStxlaGtmmnw9FUW8AaDc2y5X21nj+\/xZX04XcVCA+BycAXbfREbROH99i\/zchCA18+R0KYi0R5zDlnNACHTh2aevliNvHJV9snb\/AT7H8apL3T7KVQxOyxuPtPYdasp22MIr+\/IjHl+u55iNQii5RyUU2x2K\/XrfB\/+q98R3zjDWcShmG80eZZ3GkND02iaA7JMTV8+cdH0Y2wxlPa46CRLuP2humA5fYO8tCorZ+KWhvqiAQcvMth\/jFnmWX2Vx31P1J27kI+rj+Wy9mKcjYoWPXDBcxfk0BjA\/jDGRx3aC90KCAZN4Mo7TxDV4y+ekamHqTGDCKRVq4GRX0TgGr+hrr2aWxrWmgE6xKNV2piOtscOv7b8xB8uqT6oyCPv+v2LLue25BgQQ6aGttW14zytMoO6WJHFt\/UQE38akudxu4rADGFrg8TPqBBAkEE\/2n8UYJULM3CPCfnZqnSk2QfkT6lyTNpq5QzX06ZnWBonIsAY5Cba5Yc4iWtr1PjKW4yB+p2CtA1+zzkks3k\/99FYlVkzjLsoN2KbW1V1982381j7PH41uVea4VkT+vvU5D4dXmZ5HJI2UXj723zIgGCvSRUB5QOiVM0l\/53dsCq5\/KJncAIx+FYLKJO\/xaHt6mdQ0B7rtQ9eaJ020xN6wOPGbT6grDxIUvfVmrTbAM3z10eWcxKHqoqZAtGbs+d+v7\/dd3el+ZxxDD1ZBbTlsexjlPec6KEp\/EdUPebTtXIVXLwtx+c4EfJGpROBaeleWdxb2Y\/tK+rNHXcJIA8gsSjIgJdNQJTtyaqU+nvmOTBGDfKJ3CpkrgAmb3sbhetpGW4zsiNS2fSUMOIHZLe+My4YXzZq8KSK0RG8545Nn0O7VhaoXn1nHM1LVaS44+iwLBjl\/Y4WrZneqnIJ0GLRFoj6sYH9RO9vhtx7fJTuZRdZx7pja3rjVQTW1ZRplSBnr0L0EV0r+NYh1TInDUZWq4xbphfXINQ2WH+5Sj09pOeJJhW2erO9RZEc6LepV5xAsf5rmnMseV2tE+cqOfEgN+qz+UzNguqOEDJsxsSnypKejOuHBTE3dFWdQXkZrhrlscm4jGQddMseM6MRAVyNT70PmT3XIsb0DvO85X5qjyt0\/rLFWHtax7jIUFmwfkI8Ohs6bW30p\/m8CtLgc7LgSBfB+olkU23k8cWE0eewCdEquFUQZqU92FJXDIb2Gth\/x23Mxy4fdaS15sC6upobr74avNZBPmyuJn8zKc+CkOrYO+d3zk9fJdoT591Dpdixqvs+iIbTGBq8j9Z8EAsjga+PjnX8U9aeTyIa1cLl65Ald3yZalrWOofdnvKIJWq0+u5sXuxWO18GQEbea7as6ioLrNgeTEmLxR6Xc4rM8lBjIsL29pZPUMi4Y8YiIatSeppickeiz\/Dp8WgrubMj64wMUUlivHqbT+3+ug6Cd3\/Njgx2nwdFud65XupkTDyfIJ7AlmiWha9\/ZGOePjgvr+g3GyW4j7jNh0SNZHIiXL6ol0GrTpPGFzvPtq0T136mOYq\/FdJ3HLlL96ECBC3rQdlNf5SjcqVU\/c2u95\/zGneoYYkAK6Rq2s0K\/XSPCP9o1s42PuVovKkMRgu7WccwP3FbzRVjZqnMQ1KGMfpz2COj8Nhape5+rbgae\/uqRSokEXxzp94dT+WZDq5n48F5Aiumr7aqmAXDvd\/ewbm6DsZl3ejI9JJbIwjfTJVANNcAH9ZOBQ91icm+TzrV8aLK2mnXbz+IN2o6CHD54dZG4bTbugFhU5g5Gj+T68ivhtA0uIsoc3XSsF8+IhZ9f\/y2McH4PZr+TN2B44mz0T4vU9eb\/7aqpU9Eb9zOWmdk2x7NjO531XWcU0ahijkaVyHJeDeC0\/DV\/OaMaIsjYfvp60ZCjbE\/h0XtwGuOfFi2Fq4Kzsnhc+iprsdW9FipKdqAHftobhnXAcuXJVSG5o5sigp65bHYkwjrXMwRuCTLosPPr\/6t5KnU1Nh437d5EH16+Nz7bzPWTXOFrlf1wRKNw+K92t4MRw+P1lHDj8fg+mlUubpqBl7dOq8SJbgBHWOUVon5RFvYYkcuJ8KGoA6F+UapldKG9XZqVD59Tn6\/bRpfcsidOnUvy2mjxmfZp1nBl+d1m7qkkQLiW1\/QNJwMtYK20PJ0kX52q+F47odt9Fl1Sh35F33nHsBW9atQo\/45fs6dEDN67ozq3zkE29+4rYn5JyBcVgGVHt09zk+zBebP0RLzPOO6Pz\/Xy5ZszSOuVASnfmrACkGrOD5Xwf3JVPU5SVgUdGwdNx5T1Nki6H1XpHU7kRjflYiTOeLRvo2XuUsjfWIfaksG7piLzV6zVe8C1l4+5wyJ1NVW89AjDqnFT\/KLR4u3K4JbYXd04kHF0KuOs21zx3eOwljoHzOUIaaVZWU7dnx6Xe1n9aY1Nr592QVxjVEz89xdkdBo9T1qoc9BasoG3pRZHFeZvDp4DE0l\/fYr1y4f42a4CxbmXzJE\/nfstLi5utzRKsmx8m+zpb+ihtMa3zRxUeiayeoBhX5ctDvs77Xkre5irNq8naY2vqtgxs8rxcGyeBrVvrd\/o+r+BV0gfGPflV3j0DLI7\/2eYYZxqKRVK\/GbRsAFQx+lPJZdr6pL49k+4s4ORLF9eLrPnurJl1mH1mRqfWd\/8tRMbtX8sjQiguHaqJ8XBO8fPRmqQWGiQr2CQtpWfbtneYPXEvdpFCPCURj31fA4NeMN7n8bNvJsKZOPD8xR2WGDoC+rxHq5OMrmN1hlPkSceXwt\/571U3xU7FO68xpqvpG7uHG3F9HXNvfTRC\/bzXNRYJxbRd2a6NFvoqULpi3z1njDOuODcuH0\/\/sXtKGKxx3wXI7BtwvQJ5lAdDaicN6uRste+kYZbnxanKlevXP0vNp8Qd9Tf+xPP1OB9v+a6RU2ZPv3b1kr\/0b3fbzPdIzkfs10m26NR9h6Rvb49TpXUYOets8vawkToTzP\/HEmYDlIrKIKD51jOCLRui5XqFtiwpq\/WYJsY2ZhBnXi\/qIV8zTzEs327oS4+wDknEGvBnq1v+\/ga+x+I+snzbLGkRnU6oaiz17gnLu\/wCZ5RScua\/Faxv75PsRqyzRvum6VoDmok\/cAZltee+e1WSUpmxdbw8Q0vtwsSvSssM7NbtTgV311YVXR4pmCSyve44ZnRFr2v2okjnCH3n8YZ+1gbAtzdED1CujB02RmE8Fh1\/uLh69SNrOsvUhSp2hTuGqHcxMVW0fI1h2nveAo7fvXUcglPd6YppUfOHy8RvJPn\/vfPvuURotD0BgkFkVoJ6wlUxlVM4QaXQ+pyfRi93rNezodZt\/LmShsLrfNdHn6Bl7QGfSoOAqnhfXgnuz7dUZrCVekwyAqqCnf2nLsr3Ll\/bACd4khRmS3VdqV+K+GBgc4nGF7dEJkQBs8yCtUGjMTtxFR48ZhSGd3rolIkNmMnnjjV3\/tV9nohZzeyGzVEa0j6YtItbI6QEzHCgy5TFfWoNsbQ3tvTxih6tVxohrjx\/njVRA9poKeOk01qVCUZHqXsTxl6xWNG4FaY6+Mq5FGq+AE51r0Xi6Y+6hqqrYwAT24NTTmMtS76shGjPJcHI\/pPbyo7qvA4HafPl5fcmYdt011eXQfEWGYUy\/W6K3aON7OZBUd3b51HF1oruO16s1hEHMW4tt8Bg169cWxyGyP1Xg+\/ec8BCxXBweTMmYqm+NQG8Pr43L2mKfJkVCr6oVOVb+36zmzx3yZeOTcNR6FPuJE5XIZ3zwZP2fVl20wN\/QQH9j+5YS6VSdUKBGhUmy+MS+3edfvGVeZOPfmHoEZNVdfcD8gv91tdy1Kzb11dtwQ4V3ek+Hmt6\/BBPJrH9Eq+4W1ht1Vsgw0lLV3\/IhBKwHMHYuJ+3mZ6pIz+TJLMXSxPVWes3iRtYpAFUdRpy+HoHXfR1i+B3XW9YdDx7LW\/lU\/PZI1ZAvwJ0O07lawHdMcCbyhC5FxiNdxlf2\/GYDoBnX8cIRG0Dr8VP7zOsTzt8XqDV7fbKk5GsdWF8PwGdsUCL3j2ghqstkof6GGHGeKnUrNHKlBKUrazhR2yk+cqK2qAv3ru+gDfbgZy2kcI4YRqOlWOQpUbfI+87gU5iXyzZSmyCAaaNSpJ2yzdSP7mWNNJ8eUw8bqPDEoN1bZufr9zaqOl+CVy\/2NkvGRU67uG8ss0zBc2x9rEH\/UxIidVjM3xpOVV8NGPTZHn+uph6AWNzfDA6E1ZUD4T+WBc8iBbEb8ROrjvcVYzr\/IXz0tA+0k\/B\/30eO9uoc9U6fWcHvznl1mGQXPQfd4WCQPu1Yg+Mu\/RJw26SeOosjtbyB+33z2Ph1Qjjk2hTX9LrDera0mfncD5FvTmAk0eOgo7mDxfpFMzqgbakvGebU2Z2CPjz+eHmWfOjw5wnlGcbFRLu\/48uUMVOe5d8uUhY0Q+Ye7WbFne3FgFMkZ16Pn\/dyjVqUGyXndNWTucnvaKb+xHXf7\/DuLSx\/uDrewgrXDeSWvYJLf9ZZco875F+6vaZzNPb3izgnp0\/\/8j7rrHXb1a7LxRYcKu6unHKvxYQWd46dHiWDiyF7sx9juunlZQZdAC\/eLcuXnzqjBcuSA45FR8nWKk+cXKd65iJzSkBHHDWuQMTLJlueMfeciRB\/Z8\/bVCfoXbrm9qWx9Ia\/rIFUTelAUTwfQBeuBI3vnahksr+x+quUJ\/Qh1k31Y1zImjjkvtGY5Rnu0azerH9QCI7RS5ngfQhkRueY9\/x37MKJyg30z2mPsxuHGMpWYF2a8sHgjM\/1ZpMpA8\/Nd4+lv17aYsW5+1WHNEcJaXWnLZ6DQBzgaV08GGJeOQ8di\/thDnlZJiDLtiaL1v2SJum2r5dJ5FZqh81ut1+DWeawnoLCZTTzXd9Y9n66WbN2y2fvgVd9gbh0h9WRtIEMqc6NURCTa3HET+q8e\/OKt+9nz3ZvUiO9bU7eCoMfHZ+z+qTis1cTmUJ3BjP9bBdPXDKnaQsQ4X4XWMddmVf1mOxdx7kcumr8eIiOoa2O159f6CnbcALaj6ihJjoLPINNTsaFHZhpKFi9qApUaizzE4eK488WkNRGvfua48Q954+YW07\/xlvk8nskxjnHlI7Cp5+AbG+sI54Hc59SmmAVzxZma7LoGCEggOhNrTWWXF8POToge3rtYzziph8V0LvNx+iJF1Hs5Gd9Z2+1xxqvCj\/smLc3\/0IGrfmtNPBo+VhnEhpo+LpZ3yIfMDNfh7zlDxhVu4G3VORZR60HIF4+qDjgAFYdK2oE5+Bd1pXZBn311378e93zEtmNF\/PeET+96f17uQylnUjo3b\/Yx82m3Yz71vquj1Azvus1a+L1+5xxYjNs9s2ir7AG1b1b+azqvcbevnuvYNu9TGf0kbX7zyY5hN5F911eNlZkTVx6KhrLoeg5r5DCt8b6\/bogZMaQTWL7x52P3y6d+DY2Sw6k04m\/m0AeVFXzsuzXZrz2BA4opkLt2xkGt6mmPFTkVBWWg0P7ZO5AEfv5yA2jRZ70Kfdg8fW+vnmcrCjtHnuNEw6L1Pb61pD7yN1g+nykT2if2cl71dT76lvN1RPhGdZr2rQ\/5nhHSp6s7jnZOhz6CievHXBBOkei+de9luVH4VvJV6fVx86TgbwoNMlA\/8gubwPPTiqJIB+TrjX1fta22VD439\/YHLv0o7PM3O34dH0dokyR2XAzvd\/+5GHwYLmG5R782\/+qrzE7HbuTqNFX\/gOaCIu8qVq3p\/JXMlBHe3J\/6obZxBMUMc9++ul6R52L0D+cP1zD6otX+inPGSTSN5zqDS56CU5t6sx45V2CEC9sz5t1xaoevct4iB1etB9Me8jEWGTa7XaNEFuCQaiC60xgMRRtHYoFTXFS2\/gM7LIbMNHoFTRwAfjkjqhtCs+G8cQocYcx4h3rJI8+QWpFsB\/ascx5xDDwXZ0nV6\/a2GYQ3WbVq3TZWsK9cZf2blb+zN7mk1dReEG\/6DMytdPolE4gpsvWJR30SUX99aj5hFusXoQZheUd2pRfEkypd5rr\/WL+jHPbH2L8Y3Rn4VSLtdJ8dm3pIiPDHQ\/cUiG3plZXIUcpmYKr76XFWl78t9jmBTwvEi3GAoo7HUROLcSkoMf5j1ccW5GM1PSe9oE2TPM45JDFFT6nCMUmfPQ3Z3AmWKpw22uS1VwGUf7Zy+2cUrPt+qq71TXysu+WTWmndgpZvlPMtGqy90UljvrtiZuxiLPFHC1a11g\/olyvgAfhRD7NKzb6r++nEZg9iosdCV1pT6Q+VwJ6NR\/EwB4X3nS7pnOrSGO90ns\/O+V3f1hI4ow5kEfRbVtf7JQOBLukLGj0rRGaHaGqknEq1OUOa4uy8SMez3AaF9tV6k81lyN8oGhc+gdFYURmLRqupjNpYdC231bI58kaJ\/4GnG53fODsg4jX\/ibpNU8ccfRd2EkNFm9Xa+KclEIsG2Sp7WkVfrsXtOJeTYfSlw2t5nnbpP7NbItD8MIhuoCclH3Agv61FVGY1GVdetg+WHvdeDrKd37g1ztmMFSZR4afqaMnY9HmFi27iUcbAL6PojX0HIPvRbxDBr9\/C5Poh6G8MxujU2yKEtle3j+EpR9vVa3IuhCwwQo5ItuD8cUzx2mj32NXv1sSqrJxgltEn9q1bKbNtHZiZTv0AipC48AqVRa7ocVCmgji\/sD474jIajEdkyTXaaqzJ7vYDOB\/1mU+aWhAj3TF9Mh6vqmGIqgt91WWcfg61HTnvykdyDQjwdZ8t6u2lfQZhVvc8ymZS9M+8XeTarpjfytDXQVzGL9YcGywaxW\/vecy1dkQIFYXxyUN+uc6aHKPSWz\/qoVAL1Ip6mJtarehJ6h0\/7AAuiCJ\/wSy\/xVuOOg\/kUUT9OHBzABGjuowHcH\/0m\/H0iPAsqoDbHcN+fFVrcD5SnBhNkWqN2Nvnmoui59maAVXJ\/nxZsdho\/Okp1d\/erbpyVac4fltW6cCtfGBPxVB1JGNcjqxIFLaVujXpRSLRaQ6zVodCpDf7byuD1Pk5D3mJu55Z+Zfd873MoKpIUxbrvHX1xj\/WWkVVg8cI1id4FTn09ZiP18GIW1kh1ocVCfqvdj0CjoatGEsjkdxMwxrBYxR8UnNHzMTxVeCHZcA1v+UDeiFDwTFjRNapyMK4SY9STPd41vhhjZqn\/97tIoWGN4WZ+cyJtdjxsLKd9c\/iz+xe3Lx6EMb4\/iwA3UdVlHv9Fj61cF6+3bgZFU7lNOu59YerKvxH31S66Z2V3ZLQQ10tTec7syO6KvPjqX1\/HQitwxgT7k74jU6i+IsOV0g3a40K9dra1Yk+1hEZyzYZB9dtq4FE9XE+IHEYH4uDGc+a\/47ShZTfXLoYyQpodf25bBRpTu\/pCjlX5fgEnnmx6r+vgMXx1FipJYY\/br8ziv\/N52ZBzcYzNWB2\/lXZYpo+0JeO9+m9HAY6wDK5V0WOj639Imc6q6JNk+oWO7ZGG1cF88NnmfVacfrOvAPvtqbHevLhb89GBZZu\/5\/SEAHdAp506tO45bd7MPo57GvtPh9\/jEdPGF9bbEyob10odW1k6b9IG6f8dqmGdx9VKmNZpa7m6VV6SIXVm2XGM3fARRmMapy\/bIbfq8jvvTmXq83NB53pEQ8xYKtUw1DaWuRuz+W+txJclicPv27smHMu7r93hzR5\/dXG1BB8yRBUJXE1Nt5ppypZNOEBdtVL97\/v3s27PxZ92NZdNzawyFTf+us7iT\/X0My96apWBtMlefMcAK\/kkjSwgStgVBlWuanxSx+5DoTxeo0iRVsNAEdjyCI92d6VbaueDh80U0M+bnaor\/IiPItDxD3BMsSGa87k\/HZ6jiP9Bl+4SusfdpTfjcDAUtytKmHWOZg3\/xnnost6Th69tlY38M7f+QP1Nc4L6YGBojUDQhFeZc4tqGtZaVC\/zu2qFkXQf3QOeeashIqSy61zDqtPbCvNhbM5KK3LdL+Gktn8d+6txQMf7kxqGjTiyTd5UUHCa99PuhIL\/AduCS\/zWd\/ty+Yf\/pbFg1PQoGJ+WXuIeJWOopgPYpx98aq6Al692RwcbGad6al91ogOj\/fX3wSnP\/TEnJIHWSSP3Aol4xU\/SwtrDyHD\/aGfli+3HUf6ADafNlJ9Hf286LzJcEcWlsken2O++mQM4wXy36rqDwyvIyM7RtoxkWFqxvzpHMGoSGU82U6OoXJpP\/96l8G8hpvEt6Cs9S9VTBhlPd2cYdXd9nnvfBL1pJ+wnqcu8CZohBE6B6p72TXb4T2++xSX0PiVFMEXEZ76popWH7qE42I8ED2Tg\/e8CKuOlo\/JAOPgs\/zoIP+Cpbz6Vig3auuSd3VLfvbq3qUNsEC7tk9NgzIZxK0ZCXtO57stseUsMlVA23mH6xqn\/A9NxsB40AKZYuvtA6463rhhP3vI3b\/FRqCVHMFivB7Xm6ur+tqv0yhw3+unc7higOs59G77jFGz+3PPGwP6Nf\/Rx2VxWlsFAeXFrlwP4z1OW801TWmjHqJejZExSyhT7\/mHW1TEiyIzNDXjqwbEiyyktaFzaKUF3WLWUXq0jurLiHAK\/V9LcXnVbHTBrBKPMUORdO98K09eZlbT6KUSHvIepnCJ5SKiqGMkurKFDEWlUC1wAujRTTCvfW5pXvDjzOfXO6KddSW\/2a1+p8zQM5N4NGoXBVj\/9Qsy5vEQkaHOrDWUQcTLksRURTHSy2fHVl6ib2WS8c\/OzL5rScbURWQdUtAl\/7EV\/d8Rm4vVAPVTd5TRdVWssyCjD08wnozt7t5yevj1S2XLrd7tyKtyuAQewev5\/I9yrGKOH9I3q5Y5L4j8tbXKKgbmIFz\/H3oTiikOI\/EuNdSic0Z6VeVcvKlK1AWkyVlWIqiDCWnHutXHyd\/ooOOV3T9eperCkXG0xV2Zwar3M+Pe8QJUzNfM3bY3ja619JzF9AHFX7bHnBn2YlpWoNcie\/1qFMmX8VBxzKt7gZT6eWp63q+MM5YhE\/bO+mjttQe8d57qLzPRDrxMBdlfegvK4AR4wT7PZY7NvnV6mjvOHFq\/beAU2iI9LP5a2Y0Zffn2B\/aiVyJIFyGnin6rKK1ERf0mORAA\/x3DOqoX\/WLASq7L\/21eNkT9+K7K1HIdBzgbd8+7P6yX70Bj5zPZpxpZJspY2uYWEFDmlFN1WKVOqKbA2cJZx\/cKvTERn6Nja67crRKQY3xYUygnnMPQG5EN1mbqH4pgti+DslCxiNBTZkfnK+jBV40Wq+Go7DrGPj\/kvbfPHx0CxKA94Vy1XlCn7fyCFjh+xqszRanqE7amAoJoiR7pcsEa9aMqsq11oaNTQcFUtpeTz9HB\/PIcfYcTv6\/bNjiW5+gffbPFvrJqPCdqlDja1S5Hw43w3s0k5FvGm3mm34OS4fc\/vFpV9LfvfMX1nBbVcXDE8XDB8xdztdQK1fxWE8o7uFV9ShpAZlQbrqhG1VUijpYthiOYUYYom1SDYbhWKo6mLDPvJkJaz5lBdYVKH0WecA442+xfri\/2c3+QeF4idJzF96t0vNTktp4PgnlbKXLAH0\/d+BAFSg8lqy0fZwbNna\/PY5jnHE4EcBZbBj+sE6\/zC9QaKCODMv+rpubiakGWPvcCQqnCa08d1MdRB\/oF2dcapHL15dYj2LVnPMsvVyDwGXTW3VUyRqKa8Z419eW6tlsfjzdP1Be\/IkAUk4XxwVAp0lX0VsK0vZnDWaAPvZokr\/62FsE4I7j2sRl6TM\/JgwxEFvlZTRaJsPwxhlh5MegeeLuX32GpV5ZnbGuF+xKApEUzo4IFSwk4i6oDjhBMoi49UrlgumhVHx6pPqKZ2qBnXBPC7IKcqvcd4W\/LfXdknlXH2k59tp6ABKkCY6g5dLX3ckXPbpznHuTh5bAKKmfpGzb28p6cBRedZ9XplzXHn+QLtljm8Yzltf7CJBuJcVATCBxjJNoFZZE1dI2Hii05FC\/8WEEe+LcqiKpcPKeQV0BwczQUT1u5Dm\/rCelDc1jC6ee0dgcA\/Esx81gfROK0f++y7rj8txrBAXjvNptFPAWYksMhMCPx2yy1Z0yIlI\/Wg52xnEZmbOPZ1eO88JSlEZ1GTbv0C6qTygU\/yp4dza8PzKEYv2OilmHMlcM4oJHqNWuNVtdZyB7zLByn0alW1WWCvxylmjAFQ7tBC\/tY3TwHP+eZfE7\/eAeEuT0cYv2D\/\/WqKLaHaubLQLADdwQxGbf8Jxvt6sX1YaotLhqtajB32ptT7ZwctwDbjs37d5pBpBs\/mWssNIStHnEiVdWpYZ9338WOscobf72arC1\/gZ\/Wfy3+ItnMknuiSxr8XhKcFzXF683OmKO4mLKIIbMEU6mUxIOrceQ073pcpmn021f43SzAFDBUEThmG9\/gRGCJT8Rh37aDexqntbel6fcIDs+d0n780KNwZ6Up4RgSxIb9EwTYLXFJw3NRPdjw+NQArmrOsnW5hWw2F+t51WZ65h5oNe4FhneuSf1bBygcPUqLjSVHbQyTUNC\/Mw9Fnwx2mtHrsaZveZcsme1FcS5EZMOGyWu8eiIiuwypY+HfVutxu9NSZ3zzNY\/RzrHhKMdLaDy9LkbJ6LCAKrYGO3b8fnmB+neW0+jM24M22FyPCTqNN8dJm1z7wGhtV0bq+DsO1vHJFJ+k9\/h+WtRPsecv33qMBvEfLNn9eM659EKu2dw7YIdtZFeqZPFYVOHzzxyjUadXjqUriWvtvbaIMZrx39aXghJaNLLNEFzP7CCIBXu7FkBV4XMdzpP0VOb4985WdagYxnNnHjweXE3dV2DKGYsaGWUtowieOmxtBBeCo3HVDEWuZpcsyhB8UoH7VqyWeV\/1Bcegk6jPB8sMY7FVYa8IPywSp50\/mFoU0e0VY0le2rMxMN\/++bmz4jtzko2Y\/bEiQ92H1xhknq1+0M3pMY8ZU\/rGrHbjbP+Hzh+aqYvWRvdw1osSnWuAlYg8OcRlpF1qVnWH++QDVqlhMiqH36t48uWxucolrNOEMkvuNcgZeea7sCDz6kQnnc5ffxMbHKGfqCDiMvGqodmQgxmnZ6UZu6zsyK17FTXbcOedc8ofN7CR0goVO1xlRO2PWKCqeg5j3EZk6cXU553fSExUirqNxrssk+3HFnJd\/UujDUqnGbiicmT3Xa2odHuV98eCOS6f4fZeaa7MBeh8S0HWBpPM6VP8Bepex0SrDxpq8Zwd3KMiqqRXh2breOU0xWocW\/X4Y4Mhmnb0GqruU1P0kMowB8sa9YJm8N0Baat11a1FyqILLzOrVhOfWp2+Uy3uzx60afvXMjz02KOeQf\/gvcwfTn7v8g1hViRxy\/58V6E4pCbREVsjU7qFffPE+pb8GUUqvNhoRss08FHR8dZp9y3D+3x2cNYtPZc7TsN\/rUZ9P2tfnCsGgD3P371dPTweBKS7jmv4hCmz\/a939C9jr+8qDlo7YuhmIeSk2UUBW1EqjvNw0BT2C2rqLFerzAI4FrgM4rO5dX6e8NevBXAR2yf7mhsyUX4VGeQUbuW8w3HLY9W8V5dI3uE4HHbPrpcNqwodp2iSgXUGcCzsgbZUsZp3EcO2KCVaoEqgrtOrjYAti65x4e5S1ziHj4avuWcYA5TJQ0Pd4pvxrO64Cq844C4C4BHm72GDGzS02om6vn0+j4puHVz3UDPhWuJa59sj5UqGHUfNKcYd685MFwVXG9Oh8Y0c8zKNqjZbYBF25Djc68GeWL3HS2RFxYVT6DUc57vsAb+g\/Y1mt26rz8PQm1Mw8EVt3GNxa1Qb4d\/w1SZWFb61dn4DZnLOPUZ\/vNJxN\/igr5ArOsAoswf8n\/nmuiDG54icNVhFxEVeNoIj5kaQe2PRu2W+bgddP30irldPasbF+NzUcbP+WiYy\/+RFd3aq00PPn7xZ+2Me8kP2z4PxnL7Rc+rYvt78xjuQ6ejQEcdJLD0+USELtkyvT\/\/kGhmiz9dblQOOm\/MEp\/TU\/m5uM58zfZzngtqGYvJI1Yvqh+Ru96nezgDdc1dQbNZV9vS8fO3KHePvsRi7mpDocQXdt+LU6r8IxAWr60SRz1uASPBtPw6\/RM\/aBmO2JBbFOAzBT6PS49k7arF1Y\/TL9FYQZ4mzy\/8Oq41Hc8YXv52OiqdoBf2IBtRD8F6rtbVTDDq\/HWOEZvFlRaVVBp6MjfVLpuUospJ\/dzXi6uW8mlmRR4kFLMb3p9VR3LVnzNDQnIfj6s2vZ+9bAHGW2WYKSxSGvTJrj9MqpO\/cC49sjNfmL+ZLbm5HCFDnqWSFa34g7a6Wsk2x3lVc4rfaHxeWsWCRzkrnzM7Tf3XFTHR7VXPuYArYXMLfqk+ZBR2qFjw7ON0Cy\/QT5etjVPrXGOCjXcbjbKlomgaPXdiiWKqOzh8xt4Dj3vFEw9AFj1pR\/K3Kr3avMuZhGks\/RVkdHo7Z41vTnypwhgcPPeb0OGL2WNM+iTi5Vt6lFXlizLC8giaq+8v1Mj34I7Lncq0h6+62aU7TVrFXO5Dcwr68MkecGHEWH14gkIxXzMOYjuM4Cg8SYcXT5DGs5DurrlUquJSj8F0XTxUSbhCVp5H0ptmvqugdxqC9GxlYgqsaYXxPBzPufCoPytbjVugiVCCr4X1\/Xsp6Yct4QhwLscx1A3KfrA665MDpW\/ikaC0iQOO8Tau73U273IUfp5Tifz1shd5cD0w8TnqPVffV3LRF1iWj4okahLLM9WXdjKA3ZDVRKoe1X1\/mn0rIbm\/eAjbOw9G+nuOwf+PhUcfNcYb+zf0XP3iJTDeiOMgSWNEwdqlHKPPAPR+up\/\/zM7DiqbHaSzx5He7gEbU8P0Xrqwd4rfFn4gsq4ZRpVDPLzKOoBQHk4TBKX12dzVFZvaZKZUv3kBPVsuMd72C3fNF3q2bZOYY5RFwMeG2Oo7GVfeGJ5WmxEWWgndhdTYuHat9HD+IjXxzgLeRoc8edoYHTyIaOZLzFq18O07PoWa8vX833\/tvsSSbIsbkWk+179Hq1C9LKuOMPq+s4X0dDhTDq8vFwCdKXvWF46ogyFznq0c1aQA4o+71bLscKEkmdEJzZoxPtZoWMiiefu66vwoIx+nAaTHyMDitYVw3sMdYnOvQw43TuMgy1j8s6WCcDU73Fv63z35RE5qEUQCDjptbLK22pGjUnAoNZO79351kcy7xOHXrZGFzP5X+5gXkCx5bD+EtErybZirs70oLegxiON1cpT0k7YhgjaLHPw8Lm7VkA9ltbxoVzVkYa1W8SFhV1ffXYaGRGsDWDuLmOP5HLoUER6yRbk9nqYOvjg4ocYTFanEXRXHsrN3lJO\/mUZjGSI21VsRnmfETZPRkay7XmyfM8OBlvPMucr1aorOlcM5wx9YxC+RQc4XlTEWlCJOwKD7Z4zhgcrNVy5+NPRjxPcVUBKsDyoSEI4Ip5Xwcz07uqntVJBVipbPVi8LZk\/DAz+5JuYkTcny7Mq1ErjOC0Ge1hpDpiejmGe6zBEa\/+5Vi3peXmmc9cEb0xZc9Dw\/ubYy4fQwZ9aEzrZFfBw9nrZNuvNpjJVbw4uJHrs9TF7dEa3TUXeoA3MzATRmB6X8YmsjiPuriOhiiYDbUZln29HOuSLfwG+ghahs2tr5On4K6V0EqFCeAN9EmcyC0yiI7v8CUrOwd33y9WGXdirrakVnPNiddo\/apgbNBt5d9izV6N4dbHaRkkxHhB6541Ej2efZ+fn7sdszVCRJJoD2\/j0Isor7sSpvccp82XWi1GT7U6ZBvlY\/fxTztKZZ67kFXvdWtR5wESTjN5RMxkMfRqs51CfS6nPrFXcvQz8J8oVD\/lj9XkP7X91tLM1RCMtqnsjOfi0iNvpCAEtMq331xQWbRF79gjr3GOA01\/ytKti7NpzfJJ3X900ZlARknd4Vs91s0rULqrDXg5\/+EEMsk9Vmdr++gc2yPre7NOn\/sQ\/773oFdInMO2Zq1eXe61RAyoUjNm3R+rXAy+mIKfGWt0sr3d8aNkfp5inoiKfGdLiJS8BA+eO5D5x7PMQqt31iRjO9dz1TbeWw2JmPazr\/EIT2r7IJj3DhXt4dCGZ8tWIbPzRIybMaImuEfqBUaEKfAU6AFRo0fk3+qwZ6COHHzn09SjGSQzsgwzKGeQp5DN7dSNtjhHay9+f3dO7dVP8YtzMftEu+U5ZURXusrJleBNY\/wtqzZ4k9MHuRXdtyqisN0qY2ltudbG9ldNPAYBvRawedCtL65zY0TlzkWfIslu6qBcnaheHaiT6oUsRL3ojsmF3xQCuv5gd3BSQfXVN2vjbn\/Oll3dsY5l7PNejJxjtGJ1gckKnrKggzeJTZEH1qNHq3XUxK0+r3bf3lNl3O5sjhiibFYAyoCiWJHW3DEndaGywOHy+Js\/bB7kuo0Kylh+\/5qdhyo5\/KtN5xusclhYLtQRnjPkEZHgu2PS1ztbtRz8tvncGaVRDA5VlEagYyInVOLpFX2AZccMcFGr\/FibKpPjV20YmF8PvQMIsSGKaASvPNywjpc6DQ56HFYmGKtnonam\/jMXBRX0wlaJjfjhGPT7tuSxamVuxduvd11\/P3aFhRMpr44E1SoIHBocGreimNiWa3IwFCQmDZzbI8YOq8qiX8WeztfLgm5Xi8jnQ0uwxnp1eHXsc8r+4j0tGteXW4eFZpPsqZ7nUqiKqIzOFYH4zmFRis5t9znJJNBrDKy9OXMGtGN\/EZIRwYYwctmCel6IUtIc+f3bk2wsJXFlDDPshHRMPbXheroM8zi5OSDHG\/vXfw6HHrzcwHc0UQ\/kwNoVi2PYIg\/cF4tkcDPqp5ytT1oQa9dixrG5GUrYrcIyKuiy1u32+yqVmaHKpUp\/K5caoZdTKJwh+\/WYY74prDVebM5NMLe8uVWVL86gfdfFrs4\/1XgVSs0XQ4kZVfpmbFTx8TLX6mXbb0anlDhafEFdd1db5pBTNLzH+FKP1YrWIHvSXxzRsQvkBjug7OQL1Wp7OJHxfo\/RPdia\/ae6PQzMwTacXQOVNzdbzRdfxkBellmtW\/eE83qGpFeL7eqeVksG6yeEdo9t5scZ1+9dWStXYv0ek1Iq\/dV6PTQuqrChbjLyVlVjtjVyZ5eNKvc+e45wig77JddTo+ZBXif6p9e8o4e+KjyVPE4cty+v89FFJbjlv7m0VaqK\/xip9atjxvtRt9aQa754aF\/FEWYduyj+RY\/jizo8gmfFVXb9JlgFP2CI41Lx1IyM0jOH1mqP97gdxwlKuw7YPmxmh+KDc\/NCValPn9reFrgjqrPRVW8HEnJl7Hw2nmotbw4yzeb4cLv6QL9gSloa\/zx9WmzGV6qg9aHTuDkkuVLXLn99tIo7hm7e7BfKU\/7aZ7Ib6TFLx+p8ADXqtfSwuLxZbheL6PVU\/fen3BGM287WYdICR4GpnHHCi+gzI7nn1Mpja\/yTupdH84FkkL7LeHAPSpNHIkznCFcRh0TtsRr7zb0g0GXYxKmxeloiXYTtWn9w7R69SmweG3+ckuwGF3N8MjdVLKZkTh7RZuNBBDdrg3\/pr3nslReN9KLacYph9qBuyRRMLDZhImcU6ZfeiTybaz8VAC5Sj9Odqoh7oezRomYhkSoLOx57kqJOG2CuGS9Pt4ftAVlBwVyxcLaqGutewDDIjGKTc2I\/b9AqwXU0e59alI1wLF937wyHMWfC\/fDwcpSKmb6ULXfXZjL3PMhQujqyVsguGVhe5pCbK7FYfJSw0vdszaPx3DkLMtz3xs1EYegBi2MjcAFpDY8Z4yqau1GQLY9KT\/UAx3pW7VA6V\/JGpIIem3wY1jyUxz58AQb7nV+p26IFNXFtCJUonzfvOnGwsUqvVle\/yheg6bnMzdDBs7z\/+IfcAMriEruDAuDr6DFIBn+NanlJzatyrZZBqNsxkjznWrTghXGTm1VamR8Uy5qg0M93eQ4AJexYiVZdFLWAo1plT0nssbjH2ahiRGW4bXzG12zR+7r13OD6UnaGE\/27KmQ\/OazxDz8UleaVfhsfuLvtTEFZA0AFe3+l4Vj1B9nqdPvRz98kPetPq19tFTPo9jxUswcida2nubwHwxxq4Ut4nWz6Db3jze4Fm6lAG5tXqyzPRlfnaB422vH1uQl7IyOo6WoGfn73gsahNBLUwONpGGqzN7BiHbMNyi5rkEniINqpOLV8+tmIUCsXTZBGraouuEiuccqb6lpnImUbKqn9bM9X26vI9I1vN2TfXZPfelo2V\/EyRpHyWE0\/hzMEC\/QHBQINot86QlkWG\/xna7aPPh6yjNofmIG22Hcy3KNsPlBlbzQ7lkrhYq\/7JpO8mhonGvqzm12sImjlMX2PuYr4HaVluJiV1FhzoO65ujN\/f6sFH1+gD0d1G1UcE5ErMzYTi6EeEV4z+6DI3j8eWC0yl4W5xmT4jDHjP3XZeIIpI4jq0Q\/yQhatbrIhv5mj7fM+ufJ17\/Znnps5MTgad+PBwBkKMJRU3fR7zV6PfHd4OOZj3km\/RIxsKIv4\/TWrVfioZJcjcz886043p37ot4NT0FlNK+NRx1wbDRMMzUQQfW5UD\/Gr0\/oMvWSxPddm1kUEVbnqrKJTcxzRCOLEltVF2GqgkuCbzeZkqvEQ7J0x3fVDX8Yq9lYZIIm2DlXgehzeaFqx4Gf3+Fu8yJa5Zlv8hmzntceOyljZsoxAlPgBXbzD0c9j9Ai\/uHk10W+7rYpQ3ejbza3kLzDSiipCE0CquB5xNUb\/0yZ552gqHChINtDTVhyYYMvVmPV2VX\/K+VzAItgc4ObKfkYQ5dxsoArfyK7adw6GGn8Z5BFsPiextTf4QS+ipjF7omZdtx2vdQUXV2NM6kFXL+aE+MjoHhX00hd5z56hq1Q6XKBaPpYqryId6w0VtRm\/vhfsqcBi5zS3kX31S+WQEXslX79RbkWFPBAZrnVKP\/h+K9U+SNIzgFYw0B59qgB00NepasdCPqn9eehXS83I75f1erCuqliPxNgq4doCPp0hCq5PVjO8r2OxqtIPVllhNz1OfTgjWo+JNi5iPnFa0jYKjr5fRFEVKE\/Vad9CmOiWRcfAKhAoEk9fFeB7y8YuvUO96vlaz1mr34v9rOLH+c5KAYNSbNzSPnUbdNcD8C93pUtB0OvHs8vsQ24TR\/yZdZbvOsZxef14c\/5mwnhNMk8tMF6rAB4lwh9d+jWInrqlUXqfV+g+xer68tdjUg\/ggsyN\/y4OwSufUO53uuqEwGeQd5lp7y+YbVl3CkeBI2p0atlqeMy0Sv6Xo63b893pJ8hRpVAmmRcOvioY6y32rK0e\/hw\/VTE2bR\/bux0LvsE1DcMw7DhDncTnjV+GFZwBd4tsx3O1zH\/Abq5c51sjVfBEDjdD+4k1VQxCRJD6RF303vVgaFhaj1tEx7aoNL3lji58uix9OC9IXMX7lEdNyeg+OrdVr\/I6M9g6u2F6PLYaBd1mhjj1XNjH3cmZeELipXsCYYzADIMPt4LFxCX1AvOxF9EDO9uneaRGiTiZ7jPYtboJM5nnO6Z4vU9TEkdaVVlgRSvOe7Tdq3f+0fgcinmFFu+TDju39OJJLYPsHJnzmePYP3Enr7aqCzaqxz9yA3G6iOufOR65sP7sgX15PmXx\/1YPamHrdxQx\/qlgtGuZdyaRQfndkl9ukyeJvx7EXpplNAnHIf9y71ywr5IQ0bUJFqkgEbMxiBnj6nkgZtO6HhGQGhJNW4162vl6OFeBXjJ3Sm\/PH10O8yjXz3vdjNEkz\/m5GoBxwOd\/\/gML3A9bXkVGPy7\/ssSYsJw\/Nh66OSulA1qNjY0nb4kGStrZOpHr75SPZ9R\/t8UjTa+IppFIJMHs4\/\/O4PEVIbEouHeBhp\/SfBUVTguO78qDckxAASfw73024RByKgNPUfdZJ+5eZaq0xb1A9XqXCaI6LLUPKMvlbB5iernZMriBXT5xouqnPOiU12mA1fqc3T2Xxx3179\/5587P6jmncI\/\/1rP1A50kQ7nuYUynt0vuOyGhsualGyHyvxmusxHaKYr0B1OGZlVnqqMnzuATnqOmvEtM2vAeNtnKe5VlG+537d4i7PHEcMTras9Yv0wHUlQC8Db1yLvNndeyyYDw8XwdY+xqmlp0Va1u+EpVp1lFy9f3zjv05HMlm9XpYG5kjPWiVU3bdU3yJD2FAWQ+54o70nMDeoR5qtZcs5wRrpZ1bOPexHKVmyMM9YkDWt5v9ZpPHp7by\/odItqra6b8uCl0unhN5Lf6CjZuRgCm5uM+XA8bH6+vFTR+HvVcBi6gHpm5Oa5geq7G6EHE5VgXnmmlDsvOcRbtxe4xvHx9Po2swNUqgJHUQeDn1HURA2cOQx3By295ryxV9TuMzfn+XnbNqyPfPGa834zyeBXxe9S7GDWfXKvVq7bCBONj7kRwV2aXI1xrLSt87meWvcvTZarb7vf6rn9pwI3qaZzZR91fz38Dp6Snps4GUI1xEWM3o+eIqN\/DzKsCqrgVCh+LOOobrIMa2a88uJrx2l2OWZ4Y402tf1vmWzR7j8qSKsxM7eRYl5m2xUiG11ZR1XHobVWBnFMjjoxvc9ZxjxgfszZcUkc0tXszO86soXfTJZmj+ty4g1BmKUPZvNG0b1wl8okcvCr76Z9gK2pt7DZ++DI8FYfbWA0Tk3m25wE3l2xku3KHj4I9cENy+PGLuTfDOJoxYvN9czBmnfTVO+qd086rfvuYc0FHdnXNK\/RF1L1M9tynbKcLIK4twqH0+Y2N6XnPocT5FeMglomhd35VTXhHfdZb6sLgV1D1tvOslT637E1P8RdkSMy6v5VFT8am7AqS8IZzYNS3dTytWSYb77cK8Xv02IHRviqpHiWXXh28mfW4g\/pKLT3Hwryre9HDVkxbXN32rDAxnSPYqDfi6afcI4uR39QQusRI4YDpyjLcVh\/60mPukaf64zPBglr2nclsjoJb2bHmdY95Oo\/uqDs2HS45GlrGgVedrje8OfiqOdvvqoqOHp\/QujnFdZ0Vzns1RHzgpk\/uy9+fNeGbuXVtQtfA0VZH5OzXth7flRrm2h+26ijldWchieXiOU1sVTTv9KZWteoLXvIumC9SFsv2CX1qJokCe9ECHquvFV2uWIhqVkYukjuGzmWtNAtPu6ns9mreiephlIwApwSO5DTdDoh8ulP1sab\/X7bOLUlyLIexK+pFtE2ajdX\/7H8tI+LgkNezK6oywh\/SfZAggCvJ5XqVVnKZf1A47RF\/HrkWrtKAbD7l0Ajw3U06btWL+ne81xqqQRZSj1ROY0d+eqxK1x6lwBuURb+\/vXJJLkuciIERMi9FSjGaLKRFepcX6xvCdOvnwWy2evkd7OT62kFolJWt9INwXTh+VV8OkC1RaFvv2qSmzJUYsxY96GOxlxDiGXCSZaO6meC37AD\/oK2JruzcsxhEtwzfWKNPcGSIKceZcXy\/\/031WzHsRUz4rDi5cwaq1t4pJnUWJMDNxQGxNKdzHxkrDP47lJJJtn2VV79UNkrVMArV81DAfkFmj6\/YKtU1besd2AtM3beSgiOO66EL1+I89n7T3zuPHl400JZqRB7DJPMTv9NKb22EjWEqcpozALjxxHAUMJkIK1KGz6jKKioYtSte+UsV8A4\/sLlHOeWbvllMfDw96S5DwZiuMM9vXM1RV9RbGTKrAfitPJc7alJbGUe4PNVd1PO8nmFVHA0BXWVoj2skh\/ZK9s0co\/C8odmeHfDZRDzxbe\/luayvBi6pMY2gmawaLvcEP\/I2iM6UyrvMz+vIiuvOOfct2xgFl9RqV2M0zL0gwAnViR5sTXfFoRLIcGH3cDBbT3Jo4blWie80KLdFoRKLVGVRfBVK7Jkv8ycjbX8zZJUZOvWNyJy\/4BHjpWbru+ulr4fz+N\/+xfCs1NpiWAQGPwZVETMKfUJwxH7liTDmstS2jSaiCPA72VG9wgpFr9pAS7PnjDIzwgMM50zMMsrqb\/WCOJJfZm9vtMrRQ9g6jQURM3WvLv0\/uXc8xxn5me05f537JQRAc\/yxLJAct9KSQfrhLHQ18HE5qPtVNUoKq6FiIK+ArHfj+66sVjFk5csQah2fybx\/4IEjjHAomYatYeF5hW9JkMf7bjCZ7Rjn7FPWqUcpcskWdeKVJHq+vlMfBb6oirJCjk1xxKzYS5rYMkjotyJynPx7pRmcR6nAyeOPf2LcoOSO2SQvAXvuQwsLzLippd6Bcp6xXkC9YBquSaCyzJDHkol3c9\/PHaFFQXoZFgXRDzWfMOeXBY\/1qitcA8ZZEr2\/mm6NLYsEhWSPf3CLDK6mMUZ8TRkiFfW6tXJIMl+kLg7LuUHwtQ0nTJfBSq5Jope6F0aDNsmb4I+aLh9bU8wBdeW1uruqLd+cnfcZeVADztMn1RcE5Vv95vOicQv0B7f1KI\/jLBernsTuquFlW97JVXrpKd7Ryk3rzCqz3nf0TBzfogU+OdErLlebZgaNlEc94MzO1fat4DJ+Yos3mVnUZ0xEUnn0Ob97v57OcPOfmCVV8EfdxtSCM5wthquTyVRMeTgqLCrIR6MUTM4rZp+slX9aNRODqnezSPZFAXnltde3iI9yVHFJbkXvqSI5JGpWya++zmxc5xCHYjnWg6riN89Q3bQbtFdDg1hrPyjHfqRKXBn2ffzCOiLGBcfc2KhJdSpjmBFUD8XjurCMyxGDeuZBy8QwxSL\/jVaVQa7iOns+k1mvR57JKdHUFdWd4UapMupt3V8ZPedH4FxzQa7DSZxHWXfUOLK+rnbimvQ5jEfWJAtyNPM1786+PBMcMgKqEUZDc+BH3tFbNWbtAXzRO\/o8+smaRlx6ZAZUyShuce0\/Hir5YXa8f160cc\/cW33dLo4ntbic2tXKi6fMlcqleluVIB3OmvjDj7ggAkGMWqHh1dke1MOr1BRooJfwYjNDrZhvYq5+9HhOa7bZmP5nizhnsAavifVkf108elN\/0neufowj2TLX9V0bb2qQ67lBo2shH6d2qh1xhmUEt6SuTrlOJRdTQQH49Ooq+pWZLvPESD8o71WXmqtUV\/IjVzDX5ROGnjElB1k93T0kZC\/dwvrGoKP55Tg4NZts42KLuc7oMITaoPeNd\/ngRpXsFa31YcFiOK1S0W8OicbMm6lPnHXcP+wVna3aXtbCI8vl+l0coVUbXGWcVr5Ob4\/ctQ5nzqD0z587fiPnWKnyZ57X1bX9UO3gV51q5Zen5HWZi3GWEWceiWeRQeVmZIcZMUW863J6HSjOHZwQY\/ZjvFYVCICtiRwVNeCirnPdxRdq1wDUDzq7e7QTxu+W5HpVs7hGlVJDOBeUebiormqeZ9+qgVx8Ncao68FgyuxbdS5O5F3Z1CpFFcEqCvQ4s8xKhFURGA3zztbkBXbjX\/lQPq0Oll2z9CAqIJe2nE\/m+3Bc0Y3zm4yUZR01KvzcQ3dbe11Oo9Icijy0D940T0EY8cSrxMmHNX5yIPrgsmYpEYHT1Sw5Hh5kO9gKtQCFYFPXkwopCnEQiemuReoRmHlfByOL\/HopK6bsl3lRf1TA9c\/zqluuWMQjuxX93J51eYk2Onx+ZGp\/7uc2U2BdMzyWdWtM\/QwVZfUYRHguR85SuFG+fgvOuGLWpFRBhjnbsVLlmoXvFbfPdQsz0v0W03rS1xWRla3HcgtOnr05lqgmOTc0XfZYLc3ofG9CDx+cx5FxYB3rxuga9WLm2xgOgMOMub3Wk+s+61fAb13JxL2sUBeS0fQ1azQVC97hPSp99CfuNRgpXrsFq4FkIIAlI\/zH3oOFXQPNFq2IQz2xQGdINxK06HAU2bNVkpHoPdU4vYfzok165LXtJflW25b7huurtpN5vTki4R5wuH1nRM0udZg5fL3yibe5c34ZnB3rA2FSvCC+EYSgEkjGzcsWk5n0zWqOcRBhmFataBDBSyrJyjwsE5Frw5rmsybhpozPuiD\/51gzSOaT74yWK4mV7OZenT07VWlxLGzN6+WjxEMUrh4nrjAI6gPXcKyAbDIa1Is2JmJEukdh4s\/X6fS4JU6ZdsV6M5mxcsZGf9OZUl\/xhejX\/JjJRI73G2OeMxIrI7Mpk52Kdi7VTtxTGQWcZE1BfdMn2IZL+B3cpYqodHwFUb5tprpVCnUmkRjEDwK\/x7mvUFl7eJkrvO763H6KZZh8\/mWLFEGPZpY64lph+IQmjJ3NRmfynke9mBd6DDvkeSYyYzkfkmijxrBHqmajGjzIP9RX6r4InUfLdjNZcYLnao\/sF00D46t9KOYzvmSDLeQbFZ7aJlNxE8lXMlQ0d9ZeM7B8\/HoH8v3tO6Nbxri6MGpUPfySXopqXDhjI3ZFR3hI5UE3xJZsB7\/1PP\/yju++Psf6B2d6QhkB5aVO0AfVnJqXl26UKHB1hc\/vBV3VvrSSqEw+wAP88Y0WMCYGcUGn0jzmCgUdGHi0UmEO86LjYYw3L2J57Mm7ViQcCypPlcERaPBMec6mpC5Y58GH8SBlyeD1e8xVgvETwWSjE82gnuBBmJstZVky+7JUcMlnwzLKeZ7YFe3E59ilcUsrZN\/Zk+lXcYmr2CJGqcDErNWavVSy46erIfahJyPPPH22alGNrSIG+XC7aIMTyc5VsnEjVlS0o9U3qMnGdOcP77Smpioz42ALhFpPzU36VkuJHv\/kfRAGk1TXk0kr49wPUWNEoI6KFh2\/71rh9HPxLILjwLmyERyEqxPAAUMdy0QmPDD1FKj5WVYKdM4e5tF9YmP2hjr8fusIVM8kBnlpCXWYKuinY78wUA\/RHFD6dcr47i4R683qK4rvRPU4G086s4rSzN8sFuKPgsyu3BGwRnyvEEyt4WCpJ1g4XFQVuWpI7tMmfJTxPpx1efJR3EsqGOZKgILcIDGIwHe0umXr1EW5kcegRm1BuaquqYc4JrZTWXe\/cLxxAIH0Sx0fw8JN+aaobxMZo7zUcQaFnbscdLwpA1D9zH65MtVA31SiDgHSzPirbrDf1ngqnfbIh+P3FabC3mBCZzJB7n2h4ZuLWscDD6E\/RAR2M5ryyjHj5ZQ9\/Sf7MLfEoi3ZKvy\/7par3co0QURaQxG+EaXuvhEH3dw5MjpSR8b6eKKHNcnc4OsyneyKduhVZqJ1LYlYsAb6T3XrQ1MRwWryxbhAFLFmxCENWHHqxFemVz6vYHSPy05VxOycfSYP+qO74ghEFdPBP2iFPyfOIrpzaG2jp5l9MESvnIUHcTqCOsKMvkj5NgXv5xeA9OpxKzvKXE8CTqM+1ew3xqcH4sZ7SIM47wPCM+Z83Hf8rpM6bSVuaoA1IqYz5+LL2gp\/9YrLMsiyCpPu0Zucy8q9TameOJquDOaVsHzPUyT3MAIzUMcuQ1Qw9SpXZrvUJ+\/u56WJah2d\/lBmcZbsQ9xlGHKtmwB30wtXIMi9r58FY0SQPdVxzsWbC3rvdmWtznR9\/9XFaYy1nVqBB+q2cAeNRSNG5Kgd1zuMzDzKhXpbUFvctYr8nrbgv35jmtgVVB4bv3MpVNpsxRmc9zN69Rbfq9znQV1NTutWiM\/\/rhZOAcSHvhGO3LjWz3FlAxxpZbFlqjcV3TpLXOCrIitVj765\/ox21b3VUYbHere2oOhFJ6Oc14hAFTtpQBnzt6rDMRycBr7C9XzQU+5kPOyXMy1l4RkZVxbLq9UrlDJXYMzfYVg0WCfB33frMlDXLWI65+XLTtGn\/OhxDvl3dSt3vbemeDQxIhpExW8ePv1jNDLBYedQTiyto6szog06pxW+A1t\/BjNzx3v5kTb1Gc7GFdtxgvdYMqN1Prs3le8nfuZeELQBK4jki6ssZjVRL\/Z7\/Hzx5Tqr2Y5vEqgLSnUZe6It5xMlR2G9g7rX+TsGe7+6IzrJGf5g13eZbFqHdWXK42DfndqDqV91qcOrOrmX1IgHwHeq587qPCHxIL5oNH\/B2Hmr4ydzwecgD7k+Mlrmok6k6237gvGaLSJQXP8iy7yfSskAajLRTfS+0fO5mZlDrlunrusMqOCwVV9LvX6bhNVxVVPhGcoeV8p7qAXfUS9z4BJdRVBN4o\/4OTIfn5\/gPRB0HFL9yBhoAZSKTfvgVWIo+xdjST9VavVXSycqzKMrj9msmW8EfUYb\/itC6xTIlezyjs+5tz\/mFpaAKbyeThS\/zHD3t3tZoeu2rpdgS+rkZRse77rx6yp5yb9ErnNGGdwblTmNvNbNI5h0BsP57E\/mPK76an+Up7juCJtJ74ZVjop+zJizPsn4RhKzfp5Xnvxtf8m0uJGBZSfmIp8Z8ZsB7ztj3yezVqysRo2CLFAlT7k12DqsU8nyjKz9+gr16829tW1GWeHQh9\/Aw0hnZLDNzDB3roItgV8iJv5bTdHogWmQUa5eZ1CXb9vONChdJ0u8qpJFkfeUHSDigIZTurbP30VZ6g00MFbXP66Pqr6ZsRXXDHZlNa0Frziwdc2MCSSr\/qofzucyr66YnZkhmZMh2EJvBd\/cePQC71YghWzwc1UJr\/v8vAO01GylrswYexzODm33ml6DMduzWkCNqo0qi9s2UxmrTEw1MPIbq4zFVsSeLVXC1GtWlmgHyFPVcoUJvgvuUyG+I2J8G5v\/eTwvd1dLRtAVK2x1Hoa+HtAi2Ie9OOK3bc964\/3OmFkZIiMoVbQvfU4rccrpH5zNYz7jXdSlL1hzz1yCnHqFabf4zgrnIkPLvC8iX02bV505a0xyiy5cPuGRVFBGNRHIK3jy5Gnqg2PtSwl5AOob3WzHeoAcJbdq7VZuq27G0eoXB4yPM7mgDEeXappRjd\/KUt1PIx1LuELJuxkXTjB5ac28SFT7rcf5dBeMI2KpPpgaVJ7n55s65vX5vIVMDEfD6jAElXQ1Lpb9a92RE\/YOMrpC0OHMmO5zW3IOHnGwMnWS7KU\/PyVi1YuK1z0xb1lpWsmMkj2QVd1PJjnudRxnxf7yRr3lruircrt3UG1UysqgDmfcyOe4QWKuOuTIMFWAeyYCVC57HcujbvNZAaLc+Idx7l4l74wHU5vf7lPkwNVfP7m\/4fciPQYZVWSEvHHrHNCv4iHjC47RTNRnx5Z7RNVHhVsSZ4445fzCVE450pzoG2CAVDZHltx\/dZHPu5BdfpdzN8\/B6IxQIntWJiLZOveqgl8PXOx8Y\/R7eayU2W4\/5TGT7kpWX1gt0dOt\/5srpsJDOTLsX4oLxgOM5AbGDnOh2OFZzuvPiIg5fXKfLLSgiEoV0PKsXeY3TDDRLE\/XX+gLqkDlXlZExqSMnEr2KgvQS4U93D\/RSP4cDzhmbOB6z6eQXY7+zMzVurAFR2RSX9mfvhaBcX4FMhX+tZX75uyRzgkPGMr+WasGXSAxg6RB9+T7RAB8196odaKSHayKHn8HrYn13Nns269M3XUEY5a3h8G7lrT+GwMZiTlxnUCymfZlNq8Syef8Ul\/VttYUbqBHqrziJiOacxC9SigalPjKTlWU5KlMifOcrbpqaUbgP91kMFV0gQZi4eNGK\/skDrDftwXH0OqUe5QCfgG1raLwEXuCm84O5yF6yqBGI\/NKblkdgTr\/NUZVo63qYB2tco5Fa15\/0SvbMBaiXXzpbII23UnUZ9GrWnROnOlirVC81iUW63BZYwJzlBeyT9C1rmy5iCqcEYJb5wK+jDItTzvc\/xjErRrBFI0\/SoguWQdyh6+zBVU5GLAuYSqimxxX8ZKoIqZJyxan4bZkW6mNVEWvM51tYc3oT+9UmOznnoXfo9z3afoehIKLXJ\/qZzVlgvBy8OJ3v0XTem3\/MUu4Rq6t9rfOAwScKH9RGXWKunA1Mltxt1qdF3Uuc4t9XpFFb+94yVQxEb\/Y11nABj9rEXQEJgY14QFg3MygGF5nnLglm3rGtPmwg+N9K4tZUd84lmBrjz1l7OXUYDpKB09kKFmlgM0oEyjH01AReI\/oGfpA1ImE9cpjRvMiWNc\/tSfCBz2o86nGBH52rntLT3ktmnK1tW4yyM4cqs5BVVd5ZebigTXWOIjwPJpfTm\/kyi0cFUBp4UhRBGKIHREYTJn\/ddWJII4NPpx5qxRwq6sHatk63faX3aumUF4yLHNR19mTzKO7aa\/VV62HZdpS5jZjkVvI82UBhxWeyxz9nOL173kyOITcy0KHwNOlOomMgJjJTqAWrzU9cpSRV7tdUCmv+loz+cx4xlr+K5MTLTkRZoOjwah+ffHaOsXFyR3FQSs4xUv1qMWpY9tD9Rx7Mw4A1K7yQaL+tcPZJiqvVd5KprbUeD3aqjkik1xWIasFF72LJGO67W+9Qw9E57IDDv1nbu3nVFvkH\/fKCcRElnzvKEC7rcC5fmN8w4yujikZgqV1MGEa+Sozpg5jHo0IVVQ\/ONGEX4zsuFXPy89++NZbH5DPsG85pAx\/nA6anrhPHcfrorKuvIgeMRV3M1rPfehgZelXNdQPZ6xHO6\/H+iX\/4S3ruNbB1j\/DKymsMqwOHvYXc6z4u0qscycDuSrOmkG\/WnG4+rkLxkRwokm8Jxc8jlrMY6SuK6hWVrixGp72iaw+dDga7JRj8z45bwVn9g8L5BoasFDtSn2DotRX1jxwp73BLLcOCv4Za\/ZVheEKlA6GRWN9bl0w74nn1S285LUax8\/WHWMzG9PpVVfUMh6pKoyDWGeIbk60WJf42XkqJ4js8YJXi+Eb4\/ngMzkCyVWZh9fgn2TFcyKslMsqjBzutLbTjt4tKAM\/Xfk0n81iR8X8jpESZTSAvNStnGdFl17towWqSsyg4OQQNJDn2xOG1D25LrEeVQmYFO\/HXckcq9XVisk6Q0wXK9n6+tRdEHdmoHdT26lVIxJvkxxYPfMKvA0jWjVbJ9U6Rr3ry\/SID4DDOtJkX0dCa6rdRc244giJQFUHNOYqV7JcpqaezzeC23lenJInzrpRybA5axkYn+fEUIeVLT8O8iryndKsI74mPe7OsRwZn1XJhK2Vgl\/tyg2s66R0NB7ZpNb4Lj+cosqTSBT9IcXOMZjzipQeBSarZdTOOPPGDxcR0bd6N2KsMwO3aj0jQg1BB5WPJmVUnNBAOzhf1WqXxWi\/NRLkUtE9vjQRKTKYcfilV9DXjDR3b3UlW\/CmI+uxJFnYCrKCQaorC+oUhMmTJaJWlzWm45BBrAfUxWz6zLpmrPZpPdPmr0usv3wq7dXmQ0k26AqCNtJ\/\/VAj14DJHczy\/U4g2Wgz0tUt42U+HhcFF4eHVmyyvK4A5q6SBR1dm8AUs3ePdDb21LuKpetKFXUlgt5alWLxu+fzH793wLvc1+ngAvZ7hOPHPjzmMyA5IePKxLujUEN4tQHnVO18kyxmNhA11nV\/MAQ8uSNa5jdGwypkAgXFlxBF1fG8QmqlbiNVf6u6ZkP2NQvuURSLgc2dqolOoeDmQd+8CJ2ZJOPlzzCpbEkL\/MDwYQwUYuaFx6lmwbL2ru8yn3iCureqQ\/m16t8POegvYIC27yhS61Usv52H0ZVtXxeZaMIxO4MeVdh6jwpdxEDkq\/HO3oqFb1XUv3lBlUf\/YR965zwcGTnnIPfMq7MFI7HeZQzHCIKsUltWwaI25XSOCFzl0rI+GhbPSIJLsgYfJ1J5Z4\/wsmZJXKj+96+jNWplbqK43l9WZ1TttyM8Ni6R4xoWteAgtRHdi65\/D74RpQypexCeu3BNxj\/tyBnJQVE0Sk\/WmMYZUHbVqB4H0EFZKeYMPPvdcnETiZ1VqU+nfdTkqoFc4C2Y\/SlWfW2Op8xxzhlyLg7Kp0LDTznmj7\/gSGhYLdOCMcI137OZPY\/8DFGPkbLnuhSvGWj7RYMq7apmioH5VK3Czo1kXpvrBYYT8BqghxGR1UQi3Bt0daXtiif1\/W3FvWLAJ\/WWqVWr66ySZ\/JflNbByYdw2rJBXfi96reeWHMzK1Z26c0VysxiHOZkzzsgfHHj81PzzW\/JRLJElRGTjJfK4Tmuouct6hwng+OpI+K0OI\/NGt\/HA8ybxfYWh5Vo6SRxjNQCj85VWNPEHeTCIWoJ6gsfE\/e7piyVkXkNeYG7VvJzVAOnyohkC6j5NI\/ZzgCazVSNo0HtkvceSwx2UultO1tkdqkomIOzlqk74j\/BdE\/ON0ZrmAfVxnen6\/SJybZQdYhv8YzMMEeyhw\/vPQKmT0ZRbgdt8+qM0oovB6g\/sBY5yHwGPcvO5VkyWW4j\/tREIELL8hgjgk3CboKvqwzrzZXd1p5Ot0fDyEW5nZGFt+RKMQMHMgaO2FJnvl9mzqRAQ0eV\/Eywe2\/kMAAVQiT9URPJi2g+bq0wzWzh\/EdDVY3z1PAyFREEp8ZPwZkNbCeHiwidKbzgOGEeLGGiujzE2ufrY49W+bmdHFspb8wuPZ5VVsdA5xhhXhlWyL++5qfOslUqdY4x+jnmjqaj4F6L4IsMEOOq5vcmrhZHyvhTe92OjEFL4Jmo4EPoy3wX6V1t83pdDa1kVuFLuhze+YudXodzWgCaGCGaoQ9CocUGlaaDKydU\/YlBHMGDM7gqsypDo5gzvHpkcMpoM39iVFdR\/8GoXm1HtdYbN\/LMqU4yDGSbjh0+Zn7E2d+gv54kcyaj1Zi48PRaxhHn3sO18yknHVfN9v0ePL69OH2qDTAUbTKiiVjWbH2l0StvRSFIdtqgH2YxI2UGZunRprTJdStgp\/VWFjLj1Bejm0zACowKHQTf6Of8wwG2AjIuFKD\/4Xx6jOrllVazHrgMzDeC6nnTM9ozqGqFqSbFSvkMpas2JVrkPCvgrAly\/VhcDFoJohr77xnVHBxn7tBU2si+VOtU1fTCyMrcjSYjgmHxSgwZHX\/QVgVOZCbK1Xeut0jNsD7m+vRzP\/NO2Ws+r+zn0mewYTTQhD6V7VNP9Rqcj14mwhOvroK4MRLZO1EKM35N3L+wuv2Vt9BU8EsN43PUA3Fo7ahAVYpVd7BmjSYH4RdUIN9cWPSXH5KjyU\/GKmtWBwOjda3mkNarveVukQKLM\/ZnLHJwcb7cFRThk1RzVjZgHk+Wv+bFmkovcqNzsS0iXBRWgOOpgkvyN9tQ69WHtiyrAj3ZL8xZMBKpZjp\/zZT+wNdAN7F5WwPUOL3y5NYakVBNQAIjpJ3lZ2IXrQlCH+ZghSd3T\/So0q3FVHFmkLMjmdm8xqvbo04j1fANtVdjMPtyBZFhlEFS2lSfwAERb8bgkYy4jCs3dozVu6D\/Zu8YZ3wdbaILu9cZBLCvLjFLfRkxQHfzuo8SraxIm1d6i9LknfjyVJl+9ol9HZu4J86rB5194lSFFFtkebdPpREXHFtZITXAnHOHz6LW9rZOqmjEjT7gYbKaHC6plk\/h2plllbMaNWcJumqD7YrZ7T04pGqjCuYiz1vT4V22gF9Qh14HGFSA9kS6GKo\/ArH93cpLNjIreezUgrjABOQRJkocU0841q4L+\/1REeFsCc\/It3DX+VHcE6+cusuBRUVa4ZtX8BOqYVZHXfvTl5VMVkN5iVAz32p5Z1MXmYiRRri2881z0Q7+WnFhSfOvhtZ71udYpXMcb2tqNYWKoRbnOytBw6y6+f5q8OF9iuGdcMlq7Qyy\/r81r0Ot3teMxV1ViZibs1tHG25Mbsjbjk1eZ7RwPatp+bQxDnQcGyYLJenxp+kfrOTsFOiMkqZ+dAd3le\/MrugKh8R1wDvB7zl1xgvOwJMsgRMq68Rfpdr5G5bgNb\/vvef1gzIRSRXSBkwFM9aFwCtlowiKrFmNKkc3Yji1V3vk8Iy5sVjujb5RcYNDzpmA7LA97ju6dHzNOK0q1Ty5I3GoCjjo+vucOYzED\/FUDWcvP5nJVkE4zmS2TUaXf4xUeRa2pULJ0PXTPE+FbyUuS6XGiQKRnhGtwqMk5VL0ysoXBcaQeZgheFMnAasTtfNYuoJEggoQG\/io4IB8WjfD21St6m1tEf3Vl\/Qk\/8E7MhMMTk7nn5UH\/nnWR+WTlnrGp1qrb7RazeicoyVU6dxZlJ5iL1CCMlB6m8\/e\/+c\/88rMa7jq+9qQfB86\/4qdiUOQF9SUR0APuss91cqRZU9nCtYYglWswhLpahLuipzX4RBTfhK1yTNsNHfHzx7oQLb7BlDRbxxzvdjwX1aOfKNLvqEm7XaE4SjufjBbTbuoNAwGC04lwg14zcxmFchsok65Ew8Z8AhQ9+JMZe\/Ptffl5WjR\/Oe9IXmWeXYFDD+DI6LeKGWr2ZO4TPvnIjjK3DO0+93nCMIvB3c1801AFZZr9EboBOgkAs0S6sUavSxMZHFSw2wwFjkk46IFnqJy12uVb6IfzcXOPOOzrdRR\/NRy52JFJhoGW2eRrJElNF\/eGeigWrATswW5\/PA6kQ8m4GWOcvBKcEJ+etVERwtm4CgUscqVR6wSUKhjb1e28ng90zJlsVjFnUglAyn+yS2559ui48hnziK2Ksj8IwRhF+qja4SO\/eYuy+uTyG\/3mdk7v\/wlR8SXR1Y\/2Zbx2EIO6PehBlNkg9yB\/VW+9Z1w6HAQV6iUIcs41dfh1tazWpNRZczPUXe0vy5pGZmKqA+Au50bj3z3EMJs76qe+pPwH2MJ1lYnyPzgGLct07fagii2EJOu+WBkEjhIn4zgBy7uKg1ZQY9gNhSVWp1XRwUGz6OJWXVMPMpAHWM+n1\/erR+jhcE8TD0xDtYSgjqAnk3z7GZiEJzOoMcGEJUpbbkD1p9X\/OzXnh3d\/a6VOslpYzkxj2TXvMNVItRHFo+5errHvdblzjnBfgoJfwovJLoeW7VKiDwOHwTcqghXAZLCHq2zYx0yxf5s7TawHLVR5U3W5qWyTPRsIrAZiDwGk8mn9Tz7cSS4TNy8DytwJ8qcu2sVdv8ZL63RYpm6DmXrEaxWPVsP9V\/l08nifDqZ2qlWRgusndqDagro1E2DTNlaH7VcBI7ANR476sRaZsbheHmULIRT6F+ve+z6Vpj1wV0p4KzGKZmRr62sslW5opXw\/fFeU75P\/uGu+p34l\/OR51VBHBF5ZjO4fH42klkPOh71K\/MIiqck0S3YdAIASp7IZW573AAPCUrCTRnpcnOZOxhQ18EwbCdrET\/6TiUZ\/WYPDmoeRHT1OKyWSiBex8jkkDxSYb+67Sei6sA33+dFUSMY2x9rUoxQvZu17Y+9ziNQ6dase8AHIvYwQjyImfpiFOWMOC1iuZHkPe6OH4QP4z5Icj6iHxQ3vvWw+LdgCldWHuKZ+kPedYBRo2YAHStrJX7WK6NjHzAWnYHd6y\/g0iF2OB9OqDJ+wBjOzbUSYA5tGIcZDJFvokf+7w4LrMhIFyzQs1AZSSLy\/b1PyYED5tv3W5nrwOOdxl9HLhNuNAHPa\/5gZZhKFFJhsn3mQtRT63xmZ9rIbGSrZDR7TgzTvvpAhOaCFWqIXCV7kwu0ClVN1MA045pVEEqWTjmyl5iaZSO6UU0mpw0+q85MZb2LGoiuiy+viCKdkmygqwobJOLc70c8tZ+MW0d8Xuq5RiXRwh2onGCQiMBRoBXWrCuSf+JIGd3LXOaB+M5Gl1W5DJ7C51tFcZHl1VTCat2vujcTjz+zVq5i5BpHRizB7+pWoehz12\/JrecLBkP4vUENK8EZGavSvjbh+mY0Y+eID6spNGwevfErjxwKqDYiDhsZabAH2ok0dS6WLxL37ThwMZ+F\/Dtuzr2R77EQGRrvYr56fP2b4VQ69Sfj68euVsH1rwYc64kRWOc8g1VSBmqtgKr5WfWrtxNlroXIJ6NwTrKR7523Qj3PK\/Ks+roOEvZhxLrQxKXeZ1WiPTLOrRh4oRwzjzwyAXpoqFlsPtMb\/I8ul7eqLY7n25F7B0Cg8aHBgtcWwKRc68jKYRKa1RhenVPE0ZKYma4Il4XCrTARUSiWhv1WYXBA9QJ9NRWPG1kG5+wpWzbqxHNiFQaVla9GxY+6cDzvefG7KqAcSgSmKsJT6aHuhiyuZ0KTqLAyU6uznPDOW5SgNmQIjP36QmPEDNmCak1vYWfWPNGM\/JDX+X0Vo7OxIs67mA9GRD\/hpH6XXOOLd7dVXAJ+52u6Y1s+pWSE\/4wN90Jk1sskV9SV80Mn0GR4xgxnfriU5KOePOprrmgJ1Mp0rZWuEXVz1h9rpuWeZBhekxPbZhSMWMEbVPa5WfJ2fjL3FfpDO+Di1MH6Z7bTUuLViMa+JLtUN6zsLLfndXNqju1cj43rRlnfDdr6yUswG325OZzqJu9yVWqBKHAUTlfktQztW7fA8j1Z02+VYzMjcBqeyZTDNcl6XMMeL+Labggn+tXeUwHUW7zktDKjU1G2yp4j1FQLzoHIFj3pg9Ek7tFkORWvoZMDkzMi71CuxqlT1tEyApVZN2zeaQNcha0albLfo9vcg9hqMB8i8cYDdohGepH5s2tG2ZG7DxmYHxAXP5ZY086dn6MqqY1uP9umxeAYHhqOJp354T32mOMLfPc8vl827zpg94QxYBvykY4ZVLQCtXPd0Nx8b+db+DKLIUqPrZsdnTXROedjLAA3+hc05DiFn7ZLRKO9dc7ZMplTwYqnMl7zlVpu5NQiuI0jPq32HqO8+N5RIhybWiM7bhU6m1TGjIYqTUtlKGuKIBId1lL67x4ZbI2pNHm3nrN8P+2WpXHUqEyZU9yEh2\/e4kD2gjtkquSi+jMZ937aVZAwrlEimsZgPn82W\/M9zFZS2eJ7yt3tUE2VdR7Jzo6Cd\/GdVBWo03PLzlZP332yope0DTDPq8z0Wi7PpPbFPqNLjvVdPV6D8ub1jK211\/XwzG7qimsYfv0BikB7HCWUA1Kr34s91ivDL\/QH636jpA73qf\/ki6wRc3WAaLNHXqsW\/7DBaoHRLzqDXar3ZcVBNXXSI7w9Sobb07V0ron2YUm3JG\/JocfPKt3DoRyDWMbEayQ7GVt+d1mQ6k+5pa6IdvKNfhnzMl7G23m0j9WcOEvz5QzEOf03pnsEjcijW44S33ec0+p8joMYA7Z6lerUQVwW93uMFnbXxTM62JnWcEAglEwwEvsiWvS77gftyBUmKDvqL4fZLuNGoYnVF\/FeATIZKXfXMakwMJNVYzSK0GTZPnEqjB20DX8yjtFE8m+dw1jkpC69udDrvbN2NSIT3ajemIG7Yw3ybZ3RnlX+MtdvzYEIEameUAFyHFk4pJQxy1LV8vN369RScUUXbNOox7u1KKrQVdusBId+Xk3u9TO473Teui8DEenGgnqTKRsTeJasH+s966XJYVqXv55xH4uu53XtZc\/Zk5pPPxfV8\/i68vVDcWzgt9z+8GP5E3e2aqfSmnfYJMpXLL4rwvSdHKDMVOyhm9eCkyCV2gTDrfWqjCtd2KO6E4FQLaah8cCZeVcbU3H1ZFm3Lf85ojLlueXMJayJR2x1pcKIpHV0lUXFWwfHIX5LKTES0ad7s2XPTifZM3LauUewjisdXmcEV0XlklD18VW4uRWEQ5joL0qhvcfRMzNw4Dk6mUXOAKPgBRY9LawbqIvE89yW9nas0Fc6JmPYVpM\/xzIahXc7bmQErKFkBh1nfGT5WMaDh3vWDGapyxjUoOFBcREJbuXpy7DcCeOn0oPgujBXns2P75BVFQbVbG+sQqol6GJYPK\/QmxiAlUUI3zdFnGebXGb1OSuySvab5GKldZo1z2+V6o\/ojc+6\/o7dFjPq1Gn1rShbLp0q\/H64jpWxgMvDsYpl7Obo7PwYQ3leF247tDZHcrm2arbjjg7Woprh81m9cRc8+rwqJHJEin55v94Ikt8oWZOwq26PGPM78WgfMvy+3tnTPjVltVhBzJH7W8+MiMjkdF6f59yNmxU8V9aZ3XmV3PPvn3+4Ao\/7dnANHvtNi9M7yLGvGQOrElqFt2zRSqaFGdu0Pz1wRR9\/N7qJaa5pbA0ac+ZHXVPZ5xfgJxwLrgY1Jh8qjPl5OYccnrtJ5dSTe6VrHWyO90bbY3Tn\/3qlPS503CsiRO7hgVGppcxBLmSvw4hsAkoYqzqRuITDvFJClhch73G0Qxq8kGji73HTq6u9Tqx+k6g74oy0igIbmJ3Hp\/WYZRhTHcStVn2O7aweMlBGrPOJa8A9kM3kF3+DsoZH6l6pID4dhY\/lKnSuuTjNK0c0w+pae2c2VXzdFKON94avp+3u3yM2j6rqm\/BTHsHL\/lV\/IqGaoqvBa1hEdESvHuaDNqPPLdtTUDm9ClTvBqYms\/PgvTMvKt91HbpCbIstufp8HrWvIvBXzF5sRXJiTBVmaGCX7avqmYtsqQLB87arei1DZoxUQfrPs0XGOld6TF2wroql61qWSg\/aZ2zEcDk8eZ09HKlzCBvCLnV+306JWLV4x62zklutaDkI5cQvxk\/tcQ3ywIpMTiJKRGR0yLOQZDDbTXsz5u\/f6krGmJUL\/ydqmSpugXlnj+ZhohEPvdjsKu90D1b51TQ09HRpRqTDDPaqdq+Cwty2yx7kQccJwlO7ZT23BuHqO7ljv\/u5Fn2Nec5W930U5IXKTs1mG\/g78a53n7h1vVDL10\/MpwLmpditRq661NUomaxaE6Xld5BMbowY1a2zvNiqKr\/RgDPNoLh7K03PpGK6DuiRrrphjz7JUEHV6qdjBLHgjDOC4Dj6FQ2xilJZ3VJdEaut1lAjFtqVIzUx66946Zy\/6vupZE6r7FUCeffrJmdi77yw17FzDWWQNi3l+kuuu5xX5j7eUdaJd15L3aXPGUO+BZkrFCigPAqeQVKu7ytrV4Opm0alLkVnPvtZyfB4WDlajn7PN\/RUz4oG1LW9Rr9owZzL9VYGIzwOKDrXh17dpM+ZfDlDNrcH2LPj6Rhg5e6ZGbAVGDz9YYSw01vjrJeoL2oArlseXAwlZqlpHJ0Ze53W+M+6gFbsW4EvR6A2jPs46HiJd3jOcWVYSyyzjnG1wFFnfC06L2PwHY7EiP7kRbe6MTi7YyUUUiaYNsZJMwrZgR5pGx7mzsOcBXDO5xw57\/TL3npNZiGazO1sDTrNIQqtUjMeGfdGrK9hfMZqXmXVcIpPrxy5N0p+syq9y148YizGlKiSqTJ3UUps6woenLKHHDzlId4GnlW7cvShbQJcFcv9\/JbrVouNS5m9mL9aOCTcTB1xq7+1zLitatXVSr93qEjjcxVrvYkSlVj8\/aqClbWKW66ZubOu8sgVNZGYhgPnoW4pGoC5zf3A5jNdeK3vL5L4BfCYmS3dg225twefPYJfZf3hw3Ib5xRSSHh4eUVnSAWAnJmxn2S1fo2jcX1diNU0M7XWyA3ZPW4j7sZcfhBtajM5FOtvtYpXKol\/xrZrG7xaoo+jyzi+x1+c4MCwNXy5x6zqRFtLYVRpJG63CmhevU5KJB17TRDD7jBlfc3G4RtZWTmJfKvyeX32C2a4h8gyVVgx6p5aPD4hVpl33GjmD3hSEcnCOkUQjmddzxF84kMAJDoLnjmGp78Lsn237nm223O7PfeJytc70yjXttaREJ3kpD701gV1kWSvqJkxsxbJIxi8uaKVrlLKaVQgc0xs8rMqVqXw+GoyFiYDl2Hd+fagdYYTB1xNHXVG0+ykulLBrX1w0Huc4eya\/X5\/Af478887icXxoUxMdRgnXLavGQUdo4zOdX78Hk8OasIG5I4cpypATh5t7+LZagXnopgs1WM+jrKvjbLcNalhpBkDcURxzxflOVopGoI4cuHW9RHxinkPdAcJ8xMObCRpm3l6Nw+4oJmUB3tmEty8zs3qY5yuR\/Rxalh91fqKqDk12euD5EpGb4Ztr8hObLhuPDX0dZhPtWemHCUPHhPxxCn4wxP525EaV3BwengsfMqHAoJe60+uVSPJv8hEIfnh08OvM7Ml9I4aKrP7nYLtq7yTNRw1MRHIKDpv9JDlI\/EAcegmNVA8FU2JFzku+6WqZqUy2R1OzIVkWeHAaanOc9mgTv6eo6rWWYJexOObqCe2ZqblzLyD001WR\/sSZbVKV8E4e0VT4mTlmzliy8+0cOttIg2z6+tBTjH69c05umU+NC81Dt5RSVtIRXU2YCCsETZDx9ZJDP7qHxgb0WDUMBjIA37VFDRsMjMZ2YqbYml2Zsv5pCA8GuX0HnmpDlY5ZbP00b7QtptPlCDPbx2Hi6xxyvvLCFWf5n5HvtXcVWo5aTATB8GVGtYhWHfFqNKQ83JXq0035PqSd+US0biIQXPJxQTr+xv9ie5wvEs+n3FRTMwvMWsdzR40RAWB12SP+aQHEOg9veoayjNFdDL\/+m8ZCKUra+MiiBUKVw8D5qridRk4sTBA8Ehlcef8Dtt2SUrx6MgTA9nxWydNTak11gAjbh1TmxlSI1\/0mi0irQNlLsxOHm0Ew+lsWUUtL6FAExP0Y49mNCLck33G0PcTZRHESNVgIi6+DnP6A6sQ9MUtPb+JGJmBa3tcP\/UEuhLz5AVeTXz0Ctm\/DqU+LdlKRZItxksvtDjFSSvuWzRVS6rVyXuitGO+sSfqrffMFQbYY\/C8rx7kPbFRlKp1M7rqaz1sqiPMzDxxmGC5mpeehpu+kcNYcaK4Jd1Mx5g7QcQ\/iqnOnmuXG4e40zkiFi2LR+LYGhkpHhIxoosfCPM1hzA8I4wiMBLivnhGl8vjqWu5ftWz7KzzSp1mqzBNvSzxvHqnhlQej2ycBsBknctyEBEehKn1OiBw55Wg4LjoS9XQl4inmjifeVgN60Fekyh8wh5dKddNjRrR6CBM5466nfNBjCsZKVf8RLp1HyxytLt6k8rA+xT5ZBAOR+mcj5mkQo9tVATnLudQYXKY3sozUqxWqeagtbm05cGHqMcrUJnlaI4RZuyeBbxqgE\/JN3goqvOaq0jxwGxkav3AXodfrwCs4AqYHtSBbNp37PTfa6m74lKPUEz6Jtv1InkVRJNfWVSnVbZKPesIw8j1wyBZbg8O4helurR5I89+zJb2jmHmmdxhblAV+FZE6AQ4Ittod6sw2DqejIz+ygBls8Erc151hePIHJoH9smSTh1NZvTqabigY4fb2GdGTVycBWir+ifecgeqcD2qFCBKJqPNMt9VfrVFHieTqe9FTnLfT8UCIPPLHe1TDahIRiiuxsEl68mn\/ras0zqq8lLl8GJQxdZElOMgYklXJ3vJRGqLDIce07+4bIYaFVXflQfqAI50PtTMHTWgtWKwlar\/RB2IJNm\/imEvxhatTJKiimXx+KvymtzmKkBWWkYqtmBy23V2sNTh9hhkqqmOIjGQkdS+Org6Aj0HdQIu2Zvj5Hym+Y0\/OYI\/ZX\/H7FjZxmz67m3NqMS62sT7IPvNNPlg\/MFZ34fXrgJlerZg3KIqz5o75ufoUs\/Q\/qoOj4PNPILLicNVnHxo\/TsjkcSojRU+1Jk5V97luid12tFY1Vu3GUG2TBx2TLniknzQY3uNS2OPq+iXUV7uOKxwXh++MVJim\/gbLTKnqqE\/E+db2Ry+nD1RJnetjlRJsFzU6KNgHM\/OFT+Zk\/pMJaNQokdkyovviM1Isjm9rqMxsmUFOK440WnNcZWwB4zdeSZzOs84q1WDYMcIyexEiLbNeXRtXpsgDGOEJznn3LsDoTPFu8dHibcqiW\/xJ+8lLrM1aXMtr5MLVOa+DbkHFv6BbFg777fwiN6t3SgbTfM32KwP2NXitNhqh+9Tx\/mHBhUL+SvDucJO1enNU8XxqomeqyFyDzarboxljxwQb5wH+rrcEYzP5uUZNZ4VQ\/spl8CnqQxGNc94nnytzyEP1cVkyHpa3sEJzYwzZ31b1krk\/VvdeHUBrw4+8CuLSDhhWWm9QxmULV8mYW+z63vNYJhi3e88q88nS5c91k0yJuxz\/8AC\/AjT6skavPofGFV2dx9YRxygzMdhcNm5eq7qBMOX\/VOL0UOzz+qByubqmv5LfuhHdjp2X52rSyhG4aY4\/dQfGZ\/HZJ45EDXcYhAIA51\/PHbKq5sBvRzthh1hjNSo2WA1\/zHOxISshh9RLb2uyjstHTuZT6sXtcuzoKes\/CgNukMJdH0Qlw4LeV7QysPtbaXkeF8UqTqfugOf6W1rtGfF6KH5rtO6tRe5Im\/yH26deRO1bE9\/RIWaDerElSxxtSIS0\/u6D6qovqC6rmdy7QFDThbVN7QMbIJqOENX+HqdvMaou\/JpfDhiydGkdT+0xSs8lv2pW9oxyslExi\/GZeJ5\/eqeTx2GKeuRjUuUuKsAItnIF5\/0pNPQoby8J4K9f8M6aVriiGvwVxZK+FePNq9y8HmZ15eccss98gx4IxvoR2srZCN78AjuennLvKFezL4rqK6CMvK+NufrOL68jJ5XereQcy3yRObeXAYnVbTqsaynYyArVZyyLbGG8Z87BqHOx3CsePPPKIiqzIqzGI0UcfjJ1FM5cDt68ma6vqSIl3NAnpFlTzmXrLSqyzJWDv0zW2vIK6PAvpGQMWDV4w\/2ow2uGvYqn3NgcJqYmDpgG7Tf19UfX10X8o3CqwyoaXnxfAKoJvYXOa595J+Rfms7GHwUQ2Ug5B59vVa\/WXQNFwvTqOqXxH4g7xlTqrrMM7nP0dV6qdXI4oKrHHNmMZFhVuKl36UT1xbs5wev87iuxNNahK+iA+uN3Zp4vyzntTHijXYYydV1dKB8BaMUp5lp3Vt1H54f5DffT1xHz4mVPl5EqCAvT8AYsvQpYb3FxoK8RW+rBcs\/Uc26SdgjW3Jue7f\/mk5cqy6iULfXlr95\/aJL1oAm1BTuJfSNJPI5R9T7rVvDyRnh3pF0jhGV0ajx5xoJWPF5BTkOl+SoH7629yliu9xDlOMi4cm0HZdGazvjMm01iXyQ8eMdK\/44Hj59cJb2VH4waG0fG+kEZQy2q7YHjSDOdsQo0d\/VUB0fXJp670qAmmB+eC35gDqcvGT777+s7YuBwjCvz8pJp+CKgEpL265z4hpHqegdtkzcii2YhfvIUbGDP+fGKq3+seeM6DVjyN9JRY9FJUrgogjfeYQBiFzGZq7Ydn7ifYlKNhs0cjeR+cc10L0WJ26oQttzQIO8FE7wFTcBkqmv+vDUUI7q7vndDXlQWERzreDcg8ba4PtFQeWMKvf9XdfQ1jjXjlMLlhNzfI11UReWGTTPqr3VS5YmHtw9441X3wum9QjFU90DdcGPrA+Hy1x\/a\/Aitkf\/1C\/wdBUUnW\/V1Vm2J33S62ZdJbyaDy6qNPX9XSMQo3Ctc9QPqYq+LuPqO9BwIkVM5GYdMi1xL0mwDcsO5uVmK4E1BbqGMlid1v2tLq14tZtv0njrkdGQjFMhGH1qEsRT9bA91Zme+V33JS+wnrGf1lR9N59eJNtkq2PO4yms4BB\/m35hIusSrjLerDN1eGmxfBC\/Pt\/O+z2fzy5kH1dW8x432MfvZYbEkdHIfqn6ejrGmjVyOBtmZ1ueMVqYh5xFP+i5YwYR\/HSb3EH0IkHbOsPsbX5bI\/WuMEe1nHxQDdtB2AoMua5kVTCZI4YZZcZy87I+M\/t1vTpPcHJVnutsY03I\/2BjXimDzmvlXDEWNMUxqm0TKRm3utNV3jRMyXTNNfPNnukpaPlaKoMx3+lR1vasc1feVZrNTkbGuhsVghFFhf6DqJ1Lc6yDHVFDBc++M7biOy77jl8Qc\/kDB0pmOI6VJvKJifTVo6ziKZH9iw0GnaJXDPe7GtJZshYIpJdsDabJIZFXHdlC9oCPqR3yQE\/Mc8bcmCwemq0q8rJoYzz7dPapIVoS6URpI6er7HGGZU\/G3iOuV0OpwaL\/bZOsFC9WB7pXh2\/edFCMEG9Ttx2GoYqpJHNu9uiC7XUL72yOyVHaW9vyPDPi2sjy5sOpqfDFpJyc4Ze2OxedPXo2I5IniUivF48vq4LUyckkk+ciIg6h1+vUY+MQyiQwD5jKaqWOvr4pOI9+el8DNUMmh2NlALVDPWC81Zf21NiVZdTS0aggEoyWyyczKsysFYuBKhjMwRZl+8yjcxJ7VGdZ3rw3M9Rn9rZeapJbUUQS7SzO4b1UZWuBbFftratobvB8NQtG2iL6g4uLNoY7RmPKju01dYsi8t\/NN5qAca0rOZ8PejLQMsB5M1eZvHN6Y8vMNv7eOsqRnXjmMDf6A8ujBLIpWeL96hbhyk\/3qWrChTAQMcj6K7Phngu\/Tm89FUq9RzxbeeGle4wW0jLHHhkvjidZDAfgfXokkhotj\/N+sjZJ4fX0kH2q0emhY9GhMt\/lu9a4WxEhdGYzlzbdh1nMCHFZ9LguKa92RhiFYthAcybFFV8z0vNStldFy+j5x0xEjsx+nzqEq26+fPoPpZwfkXguBsxQ3UVLz6oS97srNHjCoTIjYqE2VktXCqhk8EOsRVw+m1WNg5HgalpoO2GmsuSMBN+MOmy7jNCjRigG88w7rCyiK0UEY3IWw7RhYDGO5wb1tNPc4Vg4qxL\/YF3ATqt+GZ\/VaZ0cyjIS4jptBbl1uEGD9UFlGiNwlwhkL5ysSkyMwCosR6tTq0WLsYaZqKcgCcWCYQrTqpZIoXViwecU4EeyxDjJMLNNbGDO4QAZtJ6D8UcXpiJSoanN2W7GXa5fRiYHvaaTdoPLRIoIJDZlQvrGQ7COhzcYpY6s\/CHr5H04iLYYeSs27xGh8FPdJK35TYDGp+3s\/BnrcaSRAZNkh8iRO9i16GuM3bZqZMyS8bolMMthu8w5EakaESMinoogW0SlOYNhV606X9RwXiWzG\/lwMthJL0FVEQpWU0PEzdUPj8D7sSPM7FYeZdA1gkpasE6ad5gwaI47Cipnnq2ucHPikpzO\/rl3L1GpQ2YWjAbuAU9VD7QojCQizRR5tYIuHkFOftRc8gsuGWsz3iiV2er\/Jz9W9EW+fBbNpU+q+\/wnGLtIMkdiVCXLvNRaZhxMJSLwJXEqV2ataZ2Kj7cqynW0meNk6THP4RiPZTBiI4AS+D5cYSWY6RcXxM77XcEIZf5loKCx4xV5d64XdoTT2ZJsq2jkO\/hvvYrV2Tb3VstxS1ZyxVMqiF6dXVsM9pgJcePqBFmCNshOeBSt+n7Pde8561L9WTT2uAfH+e\/8OeqUHKXPrzWYHV6OZjJzXcBE+u5uRUypPtDk\/bP4hLyrUuvkUD\/tzJkx7jowdwVgNvi5nVs90LXEVlTEbQ2XMMZjy1tZyT8vn0zUuTqRtlKZ5LYeyXXNRGb+m+i8W\/MYPiKDjEN+enuj1ovUckiqPI\/lja5d9Rz0WazJ9vZETPRyIPMcwFs9Gb9zbEW33eCxHrkqEtxl6LeKoKaJe1mh0UbpHs2uBqKYjNnjbF9f8zwzgm3AXDCsrw+aedM2yrGtlTrf6hN+qmpYhiQHvJrfqY3M6OeIREewR\/H0UsyUGTvbl39OqcLqpwjU8\/STv3y6p4yXIgIp+vYGYBEDfkWNGlM+zev6CwI0qompf7x3vaReKjUcb4KuWCmsPsLWRSAY9puJwStjYcuvj\/IOTKZ+\/foLYhhku2Ksf2I+U\/UzBj91XUcMo4Zp5L0wU+tL17Y+LPE9n+4155wr4fujBoAcC2H2d\/wx+JtzLIFozsP0ajmwqfYSbZlFJkTV4OYHCfXTwXePvHvcEPXuvMLmsy\/IIMb6FXkExT2kMAazAculvXA3LaiVVtyM\/cl5+Jxqf50HjL8rjM2sjgPGClJV960KHR8OLDoxsQkryvQggVfRXfgRpgJl1gNzkT\/ZnhmAXLAI6xJRYkjNJG9776XlBeIUV96Wk58qGxHqK80Q+adiwGVQWb9Nr80dmT7nVEZezmblIIqsbvwLalBN+J6pbMeaMD94tA79JjMQ3d5zviMtwDzNADwbHHRNDhcRdZwamteV4ebEcZVFJptpOZFPackPsPTiJzM6rfOZHlzWkQXhNtr1t73UXWaM5z7Evmrnu+GTxoB8hz\/M\/lNvOhXYl9yxShHr5IRqAWmJVKLLEQGcm24DBaI6yTF7wnc\/KzTrNlpQVq3naRaSs2E38kh0EtPU0PMctafeFj0ZbVgBN9s19lQmTNijBL85eqvqVfqr1v28Z13A+Y7guzkH2fI\/yKD2wK+RSXxa36IY3FDJrYHGgCrqGaa6NI9T4MDJxjmkVf4w14MV1q31MtlJJ0K0GtHsRYXM+6mpGROME85K1cy\/e5VIhPHST95Zjhqn4DGwOh6Vf+cL2ziq447w2v40ppk5Iys3ptY5miVrq14ixyyAfJqkTnTOxF7\/UAxnLmXjoOq0izmGxRnN1FqZ5GrrvAtRT4aqzFRSMZLxpNdEHXUwvyguGdfTwtOgiHmINdTCf6csshBtU+kGl\/2vHhzNfkacT7tllV7nRwBynUnv8UdOuOPEsEpGXX3KsQt5Qh2C54kcPFAsJgZWRFmtd1NWj8Ca+DSSiWnxCV4ZCVwmPqrcPUIC3uklbAfeM3YxdrxFZMuOifyxNDV30SW7VI+1g2IXCSl8juYxG1BJduoh8mg9a9pv5usuRv+QqnClK5NpJ9Eo38eZlx\/rJDIrsTaxz0hd0Yld76hktdWbwHCPy21+yxOdR0aAA2IsREyPwbEBqozjTkSaapyqVqHoyzHIrbNH7jJCbdVb4Ari6gdHqYzO\/sk5WfQfucuWwar1IY\/qxjra6Ju51rtRg53xYvpqa9WVCi82Wf3ys35oRpKqpm235tFxf3W63JEaLsdwlXirMJRZPWm8mSucZNZ9pXUb3UwME43yyuRu+XO6m9e9wtEIlvFLteyr8idTaHucL3VmDXSmUxfZJ\/z7IcFv0Km2Rqm2Zpt3KxkaCVM1S7osMjA\/zAbE6MIcpwy676zGwrFETJaHxWaMzX6r3rWn42DfIDz9xlOG1eWoyV7xN3PbjOleb51gZBrveqHgAk6J84EL5SOzW3eccVA1r36JOSLEiNtvYxbEVDuoH6pG9tP7UaODFngnbZUxgkwym22iFePne\/1q2WNiPeeaevabvJVjM4rMr9UBL1rBRVWRZdXCITDMy6IZ2bqQ1yvJSIlHWptxElmYjB5xTDBulRpFgX1QjewP\/r\/t4abyNYxXTKdNtf0UPG23DRBE\/oxf2bFaSrTNsN7FNXd1kmIIVzBKeiPHKrgu6jwlODbz5N4Vg\/nHBRiPHN9atgdV1YIeMyGWjqb6N\/tkhqxWM64QOjUDTtwrPfYsFkgBwYyUmVrTRIcxwMTwkfxw+DFCj+7HCTIbPp1xbKrP0CNcjHiFK\/zLGeWnb1Qcq\/mieN+qsMzf+9jqNPQ6skkRlvhTHc6Re7dSydyLSw9kdYffE6FzOGJAl8QnrM243oV4zvHu2W62yHc8rIL9ciqvExsfecfa1ExwUsbodtSNeVSPL5OgBUehloAA8gyeLp9BTfItMy6SQFR+xin0OF00iU8AlAVoucc3W6PtjX5BZhgmasAPDFpfWV5ldpxZFPOznxHU89ECVYxKgijGq1+QhYkEe4AFNIEo6MCvBtgKRrUfo8Oocix3mDUzg9modyqLKAS7qZ+2GG5PTusbyMhlT8YZ30ds1COjdyPa+k7rOCwiPP+oT8+ncC9kvh2FEVLjKG15WBQGP4OK4KdHJuR2dMvcEKUnE2Elrjkjl8RCxhfRdU+wkj51l7U4CaPYOKDaanc9A7MM66F6e8Vc\/EVimG8qa0zq\/hrzHmHIdK4CrRPr8o5X0Rvs8SAp6sBoqZNrT2Tyyvx41YOZP\/4ziyJOjv57dPK3o\/GvSDps2auzm5bDtEHpuz9z5a4szX5iFEXCPCW65JIt3h960O8RI2qRdcPwBfczLVa+V7wLgPFktOzzrsKtKdXUSKqb9nTq6968cnMq8p98g3Bmyqh9bi+886vq3u\/xKpdKvZGZS\/nfqP7GTJ66jL+IJBuz53deNX\/v57+9b+c7t+vjeI+xXzz0I8b6suosz8FM2z47jXy51spwbLDF24L1Mq\/5uRNj4GyYgzG4uuJ9jrWIp6uFvLa+ZBmwmm01s1o6TKFF9KFHYQtRjt7So4hATZmXqw3q3LlQc9wz3\/Zt5yoKj00FOZJmvK3hbvUqVf74X\/atH4uGdI6TpVyRg2+rwqwfdDUz28OHKN\/Ml8\/zqpfOkJoxKvRrfGW+Q4t7qwP+VZ38Fi1QSNtgUny9KHM8ulf7MW5k8u96VCt4nZGLp\/P64Mjs6KupeBmR\/fnGL9D9XZXQ2mNM4xnn35\/v273cTg98fKCr0FlayS+qeI195b0iLuM8Z3AV\/PpHcuL+1ILHAaC4rheDZnpAWb\/fXdPE78eHwQRV\/LYr6qxq164oMqpaB511Ea2P8h5egrUoNC4oKlEd36MWXQlHb1pjWen3anawHcwGxbQ1z6a3KhI+Jit9PKvrNV3a+IxEqx5QnZvXRcPeLSimxD175j51yby\/TlJLM467G\/HWEqPLzFm74j8S7bSaR\/nPdU8Qtz78RRLzUwWpR\/\/5nrpKdMDpy3rqvdV6yrixTFVZm+eW4UpqV13B1efemMUW7766fRHQVwRFjKt5221yzR28F7Ts52pkfnXa\/Gk\/8CJqDjgbNsTcxFsGNFQCDDA9OaNGCeRkvcnY+pmOcia9FDns37XqHu\/oDOCNvgureJ3Q9JDRjUck29ScbAWSZUbrkai7sjDvRVOGnwwFjY5Q7susBgsPrsp\/qaHuN1nZ+IvBVgWZj2aswqQfHDo9dNbJYDUIJl7WERvrqTsi+s1c198wsmnJCtRfUy3ymNynx5vuYWR5UVb786d3Jm2c+g16HkdNZZ5mqEGnC2CIGuRVX9FdLLL+uv8h+Hg9zaFVRX8xzJEa16ZvL2+F7\/nXPcsGp2XePUPZHIGKsCLrIPIDH5XHs0YlZmQjqAW7XdewVz7r2ppyHSiHUYRlvB6RCmKKXnnr\/JxY4Gx9qp\/aCzbVoltPvbXRCs24T1GmgoPWMKC8RbLIXf0w4\/Qb4ngvezFjWIJowfdE55AhH8p\/eT96BUoeT9NxlJO73iCzKd5WV9EAvoL8OMVsP+OhJ91jcJgjq8ZfpuxYH1\/BLPSr\/TxPudwVX3BTD0pL4FYfJfeDfEaB54X3nTXRkw\/0Ym\/lvBHTzbA935hEq+5BD9w3\/Jwfn0a29syX4ya2jArWBu\/RlUSUuWX7jXI4LltRSVStM\/A4JLmVK6zlxKQ9+hkXKmxRPazVuFzcZO\/TVnpmi1sroLPFYmbDD+sCkc68cBdoQpUWhHVbnNMdd2Ev2I3cwLCuEcjGjcc1KxgxTo349I3X29GlzuBdnEvG4egZIy6GyMo+8Ya4wclj0aki1B3eaqwIdNTORQ0CteTcKvYvuDlP1St+OctafW0MZstFEGMoZ8VjVJ+oHHkgGFhOac00Z8wXVIZZ+U6RidkdLaFvGUB\/QMStUKpkPkEnQs9HXHUucnE764pkI9cByX+ZCias44lrlW91L3ACPSdnO19eOz9KjDibF8ynbTQvPcBpVGK8WHgpbEAPecyrKhiYDUlz9wN4lREf8xhDzrhMjfQexOWxnkkFjlTDuirxxzivAopVNCvs0aPs8GIrGcyZT6LFMXjisGMeXqmjLuqT+dfnRGTT+nJAcS1CaFXMEXtRkZi30sFJctk6tj7kk3dPtj2vPSwz+6bX1Dp+D\/b0HGaYt2s1fGRZLMTJ837rwYyakWZEwxYoOdwI981r1YzmlkhQ1y9rB1kJ0jcbjqjEG0xL4uJi0yysLhhhkAfLwxDiifWzz8gu\/KUO7AqkeK3f+KZMSQwEuFpp8j+h8JPaKYFEMveDSdSNP7PCOcGWd45gOGRaAousd7J1lUPlDpfHtaeKGmFdJ3oO54iA9BrEHguBADGAZyOtoOBVaEykLScH0YD1DmScqinX5d0iYHoh03tWYI9Z9PtIemzsxp29wygT49c92e\/h21mBNb59+Bj7ag4Wcm5gjnlQG8FNtJZKgQHIEFlLbfVxfdlgakZYnsQ\/sT\/v0EsrILVmz3qZ8GTx9+0Nu6fPQX\/uDjhYyv2D8ixFa41QFTLNuQA4Oiw44wCTGensnhHjMfoavJZ5JuJeSw6LMy\/ZKe22Nu+uSdMjrIyLAOcwDFxFlHllfZRK1ro494i7MDPLd7gd2qiyRXuKr8tqx9y50m+dAjMp6vE1RGSKYnI8yAO3KJ3x5TFKISbSdfyRcwVpss9VOjGUjUBeX0letuo2OvRhy8xNDIexo0XzqOy1Y+4Mo9ccKw\/AE4H8Zv6PehCv8yrTryzC\/AaXx\/HoXbIwM88RJfFetqC34GDrxx5v9kXXtKeq1J1YQVGA6dljeakPVQFl6FFxWJ7PdyYfuZpzsO8dWWAzcIWc6x91WCgSESSPzIO5i5y6KlYK433SbuoqOoKWiPRcz1jG1SmDkLqoKpLbgHCZt9wM5tOQKvIyGFe0i5FWD\/f1wal6NOq0fKuAOZAnxlTe50rM50c2MGrEhx8ew7HUOxEo4ySC6Jb+0\/iyP8cXZNFWaOpRnj1lUs\/LKe2pPDEZC9uqeuiAOISf1BtbIN7rE1YbqgeJAZ9vJJLUyyhOtSF819ovy7qmZiTWF8Gy1sSI74tLMVimDuf7Hn0SXRTQSjMvzJDtWb3+zo1oyJLl0nz+Pnxatixv1tnh+9BDRos6eD1NuSmvsLZixmBQTWoUdmS53qaryHMvx8NoBW2SRuowCRxEUUeMkTsoopC5a2mjVExOoc6na4Hh\/MdaijjMEK1xsIomunJAc+Bs8g9v882SYjuVD09Mr4kSzKYvOSVQGbt2ToXw02z1Of5ZxbN+mNuu\/OLp6I2R8TNn6\/ud1\/Op8d3Cz8w6F84ocrXWZXf25YoheMvR8eiukOI7K25fZkDP\/IDYvUaq44YxUt+EqrNAf+sh+t6Mfb5BstecNVTH32CaXvi+yGjKOJ8wgtH1OlZndGeTW1cweY+tsp535oz\/ZjffFjbtOm7yRq7hCmpF\/MsV5TQ4MxWcMYZ\/ee2QdqxKVRsX+QBGskqsuipzeI8VTDEbdODKy5LiPDnRb9wamLEmh4NBdH5aRC9SnVRP\/yajvNJjDslss5luZSx0dvRcbrEOc7Y2FWQ7KsOy7EQJZ5eqpObINVHEqxFhV0vnoMCb\/EI1vRg+XqeO8VHWav\/iBYPa+Q2W+HfMLC5bCRklmgZ2isiwb+MRBlNRVwGrYstrgwW4OltbP6oCo3jG0lGJsqkOIpXxB1mi279xFTNHPO\/mqRmuk1QT3rM1IIZVnHyb+erKnDd6E0zBFLVSnt3IJ3Bk8upasMgY1N2JMtcmyUM4N\/J8+LM+cSjU3Tq19uNqlV6mEfJM\/q3Ievh5blUM3\/gdq6k7uPNR267SaYX35T7aVc8ZO5hZxekr7Cl7TvscBVv\/xerLyswMp0fdSrZNu8dXOgwiLZMVs3sMlj4eBFXhHWs\/YVE0kgnueZG\/WV2mZlOVpypobbklSN44NN6Ml2hE4XpEmhESAT63gbKnHgJcsui84mHKo2DfioV3cZ7HqrIyOYRNodOdc6oWvB87w2jw6eWQcVzmXl+gr2NM1KPYoCU5Sg4Ny9XZP\/VfNA5bJ8atrsxPF4m\/SXXDnI6RaiB+v6wpb4slqwtdmNlSK8866XFDVBA\/qMav5l9fYp4Y2FtQt0xLzZ1z5D6cjNooMY5hORBiHVYdAiarE1SAV\/maI66pknid8TPcZa0O49tyjtzXS+XZf7tKEG94IH9zhbmvZEYowPz+jtQkRvm5upMlrEj4Sh2CIXQF50OYxYzeewXRKlE8x4J3ZsUnqzRJySbzMGLfY6s39dsjYsl69o\/zSfWUMctpeTWuoSsMRjEtWFOgQm3Em3TuYV7qSJ4A9zBss5z9dVHmHk+j2yGzx70Tf\/a6OhAR1Jt8RzzNwbGr89HzuEZvJkcxEnGxz12EYLCchqJWmavqnwrkW1nJC6OgMs87lc2T\/2N7GAXc3jV8y37FlprHLNmWPWVHfcG1p6OdYyxgxG0mA8fZVPp9TiqZVdSDV7BJHF4VU5HVxXmPkclzalbeCeKiJOh0OWj9YGNGfGC7Oq4ygtwAS4jetIsrRivq1OhbzUzMM3r9O\/yUzIbjjKexen3bTJ3W1+sfL5qHOksxLMOJE1GL0mwvOX6e2HLXszwcJOlexAuYYAat05nfrkVwvPMPzoELnNX5APny5V7csNo040i0ulImn+e3wR4MQiZ3LdI798EXyXezcWtc9nINWVxwZDZ1VqcTfXAtkJpMnHSXqAb5CzcF3WZ5UMAcyjuJsGxVhFWRQAkIAJv0S8X4A0aCOni0OgAvtrpydDf8gDdqFKxWqwh2AEsz8lN0\/BBZpOaZnWiQV9+jRHKdWXq54Sr3tnpnBApVKFmGXN8Ki6iAWsaLdne9UG\/YkbZux8dwDSZsw1HpcvsexZ8Y6JZPF8krHDkI7l3g676TySAwMdwKH91eh5D9PWoy23I0EOyPC+AZR1C4IgZMz+M\/\/8z346jE3CVNR1JORwe+EK2e7\/yIJypHfEGIo8b7cjRmRuMRt8x2uRb9ND+X28dXlD8vs2ztiFQCORnMyAk8CrJ6XKDM2LiSjcmbbfLJgmuDiFmHsBW4xTuQ2VRd0zIsnfOygx7Ol+XbaTjmY\/zpoXFrVWZOGSk9ZOzlNhlOTjo8mdNm4dGXWzPJZWWzjFg9IwKDlvlhrUrrdz2XLCTbOjJiw6uM21lx3pPo8xrbHj7o9+pPtNiHDH7ri+zQdi5H1HE4E71v9qoROMked6FeeuCpnkQVgV9hbNdmVOFvHN5YFD2tVGdPjvSpiUzmri\/QXyQDmZGsbQ7TYLinLjMYdSXOcbB9NjEtjxKBcy\/ktJW6xxTIgq6ULEwb8lG5L3kl5rOF39OkO4vS16U512yz1aOnNRZ6pouT2KUTrsSz0qvOVUD50NgyWjjT\/ExFwjho3WRdjR+mPs7K5wy60qk2pWe0k6sTYLZzFOTkVu3nO1ARa4zxH9Lx2UTYUUVfo6D1WjlHEPTlFczp\/AcmcfRRzG8Aeoc+n+yUl4ks2S33lXHIFHiQU6Zm8jyRKvukKtj28UJd4xhPjkARZ48vWguMlnHU3TRuVBjViPNllJ5lE7k6kkezqQViETTmd2ZSp1gG1yHhmMgM1UhOUjmwf3PsNUwwh7E3H2Hk6TVc3PViVz+4VGI9HrVqMn8nptFGMYQ+vlUr\/xYtIC+sDIuRXdq8OoZ53xq\/KFlXtqGX9nXjWie4fRGh+2EE5J\/+9B+ORc6\/zyydDtwowmqJdeNfD5vv7hMd9RipOiokNmw9NXMtL4gf9w4GpodlbEemcwLt+O\/IMY6g515SYhkdTuY0V1zBTGGfrg+4v+QbFXKMnybn1IJ4o1Xj+TIviMgIi4+Ok+tZinb2xxPg3\/tePI2ouaq1+sU8WcuzXM+TUxsd0fCiiv\/L5pdrueB1DDyW4dWSxMo11WSOmmLsQdOMvriCJ4OQKu+MMYoTjsj7jFTkJg+tBxDKzOjDTMnFZKOOLQwKr+s5qSNyB\/udu8IVgB22unpgDLOXraHU1jv7FUEZXXiw24djxP+3Xe4O8Q3solQ0lV30J0EtEQwDpLqCzfIZc0U3vsnMd8Clc1arn9YUZcl\/Xg+SsjpYvejcEkq+YxMOO2cIF9aHJWpd\/eoXMmBUCpYPmWx1mS30Nvx6NbbIBCvO3UfiDczLg2C77qLqe5oZHg3COGvq2jvn5U\/5utoPd4OUZMlog9zwT49giJkqdLWNyszIOmPxKppwAuh57\/zAmqI6ApbOQ4YvGqPkrT9ohczs\/m8VqE7LgYlSrkWqX6GXiQktlauTLtmfV\/FVV4dEI3MdFGaNMyh7kSwHUqPkE958+7fd9zgVsUM9snn40YpPFtIvyLkcwYYgspoDSoIkWUK0OC4wXv\/fFQp15m\/YmwgZG9np1JnZlcHDD8lckRCuIGJETsYqozN\/RjuT+p5PheaA0PB2zlGGXrOWnOdfg8Xk1HcrmvWOTMasxYqerkwfvs0oEzOYO6waVMwrc3nnqkxH7vXwOQ\/ODMlR9ty6nkb781ur50PEH\/i4aqe9coxagAqngmEWCAIWRBXv9yCm+ah6vhER3eTYvvFc+i\/HfOgNV4WxiPHGvlmvdUksafUqxgqvLzemibF1jFaeWwD\/M6Th9BqAPZ9YpzpRn+tyg4hkDi3qiiLZHFwleqMAYppP3NJfYFXW0U+0+srijV7XP9QAdda6rZtsRO1tj0NTjaqAOLSaJq3q\/bRbl7YsdFocxxA8y\/iBSnNvzM2if3kffN02VjTcqS7Nlr2HeOaUeNXDdF2Dn8zorGORzIx0TFaATPW7T1wERz3r9pgnLKzrWdSXRZk3dSbDGwuxTOl9Y8rFFNTzrvCKSyqcDFJNzU9qGGWUSRM385LKYlu3apTicOYN5nlVZp7lpWNR1LTMHrw7zo5t\/ZexkZepKPc07tamW2GB\/JZp1KS+cLkYH6m7PSYrxjNAtiGqqHAdBj5nveJ3dCnRIYJEreox24ncIgdHT7aJFqpAH1RgHdS+Rh5G1sargGqdZ7WwXNhrpMf\/9axosMyIqfroh3eW3Ktggsp0U9bJo6+rGpUZ11xRsoozAQGTHIEJduTJ9kLtDRPdXA+3zBzMZwFIdvDM\/eGd8m5qB\/2KerV+ye4Ep2uKaaHKFNXQtcDZ6YVogvr5hhNmS17KBhhpuDN56lwiEmSrx7rbDrXBXPUntGn1olDrwOodckeltAgeqH5GYsX7iFGgvvRHdsvru0LQEQS9M7ev4wlXvj+6+j\/PE+0HeagsHvitYOZDvVCDx+6OGPVUX32cV3q+DU1KBvBruQYrgp74y4zoXF1Tr2UqUtM37BWs1HH1UZj1RncoYlTePUv\/hnPTsSx\/dJ3ByEUAcWf2zULzlDwkCxkV\/thrgOc+m1mXOSe2ndkQz\/Tfz13NjCDduNeLSj\/v9PLf8ld5TL1XR1GAsk+8Qb0a+Ncdg\/nv\/3lhVpvrB59V9rzGSiouB+8V7MyezPtUcNorIstvrfRpu6oEVk6NwD6uE3ymxsvQ\/gVpzIq2mokyB24narptsa9O4Fdt5WyrzJqyAO\/902ZGphPC9ZEX0WZmMtq6TfLAXR31iHqQzDPZquIkIShMVDz80YikvrpWOsVxZVwngV86vV4ehiHTF5qTvj03DCCrR+C8jMuKHiVNweYdNk8VutrAyZy6ZZ9Rn+yT3Abiw0iznjMWy5Bdl5y3OnUkeo28TihOSoVwlGTreMAYMqdw\/h\/G2BpHiaKOmQ\/4wSFGEVlr9bORrZ4WaOomd7Y4ZggazvvOlkYi9ZLsiC6RYw0wdurBRyBdh+UsyDF5IaN3xE3MU5kwt6pE5o0RW9L+adw5E12SOTEyl\/1qeEaDv1g2jOuhshc332tcJwr+qikPi8rs+K9Ww7BNHou+y6bok+\/ANlmXZRktr1qzx\/wqLwxgNBw70XrYhzVcRzzAAJn0QBtkw7XjVnEVhbwxnjq4r4X7lrN5Z1YkZIZ8TcvzGX3uxEk1sW\/AFLzDDqM3uedzhgB2QyZB8NiXOLn5vG+27boyup99szfryR6HyLh5xnVI5IFRkHXm8j4D5eTivafvcnjxO\/fCMnKikvoBWfAr6Hy55VyZ\/gRHdPn6rRvzIsodm3ihb1mE\/snE64dkzvRTHrVO2bq+DFOytdf9kiNnRI2fbyKi\/JyiOOtjtXkfhnNftj7OSPIbs5uXWGIswQ5IxZXlOVw1eeVO\/8OwerEgAncTTE3m8ulzXGZWnzBp51A3ZFV5XQlsKIKKnGWxYCW62hVpsZDqD2au3swYii8nq5Jyn3FBsuKAGgHvK5r5nyfJo8udPGLfHKWRX6xRxkJucAOMlh91Em5gDmLBjFMnr\/pd9R\/GVHZrXyaUT4cl7IWIgcTT7EM5CNX5XIVc5fTbSh6mYjZWUb1JK4fZ8xpjIBbyHRGhql8lwUdmRlEP4wv2+eF6wniSoBSvikLMP2eBI\/3a6hZ9lngff+jFLiqXc\/NlRKkt54a60xI\/tHvvn8J6xYIVYOXJa2zZemjtoHNxwEHKQMhqn1mB3xvROw5WV2VKBGBilepkFlQReUnN02KdKS6I1p2dOCYnPW+JoCTCyAvsYcZpgQxRc2TIzDfPHOBmVU5F4TKb5bRa7UPC+q91dcg9HKtNwQujTA3Wd+F9YLpnpTtbh3XrVRx35nhrkXUCrnnO6yxKMw96SSUkj2KVPPoqHHJcD72FgTlykOyz1VNN1kFzlr3qEYjv39dXyJhFzowNS7B1Q5Rxp7uObT5zfKtjOKw3MskfOdaf72yrT12vJ1lWr3sEPdazzpF1RVqUU7NnkNH7Za724jjYA4xtJmN5dO0guw4liEf\/WA1nzM0cNRoGKZNPFori6Gq1OSzINlTqX26Fg7F1R8UitmzdE3m1N3jH42jgAH6G25j7OaJdQxCp8iaZ0PHOHlyN2M+EeQSiKr4VSBYyHl6bMwQ86+qHR0GJ3sk1in5DH1KVxTczw8Q3RxLAb2eXahRhjA1eKVukt8ya\/WQQI593kj815lY2yW9XW0FG+qSPMlwrvlqamQ1Nlh8IfDOckYZHeBW0dcTlFFqWb3QwOlV0U4cZDuaYFfFhPdoeZepENnM77kQvFJ+uf8Pu73iJjLoaTCzWXTOHz2ccyUxrYp1Zsh+G4h0+Se0r1KNoE5meTWd8jh49G\/XqLKkscPv9F4+dzM9YOIrFvqrT1IWxndFfHVSHEo5bE6QeonA6uUSD48zBnMzF\/tWWSWreuHrhyPeXgWQbPb51EVoMP3ZNW73AUwfLdeZ13cUQ6sZvVCJtzStVSzQ2zLb75HnepxpWT8pC+ic8lEya1jMKtSTZCaO0hbCz2oViZ\/zFuCxL3MW5s9Yv2Odt9e1\/13fN7Dbc1CLsUITNzDhnnhqL1whOohLfplxvSiNVs5mVukX9hCsHOVGLtmAkByTVuamInJ3o2qHHwsgYvZ6+62UmFwlZz3dMKlgTzcDCBnWi8Hw4qPEizzMC5l2MRyepLH+jCcvv5UK0Dn6jsumBSsq+QQYOgzoismqMtcA2V8s8ghXhGWoQPYIBXwaSS3onrqhosUM1pf1ToXJRGAEndkzVbC0SYB3wi9\/QQ0Wckp3TGfgXLp1jisUstZc84Z6TscR3UZ0h8NmWckM549y6LCP\/qr1PBpaXqctpidHIbs88gr17HzfEOYOqbrJader4533qWP2aPHPMETW5SL\/68uNf6v+7OsP\/Ekn4Bef06i\/RCSOkZqq8GUoV8RzPMdxGc7UBDBKFvpt6AItghHzSn46OGLMdtcDsbI8+bRsmdCVi2zM3OCFVHoa2XSqHuDNLuL1xy+uyc9poDyr169zph2jxfvgniHN7EGpV6ZxggWAVHchs+cd7h73WOqWTGrVqywmtUhx1q7cxNJKNpWdK0NhkgS2K3YkV3FVHEoQ0k3Ay22cMmSd7TpDQsB93UPScalnDbz5VEVwFP5sZeusxE1GTeUYndImMN7GHbRlJ9j0Mv3WyeKiXkQdBi0zTPBWBm4GgUm40hmalESq\/m8vLLIgHNa4fRDWjurpgxLK81YIzbA2H3hh1lCAxwV+CTnzWoUt2m22ZqcdItpKCy\/00Fz61SMcFqDXGfDgYXFJPCU9UhOtS7vgW7MfcaQtN8\/w6NeT7bHkexjp2neasrprn81fyoyqgdgZLXd\/QEvxELtGD89syFCN4\/8GG4tXHIBV2opXqRZ7DZ+9sxM1bg7IlNdh8TNXFO5AHEE7NknPaT5ZxjZ+NrU8ADRlPMpjzfqihPswIrM6mDV5lPszojdDrLW4sxMjrhqmP48E8rua4LodpRC7+gDnU8fz4ed0Pca5jC4rWDVQdysh1A+Hzchfb4i+ITa7qCVukRZC+fJwoNH4ocjiyigESZAkiNHvP6PJqr3CxzlR5I0PMGQ0q8T3KayARlMEBZPzYgedmlSrTZVXxyiauCOSiMHU9RJDWDFe5popZxzVCwU3aYn5qqnVgPqJ1iXn+wgHMrnk8\/7naEZQRw5dRZb7D+S8LXt2WaSYWfFNZkF33mChSyeQANfHOWlQraGZmr2dmVGEKXXcdb+aYmYLDZChRPcYq2kG9nyWvVoM9tZQ6r4Mgdmh5XhtMMnbjjSaXDVBH1gDURd5F3y+jvBuFKIrAEqzELKsvGU1xCY+wJpvt8JBxjcEBOF81sq4S5x19kJQAyUXsCzvkTCp\/FzlgTNf0y0HHTDLP8ZPeUK51T1VUjT4\/Zn0dAq6m4T\/Hct9Pqm+CIc+Ll\/+p+d6XPTVap1Ju6RqOrOkGbr55vfUJV4lge5OZyYNzpi1RcQyNm+h7rWBV7qqOHAwTyjzWJXmwdqLFy4d+qu7BS+7lCK8zPjyh3ICOOfNwZLBmnVP39RHlQJCMDz23CEL1jPU\/66pOhUE2d+lRtWEB86sbI0r08ea1SF3dJeadX+uStmQleRtma21Vc4LyaHp4hTqZmE60VKrq9WrU9AZLwEREWF+WKKLqeW\/1Qh7Ww8BwxiZa1tWxEee12eaYEEZhdr4DJsECLS6XlFFskchUkdKfOcSDwb+e8SA6vCM3M8qoX5HH7Kvf3\/79dKpZLV96LA71N+dBX0Ykw8gjzPwYUYcnQ4IN6gnmn7bCqcEWelxWDSfCd7A41QBf6nvOUxG9Gwnzm7s8+o5OiqsNgnyPMY0qJW5sPXvezz2ent0PLcDNgM\/Ed7SfGohPMiIer4ahU9v47NQfeaFXdOZ4s1FevZv9rVt8Qr1S2zo+pL6JXuPN6NexZLWDqtyR5vpbvo2ZY0OHTUZppXLuhDbSz2bQ+Op85APZiaoed1OMoL64nuo3DiQRIiYdCdU7r+ovVOYeV8v7tEdOTv\/wOnhm2oE\/qvtV+IxhzwGEY6eNUKzuKKNfzmpEnM\/EJSiaPJOlqPRgRmVu\/okn4yn\/9RUVw3p2CyqFavllTHkJFOqr5FBQqU7r5uQSJK77dCz2CJKoOfwMaxRi23frolrVraSiuxpvncD\/dZQ4Nb1gnPPEllbVm4wsvExWYbbmomzV47brRNUXNSXPs9fWDcc54M9UMMxAz2AW7QRxMgMMhArvqmOP9J52nU4EN7sa9HiCkdNDoZvHGsaWCgQPrdeut1WViUvXUalCnnPsoFnbGsq8lmlZKRrn1mUY7OKfTGd\/MALzwXCJblR44ppxlsd6\/L7c2GxVr\/Q44rQwSj\/2TTvVoGjNb2bgyI4Ml0Q2Mia0Rle+2zaKjPPwC57qgYroIt65lq1hOaIzvJRs0XdXCLZafWAd0kwwKpVf\/qyyBiHgSYRX+6pIcgU94CDOD7xOlxpRjdZBZZZms9w883a19FSzWic3qqJVkFTG6ksqilx59gRngz7JH\/O455bC9KCzmps5Z8TVe\/wJVfh6GVisq\/x6aVQStYiuV+dgjWDE8U0PZXx8Ez\/WGK0Ul8aleQYj5Z4qSD8z1WyklTCkfgkUNFI3u3AKfFs2xPmoitVBmPHiSix1c8wU9JHFnyN1dYrnEuEzokwerXc9plqpQ1ItjpfIu0carBrGBHIdnwpjfNW41k62ZHuQQg1lfMvB4tVvMJSZbQtPAPLgAkZ0d3NmzuWBea9x1n9SQTMKr0FlvPIf2BUhOHZ+49Y4L8os+KE9899qG1ZvnZ16xDutaz3vbHVPz37L0cXEI1lGmtHTM\/hAl1ahJiPhOjhYx6gaz33iJ0bzjZ2z91wnjQrJMEZ9595jaVSZ\/dfvPMhK7ItvPrG1ectWjMSZxY5F6W42shv9zPh5\/7Ij5i4qVhs5Q4\/qNquvjVA\/8VdvUdaBR\/RMeGWrhNExEqL\/YkMPqDej1syNc3J9oJ7dX4+ZzoziTYtLMgvq8Abzzj9\/HAE5Z2Q6iBsXn9H9OybFSVXyt56jjUHSKnFVk56v\/m8t7Gtixv7wXudvWTvgZIwfYw+XDafiY6jB1pPjc7VCTcGK6r\/fq07r6rlY4dUblZkzTo1tEIn\/VMes5zeCVM7iK67HeqnrTPTMPYgiC7RrCzPQd4zM3Eyqfc8WDxp1o3VmUY\/rMe+2Tn\/H7jES35fzXQngGtbjuMapBxWdqhIcpkvLtxZlJLBj+bbHsIiIkVMHgrfJds+9sc9AeY8\/oAxyNytoGo8j7ZU\/ZSzXfTh3Yl40g91w97EO7F1thCmK2VsrOhv9qHoHw4Ql2sa0zyp2Xr35ojey7zyb+0n\/v7nHZPmJKg+nfp85ZdBDn\/nkccbMuNkKhxu8lhlSMTOSoFNeVe\/KtmXY1E19ETWaOsqxBbW+rnHXqa5M4PCyXda35LTbJy22yZoALEUKZtvppffmqG2gziGlVAjth0BnTrQ47RCT+gNdi57G9dqttGTdZPLDw91RmzpjbPLjKB9Rl5XDTXH40YUiOvywLlLVfRkGJpvRZxZh9H57+2SyrDWPQMRefR7eUN1ERrKf8ROFrpfvuHgZBYTpuaf1uXcpOWiM0MR8txj1D\/8Q8e0j\/AmTwaU9To2\/nBbq1nCcxxV+kic6tZFElRiD7jM953hJOJD4gsQcixoUzL1XOZKSd8vgxAGclnmJWvS4OCHuqfZqRKqUmbCiuHmjsLPvKd6puIwFbxOpw4lKYwypHjmOPe67dNQMXptPnOixVHf20D2SB1dyzFfPxR7T39yNdJDtjC4jugWZgYyTLyJeLcqsvGebukNUXIU1Q+V16yfxqCu5CFbrEomLH2eKE\/iJ4OxHjb++DDGoX2WUsjOu\/rxOmSgxEL\/NerALB3r+pCt05p49WkuJ8bJ+os+sWr2JkewL87INj6wUn2e0xQnc0bhk29dDisF7\/XylTlg8nSduxjLDsjYIofanu\/RUTSKWE4d5rc5lgiwrUR+oDz\/cO\/n1L1SDDH11IhframXOIrhatTHSY6f2ZzR15j2XafvyP9HqLFvd1eeM\/lQnjFy2m8mgL\/kvIQqGvYveMF+yhlqqpNYEsaNiMBnkz7gzR9cI8w6fHGOWRKS5+apyOaoenG2s+mXGtAeOZcnjt1fxHDsshFdlJpcfGDXc0PqB+6JZwQk19q4YGPlTXfV0O+9iw4iQFyvJdTAIrJoMF+OmqxHNpeOug5bFwBwoDlK5LwTjQCOWy7+Ro8r0EdSbLfUBTggXTmZwT2I8r7O\/uUP3g6+NKJpkVXTj5Sz4Z\/7lutKMvrVuKW2UyS4Y8hEjTOaigmTQqtCNWfnUmH2ItDyPCfP+NJ4l9+4gc5YrjzNCYxk3jX\/MsfrgoqsTYmbkFpNF+LkFmQ4\/2nsKN2NpvSw01U5vzJV44nSLZzJUZ8eoqBRqfPeJUqBUL6oOuyBFzWIOABseaQTqycyt\/oJsQ6G0lErPb7kNbp85lRVTs1U63Fm5VX5PxFJ5YM4ouN2zsilucC\/wH9Wk9vd7uoJT+rwfMmnUwPK7FXqu05Hfp4J0cKCXLdyWNtyriAFLRbMeAcw0sz3mDYrhRsdDvG416H6u\/clT+YnKbbapN9caxsC2uRtAtGA8URhitIzs+w2gVBv3tbEt7v1PxGWB60fXYe3yLUD6EuaMDvQ1dC\/Hjs4r0oNznZnw7Y4oq\/meVXDxFezyU6YIy\/FDdNxfzhu9yQq8I+J6LrZXTcvbQS2vlsVz5wKcQiglGn2uhtjYY0cd3e0gd6xF7c6Jmn2V0BjzzQrjXpnP6\/1OSf3uyRkusZrM2q84xwFMuY7qsKYgWpOJiQq1CT4z6+SotZ7aOdy72qgipKioFKKlq02muyYAneaC2ehtq\/gZfSuumlQFa0bv7AHs2FxXheRB8lI9gNXxSq13ec3KO18J98BR1C3cRX5EhJ+ot4e2m\/bLjGGX7FS+TX4zJ91N1TcqWecRhfXfhJT4mwP1H22QSb\/HG1dqF0RRGTKJTC0Xv3qeXA9Oc8YXK8FdPM4XkMVmM+2TY2MOImBYRr1aHH0SW13T4GLqoskVVYBb0U+L8pkvQn6rErm8DgaWCP7CiKk9VJM8UZ0d565xRTW6cLOqIiYfOgMRhErh5aIOKknykjFs\/OVXInbMBEJ5lVmXX+vxPPMMT1Y\/w9LHMSJJzNDXfd+06xqiiMuV8TqSxezh5HFB3\/ae88fzg9NEKUzhjFRLohga6LGWq3myzPczvKjh8at5jBM9+Hxb4kS8wBXfVKcDkK9oY0pGJ8hxAvwRmrPVVKTKH654ixnQysooGG2+8S7VwPqoGBbQDUffjOFYfGMYpbmN\/2p9kN0gP3+T62wHY5V9CGk4hRyuMhY5Qb\/c0qNQM\/kZAdIDt6UyOHZFpVRF61x0tihEctBR7NhVwXBFr3WBa4hAsz9Zq5tzBYLvZJ9WZmY4PXzbogYZAfqUmGYuzW008xjx4q3\/O0fhPl5NomsALeYUHw5CwG6wmDGGjtT\/jIqrvhZPyTXMRW6C2IyQd2C0t+7VSzKxNR+XgxKTqUQk8ZS5ltlnbG8tJtxUZFcRrc7z5I6LEfqZf2uw3LDjJQogfhWt4+qnGRJB8jIDHAZknuoDEVBjQBHjBIFX8caIuaMeRTKORPYOf60fKSZgCiJF5RHZX74ntuRIpXmyPe0Gb2RgHqQvMIG\/LnLnTTjYPhlzR59eYNrsNY95\/m3OVl59Ec0dBFCXmanqSQzaB2MKIl5PDROyjR7FqKKExJK5nIJQd3qM2eMX\/YddFfNiWnaKGqGVApw4Ub1UfZgv9UxvRXxU09iphqpu9i9S6PUQ1TgnVlRWxtD1T\/xFxkA0rDq2I\/\/k4cYOj844B8Ng0no7lwBbMAP1hzhTv4lC+h61sG4o0vDejMCoBPuihx7JPX3TJudx9TkQCuulVnnxVo6pNvVal4yM45j1YKuu5eXyXGuLvpoh6p79jr03D6AVJVu202dSezAMqEPzbr2VKHFMxdqAZ5JluaLs01ouxmdU8aapxuotVYnuBl+ZIJiTd4\/JgkkRkJGtZveapOIhmMCPGQm2lU\/JjKxuZR0igsOsYnrFLikMR+IfxGjeaKa3dpJd5m11WkEg2LqkCmbGXJvDM5UMvmUG9xeUkV\/idlcDcQdFUEhr6rlHVeBulGFQMxxW7Jfp0nJiW1UID1y81G4dNfMpHyU2BHaOb4JFrguibjLmoIwf7\/0Gi8IBufuE+g4jcaStFcY1Q2SvFdE8G2WyhaLw+0FC40IGrdnWS7ff+SQ3YDJZ+c1DOYmY6x3qfKjp5Cn9V\/FvTDDV8Rz3HzXn0yn59SgOGeU7nRnNRIC7s3B0R5+LF6OKYCej3aNAjb8eink947f1YEy3pjvBt4Jw+NOtGC\/sb7xfBDMDYsIWOs1EKdmfGgsLVzeK1TiLVHQqTzYOfteF0Qr8RqWj4sScSAdDzLWxH1yxBwyBw+e6CxgJPvX8wtTGfMdJ\/EHViohT\/4xJNwgit947KnyAVYzWnu61MqqixJOZRfmSlXMX5Yuussg23+3iWdmMq7Gm7aua8yCyiFwsNlNn+J\/vYaLfOF++wbqcV31OxsxP8FkH1KillcRc9Zite0wukezR+xkjnLAeILFQYTfaI9XwWvFcb1F4ZfitenISFETl5y+aARNw5yFGCht9R96m\/61Q67eYQ3FzRQJaQ4zh2z1HnzxOHIPPPmN44Mk9rAZmSa1U1eIO+kpeV4u8nvzU4epXvA0qzvuWtcOO4OxdUciOr3uSJ9UZteaZ7aN96oYVZHWCEL0cnOAnblm1wZv0dtzmI5Cnjt52MD0VJyqsRLlHpvZ6ArRhfg+3iuGgfTndqmFUzdtXU3OtN1pZrgnfXM+0zF72Un\/zNcNxFCNH3Tkv\/jLGF7O05fpF7mPesurNP\/GPY4GhYLGy46qDvnOPlw7P5MOGuxII+maow5ZxGehLkAx7hbnxLs\/54ow34Su+cGHrALxWrUzbCqYeqT\/\/mmV1ByygW3\/\/VmXu\/RntXAc816SNfsKiYqUxqSpYKzodNBDEMovTQvIK+18uE+UwwjjWuJ+oFnmiNedj1lTKvg\/k0kKvkP+ayjH+iXWO7eKowWMQFuThNb7cZQz62BlINHn+1oVP4nD6Fz90qG68yD23NspyMa23rpbLqNRS2TURPlejp8E5WOEzemYvC1kHeoX1X4kdaJI19BrEtghcbwEPU80q7rlpW2PGjMkr6w8b2b9uwdo6RDDqmz2Vm8pIn7KUajCvcb9uR0ZtMP5jnbaS6FVpYZ+2eXgDx3oMOUwmm\/v+cr2LEaAF0JorolK\/OHQYovjG4QC0rn3kIqJzzob6cAzxYA4g3CPz4HyG4+HEzLgZpZ5ZbdZLGZk8h7tAudUkNnVG04\/aNCMQi+QNhRv9vOjakzGB2TKyaSn9PZrdtdWuVvJ+t6e6l+vI2vTJvZepZ0ZH9uQUOQEMUrPko\/2A7ESAsTRGPddy6OPqP+v5GOl0SLaqn6ybjxOKd9684Lc6FjGRpCfvsEYyQYR6bqevlAGtZPLDfM2jSiDbRG1g0uStLqlsVPfDMZlGR1+LUkxkiHDd6mSjTovsCkm2JrYwCVWs46RvI8R8+Xa1Ccr4\/zn7\/rFn5e9jY++R\/02gVzfjH7MFOpb758\/8vldyLQvrnLxP7HlfB\/HmUcRwVn6RZC6opCoOc5IfiLneDu+4a5kCEF2vfqyW3eqR9lp36B\/VUW4YwHFVDzxS3Wq1khdwA9PgdWlB5aKOrNDisccWwPfL\/eaMCmOG1IiYJaLx2fEkPltVLTfo8miJ++cxjqtkmdoRgFj0RGax2ivbjVJ1rl6LuKAMrlRgx\/UDeRbVD\/N6fXMjBQdSf+FNqmK5qwpSd7Pn15nRaX16iEqbF1oylvzlmBQZhbcTxzIU9WbNqTqlh7pDeUh+5HoQ0DgubI5tUJe6Y5XYbF92iqoZ2eYH\/BHTyxnYGS7BsyZ7yWhRnpiViX199UFUy6nhuGX57JX2pmX5Vf3lCrF8myuZDu7lzhm5LAV21CSz7wo51ZtI6+urMWC8r7oyWuzskS3XHDJ0K6\/vG+1jS3GgIp9SzaqIdYozQbnhWNrXs9xKpWrfmqTCHYsVCxKoqNQSGC3bT7vFH5xBRtcFnMshGiIsPIjT7VqOUvUTBuooYy4mym3u11rpq09tJacdbXqoRgfRRAMl0oVUi5blerVouAj0MDpVKO11\/Id3mUaU4R\/qZDpXUGFM4yHE7XJJj3iFIVHsMkkrpBGOh4Hv+aea3mPyRp\/E8SJDvRwvFlP1fGjMoiGcBPNwbH15scxP27L7P98K\/eUUvBWegUrpEQbWZJFaxoNTgFuJO9mfXnm044w64cX5vCjVSDU738Mc2FvNXRdS5spcybJ8ICuM1uhIUu+dQ9GOa5jopz6qmRyTgF0ysmbh+6M7oS31CEQ1R+HrnhuvNwUJ8CfIYo6n+Bl8MApmg3H86Ldh0cS69lCHzqdb9g6Ky1\/TQj75ku8Tco3P99uGO9cVbeSCDr5VklGQM6tTf1OVWmW7mZAx9SKf0m8dMmOOv\/PDNykZW+rP2BzzGRdadSSuda4q8DvhBvxJ1jzEO5Xzjazflpk3mCHvNuJhXzwX0Uybnc+jncmkTnDWHHVu6yoyqxwBqHdIHTuS4LjOpVzWkW8eWrtiGOSDYs5LyAwZcZYTiLt5nmBZCXHBmQUoJYzqkwzX75wPO1BNOJnpdjAlurw2z3NdIo98pmV0IBjLUiOuPv57sjPv832mQSffiolrx9PPlXWzzdDHeH48fP7L5QfvK9O+76an1jDc4xqIqsD3V0Em1wG21xk8ClvvPjOedXKcRgqRka5DDuNNpRMdvDZsAreRKTJnNYFFkC8jqk3zzl2Vdr7lMu4RDfMpjq1RexyUqBwwyrjAY9GioeMezwSPZ5\/PNTZiswr7mH\/YUW\/3HVWBx+Xz6EarZVAX1szMeHVYLrVZ5Z6oZBvqz8pgbDCDTuOcw18MB9jLB4NcRsz2VIlVefHnHXmGfJ9Oysjz\/n3rWHMQ5KBkcbvBMtjpSEI14dXWWft\/UD\/fdguOiYYMwyN9SnX4Z6Qz7mftsjrIjGRlnAn+IYo\/xwKGk1gBh1NGDcn28R5zZET82KIcseK11UVUp0apq2P3+xTTvAZvMaYnInyHGdX8vfmd9akjBYOnIcbGkThbvSCoFjPwt9xYrV2lZRQgwFmOHp0m84g2wJJ3DFkVSEThqpitnF8AU1lntarBHysvY81x3Tu2wDkirvd\/6\/rGZj69jwrx9Ez08tC3euD7CbnrBmPHe\/FpBfV62uHcNsdGZ7Z8oyHrxOl56vtHqXrGBt7k7LkrSleacAGjoBZ1ONM\/59ZBHlU3faKbt44gh8Tq9jY+7o8\/EPViijOxzJZPaNDnzclvT9FvgNIZ68wGB3qcqveZ8fCZAirwcEkc5Jt3NQEriVOUQ1fUtZYrRBhMB7rIIy7T2RQIWSW21lPZYhh72i4LgNwQUWhYpukqJbHOu+UsPznsd7J6FYT9W1Vo2Hk+fbisdCuXMP2ulVh1LEOWDcQAf2ePstTqoZFVYc7BWcHWOZVOHagZV\/2PAmYU2yM4zGpDrV4e7asoXPwk1R3+R8cC0f4Mqic3coqZ\/32O2sGq\/Zf6ZG1yaNGPMmOqFYRObuYeDziEQa7oJS9+8mhenVeOZeYxRxf+7Qem8BN7rGea\/\/nLsa2cSPCYwbSidoD7q8gZHfNxVXe+RydEfYAK8jBKJSqqRdEKMadSn+et9KSlc0k8u1UiUVx3UhbUU6RV1qCTZXC4Pl19eT0KeP9e6ZGSoG6ikX8gTM\/NuOS3y3wwiQvIDzDimtdunRzjz252tAY3Vuen1mfUOQU69x3NFnje+gvW+plfjieyrmvr5RsyaJ6S\/c6ETFPR5w5kvdnKz15E4mSt1hq9Mm5myVEJItTfw1gdeXETD3j7gSWUVN5XIa7qLirGXUd6CMHhqP\/59t1V+0OKqLuVYTPUe37IdURBXbCy3BvNd970erXB4xnPuTr2uB9a+sVB6yUk3pXNl9Os8E\/j8dzJIvMLuhr\/q7Nbl4A0dPXcERVO\/22luGMelw1Q65xEh5XIc6ta9dUNOu6Xw6kaa92Wh8Poc95BveF3onS8dQwbNdyqAKOwD1z8wxQo167LuVat465rR11BOowOVkF46jJumNidqyQ2EeXgXUzDNxdLWjJrxNU+wFMWv6mjZzWSerPPMFGrVb4wnufDRZajN9rD92MdYs4TKq94ZkuV2UpsXZfHHDk8aR7FUKMgSyTD5NkcH\/cTTdWdXqzRxDk9gGaVb3QYjOCKZgt8YRUnkRU3x3dqmdW1\/Pi1zpW+tmdGrfw8T7W96v5mXh5jyGX9b1xzRIFxTgvHix4vLVsy60SdcXfl3fpYfSmOYFW246iG0ajC5X6tRNIIUVP0IGfmfjnNX9oEYamNor49paLijQ6t6nGrJFkEr1QXisQaCt3NiNSBKsPLfdY9noe6xbk75okOK0GPBMjIvPM+m31mK1ZfcgF59lPe7OW6wIze+0+1LU\/a2tujo3nbpc\/fn3eEoMsRvu\/ciG9vWXpemVX0O6\/JiXFyVK9TZY729huNY+p37CXPn5g6H5D3zuvVgv+d879lJjXRrLjHv82a2vn3KP7G9+Kjm5IPyOa7NRpoxHHRMMBvfnp3gK6mypm4e446TlWsh7rrReeMQ7GcftUuuE62O8cEAzLe4zxYT23bqm0Fs8qW8fResCEe8PUhZbfUET+6cvSNV0T7eVveRQ+HbYhcPG37qe5mMyJSzU2tewy5fro+V63LujUxJM97VrmaQG\/UMRjguMTphTpFVGcWd34V3VB9VhvrIuR0FFB\/Uv8E+50bYJn9aB3cOlHBbRLvi65agvLBwfrtQ2qzF56cqXqOjb7TA95njkbiYsLC8j+ZCd\/ST5GWI\/qJXbOTavNKFcfOEaTwyTwK0owjRzd1JROyaTD9pH\/OAHJYz1U92ddZZU5dMdXJZDYoANe89rrrb03D9ZfgQawSUbUw0QGlX5jn2DyrF3Xm2ystT4yY\/fkOHbZaU0SnJ1AynoJ9iI6o5tGeLY+XzywzMyp4esbtWSXr\/SY60cDLbWIWHU3eemyOuJ\/P9Rm12tYz+\/O\/V7W5Q2L+zZHqMNL3aD5VwRlBzxYlPrnKas+zeN6w42SsrsuKiuALTIKszjqIqFOdbMzoUgnZtvXM0ZRgmEpYn0VbRA0cTyQfFBd\/7Rl\/T8tbdRkLGAgy+6jXYIKQdR7Lecyx\/B2YG1e4KxhMFOAkqqEjxCUmL8SJKJQ5og1g03aTMnCSGdkva4rgto5\/2tV9g7w6tSrgOqqyOIhhG5BbVupKjhHTSvIyORIRg4OIcD3aJDJY5b+cs+vxfuqEWqe+qgB0Sa91WMScGOAE6QYviDJ1bZNnOTJWtZQn0xNs10ycfwuCyo8\/ri4Yap\/HuKA1ddOs9AhO9XmPa72rM9Dgj3W+3nzXxHfsH6aCXzjizfm9W+Whr7Abj7zT8rENkSRqYJ3qmldgIa5dnzpbDCf3x6yJcOqjSt2RUbennegp9edMqdDW6be1909U8xmJSlfmLeODMlp8kNi6XyaZHlIj+jHVkahYI2YjAZvZMEv4By7K61m99rgXaPf+58Rb9FMfMPxECyYVs0TdOtL9iOSJOpEXz+g2rBxsh+tS+WUWlEydFs9w3bzKNW3EdfaDt1yh0s\/0CetQC4dKV3K3OkHpqbHLhD5JHpBbDgt1IBOS\/hxnEMGybmLLDFWh5qteWAZSw453rFL6AsvgQcVnzYyvpuphkFZDIpC0FVll3bzyOufSMkqcHznWyqonrfayndqmShNDalVMJtthcO\/7T5x43aqm\/mFjq2ifFYHWGJGlIsmY2crAO4NDGWic66RbS3sGDvzQBucO5sxeR1CU8rnWix93\/eKKh8QmHlOGUNHWc6Fe3xbDQvZ2yugIqN6iKzUzfsTrQdDMSfHEfBwfR9H2zpteER4f01jmym5iSGhn9YunyVbZO4PyavAypOere+VJXWockYo3GIynnX1znUqCkStTdG1fl73vU\/WP87rcjZcrJCaKs35M2uoQw1DDL2U0WBsUisq621497lGS7DFzHI2d62NS+9Oe+UND9Rxwz64fPtzwicl5uSPIE6oZVQnbzFiSiVwt8z3lrNNkqBGHbavhPT+UGXAGuI5meGkZn3dFs0z061JUQKoHjYTJqCNfYbvWaKJge6KdGcES6nlY6tFZ0GgVGv\/Zik\/GhIMm1pubWeNYd0R53se1TczKX1u7rnH1gGhbzVW8Dszcq4vQ3K5zjIzVT0TKuY11dYjc9egcc4ShiBM\/7Ksb8RUwd9qarbJlc1VdKv9m+lXVIgudPZYq73V26Bp6jN8zr2Q1sKo\/JMsw5I3IuajSzoKtz1sxo3uu52De2156+xt1epvjW1iS\/IAg0Wu1HJdPezA0I1J7mSGzR5dfR+6RxK56es\/ViX7Q8vHMfA7as3jNxmKRSHInwvAveJ16X284r+c5mkZtd4TUzmSlzFNkzjJteHNWiKG1rg14FYYMDQ0PzkdXcaTLOYwnecnUze+wCVH3qj7XDGms8dVrgHJwJU6Irtqq0lz7IJn3qQBXgNaCFcG4zgFYJWRax3f+ioxyNgj6yLwTnsQhUUB1iJeqr8\/UCRzydB+tvsQgmegsdRSwBZ+V6XqpKLKSzjt9I6zeR2OKYPyO\/eEZRWyrMqghD+XDemAd2ZsD2E5kn3\/8rRDy5r1Nz8Fc\/9QDR8gyjlSQnpa93c9xPVoVQTUixE7k90ppUPBTj+JqsEu0D7tRzrA9XDfPHR+ppbZ7DCPn6\/GsiSe8pe+LiuY\/VJ+xRk1VFj2e6ASRbTMZkulOm\/FZaHC1YFXOPRoLnGdmmCiCV9iiq4+qVV4zDueByvJd009EuOr4+t5KwWlnlmXFxETNwEPgDOipDMGKPxQUdg8K4leC2FRDvAnxrzNpnZAbcHg6onIRx9OOi6s1PvlU6dbJTO8bW\/2BPNIrxFatULW0E+KZX8kmo40LMLK8NvOZ0Z62ZATNKJU8+6tWcimaCFdQ9793rap+lb0Yk+zJ0Ta8SrW91zPNq9TA9Aka4v0Sfe\/LoXKpcNYpOGLGYgIMm3kU+NeF8R6RINaqF+zKGOc8ua5PN5tI9hgEXKUjUPenL45LvOfcRATn8ry+ceY631LmfR\/QAFWD6m\/lUvEdN6vCWxGBDcYIC8iD6N350UVH6npzHb3S2ek3ZH8j9NYW9W8EiAJt0I6+mJlZGRnnrgU8p10Pq7I\/nyrR3U4kQIIjDno7g8YMLuo8pkqT07qnknAV97wec4b9Dlui5XWH5wcpkHqQ+ftNKxr8NUC55b1o8DSftud5cH4xUtsPu3oC2IHKhx1a0x6Bmv5TN\/y+mtRFhAsWScfKrw7PFlynClpopWFI5dpKqrFaSlUuezK686dVb7h26sMjacSEXKGq\/JR9gxqVFlVJlHEi1WGQxXt1m0msfcWnZNUeNsMTht3nk7VzL+1cpTTvU\/6MYvzS5G\/qnWTk3SFvtADKhGZh22aK0TOvbJvHPQo623lP5jqybyZ8q0E\/DdURpjeqd3wc6vT9y51Qq2YwIo5Ef5T8o1rlMyIIayyrtjLdH9cadg6HdI2Sysy5qbwb\/OXYP1VUNE44wi7niqmWV9uoutULkJBcU2tiS++TTKOVy8fHT2LfUYDmxGOxT1\/0ag\/08rTT9nmFs4Oo3vy2NqvWnTNs1qsisyXRo\/K6bdF53GQ9OipQf+pJFd6siS0Rc8VITVoV1gtbWkcca8Nxm7WoB7XUWMqJ9NdjJ8OemYtnbJlbst2RVGM4rrTjgpmIs6oGChurqg+5SYYpth+EdCydd\/oeXJDPFqG+qJiuWqm4evPENewNf6Rig+20lbGLXfjjRtT36pzwGKml78\/0PmTSKHFmb6uPnnp+uN4wEQ2myEEdTbkfB3y8DPfBI0VzjvSm5cpEmc71UCZG\/mVBdetqxCq\/uyhTL7ACkV6+yEAd0zEwbObdBqNkQeIE2TpfNsmoRTPcBDLkBSoy7wThMsFWaqt\/2kkP5JHVVL3mtZ8hh0OcuxEhKsT19mR2zo0tZAlG66c\/7etVIebxatYPAz88Z1V4lZAVLmdXEavrrYmyT2K79ZpnM\/e827OvqQ4yRy5E8nA2bV\/U5BJe45m6IferquSDrYh65a+KNCg\/v4QuXERol9o2y\/IWno1sXG39sH\/XIPDO6fjlR+xSmc5CFwDnkfFqfnTGDJY5stXfOSSKqzvwYIM1Ueddxk8IM\/LVVnUF7pWj4FM5mk9tDvjJnl748iXjG\/8Mnl7DPWbS2FJTOii2oy6Z4a4CxtvkaJkxAlPMI6MkJ\/N4otBYWOkeNeCKy2pGMCmOopjfQMIzqPv4niqRGL0qpVrN3DqE5pR1oewQVXt8nwiflZNIQ99kVfM4mXOOwcWzRm2+v3qZcyk6pl5bi4tLRDrGsmwN4UhCuYV2iJ5eCH0PVsoWbiX+dfSsTCjhXH\/b4zGws9oOSzdXiYZsOa+2rto74\/DV1mMyX08ZzNYThMEb67y6GCvCqxJx2OGgMaVF3HDFl4EgBhUl7taFvGSeN0745jC2VcXZEjFRrVgXQTz1F9TpaQfP9ODMjZmwZl\/25Ahp5TSjzDPUjeer+ZkJd3NxbjNC\/B4cI3qdQ1\/LPE4D+zl8oj5OIm6P8Sdy4ROUmLWDx0ypVh0AClt+K0N6LA30n6aonPSgs6in7lEE40JNX2yN7nJhHWaqp7OH4y+WPjcu5tI6AB\/fVr0mTt864\/au1cM6jPQ8CIhyDYPnOFShPPQln8ms6gq+K9t0noxR\/ieXxsi1Atm7bay8bFfm0nWw+htvCQbZpvEJb89z+AGOAm\/8MDcQ6xG\/5LmOc\/Q8uAM76V3uhBet2WdVwqqAehVbs2f4MaNLz+psUJ7o6CY4jsA8cLCudNgPlSCuq3znfnCGmWf+awQYacaRvuUwlIp3yHGcc\/m30QhTbItx5KzVaAdk0EqZANw+TKOGkH98lU7kmJZZg5hklvhPPPRArGNSyWCQWDCCznxGtDNahUdtUb51QkRQFEyuM4vl4lft6RWdkffomZbv3uiwEvXRXuX0VtRkxiyglMl3wWkuZhx+zlu8OtNl7\/bP3N4VAuMqq9bxzMbEvvgoLxOXKmcwZ6Ww9aAmXB4sgGQiRYURQVdFoLOZTDRFWfbMLKmPZrjHu3gdHgJzg8bi3J4GqRw2H6dat7meDiar7tA6M9GPOQ8riDiif4wNPMKFdSpd7RnRc49kpTEgIlO16lozQB6ICPE\/fxOnFofFWM1M6g3UWGnNpuxILsj45UY91rtW5\/ZYn474xdgWUoJKhcAy9kE\/jPQ302rxnduDJ3eUZSMVkElMODrqxp+c\/\/5whoXX1H7v6oH8yJWv7s9Yr\/LE24O8YvjatFfyCrOgmPIMWBdPZvGLUZUlqvGco9Y103JZgzkXL+TpVspu96t+qjKq6ThbWXDJ+rPHG01l5LM\/ILbKWa2WxWa8YNH7MFS5AkUr4duKo27MJEhTndYv1BsMQpgh0cIbkHDVsrUSPOKcUvPBPqrJeDubrASpXStVvgeTxyY6JDzVxbOPVaitdDFTD7Habv4v2sR5eGV1d9mdSMn95PTJc\/xJ5l7UUS\/Ho2aIKFATYHbVIKhUsWFpXZRcR52Irhn5cRTzqX582fTeavaxvB\/uq7Zr79rm1SDRzWV0QQksfGOl8kDPRcuKfOuLGBSFwUw5Qj6G+3KEmGOjHIcHUy8zk2\/mwz3aUUOurr4aw2uzJWp542LcXUPJgt3idRvqqa3IKyroy\/TyycXnYn2R0MPUX2YU+rLUxDB8vCDX+E2w2\/u8G\/\/rXUSoUHLTqsscG+t63szUyuo6LNsnBhnjeqDVsvoyYyS\/o0\/4A+qdjIpzVnBigVexOT0Tndo4f2gW9BJcW84M6l6j76e54TC8H4iC1b6o8V3Ozv+Yi+jW+eF1pmazvIZRzr2Ff8r8ifb0nfs8DcWF8fAhAcBvZQ93loqIx+hq28LphIPWbcEMi7bMCeUpgyeSv9wm1tPe4becCpNmf3g2j+YcXOJVD1fP9bjvGaXrptYgOUK9wFSPlA46wxohgXf8XT8EaUFVs0b+uobA\/aaqZzvU2wzIXOCpM\/cEYDmAPq1L9fBYiErDy5Drel98KfjvEbshSv3sPMR7wdEyzGRV39U51TXmVY4xlGf0kHKTqxFep9WOPtFH66z\/PqumkLGgDFywFmk+Zg7wIDNKVOvWjmcnuCgz+CuLJjeNUp1WveXDrOFd7mzHeYicGU0lfMPIfbmp680lI+Xsr6MtxlsPKIh6VmfS7G\/eHsZbfNWbcxXSxuLbxe\/20OfSnzNtxdVTk3nahM82B5ybWkX0EQiXJ2ftPgqsQ6\/nTvZpz2oAGf42f+k\/4\/PqetRD7TzmbmvxUWgdSpJ8rzdq\/KGmLRhQQ83yTt\/fVy4GePvRk8akbmnry\/VZuaRRK+r16KIcbqqriCPU1QxUyTxjJtc3L1X6nAToln\/Yw5yVX3B4PS7g+tUKo4oZgc6PKtBRPbUIu8VlqENqENGHOW4Uo2lghCqowwgLUw+8WjdTjjjH0Xvw1ZsYE\/9mLcgREH+2dqMM9dpwFA6hvNC6I5uMiyMKRhu+SA30eHgw1UXazItves\/YgzUiA\/ISjclF8Ob8f3DLPiB1Y9CZ5fWqBgrfc9zJRWYF2xahjSUqwTa4i\/qDTlP34frHjMMvjcxWGvOwXFQKedlqo2bogPpvRGHsqqExnmwZH97j6hDmAeu1WusHwsrLrXncjJQj6nHmWT0msad6EgcxD\/OY56aeGgPPYem5\/obWqHpjkBariIlC\/aSa8aoPKnGz0SOgshMpaojoom1guTTUb294lSJ4IRIR6vo0ODttlskah54pCH+spxMf8EwwO0hOlKr4VM6cFwQnZmfG+5\/vp0papsVbRqGrDNTzVRK1kTzWRaceBvUoIFdAwc3lodRu9AKFBMk4FbUBZLzrKZClrrkSMgtlt2n3GyJbwvmQR5xB2Hj+g5tkrVSoIxo3VifT\/Ewci54ZM6gBx+vnQFnRL1YzRvwyniH1Iw\/LmvNXhmGFic\/cuz7MsyqgGCdqMi4+C0xyddzxMa\/WC2lWXmWsLsgl1vLF9yqYWJt\/lOBWflWIvVoJlqu7AWkPE7augmzyn1zB+eVH1EVviQsQewMXrhg7HtRH4CjHDYLLcHgyKNKo77IHWEnFooxwAxiR94MjXrFncNUxgbTLCflBc\/T2vCJ6yCWjYs7rpNCNVITMSZVUk\/ZvnWRGDEMxp4mLjAdKdR5U4kaCGZ6+6nRcjUT14Y96mmw7mecKHxjktAbNK\/9FT+Va4mO2RJEcCRvneOLqXeMNNhLGh2dg1c7kqoFzhkYcJF00qf16s8T39WfB37frz3qsPryK\/3WYc1f4ijJfeQZHEG4JMraqh9FnLnMNaLNT\/SdfZl50UHEgMWMvs1jhcR2wqw6pzwgwmbrKJ0fbWuctwudv16bP6oy6s8diKIhFD2C79MLv8N\/UGRlEx1VJKkUXf6wO2\/AO7FIdyAw4us5nSbn70jGdlSUnycaya9xNMwSO9H6MDY58sZt5Xa3APak\/aNPr2uXS8Efqg4g8PdRbUhVWxD1rRcElYRPcB7zPT1xXrgageieavStMvS6+E06AF\/Z8bsYcxd2zOTJ3q9celsGeis10f9djjTbKvmxFW7Je\/Um8wnFAFZsIlgDqFNBia0WuZLajwq1j0AE3w5mgScff+C93UzvUYnPNyiOVuXwz7bTCPKpL5K9fhltElilhz1QgmakXKuPiaqpUdQ1ozXP0+BhIDMGk4r++HwaPc+hdSGT5bNzPPgcbXU+EPWXlYgguYT2a2j0e0EVQa6tdaIVn6JoJ3p\/866OYFdgv2zXm5YJkt1VYPFJ35FF0wsaZO+4odZvId2ZWLhGnTrL7eYrU4VWP7ByHkGqkSvJoKj9XwNcbktnOI\/XoCnm9IqOiXvkd5M6erdu6tu\/dfvtD3ESLubhF8\/gRwdx72u\/OMA96q\/Lq3L9x2U8u7fytZHALk\/QIjPqEylAR+lGijyZ39l2vOJPja45FH3L0K8lDMem1liHx8sedc6lPuTVIMmgkjAWqenxCU2oOd+dmJC\/7c3dLdEQ1OacoWxATqztDTHa4HwqKq5tJhL9NZSLQytjYT6e1DFynhmquqqR2cY4oBGN3NVo961iiqj02hAe9Mwi0yPxEj69Y3VQFNdOMh12nkmXTVeaMSl9IdaBr+keOoHeenRGzoz5Od9VSqxrtcZRlyda4Y6O257xAfjcvVmkZnDODwQxalzXU4\/lQqfxGI7LN57FCPLqt+xwOgpM7HuevR\/DHgsWj9X3X6SP8ZpCzH9W\/qmOhXt0Gq6AKrlhkiWmu7kvo4pKCSOqKGgQDXJUpJmdqt3JEAYuhvG5W5CdWzaibjG8v9KVbmxwEn2Tj5798FyDMLg9ndM2+amAI8IStTLKFJxkcT15aM6sHxd6uW0af4a4Zq\/eFlUPDXeu0ip4cIzseASeeo4WZM9dBdf5O9uDBeQX0Eftjt1dXSA\/f2cMnpoogLt\/d8wLTcLaEU7veP7bJSOLZo+RB3mzMdcBVOaK7vWUqE+3R+ezXWGbGUzM6RlhU7pP9ZSpYnE9mE4vkJSzR2gEPiTtMqJOTD2HdW1MQwVZ2fQ1tqXDoHOC4v0Vq9RhfQoa396lg9WuvDECr9HXMAHRND3wvRVfmzA5hghnWMeiAVGVnl1HFq8A11kFZRzcaf5JZrRfoWq+RaWV927gyZizMspy5bVAPIF4HhJ9iPK3\/1F7OW34b7u9+D5Qsdlw2oT1XHQ7OiFUdNcieU5vgLOtQUAGKRRTju1ct+Uacqp19EjlRuWgbROeKd9gguQ7ycXKuww7Fp9PzWqtzPY3fCsUIp4lWU9qDQzmWUGeKFu6KlQwTdTNTI0IdqTmtCKBEJIu7VVOc07EHiIwOkfV53s8kwMpgMGyWmNXbyHt8moF9qZzE1N+qCrNzXSm2qLP53VGMlmc0wVRmzOoAh03LPY+XWDBL+CjMuWz\/1hs9h1qrWmBV70m8iIU8QCYTX3SxiEsL9RTgCbfkesW1AOwtQy0CyzLM10rqyPC1M47mNVUe7uRMdh0ONQ96iE4Ulketxuc1vd3h1dXI7MO37TiaW2kx9ihyY08mymmtn5ZcY1PnlrokojsamJPz4oFKzlyidOmHCPI9OTjJoL39FzGNArqiSsOohyS+cYJWwHOqINOndovlekdzWN1FFGGY7AMKrPpUYWZTzkGlpy9mkyoOFuWLcjRX9uuQ64mGCz6tnG+00LuK9yKxPIWez7frTRO4AjiRyuK8VZ+Fpaw46nYG1jpPFPM4noua4yhJWyTOyfUpIPjRwZatgje2gZ\/QIONDOxcVqmT+cQfvRLZ13NVAZkHf\/DuEnx6S7TJT8Ns12Nawe1sRbH2M4760qcckq\/rgq1Grm\/gyOmIIo8YlBQa5w9tecVPHjh\/CF4WBqIKgvh4kVZDYdWTR5FW1anw5oOuuOiPym1yGAauLIB8G0deYLc46Hkq9AiuzI\/Jh05e\/yOKMj8+UPWuZojA8DRek7sBPPqEPE8gIiVrvJZA1TVZAYTPmzPEo9sFZ9AreAELMix90scoU4zpOmTkkQ\/PucGjiVubo6hqE6YB0DYdu+9dlzrheH1oNCoathBdprlF5b5HGnFI3\/QeyniPQo4D1MMlpEa4j6SisBKqPiJOjadlveeMeQChSsp4ozSPuEUidvr\/FvnXEOPkunxu5CiZb0AaK7lgi7n0+PXmnQY6B9D6LdRlk37EFcH1Hn6DKlT8zWxmETNLXRXtrNdXPkaF5Ld+Et\/eb6CCbkURk2mp7x1s3t\/q5YvbwcWq8uW1U4mmyvY7+ZR6+8V1vmjtG4gbqGOf7VCt8OZcS5qna2GeRXhcvJ1+Pp5LEmLMUVA9Mbd3JtfMad5LBgaSSEuEwZfRM94Ry6TpFU7muUdeHGQFYqOueJ\/d4jYsgWRO5cBH100\/HjcanOHsfsdZMIpN4o8e3voHpbQmmk0OsN7UBXKke\/L07Zhq9jBY\/n9BXTYI2cAOjcRU69UHUq8HBLcclW0d9NLvyXxiR5qOkPFJj2Yvnc22E1cPo51mj1SrpKOuVdFxmI7NObuzp5SCqiNpz\/Ldi8JspNxoZrzOmmm3BulVbeUf+B+doLewT3KGkrKDCSPCf339NzBP14tUM18PielYFRBr8c7yWx2Yj42LL43O4RsZZnGavbl\/sgK5hlmQoGjjDcP0SpYsyUG+068\/lmfgYCx4x4q5rjNK6rWWtHrskmmRh3U56u5UbuafGp+V4CVQaDWUujx742N5EDb3I1KoH2X\/dIkhSwUT5ckpiNvkmejhpntXhxgOxntBn1+VSPZ0dHJVVdY9ScKVLkIJ\/yTzjQ2aU4L9sXAx39VXV7Zot0QoLBLU7llBcs4lzN9JDASSZaCcqsDttsR6BdzNmXmf8zWEr1PVo\/VC5ID1NprNKCV+Hc3Y8q9l4hMvJ68SZwXiq2f++Zf5asWL1sMyY\/RadzXh1KC3SLsx1Wi2z8XfdoEd5dg0XbCUeaSOca0WeDwOZ4I1ata9EunGV4RkvqkG0jIpzemt+4ouzSqQfR1IevRLGD3fOp59B9TesKmyxAYsbVZA9M0zfRQkHZkDaPOYR65Dx3c32VEleK9NAJb76TT\/rlKQgLMtxhaxk0NggZtoOE8D5amVZKzzBVnxr\/eB4PLdXx3zvebXClCLHphvdEFgQMK30KHP8MLm6WNg32JqJcO\/AQ0lGXs\/vdSxqZ3vIyhenZZWSY78fCiakD+INir1qvZWd\/hcl6H04KUhKThOx+hrqDrRWu4gazNOzXmQp2Q7hkpvhIpkRRWwLU9fhmcZvR15NKkNzhER2fVWu9YL2JL8Tl+QD5VsH\/rB+WuJbD0ApGkmUUCQyZ8WdQ6UqYVmcD2O\/v9YnLVmV6LZOx9pg5dpjF6D067Leofko+6SnqlkKsVevhhPqYcu8E+2OHQfmf+S10aGtVj410vpmVnARc9QhMe4HWWUjMKwCvmimMmTScwTl0IQNBgKlVub6trA2TEBW+CyGoxA55o\/5JG\/hVsZ7vlKmbh533W2uzbxcTnvEWGc3OQLBjqwVlXrY+1xmDFRQkECddEygDs6pa1mEHMeuZgbXy1FUD+xDdc0Yc\/xiQpVjFlRCQB3CA+NhDo\/EgryUaau\/XE7Fw1GpXSr8mJuo0yoYr53q1cC5Lg0eCA0GrZPDZcPJzDM+PEtwx9ZksR4sPc8KMkyB98y4jSgYOjaKN4qAUP9hZvdAfzrgvp7jTOIPLnO+OJq8tkwIj+OWrBrwAUuJ5cV08Q3DcnyJmjImKrw4R7u\/bcr2y2XZl+ovpxRFdRDhAPZepzCzjc+Ag8vt\/SZisgu+QYpMpbuhrpvvcIErFpV\/\/Bl1chUMc9TjZY8q26q0VQOfJG75G+bVQXY6vBsuyAi4Pp9opRb7ndDJUpi\/cx0QdE6bnXJa0YWdQOlgK7ifWkl1TsxlZZiKvFlLblM0ZZTHJGHRVh4owQnjbGWrHW9m5PocvmKuxDZ7tJKmDrjGNahKncj27olac3zh+xt+4HrWGeS0BQpbU6mjeqo4K\/AfPU\/7+S\/slRwFF0SK+p1G49c6SuKvcqAHzKY6Xe3ZikyeUY2tLUCflkAKSqCqXuWhDpyjnn36aYxEpW02SkQRjxj+7A+1UF9UH5DIr0sAFYxxkRAnM\/iE8VU8akVvKOcZ9WXEKmDyMcFLrs9noBLg+MlrtVgcgyR\/Eynw5ex0IKd+LxbJDfNX58uyzWFkoXowWMBYTKf18UAq8tCj2FzxEjywhisD7diqUMNQmdpUsmzU66fCP2SdvBqhZOD7v59CwvOFNXsFSeu5bP3DF4PP8kzyuCqIQYpKEI+ydtgRXQx2Wge0YkTRCLKQ6kBZmykQyBaN9bdvvvsI\/WrV4NJOIzmu0shVAdZZlkGoF2ur3+8yxB8mFAtVldacswYfnWtcDHNg9El69aYrCu5D1OM9cA6MC35UAerzKpaaZMsivMovRzpSZlIumySXl9Go5Eoequ88dqTtd25Ahyq0B7TLltQ0mcr8lZWKI2rDKnyZrYxcFrl4WsdUM3k3F8aAugYlV+dEhFETNtuIysxPtQmtJB5yc3AaJVPRnry0RMvqX93NtXscReK4\/dARV2DNb++lPb6SKs3rrLuzde9v\/b3TR\/BCnOhAgk\/AsW3qLvt3i6SZqwQnuL1SbJllts83g8+e7W\/qZZ7lykL87rQ+tT992E9YaD5Bntfxx8UG31A9v\/sNEaEXHp\/mtgom1KlnVx3gRkcAk8ALqrTVqEtrm+W\/VnpJDaaRt+EInh+jH5PTsljClaG1y93FGKymHzw\/8joK+vG7d70SgXnKiOA1gOuYwKuRAtNq8fFAxxM\/M3vkOstlV30eR3YSwGhGcBu\/HzrRPXDsrr6JzbsT7meZiiwxPqongA2XrG9tZOAmOUu+hsValVOtano9SbkpRcmG8BSjZRbh0JlR\/pT3+6huwHcWkZ1FnevFK3Wfkc5f0SGrOlZqIr0N2qn+WQGVncM7YU145PiiQ5\/3nu\/dna3VGJF\/6mEljC9a9mkk8t4gcjOQ\/aonx3aqgLWh75541slGTVJddb7jjxLYBJ6aqzqlj7BIev9a6BG7uUdVHpeRMt5jr7JGWG78bvVuVpDwsT6h+PtGw3eqTjbGg3K3sGGSqZ\/5O2ewOTeJDrEVV424JmIbvjdkzmR6TYkaDjfxiSy\/W2Sex1PMqHZFivsI68VBJHOLdeoMDNE2XEGUu55IfaP4+g6V372pcud0jIXqy31sRVXBGl2RpPL1n2IWrjBKVeiOl\/4dNVx0Xp0ZlfnSRzgoPkV+1L\/NK9TWYa9z2aOU8w2HeS3l3OpolZyHy\/hdY4UA6yCqGrQKN+mZyIRXtgx+k7se63C1AavfvujGOvhwtJoDX8HI5nHjXc4jK\/xLXaf52Qlmqr+sHvqtE7ADCOsRg3CW2oG\/4Ix6ot\/evMLv14OdI73PksjMr87qF5PB5DQjTxwJisd\/eQT2svVmAwWcLOOzyLlZrnpWQ55jwqlur44sdqr01j6Yy0j2iGixthzEirHHyaIcvZ9UHd+7Krix64CvZRXTqoQTnpqqxqMD50FUrB\/M9GgVFWtUJzJkrzo9SAxz6s5SRHv9vcfxeDW8mxrLfPM571\/1jZZsH+k1bINjgWVmpVx0BkVpqVpj1d\/rjACuqlKECxiL3seK1ZF2PdrPnUWlWLHlW3qi1HNFW3NqjHQ9x0tUZNZjrGC\/Pde9BWVgEzTC9Vy5hGab418em\/1AMVWsqh8jM9NzgIcV9wNHehG4u46v2JjZTb5nFDwOTmgZx5krKoLvPSpVDkhe4Mx4ijIJ2Jnxe8cUxlCWq3M9jAep0xbOvFwkHupo6n5B9DnfXeFyRCIQ5DO54F19kJ+qN4\/\/YyuicNXyxpUeUXqVt75ex1unybiqBXDv12rO4PS6jbYT5XMm5+vJNQ7qdE0eAwenqnLX6GdGN7NGj7CaIG59UGISrJKq8HuPv4Ly1nv+OhaUu6VdmmGW6ugxetHUNrta\/dDPd36BMKIt9u\/qbObG68ySnll3gAJ\/2O6N1own+85WdcHuo+aPw9+YyW3li12ThTX6mQU4xOMTy4eMEdUBGbONVzXBYmotOlkmbE0lbmmjc4A4iWeQNE9wlTJtNPnrhgppJausRYyKcK2BjK48ioS+lk+0gU99gi7tYYhyE0zj98eQhUahOkou5F4YN5UMu9dPJv\/MNPmE9cE7bYIlkTCeABfNa9TFix\/XbuS\/1VUhmorAWaK7oj8jxx8nO\/DUscp6wvVPnUdy0nkGbdYoGZ\/WuLpNT0IEop096hbkJFabT\/ACk76uJTNFJ8sKmeH3SsVk6pz1RqrZ6DGzrIHMSSsgHqWVFdzi+Xjl9A3WBMHUK+Pnr3qDx0MneI1\/VARIcORUPxF7j43hNPQZxCZxqbKhLtTZ8n7jtHyceaAWwfYqsCNFxdYdgIfq0X7XWbSxLAWHZqroglqczJX3SoUZF7VANILPPK+fmN5ce0ymw0KMfnDIX9RWl9DWwt5V4YxPph0vNgXhUYJD17gtlGCiOO3QV++dlhpIZtM33ESW9ioWXJb10bVZZmfV4NZYQfYsbtj6cRrkXz4AS6DnXApnYECLeIFXDkGHKlcrxxEwgXu+7NMZLVqr760Q5y9fzLxgJSvav1SCLScGuUoOBvMowpT2VFI\/SbxeFAw1RyB5\/fbVksxGucjX4i55mHogR9UiMUnb9Yd5pN6j2cF9a\/mND2rOURJr3PVvMgt7B\/8TgE4cVp8WB1seHekaCqR9Xmc5N\/Np\/XZkjwKT6R9vlQgcG2Xmjb\/eQcfJCNk78aHKylhgnso8DNLf6a6VelVC\/9YMj\/wNF8NqRtb7ZJdNyF8qkHoW7Y4ENFsFRWV1qK5RXW30\/WYURv4qE62ohbQV1vl+uN\/FHDmaSq+ORJ3CfKsMsLms3vC3\/oKQvJdWW89GVhdiNb5rDz4t\/+hJuEtHR6twYsaGclQjm88MNegZLIaPHq5iv6m67JnRWTvox6CmV5N0xqNdqaQpcxQTLWcG6hfjhjuHq7lyRuYigqsTibgY9FiCeXmjzuhbm3VceTYxoEXyHW4BfzDAeQzXcouCID51EArneBG5qrd5Rg46yD+VJ9Py6ryLFwfvbgmeTtWtjuMiezVzujTadLS0aEtVyboLcDzvcXWiSq9rOnziL+QM2Z8x2p9ehfnWOXW15cyNgs6S\/ZkbYyRKRAF+pV8Z3LrzPbZzv9mZ7O0ctsrhhiDifEGGX0SCh+SBXkCSeYI\/WpM95mDlF507czTdmIK0OffduumRmdGteSlqXj\/w4iOcVbQxNo5dklu23DXGE+nph2stfjQmR7rN6Y38ZV28PqhQNckOn\/oyAtR+VjKpKuLFWffzm4Bj2sIVqXky3+Hn+nLMYiIZe2pdDHb85ZDqC9pEnzBbdRiUgwnwOtv4+XnYXN8MsviMpLWq9xyPK75EE6OLW\/w2iy\/jGDWPUe5wTrhiz8vOuzM1jnrN+VK\/kbgElbMibRNvMNo\/OAr3TA+epZ13cx+BMk9mnigEr3XTjUeYNXGdTIcpxBT8nmwYx3KU7sCK1UHu\/bdZe2ToXWEFvNXtYv9che2lRoLx1kIrnprW9fFucdNPOa1WPMd08AnjpOB3mRB0lvezQuOuKmXVICWYp+YDl1WF4qZoHnR12y\/a40UnNzi2usScdQsT0aPV9FNpHRtjbJdyT90S0bKGjXy95yAnWGDVMP+2PredzCEjQa8HgVkVZ3YgOPnvWkrdOP149UsmlIPlbPiI2WXOHEPxZxXIDHBXVlyBe+nZZqfTq13pluXxxrxP\/sKA5XVmAsfm8fJBZhp\/KG9GDeTPouZ1i7wrV\/BY3iI6rtvuVbBsLuEcW3FOallyUH40R8aPeLIlZ1XAljFCfw2vms6nFWQ4tuFHjwU7n5qe90KtZp\/p7cY9r\/AJXzLLzGfup260uNr6VDOvTyVOpj9HfWcukg\/oQj6b9ye73JGq1Dc1OWyUv\/UFRXvajlecjXMeGV7MdSXDqqGPrJZ6j1B5rxzq+RM84uXqUf+6Uh0\/43j1UU2xYk4x6o\/rsHT0qsxlUK902asbpaqKaRx7nGeZxa1w0+ouuFbRVnNczcKpw7doYD013HKtqJZwWKup60vwURysmoIfvNOsnfzsjD5OjwYic2SybsJzUOf6dIvgjh+wn333atYbMTxCvMpoaEr3t2LMll49kQsWYRLWjuh549SVSqOfMeALHNHoK6\/O2HS\/E7NZk9\/RUeonsZ\/Z5OjscJJ1ZQ3RFmr0Vmi0hmpkbj2ehfcILpqBstNoEizBKic\/tpp8J7doRJSh6HLlCjrSNu\/UPeGb6uZg+2QebFVZ4j6TL9gqM09bQTB6q8dqPHsWMOrQ9UjwnChlm7iljGf9z1fhuNBy7eYNzAfXxD3K1BgUHdUTOCy4DOvCh2D\/VhQefSgeG9NTLq9ggz\/k7+Ydb9Fso8GzDVfHknGz3ZG092Y7EIV51D7q4bBITonv6RAcMluegrjfIayts+4vz7tPHUp4lnZ5p7EM2\/DN7eWeqroIOGe0DqKrKlmLtcqtBGUSRmXOqJ1WeRTCEb46izKRddAzSOUJTMbKYKIPikFldLtObPO+nm6dRTJYXSNv+MFEOSNNnjl\/3SOV895skuv0526MCBzyN1xcjCauqY6p01QLGWfWLy\/FP4WxqhvNb7YJzsUfOnEeMxisu4V9fvR7PaIRo27Nephpcl+MFI91G4eM8uGDaRVPl9zjlVRm\/T15kJPIkvpIrEEzvO24qLZDEPHDn22Gqx7JUWraGgAlsnpbLVczmua229kXWWEsOuhWOOhKZBm\/78sLd68Q+tV9yAFXOcxRPQh\/bX\/w1M0wgIvX4tXsFxaMLgcxYKH+vFuXkyfzWS06avq+OHH+5HTOPHSFk3YdL7WQESUGtFKWTamJTzg5GYhKoBrkiTUh42LmoAP2nibyr\/NFwZ2rY7+\/5Pmcq\/tm\/qCrqpIj78lge0v0vIMGWW8\/e0Th2HWqY1pUe9hWD88zUcPMec0o8TyRDN\/V8VRZnUWu5k588n5XU0bYmMv86eFqi6628neFCE56pXkqk2ov1Ij3XlkGGvGbyRHfZT3ru3y2Z3BXbnSdyVoANMDmclP5DapEjcN8+AmYEh9xOihCcAjh+aCN2jwODFI3o+CL30Yz\/TwYJfrFwPceDstqKEJpMTOMiy0OT9GZyNWTPgbOhf91R9TlbKG+42iQDr1S8xbtS4UvUlA3lKjHHsiKniBJLMjwROu\/dCtWpYr\/KHhif2sU1egHR0FJFJFkJYN1JIP\/8k09cRAJpxO5Fyuy5rlHxpb67zUH6NZpIFiBzczdNN0VZbrvZyD6OYR5JcfnMkrq3WoFo\/JNEVkf26rIyMXkqnOcSUeLZnP9L33ld\/Iw9p\/R7sjm1WRvjinl0Qxq1sRkYlBGfzhIlYcVn+6WmJEh60EVl33kXCqAUZqrVBIamgq1VuiFnl5Ve2NDNskkanMrM\/CpZpG59JxRyogqR7O7Lk62AMF1dWVzPQHvhOfiomQ4aoIqPfaAIUTTaSWsqp94fEWPg+h95XGRWax2K9q+2JbRUxIyKtv8+tUfLxCGJzJmzl5fDcEf0LLxYzvuJkUcOLYDO\/IdufT1HvMBFzoSXZX7nXKBC9wAlUK7q6\/lVud\/TGuOGo+ufYLX5A2HJ5Pbjy4BhmOt7H+qVHHbd6mUMDdV2KPxL0J5zWvKZwi0WXLOX7ATdgrlMjqqgypLJpjguqt688zFmoWZRCYzxXHIWqk1ZMH\/uFO2rJGR5BkzmvacbxwTqlDt2nWvPMZKg8oqO1P5aUNsLHtn6+rE+n2ZhbnQGzimmnUvxIxXWbPxXvEf5DnStAmXe3wqUf7+Aa+EQCbCNYB5+xZ3akln01VT14y37rnV1PBUnas6HcVsHaB41IlxEcverej82iCNq3bDIa0RkK7O41yNhd5G3B2T4TlUF5yIKy+cXCMU1evR6FRhHVB4G1UFF3m91cV43Pp3\/VFfuVfn3apkzgPqTDlrzLbkyZ6NB4ok4lwHEBVdb\/1C\/ZgsBUfUFZTJzz+DX94vclWSrjTkyzdjVMaxqGOrsiZG02qqOJWzeAiPmsWp9Zkz13G6WvFKxsm691d1nvAwbad+eyQXVp5xiQZ1gRWfPcL0ZkHGMWfzVzbfe6+2LpLv4AOnhGMkuujveB\/1hQyq9nJEWRXeYh5hP2bl6GFv3FnWcXXu87qrbaqKWmhEVi\/oxf7fMehiLiLm8HU9xPTr9eEYea4MknWmI7Caytrfe3wDrw733NWcMSuzJlJqYXRk4zUl3SPxQcfiIhhBvXpvs+J6sEBVhiiY5qKeq1lbrTJtZrjq3Gh1Vdf8MB9rO4hLrjfndY2g6B2pKGC8fkusrqWKG19dlVuOKz8WoyCIOsKDgT1a8jMCcYKjDaNHHXPQkznf6KoLPdaCVsH+aSFzNW\/kWWYZTqSXF+GM7o4TwJUwITove1+uRTp8Sw9kuL6rXES17feUzexad2XU1j04KW+2Hbncqlv2J0Z1ZLruui0U8uDTukpcgyXq01lZucf2xMaqqEtYT+rdkhgbUYYXp00QujHoMTBGdEpQJmc9sMcDBtmMDWcm08q9aIatd9atNxk\/24TdRCw1OBxg63AN0RKV2ZorMZZ56xPBS\/kJVwTvrv8G06kqo5mI5PlmOyjFDbVf+KDqNP3TNqMXt8UAMa1ae7cRUAsjuDojtjC5uFa16q3CO+8MHM+jXMnKepZqHziXI2AVskOLVFpXVdXO+sdViea+DhPliW43Do5\/WIK2VZCNWo6i7VqA\/qrh5ZX\/USy9GhWm20CrqTtZHnRchi9fV+FlhiDI817B2OLcFpPR4oVYZYTl98ka3\/QxZ+Oy9u9KfyQA5p\/XByNdFcxsn8fR0fnnaoGsdSs4k+yAPnLDc2qSikInwQwxggF\/\/aCsWD4qvqjE5Kr4BP3J3ao6uAiXwxaJuYqPGvra77M5jyQn3ajEncz+tmZ+Dj+vz7Q60GYZF6Thw8tpZUH1VdRMqzK97G+1nv9Sc05NGfvfOFNLZUfHhJLQvtvcXBOtquerPKuM4OxdixP9+mzWYK93s6c4tvYYlel6A67pdy1Fk3uHj2SzR16ScVkHr3JMVlxGAYvDYkLWrCuCN5ML+bDKl7Nk61rXCcF\/IKBesnoO6juiroGKbri22\/lIV\/J6zrDTOhDamjMDRUzZ2qNIMiEsqRKTQeosjJAo0+71XRXVQ2e86YXrYnJOMKOJbkYJuWZiag0ehTNBdvDcGsgHBSZrh20iRg+tQzmnvpGWh13qhqI1bH8ag+aCRv9ZjedNYBt92Va+zAHotoVrBxaq5hTV+rFqg4cDdk1Odd79xspOdVd8IxazoPXTNa675nsHjAu8Tv64R4T3gHC\/ZgnLSnSqMfIC7\/xU365ynI38CQbpE2b3GDH3AjjFz\/vl0kOz9XHVDSJwotSY82ascJ7je3mOzw7Ino7UmHmdgg6AyqDO6wS+WXgXW9FBbuBo8WGL4Iz83ch0WseGL\/9WoxIJPYt7ZM7BFRUc3otfxTH16qmMdmoIv386xZgb0YxNDqcynEoehwnEVJU\/dcFxATJ630Qjpvh2mmpqKvHptZi6ymK96N1Kpj\/uZtIKTURPC\/ncyYzufkCra7CbE\/1ShZd1q\/IQ3LuiPPUOLnCvbD8\/3xHkbZHXWOcFaR2Od2WxX5CKmsxo5tyhzuD0qyudxPPJbz2zawqcV9BYH\/M8upov6xzGwngzF68Aa0yvRl4cnJNBEbz2mfGzjgkyXHnVjzXOqGuPBVCJtOMccW9ElIq4x7DNjDSMk5nomtnqrW2zW65\/qhAePTVwX\/N57ZbpqIhnDWRd2H8UqW7nVgaX5dv\/ZQFHITuxvasLKnf2vPMU4MeKIebOxBUCIz0cc53FsZHtZt8iiry5D3wWXgpy2d+K84iTnxy4CiIX4sJ8vNGkTyuOLcgaGKvbiUqZ2auw2c\/jisM\/+gu3COw4HrLHVNouvB9VuFjgKOq1W8Ww2q2v1La\/83Yq5jung\/rY+rtvoHpXnZvHbo5l6j1cs3Q1Cx6Cj16VNurI5\/PxJMTvZbJ5Zs5B+uW1Wa3T1mug8YlnSmE1t2yzvqrRI7qttrAXDEcboNOKJu6t+jDcjAadRc\/lLeqavu6oNkhwfYZDDspgArqrLygv43KrLC8mX955VYMsiNMZB8gPz2T8dTlhpP1OMXzgKhi474CcS\/dlFI1MP28HShl7fc2ini2LjrzfeRCv7QWlfvgTVGT05OUY0tF9W5SpmZs+wtHBcxdpKlaVSNb7PmO5lVl7jTnmO\/e+zHetBGoHx9N0VMIJNuvm9fyX34J+rM7InL9RLZa+Br2mjKo9V5rxl50Y81vXvPvqBbE4X0GEZY6uudJGeYX7PCVQujzfrcoV01ajmCLO1CV\/N5t55dgeFwfye+St\/U++62GCRxjg9bxXman0uqEw7mS7fc9fv6tOHDPD5jJHSbKCa2yNmpEip3AZ9QmaiI1RxbdWW6uq6Azeje1hYlxAuHt6xhOkaop7kI5eBY+L3h7fBKXmXMzSP5HTG+phLotE810RAVr9pF4NUFIl9WMeOe3KkVpPe63MxKjRYh9RKydQ27g++Rm8nC+qgi3zWv0wMhgga8Xqs7r7dUjmmHWDynHKAk+JbjKN\/7tCfhmB83DW3bmSZHPHVfWt\/ryezKjrEDjW3kqu+rFS5PWutWdUPSPPCFcpM1q0hFpmljUanY2odCv2BpfkIXeKTXb9BN1prG5Jh0P20tfjsHQc+znKco18xV78nFcy3lT2\/OabIuG1iYEriXNvooC4wSDydet6eY2Y+E3r8EJRYxTLBWCCXoiXXrDVHt7ihy1uPjq749eXmXE57088AbEPF\/SYK1XelfPxpOowjFAvCZqzFvse9Q7Bvbtm1krUl34EbTpcUD+MKXWEsyzLMirqUf6SG+B9+NKKprKKoBk\/XsvjRLeCy+cao5nDhQPpsSWzWv9e41q+pCeUyCdfPSaO0uaouZ+znfhx1R+fl535cOQdD8mrKPS0XGdi7mReMrnOKp\/p9cpKZi3eXc0RF1cPM9hUwoxtIplPB1GHGU2PRsynA2arpLDMFvLv8SDW1dGHVlXaZe8QsFcQen\/oixb3au5shxvuvqt11tAH95yu4iQenWmdZxlkAhkU4cSP7\/QIyyOgJ67nrWucLv+pSLpo21wVCGvCwUT4lMjxwAfoJz0Ggn2Uvtw7nIZGlKMmfsuN1J1HJmSYwS4o4MxoWhw2GFZfh6LWtGdmNi4jjBGnXPUli5Np4kLlyvXV38l2meZqiQKhXdzTsY1ODPZVAfXD8IgeVI9xSDWWaiAM8LDErnI67\/ghnQmsGJ5NaJOj5rc6NUjNmOGmYL9cymiJ0vyMuupvzSXty6p62WxePrIOXZPRphjGheChwmbFBB4FP5V\/s3Lrd19\/V0h+\/GH+Gg1G\/s0GRuJ+Utaxd9RIz2UBuJ4r5HuGusd7jQOf3mjUFumZWSpkaNB4JcZBEsqXQAUFfPryKi2RrmcFs8SZvCUeeuFwuyNebX2qiT0mHo8uRKVAgJW5ikGVFt9FAIy3FQxaqK3oAes8aoRz19\/jfuNoqhb9M1bnZdCSsGzHeauV5NZotZ+Nez12YlkJltFuLZ9ewyb6ctU6M1\/krI9LJKm05WocmbU+raVK6PmiNxFIREcnUyeznbVAjvDm+upkILHhM\/Ny2bxCVKaNbE\/bW0O0dQ5Zjiwn1Z1aTW8dgu7z47KNvm\/9cvKI\/g\/uuO\/J8VarOJHyale+ux6tnpBbWe85ktGqUHC2nPyibXULnWNWRuWb9cDJyDE\/89g8REv5VgT4Ri08D0A1l63WccFdHnlwXUN88URkVq0kT77PO94VBm8GKogV8d7V0rBYmRTVo11UgvnZm3OdnVmbzNw2p2EV7sheH4K2hRuqkj0iRP1TlV7Lpa7z+S3qEdyBYb0T46GGjN2plGj6Ve6ydTiwkWDlMs9hDKKTWju2CavIdOF7YpHtOibizjxXF1cf4Rf8h1Gf\/YeFaQ9mJatUMNp345ktLi9zlVBUJf1d\/eqT5BzitZ67ozNSsqLoXT2vD0+lxY+eE4hW4HjqUwcJcAv\/4Q8ao\/CoukH7eMsJCIfAUocqeJ7hn4OrHqMhDqKDCpOvytTLjsl+MpSM5BkzUf\/AP45nFAcEO1P2sBX4Fn7ED4LiYzpq5\/eV1zmUN3+O1HkEF6awott6KpPeUretL\/pArbJX0GTOQEIZO9zsaMEEteBj2zJTeEUwqROS4eJGVOR1gnpacsJ4jpu\/1\/oqvcJ6NRbxmq5FYSaRbZWjbXJRrRy9NNYX9fIUyhCOA4dBdfIO6qhVHoHOeySbnmepNoc5m8Gc5b8t+aT6\/Ob8\/hxn9ZseJhN8PwTX8FuD\/PW7LfnWB78DTh2AVWdPIyuaOGc7rc09dTlHe+eBqXRyrOLenpwr4Jyx34pz6qrHYw7M4m3Ped8IWkPLWYxe14cvgMtgVvsilmW\/ZIGf+zzAP39w1vSgDsVh94gmLSarONap0OjsVPV8Xh5UoXu5QrOko3qzcp61btCTlqNbe18IuoDjGZ9RbW0W36iQOkCdyauyFFk7vaW1Y3PiprJbA+dqjEPrs\/UPMr0TkWOs5iWmWcsHDbMOocfy2XJ62xwmzhQT2B6H7+MZGdiqgsnPX1uz39c6q5rUWjVAnuoo6wqdNaOympm7dwk3nsSkv6OSq4vnV06pOsZjzFP0znzrPXqUnOYR+HmyaKbhiNNQuMUqg4WJO+\/ox+qvgnnYVD+VV+ZCzvUQtu424klmvj6Pm3Q+9Dd48556N9bDLDNjpN7LjxbY+vTdZ1d1MpBsy6h6V57M5Tu68zWF1iajdTR1zoFQoDPH2ybWOSY0Aov32SoIAA8REO3NWSdovGW4OqZyRdZDXcmYDdjASBkheRKETR2di3JP6+5wMPHTP19s9EfEuWhLq4wuqlM0dA2Raul3l9fprUo\/eZHDxJkZiw8oj+aRbNv+cApy7ipiHFX4MNdhZj\/8Vv0\/+DYiXaukWtBxfhhNXUuCNO++3H+MQ97k8rBEtdfaSBWyqpvLfHEYxSVVtas5mGz6q2MnshOBbrl8jcaH\/5MJYkBOwoHJwF4H0XMpzNSjVHGFu75Lv3H8qA+sTtveMU0VbDgSpY7jObILKtjTVhL3PsceO\/Z5hrK51skxpV1pRCfSE+ov7u7YoGoMJuqC4NOOAnXSDw3KuUZGRQeH5F7nq065lhL9XLVWft08LnLLN\/c99XKLrqAVU0S8UW+0gkXrOdQSX1e1b9a9ek5k825iupjw+rrvvSrytARirFuZktwnZl8c+g0B8bzH+9SBHnvmw5l03ZMRenxRWYL9jlHOHVS9gxg9lysVtOWUw8hxbiuI\/5ThVRSvgnLlKn5fZxg8JcI6SXFnb6M2XE11XtOZt9bit8IacWhUDWib2qsOzjfGTk4WvVZEZptXuQ4UTuccza47WTng6Fd7e9wgl+FxxmuPGdZPmFljQb7UASvSqnpjnqoue8Fq8AOzss6pC5zX\/JhV53b4sooTg0RcZiia6W6vQmCelw0eE\/GMofUpVkRx71kYlxbvFuXx3rJ1uWHmDKJaDn7CS5PpKopKmplv70YJ1MAVzB33AVaK261Q51uXV9wRDXmGZzOWL6ZV8WvNuIFYV0zWqp6UCuxxAmJEpc5cwwkcIaw+fMPuejVcMOpiDLoFKjGY1LVk3dDjIINT2+06JSMO33IuchU5VcpahchTt18Eg62yuXFsvfzn+4H1MoetA9ZEL5P8Ko0YcbVBnLkrKFEmUvDWYlIPB0dmdOrFxr8eAizCWSq1KnJuKMqUmFolRNgq1GE4JqIyedj1W\/gELqmeZezEjJmUCYxq8Vp1wgjlG8Sp0N87MllZMvV8b+A3ivXKuy4pS178RDt4a\/3Ua4Pb9x+K0m2LA3IAQxsJiEAncxV\/KmjGrLjTIfMqM8tD\/KWvdRbpEc3K+7ixahi1XPR27ZBKXf8JGc2BvfBn2r8Wb\/5gIkSQWREV5ufsReM66PSS\/3o8yb2pJtQA71ENS3088S3DHh\/BmcxK96QasPJypWj0zHR5EVXbY5bzbaKMDqeQFlgBMUe9XLbhbFnZLfO\/iJAZnpt5rivD1wXp+855A6rvOPPaEEvGGDdCW3ltj4jqWML\/+WEsxgDubJVVcw5BtibDknX0kRV8x9\/z2MyfqxLw\/6n0Hlvv3mEj9A2tZcbwXb0psyCe5o6zeImWSK9KkqN1hdOWaqD\/1gHDO13JluE4WjF3U+KbXTu7MuNPFlpNxvmqy\/hb686w1V7XdCoqK6j2RPpmLZPJriILpkXDerSsbM844cDR13B7aqlVU9VcnIYd2EtnBzpdgemzW4Npu\/H\/dnIUyXizp9vmbBWt3vkWeVxHBf71jxSIiJsx4V6qqnlDNvj6izPhB8cL56CkoFQNgjnA6owffqXnGTmRhGcaj6RN3MKp5Pp+2zvt0quf5cYXDk6\/9ddcS5QY4X\/pl5lz1Jmx2feOvx7Leao2KrzrJjLeWnROOtqM2StY7RkEWbswzOtsW1XfsN5PFp2+MmYQORLBWSTyx5F+3hEvZsmoJzfJr+izLXjgdRxkaNCAxyv6l2lRt1N+EZQaTx\/witfPhAJbFSAL1wF5s33mMa5tuDE4ohX4nxw625wP3nWR9UHtBeeLUrE27fUMTU038W675CWhiapsdc80v9VaKg1sn8c7tmiOm099h+ynmjB+ML1asO6ACrlqYJVHXlSj6\/84y6xSi9XxKVUoqCibYirfp3c5v8yVSiF+5PZWY3Bqt6\/WWaWu\/DKadIdyU6\/RoXXF+mG9Q\/fhvEFRGQyEIYuOKnG1f709fMVVAXJ97\/jAGY78Q8WCsnoBlZgMcNcgKyarh2Kd2INaVHrnX3bHd8ossLfaKSNa0amz+lYqNC23Jq7XCSGrD1Q+UW4NTMXwrvhphXyNg+I4JbxBok67tMe2V6+gp5XYq97K+cuSopc2PQtHPSWemQmRRTNgbrWgXNcxVFe+TSMioCX\/8YwRVTdT2cx\/ZsZ1qjhBo0yMuSqNUOKWqGNGhONIBgdlFQvYc9r7VGIqdnreuJpper\/Wnxg3dlmLVjnJKkiRccwTPExcynFlVhh3XutVwUSlx2MzjyCgSi\/3wFR1ETBCPikUFz5OilFzXTbHaKi9UUXR3rG0rhmh5zY4Lg56VV9nkGtmg\/tvrl2xs\/p2Lozt3CKcx2tFdbhUBoQ1qGSZg1GK\/815I047xFNGLM4Xf5lofnY1+9QnuMAftBUQ7AoojzKnehZZiefUQFAs4jIeauH+yQT04fxefgS7uEHwg0qAZjSHd5hvWmQm9Xm4LjNVRxzstCoyQ9tv2QZpsjdzYVYzmETt20JUwlRtpRzU+sqzq56sYzmjGN6Sgc\/lMY+M\/usJL0oe4A\/jPV5aXhCHYJRxWG1UmXFG4X2NbNA3s01U4YW600Mt0cdlEC0QYVUT+Yy6+mZrekX438osfqv1jwtLumQK48GsRPpmJjmvlqbxjGKiy6PMgxrtvs1rEbfV+sRrrnvtHCbqcDejZQz0LmY3no8W30iD1VRvWaf1QHUlGn0f1IIlKgukw\/vnlZz7+5esnhLLSqDwiRGc2TyCxdFe8b18XZy1cIJ9+uP6nyrarjtwdKIVTFiN9RvN3YzzPqmfsaV1HZ\/XUaNn6z+\/9rg7hlzNvXf0XTrIaFYY4kYOCuvfmzXHdsiQzS+OdSLJ0\/Hg5rJzPO8qPsC3vxOtzpBqY10Px8FXzOv2gEthZmLQyioX0g6rPrJrVMC5TMqcdPGw17LnojkztrKW1V23OjY1iufl2jInPum4OVxVpIFy7wLjcdkqYGoDBK5eV9VRLl2B6IjzG0xXVzKn\/BeFr\/Kgi8zUFd2EAk0oj88261DDuXJ8YyjrUkGoCWMiolSmlU4OgLMKeNnxEY4uiEpuqMRbjTGGxPh7OKu9wqO6IUronVyQbzkeBDxcmcf0d2iQyUQ7cb65GW+5VWXosfBwvLNcFU4sHJl+SFTXOZRNJ\/aOsppNmRTrxXaqHZ+RqFV70U9Wwpyxi1+N0yfzUc75G64Sm5ltwKtDWrdSZyUjWsugBQeBCpBjnpsr5nhqyjOxsjzPHdFSy2rRjDAMMZXQlQutehwCjjOqb03o21QGOXejmCi8vKK+ENU5K8Mdt\/0uYFlJHyZ3ZL+dnzoDg+EVzLx8JkPNuNUKHjN\/xshsZJbDjrxIFIkkUbr6aJTw\/mH4VFLVnXIuIsIRqAk6UHEqi00L3m18WqXHeWUrOXgLg8SR4aXVwUVI2AoUU21kDT93nI9vJXo3067gsp9Oy3p0S5BIVuAN65Tnv\/HFDsN231Ik1eAqwNGdegjmQy75aZWXVTK6iSaLknBZP12IY47jEj8+Mn83dmayOpJmmBX7wvzEUmYiMzOl2xOnlInizKh3nF9UQGW614OX9X062FGQ4wn9w7GZWGREenG1lVdhD3L\/q+uglRWc9dN1a3KY+WdFkP3BRRDLj+\/bCupWLSn7kyvmaS3BVKfNOE4qJdUy\/TRGZaXWSbYQ9cm+Y+9VsEETzExExkXoWCYF5nQ5oK+Q6XqR5pjoZo86kN5\/uGe6opg4sUb4+NZ1poyp99dTWfWw2\/HsRGb+oXsZweoXn+CCL5kjyGYcagHo0Pf02Epyz7FXPz9s3ZmZxi0rLD3Aobwrq8X+Wwlgu3jpeEAN+KMwZTh5BJwEtcFZVaGryuABME0L\/Z05f8dI59O136vM+v77mkv++xln3s8ncaeXPA73fEXF3oyScYjUYDyVD9OAW3+\/qqdzld+pa8aDwlElcvYp8g9fNvsTKaPEVSczjm\/\/tMpqgfPLEh3YOiZ\/tQHc6sBWjesN9QFWZtmBel9l+3Ve9EuP4MK4FNN1n\/Aexa6DyF+V7etsv\/8wLLA+cY+ivStLiaPRDXPQFtyeug0fxQmTgWSBMbzc6JhUOuZNRSXveAd1O95qwA2jnuuq8uKTXeu0f7MOR6qx5KbMzLjBSBFSFccndo5cMdNsoyMdIfMaDMdVlo3B1\/z0s5595toAjudnXuuK95vgOUUjsvyjhhGJug9Yiqqmro3hefSOMZ8AhlGGRfuJxA\/giQBHeKdi8mgC\/m0b3ogaZsBkZHqnJTmeeYdBd91BZsuP00Y0RR0nN2bi9JBZ0BZZHrZkyyKoeSE\/5FW3Axcvj+qzf9l5xqBXiN6CDrJh\/OFGKgIPIe+qRPnEUu86YLZhyci\/e9JKPJEVUZe2iKXv+UQNFW\/P7\/2D5zU+\/cPsyEEjVBzxqbhCrd6eyDU3+NNyxuggEZyc446+djPX7NF4UMVg3ihkRvN8jk5l9NRrX2\/2dnHa6lObiqH0SN0FHanx+paMGq8jaztfZ9Cx96iwuCKbjwNUO+rozLUsokcZzuc9WgAN9HGYvboTe4xSv39b6hlsryycp2aRFZbfSs3riX7OPc4hyimFVA3vpDKLxl33TR7DAmYzoxHNVBauHGdircrNv3V7SE9GyXjyS36gadY5E6DiIKAXI3NVew1DMqhvrUtK1sslffTGXEUMVyQmv\/kkZsyJXJeZgidmyJGbYQ7jTo8T1V6Dijfg+NkMNs\/mfiXrckKACBxOYqiFrfgk95rPvEvhd8s4aGJgzArERC4f9Wb0YUxVHPzBSWRQTaYiqUGwpTtMzYY29KAZx\/IrCN0arQ52BZVju7OFLkImDKOur4ANYeZpm62tGJQKTUjQWklwFGzmtqyiji90yMyLd6A49+bV5q+sliynT8bJWIOFMuhEhf2Y0bJ2RkQETz+SI\/gN\/mir5E63caMgXngeP7djxfNZDMbjCoHeRPJx1fvKjd91rViAYZgD8ecMhnGmL6797fvxSqjE6dZq5bis5p246KrMbJ1OXldxjEl4xLuJ8PmVQfOnISiLcwYv7JV50lKZBK8Iww83OaOy1fdnvmPAc93E+NwgM28dpH357lRbzpuvLRiFm0BQ83BrVG3q\/3sjOt6rgKjlIDH3mUqpsnanHuNOu8p9vm8O7A2n+5mLix11zA9+IEqJ9obLHn8TBBPLGZWcACp4bkU4W7EG4jiDPY+9h7Xx4XW9jR7brZxBIP\/9hCkHR+XM0aBz+qnXqnNyG494SgMb96qc8iKMe4hMVFLzWe20Yqh9PQtebSPS7CRG697rFZ5IHl6MrOgkk+olkd91Dz4IJMDmZTZRTfxP7xkZNcCMmU21KO6Z2ZiDywD5dATMuDWdEZ2LOe7AV04m5HvUFDfeekId4iWInWrJNeZBCeyAXR1uSQs6NF0xuIUFmGcQ+41sjl10n+YQdMgYRCKVkzt6UUHjZvL5g1Qe\/1GD4gJ\/lPGHF6K4XUXuWjSzSx5Qz60S\/C1ciDJc5Jm3msCMjvd4TryoolMW9IXY6J78pFx4I2zPqOv29bZB1yHGNo0nOkJ+ZESVidEM0ybmVFCy7D3i4tXDoHz+uTHNcZl5HUSqXq4LGCmzJbfiUFzTL6NSlat4Qb57ui8YM3a8qneQ2U6X5SbqDt52e3ujIrnyxpZVeDhYr9M6y\/bUEp9SbNxVoBlRVxtgHdfDdpfxYthol\/n1Ioy2ZwWRhawqqArqyRpCncrxq13WV9dTDy+IILOFm6o6tKrgNNB5NX13n6xmhH2oCdiMijrWN6u6M5SZGVDbMEPZvtzgdQhcwSSvtFYz2hzPdM1WBbUKq+tpM\/0He9Ovd7+Md2GtkndUdRgHzeCH3o3EIcg+zqfBqDJV6ydxdb1bJqz2p1euH0vt9IzhjCbKNqOwpmCvY+3UITVb9wjPsvrJ+MM+zGbZ5Vya3iIrGJzBzJLREpdpjx\/95VWoam49nbbUWVL3HQvrnVkNsZqBRYrluuPEWK6erOe4NesemXsyPs3C8ryK4MFZ1Co122OWp+ebB9SfuIMzFLoMWDRPBPmh9r7\/ig1GfriAfWa2zXS9myxPpcI2GWMz2bwEbboCHe0AL\/wQpkF15hm\/ZyyDajS4+aoulZeSUxkfdDMXGOs42bp8XUNVESXKrHABiVAdaY7vZRSMM2jD+AZFIiNtgOTPr\/aOAlEs6l8mt4XGqVoq86AWagXbWqNwIbEgT\/Qtb7ysX5Zq6875dIN2Od8KSx5fu4ajZyLPaAuU4oJojTNvpKs4tndZcZQqdFl86qPeIH2xgo\/v04EkqrBzeoMJwD2cQTXjWybr9M621bF5j\/ruPPB1qa+piNTYAAd1Lwo6a2cj1ycb2QqcZ92SNhxF+bpaD8tRq83bjAv9KFzJHDkBu3W+nSuVKObMGPUAo+GNg486EPprnQWDjJR9vsdfV+NvvrNHOSgGq6NQalv4kefVYt0NWREZdxwh2aimuK2xsjbb+kRw0Bvem3NYeLGJLluQB2qYNhlPUJAMUrV1x1XmevbggxhQ04yxWerezTsVtghB56lDvjdqchg0tQbaEtVYJPRzJRlvK6ctwlD8PmVzfomO7J1enHfdziS1lccjWmFL6uMiRIWApWmH73ZnRDIJ7V6VUC2OTPaR1blKg3zTKp+wqnLWa+ot6J+2aOnU4Zc\/skfe3\/jMbWQWVXAN+9OOfERl8+7x35sdXr09b0ten5\/ffJbxWQEmHusVWrVomtFl\/scNuAraVtvg67wcx33rmKm3zCZbW5vj9SCqN8s3dmqra6HETbaED3G2wWOYtP6DuoEX1gWgtYnhYAOPUdVjRI4LpYEviuFEH\/aVMXBtuJE6365yZsx8OruoCNqpMTjLnuCDHuGtD8Rlzta4brBKvYQpqeut8Mwxjq5xYDyoC5UW3BCvomj15OoLTtXtiT28mAwqOtP61wcOf0YV3mFceLtoDav1uV\/SHBBtW5n++YMKFZH9YsYn7awq6hb0WwVWtpgGL+BUdddr6KFeLQe3VcswLGxx9XtVTL7pafFcvZYzq8KJCBnuKttx4d1RuKy0zYfxit5EA+cV7olAll2Nw+tGUdfNHd1nKt1u0R5UfY1U4UA31RkODRoSArgRhoBzZAoqPjjGg+NVO8duNSNvlRCp1GD8429e5Omgqb1Z38d38FAxn4Af55vfZiN4QRmp7YkgsyDCMjH78ckpelSXnC2ZJeZE4ddTiQ9Qc2zF61Q6JTtO6PJBqee\/r3nMxuR07lk178WNTW70Zr2WEJVeDS0uGBmfghSVyWLmc7oB15CFcgMsX8ZyfUY85h\/3bo980XY0SQcCEolxangc0hPh03P1Cvbfiko043NYExSB56F0FzA9\/JBM7pm1q4Q56jeRnPe4z7jrT+7JNrlMb6JsndVGNRks85UhEwerN9C5lZ21T2z0wDqIeokwdXgxcSf2Va7CIFFcBT831FjGs7eHDOVbrczVTV+jXB3lf549lGf53PXX12w\/DJMgJgLwwjeZ+TuFOvhMqSTNiXC6ApXzPU1Eer4Zwv4YAVHOlVZ1T97nvccMx5ezes\/xVsx+pQHcg+i02+\/yrHeTv7c+WW2Wc+OaMtLURDV4HpGz06dwT5QAp0VVo6jDYbBTn+EOUr0ywzkc9UGNcYTUixlLJTSGVefkDS2rTrWeqCpZ1vqBj6yb6+081cuRvipTyz+oH\/pZ50Ug8rr\/it3JE2yJssc7kes5Qj45zh0OeSXZKj9V0zv\/voemqLPMBPal3jPG9Ejtp996lPgNPOaMJPvWS1TRez\/OtPXm4lVte2wVlF1uD7Tfikb3da7V4im91T840\/5UE6L7KtK53lWpqny5o\/nAs8k+YefZLufvUX6YlbJMhCIb7EF0JspdeRHJcvTE9L3e55wQWQdxYJLnRAuUkB2YDPycAuJN6u7KHzLPe0f6GT7nDXJEe1kDNC0niKQwAXvcGZt1jGGa8M+3lZzH9ZKt3cQxZ8YTJ5gRTHlkAzfUexzhjSdicBD9BgFpISPGaeGXmoHo168KnjOwxnXLAwuqKX6gNYcGViuDALK5uhcUsBWMgS+pKm+W+2613NxFBcszraz6kPM4dUVVeRBBBTrGqlBHNXvWz8WZJK6HkvCl7q3sGRzPEfsqd1EDo+IRq4lhCVBFtIY4GElJMDO+f\/FRERIQEVU6jdlVRnwUU70t+xjdg8nqlvPKi1OUKRgci8sj9uoaxpbbyrFlH1HSIPAbrTWgiNQXpr0oX3u8M5rDujqRQWQ0dvA53znEI0eZvdHQraKJIndhWFeSPYivV1e5BqX\/aRXc8xs01aPES0zu0d6XS6hDkLf5DW5fhpFX8NFs6W\/dvf5djQBbqYkcfftdJchT1O25L+qFumnFRVHhNzUvfCp+qcsIL8TPCJmN6hBPvBW2CiefDq6J3\/wOo8qs7ZvqGUePfwkPZfswzoTD8XUtCgdQrR3IJA8WjlKxvtkr9VwVTw+t7p0JypayiL8og84o4eKcf+HaDGpHNw3CqLh5PFezWTGcJSw3dkzhTRQML5Axlml69tFPsTfuq68gTzyZM1VotvZ7e5DsfJPoN7rcx66KrL67DiyOq9W7NqwrgX\/fc95kadoviQR96vKuh+ktM21N8jycWqdfxcVzOQ7rAtTRBnkpgqobYcRgKogsH4jK+t3JiMk5ra1WUZUB9uKhxqlIpmp1Amx1GqRnxb\/pGnhf\/2PLALSZy8hRS8Y7v+dILCtLXtWbZChVBqNLX3z2+h0921pf9q02V89Wkzzj6iz1cTOZeue68XJNnbc67pyYu\/M4z2R85n2\/U5lt5ZqbG6w5agpKqI77vowbGxk7l0YEjlF4BC8FN3B\/WvU6axBl\/Ok7Tjo7wky2K6Lg4Ytvo9x4s32cUjA5WuRRVhD2Rglso\/ov+hm5qNB\/OhuPtpCbOqOyoPkKo5SX30jAMKgmFehM7UXUOEtm2qw03jOSuQvprlQyWkdDXvTGrtj1a6cuKBIaQ6TPGVLzzMYci2gqi\/HyLlGvY1pFsxqtVXQ6ahe1rKOHcxNccteYzN\/oFHiYPfiMMHELinqWSX4GWXDz7JP\/5qh2+OLU91YP3J+Z\/Dd39c\/MlvsR3GcPRIvx9SodOIBclSHLm\/pvoshx4umfR4zLquF1PxEj91x1Egtzcns5du9WBy7ICme4zZA4zzy6usm6LcfRiL8rmXGWDeKgdPxgFBVVxWZkVZIwo\/NZDbQmUlcTEUNDfQedaqV\/1f3zErhuZsCoiVZloh6JvB2bkWXy8PI\/Q6DaeU+8imZqTM+4+pnWQbaVwyx+a8MRWEF1L+EWlYtRvVm\/rYzIaZnzLaKYZ\/6Tnaib5i6YN+\/nI28+8tlhg9kaJ+JzzHcjYuZ8e4XxlhOWG8v1b9x+e4Q9L\/pEoxSJQ\/yrCsXCW7fG\/txm+HNyOnNBNdYRkyezzpgPMcfeIuuww4xFjT5A\/aCGxaI6BdKZY5Uwq5BsOzoH+8GC9WMZnaMvqtQk0CKibkS\/4748JXtwX5FCRjO76Gx1eDkkiErFmJs3f7hidJQtGT1VjnI739NCq6+e8cvJ5GWQWg+IDwiO9whJ4xKm5h0yl9R6vqjOvv5\/Ug2DedRlesgxliqrdStXG0H+yjiOg9zRe7AIJxKyBIh6cc1KLXo1ao\/67BVjc7z5728z3iPgHXkYNWdV9rhR17QoXas9WFFv0bR1GT22xys7wvpWufZ48Crub2SP6oD+xLz+gWhEdYIBUEBkeFafmL5BIqxUfBQp8HhXWizbwKRiQMZTnUCRlpKPoNW5NDdbxUgPvWaUdXKgM6+XIWd0OjpyD\/bJt9xHXKaV8upyf6KbGrht2kqxjK+pj0nPoLkVfj32XBL9ONPWaXWp1\/HUn+m6Z1ZWYuZbzPJ6a51jEa0fGLEskvi+rDxPnBAjN28xYeh8lJ5\/Hn\/KfodVqqNOHrbJKrcRkCNwaaeeOhlyy6jTTtATvuH8GxxUfFRRl4+Kw8TaKzOIl1qveuMiUH\/xbzTK143Uc1Qq0WNzWZJtz3sD4rdOclwjLMS4ozypIXEKWsuRZGwrXgUTHapO9Xr5ETUjt6+qMZKiuh6KowwTU0bwYt6cUC1EhtG5HZzP+62dGS9HDssRIJD2wZ\/ep6zQGFXtGPP6oXBJ57J6FQjyw5YwtG7QnJ2ro3bpl7nAByIvbMDR28Z\/AmjFgrBTQD3ixdM2YRVglHlXR3WIRMHR0PsxtPlMC1mHg9DzO9RIog7W\/EsV5BXejSbnaFX4lSrMqoloZo1UlNCi3yyoCrbf5Be2J2YgHp8F64jLYFcFaO3qRGWYddO0yB6thxlVsBQEyFr2xwj4uQwnBtEb8KWWq+I3YhAwfKJmQWVDb9hNkAb3j28U13oye\/D6RutdLqovyt7WUtgz8f0eBXswBDHUw7245F5+s370KABzcf7ur+LptahJvq9RhNdzTV\/JUlcJ4RwiJXLJAT\/0mytiR++Xr\/RysqRzEKXGfEa7xzkzU1iC\/vQCzMl35YIZFrmXcWTr5I4so92tY3QA9uhsqufitdHQHe0qUEzjbipCnN1NTyiCiNNrdOUQlbMSXhZ0tqqCFa43ywxYE1NTdVBVhm+34u\/Ur5x7XnoQlwhkX\/asq+m1IlGUoJgcBtHLKuaDPB0eByW8V+VFy+9YuiwZVc0A8koYLUGEZ8avm235jfs2cIRGFnnV2LF2pGXJ+slULghfFWJseS1j6fVSx5HLU3WtxGidDLqLPwifTQvyrdmr66\/ONOo7Gvn2\/zIW8FyVqZKkkkI6aRKHC6eVpzlwAivPlv2xIuC28GywL9\/mM6TMvThodScHVYkevTpeNvqq3yFBNqCGiMhGW76fT\/HW+aw3qUPRbaiO7IvGyfqOKnh59PiYQHa7NVdQnNk7VphaD1CWWnT0vPkXMpgi3JeoT+8eG3VEVqVH9JrhGXMZs\/gIAqizeLK0JkuJaNgNDemjKA7HZrr6Ce\/rZFUc8kJ1kC1yPnPmPFkx0EfZPjEBAY01Sr1nUnhUDWYGHbdYq1\/RVQR\/ZFKHcPUEzlB598d\/MY537s5VpcvsUyVWctrBszKuueYXnE1uJ2ovX5VvaY\/I8yPGYMOI7eNCeNzqauWlzzqlKgbqn\/ezjscpsJaYCJej8VLMN+ox+Sk3qJ3k5fxHMjN40ddkn7xaPqKPnU34IMz46IM1Hh4oVyR+q9oTrOkJnEWTq4PMA\/Zsq2Eie0DhrPlfX0i2iCFd1VUmQ2Wx5xg5HuOLzmFwcpx1InEpqXyP56wnh1CscFYO6AiMOi2F9Zoh2ZWxgHpUhEoAS1bgxIPH69njv3i2tVxlHDXIyIsseu9YQt3xmrnKZv7jSvBURK6w4ArH6CHHeFKJ83ZV+ns1aAHzM8fZuo85Y93PLAd3ieSc1574VanY\/tt\/9rS\/9OSVRiG7Hv2ax1yhMT3n9a81vB+sSMzIcuut+Iaj+dEVuCpp1RzLNa1UbpFWLTXeOIM9RnUM0uzogcEPWokXmPrLOOWDVtdmsegGp4xXb\/66ZRRDLshYyxVFWirUOu06vllo\/8nPND7\/eqQjUZAnMuaAq7gI3ifQoL1KF9zKtOeJ2atsgWsn24kJesBIcBq8a\/ZkRbhJnqzrIcrZA+2BX2WiqTHVq4wcpsEFtIKAfZDTSps2O47yB9WwmgRjZNhRKWb9VGzyxRjLKJlf8FjmXJ2L7g5yaXOdVGcb3YouBHNwYD0nvEkf1n+3Af+7dlR\/UTBiGs5LrJj7XZ802CyDBQJ841gjBh8l1zOOsEdnG07LWTJ8HbWoP0KNZi46jlASewwnRGPyfn3NeaLgoiOHJXtBDHF5K6sMQERWDeosiBKfu0gMGl1y16qODjIW65W5kEOcDjmJ16Yu5hlxNZOJdZAPZYVEwu6JO9FpX8HkRgAOi7oRDfFaVfneSt6jH65FBrU+J7t17lV1UMs8mQWYzYjSv6s6Ma0+6tzYsjEkkvltHRBxtpJN1Vm9wPVM71fJPmp+d+1wbRJ9dfv4cCJLTZf9R+Pq+OQP2D4ZTPT7LT1gra4U3XX0zuD65w5IPk8ey1b6fpmFWTpauW4xRb1SRXE35NJa5LoV6ixH4YOZuJQ6Ama67JIqYx+2gk3FBw4PTDT7uV6R7YhJ\/wO90\/O2Dm6Mtv4EDPGeugTG5WTwJ4oZ63lsqk0nzcxSY6wUll\/oo5G0LhOviwYq7Dg2NrIbfBFtCZfe7+RheuY4YdVRz1AtzWeR58qC9gnDBSXDWrkCNS5rjxJmwPls4h5LpCqmjyoLHhfuDQcky\/A76ID311pmfLCxdQrvoKDMYlrUj6ErRRE8qxIXfcFF32lEk08qABavk9JLMULUrGy22ZlsVzfIcyqEdVf\/gp7VEo9cPEhybqzXaGXmLQp5vyvJMJAYEm3W5fjC4Di5mTOP34zqq+f11Gxix5xfltW3vdxIz8wKLlETkjEqDncT\/kn+4Ju8VkYi61UNFCW9TAvUbuJ\/+pvq63GgVmrYlVdnv+JG38K1yPUIcv3o9HFxr88NBhf1fTR9c++ol2+tKtR6r40ZxgkeQPFMRWWBx1EIqrhI6d91YGF0t0VCdI9kXiTWp4GIzBr+rL+sCgfJQTBquJnpEZuxGTAcnEBvkzLyCyo4PvXGQGWQ10FM9KiOSAWa535K641P9qDV8gCcSGTEGjGbZ7wCb4FRsbqMG6Gp\/wFT+UF\/aOR71hasHbnXXlWYagTgpGqtvEQaFTHDnksCacx9r7hMv9a63M92ZIcIcNQiswtmE1uqYB1Oz5\/oulCnzC3\/ZutGCvY0f9USfFsqiuslEvMZA2oJgr\/uzFRod0cGw66+NrpkDDxTs6e7G5\/1EmYwgY3CNq\/TT85w4aSWVXL2KK2GBkSER2hmBtQjGL61xmHoqg82R2GmQhP77h\/VT7pdAekqKNkcoVAP0LCtIpTUHDgjOeb8V2LON2kNMh9nvU4h\/YMW7pTr6EXRRZl6vlbOf6DrVYYy7vRNFYBpYgX6VCFXlmL9eGp6qv51TKc7agGq6z4wPy3Z4529Qsv47Uh+4hQU0YYosoroYZ7Nd0D7GXzU9TJMvcua8kc5IU0U798u1EJLjroExWHDOSKEzuE8p\/7pq0h1zVNnSE1GFa1uXBpzCfK6SsJdJEM40jwGyalIstUohJWdoddms7KhkvuofrsMXj2hKnUQroKP5and8l01fEYN909vKGExk7G1llZjRD4axn5BQapjoDA9kFn0m\/zACug+jpdeGoXH17h93X3idBVjtKxOXH1zVxUggqpKUE0dqIGpjCDicXzU2lWQugyPzQzB22Fe7HHUonNfJKGz8w682RlX68hEZgGS0NZUivmXya5myX4jrjfleGazxfuNbzBz32xvlVYZQVrQnrMqM5a6ArRP3qEmXoUre0ffZRJdjTVD9eMbaavYqRqhSet6ix1VmgxeZbyRN\/f2LV+SH5jP6pUvbpxGU4xS7+cxBgXEGUXCPZn9aIeKeU43GuX8rqLJxUYT75DvC5m17gQGhvIRn4vniDRswjzUJX3uoEZ06EDNA0q9+6S+T3MPhfA4+EvkymiyOVrXuBiTooyzKeyv1oKQrKTRnLKdyvOoHKoWbxCm9DzJejiyCJ917pmHFZKxtaLqsuqEnKvsRI1aVctnXS+Aef08fJCM98feYa7hbfKTsTdPVJvVi0tIXvGqea\/+L0wIBtTkYy68RhUh\/mVrZ3kBLDIOGa7qUI155l2uKKs1DjgIxsGeLy8RqaqYZ7HWRdyxT8fZ7dOiGo7WnzLDMOhkgF4nxV\/UEuzWhz68RJSeTONjyjkoysyAby6lLRGr55C55HGQpUat2q1yMnpwzVYgETZ6VgTrksI\/GSWs9d\/cjTi9JLr0R11SrZ1vZ0etE79FQHYoOqtcYaViBzzSA\/qni0LtGDWvxTlEa8k3VwqBW8dChaC11hn6hSK+foXo+QOW0Cx7LYeGBZ5R1As6KuI6I+d+ZuKSnPw64\/vGGSujbN\/qdf\/x3uixHoBWaXPRAc5XK+QHasJM6F0bl2YfdUglVsutOVVEbvKe1GbCvwn786P+JALJIz\/ikLtbw1JV1dzfcp6NP8YjEzHOX8yj+WwN857ffl8P38pxCOfR7PPdLzUx4vzH+aciq3wxI\/nzB6c4xwn5DBIzYyREZxV08zAj8McYk3MrNRVSzBcjcAURL+Lf2FhdqNhM5TAUnIP9eufh5aC+xzCQxir34nwym9mFZ1M5YRm09xdLzHzrdj1SNl1v9CpyxoPOzGyLwsQjLdEelUFk\/wW5QcHkQGxzTFccHm6PteCd\/X63JAJuld++x411lDtjDCejn\/GIM16cQnhheb8Ov0fzmDl3cdIRoIqcUR9KCt1\/\/3G+fc6Ro5oD8sCgLjFnvsIs1Jw8FYQyyuYFl5WRznVVqRbUFzSjrChvj1QTbBg5n+Su7yrLiiV5gjpVOVNWbV89bf6y+kNwabE9zL6rK8dxnV+PrbjCOCSnlWBbFh8XkNw1D+fFvvYH30S6HoXo7t3qc31EvU5mQASPJ81fOKdHQNgueNqzOFW7YHTCqF+v5mQ+akLdRnMhN9NqK2Wjab7gYfnhtzoIPjl\/K40KVQv7ubYyNa+CeFcwqDwxIJv8+KrKYO7rd+NobE+9oh2rUKzAn7QnH8t6zJDI\/cbEWbmeP2ZovrI9+9Aqr1\/sRG3mEvwE\/Tu+YTWPfIulRAfma1ZkieaCeqtfCcZTW7uGGYasH+ET7vanPukYjfLjNcIYaolzcj4vHxJvODPriNRlJtj56bXCqWFWVhzmQPeU+qlGTpRA+Lmwsm\/dCE46TrZrD9Hj6MwNOmftqBBoigit36prFOug3B4cs\/2d4\/jb43UEicIhMPUaisOhdl02uKFGvve4Vw5jO\/dDnruyiX6K0WrhYSRqEAYJqzCSwyYZP99bvEQBwyllNhFPDYpo5pPXdvzWJFt2FRk2VI\/tTXajj+nx1jtwNkcwqB5UdxQLdwd7oSAqcjASHsb\/yZqYQ0agfr\/Kk9VPmUp+4vnpiVkngiqdo\/DOrCMnvcosGjrXs829fkbUoszr4Rl5eXJ8B8fbWMeso4FBv\/eYUxAK16MKogkt41liWZUs+xGpzWeYadkpHeo34kb1udkm6yeqlPabgeSrNZPPfybf2bJ6kjmh7J2VyraDB9lmiz2tPTzEqkHGfKpjlovljiCzx53kuEXGl7nmd7hCP4SbrmoG1YybM0fTUu5Yu8cCq0CrB8vprPdz\/qe+K+Pk1WSYeSSD+S\/ZzPWI4OIcVngzLa+CGWNiiTulkmUr44Y\/Jxdd\/qQ16gd36DNmJpaolJur9Za8RZVfpxu01U82qoPt4J2jZuWN4hUmlnsYS\/qS08pL+MC6b66rWm9o5pa9UMywD\/9OjciUjFFfkSgkQ\/1bPoU\/4aCuvSaTxKqR\/v\/tnWuSG0fSbFc0i7j2jdmY\/mv\/a7kIP34yCv1go9kPUZQoI9UNVGVGRni4exYKAHNBh6g5q517bPHG4Ve+5y93nY3H66fe26fwPfFvtslL1lCnoFouQ1Cz5R33BlG85tAeKruiZWUD7zCgj8GTzOE1iuwlqrjlIa6oZRTwup\/ymTsYzszlpAu\/WG\/xE00r4+g2Jr6JJnxSB0a9l9FnzYfj6qAW0VTjrDKOQ0ZVUaDhQDOaMDxY7LKDvGiTGNhMqz2rQOsSRfTGJyPs6gcjdCUdmfWmh1O7XIO59EHZSY+B98x341S7wXn9JCh1F3qYtGuqNhYr2V0Gabee8WcwjnakBqk0WewjqQcdouegT8JjvkJHD5Zp1h+AT\/lftZ5V4yUPzqqo9Uk9q+6bPsxcVcZz91KyWacAUqPyiaZdH\/TIdYez0t1d50UR3KuI2nqber7rq6eoYe8kruKhJK31eSweNzvfMne1ntd06HVYj3\/VnbB8rpzg4CCffAdaVqzz4uqCzA3yZszRNnRXtq03qCeHhWU8zuIcES5PM7oM5Gd0xdmQ8+NrUYnrTgq0w+OsI0zA70E+DkeupspzzpkVL0T\/JhfuMLYXGG3Xuj5dXlkfx+f\/yKjMzOcM8fPuX+AmmH9qof82P1WeMxZ8rfenT2f97Ve6fd19VTWCrFuYNcoP+c6PwVMRoEZN\/qKxczGGz4jkPqi+CpY1sJ7qZ73jFCp6kePxw+DmMIp7hK5ivZI1pbPEH50FjsAHHeSnLK17MCv4pLDJwf4VccHGumDelRGmSdRhBjBErzAz3WhdUcT6rbJGHeAkq0rKNUlYQGcSpMHVxwuBTFiEiqrX7ia6djzm5KEjwvZz\/Plc4pktsQUZRQA4tqudi9zTl6AYzG62gq2ZM+ihhodtcdIZtysMjnBMroiV1EHXIVJTRlyWYbTJFp\/dexsjPFZ1TfbL9hM1HR4Gs0K6SGaTr+xc1rbx6JC2g+CLOY6r26x40KK\/S4zkIC6vbHPmmxXc4maeoPgwXfsFXsqqjiuj\/5OVgxWOqjcN8smifSe7iHrQA0eJpPQe3Fi0crbZkU02V9bDo+hztYE1d\/c7GIU51ldV76KRZYiNx3HkQStfVIVBQjT7KbSZjb92JgigY1r\/6V\/ukQLJxSjISZ4yAq8LgfE5irWqZnxDSselB6f+vf8zXnzqnWRyt+McMWP7b9Daa6v0ASyY\/j8dPd9Kx+PwznyGIThK\/csE3Blhb14RmE68PQVDpmOaB9mI1yzCgvFTYBXWP59NfdxYXFbyTlZ27w8PwjzcbbDciy7pLMC5WNnON9vwA9iFXejl\/JtZ5znH5zgeWZbNiwbVgdWTIHmyW+fLmusDUvlEhZL1U87gDVDEquE0ugSOKROVow7LoQ5BmQqIvrEaV769eselh4P1UlcXhC\/Gvx4\/U6Ti7hNzOpy5i+Pu9cQu2dN3mbOjv8lyV1mPdzp8niuLBDWtStalXiYD8w06q2qy+Wojbnx7bTOWqfOnapTsDb7K7ChvqgWLEflUik8Qi1s5vdvnwmmDsvAHoydHMFRylz9qgmPKXSKYGRd\/zl62qTNGJbYCxT5xnrro5VhDZu79qPVMOV7FYbyr79YDnDWif3i37mivjLaeM3Nl5ayPiuNkzCkeR\/0CcdVGPF18ZHkqXFY3lErRB3LnKSr4bR\/YUaMXmb1dSDxVz\/ac3oRM2h\/oYa5rVXPVzNQSD1TNASOrb7KjOyKjhtV4Vo\/u9Tj7casIJ89fnBY5Xg2i98kt1d\/e5PX55JVrN\/BXcp5IexYItfZZURkgfXcbEMfFRKlM0HfFS70o+tzxcqQacXtsehYuJ\/5WvApJFHie\/pyYykuZWZ\/g9QBi8soU49HZIA00bD19XCSKSRmtZ9Rt9tl4XV8hu\/YXo\/BdE8zrt2CqHESsShURqZMOd9bnmHRomDa4qnbCphe1Wta2f0TAuf5R3YTJgqD4B94dXrd9myl3XJwYUW18B6+Ko3l6d\/0g64U7wp5FD7ioulkBRogOuiNabe21t143bW8dTuIeMxEPLqcT0cpZs1hfxZf3r3GrL0S8VXCE1XlqxapY4WoIqOR1AbBox3dvNJzSqw2rusznv2rksqz8N9kJulMxEMf1MHuP58VOZ4++pL7tX8a7Rym\/lxmqL4zrFQgZHvy3imf1jmjd4Bwqnwo0dv0XiM7ODTUlU9VRuhPuME\/wODUrVwO\/9EJRaf1v9w8xHjPcflI76raKGniz+09GMZuHZcLhqerMN7mUheI418FynL2A8jBPvVqvelMHFCiZidMOs+HH8yoZT4zCZQUp31R9fpj3E9opdA281uTgwsKT5OX2UyrFWkWmPsOr\/HUguE7f7TM\/Hm7fs60\/ChnFSLREknxFV+gfVCGZne4nZ1UJYl1Gtzt310\/Udtr1ne\/rDWC31q\/+HQTl8eQb5gxj67dgpuScV9jUatZE3XmuJclK6UD9oY5F5lgU1ye033Qi4nz9HDEJflSW7BmDXhPM1NfP8+0Zr8pZ5eUrVU6WQvPqsdBxOq0qTD\/Sf1d3h1\/b\/bBOTpZQoyb02ZMGGdfvYEvVx2HMq0MAhW\/xg\/nBUB69\/VQfzbfp9EzuSO93ok9vwUTzX867\/Xz7d47CEWbM20JxKnqOeUS9IL\/088xSRctdSUQV3BSxAwH6KnfAx8eFfe5VJnhnbpGrE5dhZTeYL41+O5rPwLVyiyqwQMfg60YwoGv4UWdXra3bU5OJ5J5fy3qNNWpCf5abUJUz7+lpuFZGq2+V3+s64Rn6OBJfh0\/vdTUnoiofyyn3TG0n0bPOvHe6DImyQpqJIXWgQhe+xgvpQLMO2MGubqeWN8khNeqq0xWwy3YrncIf1ZJKhmflsPYNOfK+HnMBRzE2I1Mz5vfPegMi2rjJoKoYENQF6tmC2tSLM6kXrCyzwMmJuPqOkurM5Hl8Dsw7f4xPJTH2Kv3k4oKZ4d1Umyvdfc8risHenD4towYx4eNUlN\/0FXouY8hV+zq1ZTijhN\/NFRnzX1UujJtFw7xopT2PE4ILy+Lnng5qbhfQisF4SAglNpNlIPxinIp9RQ3yOXepRfQzjD7famXv0vHmArdx\/G5yBM5AE7xNpdIB9kt3fngl9W\/OgLtgl3ZsdXCiKfhzY17mhidgzdvvubfX\/fct4cPoNBXqNZ9d1NdkJm57P3NtbdudqUD3dXzCSpBcB9oeCJ71NulsGKER5eqF3hu87z6EHIWR2tvkHQ5Gnagd2KBezNbeSL+V2dvvrQ1MGmVIRjoDNE2F6qQTLaODuqxUjZo4Aqm9Dspzl\/\/qnw4X1CzCLF6D9OqsvEfPLvtsj89qy0t6xuSAGcWeXQby5YpiNqtPX8ya0gWrWfow2I5O1oPwXUewM6zKT\/POgbDe0TLOQS3YUTuOPKriUuckEf0OBMARj1KT4x71UM0O6Dxd30+ego3AlHk02iBmykYeYJbOAsPocYcL6SJYcY4ar+N7J1SCVivPz5h2rkzGzNXiuG2RPwzitYbyApnoVSCvY+B1\/ZsOqD+mQ4iAV5m8FnGtoAg4brSMCTvqYsi011fUEmp8eAwGtGIoXLgXDpsMtnPDClGUOiWVjP\/LeBDxMoPd5yx2uJiTE9U3Ofesom68upd8FMPVUdRDx6AOlUuOl68L8DrNcXu4SliiLiTZBFdwloo0\/QUKJi9lBXuhWYQP4TmvK6xGu8prP1ljXe26ETqOTFkHfrJH1rskJ6mmeq2TQR2p3XFZ5YOj9qfyu9ujcjCOqlsmzSODdjKPr6Bb2oOJ0jw2+okiHKV2omS4gGHP5Kl4rLssq022j7buelDt7BeoRz3M2NnzB247viEajS+rgmU\/I+MePjl+v4oZHmtuuysNoySy+hBXdnYfZ6VxfCjd\/LffMgD+W1XdBCC+ffoDnb7qHK2F1TIprw5C1K4e5cULWZfl+VVmKiSyxD+YK3sFJevF9OmdoTkF7b1WmDioFhWsGvX\/vrsFnOp+Mi61S79Zr6t7NNZZf1Q7VXSPQJ7AoFpkzZevHJ3uXAbasS+Os5g\/mctB8oxss7sF56cjUCtiufa3I1w72Gxfx7J7qM59HwFsz9pnd04iNQIj2zh0BdYznaNmtlfoSXiGT6FmNah5HZp9N0rDlfKMg5rJgGbQ\/BGHq5XvrYF+j87Rg+OSZCJ\/HtUH\/8zBGKBJTggG83v4NV6JjtML4hhS0Z5NN13rtmvGEaAJeAiOXp2dn7izDoYEbVZyZuZ1gNt7j7qHmCv9fNLL\/8vnp7hT8ZzdkdRdnR7VU9+rzTo9c42CiJxZbxiI6wnphfs9gWy+53msWaKGcAXZcJ0+g88Qn+gox3M0swYz4KUMmcdh5ygtPgzlUX\/rNoYx8Nb42MRiTDqnqTYVo\/6ghD4tqi9nwresUixR88sjjY8dXfKQWpv3astwcPkofJ1Rck2lnIoiRMFgspm1V+JuK8q1jeD0dsK9h65ysZ4oSh8Z70t\/5a4J+aoVyqpUbGYnxln1vjomCyanqRU5Rut4jHdkrw+ZSnGc2aXy5g5FolLJL745vg0uFge+K5FVhMlwqclbrxLkfTl9LYYsZHh2c\/VgedcLtZGDqOJ6hmLs4haIuvkMpOkRteNoTLtJX0Je+5purkncs9wydhBTNms1brnhjrJlMBUKjJJXlVH8gBg13l41n2rM6jnvAXYv5fHzbm05ydnuO+QeHROLbmoyQ8yrVK6BDtNfyBE6avmdKHA6f9xYUPZw\/bDIaimYg2tgEDEIB65K8LsRhovTg3iGQfv0CHssUXK4IUcGe8WmXc7e\/t4lGUc76+xR4QY9ipHZT1c+3s6BJ+ec8458dmJlSapaLUP\/2p1kisysugY7wyFwWI7I\/9P3dKM8lkfbdaJ0eZ21wMtGcVipVWKtPF+1vc3LewdSRWJpj3qFQ84GdXL4PDqsAXfShWiWvgVWLkuGG6oL7MDy7CJQLiM6mBAUgTmRaqWz3rI2+jK\/4uFx15kRtxrGqCMAZfUG1afb4V43OfUrquUX+3teiyCirrl4oKr8YcYeUW1AK+LN2CGdFdFB60EO4wKZoK04wOUFt\/JXMl5\/pH7ot0Q3eEOnUjN1PY9OvLw2lE+OTQfxKsKpUxU4\/A5+Jt7Ece0NkH\/6vqiTTQect3Pz\/JztfqLrm4ofL4HGc2QdQ1yiuYWLnUvdqNurQ0ni2o8wReKPRvXKoX12G4j3NPK69Wow7rWZYLc\/VawWEB+ITM1v\/+eYoiXqKCrmed45WNVmxTBe9HLe\/yRHgArZm77CAyyL2nfWGwzS4XJb4ysPy8JH92f2uU82fVq1z7no2iX3WZbrBU\/MazxEa1fvz+S7anjbH\/rdROyyOWPvQuA8mCvZDtrOFaAkRAYD08hyyEjHVx9BfPxZFonTzFr2bwI8LmYZGs4r61nf6Jv6TNWZ4fZoeyZ+rTPQw3W47eh8skF4jn0cu+ZewQBxSUpyE2YOzxZjuCxQ5\/Vkmcf\/0+PugOrpgs+T8+6K+NSy0So\/z8OKhXM7M8w6VzSmDecVyGmD8MEgqN+3gdOb78Wo1tzm8z20YAUMTbeQM3FeDzHPUPl8rq+MpgdPB6cfZS75AdzLGCjPqjEVX69GFMYCjwSJ4QBYDgSCR+OEjuHBeaLfFpI87J1f\/NZvns0Hoswjs7dovwSxZav8RC3tP7mNWoK1J3HU\/6yjUCqouDspsgrGVI2MedZ+iw3kp9dQKVmHdef8KXZUc1KisldHcbnBye2n\/Fa1z6g6\/\/r\/qqDuQj\/CnOkUzq5PO6wC05ZjlFq7HxStrm\/Hm0PXL0aseT5nt6jcvMuoGxUdXOPS6MpVPVtFN9e6lz1PZyZW9Rp65rL2uTpS1opzAoV1ycGRHSBPc\/T6kLDi4T3Wj0dsUYKM7t3mtdW+1sYOj97eb0q+HXfkGXVOb7Lri1qoPuoWKigCL9G0n7YyVp38Jl8okvjL7wOActcgvBgGkXQt\/bWc3c9Q7r3njMBrStPsumOQkMxFTxIpSo5nakzTWPhK\/l4UMNzDHlFWu681fD2BDvN7HDsrKqJXA8lojr3fukE+6VLf0bnvTNwO1xfhI2WOcktYFW5DfWAz+tXod2W7JvoyVZ+U7yuZZRaqiXYHHYmfcUUHncC6xBCo1G\/sN+rZy0QI9wy7ECVqlB5orqKhUY9wKfRcllsv0+t49RTT+N0ZnNfiVJCt0kaX3IOORAxe8WSxw80iuNFF6qLKo6licHgbavZem23UTo2h2yfTYPDqZuxmUUgvwtYiabXQyvDcYrQa3Z0IfeNqqQjacFiQfR46kFpvx8E8VCkrbZ7qWKliq0fu0Gt+2pqm4xgpvaQD2n0G+Uqli2KZluipz8QOg0wk4BIelZfgkqzndJbKFnx5zbyuWkxfOKh8Qx6s0DTpcEk+o79dXHfY\/Q0dJ9upTPLWsgif70QGeTY5bk\/lPBwS+8r0O+yZbk4Xkmc4eTG0uEX5rXLxM6Olx6+dVLdaBVaXwUw6LNnA3csVPAZv3akRj6YuaFBmKr9tJrv\/qNxfFU8XP3VibaCKDuITTuQ88iIfykyyo8zhfY14j4kW5ItE4mSlzBZEn+d3fGsmq8tDu5sqN9nv7RWVpYzCappXOBNf51WgcVzthTCayOf5bB+KcZnB\/rjmwFllvHXX+r+up2y72LWudD6aDQ\/QVav9VQ67nbpznZLeSac2yoNvIgGT4fbuhuwGWAIH43FwnWsps2SE7SXmloPoEJQY9jByZ6fPWLeKJlbXF8I5BwV1yXAPuCQ\/0azy4\/RuEFvmnZ4DYeniRMOZMpirKPLCU\/rIrt061UclezkfNBkP5y2WnGe9AWfhGacCVe46SfYQeAcQ29VR2\/Thqru1ShVZL3rdvkQ1ZFHYghmwMFeUEqmP3P6fTlQpVqV74nEb555wkIerzLy6BjqI12hydnBFXmcnC4rKHGVWsKX\/xf9QO3\/mjHRk0RwUValcy2p82CUZCLqOs2A8tDcYivsA\/2EnmP92ANfz+llDvP0u+7Ps3lNNeJL1gZ\/k\/ODfys1jvm4iiuXE7RW7fkbj\/jQyxkKImKqtIzW7fGvnfDtjXlObCMlXNjsKRRWs3lXu9U6x2atwXxPqTq\/x\/oWxZiBhcjNLtWfp58aZDNodKq680RFTfZHJzxzJXbd71lWR9DHyo5+ARRVYST4z5XSMj8K\/oEs3yysjxqorYg7WTsyLISudK1JBJgyN5+r623t08IRCr7CD6n+9ptW+T7sTKT1iheUMmOOem3AGt2OHGUDr1IflhGOL2fRL81uskwvVfrufucWVHQoiyQt9Yr\/d54zq17HoZLoP3Y5ghSoDzLbV0WnIGTwDw+BTrCEdAIfsWlhXFYX85M+9cwPXcCTVlhlglyrEVLbnzqh1ba3TItZqoWwngnRNleFw7OZczpAtyEgdauoZ7OTKQX7zMxi8E6RXyvpJYbQlHZioJ\/BBR3xBsqduo4esH18klnS6fZ\/O4BV+q3bg31D5OLbp4Lx+j3YNK4zubkYOb4Es\/itbZqSDmdGKjhGum7mnr69xc2ZdzC2ufQ1ADF8dwu5x43nqqKKnVXDUfJ4LItOu3J0x0+At8mo\/jyVemJFjZ7F09PzCIXkkgFKVq73NXEYoJvHsjJh\/gTOaFKc1s6jPYIkVHkcerQobgfueOzH3u5eq2csXWW\/cdr9JueecSPjcmVRj6ltFbDX0B2UycNA72Le3ZRL6Ti4F48e1gCxWdNblmu0HOVfmTn81NvWJDIEVeaE8DnfkFDmg1QOvPJPZZRF6YroHrwYCcyzeKPnuO7patyoy\/DogoCbpPMaYx4LrrJZq5K6p6Eg7q4zGLD0vHgP00tlir+PlteZkKWfzekg5Ve+UTMOLcO\/c\/V69JT9hUc4KI8oW7Y3OfPE3MEHm7f9VS8YwSiqj+lN9cQDKQbQ6mqyHL8kYfVgtS1dNArwfVcSpA6sfz\/2X7Lo7ocNTfYWCProdd4tnrp+1+mUAuBXvQTbnp1Yqd9ijvYmw9+eEw+MV81N5fXgFVzV\/46uCiKujW19J34vw45NOx3TwVra5DZupjWbzHsUVVrSiXFNTnqovPrKsIgOckDk6blwtPQ5yxtuzElTzbqQcB8uyfthz3q1J3sI8J3+HXXvM3vnE+4B4HS3vZ6oH4h2cjBf9aiX8v6jtZ3MFp7wXVAzBfQNImQaGLi+DkOKTLOhW28moS5W1DnHyFewEXZMZeaB7S3xH9THcgRoyE92gt3D8dWhlO9woc\/dznNqNVS60A\/5azwkC6A84wirLCjwul\/O8DHB1ge7dVCgiRpuKYbjhON3qwRyXPpA7qNctxttfvz\/kaR8QRZVPTs1+zHjrbrgXP0fU+wWgi2U5T0fJWmETup28wsGHb+MBrtloVlqBsy+FtXsmirZavrzU6uc9b3xrhCtmRtd7WLq6j0qPR4Sd2MGpqcFodElGaLenF4kjoGiP89O6bfqd7jBnnOczzkC27aNVE52pK7Unlp9SQzgwc8suzoqHWoXhcZVddkRn9fxwav6Fp\/ObV2Jh79UmBC972qP6TU6YjGyW9+C+VsTup19RiJmtuKh66yt9FJ9gtlh7fWB5dMYlL+OvqAndceKIvjf7ec7X6apc52oE67TCZlgvYLZ3\/2feZ51+s848dmP6RDJnzF2MIIJvoNZxZSW3B2Sv+b31OrEbC1UlcjUnUASbvUbh2umB8Ef74TqOmAB3KI8MSf3cA+ROoqJerZpRvdJ0XEkYOVWx\/9rD7jf0LdwTbGwz71zpGV0EpZuhVQzRq7NV8eE0evLUnCVXbY6Dina0q8qcqkjmTbRmS\/bWs2z\/hGd7xXVm0Qnac+wMiGVeZ1sMH1ZvVXJvQ3hKjMokYI16sbqOUv3UJxI3iIfZ6X27mrNABJ329GeYgXnUHVVoWUtn0igSP45dTNJrVIPZ8ajLTldmZNat2NGy7j54\/vqZjHt88ss7SpaBsi\/I3TP1hbMXFe9ZRzjdvUhinZ7LM7OOdOnxlOQ8eWi1w5bdXSw\/TIz8EQWdo3Ugr\/EQzYu6Qt\/TtTK9nDmPjC+ECZKlsyug+816YsIl9poB\/T65SH7AF+h2le3R03+Hr1Hu1Bg2LXZxn3MXpRhi\/uOJqvP9Rm+MPWakf5KhZH9x5rfGUqUi\/DbHf\/7Tzwrqu17Quqc5mrm5S9vvsNpP7hY9vEaGGockb1fS\/\/ijn1NdPdtdRGZl95KIRpVkzpJsdGd2XF1hfSJ9w\/uGm\/\/2BxrPaBmZHumuklyAtIOU3cneeQxQRhYm0vnr\/m29hSwOZhiz3MJvrZQqBI\/cdsEDF1d3zknN6ut2LJ0VyCa363BcCdgDRYFoKwGyZFOYpi10m8K9+LL3qV6cAjlAUbc2coNcpwNR1eAZasCfnT89PbWeCDvqjsyxZl5l3fP1+cTkLMZpN20Olx\/J09ZnNZLH+SOyiFcnOlHR9bIOM8tLzMI7BWQIfloPKvbM\/3ps8eqr2fS5+RN1Mg4jWv\/NNKqyXmkxOrnu6rJLQDns8SD4omF9vN972ysDoeo59ez5wnJmyVzAA\/caZcblG+pfroym+R\/v1qOj3AmJm+wv281V3rCoyFR\/RQCVoaJbX3QDbvTZ1DadCIq660enVLHqu\/sd+5S61xknbjQtHr24Z3wVX\/yiIPqv1XAyqDMUb+QUlcA33X6uc9Kv8Dz\/9r1n9TFxiXSgLj5ZwD0U40GPWJg18d180bbmkLwfd1N2LRqDoDv\/S23DRmguOGcPEwyGG0F79x+8EpDea21FSFKhSw5O6ttBG4hOLdIfoDMajO7AmrBx6rP6du1IGevgrnx7upedbL36\/Y6fDsX9wh2J93gzqrkerj4iPWs0eR9RMiQq8RM6bjLcFWaO4vlc70D3qkXd0VxYq\/hPnwaVKoWqkJ45fBg+OfOBQ749VE48niS9pbJ6TQR0grZiODHr\/EGI2ZXZVkmnYoy7SkTtU+dclePvLEWPmoObSRDYu5UGH3R5\/ja6YgbmSV6KHvCkYpGhOI7p0tQ2Rwfn4IIj+CwTVE4dEAl0mQrKz7vjCCZ6Znrv4BR9UY2J1CqIOd0BNZQ1Vvcoq7sy1itD6i0cQ1SKuKK1LCHfqlV6lDqQrkq2sK5yIt7mdGrWmM+BQpvYYeGmh4ETM+6TbjdrYHBoZzNl7x0G6H2Bs4PhSkuqWiZgBlUNXMl4vWoVVoG3x+XDVV4tCw9Xd3knQ1FU\/yPHl3uLY+q1HHNlIDnfFpQHEhu9I7skW8xI5lbxVv9uR6cTZhUTO\/ejdjeZlcPcoLz4zrhwJ52arOngy9niKBHM2eVX2DEd2M7Xa7FOOp68k82ycvUJpuYI46EncPN0ATkEC4skMqBXgx\/1CLsT9KoDCkEvgwT1M0glN8fp9drF1O0wIq\/AymCih2vo1EB09f\/pbzlgIuU9t6yDjmVWOJgsyvdgzb+Dh0FRd0GXa3pweyqW4KZD4FS6HTZGM9FDuEYkdR3lhmoPt+uUz8UFIwSV3c1vZ5F3nQ9xy18wwHpc3cvUY\/g8r0vB88FAZoHVq43zOxmSFeBh7rgmp\/roruzsM8kv6NGHo9Oy7\/Q1HWhfwfB1x8EnHE+H57ypHIvs6pLpg9H1oaKytSgbkA9VtDyFO+p+VzaR92EDmDr9cjA3sVXhugJr2+9dT5ysMtjP1Yq6srBFRzxdWIQWMfU3Z38TLFXz0jOH4ckTEdux\/KyvgNsHrWCSvB9tbm6paCoURx9gJb\/8TiWZ4aquvJtSZVEX2\/On4xPzuYu8rxmH91QqscpIRJPcBzd6ifbTsGEdoDikL8S5fKP+cB3DvQp4956sri5ztBfqEuTEsmmrD2JBcnu+SN77zMW1TnnVcp7xPkBipxLgZvN\/sHa8GexOvvjUJL5Ny3pyPp+sQo1ALgqX6pW5ye38BgpZTRSq2g126LRBHvE73nqZw3\/tdNA4naxazqgyVVHaztkZ2iNlSViDmObPYaBGU\/2p91ZrXA\/e2ZwsmuT4+ezL5qZ+iHX6R607qy+2yQX\/WjPGmRm9Vnddk0d5nvowx841wdQkTAB3w66gvcg7WdDTouQXpuNegmaYatD5QcCpRFSvTEWHk10\/EWN+zzu3Dx4SR1oQFgZ1V8UZXPBub3thSk387c+iyP5RofrNqXGDuQ7bfq+3q6qhmGitOBD9ENzM5GpUgugEap\/IJwuwWVYhjlNes10N6DzpE1YRJ9e9R1BLbjleFhCh55HmH+6kHjoAdzdgNH\/7LVt0a5zEZZcbbLSisxKRLZOxSiI69cIDpipoRV+Vqd9UcUXzBfx1QjBSeSFXOewGv7HXT3ZjrNSpbkH3NNrXGgEjlDprIJONd5BfbaEm+GEcdP8fn0etiZp3m6pE0VccZjJqxChe2Y4rO3Fqeib429XBrejEIDPojPq1jviR+a1qElcW\/0G2ZAY9tG5OpyRbXv0GEZjF9FKySe6oNyvdUVuf8sDpevZqyQM463ypP1dpjurFDZCtwQfdT3bkKfOidzYbzVJZWi9AdmGjHIletH+qP62ZPetOa9USVwUK3FVNVDCQOJrK+N101J4Vq97p+HCLnd+7vfuaKNEMQutxwg0yxhUzqGM6+LgRX8WbUbiKJw\/p9cc753B8U9lCFZSp\/D2YC4bQV3VjUQLriM+qRc6ik1Rm+VU+4056HABcG52xb+qHYPBBgp9\/YveZ0\/xeJ4G60xO4D+InbhB7WIoH1be6F9DrOcHs2WsyIvkjt9mF9Yz0JE5XlZvuOLyoCyUP5ZuMLkPuOx1V3PTwrCYjyzBw9uEotPLkEedH3lGYauT5VgH2U3K\/x2eWrCErTM7pHzkPfQoy82owK6ofjy40pWEF3rVMl6tn\/kZssmZWZ+V5HCYru6nrq5FzBHWnu9y7t8IzevgODMrvxdHpcyL2vbnthagxR7rfo86ZL1mW83LMoCP5qIqS8So\/q+A5kCGHEh06lJwGh7gCqktXrR9qHxTPouHKf+rd1YM12nNNAc9iF9Bvlzpaz\/Lssi39fjg5rQBeYJj5GUTJDCqHcdOVrGvyE7Y\/ee4TPRuW0TfoZdzPMApgW7Srm0dfcxizqwOuG5zPc8dJBIN590zRmDj7agodWLdZ5IZ1L5xIHp2THsyaT5\/AH\/CpmDQ2jhXpdkx05nZ0v225vAauYUpevec16rm\/1PHFqOrO6O3n+mXG0elM5I5LpHI56IZ\/o9Pl1UlvtbO+BdYY\/NuVsvvZ3ZYRipZ+XnuQQ2eVd4qW1KesmyPoeV4xonb91PGjyCBcjtSj0EmbuX7+TNDh9QrwTBeRGdUPLuJsuzIMrotP56p2akgAmO4u8tcjTLXlr2oblZb5gAp14JpWsh7MoffEPXjlyjOVnNmCjYxav8NjZRnX5Gpcmz7n3g9eNKf9iFMrd1NtZlR5YcCjWHxGEjsJumNzCZJ4bFZCPRlr1taeKMPMapjdriEvspg5Ocyf61qqGjOtm9OdRM\/wpeNDq+Ho07kmHL1eLe2dmo3R46gCMc07HfVN8QxleJ+XCYiKbIFbPs0AprIPiRpWpM7lruPM7rQ3+JXryCO9Cnb1QWpZYwiuVn1kRjOO0oLCxUD2WlxRbW34OczcuVKBoqPe9nBpKxw2N4\/uEo4WFk3VdLp+ql4k2LF6EX1DeStnoxVqtLx94fUEC5r7bu0w4BWr8ULhcxgiuK23Z46wmlhB3fN4WIwO7Ksx4NuePPtTR7XDq7lzPn6HbjGKQUtZIbwgTqiiykzvz92RebzXGXA17kfhqsUs1Wc97Gfkvb2iKgbDb+0fYvTaaR0W12aP11j+Qk2CznxuK\/nO+vIOY1C8VchnF+aO1Ylo7vL9z39un\/ZyO2\/Ub46czyGbs+bes\/kz17IcYX73s3n8VJ7tpomDY\/Ud4mjO8j1JU\/FRWY8j5smbM5EVV2K91QbunKeK5JSa2tFgGk2m40U1bODehDM6AuyVK6HyFognOr3AxkoM8pXHoLVQi7UYs0g0u2Ljkk3diRipORVNxi1Pu96u\/Ha4n+RRli2rXz9Hcflx8yubbfzL8eCICOhLKsIMuN7w7jjJVoC8p89gtLAujNz7GHl1Ov10xQDObevuHMXy8VVzlh6pu8fsUOgenoM5y7aH7339m9zrCLeCVlqtmRWID31BurTdyZoZK9Gn5mKirFw\/inbg8evnGuW+pj64ae74Jocy\/LpmEX2HrtMnW7ny6qgfe9\/UrFxQPb\/2mF3q\/uPC7XX\/7ajkVWY8DjGz1BMdXFDKIqT9Sn1lNH87WperSt0Zu1tM9GCu7Fct0h+zMpEadFx+p0bUaVmjKhRFjYqwyw2z173gE881EDu69QdvBBXfBQbAQTGR6g2XyBT0UvuhUatm4Rx4O\/9FDzKqONLLsLrJheMt\/20X6nLuI8IfLEPANjhm+od6gZjp3v1cqNNPIHPOSASzel5lAGFTwSA9uNz14TVuj88c0dZ2DWkMp\/SHdQSZQZd9nGRzSOehfsTfzi+D140SU1gDD5kMTHRFMo\/YPaDF2s5R8oVXk6u2ZUePpepox1lh4qtOqCOJGj+DWljjmVT+5Ijr6vlNJiZKH6MSatV1t96+SJ2Xte0QWY0zyQAIAFP2jFcNZl8xVxzSK\/Hae\/fG+iaqMvVIjqfLotQ8EmTXl1ORjDPdXRfQDFZZsmLw2WvOzTj+OHsec15M9gp1+SdKQ+VxDu7wDhvdouhdPe1KXv1QpehN4k7t71YCcvVY\/IaXWX0AMcTjjmTVz0qibNYBJjujd+fQTyXMDOCyI+qR0110Q3ITpggHoT1HU6pCRRTjBUes\/Ox9wKQ6KIOxHtawXiv8QdVxxVU7kNLMZLcNX4A4MiM7XxmLjBSTqTfnFTP1zF1f+gsEZNwiZnpszuxYiTg5oWG653jqzMJWhwTKqwepPAuj6SlFdnOP8s7MZIL1oQXtgNEdOZKYzei6jrNnrarNbCDrmns1ZVnfmjlvrwu0b9Gl3NnRfC2nmf+iOlUDFXorPEVqXV9cXN+OuXIP6MSJJdrh9XoFXM\/sJm7vG8r4s9mYs\/nuBL+D4lqXeWWfHgLzMwLvRsedhOFxCZ0RfBVd1Dx1kHEYo1eRoqv1IgGHvdq9enNerYlfwK3N87OSOt5iA4ebmejpgxQ8QFGcx9Emsjh7oCIvmScTy1pnT8dZ4BCOjC\/Nu2Oyv5tzcu7tGa5x8s3XE5d9hyanSunjzJ2+aJ9Vf8nb6bs6BT0ez5Ex1tZerFtcL0WF2adOxtZ10P9FW3iIKnL\/hZrBrgq2EAlqG91cLShSPN5qwmSgSHTM+r2\/2b5HmVctgodVayI4nJLfWj2IBV1fDWVGOa5qFyaqb6pv2CyAPuvA46vh5HARakeU2epfnJEssraZk+sPcAPZ5KoAv8nnMqlH8Nl\/YIP\/+zkjM\/t0AFc5Jja1EtR51YA73\/2WFPnOeji7j88s0w1+n4rZJN71hayi2G6OWAc13usOVyXbyHz\/LpUwJ6CYlVFJ3onHuulfUCLu6FTu\/cL1VYu7253R+PaMJv\/yGccVo8xZvIcVQSE5nzysZnb8IIiMcn\/7KrWO3D0H\/Er8ZUrcADqV3uM9VDCKscBBdiaVhd0mqmuFJlN8cnDRVZ2pDrQviGFwCDfxLxxE\/Fc\/y1G9f6FaSpQdtTnSZbb36Fbw3lcWec2Z1dtnIklckyNQkHVG5eR5uxpHeu4ELcfDR3TR\/N++GX86Ubkyr07hnfAJKCqYRTPKb+U0Py8CN9edZdS3LmaixfXFJc3j\/qZnlcHSPzmWOgfFjQHXts41v82xQU2UFQccd46GsUsAV4ynxyIDvNKEfz85kLt6J0VmoWJZIf9NxKlDdpN0Y3OUOatlcWEqgthVS0DU1ts1r3rgeBx7O1w+lHnpdHpIbFBn\/pIT\/oAAfmpNqzdl9GALBToYjZu4\/VbHSj\/MYdfZ5A65anVQT0gVuL4lh4M\/zuVZo1KvWRkV2\/63XhvpLImOVJOWddqTZ2\/C2bfoqX+wWdww\/+kJ5zRz6aQ4mM3f1R+T29mL\/vfGynhG+bv8k5peUYEKyY\/m3y6lhqODfN6ReN5eZlwqBmuBMcYFFfKIbKwjV19bm9YdflFvndNvzJJ1GZncMpNOwGdYPXOjvXsdXrVSdXCGvB6KwpJzzuRVAfwBc6IDdNDqIx2AclYNc7R4plPsKxl\/u1AfbkfxjOizSsy3K\/YYNVl8GQNRWg90iz+MvR08sY6e203b1zptIjMSP8PAcWBbOBTfj\/dULYr5aipniZyZwfdYXB9dJFLX8Gz3B1dWgv1zDLwWZpUBqRh\/ZTX1RLaXsbmvonxdZK8TKeZk\/xQRzm\/ey9H04iIFTDs7caw2HqeRVZC3CzPUYxd\/PVO0lXfDPzmvvH5b7YlOJsAdZKXtnvmJHbm90l3XMHTr03qwX+9VTnuPe6E7Yr2LDo\/V56yj5uIHjBGNf6hQ8lgtjtZF79DjIiY8DnfLO9SWfrbnvFeGzMBNYOj6+VqoQrOdiKIRMxbOCszgY8pmIl62VzkORocPk9FictbT+xDqbyiOe7OsDqbAser6YDccBmubeOpHJwO8NlBFZf3mE25a56XKykFXJZQ9s+7UTFczWZhrU2QIvKS\/eO9keFMNUC+3CnX21Vyzb07xuL1edCpd\/3v4IWqHA6qncHw6Sj2mo+g6807WytFPvJg+Be0gT9XHOidQJZ7UJPIrA68vkCXkMtSBo5dTysvBFb1oVlzL\/D+vXB5868YGRe3Lug1VGZ68+OtU\/nik7D3MlvyNskXTwmHqtSuTwWCSVemz68HTVq8Z\/fRvMNn7NaqRcl7OqlLgb80RfSm3cByr8n40OgzOUj\/g+vB575DsnWK3YNAcjtSriBHqQn2dle7EyaElOkS5h95IzmDIKhwz2KEXj3VytPicaqwGoBWcQWZUs\/WzZYuDU5Ououlpu6sInySe9Cd3Ex8kRyWmqjMb10DAj96TdXH9v4qSmET+ZDV5weecfYxe5NyVg1rfgoM9eU1M9oBPOye61YroreTXibb1QyHbaosUsweDHsaHF6lX9tarf90f9Z5RMt8Ov0XLewfhVriR6tn5qqX+dHvv+j6Nq9qJM\/iCnqdDdQX0WVT89s9UI\/e45UrGchx37IQfJlvpnmr2xYe7D2cO2R0m3EjsO3J7HG07AvVoD0YV\/AwCWa0KjFqTIbxFuMC1qcrxSfkLWl1TV1tPRJ\/p3DxOrSdzrOL+fM65ul\/5jD4m13TocvZmv44dReqenVnodx6zv+VS52Rm+sUIjyNMp7ACegzuJ1tUOnySQnW+dYDNKb1MBY3keLawmPpFX8JsujOe6xEwDU6OWXN9Q3TrPeBf2NMrTn3ssOZZdbLLb4xjpXlcLywLZ36GTr3LXxeHgSPiKnS9T9\/z4HWQ1iV+sUiuj50M2Hu8op2qsNqwH7qSPGUWuT7VwBFPPtn1wVqZQhYxpqIQLcr4rgmdEHd5Nn0InxYD3V\/77lg7H5xxVCpTZVUzZCE4Xd9cLmr3yGWrb3b7Kr2KLYvJFdcO4R6qdVVWzU6yE+0re9u62nfBRphlzkxG25MglzWBcN7ppnPdzqajfGWLGQ7Sg0BVTq\/LszLZnK9blZ9yRnzf9rRnPHV59j94Niei3g5wJWTisPnh+TrAoL+af1wi1Zw\/8BAVv7KhGZQlicnuz6r89IaeLZKohC7VbOvZiJM5V6MYW+4jLuIjrsurjO0uxsVhsNJ9l\/dmA5Zc7DiiqOL\/1o0VWGsiHDTRa7LNfVXkSuJctyj6r1nWGV3Y67gnX7Nn7fu65+C3zodXj+pMbses7+2eiQwYSXi5mGeF+kn0gXuuDtNUmZPTrhfEsUdVQdDdOKr6ARgWhm8dc8byNJ0VBxdHx9Hl7yRolAGF4pVd65ROTAzEhZK4M6gLDbeqb93NJEvV2jjdM399LzPokZqpKp533noFi1d1eQUtalA\/j0cK4589MMgF7ZNnrlywo9+VbceDBXICoi8\/o5\/6oXp2lKR4rONYHbSzQLYY4IzD3LiCjEH1rJX65L1FPt9ey9pTx2pZ\/UWi5zlxcslSryboTMzDPfeaQaPBtVBD\/cTxM8ktNfOdcuZXlSf7g7jq28G3\/as2ygD9jOeyqYoLhsQ\/TBA8tk9B+umHcU+9AhTVp1OyT7Ij5r2O9qhK6zplEPgMXnb9vsZ4z4zNd47U\/ajWrlQWSMoSN2M8vcu1aGY3k2f3bvk6qq7uqi3hiOTAa3qJZTDh1R12rLy6JevgUoNB0FMhas0HWdzLRPar4lT1cJKjHe1ldeEDvCZ8XodTNwo2Ti3rdleh0Az2pWWuoxPVrvo+VFFtlE2cdbtK5tdv0YvHMwQlqzCrmVRfbR\/As8cMR2Q1cgFrlNWq93hbuBcWyt9y\/4zRHdDh9NY3WiGyYYnbsXy6RqKuKnUXUn6bkakOe2HqKkf4zppoRP2puxF5fbq+71VtzVl9kNA8mGX4W57tSkAY1wHKpafXylrLHct88iOzmUkdynJKV15nsE7mdg\/Vf80+n+SNl97qybbBNRyfKhZP6chEXZXzOoXVXxdjx3s+0XE+\/oM1eH1ncsxdlWg3rtfIxCAcNmf3e96Cr82xLArC7Az0ftegMtP\/ohHtMbLeSdhP6bwoN26r\/bQdUpdSxip2ek0Hb8AeritGFbpjOR1WJewnG4j621m+GieStitVUnkCndArqr+DCO9g4j4k2An2gEXEqfUha63Z6STc2bWOySycxedilCfoxr6LP8hhxXLV0bz2MKOEPYgvndBOLW6oOhzBSHJk2KKICQqCN++x7Vlcpb8NuneW4D3036y3DBakq82gbGc0xz5CP\/Z9ldl1cMYTxgtHJboU7PDPYaNoWb1kuhAUdKXrKulQIzcj+MqzN+jd1dHm3eWXkav4k41goIzJZ3mXfWFc\/a73acxsqHBW2Cs2ohisDR7sd1gBPifqOpPOfKI7vU8G2s24E\/Czjiq5XRRUPe96+Oo3iTPV3h3h6UCQWfyVYUBGOilqRBWo6fKcnRQQNStF6KwyOwauXKJW8W\/xZXHk+IfWGJ+wjLTqW+SVj1EPq7yK2nocL1pVKtcs0+M9ZLv2WGKQ21g1ehxcp+tdK3msawxX48GoEsx29kFHXenH9ddmFy4rP5MRKs11uONr20utwMQ1WYgWh2lAld2MrsxjrW08lv2oGlCx7X9fd2TNKMb9TlX2WvXlGFfO\/bZ053R5Ed\/uA1OFStgk2O\/5y9p1BhxcVZBJisizk4FlOXLVXfUjrvmzHhzuUim27nDZUaZhjVSStaTCcHr61H5hz5DnTv71A5MHWRDnyqx1fidzi2FWkDU2\/yLGZ7YijLPsZR3lAtk77nwwnKsv9z4gfRjsmyl+Jg\/GnOfqGUFUdxHtiayKHh8N6I4iWWgviDQ6rC4jChe2aM+cPkjARtXdRx0MXc4f3RVcsJ5TtdUVgCIyaD7LyqA16Lj6Eeb0fPLAjN3bdL9ydXysyrM2r5x7j7dFo152EUqPMc5WQfew9WYlh3G6QmrRV9fKX6h+anReZ2PnYKeDi6IDVwr+0svzd8Ykf\/Fz4R+Y3ii2d1rHZsz8rjdjdaKXV9Ymst7LEN4CF7oxucssnf1i9jm9njQorbNTtVrvZLS8nRzgiI5cNt94AHuEtV1ZAEdyFCp4oLfIjlxqBcUoPScy7FmelbPsPzKzaKA7wY+avNfhU9NLN9jdah9z7Rj+LLpa0dvIeWW4e\/mpON2\/bMNv67nwNxdMNFtkFZZgjxX\/FMYEc6gC+AF1ZmazwZLABTHjuokKWfD1rNZ1GDgsQPdc\/1aTyu3rHLYC7ifPq4NRT1lmezleJl2zXojanhGe8JRHo4rbA7LuPUehDst9YpFXSYK1M7vssMy27oLemd9xJiJVptQNTB5BHLnzm7rm3L5HJsiWIdUuuU43OMf4CQ4e62fUgTG50xoupq8aTc5FLbztb+qAK1O5qx7RfztnfqratVZyBHe5x0Gi7BfOGLzufV7hnOJovR0MGBwW6bBkeeJ0K8+zD4CRb48U9eAZTd3dmFpojfVUIkSnsdUCD\/aP+rQ5k2dVc\/lmOQz25N9gIDuz6VGYpPxWxd5+WA7LOtt3ZIm\/\/NvePW4izN4\/xKkjEPXOezjLOo0XhrWPHrEOrrnqKu6zoDrKst5TJz+IFzmhWl3My0cwsn7DPfd6r0X88Rjhj6Ne3fU1N+2nvraphiRXIHidjauyB63HMqHfsnd1SxWEMjRRDLZldFBfTrhg131p7zirDrMTmqO5yw9vIBa8X+h4\/b4S8qRSOT+dcHY7g\/\/jAOcrg+mPJ7kWUzK7Cgcn7\/eA6CuTw+5Zz86ojlWvgqsB6Rmv\/WxWGbtVPRq3OozWd3egK6rulKVT4421M5URqKo6ePijV8w78uTBnQXzxdkFHuvPznUF2OZ2RLUP1oFP64cP0\/kIPo51qXHMhO857JSuZefuXT3cCXH0qfoMD7puWIBcyQi+njEZ6HWSYBEmUCmYPTnKaPzOTmz4t11eH6En3\/2QI80I8CpKta+p9SoN\/i7ODU\/b7Cb3URZdMFfb2xNl8uDVjA+m9MOMg0vhuhH9uVq8Xoe+0gMlhpkrUdNFVZI+MnmYNV0+ATb4DirItY46CsZ1ADpYtm2VXaN3Gge1vD8RvwJbiyFjhjXFt7uVfXYdA3MeVUBbyvtX5xt8qEJnZhmWs65\/mdOrLsynJyNaOhgc6AvWtfjMHuF7F0EWHQDHpVe7YpTGY9B1HAHoLMvlEfNe3J7a61\/UV3qqni+jGXEIsxm8KhT5lE11t2SER4MgXl1Lx+gZYF\/9Kp2V+Fsl12qNcDHFX\/tDv02OZqa6pmoM9z6Zd3B9mD\/5CvOmc8AYaBLl03lWSn1mJrRxR0wd6Ja6l+uOQi21s9S7Xl+jorAT+TyZt8rEsS7G3dD6IjHfz5Wuz86ox\/vYc6J0OaAMkYq1f6G2VITOI3NbMdbbsZJpGbds0+s2zWn3AM13UBkGzZ+rSxNzUxOxjE7AzqcPoj3DanLT3c7mYOWwX7u6miC+y6v29FQhlSiHrgtMbcLhZNW8ekb3lBNzs2G+eW25qliX07X1es\/pCzAUdShH5iejqCucXHbfMO+CKHaud34kq4wRLhCbqZc6owuz88BDtHa6NVcZU6HDXPc9u+wmwqOPdY76QHCktuzuNIhGIdD3+rHW+vStfSZ3y\/jyn+MTbzIdhuP6CZgBYWDN87Yb7C0embNQ3LLK5fqfjGtu9QMyZVZ\/9ivX7oXr6Jb2VXV4KuTMNJ284sqW+d3LUIfeC9816YF076wDXJMDZqYak5lAGMVqHThXxygGzQiY518iqEuqasBc1z6wBvqK+puy8kFTIqJ79\/wyg6w\/zqE4Sbzxyl1FqkWfWDt+0z3LXyopeWF9yX3dJPXrKL2L3Tvq7GE6FzbgWvR4Lz2j3u10XagNJ+0rdV7bgVPlpzqk5nXdSVZWPyg6eDcneSBn2zVWGPyuOod5bwtODXrFoVxwO4VXFc4dH+FU3ARd6nsk0JO4ijiCVKCaZ3SwOSgGf3IYXE8X8hmWs3rf7dvXLXCOvRMFH7m4BfPbhyBHZB+1H3\/MPiQcwC7TmqM93juXatd7HH94ML5+BQzRR\/rK4ruOT7aczBRxKDnXdrovQh3BOVgjytSnDEYmdVeyPqitfvGTlezVRvz9pTaZCy3jjjWwbWeQV9hnxvZzt0Az2LTrUZnplYmUaMEULCLulvdTadZ65r09m5Hljr33QTVa7BSVw8T1jvatuzRrMdeMt7dB3eL\/rICrQtUFHYV7wqwJVojmcb04uawmo1J4JHqgtcjch+1R3EbdbLfWdRn12GqxkdtvXNVwbeBgfnM3JNfgt+Swak\/OLavpYsr77eb2DzGv6nqWGiV32lvnmks6mPqrXGTJvvQ+wObq7No2Mj8drFwUqgcV3S+E13hFfhAGB1Vt5qjMDM\/EqUQd5oww00G1Ecoi7kvRXK++wGAwW5Fd73o4g\/7NfHlVEfzHXTHjYTg6MNyIk7tF19iJsvc0p2uIQB8MHqqAySjPiTeOtffqmMIf8rxc26gyAjHor1o7om4\/VI\/Qh0F7dWPS6F3ih\/dzd9jEwP91tb0PLyLZb6JrjuizaGUrNDkk0403P5lDOMO1oldUf\/cJcJFIFcX8zp2Hdg+1oHK6IFRiO0cWvIwfNMiUdrfniTw5TydJpyx3wkDkEOYmi8d1FG\/wMiwFpoLwnKAHk9mXeVhrKksuj6KAcqJmznrgYJ4+yk9H0bYz97rUrn75u86vWsXeaxq\/EUw81uogGV5wrtW527F1Dqz3yobiPuqF8Wq1Q7zl6Warn46Xlj2eR+1ctdR3VB8P3zQ3wSfd2e7tFQpUEbxVI1pFMMbKCNFVti8SPRGr+bNqa70qfFzG0VHx4prSD33VE7Y6SEkMcXRy2MlW61F+IgPb46JSnB7nX1dRjjgr9C5n+uBaE\/2DUc16cpV2WK6Zwy\/QjTj3IFhWt5mCiaowd7LMKPOvO4uqmdhur6RdTq7LY9YGPmkduhPzKgvoBl\/+a6ejw77KDcpxgOrS7iKocbgznotrXmV3\/R7HpPdUN5mM3gS3y07T1+Cfah2NUrvTN3gRdhjEUEbJWfYOVTsuuHw0+QO9oGUi9H5Nnslq6IqzQrkMjOyelQocbjpXS2WY0QGVJ+P2yj\/vZtydiWMwEuA41WyXZ7XHG9JN9mgQGX05zLpxRVF1DTCW3yui+6S7zrvN1xdyPTMJSz16rwirXu\/LzMvAMhOP6ha7MKMOw7Bi\/UlrFm7hXBi3zKtLSEDHZxBha5\/6BhdhENaeWe5UoVd7QAH6CisPJ7Lm6+cN7T4O7kM3GDUxZg5Wip6DStgcJItHHiGa1Qf59noHOu+8jTamaijQmQXwXVyjz1otGADtg58yOv4I1usOGXwsClUPtJvx6hiLMDJyVX9joRfpz\/7HTPAcO2LmT\/qqEGIhleu4jd17Z1mvVyx1z2SlXFIHUHaqM5DHplKpdNWPah9fV50nVzA2bhQuAr14Yq9CUumsFNdXBMmDoIs1625IBBkgSygFa7CPdTSpVWbNs6oF3JHOQYn1ORPd7n\/JuQpKvagoFYaNcVPktjWpgjOv\/Izeof\/VvqON1URzVm9Hvo7TQ7sTk2Op8mIJlyNO+P\/kHS2Ad4jeOBjpIOt02lXv6c3l1rLO9UoG9ctIftJZdShsMCgjd3AKnFGWkYvrioj0wl\/hN6NvBsFxeIAeBl3hrCjvKCbZCKpyp1j0DtwUOYOOotKu6RUo7p115a7F\/8\/45a7UjI7jkcMxt4TpBujq7W24jSrkLPod7kXx4eDgfJ4Vh84jS5AXEGUlFx8+uypLvtaRyaaMAldNZH6vRpV2OiVR8DoXyLarcCPxOhNxuphc14ngYuaI+JzqKXvz279ckREPPSqxzJq4jlRFmV4\/ehYhKIeUM9LUasRhwnaOuN29nSgTu+kw8n98Higj7+TRv3Sn6CNauLP+rL3WV52OmoMiR7vyQfMPwybPiaj4RwntZeKw+ujJ7TuUdV11LcY6z\/adNN2D1At2D7krZta965re51F1F9SAgvZyqK\/6VP+cjgQX5Ur5a\/VdDUQjRCP1YHWZI+gR+2Iyz\/S6BK9BhWuqreZY7TBf1EsuJT\/FQXMLgugUnZmdsZVTuyaa5CjvqcD7zFroXno7+5G672gS\/qZ3YRQJ1e5wVGuetRR9RPy0GrsP4bOSddf0xXITUd7lcOpVzuK1ieXwecaVLvNef5qxzjXiajHY716lzanu8A1TM+Z+nxXfQjWf9s58xKgboY7cXc0fMGmHu1ZH3N\/5hPRFy\/U3vhmSc+xsUGdH2pc8xvdpEb0jzic+89tE76dD+wnYzGCPq+Ce6+dme9bGuZ8QZqfSN3z+NJ\/KTczcPTdxzucHgOV5bHzVeso51rXOh3Vzjp+qCovoqsSW2kz8+m7morr\/K7+BNXLlSIxHjRJr3Yavabd6w+F5zmMcvfEcta961CeL7EW50XekO14jeiNSGaOu6Qo\/f54uZydxdKFeBiaPNtWRgdTVeGYmp\/AI10D1Y\/eYkjO3s9aNzWN9B3Tiu2JSLtz1zHkz6yBkr\/Qz6x6lz1wMLn+o9szFWBdfWw8mZx4ERF1lTDTneOFmm1Eci84FyXqLRQmMQ0Z1DbJQ\/g\/7oyLlJPgTrbk6gLqF4064R7o7td7xdqvnjNL5hoHnnoinf3x0qsmfqY1\/pjuf\/+EzJj\/+Zxjv5\/58VgQ\/M\/tm6nr2y9l9fPwf5+K10T866+PxXY\/8caxX\/Lxv\/MdXM\/vq+z8vI\/V98\/+Tjv775evn2WLr+vPY\/Cdh4+uz9Bm1tCJfFe1XjftPQtK8p+Ur1wuOxg193Swv6\/3XzffayL8yHt+To\/ccSy6+qrq\/cka\/H1+\/y4xPnQ1V\/ojf4b6d3yU\/z9fxkdz8XbPyXk75nev\/d63hPyHuX7M373fqv1tv\/G7r+Sf0yb9r3Aw8vud6zAFzFNf7H8szdxQ8P\/bnrts+OutjsT1+1OPXI18a8ytZ5LGM3Gf7sXjQG15fe2lVr82sTq2veuqwnv3+Ayw9d2dXHZxXR7ozfBCPj9Sc9wHNkY9l90dj\/hzOn474q2j\/\/72Q5Y\/n6JGafN0xP9\/bnPm+2ryUrdf78Wls792rPJI1Xr\/lzzWS61w\/qvHT9b+Uj4\/E\/bw+c3fJ6yt7PVZWNy+0y2nct\/f6WO+r7cf4wtf9icaZ7yNYZnqksr\/iMT\/uts9hS9f9\/LXBH2VE3PD6+FMU+fuT\/c4r2Mn7QPrcrmlevX+sJo8p9EvY5X6Kx2b5nqMe96CPx8MnAj1+\/CNHmrXN3sXBfPJcj8Rzf8zzmr6G7mWMl3rtK9X6OvaPqvO+vnwpV28h\/K3n359\/z\/jK\/P18VH\/nM7nH8Qna39lvb+v0cx39npx9NksR9e573lrF1+P1f8+q96jKvRX7Vz7\/dl3ePuIr4\/vVx\/4oh99n9\/25Hly\/3fXfncVHdOfn95vftZqvcGzfFfsj81ilRd1T\/P35wuu8stq1xp\/ntn99zpy7lR\/J7s8c8\/7+f+8sX6+D743on3r8r4\/0f2pldt3\/dsu\/GPhdMvAyln2\/52eukneb+ud1nnvJJU6U\/nWP96PYHnGan7m27x\/rszjofZn6mj3F1\/sb6sN7\/n\/057Oy+v14+HfG3zsDs+d6\/ufvgddl\/tfutHiZhX58d8PX8P\/XMNzX1O6xvcJjqvtShG9fxfq8bO29E2DkMWQ\/dtT3MMPm4lE947hzR9A7r+r\/zKpeR0y+s+4Swft8wdNYZk0v1SZXhO7W+YO7O\/o67XOMPZrfRzLEZ1b8Hn9+fiWflVE+uefz\/jz+Ss5nzfm8Q17mmI+s861zP+99NHxaynf+eZqt16+Kvhdzs5KfR\/h35OCtFX3dFeLPXN1V9V9e0Vv4vUZzv+bc+fMmQyyGPgO91wh8Nf013\/DzFfpsJ\/KjCH+cwfnslKnAE52Nyv0Ioc9fqf6hw\/4G1Xz9PqaX7or4zB74d6xHM\/B2Nz860vcc9\/I++qW537gX8w1d\/VXz8khc83lt31GNj9\/Z9FaU51Obup7Xa+ozfL7bR\/68dm\/s\/ZjvV5qnNXmkkh9Zx2vnvuVyHpvz7fX\/Gl7vR3F+PBNvZ+FpNl+4Jnb75LLnOf+8vfz92B\/tjke74DOc39tI\/HgP+Z6Dn8vLC\/ctf9F+7efieyuDTzvg1+jZt6L+qucfz\/GP+v6Kiffzw+tr+4yxHq3v+\/rq0VG\/qm4fH\/cttnocGR+P5TNGeGs9nzHH141h9F+Hq7+6nl+3so9W5a3MfAYLTYxXhH7ch3101X\/d+Z+Vz79uBa\/dgfTXRfT4zG\/dT\/LMvV+c+vs08vGYHjnyu\/j9O9D5lXPM53xPPt9itec5n+q+\/6yXavc5ozyCivnOjceOuz+KHP0YU9dV\/Fi9XuuLv4bl39el76nV0yw8fu7PvL\/37ex9HSd8xcjU5e2cvY3ol9F4eXdzvvfmZ\/piz3l\/BmC1j877dIz33XX7\/qg\/lqW\/99lPdeh9zPEZa3+NV9\/u\/Y\/N\/uvuRl5e11Ncv5Wft9b3eJ+8NdL76\/A2v71\/zAtvfZD3Xpub3rjvmM\/guueVeD0\/n1eLz4j8mqncJffmXRIfqevXnPtWH33NrH\/\/Ub\/qtZq3MvN+3C4q+elx5nsrlr\/u+c\/fP\/4effB5\/PjX1fbxmX+ko5+PkNfien9H7kifEeXPzf9X4\/3x+R\/hq2G2p3fDv1Sv3mX3qk5Tj0eqcu20Of5x7X9kPW\/1wGN9\/lKOX877Y+O9FdV3PP+e7E1n2B2PdsnjuPyO1f54jqdrusfgr7gSIn6Ntx+t0dOsPILe9+CG8R8ZdY772ajfi5\/vq+cjXPacI78vvitD3\/HwB\/Zfz6N\/rf6P4eJrv7fpLex8FybfiuNxXZysfieC3o78I0c84iCu47\/0KdQfmf\/zzn3vSj5v5veO9NWRvu+9Fj+Kfu9wfptLnl9XeuvO0bfz9uv32V8f4fvQ9L6jX6rQ196z\/CNMfO3VaGZ+7z0Xz+N9v3\/DwT3Xlc97le61rM43YL\/dhV91xFf0zleM+VXr\/73H\/Wuc3eP1\/6z4Ps4YvzcO\/l3dvxn4NwPvy8CvzCn3\/ualSB\/j4O9a41\/pcN5X9beP\/pXX8tfE9vq+9P6ZR6L788X3OlKV79h7vF3\/7z1iHdJX3n32UR\/2dZV5jMe+tya\/\/2xvX2n6mhw8jqO\/KsLX1v3IqyA\/n7P3jP4yyz7CvT8f379n\/koZeJkzv8vrfSwTv1Zf\/65d8zif\/H4Z2BV97to+d7SPddHf9+zXr9z\/yKMOnj+LOXael2ecCK\/PvB6XnzT0scg+dvbjSLjO8zHX\/TGl+ehe5PEVPz9yPk1zvg94Ps\/6zz\/nM+j+\/HO+tXT+5fE\/+4dvq51\/+TOYmE+anTs5eHwemXHm8Rl1xppnuKea8TlyHu9rTx1\/zptz5qzbp\/3dHiUi\/z+PzXmMPWfzOaCMSaR+2+ocO3PyGd2+q04UOwOxG+UcS3SshtmI\/\/ZbjvUIzuO5Pp9Vk6uZl9H4RD9\/d17GZ2xi2DGsAOdy5DxPdqiGj\/CY8zjSZJXo+f\/9zzzGWZ67YzATNTAm0eG6iJuVmiF+muqTuV0xZ4EKfnJVrN1KP80a+ONMRt3sG92i1vGpAOvbLLtiawkCF+GMt1Fu5sgdMYI9\/4pEYnOV4GLrZS+5jmse7BlGN98cIe7F5mBI5NMV88giwu6iKsbjmq7dwWPXCMW5vUrXL5a3SuLK+m6urbqrEPVk0tUsJl3vtU6shlUOk1xzuciRjThaJhIlRiZv2SHifavsN28vlukxxzWLdt61p2dVIv\/aSSDlGsuOtpWx77aDrOcyLuwl18Jzm+0r0zIanOjIspfPLYO4Go+0gybb27Vyz\/yfnrYay\/aysox7xYb9Bo\/wF1aZf+FD1rpM9ZzhRPeyE1lgtGVp+3aZS86TK0XhPRrEO+OPLi5bEp95I14666oSIFTmWhWVcY1yGXtHkPkWf673qnmbFfAmCvnZPl7G+OMPjrlqp7FbC2NQMVcBOWs135\/szNX\/a99ubohKpqYbrtHIOquuMvVmVd9wXa9KYddtFhhxULE6qj6pNfcsiUPBO2wc61auurFay30y4mN+\/uMPcEdt5UgRo9KIVTt5O3FrNOfiYmS5neveGaj\/Hm2ORAnnXXnzqmTmZdmLPModPi6O1zlclceuIX\/2CXW0w+VGlESuX\/\/gvMtGqOig97oC8H2v8lspdFAeUQmuzHCfvfUFRK6rkHVBry6VasN+MgtzyMMi7qr9+ojFCuu572Piuno\/HcA9Y+mlQY+IvTLGtfLX3K1amSXOvrLYPkO0y1ZkRt+zq+cMe9pViP6ry9pzl+X1UuQDXOjClklxHubPdVvpZZTrbHKOa5j+WP0mZnlxR1\/u2eeurLp8a+7sZlCwuiPy7Wk5hKM8S\/ZgrYurex9nduUmHbX5Yl3+tszsmtXbp9GbYSPfEeCu1cj7\/p9+sFNgzeVNmcZqLR+K0VnbsvO9V7YHGVGsuyJzaUeAGiLl2J2D81kRdbl3QLKxiNORyC7rnq7OQf8lJjYyepoY7Aj7nPWa\/dX0q3NY3WEXy9G6NfGgyxErnHXdNdFboN99FUdvr4uX\/\/3vv\/+1E+zhZan1JVfFlkV04\/f4homXN6zP9rcMZw23Mjuy69m45cv1jledm1zJwUYtL5kPf9\/6WKfVY9VL7MniVMO8quv2up5mxqNyoNcsox9mf3vFY66eQdy7XpHL+lafWNX4DWJbHdueXUSLTZ5b\/RU5XjfBdSz3sNLRu1UramvXLI+BVllBtG\/P8bx4VgHUBHMp+8uQyy1eTbDHGG9ZD41e\/+sqjVUE6ke2X3FI5nGdodqpDi8GGJsd8fVnxrn2mkjYHcHWSgUiK5tjqgFrmQe7xe6xa5dtN\/MiXdSKj+UlMbi7Jvf766zW0zGn1\/Gscj\/X5GRhr4nYReLflVjrzbx6CX\/LeHaOOFvHxUh6R\/PG2XLeNZPqwz4HntzZyo8yrRqxHSAyjHk5eZ0myAMtuo7lPVF\/1Sgjd9dr997HKyOvu3Se5c7dpzHm7m\/qRIPIzbh9bCbNNWfLnfpdsr1Oah2ruJa77mtnH1yd8bLhrnLZg8fkHqJZ1qQPrr7P3lg2Wla6Outl\/WV5uOveta5i8ezuA5iZPIlxGJEYrtew5cqtAnlZ7WCV5vGKlvVJ7CvvkaRLkuNY13aU69E7ryPfPfD1HJVqOe062lVPnOeKlO2Crcr6B89eB7fouKJRbiOWawfLatvt4mzdor2ql9TN07voD9nIHXPF8ZUbt2Ps3WWSVUZ7zaqRByvEmdv9VzckRq7uetmACotjUHJ1e8smi8Ar3q6deb9\/0en5KojuH1SuE70yvK\/FPO14cGW\/6L44E+xv3WVNHdZ6U1+RcY06pvsMkMsrXnVIVtQZVvvv+2S1nSPlNL3BlT\/X3TIvexrQvm5tZ160UnFqwVXQec4djc7Ho9Y12n96LK9a6GhkOfdaotYRrrhbT2IcsqrrMkfEbYxm2I7c16HcLd0z+rXT16NdWVWG05+pF1w73XmueKbG26PWikj3agt6pneiMrgZ1WKr4ErIzFUz7cPVj\/V4cjgKuR6Vn3ZMkX5F1bLazPnf\/xKf759jRDmQKqBvukbdOBFPvuw067XqZnTqkE5Xv7mxOwbzy1RiepHNCKqmnAE+ZE53cmb02l9XTjef15paY6t35ain+3o5VCcuMlDc7ZOrlhrbYkdfKPKXpZZVllHEkU7aDOlenXuR6t7OlYFBsgzeZDzOxc\/oJeQ+MbbzXf3V8jPMw7+7H7BOOwrj7Gh73l5potagTAXa3YDH6b484iV1uuoos5plPSwRXmfBFVHFVYvtZOb3qqqKKpboUM5fbl32Nq\/mimpcR1Nb96qCqiHOyQ\/RbafxOpfV2X0d0S5zghB9gpqzWi232JHr5a57Jmu4u5N9BUDXuFi3ynvlB9W1JvfucStq168PUXVc+yrq4mUrJ4eJymXy690cVGy5ktpc98CbE7vWPiP\/Uw3+qCJ6j2VQXDgjWw0e+b\/\/+\/\/d2aTFEDYSAA==",
-    "sex": 2,
-    "haplogroup": {
-      "y": {
-        "haplogroup": ""
-      },
-      "mt": {
-        "haplogroup": "C7a2"
-      }
-    },
-    "haplotype": {
-      "IFNL3" : [
-        "rs12979860 reference (C)",
-        "rs12979860 reference (C)"
-      ],
-      "HLA-B" : [
-        "55:02",
-        "46:01"
-      ],
-      "CFTR" : [
-        "Reference",
-        "Reference"
-      ],
-      "VKORC1" : [
-        "rs9923231 (-1639G>A)",
-        "rs9923231 (-1639G>A)"
-      ],
-      "HLA-DQB1" : [
-        "03:03",
-        "03:03"
-      ],
-      "NUDT15" : [
-        "*1",
-        "*1"
-      ],
-      "HLA-A" : [
-        "24:02",
-        "02:07"
-      ],
-      "UGT1A1" : [
-        "*1",
-        "*1"
-      ],
-      "CYP3A5" : [
-        "*3",
-        "*3"
-      ],
-      "CYP2D6" : [
-        "*10",
-        "*10"
-      ],
-      "CYP2B6" : [
-        "*1",
-        "*1"
-      ],
-      "NAT2" : [
-        "*4",
-        "*7B"
-      ],
-      "TPMT" : [
-        "*1",
-        "*1"
-      ],
-      "DPYD" : [
-        "Reference",
-        "Reference"
-      ],
-      "RYR1" : [
-        "Reference",
-        "Reference"
-      ],
-      "CYP2C19" : [
-        "*2",
-        "*2"
-      ],
-      "CYP4F2" : [
-        "*1",
-        "*1"
-      ],
-      "CYP2C9" : [
-        "*1",
-        "*1"
-      ],
-      "HLA-DRB1" : [
-        "--",
-        "--"
-      ],
-      "G6PD" : [
-        "B (wildtype)"
-      ],
-      "CACNA1S" : [
-        "Reference",
-        "Reference"
-      ],
-      "HLA-C" : [
-        "01:02",
-        "14:02"
-      ]
-    },
-    "ancestry": {
-      "block": {
-        "african": "0.000040",
-        "middle_eastern": "0.000030",
-        "ne_asian": "0.000572",
-        "se_asian": "0.028815",
-        "chinese_nation": "0.969937",
-        "central_asian": "0.000020",
-        "european": "0.000080",
-        "american": "0.000030",
-        "south_asian": "0.000030",
-        "oceanian": "0.000446"
-      },
-      "area": {
-        "uygur": "0.000010",
-        "ny": "0.000010",
-        "finnish_russian": "0.000010",
-        "iranian": "0.000010",
-        "dai": "0.041639",
-        "spanish": "0.000010",
-        "han_southern": "0.573840",
-        "han_northern": "0.286408",
-        "somali": "0.000010",
-        "tungus": "0.000010",
-        "sardinian": "0.000010",
-        "mayan": "0.000010",
-        "mongolian": "0.000010",
-        "egyptian": "0.000010",
-        "pima": "0.000010",
-        "gaoshan": "0.033037",
-        "lahu": "0.000010",
-        "cambodian": "0.005365",
-        "korean": "0.000552",
-        "french": "0.000010",
-        "english": "0.000010",
-        "balkan": "0.000010",
-        "sindhi": "0.000010",
-        "papuan": "0.000446",
-        "hungarian": "0.000010",
-        "kinh": "0.000524",
-        "japanese": "0.000010",
-        "eskimo": "0.000010",
-        "saudi": "0.000010",
-        "mbuti": "0.000010",
-        "she": "0.026467",
-        "tibetan": "0.000010",
-        "yoruba": "0.000010",
-        "bantusa": "0.000010",
-        "ashkenazi": "0.000010",
-        "mala": "0.000010",
-        "yakut": "0.000010",
-        "bengali": "0.000010",
-        "thai": "0.022926",
-        "kyrgyz": "0.000010",
-        "uzbek": "0.000010",
-        "miao_yao": "0.008486"
-      }
-    }
-  }
-}
+# -*- coding: utf-8 -*-
+
+__all__ = ['data', 'load_sample_data', 'load_sample_genome']
+
+import os
+import json
+import gzip
+import mmap
+import base64
+
+_data = None
+
+
+'''
+The bundled sample genome is kept as a gzipped json resource and only read
+by the commands that need it
+'''
+
+
+def load_sample_data():
+    global _data
+    if _data is None:
+        lib_path = os.path.split(os.path.abspath(__file__))[0]
+        with gzip.open(lib_path + '/sample.json.gz', 'rt',
+                       encoding='utf-8') as sample_file:
+            _data = json.load(sample_file)
+    return _data
+
+
+class SampleGenome(object):
+
+    def __init__(self, entry_path):
+        from weapp_cli.wegene_utils import GenomeIndex
+
+        self._index = GenomeIndex(entry_path + '/index.bin')
+        with open(entry_path + '/genome.txt', 'rb') as genome_file:
+            self._genome = mmap.mmap(genome_file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+
+    def get(self, rsid, default=None):
+        entry = self._index.get(rsid)
+        if entry is None:
+            return default
+        index_pos, chromosome, position = entry
+        start_pos = index_pos * 2
+        return {
+            'genotype': ''.join(sorted(
+                self._genome[start_pos:start_pos + 2].decode('ascii'))),
+            'chromosome': chromosome,
+            'position': position
+        }
+
+    def close(self):
+        self._index.close()
+        self._genome.close()
+
+
+'''
+Returns the bundled sample genome decoded once into the user cache folder:
+the raw genotype string plus the compiled index of its format, keyed by the
+format and the hashes of the sample and the index. The hashes are only
+computed again once the size or modification time of a file changes.
+Single rsids are then read through mmap without decoding or parsing the
+whole genome again
+'''
+
+
+def load_sample_genome():
+    from weapp_cli.cache import build_entry, cache_dir, cached_digest
+    from weapp_cli.wegene_utils import _index_path, compile_genome_index
+
+    lib_path = os.path.split(os.path.abspath(__file__))[0]
+    inputs = load_sample_data()['inputs']
+    idx_path = _index_path(inputs['format'])
+    key = '{}-{}-{}'.format(inputs['format'],
+                            cached_digest(lib_path + '/sample.json.gz')[:12],
+                            cached_digest(idx_path)[:12])
+
+    def build(tmp_path):
+        genome = gzip.decompress(base64.b64decode(inputs['data']))
+        with open(tmp_path + '/genome.txt', 'wb') as genome_file:
+            genome_file.write(genome)
+        compile_genome_index(idx_path, tmp_path + '/index.bin')
+
+    return SampleGenome(build_entry(
+        os.path.join(cache_dir('sample'), key), build))
+
+
+def __getattr__(name):
+    if name == 'data':
+        return load_sample_data()
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
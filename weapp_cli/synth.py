@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import gzip
+import base64
+import random
+from multiprocessing import Pool
+
+import numpy as np
+
+from weapp_cli.sample import load_sample_data
+from weapp_cli.wegene_utils import _index_path
+
+ALLELES = np.frombuffer(b'ACGT', dtype=np.uint8)
+MISSING = ord('-')
+# Random genotypes barely compress, a higher level only costs time
+COMPRESS_LEVEL = 1
+
+# Set per worker process by _init_worker
+_sites = None
+
+
+'''
+Reads the sites of a format from its text index. Returns the genome length
+in sites and a mask of the sites that carry an rsid; the others are always
+written as '--'
+'''
+
+
+def _read_sites(genome_format):
+    mapped = []
+    site_count = 0
+    with open(_index_path(genome_format), 'r') as idx_f:
+        for line in idx_f:
+            site_count += 1
+            if not line.startswith('NA'):
+                mapped.append(int(line.split('\t', 1)[0]))
+    site_count = max([site_count] + [pos + 1 for pos in mapped[-1:]])
+    mask = np.zeros(site_count, dtype=bool)
+    mask[mapped] = True
+    return site_count, mask
+
+
+'''
+Chooses a reference and an alternate allele for every site and the
+frequency of the alternate allele. Sites follow the bundled sample where it
+has the same format so that genotypes look like real calls
+'''
+
+
+def site_model(genome_format, min_freq, max_freq, seed):
+    site_count, mapped = _read_sites(genome_format)
+    rng = np.random.default_rng(seed)
+    ref = ALLELES[rng.integers(0, 4, site_count)]
+    sample = load_sample_data()['inputs']
+    if sample['format'] == genome_format:
+        genome = np.frombuffer(gzip.decompress(
+            base64.b64decode(sample['data'])), dtype=np.uint8)
+        first = genome[0::2][:site_count]
+        called = np.isin(first, ALLELES)
+        ref[:len(first)][called] = first[called]
+    # Any of the three other bases as the alternate allele
+    shift = rng.integers(1, 4, site_count)
+    alt = ALLELES[(np.searchsorted(ALLELES, ref) + shift) % 4]
+    freq = rng.uniform(min_freq, max_freq, site_count).astype(np.float32)
+    return {'ref': ref, 'alt': alt, 'freq': freq, 'mapped': mapped}
+
+
+def synth_genome(sites, missing_rate, rng):
+    site_count = len(sites['ref'])
+    is_alt = rng.random((site_count, 2), dtype=np.float32) < \
+        sites['freq'][:, None]
+    alleles = np.where(is_alt, sites['alt'][:, None], sites['ref'][:, None])
+    alleles.sort(axis=1)
+    missing = (rng.random(site_count, dtype=np.float32) < missing_rate) | \
+        ~sites['mapped']
+    alleles[missing] = MISSING
+    return alleles.tobytes()
+
+
+def synth_inputs(genome_format, genome, rng):
+    sample = load_sample_data()['inputs']
+    return {
+        'inputs': {
+            'format': genome_format,
+            'sex': int(rng.integers(1, 3)),
+            'age': int(rng.integers(18, 81)),
+            'ancestry': sample['ancestry'],
+            'haplogroup': sample['haplogroup'],
+            'haplotype': sample['haplotype'],
+            'data': base64.b64encode(gzip.compress(
+                genome, COMPRESS_LEVEL, mtime=0)).decode('ascii')
+        }
+    }
+
+
+def _init_worker(sites):
+    global _sites
+    _sites = sites
+
+
+def _write_one(args):
+    i, genome_format, missing_rate, seed, out_path = args
+    rng = np.random.default_rng([seed, i])
+    genome = synth_genome(_sites, missing_rate, rng)
+    with open(out_path, 'w') as out_f:
+        json.dump(synth_inputs(genome_format, genome, rng), out_f)
+    return out_path
+
+
+'''
+Writes count synthetic inputs for genome_format to out_dir as
+synth_<n>.json. Every genome is drawn from its own generator seeded with
+(seed, n), so the output does not depend on the number of jobs
+'''
+
+
+def generate(genome_format, count, out_dir, missing_rate=0.01,
+             min_freq=0.05, max_freq=0.5, seed=None, jobs=1, progress=None):
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+    sites = site_model(genome_format, min_freq, max_freq, seed)
+    width = len(str(count))
+    tasks = [(i, genome_format, missing_rate, seed,
+              os.path.join(out_dir, 'synth_{:0{}d}.json'.format(i, width)))
+             for i in range(count)]
+    if jobs > 1:
+        pool = Pool(jobs, initializer=_init_worker, initargs=(sites,))
+        try:
+            for _ in pool.imap_unordered(_write_one, tasks, chunksize=4):
+                if progress is not None:
+                    progress(1)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        _init_worker(sites)
+        for task in tasks:
+            _write_one(task)
+            if progress is not None:
+                progress(1)
+    return seed
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+'''
+Warm worker used by weapp-cli test --warm. It runs under the interpreter of
+a Python project with the project folder as its working directory, imports
+wegene_utils and opens the genome indexes once, then runs main.py for every
+request read from stdin. Each request is a JSON line
+    {"stdin": "/path/to/input.json", "cpu_limit": 60}
+answered by a JSON line with the return code and the base64 encoded
+outputs. A request may also name the "cwd" of another project that has
+the same wegene_utils.py and indexes, as weapp-cli test-all does, to run
+its main.py with what is already loaded. Modules imported from the project
+folder and the globals of wegene_utils are reset after every run so that
+runs do not see each other.
+This file must stay compatible with Python 2.7
+'''
+
+import io
+import os
+import sys
+import json
+import math
+import time
+import base64
+import runpy
+import traceback
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PY3 = sys.version_info[0] >= 3
+
+
+def _share_indexes(utils):
+    # Indexes are opened once and kept open, closing them becomes a no-op
+    open_index = getattr(utils, 'open_genome_index', None)
+    load_text_index = getattr(utils, '_load_text_index', None)
+    indexes = {}
+    text_indexes = {}
+
+    def shared_open_index(genome_format):
+        if genome_format not in indexes:
+            index = open_index(genome_format)
+            if index is not None:
+                index.close = lambda: None
+            indexes[genome_format] = index
+        return indexes[genome_format]
+
+    def shared_text_index(genome_format):
+        if genome_format not in text_indexes:
+            text_indexes[genome_format] = load_text_index(genome_format)
+        return text_indexes[genome_format]
+
+    if open_index is not None:
+        utils.open_genome_index = shared_open_index
+    if load_text_index is not None:
+        utils._load_text_index = shared_text_index
+    if open_index is not None and os.path.isdir('indexes'):
+        for filename in sorted(os.listdir('indexes')):
+            if filename.startswith('index_') and filename.endswith('.idx'):
+                shared_open_index(filename[len('index_'):-len('.idx')])
+
+
+def _capture():
+    if PY3:
+        return io.TextIOWrapper(io.BytesIO(), encoding='utf-8',
+                                write_through=True)
+    return io.BytesIO()
+
+
+def _captured(stream):
+    if PY3:
+        stream.flush()
+        return stream.buffer.getvalue()
+    return stream.getvalue()
+
+
+def _limit_cpu(cpu_limit):
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    # The soft limit can not be raised above a finite hard limit
+    soft = hard
+    if cpu_limit:
+        # The limit counts the CPU time of the whole worker so far
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = int(math.ceil(usage.ru_utime + usage.ru_stime)) + cpu_limit
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _run_app(stdin_path, project_path):
+    with open(stdin_path, 'rb') as stdin_f:
+        payload = stdin_f.read()
+    if PY3:
+        stdin = io.TextIOWrapper(io.BytesIO(payload), encoding='utf-8')
+    else:
+        stdin = io.BytesIO(payload)
+    stdout = _capture()
+    stderr = _capture()
+    saved = (sys.stdin, sys.stdout, sys.stderr, sys.argv, list(sys.path),
+             os.getcwd())
+    sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+    sys.argv = ['main.py']
+    sys.path[0] = project_path
+    returncode = 0
+    try:
+        os.chdir(project_path)
+        runpy.run_path('main.py', run_name='__main__')
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            stderr.write(str(e.code) + '\n')
+            returncode = 1
+    except Exception:
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr, sys.argv, sys.path[:], cwd = saved
+        os.chdir(cwd)
+    return {
+        'returncode': returncode,
+        'stdout': base64.b64encode(_captured(stdout)).decode('ascii'),
+        'stderr': base64.b64encode(_captured(stderr)).decode('ascii'),
+        'stdin_bytes': len(payload)
+    }
+
+
+def _reset(project_path, baseline, utils, utils_state):
+    for name, module in list(sys.modules.items()):
+        if name in baseline or module is None:
+            continue
+        module_file = getattr(module, '__file__', None) or ''
+        if os.path.abspath(module_file).startswith(project_path + os.sep):
+            del sys.modules[name]
+    utils.__dict__.clear()
+    utils.__dict__.update(utils_state)
+
+
+def _send(channel, message):
+    channel.write((json.dumps(message) + '\n').encode('utf-8'))
+    channel.flush()
+
+
+def main():
+    project_path = os.getcwd()
+    sys.path.insert(0, project_path)
+    requests = sys.stdin
+    # Responses get their own copy of stdout, anything else written to
+    # file descriptor 1 goes to stderr instead of corrupting them
+    channel = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+
+    import wegene_utils
+    _share_indexes(wegene_utils)
+    baseline = set(sys.modules)
+    utils_state = dict(wegene_utils.__dict__)
+    _send(channel, {'ready': True})
+
+    for line in iter(requests.readline, ''):
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        start = time.time()
+        run_path = request.get('cwd') or project_path
+        _limit_cpu(request.get('cpu_limit', 0))
+        response = _run_app(request['stdin'], run_path)
+        _limit_cpu(0)
+        _reset(run_path, baseline, wegene_utils, utils_state)
+        response['duration'] = time.time() - start
+        _send(channel, response)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+
+# Folders and files that never trigger a new test run: outputs of the
+# test itself, caches and the large extended data
+IGNORED_DIRS = {'.git', '.hg', '.svn', '__pycache__', '.weapp-cache',
+                'extended_data', 'node_modules', '.venv', 'venv'}
+IGNORED_FILES = {'test_result.html', 'test_profile.json', 'test_corpus.json'}
+IGNORED_SUFFIXES = ('.pyc', '.zip', '.swp', '.swx', '.tmp', '~')
+# Changes closer together than this are reported as one
+DEBOUNCE = 0.3
+POLL_INTERVAL = 0.5
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | \
+    IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_ignored(rel_path):
+    parts = rel_path.split(os.sep)
+    if any(part in IGNORED_DIRS for part in parts[:-1]):
+        return True
+    name = parts[-1]
+    return name in IGNORED_DIRS or name in IGNORED_FILES or \
+        name.endswith(IGNORED_SUFFIXES) or name.startswith('.#')
+
+
+def _walk_dirs(root):
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        yield path
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and \
+                    entry.name not in IGNORED_DIRS:
+                stack.append(entry.path)
+
+
+class _Watcher(object):
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+
+    def _relative(self, path):
+        return os.path.relpath(path, self.root)
+
+    '''
+    Blocks until something changed, or until timeout seconds have passed,
+    and returns the set of changed paths relative to root. Changes of
+    ignored paths only, such as the test_result.html a run writes, do not
+    end the wait. Changes that keep coming in within DEBOUNCE seconds are
+    collected into the same set
+    '''
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0, deadline - time.time())
+            changes = self._read(remaining)
+            if changes:
+                break
+            if deadline is not None and time.time() >= deadline:
+                return changes
+        while True:
+            more = self._read(DEBOUNCE)
+            if not more:
+                return changes
+            changes |= more
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher(_Watcher):
+
+    name = 'inotify'
+
+    def __init__(self, root):
+        super(InotifyWatcher, self).__init__(root)
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'),
+                                 use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._dirs = {}
+        try:
+            for path in _walk_dirs(self.root):
+                self._add(path)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path),
+                                          WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOENT:
+                return
+            # Most likely ENOSPC, out of inotify watches
+            raise OSError(err, os.strerror(err), path)
+        self._dirs[wd] = path
+
+    def _read(self, timeout):
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changes = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = buf[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+            if mask & IN_DELETE_SELF:
+                self._dirs.pop(wd, None)
+                continue
+            if wd not in self._dirs or not name:
+                continue
+            path = os.path.join(self._dirs[wd], os.fsdecode(name))
+            rel_path = self._relative(path)
+            if is_ignored(rel_path):
+                continue
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    for sub_path in _walk_dirs(path):
+                        self._add(sub_path)
+                continue
+            changes.add(rel_path)
+        return changes
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher(_Watcher):
+
+    name = 'polling'
+
+    def __init__(self, root):
+        super(PollingWatcher, self).__init__(root)
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for path in _walk_dirs(self.root):
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            for entry in entries:
+                rel_path = self._relative(entry.path)
+                if is_ignored(rel_path):
+                    continue
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    pass
+        return snapshot
+
+    def _read(self, timeout):
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            snapshot = self._scan()
+            changes = set(path for path in set(snapshot) | set(self._snapshot)
+                          if snapshot.get(path) != self._snapshot.get(path))
+            self._snapshot = snapshot
+            if changes:
+                return changes
+            if deadline is not None and time.time() >= deadline:
+                return changes
+            wait = POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(0, deadline - time.time()))
+            time.sleep(wait)
+
+
+def open_watcher(root='.'):
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError, TypeError):
+            # No inotify in this libc or too many folders to watch
+            pass
+    return PollingWatcher(root)